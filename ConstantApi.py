@@ -0,0 +1,337 @@
+'''
+This is the ConstantApi.py file for Pyhton 3
+'''
+
+'''
+Constants of the TV test equipment APIs (UI Structure Function, Remote Control, AC, Audio Video Recording, Serial API, System API, Capture Photo).
+Loaded through ConstantName, eg. CN.AKIRAPATH
+'''
+from ConstantGeneral import *
+
+#---------------
+# UI Structure Function
+#---------------
+AKIRAPATH = r'C:\Users\Public'
+TESTTOOLNAME1 = r'\TVTool'
+TESTTOOLNAME2 = r'\AKIRA'
+AKIRAPATHERRORMESSAGE = r"Can't find TestTool Path."
+UISTRUCTURELIBRARYFOLDERPATH = r'Api\uistructure\uistructurelibrary'
+
+UIUP = STR_UP
+UIDOWN = STR_DOWN
+UILEFT = STR_LEFT
+UIRIGHT = STR_RIGHT
+UISELECT = STR_SELECT
+UIBACK = STR_BACK
+UIHOME = STR_HOME
+UIOPTION = STR_OPTION
+
+UIHOMENAME = STR_HOME
+UIGRAPHHOMEINDEX = INT_SIX
+UIGREYOUTFLAGINDEX = INT_SIX
+UIGREYOUT = True
+UINOTGREYOUT = False
+UINEXT = INT_ONE
+UILASTINDEX = INT_NEG_ONE
+UILASTUINAMEINDEX = INT_ZERO
+UIGRAPHNODEINDEX = INT_ZERO
+UIMOREOPTIONINDEX = INT_ONE
+UICHANGEDEFAULTVALUEFLAGINDEX = INT_FIVE
+UIDEFAULTVALUEINDEX = INT_TWO
+UIVALUESELECTIONINDEX = INT_ZERO
+UIMINVALUEINDEX = INT_THREE
+UIMAXVALUEINDEX = INT_FOUR
+UILDICKEYLST1STINDEX = INT_ZERO
+UIOK = 'ok'
+UICANCEL = 'cancel'
+UIAERIAL = 'aerial'
+UIANTENNA = 'antenna'
+UICABLE = 'cable'
+UIHORIZONTAL = 'horizontal'
+UIVERTICAL = 'vertical'
+UISWITCH = 'switch'
+UICONVERTUIFILENAME = r'ConvertUIRegion'
+UIREGIONUIFILENAME = r'RegionUIUpdate'
+UICOUNTRYUIFILENAME = r'CountryUIUpdate'
+
+#---------------
+# Remote Control
+#---------------
+RCUP = STR_UP
+RCDOWN = STR_DOWN
+RCLEFT = STR_LEFT
+RCRIGHT = STR_RIGHT
+RCSELECT = STR_SELECT
+RCBACK = STR_BACK
+RCHOME = STR_HOME
+RCOPTION = STR_OPTION
+
+RCAPIFOLDERPATHTVTOOL = r'C:\Users\Public\TVTool\Api\config'
+RCAPIFOLDERPATHAKIRA = r'C:\Users\Public\AKIRA\Api\config'
+RCIRCODEEXCELPATH = r'Api\config'
+RCINDEXUINAME = INT_ZERO
+RCINDEXDIRECTION = INT_ONE
+RCINDEXDEFAULTVALUE = INT_TWO
+RCINDEXMINVALUE = UIMINVALUEINDEX
+RCINDEXMAXVALUE = UIMAXVALUEINDEX
+RCLASTINDEX = UILASTINDEX
+RCDELAY1SEC = INT_ONE
+RCDELAY2SEC = INT_TWO
+RCDELAY5SEC = INT_FIVE
+RCHORIZONTAL = UIHORIZONTAL
+RCVERTICAL = UIVERTICAL
+RCHOME = UIHOMENAME
+RCINDEXSELECTION = INT_ZERO
+RCMSEC = 1000
+RCDEFAULTDELAY = 1
+RCDEFAULTREPEAT = 2
+
+RCEU = STR_EU
+RCPA = STR_PA
+RCLA = STR_LA
+RCBZ = STR_BZ
+RCUC = STR_UC
+RCCOL = STR_COL
+RCTW = STR_TW
+RCCHD = STR_CHD
+RCHK = STR_HK
+
+RCUK = STR_UK 
+RCBRA = STR_BRA
+RCGCC = STR_GCC
+RCGHA = STR_GHA
+RCIDN = STR_IDN
+RCKEN = STR_KEN
+RCMY = STR_MY 
+RCNZ = STR_NZ 
+RCSG = STR_SG 
+RCTHA = STR_THA
+RCECU = STR_ECU
+RCPH = STR_PH 
+RCPAR = STR_PAR # Paraguay
+RCURU = STR_URU # Uruguay
+RCUSA = STR_USA
+RCTWN = STR_TWN
+
+RCDEFAULTUSBUIRTNAME = 'USB-UIRT'
+
+#---------------
+#      AC
+#---------------
+ACHTTP = STR_HTTP
+ACSETCMDUSER = r'/set.cmd?user='
+ACCMDSETPOWERON = r'+cmd=setpower+p61=1'
+ACCMDSETPOWEROFF = r'+cmd=setpower+p61=0'
+ACPASS = r'+pass='
+ACON_LOWER = r'on'
+ACOFF_LOWER = r'off'
+
+#---------------
+# Audio Video Recording
+#---------------
+AVRAUDIOCHUNK = 1024
+AVRAUDIORATE = 44100
+AVRAUDIOCHANNEL = 2
+AVRDEFAULTDEVICE = 0
+AVR30FPS = 30.0
+AVR1SECOND = INT_ONE
+AVRDEFAULTVIDEOWIDTH = 1920
+AVRDEFAULTVIDEOHEIGHT = 1080
+
+AVRAUDIONAME = r'_audio'
+
+#---------------
+#  Serial API
+#---------------
+SAPI3DECIMAL = INT_THREE
+SAPISTR_I = 'i'
+SAPISTR_C = 'c'
+SAPISTR_TAB = 'tab'
+
+SAPIUP = STR_UP
+SAPIDOWN = STR_DOWN
+SAPILEFT = STR_LEFT
+SAPIRIGHT = STR_RIGHT
+SAPISELECT = STR_SELECT
+SAPIBACK = STR_BACK
+SAPIHOME = STR_HOME
+SAPIOPTION = STR_OPTION
+
+SAPIINDEXUINAME = INT_ZERO
+SAPIINDEXDIRECTION = INT_ONE
+SAPIINDEXDEFAULTVALUE = INT_TWO
+SAPIINDEXMINVALUE = UIMINVALUEINDEX
+SAPIINDEXMAXVALUE = UIMAXVALUEINDEX
+SAPILASTINDEX = UILASTINDEX
+SAPIDELAY1SEC = INT_ONE
+SAPIDELAY2SEC = INT_TWO
+SAPIDELAY5SEC = INT_FIVE
+SAPIHORIZONTAL = UIHORIZONTAL
+SAPIVERTICAL = UIVERTICAL
+SAPIHOME = UIHOMENAME
+SAPIINDEXSELECTION = INT_ZERO
+SAPIINDEXNEXT = INT_ONE
+SAPIASCIICARRIAGERETURN_STR = '\x0D'
+SAPIASCIIHORIZONALTAB_STR = '\x09'
+SAPIASCIIINTERRUPT_STR = '\x09'
+SAPIASCIIFORMAT_STR = 'ascii'
+
+MTKMODE = 'mtkmode'
+RTKMODE = 'rtkmode'
+SERIALDELAY = 5
+
+DEFAULT_WRITE_WAIT_TIME = 3
+
+#---------------
+# Capture Photo
+#---------------
+CPDEFAULTDEVICE = INT_ZERO
+
+#---------------
+#  System API
+#---------------
+SAPISUMMARYTEXTDEFAULT = INT_ONE
+SAPISUBSUMMARYTEXTDEFAULT = INT_TWO
+SAPIRESULTTEXTDEFAULT = INT_ONE
+SAPIRESULTPICDEFAULT = INT_FOUR
+SAPIWORKSHEETDEFAULTNAME1 = 'Summary'
+SAPIWORKSHEETDEFAULTNAME2 = 'Results'
+SAPIDEFAULTCOOR  = [INT_ZERO,INT_ZERO,INT_ZERO,INT_ZERO]
+SAPIDATAIMAGERESULTPASS = 'Passed'
+SAPIDATAIMAGERESULTFAIL = 'Failed'
+SAPIDATAIMAGERESULTPENDING = 'Pending'
+SAPIDEFAULTERRORTEXT = 'Error Detected'
+
+SAPIINCREMENT1 = INT_ONE
+SAPIINCREMENT2 = INT_TWO
+SAPIINCREMENT3 = INT_THREE
+SAPIINCREMENT28 = 28
+SAPIINCREMENT30 = 30
+SAPITESTFOLDERSELECTIONPICTURE = 'picture'
+SAPITESTFOLDERSELECTIONSUBTITLE = 'subtitle'
+SAPITESTFOLDERSELECTIONVIDEO = 'video'
+SAPITESTFOLDERPICTURE= r'testfolder'
+SAPITESTFOLDERSUBVIDEO = r'subtitlevideo'
+SAPITESTFOLDERTESTVIDEO = r'testvideo'
+SAPIAVALSHAREFOLDERNAME = 'avalshare'
+SAPIIMAGEFLAG = False
+SAPISUBTITLEFLAG = True
+SAPIAVALDEFAULTIP = '43.74.4.35'
+SAPIJAASDEFAULTIP = '43.74.10.87'
+SAPIAVALGATEWAYDEFAULTIP = '43.74.10.87'
+SAPIHTTPPOSTDATAVALUE = ':3030/postdata'
+SAPIAVALTESTFOLDERPATH = r'avalshare/testfolder'
+SAPIAVALSTATUS = r'http://43.74.4.35:3031/aval/status'
+
+SAPICOORLENGTH = INT_FIVE
+SAPICOOR1 = INT_ZERO
+SAPICOOR2 = INT_ONE
+SAPICOOR3 = INT_TWO
+SAPICOOR4 = INT_THREE
+SAPIREFWORD = INT_FOUR
+SAPIREFTEXTTESTMODE = INT_ONE
+SAPIREFLOGOTESTMODE = INT_THREE
+SAPIIMAGETESTRESULT = INT_ZERO
+SAPIFULLHDWIDTH = 1920 
+SAPIFULLHDHEIGHT = 1080 
+SAPIVIDEOFULLHDCOOR = [0,0,1920,320,0,780,1920,1080]
+SAPIHDWIDTH = 1280
+SAPIHDHEIGHT = 720
+SAPIVIDEOHDCOOR = [0,0,1280,213,0,520,1280,720]
+SAPIAVALSHAREJSONRESULTPATH = r'avalshare\result'
+SAPIJSONRESULTNAME = '_subtitle'
+
+SAPISUMMARYTAB = INT_ZERO
+SAPIRESULTTAB = INT_ONE
+SAPISUMMARYCOLUMN = INT_FIVE
+SAPISUMMARYRESULTCOLUMN = INT_ONE
+SAPIRESULTRESULTCOLUMN = INT_ONE
+SAPISUMMARYDEFAULTFONTSIZE = '30'
+SAPIPICTUREPATHINDEX = INT_ZERO
+SAPIPICTURECOORINDEX = INT_ONE
+SAPIPICTURERESULTNAMEINDEX = INT_TWO
+SAPIPICTURERESULTINDEX = INT_THREE
+SAPITEXTINDEX = INT_FOUR
+SAPITEXTREFERENCEINDEX = INT_ZERO
+SAPITEXTDETECTEDINDEX = INT_ONE
+SAPIERRORINDEX = INT_FIVE
+SAPITESTDESCINDEX = INT_SIX
+SAPIERRORSTATUSCODEINDEX = INT_ZERO
+SAPIERRORTEXTINDEX = INT_ONE
+SAPIATTACHIMAGEWIDTH = 960
+SAPIATTACHIMAGEHEIGHT = 540
+SAPIATTACHIMAGECOLUMN = INT_ONE
+SAPIAVALSUBTITLERESULTFILEPATHINDEX = INT_ONE
+SAPIAVALSUBTITLEVIDEOPATHINDEX = INT_ZERO
+SAPIAVALSUBTITLERESULTPATHINDEX = INT_TWO
+SAPIAVALSUBTITLEVIDEONAMEINDEX = INT_ONE
+SAPIREDCOLOUR = (0,0,255) # (B,G,R) (0 -> 255 value)
+SAPIGREENCOLOUR = (0,255,0) # (B,G,R) (0 -> 255 value)
+
+SAPILINETHICKNESS = INT_THREE
+SAPILINETYPE = INT_EIGHT
+SAPILINESHIFT = INT_ZERO
+SAPISUBTITLEFRAMENAME = 'SubtitleFrame'
+SAPIBEGSUBTITLEFRAMEINDEX = INT_ZERO
+SAPIENDSUBTITLEFRAMEINDEX = INT_ONE
+SAPIMINFRAME = INT_ZERO
+SAPISUBTITLETEXTINDEX = INT_TWO
+SAPIJSONSTARTFRAME = 'Start Frame'
+SAPIJSONENDFRAME = 'End Frame'
+SAPIJSONTEXT = 'text'
+SAPIRESULTKEY = 'result'
+SAPIRESULTMESSAGEKEY = 'resultmessage'
+SAPIDBFILENAME = 'systemapiresult.db'
+SAPIPICTUREJUDGEMENT = 'picture'
+SAPIREFVIDEOJUDGEMENT = 'reference_video'
+SAPIAUTOVIDEOJUDGEMENT = 'auto_video'
+
+SAPIARTIFACTSTHRESHOLD = 'artifactsthreshold'
+SAPITOLERANCESECOND = 'tolerancesecond'
+SAPIFREQUENCY = 'frequency'
+SAPINOISEREMOVETHRESHOLD = 'noiseremovethreshold'
+
+SAPIMINIODEFAULTIPPORT = 9000
+SAPIMINIOIPADDRESS = '43.74.4.35:9000'
+
+SAPIRUNTIMEPARAFILE = 'runtime.json'
+SAPIRUNTIMEPARADIR = r'Api\settings\runtime'
+
+SAPI_LOGO_DETECTION_OPTION = [2,3]
+SAPI_TEXT_DETECTION_OPTION = [1,5]
+
+SAPI_RESULT_PASS = 1
+SAPI_RESULT_FAIL = 0
+SAPI_RESULT_PENDING = 2
+SAPI_RESULT_SERVER_ISSUE = 3
+
+SAPI_DEFAULT_PENDING_MESSAGE = "Please check WebUI for results."
+SAPI_DEFAULT_400_MESSAGE = "Server issue"
+SAPI_DEFAULT_500_MESSAGE = "Client issue"
+SAPI_DEFAULT_503_MESSAGE = "Not enough resources"
+SAPI_DEFAULT_EXCEPTION_MESSAGE = "General Exception Detected"
+SAPI_DEFAULT_TIMEOUT_MESSAGE = "Requests Time Out Detected"
+
+SAPI_STANDARD_TIMEOUT = 20
+
+#-------------------
+#  Reference Video Name
+#-------------------
+SAPI_SCENE_REF = 'scene_ref'
+SAPI_BRIDGE_REF = 'bridge_ref'
+SAPI_FLOWER_REF = 'flower_ref'
+SAPI_PARK_REF = 'park_ref'
+SAPI_VILLAGE_REF = 'village_ref'
+SAPI_OFFICE_REF = 'office_ref'
+
+#-------------------
+#  Auto Video Detection Speed Name
+#-------------------
+SAPI_DETECTION_FAST = 'FAST'
+SAPI_DETECTION_DEFAULT = 'DEFAULT'
+
+#---------------
+# Capture Photo
+#---------------
+CPDEFAULTPHOTOWIDTH = 1920
+CPDEFAULTPHOTOHEIGHT = 1080
@@ -0,0 +1,105 @@
+'''
+This is the ConstantGeneral.py file for Pyhton 3
+'''
+
+'''
+General constants (strings, numbers, country codes) shared by every constant module.
+Loaded through ConstantName, eg. CN.BOOL_TRUE
+'''
+#---------------
+#   General
+#---------------
+BOOL_TRUE = True
+BOOL_FALSE = False
+
+INT_ZERO = 0
+INT_ONE = 1
+INT_TWO = 2
+INT_THREE = 3
+INT_FOUR = 4
+INT_FIVE = 5
+INT_SIX = 6
+INT_SEVEN = 7
+INT_EIGHT = 8
+INT_NINE = 9
+RC_RIGHT = 'rcright'
+RC_OK = 'rcok'
+
+INT_NEG_ONE = -INT_ONE
+
+STR_ZERO = str(INT_ZERO)
+STR_ONE = str(INT_ONE)
+STR_TWO = str(INT_TWO)
+STR_THREE = str(INT_THREE)
+STR_FOUR = str(INT_FOUR)
+STR_FIVE = str(INT_FIVE)
+STR_SIX = str(INT_SIX)
+STR_SEVEN = str(INT_SEVEN)
+STR_EIGHT = str(INT_EIGHT)
+STR_NINE = str(INT_NINE)
+
+STR_UNDERSCORE = '_'
+STR_DASH = '-'
+STR_BACKSLASH = '\\'
+STR_2BACKSLASH = '\\\\'
+STR_2FORWARDSLASH = r'//'
+STR_FORWARDSLASH = r'/'
+STR_PYTHONFORMAT = r'.py'
+STR_EXCELFORMAT = r'.xlsx'
+STR_HTTP = r'http://'
+STR_COLON = r':'
+STR_SEMICOLON = ';'
+
+STR_MP3FORMAT = r'.mp3'
+STR_MP4FORMAT = r'.mp4' 
+STR_PNGFORMAT = r'.png' 
+STR_FLVFORMAT = r'.flv'
+STR_WAVFORMAT = r'.wav'
+
+STR_UP = 'up'
+STR_DOWN = 'down'
+STR_LEFT = 'left'
+STR_RIGHT = 'right'
+STR_SELECT = 'ok'
+STR_BACK = 'back'
+STR_HOME = 'home'
+STR_OPTION = 'option'
+
+STR_EU = 'EU'
+STR_PA = 'PA'
+STR_LA = 'LA'
+STR_BZ = 'BZ'
+STR_UC = 'UC'
+STR_COL = 'COL'
+STR_TW = 'TW'
+STR_CHD = 'CHD'
+STR_HK = 'HK'
+
+STR_UK = 'UK'
+STR_BRA = 'BRA'
+STR_GCC = 'GCC'
+STR_GHA = 'GHA'
+STR_IDN = 'IDN'
+STR_KEN = 'KEN'
+STR_MY = 'MY'
+STR_NZ = 'NZ'
+STR_SG = 'SG'
+STR_THA = 'THA'
+STR_ECU = 'ECU'
+STR_PH = 'PH'
+STR_PAR = 'PAR' # Paraguay
+STR_URU = 'URU' # Uruguay
+STR_USA = 'USA'
+STR_TWN = 'TWN'
+
+#-----------
+#  Remote Interface
+#-----------
+REMOTE_IR = 'IR'
+REMOTE_BLUETOOTH = 'BLUETOOTH'
+
+
+#-----------
+#  HTTP Status Code
+#  TODO
+#-----------
@@ -1,10186 +1,62 @@
-'''
-This is the ConstantName.py file for Pyhton 3
-'''
-
-'''
-This file is to hold a collection of Constant Variable that is used by the APIs.
-'''
-
-'''
-For searching purposes
-----------------------
-INDEX:-
-1) General
-2) UI Structure Library
-  a) UISTRUCLIB_EU
-  b) IPTV UI
-  c) Google UI
-3) UI Structure Function
-4) Remote Control
-5) AC
-6) Audio Video Recording
-7) Serial API
-8) System API
-9) Capture Photo
-10) Router API
-11) TV Models
-'''
-#---------------
-#   General
-#---------------
-BOOL_TRUE = True
-BOOL_FALSE = False
-
-INT_ZERO = 0
-INT_ONE = 1
-INT_TWO = 2
-INT_THREE = 3
-INT_FOUR = 4
-INT_FIVE = 5
-INT_SIX = 6
-INT_SEVEN = 7
-INT_EIGHT = 8
-INT_NINE = 9
-RC_RIGHT = 'rcright'
-RC_OK = 'rcok'
-
-INT_NEG_ONE = -INT_ONE
-
-STR_ZERO = str(INT_ZERO)
-STR_ONE = str(INT_ONE)
-STR_TWO = str(INT_TWO)
-STR_THREE = str(INT_THREE)
-STR_FOUR = str(INT_FOUR)
-STR_FIVE = str(INT_FIVE)
-STR_SIX = str(INT_SIX)
-STR_SEVEN = str(INT_SEVEN)
-STR_EIGHT = str(INT_EIGHT)
-STR_NINE = str(INT_NINE)
-
-STR_UNDERSCORE = '_'
-STR_DASH = '-'
-STR_BACKSLASH = '\\'
-STR_2BACKSLASH = '\\\\'
-STR_2FORWARDSLASH = r'//'
-STR_FORWARDSLASH = r'/'
-STR_PYTHONFORMAT = r'.py'
-STR_EXCELFORMAT = r'.xlsx'
-STR_HTTP = r'http://'
-STR_COLON = r':'
-
-STR_MP3FORMAT = r'.mp3'
-STR_MP4FORMAT = r'.mp4' 
-STR_PNGFORMAT = r'.png' 
-STR_FLVFORMAT = r'.flv'
-STR_WAVFORMAT = r'.wav'
-
-STR_UP = 'up'
-STR_DOWN = 'down'
-STR_LEFT = 'left'
-STR_RIGHT = 'right'
-STR_SELECT = 'ok'
-STR_BACK = 'back'
-STR_HOME = 'home'
-STR_OPTION = 'option'
-
-STR_EU = 'EU'
-STR_PA = 'PA'
-STR_LA = 'LA'
-STR_BZ = 'BZ'
-STR_UC = 'UC'
-STR_COL = 'COL'
-STR_TW = 'TW'
-STR_CHD = 'CHD'
-STR_HK = 'HK'
-
-STR_UK = 'UK'
-STR_BRA = 'BRA'
-STR_GCC = 'GCC'
-STR_GHA = 'GHA'
-STR_IDN = 'IDN'
-STR_KEN = 'KEN'
-STR_MY = 'MY'
-STR_NZ = 'NZ'
-STR_SG = 'SG'
-STR_THA = 'THA'
-STR_ECU = 'ECU'
-STR_PH = 'PH'
-STR_PAR = 'PAR' # Paraguay
-STR_URU = 'URU' # Uruguay
-STR_USA = 'USA'
-STR_TWN = 'TWN'
-
-#-----------
-#  Remote Interface
-#-----------
-REMOTE_IR = 'IR'
-REMOTE_BLUETOOTH = 'BLUETOOTH'
-
-
-#-----------
-#  HTTP Status Code
-#  TODO
-#-----------
-
-
-#----------------------------------
-# UI Structure Library
-#----------------------------------
-#---------------
-# LINUX UISTRUCLIB_SA
-#---------------
-# Home layer
-SA_UI_DTV = 'dtv'
-SA_UI_WIFISHORTCUT = 'wifishortcut'
-SA_UI_SEARCH = 'search'
-SA_UI_APP1 = 'app1'
-SA_UI_APP2 = 'app2'
-SA_UI_APP3 = 'app3'
-SA_UI_FAVORITES = 'favorites'
-SA_UI_DIGITALEPG = 'digitalepg'
-SA_UI_PHOTO = 'UIphoto'
-SA_UI_MUSIC = 'UImusic'
-SA_UI_VIDEO = 'UIvideo'    
-SA_UI_PREFERENCES = 'preferences'
-SA_UI_NETWORKSETUP = 'networksetup'
-SA_UI_CUSTOMERSUPPORT = 'customersupport'
-SA_UI_HELPGUIDE = 'helpguide'
-SA_UI_RECOMMENDATIONROW = 'recommendationrow'
-SA_UI_RECENTCHANNELS = 'recentchannels'
-# Option layer
-SA_UI_OPICTUREADJUSTMENTS = 'opictureadjustments'
-SA_UI_OSOUNDADJUSTMENTS = 'osoundadjustments'        
-# CustomerSupport Layer 1
-SA_UI_SIGNALDIAGNOSTICS = 'signaldianostics'
-SA_UI_VIEWMANAGEINPUTS1 = 'viewmanageinputs1'
-SA_UI_VIEWMANAGEINPUTS2 = 'viewmanageinputs2'
-SA_UI_VIEWTESTPICTURE = 'viewtestpicture'
-SA_UI_SOFTWAREUPDATE = 'softwareupdate'
-SA_UI_AUTOMATICSOFTWAREDOWNLOAD = 'automaticsoftwaredownload'
-SA_UI_FACTORYSETTINGS = 'factorysettings'
-SA_UI_INITIALIZEPERSONALINFORMATION = 'initializepersonalinformation'
-SA_UI_PRODUCTINFORMATION = 'productinformation'
-SA_UI_CONTACTSONY = 'contactsony'
-SA_UI_CSHELPGUIDE = 'cshelpguide'
-SA_UI_LEGALINFORMATION = 'legalinformation'
-
-SA_UI_CSHDMI1 = 'cshdmi1'
-SA_UI_CSHDMI2 = 'cshdmi2'
-SA_UI_CSHDMI3 = 'cshdmi3'
-SA_UI_CSVIDEO = 'csvideo'
-
-# System Setting layer 1
-SA_UI_PICTUREADJUSTMENTS = 'pictureadjustments'
-SA_UI_SOUNDADJUSTMENTS = 'soundadjustments'
-SA_UI_SCREEN = 'screen'
-SA_UI_CHANNELSETUP = 'channelsetup'
-SA_UI_PARENTALLOCK = 'parentallock'
-SA_UI_SETUP = 'setup'
-SA_UI_ECO = 'eco'
-# Picture Adjustments layer 1
-SA_UI_PICTUREMODE = 'picturemode'
-SA_UI_PRESET = 'preset'
-SA_UI_BRIGHTNESS = 'brightness'
-SA_UI_CONTRAST = 'contrast'
-SA_UI_BLACKLEVEL= 'blacklevel'
-SA_UI_COLOR = 'color'
-SA_UI_HUE = 'hue'
-SA_UI_COLORTEMPERATURE = 'colortemperature'
-SA_UI_SHARPNESS = 'sharpness'
-SA_UI_REALITYCREATION = 'realitycreation'
-SA_UI_RESOLUTION = 'resolution'
-SA_UI_RANDOMNOISEREDUCTION = 'randomnoisereduction'
-SA_UI_DIGITALNOISEREDUCTION = 'digitalnoisereduction'
-SA_UI_MOTIONFLOW = 'motionflow'
-SA_UI_SMOOTHNESS = 'smoothness'
-SA_UI_CLEARNESS = 'clearness'
-SA_UI_CINEMOTION = 'cinemotion'
-SA_UI_PADVANCEDSETTINGS = 'padvancedsettings'
-# Picture layer 2
-SA_UI_P2RESET = 'p2reset'
-SA_UI_ADVCONTRASTENHANCER = 'advcontrastenhancer'
-SA_UI_BLACKADJUST = 'blackadjust'
-SA_UI_GAMMA = 'gamma'
-SA_UI_LIVECOLOR = 'livecolor'
-SA_UI_ADVCOLORTEMPERATURE = 'advcolortemperature'
-# Picture Layer 3
-SA_UI_P3RESET = 'p3reset'
-SA_UI_RGAIN = 'rgain'
-SA_UI_GGAIN = 'ggain'
-SA_UI_BGAIN = 'bgain'
-SA_UI_RBIAS = 'rbias'
-SA_UI_GBIAS = 'gbias'
-SA_UI_BBIAS = 'bbias'
-SA_UI_COLORGAMMAADJUSTMENTPOINTS = 'colorgammaadjustmentpoints'
-SA_UI_ROFFSET = 'roffset'
-SA_UI_GOFFSET = 'goffset'
-SA_UI_BOFFSET = 'boffset'
-# Sound Adjustments layer 1
-SA_UI_CLEARAUDIO = 'clearaudio'
-SA_UI_SOUNDMODE = 'soundmode'
-SA_UI_SRESET = 'sreset'
-SA_UI_SURROUND = 'surround'
-SA_UI_SURROUNDEFFECT = 'surroundeffect'
-SA_UI_SOUNDRESTORATION = 'soundrestoration'
-SA_UI_EQUALISER = 'equaliser'
-SA_UI_VOICEZOOM = 'voicezoom'
-SA_UI_ADVANCEDAUTOVOLUME = 'advancedautovolume'
-SA_UI_BALANCE = 'balance'
-SA_UI_VOLUMEOFFSET = 'volumeoffset'
-SA_UI_MTSAUDIO = 'mtsaudio'
-SA_UI_DIGITALDUALMONO = 'digitaldualmono'
-SA_UI_SADVANCEDSETTINGS = 'sadvancedsettings'
-# Sound layer 2
-SA_UI_DYNAMICRANGE = 'dynamicrange'
-SA_UI_DOLBYDIGITALPLUSOUT = 'dolbydigitalplusout'
-SA_UI_HEAACAUDIOLEVEL = 'heaacaudiolevel'
-SA_UI_MPEGAUDIOLEVEL = 'mpegaudiolevel'
-SA_UI_DOLBYAC4DIALOGENHANCER = 'dolbyac4dialogenhancer'
-# Screen layer 1
-SA_UI_WIDEMODE = 'widemode'
-SA_UI_AUTOWIDE = 'autowide'
-SA_UI_43DEFAULT = '43default'
-SA_UI_AUTODISPLAYAREA = 'autodisplayarea'
-SA_UI_DISPLAYAREA = 'displayarea'
-SA_UI_HCENTER = 'hcenter'
-SA_UI_VCENTER = 'vcenter'
-SA_UI_VERTICALSIZE = 'verticalsize'
-SA_UI_PCSETTINGS = 'pcsettings'
-# Screen layer 2
-# Channel Setup layer 1
-SA_UI_CABLEANTENNA = 'cableantenna'
-SA_UI_AUTOPROGRAM = 'autoprogram'
-SA_UI_ADDDIGITALCHANNEL = 'adddigitalchannel'
-SA_UI_SHOWHIDECHANNEL = 'showhidedigitalchannel'
-SA_UI_EDITANALOGCHANNELLABELS = 'editanalogchannellabels'
-SA_UI_DIGITALSIGNALBOOSTER = 'digitalsignalbooster'
-SA_UI_ANALOGCHANNELADJUSTMENT = 'analogchanneladjustment'
-SA_UI_DIGITALCHANNELTUNINGMODE = 'digitalchanneltuningmode'
-SA_UI_FMRADIOSETUP = 'fmradiosetup'
-SA_UI_AREASELECTION = 'areaselection'
-SA_UI_AREASELECTION2 = 'areaselection2'
-SA_UI_EWBSAUDIBLETONE = 'ewbsaudibletone'
-# Channel Setup layer 2
-SA_UI_ACHANNEL = 'achannel'
-SA_UI_ANALOGFINETUNE = 'analogfinetune'
-SA_UI_AAUDIOFILTER = 'aaudiofilter'
-SA_UI_ACOLORSYSTEM = 'acolorsystem'
-SA_UI_ASIGNALBOOSTER = 'asignalbooster'
-SA_UI_FMAUTOPROGRAM = 'fmautoprogram'
-SA_UI_FMRADIOPRESETS = 'fmradiopreset'
-SA_UI_ZONE = 'zone'
-SA_UI_REGION = 'region'
-SA_UI_CITY = 'city'
-SA_UI_ASOK = 'asok'
-# Parental Lock layer 1
-SA_UI_PASSWORD = 'password'
-SA_UI_CHANGEPASSWORD = 'changepassword'
-SA_UI_DIGITALRATING = 'digitalrating'
-SA_UI_ANALOGCHANNELBLOCK = 'analogchannelblock'
-SA_UI_EXTERNALINPUTLOCK = 'externalinputlock'
-SA_UI_INTERNETLOCK = 'internetlock'
-# Parental Lock layer 2
-SA_UI_PHDMI1 = 'phdmi1'
-SA_UI_PHDMI2 = 'phdmi2'
-SA_UI_PHDMI3 = 'phdmi3'
-SA_UI_PVIDEO = 'pvideo'
-# Setup layer 1 (SL)
-SA_UI_NETWORK = 'network'
-SA_UI_PRIVACYPOLICY = 'privacypolicy'
-SA_UI_PHOTOFRAMESETTINGS = 'photoframesettings'
-SA_UI_USBAUTOSTART = 'usbautostart'
-SA_UI_CLOSECAPTIONS = 'closecaptions'
-SA_UI_INFOBANNER = 'infobanner'
-SA_UI_CLOCKTIMERS = 'clocktimers'
-SA_UI_AUTOSTARTUP = 'autostartup'
-SA_UI_LANGUAGE = 'uilanguage'
-SA_UI_PHYSICALKEYBOARD = 'physicalkeyboard'
-SA_UI_STARTUPLOGO = 'startuplogo'
-SA_UI_LEDINDICATOR = 'ledindicator'
-SA_UI_AVSETUP = 'avsetup'
-SA_UI_BRAVIASYNCSETTINGS = 'braviasyncsettings'
-SA_UI_SLCUSTOMERSUPPORT = 'slcustomersupport'
-# Setup layer 2
-SA_UI_SLNETWORKSETUP = 'slnetworksetup'
-SA_UI_USBTETHERINGSTATUS = 'usbtetheringstatus'
-SA_UI_IPV6IPV4PRIORITY = 'ipv6ipv4priority'
-SA_UI_BUILTINWIFI = 'builtinwifi'
-SA_UI_WIFIDIRECT = 'wifidirect'
-SA_UI_WIFIDIRECTSETTINGS = 'wifidirectsettings'
-SA_UI_DEVICENAME = 'devicename'
-SA_UI_REFRESHINTERNETCONTENT = 'refreshinternetcontent'
-SA_UI_HOMENETWORKSETUP = 'homenetworksetup'    
-SA_UI_DISPLAYMODE = 'displaymode'
-SA_UI_CLOCKDISPLAY = 'clockdisplay'
-SA_UI_AUDIOAPPLICATION = 'audioapplication'
-SA_UI_IMAGESELECTION = 'imageselection'
-SA_UI_MUSICSELECTION = 'musicselection'
-SA_UI_SLIDESHOWSETTING = 'slideshowsetting'
-SA_UI_MUSICPLAYBACKSETTING = 'musicplaybacksetting'
-SA_UI_DURATION = 'duration'
-SA_UI_FIRSTDAYOFTHEWEEK = 'firstdayoftheweek'    
-SA_UI_CCDISPLAY = 'ccdisplay'
-SA_UI_ANALOGCC = 'analogcc'
-SA_UI_DIGITALCC = 'digitalcc'
-SA_UI_BROADCASTINGTEXTSETTING = 'broadcastingtextsetting '
-SA_UI_SLEEPTIMER = 'sleeptimer'
-SA_UI_ONTIMER = 'ontimer'
-SA_UI_CURRENTIME = 'currenttime'
-SA_UI_SLDATE = 'sldate'
-SA_UI_SLTIME = 'sltime'
-SA_UI_MANAGEINPUTS = 'manageinputs'
-SA_UI_COLORSYSTEM = 'colorsysterm'
-SA_UI_SLCOLORSYSTEM = 'slcoloursystem'
-SA_UI_SPEAKERS = 'speakers'
-SA_UI_HEADPHONEAUDIOOUT = 'headphoneaudioout'
-SA_UI_HEADPHONESPEAKERLINK = 'headphonespeakerlink'
-SA_UI_HEADPHONEVOLUME = 'headphonevolume'
-SA_UI_SUBWOOFER = 'subwoofer'
-SA_UI_DIGITALAUDIOOUT = 'digitalaudioout'
-SA_UI_TVPOSITION = 'tvposition'
-SA_UI_HDMISIGNALFORMAT = 'hdmisignalformat'    
-SA_UI_BRAVIASYNCCONTROL = 'braviasynccontrol'
-SA_UI_DEVICEAUTOPOWEROFF = 'deviceautopoweroff'
-SA_UI_TVAUTOPOWERON = 'tvautopoweron'
-SA_UI_BRAVIASYNCDEVICELIST = 'braviasyncdevicelist'
-SA_UI_DEVICECONTROLKEYS = 'devicecontrolkeys'
-
-SA_UI_SLSIGNALDIAGNOSTICS = 'slsysteminformation'
-SA_UI_SLVIEWMANAGEINPUTS1 = 'slviewmanagemnentinputs1'
-SA_UI_SLVIEWMANAGEINPUTS2 = 'slviewmanagemnentinputs2'
-SA_UI_SLVIEWTESTPICTURE = 'slviewtestpicture'
-SA_UI_SLSOFTWAREUPDATE = 'slsoftwareupdate'
-SA_UI_SLAUTOMATICSOFTWAREDOWNLOAD = 'slautomaticsoftwaredownload'
-SA_UI_SLFACTORYSETTINGS = 'slfactorysettings'
-SA_UI_SLINITIALIZEPERSONALINFORMATION = 'slinitializepersonalinformation'
-SA_UI_SLPRODUCTINFORMATION = 'slproductinformation'
-SA_UI_SLCONTACTSONY = 'slcontactsony'
-SA_UI_SLHELPGUIDE = 'slhelpguide'
-SA_UI_SLLEGALINFORMATION = 'sllegalinformation'
-
-SA_UI_SLHDMI1 = 'slhdmi1'
-SA_UI_SLHDMI2 = 'slhdmi2'
-SA_UI_SLHDMI3 = 'slhdmi3'
-SA_UI_SLVIDEO = 'slvideo'
-# Setup layer 3
-SA_UI_SHOWHIDEMEDIASERVERS = 'showhidemediaservers'
-SA_UI_MEDIASERVERTROUBLESHOOTING = 'mediaservertroubleshooting'
-SA_UI_REMOTESTART = 'remotestart'
-SA_UI_RENDERER1 = 'renderer1'
-SA_UI_OTTIMER = 'ottimer'
-SA_UI_OTDAY = 'otday'
-SA_UI_OTTIME = 'ottime'
-SA_UI_OTDURATION = 'otduration'
-SA_UI_OTINPUT = 'otinput'
-SA_UI_OTCABLEANTENNA = 'otcableantenna'
-SA_UI_OTCHANNEL = 'otchannel'
-SA_UI_OTTVONVOLUME = 'ottvonvolume'
-SA_UI_CTDATE = 'ctdate'
-SA_UI_CTTIME = 'cttime'
-# SA_UI_CTAUTOMANUAL = 'ctautomanual'
-# SA_UI_CTDAY = 'ctday'
-# SA_UI_CTBRASILLIATIME = 'ctbrasilliatime'
-# SA_UI_CTTIMEOFFSET = 'cttimeoffset'
-# SA_UI_CTADJUSTEDTIME = 'ctadjustedtime'
-SA_UI_SHDMI1 = 'shdmi1'
-SA_UI_SHDMI2 = 'shdmi2'
-SA_UI_SHDMI3 = 'shdmi3'
-SA_UI_SVIDEO = 'svideo'
-SA_UI_HSFHDMI2 = 'hsfhdmi2'
-SA_UI_HSFHDMI3 = 'hsfhdmi3'
-SA_UI_SUBWOOFERLEVEL = 'subwooferlevel'
-SA_UI_PHASE = 'phase'
-SA_UI_SUBWOOFERSYNC = 'subwoofersync'
-# Setup layer 4
-SA_UI_RENDERER2 = 'renderer2'
-SA_UI_RENDERERACCESSCONTROL = 'rendereraccesscontrol'
-SA_UI_RENDEREROPTIONS = 'rendereroptions'
-SA_UI_AUTOACCESSPERMISSION = 'autoaccesspermission'
-# Eco layer 1
-SA_UI_ERESET = 'ereset'
-SA_UI_POWERSAVING = 'powersaving'
-SA_UI_IDLETVSTANDBY = 'idletvstandby'
-# FACTORY RESET
-SA_UI_FENGLISH = 'fenglish'
-SA_UI_FESPANOL = 'fespanol'
-SA_UI_FPORTUGUES = 'fportugues'
-SA_UI_FDOWN1 = 'fdown1'
-SA_UI_FDOWN2 = 'fdown2'
-SA_UI_FDOWN3 = 'fdown3'
-SA_UI_FDOWN4 = 'fdown4'
-SA_UI_FDOWN5 = 'fdown5'
-SA_UI_FDOWN6 = 'fdown6'
-SA_UI_FENABLESMARTTV = 'fenablesmarttv'
-SA_UI_FDISABLESMARTTV = 'fdisablesmarttv'
-SA_UI_FEASY = 'feasy'
-SA_UI_FEXPERT = 'fexpert'
-SA_UI_FSKIP = 'fskip'
-SA_UI_FDATE = 'fdate'
-SA_UI_FTIME = 'ftime'
-SA_UI_FOK = 'fok'
-#---------------
-# LINUX UISTRUCLIB_CHD
-#---------------
-# Home layer
-CHD_UI_DTV = 'dtv'
-CHD_UI_WIFISHORTCUT = 'wifishortcut'
-CHD_UI_SEARCH = 'search'
-CHD_UI_APP1 = 'app1'
-CHD_UI_APP2 = 'app2'
-CHD_UI_APP3 = 'app3'
-CHD_UI_PROGRAMMELIST = 'programmelist'
-CHD_UI_DIGITALEPG = 'digitalepg'
-CHD_UI_PHOTO = 'uiphoto'
-CHD_UI_MUSIC = 'uimusic'
-CHD_UI_VIDEO = 'uivideo'    
-CHD_UI_SYSTEMSETTINGS = 'systemsettings'
-CHD_UI_NETWORKSETUP = 'networksetup'
-CHD_UI_CUSTOMERSUPPORT = 'customersupport'
-CHD_UI_HELPGUIDE = 'helpguide'
-CHD_UI_RECOMMENDATIONROW = 'recommendationrow'
-CHD_UI_RECENTCHANNELS = 'recentchannels'
-
-# Option layer
-CHD_UI_SCENESELECT = 'sceneselect'
-CHD_UI_OPICTURE = 'opicture'
-CHD_UI_OSOUND = 'osound'
-CHD_UI_OSPEAKERS = 'ospeakers'
-CHD_UI_AUDIOLANGUAGE = 'audiolanguage'
-CHD_UI_OSUBTITLESETTING = 'osubtitlesetting'
-CHD_UI_OSLEEPTIMER = 'osleeptimer'
-CHD_UI_OPOWERSAVING = 'opowersaving'
-CHD_UI_OSYSTEMINFORMATION = 'osysteminformation'
-
-# CustomerSupport Layer 1
-CHD_UI_SYSTEMINFORMATION = 'systeminformation'
-CHD_UI_VIEWVIDEOLABELS1 = 'viewvideolabels1'
-CHD_UI_VIEWVIDEOLABELS2 = 'viewvideolabels2'
-CHD_UI_VIEWTESTPICTURE = 'viewtestpicture'
-CHD_UI_SOFTWAREUPDATE = 'softwareupdate'
-CHD_UI_AUTOMATICSOFTWAREDOWNLOAD = 'automaticsoftwaredownload'
-CHD_UI_FACTORYSETTINGS = 'factorysettings'
-CHD_UI_INITIALIZEPERSONALINFORMATION = 'initializepersonalinformation'
-CHD_UI_PRODUCTINFORMATION = 'productinformation'
-CHD_UI_CSHELPGUIDE = 'cshelpguide'
-CHD_UI_LEGALINFORMATION = 'legalinformation'
-
-CHD_UI_CSDIGITAL = 'csdigital'
-CHD_UI_CSANALOGUE = 'csanalogue'
-CHD_UI_CSHDMI1 = 'cshdmi1'
-CHD_UI_CSHDMI2 = 'cshdmi2'
-CHD_UI_CSHDMI3 = 'cshdmi3'
-CHD_UI_CSVIDEO = 'csvideo'
-
-# System Setting layer 1
-CHD_UI_PICTURE = 'picture'
-CHD_UI_SOUND = 'sound'
-CHD_UI_SCREEN = 'screen'
-CHD_UI_CHANNELSETUP = 'channelsetup'
-CHD_UI_PARENTALLOCK = 'parentallock'
-CHD_UI_SETUP = 'setup'
-CHD_UI_ECO = 'eco'
-# Picture layer 1
-CHD_UI_PICTUREMODE = 'picturemode'
-CHD_UI_PRESET = 'preset'
-CHD_UI_BRIGHTNESS = 'brightness'
-CHD_UI_CONTRAST = 'contrast'
-CHD_UI_BLACKLEVEL = 'blacklevel'    
-CHD_UI_COLOUR = 'colour'
-CHD_UI_HUE = 'hue'
-CHD_UI_COLOURTEMPERATURE = 'colourtemperature'
-CHD_UI_SHARPNESS = 'sharpness'
-CHD_UI_REALITYCREATION = 'realitycreation'
-CHD_UI_RESOLUTION = 'resolution'
-CHD_UI_MASTEREDIN4K = 'masteredin4k'
-CHD_UI_RANDOMNOISEREDUCTION = 'randomnoisereduction'
-CHD_UI_DIGITALNOISEREDUCTION = 'digitalnoisereduction'
-CHD_UI_MOTIONFLOW = 'motionflow'
-CHD_UI_SMOOTHNESS = 'smoothness'
-CHD_UI_CLEARNESS = 'clearness'
-CHD_UI_FILMMODE = 'filmmode'
-CHD_UI_PADVANCEDSETTINGS = 'padvancedsettings'
-# Picture layer 2
-CHD_UI_P2RESET = 'p2reset'
-CHD_UI_ADVCONTRASTENHANCER = 'advcontrastenhancer'
-CHD_UI_BLACKADJUST = 'blackadjust'
-CHD_UI_GAMMA = 'gamma'
-CHD_UI_LIVECOLOUR = 'livecolour'
-CHD_UI_ADVCOLOURTEMPERATURE = 'advcolourtemperature'
-# Picture Layer 3
-CHD_UI_P3RESET = 'p3reset'
-CHD_UI_RGAIN = 'rgain'
-CHD_UI_GGAIN = 'ggain'
-CHD_UI_BGAIN = 'bgain'
-CHD_UI_RBIAS = 'rbias'
-CHD_UI_GBIAS = 'gbias'
-CHD_UI_BBIAS = 'bbias'
-CHD_UI_COLOURGAMMAADJUSTMENTPOINTS = 'colourgammaadjustmentpoints'
-CHD_UI_ROFFSET = 'roffset'
-CHD_UI_GOFFSET = 'goffset'
-CHD_UI_BOFFSET = 'boffset'
-# Sound layer 1
-CHD_UI_CLEARAUDIO = 'clearaudio'
-CHD_UI_SOUNDMODE = 'soundmode'
-CHD_UI_SRESET = 'sreset'
-CHD_UI_SURROUND = 'surround'
-CHD_UI_SURROUNDEFFECT = 'surroundeffect'
-CHD_UI_SOUNDRESTORATION = 'soundrestoration'
-CHD_UI_EQUALISER = 'equaliser'
-CHD_UI_VOICEZOOM = 'voicezoom'
-CHD_UI_ADVANCEDAUTOVOLUME = 'advancedautovolume'
-CHD_UI_BALANCE = 'balance'
-CHD_UI_VOLUMEOFFSET = 'volumeoffset'
-CHD_UI_DUALSOUND = 'dualsound'
-CHD_UI_SADVANCEDSETTINGS = 'sadvancedsettings'
-# Sound layer 2
-CHD_UI_DYNAMICRANGE = 'dynamicrange'
-CHD_UI_DOLBYDIGITALPLUSOUT = 'dolbydigitalplusout'
-CHD_UI_HEAACAUDIOLEVEL = 'heaacaudiolevel'
-CHD_UI_MPEGAUDIOLEVEL = 'mpegaudiolevel'
-CHD_UI_DOLBYAC4DIALOGENHANCER = 'dolbyac4dialogenhancer'
-# Screen layer 1
-CHD_UI_WIDEMODE = 'widemode'
-CHD_UI_AUTOWIDE = 'autowide'
-CHD_UI_43DEFAULT = '43default'
-CHD_UI_AUTODISPLAYAREA = 'autodisplayarea'
-CHD_UI_DISPLAYAREA = 'displayarea'
-CHD_UI_HORIZONTALSHIFT = 'horizontalshift'
-CHD_UI_VERTICALSHIFT = 'verticalshift'
-CHD_UI_VERTICALSIZE = 'verticalsize'
-CHD_UI_PCSETTINGS = 'pcsettings'
-# Screen layer 2
-# Channel Setup layer 1
-CHD_UI_ANALOGUESETUP = 'analoguesetup'
-CHD_UI_DIGITALSETUP = 'digitalsetup'
-CHD_UI_FMRADIOSETUP = 'fmradiosetup'
-# Channel Setup layer 2
-CHD_UI_ANALOGUEAUTOTUNING = 'analogueautotuning'
-CHD_UI_MANUALPROGRAMMEPRESET = 'manualprogrammepreset'
-CHD_UI_PROGRAMMESORTING = 'programmesorting'
-CHD_UI_DIGITALTUNING = 'digitaltuning'
-CHD_UI_SUBTITLESETUP = 'subtitlesetup'
-CHD_UI_AUDIOSETUP = 'audiosetup'
-CHD_UI_TECHNICALSETUP = 'technicalsetup'    
-CHD_UI_FMAUTOTUNING = 'fmautotuning'
-CHD_UI_FMRADIOPRESETS = 'fmradiopresets'
-# Channel Setup layer 3
-CHD_UI_PROGRAMME = 'programme'
-CHD_UI_TVSYSTEM = 'tvsystem'
-CHD_UI_CHANNEL = 'channel'
-CHD_UI_AFT = 'aft'
-CHD_UI_AUDIOFILTER = 'audiofilter'
-CHD_UI_SKIP = 'skip'
-CHD_UI_COLOURSYSTEM = 'coloursystem'
-CHD_UI_LNA = 'Lna'
-CHD_UI_SIGNALLEVEL = 'signallevel'
-CHD_UI_DIGITALAUTOTUNING = 'digitalautotuning'
-CHD_UI_PROGRAMMELISTEDIT = 'programmelistedit'
-CHD_UI_DIGITALMANUALTUNING = 'digitalmanualtuning'
-CHD_UI_LNA_CH = 'Lna_ch'
-CHD_UI_SUBTITLESETTING = 'subtitlesetting'
-CHD_UI_AUDIOTYPE = 'audiotype'
-CHD_UI_MIXINGLEVEL = 'mixinglevel'
-CHD_UI_AUTOSERVICEUPDATE = 'autoserviceupdate'
-CHD_UI_SERVICEREPLACEMENT = 'servicereplacement'
-# Channel Setup layer 4
-CHD_UI_SCANTYPE = 'scantype'
-CHD_UI_CHANNNELNUMBER = 'channelnumber'
-CHD_UI_FREQUENCY = 'frequency'
-CHD_UI_SCANUP = 'scanup'
-CHD_UI_SCANDOWN = 'scandown'
-# Parental Lock layer 1
-CHD_UI_PINCODE = 'pincode'
-CHD_UI_CHANGEPINCODE = 'changepincode'
-CHD_UI_PARENTALRATING = 'parentalrating'
-CHD_UI_ANALOGUEPROGRAMMELOCK = 'analogueprogrammelock'
-CHD_UI_EXTERNALINPUTLOCK = 'externalinputlock'
-CHD_UI_INTERNETLOCK = 'internetlock'
-# Parental Lock layer 2
-CHD_UI_PHDMI1 = 'phdmi1'
-CHD_UI_PHDMI2 = 'phdmi2'
-CHD_UI_PHDMI3 = 'phdmi3'
-CHD_UI_PVIDEO = 'pvideo'
-# Setup layer 1 (SL)
-CHD_UI_NETWORK = 'network'
-CHD_UI_PRIVACYPOLICY = 'privacypolicy'
-CHD_UI_PHOTOFRAMESETTINGS = 'photoframesettings'
-CHD_UI_USBAUTOSTART = 'usbautostart'
-CHD_UI_CLOCKTIMERS = 'clocktimers'
-CHD_UI_AUTOSTARTUP = 'autostartup'
-CHD_UI_LANGUAGE = 'uilanguage'
-CHD_UI_PHYSICALKEYBOARD = 'physicalkeyboard'
-CHD_UI_STARTUPLOGO = 'startuplogo'
-CHD_UI_LEDINDICATOR = 'ledindicator'
-CHD_UI_AVSETUP = 'avsetup'
-CHD_UI_BRAVIASYNCSETTINGS = 'braviasyncsettings'
-CHD_UI_SLCUSTOMERSUPPORT = 'slcustomersupport'
-# Setup layer 2
-CHD_UI_SLNETWORKSETUP = 'slnetworksetup'
-CHD_UI_USBTETHERINGSTATUS = 'usbtetheringstatus'
-CHD_UI_IPV6IPV4PRIORITY = 'ipv6ipv4priority'
-CHD_UI_BUILTINWIFI = 'builtinwifi'
-CHD_UI_WIFIDIRECT = 'wifidirect'
-CHD_UI_WIFIDIRECTSETTINGS = 'wifidirectsettings'
-CHD_UI_DEVICENAME = 'devicename'
-CHD_UI_REFRESHINTERNETCONTENT = 'refreshinternetcontent'
-CHD_UI_HOMENETWORKSETUP = 'homenetworksetup'    
-CHD_UI_DISPLAYMODE = 'displaymode'
-CHD_UI_CLOCKDISPLAY = 'clockdisplay'
-CHD_UI_AUDIOAPPLICATION = 'audioapplication'
-CHD_UI_IMAGESELECTION = 'imageselection'
-CHD_UI_MUSICSELECTION = 'musicselection'
-CHD_UI_SLIDESHOWSETTING = 'slideshowsetting'
-CHD_UI_MUSICPLAYBACKSETTING = 'musicplaybacksetting'
-CHD_UI_DURATION = 'duration'
-CHD_UI_FIRSTDAYOFTHEWEEK = 'firstdayoftheweek'    
-CHD_UI_SLEEPTIMER = 'sleeptimer'
-CHD_UI_ONTIMER = 'ontimer'
-CHD_UI_CLOCKSET = 'clockset'
-CHD_UI_VIDEOLABELS = 'videolabels'
-CHD_UI_AVPRESET = 'avpreset'
-CHD_UI_SLCOLOURSYSTEM = 'slcoloursystem'
-CHD_UI_SPEAKERS = 'speakers'
-CHD_UI_HEADPHONEAUDIOOUT = 'headphoneaudioout'
-CHD_UI_HEADPHONESPEAKERLINK = 'headphonespeakerlink'
-CHD_UI_HEADPHONEVOLUME = 'headphonevolume'
-CHD_UI_SUBWOOFER = 'subwoofer'
-CHD_UI_DIGITALAUDIOOUT = 'digitalaudioout'
-CHD_UI_TVPOSITION = 'tvposition'
-CHD_UI_HDMISIGNALFORMAT = 'hdmisignalformat'    
-CHD_UI_BRAVIASYNCCONTROL = 'braviasynccontrol'
-CHD_UI_AUTODEVICESOFF = 'autodevicesoff'
-CHD_UI_AUTOTVON = 'autotvon'
-CHD_UI_BRAVIASYNCDEVICELIST = 'braviasyncdevicelist'
-CHD_UI_DEVICECONTROLKEYS = 'devicecontrolkeys'
-
-CHD_UI_SLSYSTEMINFORMATION = 'slsysteminformation'
-CHD_UI_SLVIEWVIDEOLABELS1 = 'slviewvideolabels1'
-CHD_UI_SLVIEWVIDEOLABELS2 = 'slviewvideolabels2'
-CHD_UI_SLVIEWTESTPICTURE = 'slviewtestpicture'
-CHD_UI_SLSOFTWAREUPDATE = 'slsoftwareupdate'
-CHD_UI_SLAUTOMATICSOFTWAREDOWNLOAD = 'slautomaticsoftwaredownload'
-CHD_UI_SLFACTORYSETTINGS = 'slfactorysettings'
-CHD_UI_SLINITIALIZEPERSONALINFORMATION = 'slinitializepersonalinformation'
-CHD_UI_SLPRODUCTINFORMATION = 'slproductsupport'
-CHD_UI_SLHELPGUIDE = 'slhelpguide'
-CHD_UI_SLLEGALINFORMATION = 'sllegalinformation'
-
-CHD_UI_SLDIGITAL = 'sldigital'
-CHD_UI_SLANALOGUE = 'slanalogue'
-CHD_UI_SLHDMI1 = 'slhdmi1'
-CHD_UI_SLHDMI2 = 'slhdmi2'
-CHD_UI_SLHDMI3 = 'slhdmi3'
-CHD_UI_SLVIDEO = 'slvideo'
-# Setup layer 3
-CHD_UI_SERVERDISPLAYSETTINGS = 'serverdisplaysettings'
-CHD_UI_SERVERDIAGNOSTICS = 'serverdiagnostics'
-CHD_UI_REMOTESTART = 'remotestart'
-CHD_UI_RENDERER = 'renderer'        
-CHD_UI_OTONTIMER = 'otontimer'
-CHD_UI_OTDAY = 'otday'
-CHD_UI_OTTIME = 'ottime'
-CHD_UI_OTDURATION = 'otduration'
-CHD_UI_OTINPUT = 'otinput'
-CHD_UI_OTPROGRAMME = 'otprogramme'
-CHD_UI_OTVOLUMESETUP = 'otvolumesetup'
-CHD_UI_DATE = 'date'
-CHD_UI_SLTIME = 'sltime'
-CHD_UI_SDIGITAL = 'sdigital'
-CHD_UI_SANALOGUE = 'sanalogue'
-CHD_UI_SHDMI1 = 'shdmi1'
-CHD_UI_SHDMI2 = 'shdmi2'
-CHD_UI_SHDMI3 = 'shdmi3'
-CHD_UI_SVIDEO = 'svideo'
-CHD_UI_HSFHDMI2 = 'hsfhdmi2'
-CHD_UI_HSFHDMI3 = 'hsfhdmi3'
-CHD_UI_SUBWOOFERLEVEL = 'subwooferlevel'
-CHD_UI_PHASE = 'phase'
-CHD_UI_SUBWOOFERSYNC = 'subwoofersync'
-# Setup layer 4
-CHD_UI_RENDERERFUNCTION = 'rendererfunction'
-CHD_UI_RENDERERACCESSCONTROL = 'rendereraccesscontrol'
-CHD_UI_RENDERERSETUP = 'renderersetup'
-CHD_UI_AUTOMATICACCESSPERMISSION = 'automaticaccesspermission'
-# Eco layer 1
-CHD_UI_ERESET = 'ereset'
-CHD_UI_POWERSAVING = 'powersaving'
-CHD_UI_IDLETVSTANDBY = 'idletvstandby'
-
-CHD_UI_FENGLISH = 'uienglish'
-CHD_UI_FCHINESE = 'uifchinese'
-CHD_UI_FDOWN1 = 'fdown1'
-CHD_UI_FDOWN2 = 'fdown2'
-CHD_UI_FDOWN3 = 'fdown3'
-CHD_UI_FDOWN4 = 'fdown4'
-CHD_UI_FDOWN5 = 'fdown5'
-CHD_UI_FDOWN6 = 'fdown6'
-CHD_UI_FENABLESMARTTV = 'fenablesmarttv'
-CHD_UI_FDISABLESMARTTV = 'fdisablesmarttv'
-CHD_UI_FEASY = 'feasy'
-CHD_UI_FEXPERT = 'fexpert'
-CHD_UI_FSKIP = 'fskip'
-
-CHD_UI_FDATE = 'fdate'
-CHD_UI_FTIME = 'ftime'
-CHD_UI_FOK = 'fok'
-#---------------
-# LINUX UISTRUCLIB_COL
-#---------------
-# Home layer
-COL_UI_DTV = 'dtv'
-COL_UI_WIFISHORTCUT = 'wifishortcut'
-COL_UI_SEARCH = 'search'
-COL_UI_APP1 = 'app1'
-COL_UI_APP2 = 'app2'
-COL_UI_APP3 = 'app3'
-COL_UI_PROGRAMMELIST = 'programmelist'
-COL_UI_DIGITALEPG = 'digitalepg'
-COL_UI_PHOTO = 'uiphoto'
-COL_UI_MUSIC = 'uimusic'
-COL_UI_VIDEO = 'uivideo'    
-COL_UI_PREFERENCES = 'preferemces'
-COL_UI_NETWORKSETUP = 'networksetup'
-COL_UI_CUSTOMERSUPPORT = 'customersupport'
-COL_UI_HELPGUIDE = 'helpguide'
-COL_UI_RECOMMENDATIONROW = 'recommendationrow'
-COL_UI_RECENTCHANNELS = 'recentchannels'
-
-# Option layer
-COL_UI_SCENESELECT = 'sceneselect'
-COL_UI_OPICTUREADJUSTMENTS = 'opictureadjustments'
-COL_UI_OSOUNDADJUSTMENTS = 'osoundadjustments'
-COL_UI_OSPEAKERS = 'ospeakers'
-COL_UI_AUDIOLANGUAGE = 'audiolanguage'
-COL_UI_OSUBTITLESETTING = 'osubtitlesetting'
-COL_UI_OSLEEPTIMER = 'osleeptimer'
-COL_UI_OPOWERSAVING = 'opowersaving'
-COL_UI_OSYSTEMINFORMATION = 'osysteminformation'
-
-# CustomerSupport Layer 1
-COL_UI_SYSTEMINFORMATION = 'systeminformation'
-COL_UI_VIEWMANAGEINPUTS1 = 'viewmanageinputs1'
-COL_UI_VIEWMANAGEINPUTS2 = 'viewmanageinputs2'
-COL_UI_VIEWTESTPICTURE = 'viewtestpicture'
-COL_UI_SOFTWAREUPDATE = 'softwareupdate'
-COL_UI_AUTOMATICSOFTWAREDOWNLOAD = 'automaticsoftwaredownload'
-COL_UI_FACTORYSETTINGS = 'factorysettings'
-COL_UI_INITIALIZEPERSONALINFORMATION = 'initializepersonalinformation'
-COL_UI_PRODUCTINFORMATION = 'productinformation'
-COL_UI_CSHELPGUIDE = 'cshelpguide'
-COL_UI_LEGALINFORMATION = 'legalinformation'
-
-COL_UI_CSHDMI1 = 'cshdmi1'
-COL_UI_CSHDMI2 = 'cshdmi2'
-COL_UI_CSHDMI3 = 'cshdmi3'
-COL_UI_CSVIDEO = 'csvideo'
-COL_UI_CSHDMI1ENABLE = 'cshdmi1enable'
-COL_UI_CSHDMI2ENABLE = 'cshdmi2enable'
-COL_UI_CSHDMI3ENABLE = 'cshdmi3enable'
-COL_UI_CSVIDEOENABLE = 'csvideoenable'
-COL_UI_CSHDMI1LABEL = 'cshdmi1label'
-COL_UI_CSHDMI2LABEL = 'cshdmi2label'
-COL_UI_CSHDMI3LABEL = 'cshdmi3label'
-COL_UI_CSVIDEOLABEL = 'csvideolabel'
-
-# System Setting layer 1
-COL_UI_PICTURE = 'picture'
-COL_UI_SOUND = 'sound'
-COL_UI_SCREEN = 'screen'
-COL_UI_CHANNELSETUP = 'channelsetup'
-COL_UI_PARENTALLOCK = 'parentallock'
-COL_UI_SETUP = 'setup'
-COL_UI_ECO = 'eco'
-# Picture layer 1
-COL_UI_PICTUREMODE = 'picturemode'
-COL_UI_PRESET = 'preset'
-COL_UI_BRIGHTNESS = 'brightness'
-COL_UI_CONTRAST = 'contrast'
-COL_UI_BLACKLEVEL = 'blacklevel'    
-COL_UI_COLOUR = 'colour'
-COL_UI_HUE = 'hue'
-COL_UI_COLOURTEMPERATURE = 'colourtemperature'
-COL_UI_SHARPNESS = 'sharpness'
-COL_UI_REALITYCREATION = 'realitycreation'
-COL_UI_RESOLUTION = 'resolution'
-COL_UI_MASTEREDIN4K = 'masteredin4k'
-COL_UI_RANDOMNOISEREDUCTION = 'randomnoisereduction'
-COL_UI_DIGITALNOISEREDUCTION = 'digitalnoisereduction'
-COL_UI_MOTIONFLOW = 'motionflow'
-COL_UI_SMOOTHNESS = 'smoothness'
-COL_UI_CLEARNESS = 'clearness'
-COL_UI_FILMMODE = 'filmmode'
-COL_UI_PADVANCEDSETTINGS = 'padvancedsettings'
-# Picture layer 2
-COL_UI_P2RESET = 'p2reset'
-COL_UI_ADVCONTRASTENHANCER = 'advcontrastenhancer'
-COL_UI_BLACKADJUST = 'blackadjust'
-COL_UI_GAMMA = 'gamma'
-COL_UI_LIVECOLOUR = 'livecolour'
-COL_UI_ADVCOLOURTEMPERATURE = 'advcolourtemperature'
-# Picture Layer 3
-COL_UI_P3RESET = 'p3reset'
-COL_UI_RGAIN = 'rgain'
-COL_UI_GGAIN = 'ggain'
-COL_UI_BGAIN = 'bgain'
-COL_UI_RBIAS = 'rbias'
-COL_UI_GBIAS = 'gbias'
-COL_UI_BBIAS = 'bbias'
-COL_UI_COLOURGAMMAADJUSTMENTPOINTS = 'colourgammaadjustmentpoints'
-COL_UI_ROFFSET = 'roffset'
-COL_UI_GOFFSET = 'goffset'
-COL_UI_BOFFSET = 'boffset'
-# Sound layer 1
-COL_UI_CLEARAUDIO = 'clearaudio'
-COL_UI_SOUNDMODE = 'soundmode'
-COL_UI_SRESET = 'sreset'
-COL_UI_SURROUND = 'surround'
-COL_UI_SURROUNDEFFECT = 'surroundeffect'
-COL_UI_SOUNDRESTORATION = 'soundrestoration'
-COL_UI_EQUALISER = 'equaliser'
-COL_UI_VOICEZOOM = 'voicezoom'
-COL_UI_ADVANCEDAUTOVOLUME = 'advancedautovolume'
-COL_UI_BALANCE = 'balance'
-COL_UI_VOLUMEOFFSET = 'volumeoffset'
-COL_UI_DUALSOUND = 'dualsound'
-COL_UI_SADVANCEDSETTINGS = 'sadvancedsettings'
-# Sound layer 2
-COL_UI_DYNAMICRANGE = 'dynamicrange'
-COL_UI_DOLBYDIGITALPLUSOUT = 'dolbydigitalplusout'
-COL_UI_HEAACAUDIOLEVEL = 'heaacaudiolevel'
-COL_UI_MPEGAUDIOLEVEL = 'mpegaudiolevel'
-COL_UI_DOLBYAC4DIALOGENHANCER = 'dolbyac4dialogenhancer'
-# Screen layer 1
-COL_UI_WIDEMODE = 'widemode'
-COL_UI_AUTOWIDE = 'autowide'
-COL_UI_43DEFAULT = '43default'
-COL_UI_AUTODISPLAYAREA = 'autodisplayarea'
-COL_UI_DISPLAYAREA = 'displayarea'
-COL_UI_HORIZONTALSHIFT = 'horizontalshift'
-COL_UI_VERTICALSHIFT = 'verticalshift'
-COL_UI_VERTICALSIZE = 'verticalsize'
-COL_UI_PCSETTINGS = 'pcsettings'
-# Screen layer 2
-# Channel Setup layer 1
-COL_UI_ANALOGUESETUP = 'analoguesetup'
-COL_UI_DIGITALSETUP = 'digitalsetup'
-COL_UI_FMRADIOSETUP = 'fmradiosetup'
-# Channel Setup layer 2
-COL_UI_CABLEANTENNA = 'cableantenna'
-COL_UI_ANALOGUEAUTOTUNING = 'analogueautotuning'
-COL_UI_MANUALPROGRAMMEPRESET = 'manualprogrammepreset'
-COL_UI_PROGRAMMESORTING = 'programmesorting'
-COL_UI_DIGITALTUNING = 'digitaltuning'
-COL_UI_SUBTITLESETUP = 'subtitlesetup'
-COL_UI_AUDIOSETUP = 'audiosetup'
-COL_UI_GUIDESETUP = 'guidesetup'
-COL_UI_TECHNICALSETUP = 'technicalsetup'    
-COL_UI_INTERACTIVEAPPLICATIONSETUP = 'interactiveapplicationsetup'
-COL_UI_FMAUTOTUNING = 'fmautotuning'
-COL_UI_FMRADIOPRESETS = 'fmradiopresets'
-COL_UI_ANALOGUECHANNELADJUSTMENT = 'analoguechanneladjustment'
-COL_UI_SHOWHIDECHANNELS = 'showhidechannels'
-COL_UI_LABELCHANNELS = 'labelchannels'
-# Channel Setup layer 3
-COL_UI_PROGRAMME = 'programme'
-COL_UI_TVSYSTEM = 'tvsystem'
-COL_UI_CHANNEL = 'channel'
-COL_UI_AFT = 'aft'
-COL_UI_AUDIOFILTER = 'audiofilter'
-COL_UI_ERROR_STR = 'error_str'
-COL_UI_SKIP = 'uiskip'
-COL_UI_COLOURSYSTEM = 'coloursystem'
-COL_UI_SIGNALLEVEL = 'signallevel'
-COL_UI_DIGITALAUTOTUNING = 'digitalautotuning'
-COL_UI_PROGRAMMELISTEDIT = 'programmelistedit'
-COL_UI_DIGITALMANUALTUNING = 'digitalmanualtuning'
-COL_UI_DSIGNALBOOSTER = 'dsignalbooster'
-COL_UI_SUBTITLESETTING = 'subtitlesetting'
-COL_UI_SPRIMARYPREFERREDLANGUAGE = 'sprimarypreferredlanguage'
-COL_UI_SSECONDARYPREFERREDLANGUAGE = 'ssecondarypreferredlanguage'
-COL_UI_AUDIOTYPE = 'audiotype'
-COL_UI_APRIMARYPREFERREDLANGUAGE = 'aprimarypreferredlanguage'
-COL_UI_ASECONDARYPREFERREDLANGUAGE = 'asecondarypreferredlanguage'
-COL_UI_MIXINGLEVEL = 'mixinglevel'
-COL_UI_UPDATEGUIDEINSTANDBY = 'updateguideinstandby'
-COL_UI_AUTOSERVICEUPDATE = 'autoserviceupdate'
-COL_UI_SERVICEREPLACEMENT = 'servicereplacement'
-COL_UI_INTERACTIVEAPPLICATION = 'interactiveapplication'
-COL_UI_AUTOSTARTAPPLICATION = 'autostartapplication'
-COL_UI_APPLICATIONFORPROG = 'applicationforprog'
-COL_UI_ACHANNEL = 'achannel'
-COL_UI_ANALOGUEFINETUNE = 'analoguefinetune'
-# Channel Setup layer 4
-COL_UI_SCANTYPE = 'scantype'
-COL_UI_CHANNNELNUMBER = 'channelnumber'
-COL_UI_FREQUENCY = 'frequency'
-COL_UI_SCANUP = 'scanup'
-COL_UI_SCANDOWN = 'scandown'
-# Parental Lock layer 1
-COL_UI_PASSWORD = 'password'
-COL_UI_CHANGEPASSWORD = 'changepassword'
-COL_UI_RATING = 'rating'
-COL_UI_DIGITALPROGRAMMELOCK = 'digitalprogrammelock'
-COL_UI_EXTERNALINPUTLOCK = 'externalinputlock'
-COL_UI_INTERNETLOCK = 'internetlock'
-# Parental Lock layer 2
-COL_UI_PHDMI1 = 'phdmi1'
-COL_UI_PHDMI2 = 'phdmi2'
-COL_UI_PHDMI3 = 'phdmi3'
-COL_UI_PVIDEO = 'pvideo'
-# Setup layer 1 (SL)
-COL_UI_NETWORK = 'network'
-COL_UI_PRIVACYPOLICY = 'privacypolicy'
-COL_UI_PHOTOFRAMESETTINGS = 'photoframesettings'
-COL_UI_USBAUTOSTART = 'usbautostart'
-COL_UI_CLOSEDCAPTIONS = 'closedcaptions'
-COL_UI_CLOCKTIMERS = 'clocktimers'
-COL_UI_AUTOSTARTUP = 'autostartup'
-COL_UI_LANGUAGE = 'uilanguage'
-COL_UI_PHYSICALKEYBOARD = 'physicalkeyboard'
-COL_UI_STARTUPLOGO = 'startuplogo'
-COL_UI_LEDINDICATOR = 'ledindicator'
-COL_UI_AVSETUP = 'avsetup'
-COL_UI_BRAVIASYNCSETTINGS = 'braviasyncsettings'
-COL_UI_SLCUSTOMERSUPPORT = 'slcustomersupport'
-# Setup layer 2
-COL_UI_SLNETWORKSETUP = 'slnetworksetup'
-COL_UI_USBTETHERINGSTATUS = 'usbtetheringstatus'
-COL_UI_IPV6IPV4PRIORITY = 'ipv6ipv4priority'
-COL_UI_BUILTINWIFI = 'builtinwifi'
-COL_UI_WIFIDIRECT = 'wifidirect'
-COL_UI_WIFIDIRECTSETTINGS = 'wifidirectsettings'
-COL_UI_DEVICENAME = 'devicename'
-COL_UI_REFRESHINTERNETCONTENT = 'refreshinternetcontent'
-COL_UI_HOMENETWORKSETUP = 'homenetworksetup'    
-COL_UI_DISPLAYMODE = 'displaymode'
-COL_UI_CLOCKDISPLAY = 'clockdisplay'
-COL_UI_AUDIOAPPLICATION = 'audioapplication'
-COL_UI_IMAGESELECTION = 'imageselection'
-COL_UI_MUSICSELECTION = 'musicselection'
-COL_UI_SLIDESHOWSETTING = 'slideshowsetting'
-COL_UI_MUSICPLAYBACKSETTING = 'musicplaybacksetting'
-COL_UI_DURATION = 'duration'
-COL_UI_FIRSTDAYOFTHEWEEK = 'firstdayoftheweek'
-COL_UI_CCDISPLAY = 'ccdisplay'
-COL_UI_ANALOGCC = 'analogcc'
-COL_UI_SLEEPTIMER = 'sleeptimer'
-COL_UI_ONTIMER = 'ontimer'
-COL_UI_CLOCKSET = 'clockset'
-COL_UI_MANAGEINPUTS = 'manageinputs'
-COL_UI_AVPRESET = 'avpreset'
-COL_UI_SLCOLOURSYSTEM = 'slcoloursystem'
-COL_UI_SPEAKERS = 'speakers'
-COL_UI_HEADPHONEAUDIOOUT = 'headphoneaudioout'
-COL_UI_HEADPHONESPEAKERLINK = 'headphonespeakerlink'
-COL_UI_HEADPHONEVOLUME = 'headphonevolume'
-COL_UI_SUBWOOFER = 'subwoofer'
-COL_UI_DIGITALAUDIOOUT = 'digitalaudioout'
-COL_UI_TVPOSITION = 'tvposition'
-COL_UI_HDMISIGNALFORMAT = 'hdmisignalformat'    
-COL_UI_BRAVIASYNCCONTROL = 'braviasynccontrol'
-COL_UI_AUTODEVICESOFF = 'autodevicesoff'
-COL_UI_AUTOTVON = 'autotvon'
-COL_UI_BRAVIASYNCDEVICELIST = 'braviasyncdevicelist'
-COL_UI_DEVICECONTROLKEYS = 'devicecontrolkeys'
-
-COL_UI_SLSYSTEMINFORMATION = 'slsysteminformation'
-COL_UI_SLSYSTEMINFORMATION2 = 'slsysteminformation2'
-COL_UI_SLVIEWMANAGEINPUTS1 = 'slviewmangeinputs1'
-COL_UI_SLVIEWMANAGEINPUTS2 = 'slviewmanageinputs2'
-COL_UI_SLVIEWTESTPICTURE = 'slviewtestpicture'
-COL_UI_SLSOFTWAREUPDATE = 'slsoftwareupdate'
-COL_UI_SLAUTOMATICSOFTWAREDOWNLOAD = 'slautomaticsoftwaredownload'
-COL_UI_SLFACTORYSETTINGS = 'slfactorysettings'
-COL_UI_SLINITIALIZEPERSONALINFORMATION = 'slinitializepersonalinformation'
-COL_UI_SLPRODUCTINFORMATION = 'slproductsupport'
-COL_UI_SLHELPGUIDE = 'slhelpguide'
-COL_UI_SLLEGALINFORMATION = 'sllegalinformation'
-
-COL_UI_SLHDMI1 = 'slhdmi1'
-COL_UI_SLHDMI2 = 'slhdmi2'
-COL_UI_SLHDMI3 = 'slhdmi3'
-COL_UI_SLVIDEO = 'slvideo'
-COL_UI_SLHDMI1ENABLE = 'slhdmi1enable'
-COL_UI_SLHDMI2ENABLE = 'slhdmi2enable'
-COL_UI_SLHDMI3ENABLE = 'slhdmi3enable'
-COL_UI_SLVIDEOENABLE = 'slvideoenable'
-COL_UI_SLHDMI1LABEL = 'slhdmi1label'
-COL_UI_SLHDMI2LABEL = 'slhdmi2label'
-COL_UI_SLHDMI3LABEL = 'slhdmi3label'
-COL_UI_SLVIDEOLABEL = 'slvideolabel'
-# Setup layer 3
-COL_UI_SERVERDISPLAYSETTINGS = 'serverdisplaysettings'
-COL_UI_SERVERDIAGNOSTICS = 'serverdiagnostics'
-COL_UI_REMOTESTART = 'remotestart'
-COL_UI_RENDERER = 'renderer'        
-COL_UI_AUTOMANUAL = 'automanual'
-COL_UI_AUTOMATICTIMEZONE = 'automatictimezone'
-COL_UI_AUTOMATICDAYLIGHTSAVINGTIME = 'automaticdaylightsavingtime'
-COL_UI_OTTIMER = 'ottimer'
-COL_UI_OTDAY = 'otday'
-COL_UI_OTTIME = 'ottime'
-COL_UI_OTDURATION = 'otduration'
-COL_UI_OTINPUT = 'otinput'
-COL_UI_OTCHANNEL = 'otchannel'
-COL_UI_OTTVONVOLUME = 'otonvolume'
-COL_UI_DATE = 'date'
-COL_UI_SLTIME = 'sltime'
-COL_UI_TIMEOFFSET = 'timeoffset'                
-COL_UI_SHDMI1 = 'shdmi1'
-COL_UI_SHDMI2 = 'shdmi2'
-COL_UI_SHDMI3 = 'shdmi3'
-COL_UI_SVIDEO = 'svideo'
-COL_UI_HSFHDMI2 = 'hsfhdmi2'
-COL_UI_HSFHDMI3 = 'hsfhdmi3'
-COL_UI_SUBWOOFERLEVEL = 'subwooferlevel'
-COL_UI_PHASE = 'phase'
-COL_UI_SUBWOOFERSYNC = 'subwoofersync'
-# Setup layer 4
-COL_UI_RENDERERFUNCTION = 'rendererfunction'
-COL_UI_RENDERERACCESSCONTROL = 'rendereraccesscontrol'
-COL_UI_RENDERERSETUP = 'renderersetup'
-COL_UI_AUTOMATICACCESSPERMISSION = 'automaticaccesspermission'
-# Eco layer 1
-COL_UI_ERESET = 'ereset'
-COL_UI_POWERSAVING = 'powersaving'
-COL_UI_IDLETVSTANDBY = 'idletvstandby'
-# Factory Settings
-COL_UI_UIENGLISH = 'uienglish'
-COL_UI_UIESPANOL = 'uiespanol'
-COL_UI_FAUTOMANUAL = 'fautomanual'
-COL_UI_FTIMEOFFSET = 'ftimeoffset'
-COL_UI_FOK = 'fok'
-COL_UI_FEASY = 'feasy'
-COL_UI_FEXPERT = 'fexpert'
-COL_UI_FSKIP = 'fskip'
-#---------------
-# LINUX UISTRUCLIB_TW
-#---------------
-# Home layer
-TW_UI_DTV = 'dtv'
-TW_UI_WIFISHORTCUT = 'wifishortcut'
-TW_UI_SEARCH = 'search'
-TW_UI_APP1 = 'app1'
-TW_UI_APP2 = 'app2'
-TW_UI_APP3 = 'app3'
-TW_UI_PROGRAMMELIST = 'programmelist'
-TW_UI_DIGITALEPG = 'digitalepg'
-TW_UI_PHOTO = 'uiphoto'
-TW_UI_MUSIC = 'uimusic'
-TW_UI_VIDEO = 'uivideo'    
-TW_UI_SYSTEMSETTINGS = 'systemsettings'
-TW_UI_NETWORKSETUP = 'networksetup'
-TW_UI_CUSTOMERSUPPORT = 'customersupport'
-TW_UI_HELPGUIDE = 'helpguide'
-TW_UI_RECOMMENDATIONROW = 'recommendationrow'
-TW_UI_RECENTCHANNELS = 'recentchannels'
-
-# Option layer
-TW_UI_SCENESELECT = 'sceneselect'
-TW_UI_OPICTURE = 'opicture'
-TW_UI_OSOUND = 'osound'
-TW_UI_OSPEAKERS = 'ospeakers'
-TW_UI_AUDIOLANGUAGE = 'audiolanguage'
-TW_UI_OSUBTITLESETTING = 'osubtitlesetting'
-TW_UI_OSLEEPTIMER = 'osleeptimer'
-TW_UI_OPOWERSAVING = 'opowersaving'
-TW_UI_OSYSTEMINFORMATION = 'osysteminformation'
-
-# CustomerSupport Layer 1
-TW_UI_SYSTEMINFORMATION = 'systeminformation'
-TW_UI_VIEWVIDEOLABELS1 = 'viewvideolabels1'
-TW_UI_VIEWVIDEOLABELS2 = 'viewvideolabels2'
-TW_UI_VIEWTESTPICTURE = 'viewtestpicture'
-TW_UI_SOFTWAREUPDATE = 'softwareupdate'
-TW_UI_AUTOMATICSOFTWAREDOWNLOAD = 'automaticsoftwaredownload'
-TW_UI_FACTORYSETTINGS = 'factorysettings'
-TW_UI_INITIALIZEPERSONALINFORMATION = 'initializepersonalinformation'
-TW_UI_PRODUCTINFORMATION = 'productinformation'
-TW_UI_CSHELPGUIDE = 'cshelpguide'
-TW_UI_LEGALINFORMATION = 'legalinformation'
-
-TW_UI_CSHDMI1 = 'cshdmi1'
-TW_UI_CSHDMI2 = 'cshdmi2'
-TW_UI_CSHDMI3 = 'cshdmi3'
-TW_UI_CSVIDEO = 'csvideo'
-
-# System Setting layer 1
-TW_UI_PICTURE = 'picture'
-TW_UI_SOUND = 'sound'
-TW_UI_SCREEN = 'screen'
-TW_UI_CHANNELSETUP = 'channelsetup'
-TW_UI_PARENTALLOCK = 'parentallock'
-TW_UI_SETUP = 'setup'
-TW_UI_ECO = 'eco'
-# Picture layer 1
-TW_UI_PICTUREMODE = 'picturemode'
-TW_UI_PRESET = 'preset'
-TW_UI_BRIGHTNESS = 'brightness'
-TW_UI_CONTRAST = 'contrast'
-TW_UI_BLACKLEVEL = 'blacklevel'    
-TW_UI_COLOUR = 'colour'
-TW_UI_HUE = 'hue'
-TW_UI_COLOURTEMPERATURE = 'colourtemperature'
-TW_UI_SHARPNESS = 'sharpness'
-TW_UI_REALITYCREATION = 'realitycreation'
-TW_UI_RESOLUTION = 'resolution'
-TW_UI_MASTEREDIN4K = 'masteredin4k'
-TW_UI_RANDOMNOISEREDUCTION = 'randomnoisereduction'
-TW_UI_DIGITALNOISEREDUCTION = 'digitalnoisereduction'
-TW_UI_MOTIONFLOW = 'motionflow'
-TW_UI_SMOOTHNESS = 'smoothness'
-TW_UI_CLEARNESS = 'clearness'
-TW_UI_FILMMODE = 'filmmode'
-TW_UI_PADVANCEDSETTINGS = 'padvancedsettings'
-# Picture layer 2
-TW_UI_P2RESET = 'p2reset'
-TW_UI_ADVCONTRASTENHANCER = 'advcontrastenhancer'
-TW_UI_BLACKADJUST = 'blackadjust'
-TW_UI_GAMMA = 'gamma'
-TW_UI_LIVECOLOUR = 'livecolour'
-TW_UI_ADVCOLOURTEMPERATURE = 'advcolourtemperature'
-# Picture Layer 3
-TW_UI_P3RESET = 'p3reset'
-TW_UI_RGAIN = 'rgain'
-TW_UI_GGAIN = 'ggain'
-TW_UI_BGAIN = 'bgain'
-TW_UI_RBIAS = 'rbias'
-TW_UI_GBIAS = 'gbias'
-TW_UI_BBIAS = 'bbias'
-TW_UI_COLOURGAMMAADJUSTMENTPOINTS = 'colourgammaadjustmentpoints'
-TW_UI_ROFFSET = 'roffset'
-TW_UI_GOFFSET = 'goffset'
-TW_UI_BOFFSET = 'boffset'
-# Sound layer 1
-TW_UI_CLEARAUDIO = 'clearaudio'
-TW_UI_SOUNDMODE = 'soundmode'
-TW_UI_SRESET = 'sreset'
-TW_UI_SURROUND = 'surround'
-TW_UI_SURROUNDEFFECT = 'surroundeffect'
-TW_UI_SOUNDRESTORATION = 'soundrestoration'
-TW_UI_EQUALISER = 'equaliser'
-TW_UI_VOICEZOOM = 'voicezoom'
-TW_UI_ADVANCEDAUTOVOLUME = 'advancedautovolume'
-TW_UI_BALANCE = 'balance'
-TW_UI_VOLUMEOFFSET = 'volumeoffset'
-TW_UI_DUALSOUND = 'dualsound'
-TW_UI_SADVANCEDSETTINGS = 'sadvancedsettings'
-# Sound layer 2
-TW_UI_DYNAMICRANGE = 'dynamicrange'
-TW_UI_DOLBYDIGITALPLUSOUT = 'dolbydigitalplusout'
-TW_UI_HEAACAUDIOLEVEL = 'heaacaudiolevel'
-TW_UI_MPEGAUDIOLEVEL = 'mpegaudiolevel'
-TW_UI_DOLBYAC4DIALOGENHANCER = 'dolbyac4dialogenhancer'
-# Screen layer 1
-TW_UI_WIDEMODE = 'widemode'
-TW_UI_AUTOWIDE = 'autowide'
-TW_UI_43DEFAULT = '43default'
-TW_UI_AUTODISPLAYAREA = 'autodisplayarea'
-TW_UI_DISPLAYAREA = 'displayarea'
-TW_UI_HORIZONTALSHIFT = 'horizontalshift'
-TW_UI_VERTICALSHIFT = 'verticalshift'
-TW_UI_VERTICALSIZE = 'verticalsize'
-TW_UI_PCSETTINGS = 'pcsettings'
-# Screen layer 2
-# Channel Setup layer 1
-TW_UI_ANALOGUESETUP = 'analoguesetup'
-TW_UI_DIGITALSETUP = 'digitalsetup'
-TW_UI_FMRADIOSETUP = 'fmradiosetup'
-# Channel Setup layer 2
-TW_UI_CABLEANTENNA = 'cableantenna'
-TW_UI_ANALOGUEAUTOTUNING = 'analogueautotuning'
-TW_UI_MANUALPROGRAMMEPRESET = 'manualprogrammepreset'
-TW_UI_PROGRAMMESORTING = 'programmesorting'
-TW_UI_DIGITALTUNING = 'digitaltuning'
-TW_UI_SUBTITLESETUP = 'subtitlesetup'
-TW_UI_AUDIOSETUP = 'audiosetup'
-TW_UI_GUIDESETUP = 'guidesetup'
-TW_UI_TECHNICALSETUP = 'technicalsetup'    
-TW_UI_INTERACTIVEAPPLICATIONSETUP = 'interactiveapplicationsetup'
-TW_UI_FMAUTOTUNING = 'fmautotuning'
-TW_UI_FMRADIOPRESETS = 'fmradiopresets'
-TW_UI_ANALOGUECHANNELADJUSTMENT = 'analoguechanneladjustment'
-TW_UI_SHOWHIDECHANNELS = 'showhidechannels'
-TW_UI_LABELCHANNELS = 'labelchannels'
-# Channel Setup layer 3
-TW_UI_PROGRAMME = 'programme'
-TW_UI_TVSYSTEM = 'tvsystem'
-TW_UI_CHANNEL = 'channel'
-TW_UI_AFT = 'aft'
-TW_UI_AUDIOFILTER = 'audiofilter'
-TW_UI_ERROR_STR = 'error_str'
-TW_UI_SKIP = 'skip'
-TW_UI_COLOURSYSTEM = 'coloursystem'
-TW_UI_SIGNALLEVEL = 'signallevel'
-TW_UI_DIGITALAUTOTUNING = 'digitalautotuning'
-TW_UI_AUTOTUNINGRANGE = 'autotuningrange'
-TW_UI_PROGRAMMELISTEDIT = 'programmelistedit'
-TW_UI_DIGITALMANUALTUNING = 'digitalmanualtuning'
-TW_UI_DSIGNALBOOSTER = 'dsignalbooster'
-TW_UI_SUBTITLESETTING = 'subtitlesetting'
-TW_UI_SPRIMARYPREFERREDLANGUAGE = 'sprimarypreferredlanguage'
-TW_UI_SSECONDARYPREFERREDLANGUAGE = 'ssecondarypreferredlanguage'
-TW_UI_AUDIOTYPE = 'audiotype'
-TW_UI_APRIMARYPREFERREDLANGUAGE = 'aprimarypreferredlanguage'
-TW_UI_ASECONDARYPREFERREDLANGUAGE = 'asecondarypreferredlanguage'
-TW_UI_MIXINGLEVEL = 'mixinglevel'
-TW_UI_UPDATEGUIDEINSTANDBY = 'updateguideinstandby'
-TW_UI_AUTOSERVICEUPDATE = 'autoserviceupdate'
-TW_UI_SERVICEREPLACEMENT = 'servicereplacement'
-TW_UI_INTERACTIVEAPPLICATION = 'interactiveapplication'
-TW_UI_AUTOSTARTAPPLICATION = 'autostartapplication'
-TW_UI_APPLICATIONFORPROG = 'applicationforprog'
-TW_UI_ACHANNEL = 'achannel'
-TW_UI_ANALOGUEFINETUNE = 'analoguefinetune'
-# Channel Setup layer 4
-TW_UI_SCANTYPE = 'scantype'
-TW_UI_CHANNNELNUMBER = 'channelnumber'
-TW_UI_FREQUENCY = 'frequency'
-TW_UI_SCANUP = 'scanup'
-TW_UI_SCANDOWN = 'scandown'
-# Parental Lock layer 1
-TW_UI_PINCODE = 'pincode'
-TW_UI_CHANGEPINCODE = 'changepincode'
-TW_UI_PARENTALRATING = 'parentalrating'
-TW_UI_DIGITALPROGRAMMELOCK = 'digitalprogrammelock'
-TW_UI_EXTERNALINPUTLOCK = 'externalinputlock'
-TW_UI_INTERNETLOCK = 'internetlock'
-# Parental Lock layer 2
-TW_UI_PHDMI1 = 'phdmi1'
-TW_UI_PHDMI2 = 'phdmi2'
-TW_UI_PHDMI3 = 'phdmi3'
-TW_UI_PVIDEO = 'pvideo'
-# Setup layer 1 (SL)
-TW_UI_NETWORK = 'network'
-TW_UI_PRIVACYPOLICY = 'privacypolicy'
-TW_UI_PHOTOFRAMESETTINGS = 'photoframesettings'
-TW_UI_USBAUTOSTART = 'usbautostart'
-TW_UI_CLOCKTIMERS = 'clocktimers'
-TW_UI_AUTOSTARTUP = 'autostartup'
-TW_UI_LANGUAGE = 'uilanguage'
-TW_UI_PHYSICALKEYBOARD = 'physicalkeyboard'
-TW_UI_STARTUPLOGO = 'startuplogo'
-TW_UI_LEDINDICATOR = 'ledindicator'
-TW_UI_AVSETUP = 'avsetup'
-TW_UI_BRAVIASYNCSETTINGS = 'braviasyncsettings'
-TW_UI_SLCUSTOMERSUPPORT = 'slcustomersupport'
-# Setup layer 2
-TW_UI_SLNETWORKSETUP = 'slnetworksetup'
-TW_UI_USBTETHERINGSTATUS = 'usbtetheringstatus'
-TW_UI_IPV6IPV4PRIORITY = 'ipv6ipv4priority'
-TW_UI_BUILTINWIFI = 'builtinwifi'
-TW_UI_WIFIDIRECT = 'wifidirect'
-TW_UI_WIFIDIRECTSETTINGS = 'wifidirectsettings'
-TW_UI_DEVICENAME = 'devicename'
-TW_UI_REFRESHINTERNETCONTENT = 'refreshinternetcontent'
-TW_UI_HOMENETWORKSETUP = 'homenetworksetup'    
-TW_UI_DISPLAYMODE = 'displaymode'
-TW_UI_CLOCKDISPLAY = 'clockdisplay'
-TW_UI_AUDIOAPPLICATION = 'audioapplication'
-TW_UI_IMAGESELECTION = 'imageselection'
-TW_UI_MUSICSELECTION = 'musicselection'
-TW_UI_SLIDESHOWSETTING = 'slideshowsetting'
-TW_UI_MUSICPLAYBACKSETTING = 'musicplaybacksetting'
-TW_UI_DURATION = 'duration'
-TW_UI_FIRSTDAYOFTHEWEEK = 'firstdayoftheweek'    
-TW_UI_SLEEPTIMER = 'sleeptimer'
-TW_UI_ONTIMER = 'ontimer'
-TW_UI_CLOCKSET = 'clockset'
-TW_UI_LABELVIDEOINPUTS = 'labelvideoinputs'
-TW_UI_AVPRESET = 'avpreset'
-TW_UI_SLCOLOURSYSTEM = 'slcoloursystem'
-TW_UI_SPEAKERS = 'speakers'
-TW_UI_HEADPHONEAUDIOOUT = 'headphoneaudioout'
-TW_UI_HEADPHONESPEAKERLINK = 'headphonespeakerlink'
-TW_UI_HEADPHONEVOLUME = 'headphonevolume'
-TW_UI_SUBWOOFER = 'subwoofer'
-TW_UI_DIGITALAUDIOOUT = 'digitalaudioout'
-TW_UI_TVPOSITION = 'tvposition'
-TW_UI_HDMISIGNALFORMAT = 'hdmisignalformat'    
-TW_UI_BRAVIASYNCCONTROL = 'braviasynccontrol'
-TW_UI_AUTODEVICESOFF = 'autodevicesoff'
-TW_UI_AUTOTVON = 'autotvon'
-TW_UI_BRAVIASYNCDEVICELIST = 'braviasyncdevicelist'
-TW_UI_DEVICECONTROLKEYS = 'devicecontrolkeys'
-
-TW_UI_SLSYSTEMINFORMATION = 'slsysteminformation'
-TW_UI_SLSYSTEMINFORMATION2 = 'slsysteminformation2'
-TW_UI_SLVIEWVIDEOLABELS1 = 'slviewvideolabels1'
-TW_UI_SLVIEWVIDEOLABELS2 = 'slviewvideolabels2'
-TW_UI_SLVIEWTESTPICTURE = 'slviewtestpicture'
-TW_UI_SLSOFTWAREUPDATE = 'slsoftwareupdate'
-TW_UI_SLAUTOMATICSOFTWAREDOWNLOAD = 'slautomaticsoftwaredownload'
-TW_UI_SLFACTORYSETTINGS = 'slfactorysettings'
-TW_UI_SLINITIALIZEPERSONALINFORMATION = 'slinitializepersonalinformation'
-TW_UI_SLPRODUCTINFORMATION = 'slproductsupport'
-TW_UI_SLHELPGUIDE = 'slhelpguide'
-TW_UI_SLLEGALINFORMATION = 'sllegalinformation'
-
-TW_UI_SLHDMI1 = 'slhdmi1'
-TW_UI_SLHDMI2 = 'slhdmi2'
-TW_UI_SLHDMI3 = 'slhdmi3'
-TW_UI_SLVIDEO = 'slvideo'
-# Setup layer 3
-TW_UI_SERVERDISPLAYSETTINGS = 'serverdisplaysettings'
-TW_UI_SERVERDIAGNOSTICS = 'serverdiagnostics'
-TW_UI_REMOTESTART = 'remotestart'
-TW_UI_RENDERER = 'renderer'        
-TW_UI_AUTOMANUAL = 'automanual'
-TW_UI_AUTOMATICTIMEZONE = 'automatictimezone'
-TW_UI_AUTOMATICDAYLIGHTSAVINGTIME = 'automaticdaylightsavingtime'
-TW_UI_OTTIMER = 'ottimer'
-TW_UI_OTDAY = 'otday'
-TW_UI_OTTIME = 'ottime'
-TW_UI_OTDURATION = 'otduration'
-TW_UI_OTINPUT = 'otinput'
-TW_UI_OTPROGRAMME = 'otprogramme'
-TW_UI_OTVOLUMESETUP = 'otvolumesetup'
-TW_UI_DATE = 'date'
-TW_UI_SLTIME = 'sltime'
-TW_UI_TIMEOFFSET = 'timeoffset'                
-TW_UI_SHDMI1 = 'shdmi1'
-TW_UI_SHDMI2 = 'shdmi2'
-TW_UI_SHDMI3 = 'shdmi3'
-TW_UI_SVIDEO = 'svideo'
-TW_UI_HSFHDMI2 = 'hsfhdmi2'
-TW_UI_HSFHDMI3 = 'hsfhdmi3'
-TW_UI_SUBWOOFERLEVEL = 'subwooferlevel'
-TW_UI_PHASE = 'phase'
-TW_UI_SUBWOOFERSYNC = 'subwoofersync'
-# Setup layer 4
-TW_UI_RENDERERFUNCTION = 'rendererfunction'
-TW_UI_RENDERERACCESSCONTROL = 'rendereraccesscontrol'
-TW_UI_RENDERERSETUP = 'renderersetup'
-TW_UI_AUTOMATICACCESSPERMISSION = 'automaticaccesspermission'
-# Eco layer 1
-TW_UI_ERESET = 'ereset'
-TW_UI_POWERSAVING = 'powersaving'
-TW_UI_IDLETVSTANDBY = 'idletvstandby'
-
-# FACTORY RESET
-TW_UI_FENGLISH = 'fenglish'
-TW_UI_FCHINESE = 'fchinese'
-TW_UI_FDOWN1 = 'fdown1'
-TW_UI_FDOWN2 = 'fdown2'
-TW_UI_FDOWN3 = 'fdown3'
-TW_UI_FDOWN4 = 'fdown4'
-TW_UI_FDOWN5 = 'fdown5'
-TW_UI_FDOWN6 = 'fdown6'
-TW_UI_FENABLESMARTTV = 'fenablesmarttv'
-TW_UI_FDISABLESMARTTV = 'fdisablesmarttv'
-TW_UI_FEASY = 'feasy'
-TW_UI_FEXPERT = 'fexpert'
-TW_UI_FSKIP = 'fskip'
-TW_UI_FAUTOMANUAL = 'fautomanual'
-TW_UI_FAUTOMATICTIMEZONE = 'fautomatictimezone'
-TW_UI_FAUTOMATICTICDAYLIGHTSAVINGTIME = 'fautomaticticdaylightsavingtime'
-TW_UI_FTIMEOFFSET = 'ftimeoffset'
-TW_UI_FOK = 'fok'
-
-#---------------
-# LINUX UISTRUCLIB_PA
-#---------------
-# Home layer
-PA_UI_DTV = 'dtv'
-PA_UI_WIFISHORTCUT = 'wifishortcut'
-PA_UI_SEARCH = 'search'
-PA_UI_APP1 = 'app1'
-PA_UI_APP2 = 'app2'
-PA_UI_APP3 = 'app3'
-PA_UI_PROGRAMMELIST = 'programmelist'
-PA_UI_DIGITALEPG = 'digitalepg'
-PA_UI_TITLELIST = 'titlelist'
-PA_UI_TIMERLIST = 'timerlist'
-PA_UI_ERRORLIST = 'errorlist'
-PA_UI_MANUALTIMER = 'manualtimer'
-PA_UI_PHOTO = 'uiphoto'
-PA_UI_MUSIC = 'uimusic'
-PA_UI_VIDEO = 'uivideo'    
-PA_UI_SYSTEMSETTINGS = 'systemsettings'
-PA_UI_NETWORKSETUP = 'networksetup'
-PA_UI_CUSTOMERSUPPORT = 'customersupport'
-PA_UI_HELPGUIDE = 'helpguide'
-PA_UI_RECOMMENDATIONROW = 'recommendationrow'
-PA_UI_RECENTCHANNELS = 'recentchannels'
-
-# Option layer
-PA_UI_SCENESELECT = 'sceneselect'
-PA_UI_OPICTURE = 'opicture'
-PA_UI_OSOUND = 'osound'
-PA_UI_OSPEAKERS = 'ospeakers'
-PA_UI_AUDIOLANGUAGE = 'audiolanguage'
-PA_UI_OSUBTITLESETTING = 'osubtitlesetting'
-PA_UI_OSLEEPTIMER = 'osleeptimer'
-PA_UI_OPOWERSAVING = 'opowersaving'
-PA_UI_OSYSTEMINFORMATION = 'osysteminformation'
-PA_UI_OSHOWSSLCERT = 'oshowsslcert'
-PA_UI_ORECSTART = 'orecstart'
-# CustomerSupport Layer 1
-PA_UI_SYSTEMINFORMATION = 'systeminformation'
-PA_UI_VIEWVIDEOLABELS1 = 'viewvideolabels1'
-PA_UI_VIEWVIDEOLABELS2 = 'viewvideolabels2'
-PA_UI_VIEWTESTPICTURE = 'viewtestpicture'
-PA_UI_SOFTWAREUPDATE = 'softwareupdate'
-PA_UI_AUTOMATICSOFTWAREDOWNLOAD = 'automaticsoftwaredownload'
-PA_UI_FACTORYSETTINGS = 'factorysettings'
-PA_UI_INITIALIZEPERSONALINFORMATION = 'initializepersonalinformation'
-PA_UI_PRODUCTINFORMATION = 'productinformation'
-PA_UI_CSHELPGUIDE = 'cshelpguide'
-PA_UI_LEGALINFORMATION = 'legalinformation'
-
-PA_UI_CSHDMI1 = 'cshdmi1'
-PA_UI_CSHDMI2 = 'cshdmi2'
-PA_UI_CSHDMI3 = 'cshdmi3'
-PA_UI_CSVIDEO = 'csvideo'
-PA_UI_CSHDMI1ENABLE = 'cshdmi1enable'
-PA_UI_CSHDMI2ENABLE = 'cshdmi2enable'
-PA_UI_CSHDMI3ENABLE = 'cshdmi3enable'
-PA_UI_CSVIDEOENABLE = 'csvideoenable'
-PA_UI_CSHDMI1LABEL = 'cshdmi1label'
-PA_UI_CSHDMI2LABEL = 'cshdmi2label'
-PA_UI_CSHDMI3LABEL = 'cshdmi3label'
-PA_UI_CSVIDEOLABEL = 'csvideolabel'
-# System Setting layer 1
-PA_UI_PICTURE = 'picture'
-PA_UI_SOUND = 'sound'
-PA_UI_SCREEN = 'screen'
-PA_UI_CHANNELSETUP = 'channelsetup'
-PA_UI_PARENTALLOCK = 'parentallock'
-PA_UI_SETUP = 'setup'
-PA_UI_ECO = 'eco'
-# Picture layer 1
-PA_UI_PICTUREMODE = 'picturemode'
-PA_UI_PRESET = 'preset'
-PA_UI_BRIGHTNESS = 'brightness'
-PA_UI_CONTRAST = 'contrast'
-PA_UI_BLACKLEVEL = 'blacklevel'    
-PA_UI_COLOUR = 'colour'
-PA_UI_HUE = 'hue'
-PA_UI_COLOURTEMPERATURE = 'colourtemperature'
-PA_UI_SHARPNESS = 'sharpness'
-PA_UI_REALITYCREATION = 'realitycreation'
-PA_UI_RESOLUTION = 'resolution'
-PA_UI_MASTEREDIN4K = 'masteredin4k'
-PA_UI_RANDOMNOISEREDUCTION = 'randomnoisereduction'
-PA_UI_DIGITALNOISEREDUCTION = 'digitalnoisereduction'
-PA_UI_MOTIONFLOW = 'motionflow'
-PA_UI_SMOOTHNESS = 'smoothness'
-PA_UI_CLEARNESS = 'clearness'
-PA_UI_FILMMODE = 'filmmode'
-PA_UI_PADVANCEDSETTINGS = 'padvancedsettings'
-# Picture layer 2
-PA_UI_P2RESET = 'p2reset'
-PA_UI_ADVCONTRASTENHANCER = 'advcontrastenhancer'
-PA_UI_BLACKADJUST = 'blackadjust'
-PA_UI_GAMMA = 'gamma'
-PA_UI_LIVECOLOUR = 'livecolour'
-PA_UI_ADVCOLOURTEMPERATURE = 'advcolourtemperature'
-# Picture Layer 3
-PA_UI_P3RESET = 'p3reset'
-PA_UI_RGAIN = 'rgain'
-PA_UI_GGAIN = 'ggain'
-PA_UI_BGAIN = 'bgain'
-PA_UI_RBIAS = 'rbias'
-PA_UI_GBIAS = 'gbias'
-PA_UI_BBIAS = 'bbias'
-PA_UI_COLOURGAMMAADJUSTMENTPOINTS = 'colourgammaadjustmentpoints'
-PA_UI_ROFFSET = 'roffset'
-PA_UI_GOFFSET = 'goffset'
-PA_UI_BOFFSET = 'boffset'
-# Sound layer 1
-PA_UI_CLEARAUDIO = 'clearaudio'
-PA_UI_SOUNDMODE = 'soundmode'
-PA_UI_SRESET = 'sreset'
-PA_UI_SURROUND = 'surround'
-PA_UI_SURROUNDEFFECT = 'surroundeffect'
-PA_UI_SOUNDRESTORATION = 'soundrestoration'
-PA_UI_EQUALISER = 'equaliser'
-PA_UI_VOICEZOOM = 'voicezoom'
-PA_UI_ADVANCEDAUTOVOLUME = 'advancedautovolume'
-PA_UI_BALANCE = 'balance'
-PA_UI_VOLUMEOFFSET = 'volumeoffset'
-PA_UI_DUALSOUND = 'dualsound'
-PA_UI_SADVANCEDSETTINGS = 'sadvancedsettings'
-# Sound layer 2
-PA_UI_DYNAMICRANGE = 'dynamicrange'
-PA_UI_DOLBYDIGITALPLUSOUT = 'dolbydigitalplusout'
-PA_UI_HEAACAUDIOLEVEL = 'heaacaudiolevel'
-PA_UI_MPEGAUDIOLEVEL = 'mpegaudiolevel'
-PA_UI_DOLBYAC4DIALOGENHANCER = 'dolbyac4dialogenhancer'
-# Screen layer 1
-PA_UI_WIDEMODE = 'widemode'
-PA_UI_AUTOWIDE = 'autowide'
-PA_UI_43DEFAULT = '43default'
-PA_UI_AUTODISPLAYAREA = 'autodisplayarea'
-PA_UI_DISPLAYAREA = 'displayarea'
-PA_UI_HORIZONTALSHIFT = 'horizontalshift'
-PA_UI_VERTICALSHIFT = 'verticalshift'
-PA_UI_VERTICALSIZE = 'verticalsize'
-PA_UI_PCSETTINGS = 'pcsettings'
-# Screen layer 2
-# Channel Setup layer 1
-PA_UI_ANALOGUESETUP = 'analoguesetup'
-PA_UI_DIGITALSETUP = 'digitalsetup'
-PA_UI_FMRADIOSETUP = 'fmradiosetup'
-# Channel Setup layer 2
-PA_UI_ANALOGUEAUTOTUNING = 'analogueautotuning'
-PA_UI_MANUALPROGRAMMEPRESET = 'manualprogrammepreset'
-PA_UI_PROGRAMMESORTING = 'programmesorting'
-PA_UI_DIGITALTUNING = 'digitaltuning'
-PA_UI_SUBTITLESETUP = 'subtitlesetup'
-PA_UI_AUDIOSETUP = 'audiosetup'
-PA_UI_GUIDESETUP = 'guidesetup'
-PA_UI_TECHNICALSETUP = 'technicalsetup'    
-PA_UI_INTERACTIVEAPPLICATIONSETUP = 'interactiveapplicationsetup'
-PA_UI_FMAUTOTUNING = 'fmautotuning'
-PA_UI_FMRADIOPRESETS = 'fmradiopresets'
-# Channel Setup layer 3
-PA_UI_PROGRAMME = 'programme'
-PA_UI_TVSYSTEM = 'tvsystem'
-PA_UI_CHANNEL = 'channel'
-PA_UI_AFT = 'aft'
-PA_UI_AUDIOFILTER = 'audiofilter'
-PA_UI_SKIP = 'skip'
-PA_UI_COLOURSYSTEM = 'coloursystem'
-PA_UI_ASIGNALBOOSTER = 'asignalbooster'
-PA_UI_SIGNALLEVEL = 'signallevel'
-PA_UI_DIGITALAUTOTUNING = 'digitalautotuning'
-PA_UI_DIGITALAUTOTUNINGOK = 'digitalautotuningok'
-PA_UI_DIGITALAUTOTUNINGCANCEL = 'digitalautotuningcancel'
-PA_UI_AUTOTUNINGRANGE = 'autotuningrange'
-PA_UI_DATPROGRAMMELISTEDIT = 'datprogrammelistedit'
-PA_UI_PROGRAMMELISTEDIT = 'programmelistedit'
-PA_UI_PROGRAMMELISTEDIT2 = 'programmelistedit2'
-PA_UI_DIGITALMANUALTUNING = 'digitalmanualtuning'
-PA_UI_DSIGNALBOOSTER = 'dsignalbooster'
-PA_UI_SUBTITLESETTING = 'subtitlesetting'
-PA_UI_SPRIMARYPREFERREDLANGUAGE = 'sprimarypreferredlanguage'
-PA_UI_SSECONDARYPREFERREDLANGUAGE = 'ssecondarypreferredlanguage'
-PA_UI_AUDIOTYPE = 'audiotype'
-PA_UI_APRIMARYPREFERREDLANGUAGE = 'aprimarypreferredlanguage'
-PA_UI_ASECONDARYPREFERREDLANGUAGE = 'asecondarypreferredlanguage'
-PA_UI_MIXINGLEVEL = 'mixinglevel'
-PA_UI_PREFERREDLANGUAGE = 'preferredlanguage'
-PA_UI_UPDATEGUIDEINSTANDBY = 'updateguideinstandby'
-PA_UI_AUTOSERVICEUPDATE = 'autoserviceupdate'
-PA_UI_SERVICEREPLACEMENT = 'servicereplacement'
-PA_UI_INTERACTIVEAPPLICATION = 'interactiveapplication'
-PA_UI_AUTOSTARTAPPLICATION = 'autostartapplication'
-PA_UI_APPLICATIONFORPROG = 'applicationforprog'
-# Indonesia
-PA_UI_DIGITALAUTOTUNINGCANCEL = 'digitalautotuningcancel'
-PA_UI_DIGITALAUTOTUNINGOK = 'digitalautotuningok'
-PA_UI_DATPROGRAMMELISTEDIT = 'datprogrammelistedit'
-PA_UI_POSTALCODE = 'postalcode'
-PA_UI_POSTALCODE2 = 'postalcode2'
-PA_UI_AEASY = 'aeasy'
-PA_UI_AEXPERT = 'aexpert'
-PA_UI_ASKIP = 'askip'
-PA_UI_AAFRICA = 'aafrica'
-PA_UI_AASIA = 'aasia'
-PA_UI_AEUROPE = 'aeurope'
-PA_UI_AMIDDLEEAST = 'amiddleeast'
-PA_UI_AOCEANIA = 'aoceania'
-PA_UI_AAREAEXCLUDINGABOVE = 'aareaexcludingabove'
-PA_UI_AAUTOMANUAL = 'aautomanual'
-PA_UI_AAUTOMATICTIMEZONE = 'aautomatictimezone'
-PA_UI_AOK = 'aok'
-# Channel Setup layer 4
-PA_UI_SCANTYPE = 'scantype'
-PA_UI_CHANNNELNUMBER = 'channelnumber'
-PA_UI_FREQUENCY = 'frequency'
-PA_UI_SCANUP = 'scanup'
-PA_UI_SCANDOWN = 'scandown'
-# Parental Lock layer 1
-PA_UI_PINCODE = 'pincode'
-PA_UI_CHANGEPINCODE = 'changepincode'
-PA_UI_PARENTALRATING = 'parentalrating'
-PA_UI_DIGITALPROGRAMMELOCK = 'digitalprogrammelock'
-PA_UI_EXTERNALINPUTLOCK = 'externalinputlock'
-PA_UI_INTERNETLOCK = 'internetlock'
-# Parental Lock layer 2
-PA_UI_PHDMI1 = 'phdmi1'
-PA_UI_PHDMI2 = 'phdmi2'
-PA_UI_PHDMI3 = 'phdmi3'
-PA_UI_PVIDEO = 'pvideo'
-# Setup layer 1 (SL)
-PA_UI_NETWORK = 'network'
-PA_UI_PRIVACYPOLICY = 'privacypolicy'
-PA_UI_PHOTOFRAMESETTINGS = 'photoframesettings'
-PA_UI_USBAUTOSTART = 'usbautostart'
-PA_UI_CLOCKTIMERS = 'clocktimers'
-PA_UI_AUTOSTARTUP = 'autostartup'
-PA_UI_LANGUAGE = 'uilanguage'
-PA_UI_PHYSICALKEYBOARD = 'physicalkeyboard'
-PA_UI_STARTUPLOGO = 'startuplogo'
-PA_UI_LEDINDICATOR = 'ledindicator'
-PA_UI_AVSETUP = 'avsetup'
-PA_UI_BRAVIASYNCSETTINGS = 'braviasyncsettings'
-PA_UI_SLCUSTOMERSUPPORT = 'slcustomersupport'
-# Setup layer 2
-PA_UI_SLNETWORKSETUP = 'slnetworksetup'
-PA_UI_USBTETHERINGSTATUS = 'usbtetheringstatus'
-PA_UI_IPV6IPV4PRIORITY = 'ipv6ipv4priority'
-PA_UI_BUILTINWIFI = 'builtinwifi'
-PA_UI_WIFIDIRECT = 'wifidirect'
-PA_UI_WIFIDIRECTSETTINGS = 'wifidirectsettings'
-PA_UI_DEVICENAME = 'devicename'
-PA_UI_REFRESHINTERNETCONTENT = 'refreshinternetcontent'
-PA_UI_HOMENETWORKSETUP = 'homenetworksetup'    
-PA_UI_DOWN1 = 'down1'
-PA_UI_DOWN2 = 'down2'
-PA_UI_DOWN3 = 'down3'
-PA_UI_DOWN4 = 'down4'
-PA_UI_DOWN5 = 'down5'
-PA_UI_DOWN6 = 'down6'
-PA_UI_DOWN7 = 'down7'
-PA_UI_DOWN8 = 'down8'
-PA_UI_ENABLESMARTTV = 'uienablesmarttv'
-PA_UI_DISABLESMARTTV = 'uidisablesmarttv'
-PA_UI_DISPLAYMODE = 'displaymode'
-PA_UI_CLOCKDISPLAY = 'clockdisplay'
-PA_UI_AUDIOAPPLICATION = 'audioapplication'
-PA_UI_IMAGESELECTION = 'imageselection'
-PA_UI_MUSICSELECTION = 'musicselection'
-PA_UI_SLIDESHOWSETTING = 'slideshowsetting'
-PA_UI_MUSICPLAYBACKSETTING = 'musicplaybacksetting'
-PA_UI_DURATION = 'duration'
-PA_UI_FIRSTDAYOFTHEWEEK = 'firstdayoftheweek'    
-PA_UI_SLEEPTIMER = 'sleeptimer'
-PA_UI_ONTIMER = 'ontimer'
-PA_UI_CLOCKSET = 'clockset'
-PA_UI_RECORDINGDEVICESETUP = 'recordingdevicesetup'
-PA_UI_HDDREGISTRATION = 'hddregistration'
-PA_UI_HDDDEREGISTRATION = 'hddderegistration'
-PA_UI_RECORDINGTIMEAUTOUPDATE = 'recordingtimeautoupdate'
-PA_UI_VIDEOLABELS = 'videolabels'
-PA_UI_AVPRESET = 'avpreset'
-PA_UI_SLCOLOURSYSTEM = 'slcoloursystem'
-PA_UI_SPEAKERS = 'speakers'
-PA_UI_HEADPHONEAUDIOOUT = 'headphoneaudioout'
-PA_UI_HEADPHONESPEAKERLINK = 'headphonespeakerlink'
-PA_UI_HEADPHONEVOLUME = 'headphonevolume'
-PA_UI_SUBWOOFER = 'subwoofer'
-PA_UI_DIGITALAUDIOOUT = 'digitalaudioout'
-PA_UI_TVPOSITION = 'tvposition'
-PA_UI_HDMISIGNALFORMAT = 'hdmisignalformat'    
-PA_UI_BRAVIASYNCCONTROL = 'braviasynccontrol'
-PA_UI_AUTODEVICESOFF = 'autodevicesoff'
-PA_UI_AUTOTVON = 'autotvon'
-PA_UI_BRAVIASYNCDEVICELIST = 'braviasyncdevicelist'
-PA_UI_DEVICECONTROLKEYS = 'devicecontrolkeys'
-PA_UI_AEASY = 'aeasy'
-PA_UI_AEXPERT = 'eaxpert'
-PA_UI_ASKIP = 'askip'
-PA_UI_SLSYSTEMINFORMATION = 'slsysteminformation'
-PA_UI_SLVIEWVIDEOLABELS1 = 'slviewvideolabels1'
-PA_UI_SLVIEWVIDEOLABELS2 = 'slviewvideolabels2'
-PA_UI_SLVIEWTESTPICTURE = 'slviewtestpicture'
-PA_UI_SLSOFTWAREUPDATE = 'slsoftwareupdate'
-PA_UI_SLAUTOMATICSOFTWAREDOWNLOAD = 'slautomaticsoftwaredownload'
-PA_UI_SLFACTORYSETTINGS = 'slfactorysettings'
-PA_UI_SLINITIALIZEPERSONALINFORMATION = 'slinitializepersonalinformation'
-PA_UI_SLPRODUCTINFORMATION = 'slproductsupport'
-PA_UI_SLHELPGUIDE = 'slhelpguide'
-PA_UI_SLLEGALINFORMATION = 'sllegalinformation'
-
-PA_UI_SLHDMI1 = 'slhdmi1'
-PA_UI_SLHDMI2 = 'slhdmi2'
-PA_UI_SLHDMI3 = 'slhdmi3'
-PA_UI_SLVIDEO = 'slvideo'
-PA_UI_SLHDMI1ENABLE = 'slhdmi1enable'
-PA_UI_SLHDMI2ENABLE = 'slhdmi2enable'
-PA_UI_SLHDMI3ENABLE = 'slhdmi3enable'
-PA_UI_SLVIDEOENABLE = 'slvideoenable'
-PA_UI_SLHDMI1LABEL = 'slhdmi1label'
-PA_UI_SLHDMI2LABEL = 'slhdmi2label'
-PA_UI_SLHDMI3LABEL = 'slhdmi3label'
-PA_UI_SLVIDEOLABEL = 'slvideolabel'
-# Setup layer 3
-PA_UI_SERVERDISPLAYSETTINGS = 'serverdisplaysettings'
-PA_UI_SERVERDIAGNOSTICS = 'serverdiagnostics'
-PA_UI_REMOTESTART = 'remotestart'
-PA_UI_RENDERER = 'renderer'
-PA_UI_OTONTIMER = 'otontimer'
-PA_UI_OTDAY ='otday'
-PA_UI_OTTIME ='ottime'
-PA_UI_OTDURATION ='otduration'
-PA_UI_OTINPUT ='otinput'
-PA_UI_OTPROGRAMME ='otprogramme'
-PA_UI_OTVOLUMESETUP ='otvolumesetup'
-PA_UI_AUTOMANUAL = 'automanual'
-PA_UI_AUTOMATICTIMEZONE = 'automatictimezone'
-PA_UI_AUTOMATICDAYLIGHTSAVINGTIME = 'automaticdaylightsavingtime'
-PA_UI_DATE = 'date'
-PA_UI_SLTIME = 'sltime'
-PA_UI_TIMEOFFSET = 'timeoffset'                
-PA_UI_SHDMI1 = 'shdmi1'
-PA_UI_SHDMI2 = 'shdmi2'
-PA_UI_SHDMI3 = 'shdmi3'
-PA_UI_SVIDEO = 'svideo'
-PA_UI_SHDMI1ENABLE = 'shdmi1enable'
-PA_UI_SHDMI2ENABLE = 'shdmi2enable'
-PA_UI_SHDMI3ENABLE = 'shdmi3enable'
-PA_UI_SVIDEOENABLE = 'svideoenable'
-PA_UI_SHDMI1LABEL = 'shdmi1label'
-PA_UI_SHDMI2LABEL = 'shdmi2label'
-PA_UI_SHDMI3LABEL = 'shdmi3label'
-PA_UI_SVIDEOLABEL = 'svideolabel'
-PA_UI_HSFHDMI2 = 'hsfhdmi2'
-PA_UI_HSFHDMI3 = 'hsfhdmi3'
-PA_UI_SUBWOOFERLEVEL = 'subwooferlevel'
-PA_UI_PHASE = 'phase'
-PA_UI_SUBWOOFERSYNC = 'subwoofersync'
-# Setup layer 4
-PA_UI_RENDERERFUNCTION = 'rendererfunction'
-PA_UI_RENDERERACCESSCONTROL = 'rendereraccesscontrol'
-PA_UI_RENDERERSETUP = 'renderersetup'
-PA_UI_AUTOMATICACCESSPERMISSION = 'automaticaccesspermission'
-# Eco layer 1
-PA_UI_ERESET = 'ereset'
-PA_UI_POWERSAVING = 'powersaving'
-PA_UI_IDLETVSTANDBY = 'idletvstandby'
-
-# FACTORRESET
-PA_UI_AAFRICA = 'aafrica'
-PA_UI_AASIA = 'aasia'
-PA_UI_AEUROPE = 'aeurope'
-PA_UI_AMIDDLEEAST = 'amiddleeast'
-PA_UI_AOCEANIA = 'aoceania'
-PA_UI_AAREAEXCLUDINGABOVE = 'aareaexcludeingabove'
-PA_UI_FAFRICA = 'fafrica'
-PA_UI_FASIA = 'fasia'
-PA_UI_FEUROPE = 'feurope'
-PA_UI_FMIDDLEEAST = 'fmiddleeast'
-PA_UI_FOCEANIA = 'foceania'
-PA_UI_FAREAEXCLUDINGABOVE = 'fareaexcludeingabove'
-PA_UI_FENGLISH = 'fenglish'
-PA_UI_FFRANCAIS = 'ffrancais'
-PA_UI_FTURKCE = 'fturkce'
-PA_UI_FCHINESE = 'fchinese'
-PA_UI_FARABIC  = 'farabic'
-PA_UI_FENGLISH = 'fenglish'
-PA_UI_FFRANCAIS = 'ffrancais'
-PA_UI_FTURKCE = 'fturkce'
-PA_UI_FCHINESE = 'fchinese'
-PA_UI_FARABIC  = 'farabic'
-PA_UI_FDOWN1 = 'fdown1'
-PA_UI_FDOWN2 = 'fdown2'
-PA_UI_FDOWN3 = 'fdown3'
-PA_UI_FDOWN4 = 'fdown4'
-PA_UI_FDOWN5 = 'fdown5'
-PA_UI_FDOWN6 = 'fdown6'
-PA_UI_FDOWN7 = 'fdown7'
-PA_UI_FENABLESMARTTV = 'fenablesmarttv'
-PA_UI_FDISABLESMARTTV = 'fdisablesmarttv'
-PA_UI_FEASY = 'feasy'
-PA_UI_FEXPERT = 'fexpert'
-PA_UI_FSKIP = 'fskip'
-PA_UI_AAUTOMANUAL = 'aautomanual'
-PA_UI_AAUTOMATICTIMEZONE = 'aautomatictimezone'
-PA_UI_AOK = 'aok'
-PA_UI_FAUTOMANUAL = 'fautomanual'
-PA_UI_FAUTOMATICTIMEZONE = 'fautomatictimezone'
-PA_UI_FAUTOMATICDAYLIGHTSAVINGTIME = 'fautomaticdaylightsavingtime'
-PA_UI_FDATE = 'fdate'
-PA_UI_FTIME = 'ftime'
-PA_UI_FTIMEOFFSET = 'ftimeoffset'
-PA_UI_FOK = 'fok'
-#---------------
-# LINUX UISTRUCLIB_BZ
-#---------------
-# Home layer
-BZ_UI_DTV = 'dtv'
-BZ_UI_WIFISHORTCUT = 'wifishortcut'
-BZ_UI_SEARCH = 'search'
-BZ_UI_APP1 = 'app1'
-BZ_UI_APP2 = 'app2'
-BZ_UI_APP3 = 'app3'
-BZ_UI_FAVORITES = 'favorites'
-BZ_UI_DIGITALEPG = 'digitalepg'
-BZ_UI_PHOTO = 'uiphoto'
-BZ_UI_MUSIC = 'uimusic'
-BZ_UI_VIDEO = 'uivideo'    
-BZ_UI_PREFERENCES = 'preferences'
-BZ_UI_NETWORKSETUP = 'networksetup'
-BZ_UI_CUSTOMERSUPPORT = 'customersupport'
-BZ_UI_HELPGUIDE = 'helpguide'
-BZ_UI_RECOMMENDATIONROW = 'recommendationrow'
-BZ_UI_RECENTCHANNELS = 'recentchannels'
-# Option layer
-BZ_UI_OPICTUREADJUSTMENTS = 'opictureadjustments'
-BZ_UI_OSOUNDADJUSTMENTS = 'osoundadjustments'
-BZ_UI_OSPEAKERS = 'ospeakers'
-BZ_UI_AUDIOLANGUAGE = 'audiolanguage'
-BZ_UI_OSUBTITLESETTING = 'osubtitlesetting'
-BZ_UI_OSLEEPTIMER = 'osleeptimer'
-BZ_UI_OPOWERSAVING = 'opowersaving'
-BZ_UI_OSIGNALDIAGNOSTICS = 'osignaldiagnostics'
-# CustomerSupport Layer 1
-BZ_UI_SIGNALDIAGNOSTICS = 'signaldianostics'
-BZ_UI_VIEWMANAGEINPUTS1 = 'viewmanageinputs1'
-BZ_UI_VIEWMANAGEINPUTS2 = 'viewmanageinputs2'
-BZ_UI_VIEWTESTPICTURE = 'viewtestpicture'
-BZ_UI_SOFTWAREUPDATE = 'softwareupdate'
-BZ_UI_AUTOMATICSOFTWAREDOWNLOAD = 'automaticsoftwaredownload'
-BZ_UI_FACTORYSETTINGS = 'factorysettings'
-BZ_UI_INITIALIZEPERSONALINFORMATION = 'initializepersonalinformation'
-BZ_UI_CONTACTSONY = 'contactsony'
-BZ_UI_CSHELPGUIDE = 'cshelpguide'
-BZ_UI_LEGALINFORMATION = 'legalinformation'
-
-BZ_UI_CSHDMI1 = 'cshdmi1'
-BZ_UI_CSHDMI2 = 'cshdmi2'
-BZ_UI_CSHDMI3 = 'cshdmi3'
-BZ_UI_CSVIDEO = 'csvideo'
-
-# System Setting layer 1
-BZ_UI_PICTUREADJUSTMENTS = 'pictureadjustments'
-BZ_UI_SOUNDADJUSTMENTS = 'soundadjustments'
-BZ_UI_SCREEN = 'screen'
-BZ_UI_CHANNELSETUPGINGA = 'channelsetupginga'
-BZ_UI_PARENTALLOCK = 'parentallock'
-BZ_UI_SETUP = 'setup'
-BZ_UI_ECO = 'eco'
-# Picture Adjustments layer 1
-BZ_UI_PICTUREMODE = 'picturemode'
-BZ_UI_PRESET = 'preset'
-BZ_UI_BRIGHTNESS = 'brightness'
-BZ_UI_CONTRAST = 'contrast'
-BZ_UI_BLACKLEVEL= 'blacklevel'
-BZ_UI_COLOR = 'color'
-BZ_UI_HUE = 'hue'
-BZ_UI_COLORTEMPERATURE = 'colortemperature'
-BZ_UI_SHARPNESS = 'sharpness'
-BZ_UI_REALITYCREATION = 'realitycreation'
-BZ_UI_RESOLUTION = 'resolution'
-BZ_UI_RANDOMNOISEREDUCTION = 'randomnoisereduction'
-BZ_UI_DIGITALNOISEREDUCTION = 'digitalnoisereduction'
-BZ_UI_MOTIONFLOW = 'motionflow'
-BZ_UI_SMOOTHNESS = 'smoothness'
-BZ_UI_CLEARNESS = 'clearness'
-BZ_UI_CINEMOTION = 'cinemotion'
-BZ_UI_PADVANCEDSETTINGS = 'padvancedsettings'
-# Picture layer 2
-BZ_UI_P2RESET = 'p2reset'
-BZ_UI_ADVCONTRASTENHANCER = 'advcontrastenhancer'
-BZ_UI_BLACKADJUST = 'blackadjust'
-BZ_UI_GAMMA = 'gamma'
-BZ_UI_LIVECOLOR = 'livecolor'
-BZ_UI_ADVCOLORTEMPERATURE = 'advcolortemperature'
-# Picture Layer 3
-BZ_UI_P3RESET = 'p3reset'
-BZ_UI_RGAIN = 'rgain'
-BZ_UI_GGAIN = 'ggain'
-BZ_UI_BGAIN = 'bgain'
-BZ_UI_RBIAS = 'rbias'
-BZ_UI_GBIAS = 'gbias'
-BZ_UI_BBIAS = 'bbias'
-BZ_UI_COLORGAMMAADJUSTMENTPOINTS = 'colorgammaadjustmentpoints'
-BZ_UI_ROFFSET = 'roffset'
-BZ_UI_GOFFSET = 'goffset'
-BZ_UI_BOFFSET = 'boffset'
-# Sound Adjustments layer 1
-BZ_UI_CLEARAUDIO = 'clearaudio'
-BZ_UI_SOUNDMODE = 'soundmode'
-BZ_UI_SRESET = 'sreset'
-BZ_UI_SURROUND = 'surround'
-BZ_UI_SURROUNDEFFECT = 'surroundeffect'
-BZ_UI_SOUNDRESTORATION = 'soundrestoration'
-BZ_UI_EQUALISER = 'equaliser'
-BZ_UI_VOICEZOOM = 'voicezoom'
-BZ_UI_ADVANCEDAUTOVOLUME = 'advancedautovolume'
-BZ_UI_BALANCE = 'balance'
-BZ_UI_VOLUMEOFFSET = 'volumeoffset'
-BZ_UI_MTSAUDIO = 'mtsaudio'
-BZ_UI_DIGITALDUALMONO = 'digitaldualmono'
-BZ_UI_SADVANCEDSETTINGS = 'sadvancedsettings'
-# Sound layer 2
-BZ_UI_DYNAMICRANGE = 'dynamicrange'
-BZ_UI_DOLBYDIGITALPLUSOUT = 'dolbydigitalplusout'
-BZ_UI_HEAACAUDIOLEVEL = 'heaacaudiolevel'
-BZ_UI_MPEGAUDIOLEVEL = 'mpegaudiolevel'
-BZ_UI_DOLBYAC4DIALOGENHANCER = 'dolbyac4dialogenhancer'
-# Screen layer 1
-BZ_UI_WIDEMODE = 'widemode'
-BZ_UI_AUTOWIDE = 'autowide'
-BZ_UI_43DEFAULT = '43default'
-BZ_UI_AUTODISPLAYAREA = 'autodisplayarea'
-BZ_UI_DISPLAYAREA = 'displayarea'
-BZ_UI_HCENTER = 'hcenter'
-BZ_UI_VCENTER = 'vcenter'
-BZ_UI_VERTICALSIZE = 'verticalsize'
-BZ_UI_PCSETTINGS = 'pcsettings'
-# Screen layer 2
-# Channel Setup layer 1
-BZ_UI_CABLEANTENNA = 'cableantenna'
-BZ_UI_AUTOPROGRAM = 'autoprogram'
-BZ_UI_ADDDIGITALCHANNEL = 'adddigitalchannel'
-BZ_UI_SHOWHIDECHANNEL = 'showhidedigitalchannel'
-BZ_UI_EDITANALOGCHANNELLABELS = 'editanalogchannellabels'
-BZ_UI_ANALOGCHANNELADJUSTMENT = 'analogchanneladjustment'
-BZ_UI_DIGITALCHANNELTUNINGMODE = 'digitalchanneltuningmode'
-BZ_UI_INTERACTIVEAPPLICATIONSETUP = 'interactiveapplicationsetup'
-BZ_UI_FMRADIOSETUP = 'fmradiosetup'
-# Channel Setup layer 2
-BZ_UI_ACHANNEL = 'achannel'
-BZ_UI_ANALOGFINETUNE = 'analogfinetune'
-BZ_UI_AAUDIOFILTER = 'aaudiofilter'
-BZ_UI_ACOLORSYSTEM = 'acolorsystem'
-BZ_UI_INTERACTIVEAPPLICATION = 'interactiveapplication'
-BZ_UI_APPLICATIONAUTOSTART = 'applicationautostart'
-BZ_UI_FMAUTOPROGRAM = 'fmautoprogram'
-BZ_UI_FMRADIOPRESETS = 'fmradiopreset'
-# Parental Lock layer 1
-BZ_UI_PASSWORD = 'password'
-BZ_UI_CHANGEPASSWORD = 'changepassword'
-BZ_UI_DIGITALRATING = 'digitalrating'
-BZ_UI_ANALOGCHANNELBLOCK = 'analogchannelblock'
-BZ_UI_EXTERNALINPUTLOCK = 'externalinputlock'
-BZ_UI_INTERNETLOCK = 'internetlock'
-# Parental Lock layer 2
-BZ_UI_PHDMI1 = 'phdmi1'
-BZ_UI_PHDMI2 = 'phdmi2'
-BZ_UI_PHDMI3 = 'phdmi3'
-BZ_UI_PVIDEO = 'pvideo'
-# Setup layer 1 (SL)
-BZ_UI_NETWORK = 'network'
-BZ_UI_PRIVACYPOLICY = 'privacypolicy'
-BZ_UI_PHOTOFRAMESETTINGS = 'photoframesettings'
-BZ_UI_USBAUTOSTART = 'usbautostart'
-BZ_UI_CLOSECAPTIONS = 'closecaptions'
-BZ_UI_INFOBANNER = 'infobanner'
-BZ_UI_CLOCKTIMERS = 'clocktimers'
-BZ_UI_AUTOSTARTUP = 'autostartup'
-BZ_UI_LANGUAGE = 'uilanguage'
-BZ_UI_PHYSICALKEYBOARD = 'physicalkeyboard'
-BZ_UI_STARTUPLOGO = 'startuplogo'
-BZ_UI_LEDINDICATOR = 'ledindicator'
-BZ_UI_AVSETUP = 'avsetup'
-BZ_UI_BRAVIASYNCSETTINGS = 'braviasyncsettings'
-BZ_UI_SLCUSTOMERSUPPORT = 'slcustomersupport'
-# Setup layer 2
-BZ_UI_SLNETWORKSETUP = 'slnetworksetup'
-BZ_UI_USBTETHERINGSTATUS = 'usbtetheringstatus'
-BZ_UI_IPV6IPV4PRIORITY = 'ipv6ipv4priority'
-BZ_UI_BUILTINWIFI = 'builtinwifi'
-BZ_UI_WIFIDIRECT = 'wifidirect'
-BZ_UI_WIFIDIRECTSETTINGS = 'wifidirectsettings'
-BZ_UI_DEVICENAME = 'devicename'
-BZ_UI_REFRESHINTERNETCONTENT = 'refreshinternetcontent'
-BZ_UI_HOMENETWORKSETUP = 'homenetworksetup'    
-BZ_UI_DISPLAYMODE = 'displaymode'
-BZ_UI_CLOCKDISPLAY = 'clockdisplay'
-BZ_UI_AUDIOAPPLICATION = 'audioapplication'
-BZ_UI_IMAGESELECTION = 'imageselection'
-BZ_UI_MUSICSELECTION = 'musicselection'
-BZ_UI_SLIDESHOWSETTING = 'slideshowsetting'
-BZ_UI_MUSICPLAYBACKSETTING = 'musicplaybacksetting'
-BZ_UI_DURATION = 'duration'
-BZ_UI_FIRSTDAYOFTHEWEEK = 'firstdayoftheweek'    
-BZ_UI_CCDISPLAY = 'ccdisplay'
-BZ_UI_ANALOGCC = 'analogcc'
-BZ_UI_DIGITALCC = 'digitalcc'
-BZ_UI_SLEEPTIMER = 'sleeptimer'
-BZ_UI_ONTIMER = 'ontimer'
-BZ_UI_CURRENTIME = 'currenttime'
-BZ_UI_MANAGEINPUTS = 'manageinputs'
-BZ_UI_SLCOLORSYSTEM = 'slcoloursystem'
-BZ_UI_SPEAKERS = 'speakers'
-BZ_UI_HEADPHONEAUDIOOUT = 'headphoneaudioout'
-BZ_UI_HEADPHONESPEAKERLINK = 'headphonespeakerlink'
-BZ_UI_HEADPHONEVOLUME = 'headphonevolume'
-BZ_UI_SUBWOOFER = 'subwoofer'
-BZ_UI_DIGITALAUDIOOUT = 'digitalaudioout'
-BZ_UI_TVPOSITION = 'tvposition'
-BZ_UI_HDMISIGNALFORMAT = 'hdmisignalformat'    
-BZ_UI_BRAVIASYNCCONTROL = 'braviasynccontrol'
-BZ_UI_DEVICEAUTOPOWEROFF = 'deviceautopoweroff'
-BZ_UI_TVAUTOPOWERON = 'tvautopoweron'
-BZ_UI_BRAVIASYNCDEVICELIST = 'braviasyncdevicelist'
-BZ_UI_DEVICECONTROLKEYS = 'devicecontrolkeys'
-
-BZ_UI_SLSIGNALDIAGNOSTICS = 'slsysteminformation'
-BZ_UI_SLVIEWMANAGEINPUTS1 = 'slviewmanagemnentinputs1'
-BZ_UI_SLVIEWMANAGEINPUTS2 = 'slviewmanagemnentinputs2'
-BZ_UI_SLVIEWTESTPICTURE = 'slviewtestpicture'
-BZ_UI_SLSOFTWAREUPDATE = 'slsoftwareupdate'
-BZ_UI_SLAUTOMATICSOFTWAREDOWNLOAD = 'slautomaticsoftwaredownload'
-BZ_UI_SLFACTORYSETTINGS = 'slfactorysettings'
-BZ_UI_SLINITIALIZEPERSONALINFORMATION = 'slinitializepersonalinformation'
-BZ_UI_SLCONTACTSONY = 'slcontactsony'
-BZ_UI_SLHELPGUIDE = 'slhelpguide'
-BZ_UI_SLLEGALINFORMATION = 'sllegalinformation'
-
-BZ_UI_SLHDMI1 = 'slhdmi1'
-BZ_UI_SLHDMI2 = 'slhdmi2'
-BZ_UI_SLHDMI3 = 'slhdmi3'
-BZ_UI_SLVIDEO = 'slvideo'
-# Setup layer 3
-BZ_UI_SHOWHIDEMEDIASERVERS = 'showhidemediaservers'
-BZ_UI_MEDIASERVERTROUBLESHOOTING = 'mediaservertroubleshooting'
-BZ_UI_REMOTESTART = 'remotestart'
-BZ_UI_RENDERER1 = 'renderer1'
-BZ_UI_OTTIMER = 'ottimer'
-BZ_UI_OTDAY = 'otday'
-BZ_UI_OTTIME = 'ottime'
-BZ_UI_OTDURATION = 'otduration'
-BZ_UI_OTINPUT = 'otinput'
-BZ_UI_OTCABLEANTENNA = 'otcableantenna'
-BZ_UI_OTCHANNEL = 'otchannel'
-BZ_UI_OTTVONVOLUME = 'ottvonvolume'
-BZ_UI_CTAUTOMANUAL = 'ctautomanual'
-BZ_UI_CTDAY = 'ctday'
-BZ_UI_CTBRASILLIATIME = 'ctbrasilliatime'
-BZ_UI_CTTIMEOFFSET = 'cttimeoffset'
-BZ_UI_CTADJUSTEDTIME = 'ctadjustedtime'
-BZ_UI_SHDMI1 = 'shdmi1'
-BZ_UI_SHDMI2 = 'shdmi2'
-BZ_UI_SHDMI3 = 'shdmi3'
-BZ_UI_SVIDEO = 'svideo'
-BZ_UI_HSFHDMI2 = 'hsfhdmi2'
-BZ_UI_HSFHDMI3 = 'hsfhdmi3'
-BZ_UI_SUBWOOFERLEVEL = 'subwooferlevel'
-BZ_UI_PHASE = 'phase'
-BZ_UI_SUBWOOFERSYNC = 'subwoofersync'
-# Setup layer 4
-BZ_UI_RENDERER2 = 'renderer2'
-BZ_UI_RENDERERACCESSCONTROL = 'rendereraccesscontrol'
-BZ_UI_RENDEREROPTIONS = 'rendereroptions'
-BZ_UI_AUTOACCESSPERMISSION = 'autoaccesspermission'
-# Eco layer 1
-BZ_UI_ERESET = 'ereset'
-BZ_UI_POWERSAVING = 'powersaving'
-BZ_UI_IDLETVSTANDBY = 'idletvstandby'
-# FACTORY RESET
-BZ_UI_FENGLISH = 'fenglish'
-BZ_UI_FESPANOL = 'fespanol'
-BZ_UI_FPORTUGUES = 'fportugues'
-BZ_UI_FDOWN1 = 'fdown1'
-BZ_UI_FDOWN2 = 'fdown2'
-BZ_UI_FDOWN3 = 'fdown3'
-BZ_UI_FDOWN4 = 'fdown4'
-BZ_UI_FDOWN5 = 'fdown5'
-BZ_UI_FDOWN6 = 'fdown6'
-BZ_UI_FENABLESMARTTV = 'fenablesmarttv'
-BZ_UI_FDISABLESMARTTV = 'fdisablesmarttv'
-BZ_UI_FEASY = 'feasy'
-BZ_UI_FEXPERT = 'fexpert'
-BZ_UI_FSKIP = 'fskip'
-BZ_UI_FAUTOMANUAL = 'fautomanual'
-BZ_UI_FOK = 'fok'
-#---------------
-# LINUX UISTRUCLIB_UC
-#---------------
-# Home layer
-UC_UI_DTV = 'dtv'
-UC_UI_WIFISHORTCUT = 'wifishortcut'
-UC_UI_SEARCH = 'search'
-UC_UI_APP1 = 'app1'
-UC_UI_APP2 = 'app2'
-UC_UI_FAVORITES = 'favorites'
-UC_UI_PHOTO = 'uiphoto'
-UC_UI_MUSIC = 'uimusic'
-UC_UI_VIDEO = 'uivideo'    
-UC_UI_PREFERENCES = 'preferences'
-UC_UI_NETWORKSETUP = 'networksetup'
-UC_UI_CUSTOMERSUPPORT = 'customersupport'
-UC_UI_HELPGUIDE = 'helpguide'
-SA_UI_ACCESSIBILITY = 'accessiblility'
-UC_UI_RECOMMENDATIONROW = 'recommendationrow'
-UC_UI_RECENTCHANNELS = 'recentchannels'
-# Option layer
-UC_UI_OPICTUREADJUSTMENTS = 'opictureadjustments'
-UC_UI_OSOUNDADJUSTMENTS = 'osoundadjustments'
-UC_UI_OALTERNATEAUDIO = 'oalternateaudio'
-UC_UI_ODIGITALNOISEREDUCTION = 'odigitalnoisereduction'
-UC_UI_OSPEAKERS = 'ospeakers'
-UC_UI_OADDTOFAVOURITES = 'oaddtofavourites'
-UC_UI_OSCENESELECT = 'osceneselect'
-UC_UI_OSLEEPTIMER = 'osleeptimer'
-UC_UI_OPOWERSAVING = 'ppowersaving'
-
-# CustomerSupport Layer 1
-UC_UI_SIGNALDIAGNOSTICS = 'signaldianostics'
-UC_UI_VIEWMANAGEINPUTS1 = 'viewmanageinputs1'
-UC_UI_VIEWMANAGEINPUTS2 = 'viewmanageinputs2'
-UC_UI_VIEWTESTPICTURE = 'viewtestpicture'
-UC_UI_SOFTWAREUPDATE = 'softwareupdate'
-UC_UI_AUTOMATICSOFTWAREDOWNLOAD = 'automaticsoftwaredownload'
-UC_UI_INITIALSETUP = 'initialsetup'
-UC_UI_INITIALIZEPERSONALINFORMATION = 'initializepersonalinformation'
-UC_UI_CONTACTSONY = 'contactsony'
-UC_UI_CSHELPGUIDE = 'cshelpguide'
-UC_UI_LEGALINFORMATION = 'legalinformation'
-
-UC_UI_CSTV    = 'cstv'
-UC_UI_CSHDMI1 = 'cshdmi1'
-UC_UI_CSHDMI2 = 'cshdmi2'
-UC_UI_CSHDMI3 = 'cshdmi3'
-UC_UI_CSVIDEO = 'csvideo'
-
-# Accessibility
-
-UC_UI_ACCSCREENREADER = 'accscreenreader'
-UC_UI_ACCZOOM = 'acczoom'
-UC_UI_ACCCLOSEDCAPTIONS = 'accclosedcaptions'
-UC_UI_ACCAUDIODESCRIPTION = 'accaudiodescriptions'
-
-UC_UI_ACCCCDISPLAY = 'accccdisplay'
-UC_UI_ACCANALOGCC = 'accanalogcc'
-UC_UI_ACCDIGITALCC = 'accdigitalcc'
-UC_UI_ACCDIGITALCCOPTIONS = 'accdigitaloptions'
-
-UC_UI_ACCCUSTOM = 'acccustom'
-UC_UI_ACCCHARACTERSIZE = 'acccharactersize'
-UC_UI_ACCCHARACTERSTYLE = 'acccharacterstyle'
-UC_UI_ACCCHARACTERCOLOR = 'acccharactercolor'
-UC_UI_ACCCHARACTEROPACITY = 'acccharacteropacity'
-UC_UI_ACCEDGETYPE = 'accedgetype'
-UC_UI_ACCEDGECOLOR = 'accedgecolor'
-UC_UI_ACCBACKGROUNDCOLOR = 'accbackgroundcolor'
-UC_UI_ACCBACKGROUNDOPACITY = 'accbackgrouondopacity'
-UC_UI_ACCWINDOWCOLOR = 'accwindowcolor'
-UC_UI_ACCWINDOWOPACITY = 'accwindowopacity'
-
-# System Setting layer 1
-UC_UI_PICTURE = 'picture'
-UC_UI_SOUND = 'sound'
-UC_UI_SCREEN = 'screen'
-UC_UI_CHANNEL = 'channel'
-UC_UI_PARENTALLOCK = 'parentallock'
-UC_UI_SETUP = 'setup'
-UC_UI_ECO = 'eco'
-# Picture Adjustments layer 1
-UC_UI_PICTUREMODE = 'picturemode'
-UC_UI_PRESET = 'preset'
-UC_UI_BRIGHTNESS = 'brightness'
-UC_UI_CONTRAST = 'contrast'
-UC_UI_BLACKLEVEL= 'blacklevel'
-UC_UI_COLOR = 'color'
-UC_UI_HUE = 'hue'
-UC_UI_COLORTEMPERATURE = 'colortemperature'
-UC_UI_SHARPNESS = 'sharpness'
-UC_UI_REALITYCREATION = 'realitycreation'
-UC_UI_RESOLUTION = 'resolution'
-UC_UI_RANDOMNOISEREDUCTION = 'randomnoisereduction'
-UC_UI_DIGITALNOISEREDUCTION = 'digitalnoisereduction'
-UC_UI_MOTIONFLOW = 'motionflow'
-UC_UI_SMOOTHNESS = 'smoothness'
-UC_UI_CLEARNESS = 'clearness'
-UC_UI_CINEMOTION = 'cinemotion'
-UC_UI_PADVANCEDSETTINGS = 'padvancedsettings'
-# Picture layer 2
-UC_UI_P2RESET = 'p2reset'
-UC_UI_ADVCONTRASTENHANCER = 'advcontrastenhancer'
-UC_UI_BLACKADJUST = 'blackadjust'
-UC_UI_GAMMA = 'gamma'
-UC_UI_LIVECOLOR = 'livecolor'
-UC_UI_ADVCOLORTEMPERATURE = 'advcolortemperature'
-# Picture Layer 3
-UC_UI_P3RESET = 'p3reset'
-UC_UI_RGAIN = 'rgain'
-UC_UI_GGAIN = 'ggain'
-UC_UI_BGAIN = 'bgain'
-UC_UI_RBIAS = 'rbias'
-UC_UI_GBIAS = 'gbias'
-UC_UI_BBIAS = 'bbias'
-UC_UI_COLORGAMMAADJUSTMENTPOINTS = 'colorgammaadjustmentpoints'
-UC_UI_ROFFSET = 'roffset'
-UC_UI_GOFFSET = 'goffset'
-UC_UI_BOFFSET = 'boffset'
-# Sound Adjustments layer 1
-UC_UI_CLEARAUDIO = 'clearaudio'
-UC_UI_SOUNDMODE = 'soundmode'
-UC_UI_SRESET = 'sreset'
-UC_UI_SURROUND = 'surround'
-UC_UI_SURROUNDEFFECT = 'surroundeffect'
-UC_UI_SOUNDRESTORATION = 'soundrestoration'
-UC_UI_EQUALISER = 'equaliser'
-UC_UI_VOICEZOOM = 'voicezoom'
-UC_UI_ADVANCEDAUTOVOLUME = 'advancedautovolume'
-UC_UI_BALANCE = 'balance'
-UC_UI_VOLUMEOFFSET = 'volumeoffset'
-UC_UI_ALTERNATEAUDIO = 'alternateaudio'
-UC_UI_MTSAUDIO = 'mtsaudio'
-UC_UI_DIGITALDUALMONO = 'digitaldualmono'
-UC_UI_SADVANCEDSETTINGS = 'sadvancedsettings'
-# Sound layer 2
-UC_UI_DYNAMICRANGE = 'dynamicrange'
-UC_UI_DOLBYDIGITALPLUSOUT = 'dolbydigitalplusout'
-UC_UI_HEAACAUDIOLEVEL = 'heaacaudiolevel'
-UC_UI_MPEGAUDIOLEVEL = 'mpegaudiolevel'
-UC_UI_DOLBYAC4DIALOGENHANCER = 'dolbyac4dialogenhancer'
-# Screen layer 1
-UC_UI_WIDEMODE = 'widemode'
-UC_UI_AUTOWIDE = 'autowide'
-UC_UI_43DEFAULT = '43default'
-UC_UI_AUTODISPLAYAREA = 'autodisplayarea'
-UC_UI_DISPLAYAREA = 'displayarea'
-UC_UI_HCENTER = 'hcenter'
-UC_UI_VCENTER = 'vcenter'
-UC_UI_VERTICALSIZE = 'verticalsize'
-UC_UI_PCSETTINGS = 'pcsettings'
-# Screen layer 2
-# Channel Setup layer 1
-UC_UI_SINGNALTYPE = 'signaltype'
-UC_UI_AUTOPROGRAM = 'autoprogram'
-UC_UI_ADDDIGITALCHANNEL = 'adddigitalchannel'
-UC_UI_SHOWHIDECHANNEL = 'showhidechannels'
-UC_UI_EDITCHANNELLABELS = 'editchannellabels'
-UC_UI_ANALOGCHANNELADJUSTMENT = 'analogchanneladjustment'
-# Channel Setup layer 2
-UC_UI_ACHANNEL = 'achannel'
-UC_UI_ANALOGFINETUNE = 'analogfinetune'
-UC_UI_AAUDIOFILTER = 'aaudiofilter'
-UC_UI_ASIGNALBOOSTER = 'asignalbooster'
-# Parental Lock layer 1
-UC_UI_PASSWORD = 'password'
-UC_UI_CHANGEPASSWORD = 'changepassword'
-UC_UI_COUNTRY = 'country'
-UC_UI_RATING = 'digitalrating'
-UC_UI_RATINGCUSTOM = 'ratingcustom'
-UC_UI_MOVIERATING = 'movierating'
-UC_UI_TVRATING = 'tvrating'
-
-UC_UI_G = 'g'
-UC_UI_PG = 'pg'
-UC_UI_PG_B = 'pg_b'
-UC_UI_R = 'r'
-UC_UI_NC_17 = 'nc_17'
-UC_UI_X = 'x'
-UC_UI_TV_Y = 'tv_y'
-UC_UI_TV_Y7 = 'tv_y7'
-UC_UI_FV = 'fv'
-UC_UI_TV_G = 'tv_g'
-UC_UI_TV_PG = 'tv_pg'
-UC_UI_TV_PGD = 'tv_pgd'
-UC_UI_TV_PGL = 'tv_pgl'
-UC_UI_TV_PGS = 'tv_pgs'
-UC_UI_TV_PGV = 'tv_pgv'
-UC_UI_TV_14 = 'tv_14'
-UC_UI_TV_14D = 'tv_14d'
-UC_UI_TV_14L = 'tv_14L'
-UC_UI_TV_14S = 'tv_14s'
-UC_UI_TV_14V = 'tv_14v'
-UC_UI_TV_MA = 'tv_ma'
-UC_UI_TV_MAL = 'tv_maL'
-UC_UI_TV_MAS = 'tv_mas'
-UC_UI_TV_MAV = 'tv_mav'
-
-UC_UI_DOWNLOADABLEUSRATING = 'downloadableusrating'
-UC_UI_UNRATED = 'uiunrated'
-UC_UI_CHANNELBLOCK= 'channelblock'
-UC_UI_EXTERNALINPUTBLOCK = 'externalinputblock'
-UC_UI_INTERNETLOCK = 'internetlock'
-# Parental Lock layer 2
-UC_UI_PHDMI1 = 'phdmi1'
-UC_UI_PHDMI2 = 'phdmi2'
-UC_UI_PHDMI3 = 'phdmi3'
-UC_UI_PVIDEO = 'pvideo'
-# Setup layer 1 (SL)
-UC_UI_NETWORK = 'network'
-UC_UI_PRIVACYPOLICY = 'privacypolicy'
-UC_UI_PHOTOFRAMESETTINGS = 'photoframesettings'
-UC_UI_USBAUTOSTART = 'usbautostart'
-UC_UI_CLOSEDCAPTIONSCC = 'closecaptionscc'
-UC_UI_AUDIODESCRIPTION = 'audiodescription'
-UC_UI_INFOBANNER = 'infobanner'
-UC_UI_CLOCKTIMERS = 'clocktimers'
-UC_UI_INITIALSTARTUP = 'initialstartup'
-UC_UI_LANGUAGE = 'uilanguage'
-UC_UI_PHYSICALKEYBOARD = 'physicalkeyboard'
-UC_UI_STARTUPLOGO = 'startuplogo'
-UC_UI_LEDINDICATOR = 'ledindicator'
-UC_UI_AVSETUP = 'avsetup'
-UC_UI_BRAVIASYNCSETTINGS = 'braviasyncsettings'
-UC_UI_PICTUREADJUSMENTSLOCK = 'pictureadjustmentslock'
-UC_UI_SLCUSTOMERSUPPORT = 'slcustomersupport'
-# Setup layer 2
-UC_UI_SLNETWORKSETUP = 'slnetworksetup'
-UC_UI_USBTETHERINGSTATUS = 'usbtetheringstatus'
-UC_UI_IPV6IPV4PRIORITY = 'ipv6ipv4priority'
-UC_UI_BUILTINWIFI = 'builtinwifi'
-UC_UI_WIFIDIRECT = 'wifidirect'
-UC_UI_WIFIDIRECTSETTINGS = 'wifidirectsettings'
-UC_UI_DEVICENAME = 'devicename'
-UC_UI_REFRESHINTERNETCONTENT = 'refreshinternetcontent'
-UC_UI_HOMENETWORKSETUP = 'homenetworksetup'    
-UC_UI_DISPLAYMODE = 'displaymode'
-UC_UI_CLOCKDISPLAY = 'clockdisplay'
-UC_UI_AUDIOAPPLICATION = 'audioapplication'
-UC_UI_IMAGESELECTION = 'imageselection'
-UC_UI_MUSICSELECTION = 'musicselection'
-UC_UI_SLIDESHOWSETTING = 'slideshowsetting'
-UC_UI_MUSICPLAYBACKSETTING = 'musicplaybacksetting'
-UC_UI_DURATION = 'duration'
-UC_UI_FIRSTDAYOFTHEWEEK = 'firstdayoftheweek'    
-UC_UI_CCDISPLAY = 'ccdisplay'
-UC_UI_ANALOGCC = 'analogcc'
-UC_UI_DIGITALCC = 'digitalcc'
-UC_UI_DIGITALCCOPTIONS = 'digitalccoptios'
-UC_UI_CCCUSTOM = 'cccustom'
-UC_UI_CHARACTERSIZE = 'charactersize'
-UC_UI_CHARACTERSTYLE = 'characterstyle'
-UC_UI_CHARACTERCOLOR = 'charactercolor'
-UC_UI_CHARACTEROPACITY = 'characteropacity'
-UC_UI_EDGETYPE = 'edgetype'
-UC_UI_EDGECOLOR = 'edgecolor'
-UC_UI_BACKGROUNDCOLOR = 'backgroundcolor'
-UC_UI_BACKGROUNDOPACITY = 'backgrouondopacity'
-UC_UI_WINDOWCOLOR = 'windowcolor'
-UC_UI_WINDOWOPACITY = 'windowopacity'
-UC_UI_SLEEPTIMER = 'sleeptimer'
-UC_UI_ONTIMER = 'ontimer'
-UC_UI_CURRENTIME = 'currenttime'
-UC_UI_MANAGEINPUTS = 'manageinputs'
-UC_UI_SLCOLORSYSTEM = 'slcoloursystem'
-UC_UI_SPEAKERS = 'speakers'
-UC_UI_HEADPHONEAUDIOOUT = 'headphoneaudioout'
-UC_UI_HEADPHONESPEAKERLINK = 'headphonespeakerlink'
-UC_UI_HEADPHONEVOLUME = 'headphonevolume'
-UC_UI_SUBWOOFER = 'subwoofer'
-UC_UI_DIGITALAUDIOOUT = 'digitalaudioout'
-UC_UI_TVPOSITION = 'tvposition'
-UC_UI_HDMISIGNALFORMAT = 'hdmisignalformat'    
-UC_UI_BRAVIASYNCCONTROL = 'braviasynccontrol'
-UC_UI_DEVICEAUTOPOWEROFF = 'deviceautopoweroff'
-UC_UI_TVAUTOPOWERON = 'tvautopoweron'
-UC_UI_BRAVIASYNCDEVICELIST = 'braviasyncdevicelist'
-UC_UI_DEVICECONTROLKEYS = 'devicecontrolkeys'
-
-UC_UI_SLSIGNALDIAGNOSTICS = 'slsysteminformation'
-UC_UI_SLVIEWMANAGEINPUTS1 = 'slviewmanagemnentinputs1'
-UC_UI_SLVIEWMANAGEINPUTS2 = 'slviewmanagemnentinputs2'
-UC_UI_SLVIEWTESTPICTURE = 'slviewtestpicture'
-UC_UI_SLSOFTWAREUPDATE = 'slsoftwareupdate'
-UC_UI_SLAUTOMATICSOFTWAREDOWNLOAD = 'slautomaticsoftwaredownload'
-UC_UI_SLINITIALSETUP = 'slinitialsetup'
-UC_UI_SLINITIALIZEPERSONALINFORMATION = 'slinitializepersonalinformation'
-UC_UI_SLPRODUCTINFORMATION = 'slproductsupport'
-UC_UI_SLHELPGUIDE = 'slhelpguide'
-UC_UI_SLLEGALINFORMATION = 'sllegalinformation'
-
-UC_UI_SLTV = 'sltv'
-UC_UI_SLHDMI1 = 'slhdmi1'
-UC_UI_SLHDMI2 = 'slhdmi2'
-UC_UI_SLHDMI3 = 'slhdmi3'
-UC_UI_SLVIDEO = 'slvideo'
-# Setup layer 3
-UC_UI_SHOWHIDEMEDIASERVERS = 'showhidemediaservers'
-UC_UI_MEDIASERVERTROUBLESHOOTING = 'mediaservertroubleshooting'
-UC_UI_REMOTESTART = 'remotestart'
-UC_UI_RENDERER1 = 'renderer1'        
-UC_UI_AUTOMANUAL = 'automanual'
-UC_UI_AUTOMATICTIMEZONE = 'automatictimezone'
-UC_UI_AUTOMATICDAYLIGHTSAVINGTIME = 'automaticdaylightsavingtime'
-UC_UI_OTTIMER = 'ottimer'
-UC_UI_OTDAY = 'otday'
-UC_UI_OTTIME = 'ottime'
-UC_UI_OTDURATION = 'otduration'
-UC_UI_OTINPUT = 'otinput'
-UC_UI_OTSIGNALTYPE = 'otsignaltype'
-UC_UI_OTCHANNEL = 'otchannel'
-UC_UI_OTTVONVOLUME = 'ottvonvolume'
-UC_UI_CTDATE = 'ctdate'
-UC_UI_CTTIME = 'cttime'
-UC_UI_STV = 'stv'
-UC_UI_SHDMI1 = 'shdmi1'
-UC_UI_SHDMI2 = 'shdmi2'
-UC_UI_SHDMI3 = 'shdmi3'
-UC_UI_SVIDEO = 'svideo'
-UC_UI_HSFHDMI2 = 'hsfhdmi2'
-UC_UI_HSFHDMI3 = 'hsfhdmi3'
-UC_UI_SUBWOOFERLEVEL = 'subwooferlevel'
-UC_UI_PHASE = 'phase'
-UC_UI_SUBWOOFERSYNC = 'subwoofersync'
-# Setup layer 4
-UC_UI_RENDERER2 = 'renderer2'
-UC_UI_RENDERERACCESSCONTROL = 'rendereraccesscontrol'
-UC_UI_RENDEREROPTIONS = 'rendereroptions'
-UC_UI_AUTOACCESSPERMISSION = 'autoaccesspermission'
-# Eco layer 1
-UC_UI_ERESET = 'ereset'
-UC_UI_POWERSAVING = 'powersaving'
-UC_UI_IDLETVSTANDBY = 'idletvstandby'
-UC_UI_AUTOSHUTOFF = 'autoshutoff'
-# Factory Reset
-UC_UI_FENGLISH = 'uienglish'
-UC_UI_FESPANOL = 'uifespanol'
-UC_UI_FFRANCAIS = 'uiffrancais'
-UC_UI_FDOWN1 = 'fdown1'
-UC_UI_FDOWN2 = 'fdown2'
-UC_UI_FDOWN3 = 'fdown3'
-UC_UI_FDOWN4 = 'fdown4'
-UC_UI_FDOWN5 = 'fdown5'
-UC_UI_FDOWN6 = 'fdown6'
-UC_UI_FENABLESMARTTV = 'fenablesmarttv'
-UC_UI_FDISABLESMARTTV = 'fdisablesmarttv'
-UC_UI_FEASY = 'feasy'
-UC_UI_FEXPERT = 'fexpert'
-
-UC_UI_FUSA = 'fusa'
-UC_UI_FCANADA = 'fcanada'
-UC_UI_FMEXICO = 'fmexico'
-UC_UI_FPUERTORICO = 'fpuertorico'
-UC_UI_FOTHER = 'fother'
-
-UC_UI_FDATE = 'fdate'
-UC_UI_FTIME = 'ftime'
-UC_UI_FOK = 'fok'
-
-#---------------
-# LINUX UISTRUCLIB_EU
-#---------------
-EU_UI_DTV = 'dtv'
-EU_UI_WIFISHORTCUT = 'wifishortcut'
-EU_UI_SEARCH = 'search'
-EU_UI_APP1 = 'app1'
-EU_UI_APP2 = 'app2'
-EU_UI_PROGRAMMELIST = 'programmelist'
-EU_UI_GUIDE = 'guide'
-EU_UI_TITLELIST = 'titlelist'
-EU_UI_TIMERLIST = 'timerlist'
-EU_UI_ERRORLIST = 'errorlist'
-EU_UI_MANUALTIMERREC = 'manualtimerrec'
-EU_UI_PHOTO = 'uiphoto'
-EU_UI_VIDEO = 'uivideo'
-EU_UI_MUSIC = 'uimusic'
-EU_UI_SYSTEMSETTINGS = 'systemsettings'
-EU_UI_NETWORKSETUP = 'networksetup'
-EU_UI_CUSTOMERSUPPORT = 'customersupport'
-EU_UI_SIGNALDIAGNOSTICS = 'signaldiagnostics'
-EU_UI_HELPGUIDE = 'helpguide'
-EU_UI_RECOMMENDATIONROW = 'recommendationrow'
-
-# Option layer
-EU_UI_SCENESELECT = 'sceneselect'
-EU_UI_OPICTURE = 'opicture'
-EU_UI_OSOUND = 'osound'
-EU_UI_OSPEAKERS = 'ospeakers'
-EU_UI_LOCK_UNLOCK = 'olock_unlock'
-EU_UI_OAUDIOLANGUAGE = 'audiolanguage'
-EU_UI_OSUBTITLESETTING = 'osubtitlesetting'
-EU_UI_OSLEEPTIMER = 'osleeptimer'
-EU_UI_OPOWERSAVING = 'opowersaving'
-EU_UI_OSYSTEMINFORMATION = 'osysteminformation'
-EU_UI_RECSTART = 'recstart'
-EU_UI_SHOWSSLCERT = 'showsslcert'
-
-# CustomerSupport Layer 1
-EU_UI_SYSTEMINFORMATION = 'systeminformation'
-EU_UI_OSYSTEMINFORMATION = 'osysteminformation'
-EU_UI_VIEWAVPRESET = 'viewavpreset'
-EU_UI_VIEWTESTPICTURE = 'viewtestpicture'
-EU_UI_SOFTWAREUPDATE = 'softwareupdate'
-EU_UI_AUTOMATICSOFTWAREDOWNLOAD = 'automaticsoftwaredownload'
-EU_UI_FACTORYSETTINGS = 'factorysettings'
-EU_UI_INITIALIZEPERSONALINFORMATION = 'initializepersonalinformation'
-EU_UI_PRODUCTSUPPORT = 'productsupport'
-EU_UI_CSHELPGUIDE = 'cshelpguide'
-EU_UI_LEGALINFORMATION = 'legalinformation'
-EU_UI_VIEWAVPRESET1 = 'viewavpreset1'
-EU_UI_VIEWAVPRESET2 = 'viewavpreset2'
-EU_UI_CSHDMI1 = 'cshdmi1'
-EU_UI_CSHDMI2 = 'cshdmi2'
-EU_UI_CSHDMI3 = 'cshdmi3'
-EU_UI_CSAV = 'csav'
-EU_UI_CSHDMI1ENABLE = 'cshdmi1enable'
-EU_UI_CSHDMI2ENABLE = 'cshdmi2enable'
-EU_UI_CSHDMI3ENABLE = 'cshdmi3enable'
-EU_UI_CSAVENABLE = 'csavenable'
-EU_UI_CSAVLABEL = 'csavlabel'
-EU_UI_CSHDMI1LABEL = 'cshdmi1label'
-EU_UI_CSHDMI2LABEL = 'cshdmi2label'
-EU_UI_CSHDMI3LABEL = 'cshdmi3label'
-
-# System Setting layer 1
-EU_UI_OPICTURE = 'opicture'
-EU_UI_PICTURE = 'picture'
-EU_UI_OSOUND = 'osound'
-EU_UI_SOUND = 'sound'
-EU_UI_OSCREEN = 'oscreen'
-EU_UI_SCREEN = 'screen'
-EU_UI_CHANNELSETUP = 'channelsetup'
-EU_UI_PARENTALLOCK = 'parentallock'
-EU_UI_SETUP = 'setup'
-EU_UI_ECO = 'eco'
-# Picture layer 1
-EU_UI_PICTUREMODE = 'picturemode'
-EU_UI_PRESET = 'preset'
-EU_UI_BRIGHTNESS = 'brightness'
-EU_UI_CONTRAST = 'contrast'
-EU_UI_BLACKLEVEL = 'blacklevel'
-EU_UI_COLOUR = 'colour'
-EU_UI_HUE = 'hue'
-EU_UI_COLOURTEMPERATURE = 'colourtemperature'
-EU_UI_SHARPNESS = 'sharpness'
-EU_UI_REALITYCREATION = 'realitycreation'
-EU_UI_RESOLUTION = 'resolution'
-EU_UI_MASTEREDIN4K = 'masteredin4k'
-EU_UI_RANDOMNOISEREDUCTION = 'randomnoisereduction'
-EU_UI_DIGITALNOISEREDUCTION = 'digitalnoisereduction'
-EU_UI_MOTIONFLOW = 'motionflow'
-EU_UI_SMOOTHNESS = 'smoothness'
-EU_UI_CLEARNESS = 'clearness'
-EU_UI_FILMMODE = 'filmmode'
-EU_UI_PADVANCEDSETTINGS = 'padvancedsettings'
-# Picture layer 2
-EU_UI_P2RESET = 'p2reset'
-EU_UI_ADVCONTRASTENHANCER = 'advcontrastenhancer'
-EU_UI_BLACKADJUST = 'blackadjust'
-EU_UI_GAMMA = 'gamma'
-EU_UI_LIVECOLOUR = 'livecolour'
-EU_UI_ADVCOLOURTEMPERATURE = 'advcolourtemperature'
-# Picture Layer 3
-EU_UI_P3RESET = 'p3reset'
-EU_UI_RGAIN = 'rgain'
-EU_UI_GGAIN = 'ggain'
-EU_UI_BGAIN = 'bgain'
-EU_UI_RBIAS = 'rbias'
-EU_UI_GBIAS = 'gbias'
-EU_UI_BBIAS = 'bbias'
-EU_UI_COLOURGAMMAADJUSTMENTPOINTS = 'colourgammaadjustmentpoints'
-EU_UI_ROFFSET = 'roffset'
-EU_UI_GOFFSET = 'goffset'
-EU_UI_BOFFSET = 'boffset'
-# Sound layer 1
-EU_UI_CLEARAUDIO = 'clearaudio'
-EU_UI_SOUNDMODE = 'soundmode'
-EU_UI_SRESET = 'sreset'
-EU_UI_SURROUND = 'surround'
-EU_UI_SURROUNDEFFECT = 'surroundeffect'
-EU_UI_SOUNDRESTORATION = 'soundrestoration'
-EU_UI_EQUALISER = 'equaliser'
-EU_UI_VOICEZOOM = 'voicezoom'
-EU_UI_ADVANCEDAUTOVOLUME = 'advancedautovolume'
-EU_UI_BALANCE = 'balance'
-EU_UI_VOLUMEOFFSET = 'volumeoffset'
-EU_UI_DUALSOUND = 'dualsound'
-EU_UI_SADVANCEDSETTINGS = 'sadvancedsettings'
-# Sound layer 2
-EU_UI_DYNAMICRANGE = 'dynamicrange'
-EU_UI_DOLBYDIGITALPLUSOUT = 'dolbydigitalplusout'
-EU_UI_HEAACAUDIOLEVEL = 'heaacaudiolevel'
-EU_UI_MPEGAUDIOLEVEL = 'mpegaudiolevel'
-EU_UI_DOLBYAC4DIALOGENHANCER = 'dolbyac4dialogenhancer'
-# Screen layer 1
-EU_UI_SCREENFORMAT = 'screenformat'
-EU_UI_AUTOFORMAT = 'autoformat'
-EU_UI_43DEFAULT = '43default'
-EU_UI_AUTODISPLAYAREA = 'autodisplayarea'
-EU_UI_DISPLAYAREA = 'displayarea'
-EU_UI_HORIZONTALSHIFT = 'horizontalshift'
-EU_UI_VERTICALSHIFT = 'verticalshift'
-EU_UI_VERTICALSIZE = 'verticalsize'
-EU_UI_PCDCI4KSETTINGS = 'pcdci4ksettings'
-# Screen layer 2
-# Channel Setup layer 1
-EU_UI_ANALOGUESETUP = 'analoguesetup'
-EU_UI_DIGITALSETUP = 'digitalsetup'
-# Channel Setup layer 2
-EU_UI_ANALOGUEAUTOTUNING = 'analogueautotuning'
-EU_UI_MANUALPROGRAMMEPRESET = 'manualprogrammepreset'
-EU_UI_PROGRAMMESORTING = 'programmesorting'
-EU_UI_DIGITALTUNING = 'digitaltuning'
-EU_UI_SUBTITLESETUP = 'subtitlesetup'
-EU_UI_AUDIOSETUP = 'audiosetup'
-EU_UI_GUIDESETUP = 'guidesetup'
-EU_UI_TECHNICALSETUP = 'technicalsetup'    
-EU_UI_SATELLITESETUP = 'satellitesetup'
-EU_UI_MANUALSERVICEUPDATE = 'manualserviceupdate'
-EU_UI_CAMODULESETUP = 'camodulesetup'
-EU_UI_CAMODULEPIN = 'camodulepin'
-EU_UI_DELETESERVICELIST = 'deleteservicelist'
-EU_UI_INTERACTIVEAPPLICATIONSETUP = 'interactiveapplicationsetup'
-EU_UI_OAUDIOLANGUAGE = 'oaudiolanguage'
-EU_UI_OSUBTITLESETTING = 'osubtitlesetting'
-# Channel Setup layer 3
-EU_UI_PROGRAMME = 'programme'
-EU_UI_TVSYSTEM = 'tvsystem'
-EU_UI_CHANNEL = 'channel'
-EU_UI_AFT = 'aft'
-EU_UI_AUDIOFILTER = 'audiofilter'
-EU_UI_SKIP = 'uiskip'
-EU_UI_COLOURSYSTEM = 'coloursystem'
-EU_UI_SIGNALLEVEL = 'signallevel'
-EU_UI_DIGITALAUTOTUNING = 'digitalautotuning'
-EU_UI_AUTOTUNINGRANGE = 'autotuningrange'
-EU_UI_PROGRAMMELISTEDIT = 'programmelistedit'
-EU_UI_PROGRAMMELISTEDIT2 = 'programmelistedit2'
-EU_UI_DIGITALMANUALTUNING = 'digitalmanualtuning'
-EU_UI_SUBTITLESETTING = 'subtitlesetting'
-EU_UI_SPRIMARYPREFERREDLANGUAGE = 'sprimarypreferredlanguage'
-EU_UI_SSECONDARYPREFERREDLANGUAGE = 'ssecondarypreferredlanguage'
-EU_UI_AUDIOTYPE = 'audiotype'
-EU_UI_APRIMARYPREFERREDLANGUAGE = 'aprimarypreferredlanguage'
-EU_UI_ASECONDARYPREFERREDLANGUAGE = 'asecondarypreferredlanguage'
-EU_UI_MIXINGLEVEL = 'mixinglevel'
-EU_UI_UPDATEGUIDEINSTANDBY = 'updateguideinstandby'
-EU_UI_AUTOSERVICEUPDATE = 'autoserviceupdate'
-EU_UI_SERVICEREPLACEMENT = 'servicereplacement'
-EU_UI_PROGRAMMELISTTRANSFER = 'programmelisttransfer'
-EU_UI_DIGITALSATELLITETUNING = 'digitalsatellitetuning'
-EU_UI_SATELLITEPROGRAMMELISTEDIT = 'satelliteprogrammelistedit'
-EU_UI_SATELLITEAUTOSERVICEUPDATE = 'satelliteautoserviceupdate'
-# Channel Setup layer 4
-EU_UI_SCANTYPE = 'scantype'
-EU_UI_CHANNNELNUMBER = 'channelnumber'
-EU_UI_FREQUENCY = 'frequency'
-EU_UI_SCANUP = 'scanup'
-EU_UI_SCANDOWN = 'scandown'
-EU_UI_GENERALSATELLITE = 'generalsatellite'
-EU_UI_INTERACTIVEAPPLICATION = 'interactiveapplication'
-EU_UI_AUTOSTARTAPPLICATION = 'autostartapplication'
-EU_UI_APPLICATIONFORPROG = 'applicationforprog'
-EU_UI_CHANNELNUMBER = 'channelnumber'
-# Channel Setup layer 4
-EU_UI_GENERALSATELLITE = 'generalsatellite'
-# Parental Lock layer 1
-EU_UI_PINCODE = 'pincode'
-EU_UI_CHANGEPINCODE = 'changepincode'
-EU_UI_PARENTALRATING = 'parentalrating'
-EU_UI_SETUPPROTECTION = 'setupprotection'
-EU_UI_DIGITALPROGRAMMELOCK = 'digitalprogrammelock'
-EU_UI_SATELLITEPROGRAMMELOCK = 'satelliteprogrammelock'
-EU_UI_EXTERNALINPUTLOCK = 'externalinputlock'
-EU_UI_GUIDANCEBLOCK = 'guidanceblock'
-EU_UI_GUIDANCEBLOCKFORRECORDEDTILES = 'guidanceblockforrecordedtiles'
-EU_UI_INTERNETLOCK = 'internetlock'
-# Parental Lock layer 2
-EU_UI_PHDMI1 = 'phdmi1'
-EU_UI_PHDMI2 = 'phdmi2'
-EU_UI_PHDMI3 = 'phdmi3'
-EU_UI_PAV = 'pav'
-# Setup layer 1 (SL)
-EU_UI_NETWORK = 'network'
-EU_UI_PRIVACYPOLICY = 'privacypolicy'
-EU_UI_PRIVACYSETUP = 'privacysetup'
-EU_UI_PHOTOFRAMESETTINGS = 'photoframesettings'
-EU_UI_USBAUTOSTART = 'usbautostart'
-EU_UI_CLOCKTIMERS = 'clocktimers'
-EU_UI_RECORDINGSETUP = 'recordingsetup'
-EU_UI_AUTOSTARTUP = 'autostartup'
-EU_UI_LANGUAGE = 'language'
-EU_UI_PHYSICALKEYBOARD = 'physicalkeyboard'
-EU_UI_STARTUPLOGO = 'startuplogo'
-EU_UI_LEDINDICATOR = 'ledindicator'
-EU_UI_AVSETUP = 'avsetup'
-EU_UI_BRAVIASYNCSETTINGS = 'braviasyncsettings'
-EU_UI_SLCUSTOMERSUPPORT = 'slcustomersupport'
-# Setup layer 2
-EU_UI_SLNETWORKSETUP = 'slnetworksetup'
-EU_UI_USBTETHERINGSTATUS = 'usbtetheringstatus'
-EU_UI_IPV6IPV4PRIORITY = 'ipv6ipv4priority'
-EU_UI_BUILTINWIFI = 'builtinwifi'
-EU_UI_WIFIDIRECT = 'wifidirect'
-EU_UI_WIFIDIRECTSETTINGS = 'wifidirectsettings'
-EU_UI_DEVICENAME = 'devicename'
-EU_UI_REFRESHINTERNETCONTENT = 'refreshinternetcontent'
-EU_UI_HOMENETWORKSETUP = 'homenetworksetup'
-EU_UI_SLINITIALIZEPERSONALINFORMATION = 'slinitializepersonalinformation'
-EU_UI_DOWN1 = 'down1'
-EU_UI_DOWN2 = 'down2'
-EU_UI_DOWN3 = 'down3'
-EU_UI_DOWN4 = 'down4'
-EU_UI_DOWN5 = 'down5'
-EU_UI_DOWN6 = 'down6'
-EU_UI_DOWN7 = 'down7'
-EU_UI_DOWN8 = 'down8'
-EU_UI_ENABLESMARTTV = 'uienablesmarttv'
-EU_UI_DISABLESMARTTV = 'uidisablesmarttv' 
-EU_UI_PSINITIALIZEPERSONALINFORMATION = 'psinitializepersonalinformation'
-EU_UI_HBBTV = 'hbbtv'
-EU_UI_DISPLAYMODE = 'displaymode'
-EU_UI_CLOCKDISPLAY = 'clockdisplay'
-EU_UI_AUDIOAPPLICATION = 'audioapplication'
-EU_UI_IMAGESELECTION = 'imageselection'
-EU_UI_MUSICSELECTION = 'musicselection'
-EU_UI_SLIDESHOWSETTING = 'slideshowsetting'
-EU_UI_MUSICPLAYBACKSETTING = 'musicplaybacksetting'
-EU_UI_DURATION = 'duration'
-EU_UI_FIRSTDAYOFTHEWEEK = 'firstdayoftheweek'    
-EU_UI_SLEEPTIMER = 'sleeptimer'
-EU_UI_ONTIMER = 'ontimer'
-EU_UI_OTONTIMER = 'otontimer'
-EU_UI_CLOCKSET = 'clockset'
-EU_UI_OTDAY = 'otday'
-EU_UI_OTTIME = 'ottime'
-EU_UI_OTDURATION = 'otduration'
-EU_UI_OTINPUT = 'otinput'
-EU_UI_OTPROGRAMME = 'otprogramme'
-EU_UI_HDDREGISTRATION = 'hddregistration'
-EU_UI_HDDDEREGISTRATION = 'hddderegistration'
-EU_UI_RECORDINGTIMEAUTOUPDATE = 'recordingtimeautoupdate'
-EU_UI_AVPRESET = 'avpreset'
-EU_UI_AVHDMI1 = 'avhdmi1'
-EU_UI_AVHDMI2 = 'avhdmi2'
-EU_UI_AVHDMI3 = 'avhdmi3'
-EU_UI_AVHDMI4 = 'avhdmi4'
-EU_UI_AVHDMI1LABEL = 'avhdmi1label'
-EU_UI_AVHDMI2LABEL = 'avhdmi2label'
-EU_UI_AVHDMI3LABEL = 'avhdmi3label'
-EU_UI_AVHDMI4LABEL = 'avhdmi4label'
-EU_UI_SLHDMI1LABEL = 'slhdmi1label'
-EU_UI_SLHDMI2LABEL = 'slhdmi2label'
-EU_UI_SLHDMI3LABEL = 'slhdmi3label'
-EU_UI_SLHDMI4LABEL = 'slhdmi4label'
-EU_UI_AVAV = 'avav'
-EU_UI_AVAVLABEL = 'avavlabel'
-EU_UI_AVAVENABLE = 'avavenable'
-EU_UI_SLAVLABEL = 'slavlabel'
-EU_UI_SLAVENABLE = 'slavenable'
-EU_UI_AVHDMI1ENABLE = 'avhdmi1enable'
-EU_UI_AVHDMI2ENABLE = 'avhdmi2enable'
-EU_UI_AVHDMI3ENABLE = 'avhdmi3enable'
-EU_UI_AVHDMI4ENABLE = 'avhdmi4enable'
-EU_UI_SLHDMI1ENABLE = 'slhdmi1enable'
-EU_UI_SLHDMI2ENABLE = 'slhdmi2enable'
-EU_UI_SLHDMI3ENABLE = 'slhdmi3enable'
-EU_UI_SLHDMI4ENABLE = 'slhdmi4enable'
-EU_UI_SHDMI1 = 'shdmi1'
-EU_UI_SHDMI2 = 'shdmi2'
-EU_UI_SHDMI3 = 'shdmi3'
-EU_UI_SHDMI4 = 'shdmi4'
-EU_UI_SLHDMI1 = 'slhdmi1'
-EU_UI_SLHDMI2 = 'slhdmi2'
-EU_UI_SLHDMI3 = 'slhdmi3'
-EU_UI_SLHDMI4 = 'slhdmi4'
-EU_UI_SLCOLOURSYSTEM = 'slcoloursystem'
-EU_UI_SPEAKERS = 'speakers'
-EU_UI_OSPEAKERS = 'ospeakers'
-EU_UI_HEADPHONEAUDIOOUT = 'headphoneaudioout'
-EU_UI_HEADPHONESPEAKERLINK = 'headphonespeakerlink'
-EU_UI_HEADPHONEVOLUME = 'headphonevolume'
-EU_UI_SUBWOOFER = 'subwoofer'
-EU_UI_DIGITALAUDIOOUT = 'digitalaudioout'
-EU_UI_TVPOSITION = 'tvposition'
-EU_UI_HDMISIGNALFORMAT = 'hdmisignalformat'    
-EU_UI_BRAVIASYNCCONTROL = 'braviasynccontrol'
-EU_UI_AUTODEVICESOFF = 'autodevicesoff'
-EU_UI_AUTOTVON = 'autotvon'
-EU_UI_BRAVIASYNCDEVICELIST = 'braviasyncdevicelist'
-EU_UI_DEVICECONTROLKEYS = 'devicecontrolkeys'
-EU_UI_LOCK_UNLOCK = 'lockunlock'
-EU_UI_SLSYSTEMINFORMATION = 'slsysteminformation'
-EU_UI_SLVIEWAVPRESET1 = 'slviewavpreset1'
-EU_UI_SLVIEWAVPRESET2 = 'slviewavpreset2'
-EU_UI_SLVIEWTESTPICTURE = 'slviewtestpicture'
-EU_UI_SLSOFTWAREUPDATE = 'slsoftwareupdate'
-EU_UI_SLAUTOMATICSOFTWAREDOWNLOAD = 'slautomaticsoftwaredownload'
-EU_UI_SLFACTORYSETTINGS = 'slfactorysettings'
-EU_UI_SLINITIALIZEPERSONALINFORMATION = 'slinitializepersonalinformation'
-EU_UI_SLPRODUCTSUPPORT = 'slproductsupport'
-EU_UI_SLHELPGUIDE = 'slhelpguide'
-EU_UI_SLLEGALINFORMATION = 'sllegalinformation'
-EU_UI_SLHDMI1 = 'slhdmi1'
-EU_UI_SLHDMI2 = 'slhdmi2'
-EU_UI_SLHDMI3 = 'slhdmi3'
-EU_UI_SLAV = 'slav'
-EU_UI_SLHDMI1ENABLE = 'slhdmi1enable'
-EU_UI_SLHDMI2ENABLE = 'slhdmi2enable'
-EU_UI_SLHDMI3ENABLE = 'slhdmi3enable'
-EU_UI_SLAVENABLE = 'slavenable'
-EU_UI_SLHDMI1LABEL = 'slhdmi1label'
-EU_UI_SLHDMI2LABEL = 'slhdmi2label'
-EU_UI_SLHDMI3LABEL = 'slhdmi3label'
-EU_UI_SLAVLABEL = 'slavlabel'
-# Setup layer 3
-EU_UI_SERVERDISPLAYSETTINGS = 'serverdisplaysettings'
-EU_UI_SERVERDIAGNOSTICS = 'serverdiagnostics'
-EU_UI_REMOTESTART = 'remotestart'
-EU_UI_RENDERER = 'renderer'
-EU_UI_DONOTTRACK = 'donottrack'
-EU_UI_BLOCK3RDPARTYCOOKIES = 'block3rdpartycookies'
-EU_UI_PERSISTENTSTORAGE = 'persistentstorage'
-EU_UI_OTONTIMER = 'otontimer'
-EU_UI_OTDAY ='otday'
-EU_UI_OTTIME ='ottime'
-EU_UI_OTDURATION ='otduration'
-EU_UI_OTINPUT ='otinput'
-EU_UI_OTPROGRAMME ='otprogramme'
-EU_UI_VOLUMESETUP = 'volumesetup'
-EU_UI_OTVOLUMESETUP ='otvolumesetup'
-EU_UI_AUTOMANUAL = 'automanual'
-EU_UI_AUTOMATICTIMEZONE = 'automatictimezone'
-EU_UI_AUTOMATICDAYLIGHTSAVINGTIME = 'automaticdaylightsavingtime'
-EU_UI_DATE = 'date'
-EU_UI_SLTIME = 'sltime'
-EU_UI_TIMEZONE = 'timezone'                
-EU_UI_OSLEEPTIMER = 'osleeptimer'
-EU_UI_RECSTART = 'recstart'
-EU_UI_SHOWSSLCERT = 'showsslcert'
-EU_UI_DOWN1 = 'down1'
-EU_UI_DOWN2 = 'down2'
-EU_UI_DOWN3 = 'down3'
-EU_UI_DOWN4 = 'down4'
-EU_UI_DOWN5 = 'down5'
-EU_UI_DOWN6 = 'down6'
-EU_UI_DOWN7 = 'down7'
-EU_UI_DOWN8 = 'down8'
-EU_UI_ENABLESMARTTV = 'enablesmarttv'
-EU_UI_DISABLESMARTTV = 'disablesmarttv'
-EU_UI_SLSYSTEMINFORMATION = 'slsysteminformation'
-EU_UI_SLLEGALINFORMATION = 'sllegalinformation'
-EU_UI_SLVIEWAVPRESET1 = 'slviewavpreset1'
-EU_UI_SLVIEWAVPRESET2 = 'slviewavpreset2'
-EU_UI_SLVIEWAVPRESET3 = 'slviewavpreset3'
-EU_UI_SLVIEWAVPICTURE = 'slviewavpicture'
-EU_UI_SLVIEWTESTPICTURE = 'slviewtestpicture'
-EU_UI_SLSOFTWAREUPDATE = 'slsoftwareupdate'
-EU_UI_SLAUTOMATICSOFTWAREDOWNLOAD = 'slautomaticsoftwaredownload'
-EU_UI_SLFACTORYSETTINGS = 'slfactorysettings'
-EU_UI_SLPRODUCTSUPPORT = 'slproductsupport'
-EU_UI_SLHELPGUIDE = 'slhelpguide'
-EU_UI_SLAV = 'slav'
-EU_UI_AVHDMI1 = 'avhdmi1'
-EU_UI_AVHDMI2 = 'avhdmi2'
-EU_UI_AVHDMI3 = 'avhdmi3'
-EU_UI_AVAV = 'avav'
-EU_UI_AVHDMI1ENABLE = 'avhdmi1enable'
-EU_UI_AVHDMI2ENABLE = 'avhdmi2enable'
-EU_UI_AVHDMI3ENABLE = 'avhdmi3enable'
-EU_UI_AVAVENABLE = 'avavenable'
-EU_UI_AVHDMI1LABEL = 'avhdmi1label'
-EU_UI_AVHDMI2LABEL = 'avhdmi2label'
-EU_UI_AVHDMI3LABEL = 'avhdmi3label'
-EU_UI_AVAVLABEL = 'avavlabel'
-
-EU_UI_SHDMI2 = 'shdmi2'
-EU_UI_SHDMI3 = 'shdmi3'
-EU_UI_SUBWOOFERLEVEL = 'subwooferlevel'
-EU_UI_PHASE = 'phase'
-EU_UI_SUBWOOFERSYNC = 'subwoofersync'
-# Setup layer 4
-EU_UI_RENDERERFUNCTION = 'rendererfunction'
-EU_UI_RENDERERACCESSCONTROL = 'rendereraccesscontrol'
-EU_UI_RENDERERSETUP = 'renderersetup'
-EU_UI_AUTOMATICACCESSPERMISSION = 'automaticaccesspermission'
-# Eco layer 1
-EU_UI_ERESET = 'ereset'
-EU_UI_POWERSAVING = 'powersaving'
-EU_UI_OPOWERSAVING = 'opowersaving'
-EU_UI_IDLETVSTANDBY = 'idletvstandby'
-# ADD Country LANG
-# Factory Reset
-EU_UI_FBULGARIAN = 'fbulgarian'
-EU_UI_FBOSANSKI = 'fbosanski'
-EU_UI_FCATALA = 'fcatala'
-EU_UI_FCESKY = 'fcesky'
-EU_UI_FDANSK = 'fdansk'
-EU_UI_FDEUTSCH = 'fdeutsch'
-EU_UI_FGREEK = 'fgreek'
-EU_UI_FENGLISH = 'fenglish'
-EU_UI_FESPANOL = 'fespanol'
-EU_UI_FEESTI = 'feesti'
-EU_UI_FSUOMI = 'fsuomi'
-EU_UI_FFRANCAIS = 'ffrancais'
-EU_UI_FHEBREW = 'fhebrew'
-EU_UI_FHRVATSKI = 'fhrvatski'
-EU_UI_FMAGYAR = 'fmagyar'
-EU_UI_FITALIANO = 'fitaliano'
-EU_UI_FKAZAKH = 'fkazakh'
-EU_UI_FLIETUVISKAI = 'flietuviskai'
-EU_UI_FLATVIESU = 'flatviesu'
-EU_UI_FMACEDONIAN = 'fmacedonian'
-EU_UI_FNEDERLANDS  = 'fnederlands'
-EU_UI_FNORSK = 'fnorsk'
-EU_UI_FPOLSKI = 'fpolski'
-EU_UI_FPORTUGUES = 'fportugues'
-EU_UI_FROMANA = 'fromana'
-EU_UI_FRUSSIAN = 'frussian'
-EU_UI_FSLOVENCINA = 'fslovencina'
-EU_UI_FSLOVENSCINA = 'fslovenscina'
-EU_UI_FSRPSKI = 'fsrpski'
-EU_UI_FSVENSKA = 'fsvenska'
-EU_UI_FTURKCE = 'fturkce'
-EU_UI_FUKRANIAN = 'fukranian'
-
-EU_UI_FDOWN1 = 'fdown1'
-EU_UI_FDOWN2 = 'fdown2'
-EU_UI_FDOWN3 = 'fdown3'
-EU_UI_FDOWN4 = 'fdown4'
-EU_UI_FDOWN5 = 'fdown5'
-EU_UI_FDOWN6 = 'fdown6'
-EU_UI_FDOWN7 = 'fdown7'
-EU_UI_FDOWN8 = 'fdown8'
-EU_UI_FDOWN9 = 'fdown9'
-EU_UI_FDOWN10 = 'fdown10'
-EU_UI_FDOWN11 = 'fdown11'
-EU_UI_FENABLESMARTTV = 'fenablesmarttv'
-EU_UI_FDISABLESMARTTV = 'fdisablesmarttv'
-EU_UI_FDISABLESMARTTVOK = 'fdisablesmarttvok'
-
-EU_UI_FEASY = 'feasy'
-EU_UI_FEXPERT = 'fexpert'
-EU_UI_FSKIP = 'fskip'
-
-EU_UI_FNONE = 'fnone'
-EU_UI_FAFRICA = 'fafrica'
-EU_UI_FBOSNIA = 'fbosnia'
-EU_UI_FCESKAREP = 'fceskarep'
-EU_UI_FDANMARK = 'fdanmark'
-EU_UI_FDEUTSCHLAND = 'fdeutschland'
-EU_UI_FSCHWEIZ = 'fschweiz'
-EU_UI_FOSTERREICH = 'fosterreich'
-EU_UI_FEESTI = 'feesti'
-EU_UI_FGREECE = 'fgreece'
-EU_UI_FUNITEDKINGDOM = 'funitedkingdom'
-EU_UI_FIRELAND = 'fireland'
-EU_UI_FESPANA = 'fespana'
-EU_UI_FFRANCE = 'ffrance'
-EU_UI_FREPUBLIKAHRVATSKA = 'frepublikahrvatska'
-EU_UI_FITALIA = 'fitalia'
-EU_UI_FLATVIJA = 'flatvija'
-EU_UI_FLIETUVA = 'flietuva'
-EU_UI_FMAGYARORSZAG = 'fmagyarorszag'
-EU_UI_FMACEDONIA = 'fmacedonia'
-EU_UI_FNEDERLAND = 'fnederland'
-EU_UI_FBELGIE = 'fbelgie'
-EU_UI_FLUXEMBOURG = 'fluxembourg'
-EU_UI_FNORGE = 'fnorge'
-EU_UI_FPOLSKA = 'fpolska'
-EU_UI_FPORTUGAL = 'fportugal'
-EU_UI_FROMANIA = 'fromania'
-EU_UI_FRUSSIA = 'frussia'
-EU_UI_FSLOVENSKAREP = 'fslovenskarep'
-EU_UI_FSLOVENIJA = 'fslovenija'
-EU_UI_FSERBIA = 'fserbia'
-EU_UI_FSUOMI = 'fsuomi'
-EU_UI_FSVERIGE = 'fsverige'
-EU_UI_FTURKIYE = 'fturkiye'
-EU_UI_FUKRAIN = 'fukrain'
-EU_UI_FKAZAKHSTAN = 'fkazakhstan'
-EU_UI_FISRAEL = 'fisrael'
-
-EU_UI_FON = 'fon'
-EU_UI_FOFF = 'foff'
-EU_UI_FSTART = 'fstart'
-EU_UI_FSKIP2 = 'fskip2'
-EU_UI_FAUTOMANUAL = 'fautomanual'
-EU_UI_FAUTOMATICTIMEZONE = 'fautomatictimezone'
-EU_UI_FAUTOMATICDAYLIGHTSAVINGTIME = 'fautomaticdaylightsavingtime'
-EU_UI_FDATE = 'fdate'
-EU_UI_FTIME = 'ftime'
-EU_UI_FTIMEZONE = 'ftimezone'
-EU_UI_FOK = 'fok'
-#---------------
-# VULCAN UISTRUCLIB_PA
-#---------------
-# HOME LAYER
-PA_UI_CLICKTOSPEAK = 'clicktospeak'
-PA_UI_CLICKTOTYPE = 'clicktotype'
-PA_UI_NOTIFICATION = 'notification'
-PA_UI_HOMESETTINGS = 'homesettings'
-PA_UI_DETAILS = 'details'
-PA_UI_DISMISS = 'dismiss'
-PA_UI_APPS = 'apps'
-PA_UI_TV = 'tv'
-PA_UI_DTV = 'dtv'
-
-# Apps
-PA_UI_NETFLIX = 'netflix'
-PA_UI_PRIMEVIDEO = 'primevideo'
-PA_UI_MEDIAPLAYER = 'mediaplayer'
-PA_UI_YOUTUBE = 'youtube'
-PA_UI_GOOLEPLAY = 'googleplay'
-PA_UI_ADDAPPTOFAVOURITES = 'addapptofavourites'
-PA_UI_HOMECUSTOMISECHANNELS = 'homecustomisechannels'
-PA_UI_APPTV = 'apptv'
-PA_UI_CHANNEL1 = 'channel1'
-PA_UI_CHANNEL2 = 'channel2'
-PA_UI_CHANNEL3 = 'channel3'
-
-# Home Customise Channels
-PA_UI_HOMEPLAYNEXT = 'homeplaynext'
-PA_UI_HOMECUSTOMISECHANNELSTV = 'homecustomisechannelstv'
-PA_UI_HOMEPLAYNEXTL2 = 'homeplaynextl2'
-PA_UI_HOMEPLAYNEXTTV = 'homeplaynexttv'
-
-# Option
-PA_UI_OPICTUREOFF = 'opictureoff'
-PA_UI_OPICTURE = 'opicture'
-PA_UI_OSOUND = 'osound'
-PA_UI_OSPEAKERS = 'ospeakers'
-PA_UI_OWATCHTV = 'owatchtv'
-PA_UI_OAUDIOLANGUAGE = 'oaudiolanguage'
-PA_UI_OAUDIODESCRIPTION = 'oaudiodescription'
-PA_UI_OSETTINGS = 'osettings'
-PA_UI_BLACKSCREEN = 'blackscreen'
-# Inside Apps
-PA_UI_GETMOREAPPS = 'getmoreapps'
-PA_UI_GETMOREGAMES = 'getmoregames'
-PA_UI_APPSNETFLIX = 'appsnetflix'
-PA_UI_APPSPRIMEVIDEO = 'appsprimevideo'
-PA_UI_APPSTV = 'appstv'
-PA_UI_APPSMEDIAPLAYER = 'appsmediaplayer'
-PA_UI_APPSYOUTUBE = 'appsyoutube'
-PA_UI_APPSGOOGLEPLAYMOVIES = 'appsgoogleplaymovies'
-PA_UI_APPSGOOGLEPLAYMUSIC = 'appsgoogleplaymusic'
-PA_UI_APPSGOOGLEPLAYSTORE = 'appsgoogleplaystore'
-PA_UI_APPSGOOGLEPLAYGAMES = 'appsgoogleplaygames'
-PA_UI_APPSCUSTOMERSUPPORT = 'appscustomersupport'
-PA_UI_APPSSYSTEMTRACING = 'appssystemtracing'
-
-PA_UI_OKIVEGOTIT = 'okivegotit'
-PA_UI_OKSETUPNOW = 'oksetupnow'
-
-# Inside Settings from HOME        Inside Settings from HOME        Inside Settings from HOME        Inside Settings from HOME        Inside Settings from HOME        
-PA_UI_HSDTV = 'hsdtv'
-PA_UI_HSFINISHSETTINGTV = 'hsfinishsettingtv'
-PA_UI_HSTAKEBUGREPORT = 'hstakebugreport'
-PA_UI_HSNETWORKANDINTERNET = 'hsnetworkandinternet'
-PA_UI_HSACCOUNTSANDSIGNIN = 'hsaccountsandsignin'
-PA_UI_HSSAPPS = 'hssapps'
-PA_UI_HSDEVICEPREFERENCES = 'hsdevicepreferences'
-PA_UI_HSREMOTESANDACCESSORIES = 'hsremoteandaccessories'
-PA_UI_HSBRAVIASETTINGS = 'hsbraviasettings'
-
-# Network and Internet
-PA_UI_HSWIFI = 'hswifi'
-PA_UI_HSNETWORK1 = 'hsnetwork1'
-PA_UI_HSNETWORK2 = 'hsnetwork2'
-PA_UI_HSNETWORK3 = 'hsnetwork3'
-PA_UI_HSSEEALL = 'hsseeall'
-PA_UI_HSADDNEWNETWORK = 'hsaddnewnetwork'
-PA_UI_HSSCANNINGALWAYSAVAILABLE = 'hsscanningalwaysavailable'
-PA_UI_HSNOTCONNECTED = 'hsnotconnected'
-PA_UI_HSPROXYSETTINGS = 'hsproxysettings'
-PA_UI_HSIPSETTINGS = 'hsipsettings'
-
-# Inside Apps
-PA_UI_HSAPPS1 = 'hsapps1'
-PA_UI_HSAPPS2 = 'hsapps2'
-PA_UI_HSAPPS3 = 'hsapps3'
-PA_UI_HSAPPS4 = 'hsapps4'
-PA_UI_HSAPPS5 = 'hsapps5'
-PA_UI_HSSEEALLAPPS = 'hsseeallmaps'
-PA_UI_HSAPPSPERMISSION = 'hsappspermission'
-PA_UI_HSSPECIALAPPACCESS = 'hsspecialappaccess'
-PA_UI_HSSECURITYANDRESTRICTIONS = 'hssecurityandrestrictions'
-
-# App Permissions
-PA_UI_HSBODYSENSORS = 'hsbodysensors'
-PA_UI_HSCALENDAR = 'hscalendar'
-PA_UI_HSCALLLOGS = 'hscalllogs'
-PA_UI_HSCAMERA = 'hscamera'
-PA_UI_HSCONTACTS = 'hscontacts'
-PA_UI_HSLOCATION = 'hslocations'
-PA_UI_HSMICROPHONE = 'hsmicrophone'
-PA_UI_HSSMS = 'hssms'
-PA_UI_HSSTORAGE = 'hsstorage'
-PA_UI_HSTELEPHONE = 'hstelephone'
-PA_UI_HSADDITIONALPERMISSION = 'hsadditionalpermission'
-
-# Calendar Permissions
-PA_UI_HSCALENDARSHOWSYSTEMAPPS = 'hscalendarshowsystemapps'
-PA_UI_HSCALENDARGOOGLECALENDARSYNC = 'hscalendargooglecalendarsync'
-PA_UI_HSCALENDARGOOGLEPLAYSERVICES = 'hscalendargoogleplayservices'
-PA_UI_HSCALENDARGOOGLESEARCH = 'hscalendargooglesearch'
-# Call Log Permissions
-PA_UI_HSCALLLOGSSHOWSYSTEMAPPS = 'hscalllogsshowsystmeapps'
-PA_UI_HSCALLLOGSGOOGLEPLAYSERVICES = 'hscalllogsgoogleplayservices'
-# Camera Permissions
-PA_UI_HSCAMERAL2 = 'hscameral2'
-PA_UI_HSCAMERAGALLERY = 'hscameragallery'
-PA_UI_HSCAMERASHOWSYSTEMAPPS = 'hscamerashowsystemapps'
-PA_UI_HSCAMERAL3 = 'hscameral3'
-PA_UI_HSCAMERAGOOGLEPLAYSERVICES = 'hscameragoogleplayservices'
-PA_UI_HSCAMERAGOOGLESEARCH = 'hscameragooglesearch'
-# Contacts Permissions
-PA_UI_HSCONTACTSGALLERY = 'hscontactsgallery'
-PA_UI_HSCONTACTSGOOGLEPLAYGAMES = 'hscontactsgoogleplaygames'
-PA_UI_HSCONTACTSGOOGLEPLAYSTORE = 'hscontactsgoogleplaystore'
-PA_UI_HSCONTACTSNETFLIX = 'hscontactsnetflix'
-PA_UI_HSCONTACTSSHOWSYSTEMAPPS = 'hscontactsshowsytemapps'
-PA_UI_HSCONTACTSBUGREPORTSENDER = 'hscontactsbugreportsender'
-PA_UI_HSCONTACTSCALENDARSTORAGE = 'hscontactscalendarstorage'
-PA_UI_HSCONTACTSGBOARD = 'hscontactsgboard'
-PA_UI_HSCONTACTSGOOGLEBACKUPTRANSPORT = 'hscontactsgooglebackuptransport'
-PA_UI_HSCONTACTSGOOGLECONTACTSSYNC = 'hscontactsgooglecontactssync'
-PA_UI_HSCONTACTSGOOGLEINDICKEYBOARD = 'hscontactsgoogleinidckeyboard'
-PA_UI_HSCONTACTSGOOGLEPLAYSERVICE = 'hscontactsgoogleplayservice'
-PA_UI_HSCONTACTSGOOGLESEARCH = 'hscontactsgooglesearch'
-PA_UI_HSCONTACTSGOOGLESERVICEFRAMEWORK = 'hscontactsgoogleserviceframework'
-PA_UI_HSCONTACTSPLAYMUSIC = 'hscontactsplaymusic'
-# Location Permissions
-PA_UI_HSLOCATIONANDROIDTVREMOTE = 'hslocationandroidremote'
-PA_UI_HSLOCATIONSERVICE = 'hslocationservice'
-PA_UI_HSLOCATIONEULA1 = 'hslocationeula1'
-PA_UI_HSLOCATIONEULA2 = 'hslocationeula2'
-PA_UI_HSLOCATIONEULA3 = 'hslocationeula3'
-PA_UI_HSLOCATIONGALLERY = 'hslocationgallery'
-PA_UI_HSLOCATIONGOOGLEPLAYSTORE = 'hslocationgoogleplaystore'
-PA_UI_HSLOCATIONHELP1 = 'hslocationhelp1'
-PA_UI_HSLOCATIONHELP2 = 'hslocationhelp2'
-PA_UI_HSLOCATIONSHOWSYSTEMAPPS = 'hslocationshowsystemapps'
-PA_UI_HSLOCATIONANDDROIDACCESSIBILITY = 'hslocationandroidaccessibility'
-PA_UI_HSLOCATIONCAMERA = 'hslocationcamera'
-PA_UI_HSLOCATIONGOOGLEPLAYMOVIESANDTV = 'hslocationgoogleplaymoviesandtv'
-PA_UI_HSLOCATIONGOOGLEPLAYSERVICES = 'hslocationgoogleplayservices'
-PA_UI_HSLOCATIONGOOGLESEARCH = 'hslocationgooglesearch'
-PA_UI_HSLOCATIONPLAYMUSIC = 'hslocationplaymusic'
-PA_UI_HSLOCATIONSETUPWIZARD = 'hslocationsetupwizard'
-# Microphone Permissions
-PA_UI_HSMICROPHONECAMERA = 'hsmicrophonecamera'
-PA_UI_HSMICROPHONEEULA1 = 'hsmicrophoneeula1'
-PA_UI_HSMICROPHONEEULA2 = 'hsmicrophoneeula2'
-PA_UI_HSMICROPHONEEULA3 = 'hsmicrophoneeula3'
-PA_UI_HSMICROPHONEGALLERY = 'hsmicrophonegallery'
-PA_UI_HSMICROPHONEGOOGLEPLAYSTORE = 'hsmicrophonegoogleplaystore'
-PA_UI_HSMICROPHONEHELP1 = 'hsmicrophonehelp1'
-PA_UI_HSMICROPHONEHELP2 = 'hsmicrophonehelp2'
-PA_UI_HSMICROPHONEYOUTUBE = 'hsmicrophoneyoutube'
-PA_UI_HSMICROPHONESHOWSYSTEMAPPS = 'hsmicrophoneshowsystemapps'
-PA_UI_HSMICROPHONEANDROIDACCESSIBILITY = 'hsmicrophoneandroidaccessibility'
-PA_UI_HSMICROPHONECAMERAL2 = 'hsmicrophonecameral2'
-PA_UI_HSMICROPHONEGBOARD = 'hsmicrophonegboard'
-PA_UI_HSMICROPHONEGOOGLEPLAYSERVICE = 'hsmicrophonegoogleplayservice'
-PA_UI_HSMICROPHONEGOOGLESEARCH = 'hsmicrophonegooglesearch'
-PA_UI_HSMICROPHONEPLAYMUSIC = 'hsmicrophoneplaymusic'
-# SMS Permissions
-PA_UI_HSSMSGOOGLEPLAYSTORE = 'hssmsgoogleplaystore'
-PA_UI_HSSMSSHOWSYSTEMAPPS = 'hssmsshowsystemapps'
-PA_UI_HSSMSGOOGLEPLAYSERVICES = 'hssmsgoogleplayservices'
-# Storage Permissions
-PA_UI_HSSTORAGEANDROIDTVREMOTE = 'hsstorageandroidtvremote'
-PA_UI_HSSTORAGECAMERAL2 = 'hsstoragecameral2'
-PA_UI_HSSTORAGEEULA1 = 'hsstorageeula1'
-PA_UI_HSSTORAGEEULA2 = 'hsstorageeula2'
-PA_UI_HSSTORAGEEULA3 = 'hsstorageeula3'
-PA_UI_HSSTORAGEGALLERY = 'hsstoragegallery'
-PA_UI_HSSTORAGEHELP1 = 'hsstoragehelp1'
-PA_UI_HSSTORAGEHELP2 = 'hsstoragehelp2'
-PA_UI_HSSTORAGENETFLIX = 'hsstoragenetflix'
-PA_UI_HSSTORAGEQRMT = 'hsstorageqrmt'
-PA_UI_HSSTORAGESHOWSYSTEMAPPS = 'hsstorageshowsystemapps'
-PA_UI_HSSTORAGEBUGREPORTSENDER = 'hsstoragebugreportsender'
-PA_UI_HSSTORAGECALENDARSTORAGE = 'hsstoragecalendarstorage'
-PA_UI_HSSTORAGECAMERAL3 = 'hsstoragecameral3'
-PA_UI_HSSTORAGEDEMOAPP = 'hsstoragestoragedemoapp'
-PA_UI_HSSTORAGEGBOARD = 'hsstoragegboard'
-PA_UI_HSSTORAGEGOOGLEINDICKEYBOARD = 'hsstoragegoogleindickeyboard'
-PA_UI_HSSTORAGEGOOGLEPLAYSERVICES = 'hsstoragegoogleplayservices'
-PA_UI_HSSTORAGEGOOGLESEARCH = 'hsstoragegooglesearch'
-PA_UI_HSSTORAGEHTMLVIEWER = 'hsstoragehtmlviewer'
-PA_UI_HSSTORAGEMEDIAPLAYER = 'hsstoragemediaplayer'
-PA_UI_HSSTORAGEPLAYMUSIC = 'hsstorageplaymusic'
-PA_UI_HSSTORAGEPRIMEVIDEO = 'hsstorageprimevideo'
-PA_UI_HSSTORAGESETUPWIZARD = 'hsstoragesetupwizard'
-PA_UI_HSSTORAGETVSTORAGE = 'hsstoragetvstorage'
-# Telephone Permissions
-PA_UI_HSTELEPHONEEULA1 = 'hstelephoneeula1'
-PA_UI_HSTELEPHONEEULA2 = 'hstelephoneeula2'
-PA_UI_HSTELEPHONEEULA3 = 'hstelephoneeula3'
-PA_UI_HSTELEPHONEGOOGLEPLAYSTORE = 'hstelephonegoogleplaystore'
-PA_UI_HSTELEPHONEHELP1 = 'hstelephonehelp1'
-PA_UI_HSTELEPHONEHELP2 = 'hstelephonehelp2'
-PA_UI_HSTELEPHONEQRMT = 'hstelephoneqrmt'
-PA_UI_HSTELEPHONESHOWSYSTEMAPPS = 'hstelephoneshowsystemapps'
-PA_UI_HSTELEPHONEANDROIDACCESSIBILITY = 'hstelephoneandroidaccessibility'
-PA_UI_HSTELEPHONEGOOGLEPLAYSERVICES = 'hstelephonegoogleplayservices'
-PA_UI_HSTELEPHONEGOOGLESEARCH = 'hstelephonegooglesearch'
-PA_UI_HSTELEPHONEGOOGLESERVICESFRAMEWORK = 'hstelephonegoogleservicesframework'
-PA_UI_HSTELEPHONESETTINGSSUGGESTIONS = 'hstelephonesettingssuggestions'
-# Additional Permissions
-PA_UI_HSREADALLTVLISTINGS = 'hsreadalltvlistings'
-PA_UI_HSREADINSTANTMESSAGES = 'hsreadinstantmessages'
-PA_UI_HSWRITEINSTANTMESSAGES = 'hswriteinstantmessages'
-# Read Instant messages permission
-PA_UI_HSREADSHOWSYSTEMAPPS = 'hsreadshowsystemapps'
-PA_UI_HSREADGOOGLESERVICESFRAMEWORK = 'hsreadgoogleservicesframework'
-# Write Instant messages permission
-PA_UI_HSWRITESHOWSYSTEMAPPS = 'hswriteshowsystemapps'
-PA_UI_HSWRITEGOOGLESERVICESFRAMEWORK = 'hswritegoogleservicesframework'
-
-# Special App Access
-PA_UI_HSENERGYOPTIMISATION = 'hsenergyoptimisation'
-PA_UI_HSUSAGEACCESS = 'hsusageaccess'
-PA_UI_HSNOTIFICATIONACCESS = 'hsnotificationaccess'
-PA_UI_HSDISPLAYOVEROTHERAPPS = 'hsdisplayoverotherapps'
-PA_UI_HSMODIFYSYSTEMSETTINGS = 'hsmodifysystemsettings'
-PA_UI_HSDIRECTORYACCESS = 'hsdirectoryaccess'
-
-# Energy Optimisation
-PA_UI_ENERGYOPTIMISATION2 = 'energyoptimisation2'
-PA_UI_ENERGYACTIONMENU = 'energyactionmenu'
-PA_UI_ENERGYACTIVITYSTUB = 'energyactivitystub'
-PA_UI_ENERGYADVANCEDSETTINGS = 'energyadvancedsettings'
-PA_UI_ENERGYANDROIDACCESSIBILITYSUITE = 'energyandroidaccessibilitysuite'
-PA_UI_ENERGYANDROIDSERVICESLIBRARY = 'energyandroidserviceslibrary'
-PA_UI_ENERGYANDROIDSHAREDLIBRARY = 'energyandroidsharedlibrary'
-PA_UI_ENERGYANDROIDSYSTEMWEBVIEW = 'energyandroidsystemwebview'
-PA_UI_ENERGYANDROIDTVCORESERVICES = 'energyandroidtvcoreservices'
-PA_UI_ENERGYANDROIDTVHOME = 'energyandroidtvhome'
-PA_UI_ENERGYANDROIDTVREMOTESERVICE = 'energyandroidtvremoteservice'
-PA_UI_ENERGYBACKDROP = 'energybackdrop'
-PA_UI_ENERGYBASICDAYDREAMS = 'energybasicdaydreams'
-PA_UI_ENERGYBLUETOOTH = 'energybluetooth'
-PA_UI_ENERGYBRAVIASETTINGS = 'energybraviasettings'
-PA_UI_ENERGYBUGREPORTSENDER = 'energybugreportsender'
-PA_UI_ENERGYCALENDARSTORAGE = 'energycalendarstorage'
-PA_UI_ENERGYCAMERA1 = 'energycamera1'
-PA_UI_ENERGYCAMERA2 = 'energycamera2'
-PA_UI_ENERGYCAPTIVEPORTALLOGIN = 'energycaptiveportallogin'
-PA_UI_ENERGYCERIFICATEINSTALLER = 'energycerificateinstaller'
-PA_UI_ENERGYCHROMECASTBUILTIN = 'energychromecastbuiltin'
-PA_UI_ENERGYCODECNOTIFICATION = 'energycodecnotification'
-PA_UI_ENERGYCOMANDROIDBACKUPCOMFIRM = 'energycomandroidbackupcomfirm'
-PA_UI_ENERGYCOMANDROIDCTCCTSSHIM = 'energycomandroidctcctsshim'
-PA_UI_ENERGYCOMANDROIDSHAREDSTORAGEBACKUP = 'energycomandroidsharedstoragebackup'
-PA_UI_ENERGYCOMGOOGLEANDORIDLEANBACKLAUNCHER = 'energycomgoogleandoridleanbacklauncher'
-PA_UI_ENERGYCOMGOOGLEANDORIDLEANBACKLAUNCHERRECOMENDATIONS = 'energycomgoogleandoridleanbacklauncherrecomendations'
-PA_UI_ENERGYCOMREALTEKSERVICEMENU = 'energycomrealtekservicemenu'
-PA_UI_ENERGYCOMPANIONDEVICEMANAGER = 'energycompaniondevicemanager'
-PA_UI_ENERGYCONTACTSSTORAGE = 'energycontactsstorage'
-PA_UI_ENERGYDEMOAPP = 'energydemoapp'
-PA_UI_ENERGYDEVICECONFIGURATION = 'energydeviceconfiguration'
-PA_UI_ENERGYDOWNLOADMANAGER = 'energydownloadmanager'
-PA_UI_ENERGYDTVTVINOUT = 'energydtvtvinout'
-PA_UI_ENERGYENGLISHMENU = 'energyenglishmenu'
-PA_UI_ENERGYEULA1 = 'energyeula1'
-PA_UI_ENERGYEULA2 = 'energyeula2'
-PA_UI_ENERGYEULA3 = 'energyeula3'
-PA_UI_ENERGYEXTERNALSTORAGE = 'energyexternalstorage'
-PA_UI_ENERGYFILES = 'energyfiles'
-PA_UI_ENERGYFUSEDLOCATION = 'energyfusedlocation'
-PA_UI_ENERGYGALLERY = 'energygallery'
-PA_UI_ENERGYGBOARD = 'energygboard'
-PA_UI_ENERGYGOOGLEBACKUPTRANSPORT = 'energygooglebackuptransport'
-PA_UI_ENERGYGOOGLECALENDARSYNC = 'energygooglecalendarsync'
-PA_UI_ENERGYGOOGLECONTACTSSYNC = 'energygooglecontactssync'
-PA_UI_ENERGYGOOGLEONETIMEINIT = 'energygoogleonetimeinit'
-PA_UI_ENERGYGOOGLEPARTNERSETUP = 'energygooglepartnersetup'
-PA_UI_ENERGYGOOGLEPLAYGAMES = 'energygoogleplaygames'
-PA_UI_ENERGYGOOGLEPLAYMOVIESANDTV = 'energygoogleplaymoviesandtv'
-PA_UI_ENERGYGOOGLEPLAYSERVICES = 'energygoogleplayservices'
-PA_UI_ENERGYGOOGLEPLAYSTORE = 'energygoogleplaystore'
-PA_UI_ENERGYGOOGLESEARCH = 'energygooglesearch'
-PA_UI_ENERGYGOOGLESERVICEFRAMEWORK = 'energygoogleserviceframework'
-PA_UI_ENERGYGOOGLETEXTTOSPEECHENGINE = 'energygoogletexttospeechengine'
-PA_UI_ENERGYHELP1 = 'energyhelp1'
-PA_UI_ENERGYHELP2 = 'energyhelp2'
-PA_UI_ENERGYHTMLVIEWER = 'energyhtmlviewer'
-PA_UI_ENERGYINPUTDEVICES = 'energyinputdevices'
-PA_UI_ENERGYINTENTFILTERVERIFICATIONSERVICE = 'energyintentfilterverificationservice'
-PA_UI_ENERGYIPCONTROL = 'energyipcontrol'
-PA_UI_ENERGYIPCONTROLAUX = 'energyipcontrolaux'
-PA_UI_ENERGYKEYCHAIN = 'energykeychain'
-PA_UI_ENERGYLIVEWALLPAPERPICKER = 'energylivewallpaperpicker'
-PA_UI_ENERGYMARKETFEEDBACKAGENT = 'energymarketfeedbackagent'
-PA_UI_ENERGYMEDIAPLAYER = 'energymediaplayer'
-PA_UI_ENERGYMEDIASTORAGE = 'energymediastorage'
-PA_UI_ENERGYMULTILINGUALKEYBOARD = 'energymultilingualkeyboard'
-PA_UI_ENERGYNETFLIX = 'energynetflix'
-PA_UI_ENERGYNETFLIXSETTINGS = 'energynetflixsettings'
-PA_UI_ENERGYPACKAGEACCESSHELPER = 'energypackageaccesshelper'
-PA_UI_ENERGYPACKAGEINSTALLER = 'energypackageinstaller'
-PA_UI_ENERGYPACPROCESSOR = 'energypacprocessor'
-PA_UI_ENERGYPASSTHROUGHINPUT = 'energypassthroughinput'
-PA_UI_ENERGYPLAYMUSIC = 'energyplaymusic'
-PA_UI_ENERGYPRIMEVIDEO = 'energyprimevideo'
-PA_UI_ENERGYPRINTSPOOLER = 'energyprintspooler'
-PA_UI_ENERGYPROXYHANDLER = 'energyproxyhandler'
-PA_UI_ENERGYPUMPKINSERVICE = 'energypumpkinservice'
-PA_UI_ENERGYQRMT = 'energyqrmt'
-PA_UI_ENERGYSECONDSCREENSETUPAUTHBRIDGE = 'energysecondscreensetupauthbridge'
-PA_UI_ENERGYSECUREELEMENTAPPLICATION = 'energysecureelementapplication'
-PA_UI_ENERGYSETTINGSSTORAGE = 'energysettingsstorage'
-PA_UI_ENERGYSETTINGSSUGGESTION = 'energysettingssuggestion'
-PA_UI_ENERGYSETUPWIZARD = 'energysetupwizard'
-PA_UI_ENERGYSETUPCUSTOMIZER = 'energysetupcustomizer'
-PA_UI_ENERGYSHELL = 'energyshell'
-PA_UI_ENERGYSYSTEMTRACING = 'energysystemtracing'
-PA_UI_ENERGYTEXTMAGNIFICATION = 'energytextmagnification'
-PA_UI_ENERGYTV1 = 'energytv1'
-PA_UI_ENERGYTV2 = 'energytv2'
-PA_UI_ENERGYTVSTORAGE1 = 'energytvstorage1'
-PA_UI_ENERGYTVSTORAGE2 = 'energytvstorage2'
-PA_UI_ENERGYUSBUPDATE = 'energyusbupdate'
-PA_UI_ENERGYUSERDICTIONARY = 'energyuserdictionary'
-PA_UI_ENERGYVPNDIALOGS = 'energyvpndialogs'
-PA_UI_ENERGYYOUTUBE = 'energyyoutube'
-
-# Usage Access
-PA_UI_HSUSAGEACCESS2 = 'hsusageaccess2'
-PA_UI_HSUSAGEBLUETOOTH = 'hsusagebluetooth'
-PA_UI_HSUSAGEGOOGLEPLAYSERVICES = 'hsusagegoogleplayservices'
-PA_UI_HSUSAGEGOOGLEPLAYSTORE = 'hsusagegoogleplaystore'
-PA_UI_HSUSAGEGOOGLESEARCH = 'hsusagegooglesearch'
-PA_UI_HSUSAGESHELL = 'hsusageshell'
-# Notification Access
-PA_UI_HSNOTIFICATIONACCESS2 = 'hsnotificationaccess2'
-PA_UI_HSNOTIFICATIONANDROIDTVCORESERVICES = 'hsnotificationandroidtvservices'
-# Allow Display Over Other Apps
-PA_UI_HSDISPLAYOVEROTHERAPPS2 = 'hsdisplayoverotherapps2'
-PA_UI_HSDISPLAYADVANCEDSETTINGS = 'hsdisplayadvancedsettings'
-PA_UI_HSDISPLAYANDROIDACCESSIBILITYSUITE = 'hsdisplayandroidaccessibilitysuite'
-PA_UI_HSDISPLAYANDROIDTVCORESERVICES = 'hsdisplayandroidtvcoreservices'
-PA_UI_HSDISPLAYANDROIDTVHOME = 'hsdisplayandroidhome'
-PA_UI_HSDISPLAYANDROIDTVREMOTESERVICE = 'hsdisplayandroidtvremoteservice'
-PA_UI_HSDISPLAYBRAVIASETTINGS = 'hsdisplaybraviasettings'
-PA_UI_HSDISPLAYCODECNOTIFICATION = 'hsdisplaycodenotification'
-PA_UI_HSDISPLAYCOMREALTEKSERVICEMENU = 'hsdisplaycomrealtekservicemenu'
-PA_UI_HSDISPLAYGOOGLEPLAYSERVICE = 'hsdisplaygoogleplayservice'
-PA_UI_HSDISPLAYGOOGLESEARCH = 'hsdisplaygooglesearch'
-PA_UI_HSDISPLAYMULTILINGUALKEYBOARD = 'hsdisplaymultilingualkeyboard'
-PA_UI_HSDISPLAYPLAYMUSIC = 'hsdisplayplaymusic'
-PA_UI_HSDISPLAYTEXTMAGNIFICATION = 'hsdisplaytextmagnification'
-PA_UI_HSDISPLAYTV = 'hsdisplaytv'
-# Modify System Settings
-PA_UI_HSMODIFYSYSTEMSETTINGS2 = 'hsmodifysystemsettings2'
-PA_UI_HSMODIFYACTIONMENU = 'hsmodifyactionmenu'
-PA_UI_HSMODIFYADVANCEDSETTINGS = 'hsmodifyadvancedsettings'
-PA_UI_HSMODIFYBLUETOOTH = 'hsmodifybluetooth'
-PA_UI_HSMODIFYBRAVIASETTINGS = 'hsmodifybraviasettings'
-PA_UI_HSMODIFYCAMERA = 'hsmodifycamera'
-PA_UI_HSMODIFYGALLERY = 'hsmodifygallery'
-PA_UI_HSMODIFYGOOGLEBACKUPTRANSPORT = 'hsmodifygooglebackuptransport'
-PA_UI_HSMODIFYGOOGLEPLAYSERVICE = 'hsmodifygoogleplayservice'
-PA_UI_HSMODIFYGOOGLEPLAYSTORE = 'hsmodifygoogleplaystore'
-PA_UI_HSMODIFYGOOGLESEARCH = 'hsmodifygooglesearch'
-PA_UI_HSMODIFYGOOGLESERVICESFRAMEWORK = 'hsmodifygoogleservicesframework'
-PA_UI_HSMODIFYMEDIASTORAGE = 'hsmodifymediastorage'
-PA_UI_HSMODIFYPLAYMUSIC = 'hsmodifyplaymusic'
-PA_UI_HSMODIFYQRMT = 'hsmodifyqrmt'
-PA_UI_HSMODIFYSETUPWIZARD = 'hsmodifysetupwizard'
-PA_UI_HSMODIFYSHELL = 'hsmodifyshell'
-PA_UI_HSMODIFYTV = 'hsmodifytv'
-# Directory Access
-PA_UI_HSDIRECTORYACCESS2 = 'hsdirectoryaccess2'
-
-# Security and Restrictions
-PA_UI_HSUNKNOWNSOURCES = 'hsunknownsources'
-PA_UI_HSVERIFYAPPS = 'hsverifyapps'
-# Install Unknown Apps
-PA_UI_HSDEMOAPP = 'hsdemoapp'
-
-
-# Device Preferences
-PA_UI_HSABOUT = 'hsabout'
-PA_UI_HSDATEANDTIME = 'hsdateandtime'
-PA_UI_HSLANGUAGE = 'hslanguage'
-PA_UI_HSKEYBOARD = 'hskeyboard'
-PA_UI_HSDEVICESOUND = 'hsdevicesound'
-PA_UI_HSDEVICESTORAGE = 'hsdevicestorage'
-PA_UI_HSHOMESCREEN = 'hshomescreen'
-PA_UI_HSGOOGLEASSISTANT = 'hsgoogleassistant'
-PA_UI_HSCHROMECASTBUILTIN = 'hschromecastbuiltin'
-PA_UI_HSSCREENSAVER = 'hsscreensaver'
-PA_UI_HSDEVICELOCATION = 'hsdevicelocation'
-PA_UI_HSUSAGEANDDIAGNOSTICS = 'hsusageanddiagnostics'
-PA_UI_HSACCESSIBILITY = 'hsaccessibility'
-PA_UI_HSRESET = 'hsuireset'
-# About
-PA_UI_HSSYSTEMUPDATE = 'hssystemupdate'
-PA_UI_HSDEVICENAME = 'hsdevicename'
-PA_UI_HSRESTART = 'hsrestart'
-PA_UI_HSSTATUS = 'hsstatus'
-PA_UI_HSLEGALINFORMATION = 'hslegalinformation'
-PA_UI_HSMODEL = 'hsmodel'
-PA_UI_HSNETFLIXESN = 'hsnetflixesn'
-PA_UI_HSVERSION = 'hsversion'
-PA_UI_HSANDROID = 'hsandroid'
-PA_UI_HSKERNELVERSION = 'hskernelversion'
-PA_UI_HSBUILD = 'hsbuild'
-# Status
-PA_UI_HSIPADDRESS = 'hsipaddress'
-PA_UI_HSMACADDRESS = 'hsmacaddress'
-PA_UI_HSBLUETOOTHADDRESS = 'hsbluetoothaddress'
-PA_UI_HSSERIALNUMBER = 'hsserialnumber'
-PA_UI_HSUPTIME = 'hsuptime'
-
-# Legal Information
-PA_UI_HSOPENSOURCE = 'hsopensource'
-PA_UI_HSGOOGLELEGAL = 'hsgooglelegal'
-PA_UI_HSSYSTEMWEBVIEWLICENCES = 'hssystemwebviewlicences'
-PA_UI_HSADS = 'hsads'
-# Date And Time
-PA_UI_HSAUTOMATICDATEANDTIME = 'hsautomaticdateandtime'
-PA_UI_HSSETDATE = 'hssetdate'
-PA_UI_HSSETTIME = 'hssettime'
-PA_UI_HSSETTIMEZONE = 'hssettimezone'
-PA_UI_HSUSE24HOURFORMAT = 'hsuse24hourformat'
-# Keyboard
-PA_UI_HSCURRENTKEYBOARD = 'hscurrentkeyboard'
-PA_UI_HSGBOARDSETTINGS = 'hsgboardsettings'
-PA_UI_HSMANAGEKEYBOARD = 'hsmanagekeyboard'
-# Keyboard Settings
-PA_UI_HSGBOARDLANGUAGE = 'hsgboardlanguage'
-PA_UI_HSTERMSOFSERVICE = 'hstermsofservice'
-PA_UI_HSPRIVACYPOLICY = 'hsprivacypolicy'
-PA_UI_HSKEYBOARDOPENSOURCELICENCES = 'hskeyboardopensourcelicences'
-PA_UI_HSSHAREUSAGESTATISTICS = 'hsshareusagestatistics'
-# Gboard Settings
-PA_UI_HSUSESYSTEMLANGUAGES = 'hsusesytemlanguages'
-PA_UI_HSKENGLISH_US = 'hskenglish_us'
-PA_UI_HSKENGLISH_UK = 'hskenglish_uk'
-PA_UI_HSKSIMPLIFIEDCHINESE = 'hsksimplifiedchinese'
-PA_UI_HSKTRADISIONALCHINESE = 'hsktraditionalchinese'
-PA_UI_HSKFRENCH = 'hskfrench'
-PA_UI_HSKGERMAN = 'hskgerman'
-PA_UI_HSKGERMAN_SWITZERLAND = 'hskgerman_switzerland'
-PA_UI_HSKHEBREW = 'hskhebrew'
-PA_UI_HSKHINDI1 = 'hskhindi1'
-PA_UI_HSKHINDI2 = 'hskhindi2'
-PA_UI_HSKITALIAN = 'hskitalian'
-PA_UI_HSKITALIAN_SWITZERLAND = 'hskitalian_switzerland'
-PA_UI_HSKJAPANESE = 'hskjapanese'
-PA_UI_HSKKOREAN = 'hskkorean'
-PA_UI_HSKNORWEGIAN_BOKMAL = 'hsknorwegian_bokmal'
-PA_UI_HSKRUSSIAN = 'hskrussian'
-PA_UI_HSKSPANISH = 'hskspanish'
-PA_UI_HSKVIETNAMESE = 'hskvietnamese'
-
-# Available Virtual Keyboard
-PA_UI_HSKEYBOARDGBOARD = 'hskeyboardgboard'
-PA_UI_HSGOOGLEINDICKEYBOARD = 'hsgoogleindickeyboard'
-PA_UI_HSGOOGLEVOICETYPING = 'hsgooglevoicetyping'
-PA_UI_HSMULTILINGUALKEYBOARD = 'hsmultilingualkeyboard'
-PA_UI_HSVIRTUALREMOTEKEYBOARD = 'hsvirtualremotekeyboard'
-# Device Sound
-PA_UI_HSSYSTEMSOUND = 'hssystemsound'
-# Device Storage
-PA_UI_HSINTERNALSHAREDSTORAGE = 'hsinternalsharedstorge'
-# Internal Shared Storage
-PA_UI_HSINTERNALAPPS = 'hsintnernalaps'
-PA_UI_HSINTERNALPHOTOSANDVIDEOS = 'hsinternalphotosandvideos'
-PA_UI_HSINTERNALAUDIO = 'hsinternalaudio'
-PA_UI_HSINTERNALDOWNLOAD = 'hsinternaldownload'
-PA_UI_HSINTERNALCACHED = 'hsinternalcached'
-PA_UI_HSINTERNALMISC = 'hsinternalmisc'
-PA_UI_HSINTERNALAVAILABLE = 'hsinternalavailable'
-
-# Home Screen
-# Channels
-PA_UI_HSCUSTOMISECHANNELS = 'hscustomisechannels'
-PA_UI_HSENABLEVIDEOPREVIEWS = 'hsenablevideopreviews'
-PA_UI_HSENABLEAUDIOPREVIEWS = 'hsenableaudiopreviews'
-# Apps
-PA_UI_HSREORDERAPPS = 'hsreorderapps'
-PA_UI_HSREORDERGAMES = 'hsreordergames'
-# Open-Source Licences
-PA_UI_HSANDROIDTVHOME = 'hsandroidtvhome'
-PA_UI_HSANDROIDTVCORESERVICES = 'hsandroidtvcoreservices'
-# Customise Channels
-PA_UI_HSPLAYNEXT = 'hsplaynext'
-PA_UI_HSCUSTOMISECHANNELSTV = 'hscustomisechannelstv'
-PA_UI_HSPLAYNEXTL2 = 'hsplaynextl2'
-PA_UI_HSPLAYNEXTTV = 'hsplaynexttv'
-# Google Assistant
-PA_UI_HSACCOUNTS = 'hsaccounts'
-PA_UI_HSSEARCHABLEAPPS = 'hssearchableapps'
-PA_UI_HSSAFESEARCHFILTER = 'hssafesearchfilter'
-PA_UI_HSBLOCKOFFENSIVEWORDS = 'hsblockoffensivewords'
-PA_UI_HSTEMPERATUREUNIT = 'hstemperatureunit'
-PA_UI_HSGOOGLEOPENSOURCELICENCES = 'hsgooleopensourcelicences'
-# Google Assistant
-PA_UI_HSSEARCHABLEAPPSGOOGLEPLAYGAMES = 'hssearchableappsgoogleplaygames'
-PA_UI_HSSEARCHABLEAPPSTV = 'hssearchableappstv'
-# Chromecast Built-in
-PA_UI_HSCHROMEOPENSOURCELICENSE = 'hschromeopensourcelicense'
-PA_UI_HSVERSIONNUMBERS = 'hsversionnumbers'
-# Screen Saver
-PA_UI_HSSCREENSAVERL2 = 'hsscreensaverl2'
-PA_UI_HSWHENTOSTART = 'hswhentostart'
-PA_UI_HSPUTDEVICETOSLEEP = 'hsputdevicetosleep'
-PA_UI_HSSTARTNOW = 'hsstartnow'
-# Start Screen Saver
-PA_UI_HSSTARTSCREENSAVER = 'hsstartscreensaver'
-# Location
-PA_UI_HSLOCATIONSTATUS = 'hslocationstatus'
-# Usage and Diafnostics
-PA_UI_HSUSAGEANDDIAGNOSTICSL2 = 'hsusageanddiagnosticsl2'
-PA_UI_HSACCESSIBILITYCAPTIONS = 'hsaccessibilitycaptions'
-PA_UI_HSACCESSIBILITYAUDIODESCRIPTION = 'hsaccessibilityaudiodescription'
-PA_UI_HSACCESSIBILITYHIGHCONTRASTTEXT = 'hsaccessibilityhighcontrasttext'
-PA_UI_HSACCESSIBILITYTEXTTOSPEECH = 'hsaccessibilitytexttospeech'
-PA_UI_HSACCESSIBILITYSHORTCUT = 'hsaccessibilityshortcut'
-PA_UI_HSACCESSIBILITYTALKBACK = 'hsaccessibilitytalkback'
-PA_UI_HSACCESSIBILITYSWITCHACCESS = 'hsaccessibilityswitchaccess'
-PA_UI_HSACCESSIBILITYTEXTMAGNIFICATION = 'hsaccessibilitytextmagnification'
-PA_UI_HSACCESSIBILITYSCREENREADER = 'hsaccessibilityscreenreader'
-# Captions
-PA_UI_HSCAPTIONSDISPLAY = 'hscaptionsdisplay'
-# Display Options
-PA_UI_HSCAPTIONSLANGUAGE = 'hscaptionslanguage'
-PA_UI_HSCAPTIONSTEXTSIZE = 'hscaptionstextsize'
-# Caption Style
-PA_UI_HSCAPTIONSWHITEONBLACK = 'hscaptionswhiteonblack'
-PA_UI_HSCAPTIONSBLACKONWHITE = 'hscaptionsblackonwhite'
-PA_UI_HSCAPTIONSYELLOWONBLACK = 'hscaptionsyellowonblack'
-PA_UI_HSCAPTIONSYELLOWONBLUE = 'hscaptionsyellowonblue'
-PA_UI_HSCAPTIONSCUSTOMIZED = 'hscaptionscustomized'
-# Caption Customised
-PA_UI_HSFONTFAMILY = 'hsfontfamily'
-PA_UI_HSTEXTFLASHING = 'hstextflashing'
-PA_UI_HSTEXTCOLOUR = 'hstextcolour'
-PA_UI_HSTEXTOPACITY = 'hstextopacity'
-PA_UI_HSEDGETYPE = 'hsedgetype'
-PA_UI_HSEDGECOLOUR = 'hsedgecolour'
-PA_UI_HSSHOWBACKGROUND = 'hsshowbackground'
-PA_UI_HSBACKGROUNDFLASHING = 'hsbackgroundflashing'
-PA_UI_HSBACKGROUNDCOLOUR = 'hsbackgroundcolour'
-PA_UI_HSBACKGROUNDOPACITY = 'hsbackgroundopacity'
-PA_UI_HSSHOWWINDOW = 'hsshowwindow'
-PA_UI_HSWINDOWCOLOUR = 'hswindowcolour'
-PA_UI_HSWINDOWOPACITY = 'hswindowopacity'
-# Audio Setup
-PA_UI_HSAUDIODESCRIPTION = 'hsaudiodescription'
-PA_UI_HSMIXINGLEVEL = 'hsmixinglevel'
-PA_UI_HSAUDIOTYPE = 'hsaudiotype'
-PA_UI_HSAPRIMARYPREFEREDLANGUAGE = 'hsaprimarypreferedlanguage'
-PA_UI_HSASECONDARYPREFEREDLANGUAGE = 'hsasecondarypreferedlanguage'
-# Text to Speech Output
-PA_UI_HSGOOGLETEXTTOSPEECHENGINE = 'hsgoogletexttospeechengine'
-PA_UI_HSENGINECONFIGURATION = 'hsengineconfiguration'
-PA_UI_HSSPEECHRATE = 'hsspeechrate'
-PA_UI_HSLISTENTOANEXAMPLE = 'hslistentoanexample'
-PA_UI_HSDEFAULTLANGUAGESTATUS = 'hsdefaultlanguagestatus'
-# Engine Configuration
-PA_UI_HSGOOGLETEXTTOSPEECHLANGUAGE = 'hsgoogletexttospeechlanguage'
-PA_UI_HSSETTINGSFORGOOGLETEXTTOSPEECHENGINE = 'hssettingsforgoogletexttospeechengine'
-PA_UI_HSINSTALLVOICEDATA = 'hsinstallvoicedata'
-# Accessibility Shortcut
-PA_UI_HSENABLEACCESSIBILITYSHORTCUT = 'hsenableaccessibilityshortcut'
-PA_UI_HSSHORTCUTSERVICE = 'hsshortcutservice'
-# Talkback
-PA_UI_HSTALKBACKENABLE = 'hstalkbackenable'
-PA_UI_HSTALKBACKCONFIGURATION = 'hstalkbackconfiguration'
-# Switch Access
-PA_UI_HSSWITCHACCESSENABLE = 'hsswitchaccessenable'
-PA_UI_HSSWITCHACCESSCONFIGURATION = 'hsswitchaccessconfiguration'
-# Text Magnification
-PA_UI_HSTEXTMAGNIFICATIONENABLE = 'hstextmagnificationenable'
-PA_UI_HSTEXTMAGNIFICATIONCONFIGURATION = 'hstextmagnificationconfiguration'
-PA_UI_HSTEXTMAGNIFICATIONCOLOUR = 'hstextmagnificationcolour'
-PA_UI_HSTEXTMAGNIFICATIONDURATION = 'hstextmagnificationduration'
-# Screen Reader        
-PA_UI_HSSCREENREADERENABLE = 'hsscreenreaderenable'
-PA_UI_HSSCREENREADERCONFIGURATION = 'hsscreenreaderconfiguration'
-
-# Bravia Settings
-PA_UI_HSCHANNELSETUP = 'hschannelsetup'
-PA_UI_HSPICTURE = 'hspicture'
-PA_UI_HSSOUND = 'hssound'
-PA_UI_HSSCREEN = 'hsscreen'
-PA_UI_HSREMOTESTART = 'hsremotestart'
-PA_UI_HSBLUETOOTH = 'hsbluetooth'
-PA_UI_HSVOICEREMOTECONTROL = 'hsvoiceremotecontrol'
-PA_UI_HSSPEAKERS = 'hsspeakers'
-PA_UI_HSTVPOSITION = 'hstvposition'
-PA_UI_HSDIGITALAUDIOOUT = 'hsdigitalaudioout'
-PA_UI_HSEXTERNALINPUTS = 'hsexternalinputs'
-PA_UI_HSPARENTALCONTROLS = 'hsparentalcontrols'
-PA_UI_HSECO = 'hseco'
-PA_UI_HSIPCONTROL = 'hsipcontrol'
-PA_UI_HSCUSTOMERSUPPORT = 'hscustomersupport'
-
-# Channel Setup
-PA_UI_HSANALOGSETUP = 'hsanalogsetup'
-PA_UI_HSDIGITALSETUP = 'hsdigitalsetup'
-# Analog Setup
-PA_UI_HSANALOGAUTOTUNING = 'hsanalogautotuning'
-PA_UI_HSMANUALPROGRAMPRESET = 'hsmanualprogrampreset'
-PA_UI_HSCHANNELLISTEDIT = 'hschannellistedit'
-PA_UI_HSPROGRAMMELABELS = 'hsprogrammelabels'
-# Digital Setup
-PA_UI_HSDIGITALTUNING = 'hsdigitaltuning'
-PA_UI_HSSUBTITLESETUP = 'hssubtitlesetup'
-PA_UI_HSAUDIOSETUP = 'hsaudiosetup'
-PA_UI_HSTECHNICALSETUP = 'hstechnicalsetup'
-# Digital Tuning
-PA_UI_HSDIGITALAUTOTUNING = 'hsdigitalautotuning'
-PA_UI_HSPROGRAMLISTEDIT = 'hsprogramlistedit'
-PA_UI_HSMANUALTUNING = 'hsmanualtuning'
-PA_UI_HSLCN = 'hslcn'
-PA_UI_HSPOSTALCODE = 'hspostalcode'
-PA_UI_HSPOSTALCODE2 = 'hspostalcode2'
-PA_UI_HSSCANTYPE = 'hsscantype'
-PA_UI_HSCHANNELNUMBER = 'hschannelnumber'
-PA_UI_HSFREQUENCY = 'hsuifrequency'
-PA_UI_HSSCAN = 'hsscan'
-PA_UI_HSSUBTITLE = 'hssubtitle'
-PA_UI_HSSPRIMARYPREFEREDLANGUAGE = 'hssprimarypreferedlanguage'
-PA_UI_HSSSECONDARYPREFEREDLANGUAGE = 'hsssecondarypreferedlanguage'
-# Audio Setup
-PA_UI_HSDAUDIODESCRIPTION = 'hsdaudiodescription'
-PA_UI_HSDMIXINGLEVEL = 'hsdmixinglevel'
-PA_UI_HSDAUDIOTYPE = 'hsdaudiotype'
-PA_UI_HSDAPRIMARYPREFEREDLANGUAGE = 'hsdaprimarypreferedlanguage'
-PA_UI_HSDASECONDARYPREFEREDLANGUAGE = 'hsdasecondarypreferedlanguage'
-# Technical Setup
-PA_UI_HSAUTOMATICSOFTWAREDOWNLOAD = 'hsautomaticsoftwaredownload'
-PA_UI_HSEPGLANGUAGE = 'hsepglanguage'
-PA_UI_HSACTIVESTANBYUPDATE = 'hsactivestanbyupdate'
-
-# Picture
-PA_UI_HSPICTUREMODE = 'hspicturemode'
-PA_UI_HSBRIGHTNESS = 'hsbrightness'
-PA_UI_HSCOLOUR = 'hscolour'
-PA_UI_HSPICTUREADVANCED = 'hspictureadvanced'
-# Advanced Picture
-# Brightness
-PA_UI_HSBRIGHTNESSL2 = 'hsbrightnessl2'
-PA_UI_HSBRIGHTNESSL3 = 'hsbrightnessl3'
-PA_UI_HSCONTRAST = 'hscontrast'
-PA_UI_HSGAMMA = 'hsgamma'
-PA_UI_HSBLACKLEVEL = 'hsblacklevel'
-PA_UI_HSBLACKADJUST = 'hsblackadjust'
-PA_UI_HSADVCONTRASTENHANCER = 'hsadvcontrastenhancer'
-# Colour
-PA_UI_HSCOLOURL2 = 'hscolourl2'
-PA_UI_HSCOLOURL3 = 'hscolourl3'
-PA_UI_HSHUE = 'hshue'
-PA_UI_HSCOLOURTEMPERATURE = 'hscolourtemperature'
-PA_UI_HSADVCOLOURTEMPERATURE = 'hsadvcolourtemperature'
-PA_UI_HSLIVECOLOUR = 'hslivecolour'
-# Adv colour temperature
-PA_UI_HSCRESET = 'hscreset'
-PA_UI_HSBASIC = 'hsbasic'
-PA_UI_HSRGAIN = 'hsrgain'
-PA_UI_HSGGAIN = 'hsggain'
-PA_UI_HSBGAIN = 'hsbgain'
-PA_UI_HSRBIAS = 'hsrbias'
-PA_UI_HSGBIAS = 'hsgbias'
-PA_UI_HSBBIAS = 'hsbbias'
-PA_UI_HSMULTIPOINT = 'hsmultipoint'
-PA_UI_HSCOLOURGAMMAADJUSTMENTPOINT = 'hscolourgammaadjustmentpoint'
-PA_UI_HSROFFSET = 'hsroofset'
-PA_UI_HSGOFFSET = 'hsgoofset'
-PA_UI_HSBOFFSET = 'hsboofset'
-# Clarity
-PA_UI_HSCLARITY = 'hsclarity'
-PA_UI_HSSHARPNESS = 'hssharpness'
-PA_UI_HSREALITYCREATION = 'hsrealitycreation'
-PA_UI_HSRESOLUTION = 'hsresolution'
-PA_UI_HSRANDOMNOISEREDUCTION = 'hsrandomnoisereduction'
-PA_UI_HSDIGITALNOISEREDUCTION = 'hsdigitalnoisereduction'
-PA_UI_HSMOTION = 'hsmotion'
-PA_UI_HSMOTIONFLOW = 'hsmotionflow'
-PA_UI_HSSMOOTHNESS = 'hssmoothness'
-PA_UI_HSCLEARNESS = 'hsclearness'
-PA_UI_HSFILMMODE = 'hsfilmmode'
-PA_UI_HSVIDEOOPTION = 'hsvideooption'
-PA_UI_HSHDMIVIDEORANGE = 'hshdmivideorange'
-PA_UI_HSPRESET = 'hspreset'
-PA_UI_HSPRESETL2 = 'hspresetl2'
-
-# Sound
-PA_UI_HSDIALOGUEENHANCER = 'hsdialogueenhancer'
-PA_UI_HSSURROUND = 'hssurround'
-PA_UI_HSSOUNDADVANCED = 'hssoundadvanced'
-PA_UI_HSCOMMON = 'hscommon'
-PA_UI_HSAUTOVOLUME = 'hsautovolume'
-PA_UI_HSBALANCE = 'hsbalance'
-PA_UI_HSDIGITALAUDIOOUTVOLUME = 'hsdigitalaudiovolume'
-PA_UI_HSINPUTRELATED = 'hsinputrelated'
-PA_UI_HSVOLUMEOFFSET = 'hsvolumeoffset'
-PA_UI_HSDYNAMICRANGE = 'hsdynamicrange'
-PA_UI_HSSRESET = 'hssreset'
-PA_UI_HSSRESETL2 = 'hssresetl2'
-
-# Screen
-PA_UI_HSWIDEMODE = 'hswidemode'
-PA_UI_HS43DEFAULT = 'hs43default'
-
-# External Input
-PA_UI_HSMANAGEINPUTS = 'hsmanageinputs'
-PA_UI_HSHDMICECSETTINGS = 'hshdmicecsettings'
-PA_UI_HSCUSTOMISETVKEY = 'hscustomisetvkey'
-PA_UI_HSHDMISIGNALFORMAT = 'hshdmisignalformat'
-# Manage Inputs
-# analogue
-PA_UI_HSANALOGUE = 'hsuianalogue'
-PA_UI_HSANALOGUEDISPLAY = 'hsanaloguedisplay'
-# digital
-PA_UI_HSDIGITAL = 'hsuidigital'
-PA_UI_HSDIGITALDISPLAY = 'hsdigitaldisplay'
-# hdmi1
-PA_UI_HSHDMI1 = 'hsuihdmi1'
-PA_UI_HSHDMI1DISPLAY = 'hshdmi1display'
-PA_UI_HSHDMI1LABEL = 'hshdmi1label'
-# hdmi2
-PA_UI_HSHDMI2 = 'hsuihdmi2'
-PA_UI_HSHDMI2DISPLAY = 'hshdmi2display'
-PA_UI_HSHDMI2LABEL = 'hshdmi2label'
-# hdmi3
-PA_UI_HSHDMI3 = 'hsuihdmi3'
-PA_UI_HSHDMI3DISPLAY = 'hshdmi3display'
-PA_UI_HSHDMI3LABEL = 'hshdmi3label'
-# av
-PA_UI_HSAV = 'hsuiav'
-PA_UI_HSAVDISPLAY = 'hsavdisplay'
-PA_UI_HSAVLABEL = 'hsavlabel'
-# Hdmi CEC Settings
-PA_UI_HSCEC = 'hscec'
-PA_UI_HSAUTODEVICESOFF = 'hsautodeviceoff'
-PA_UI_HSAUTOTVON = 'hsautotvon'
-# Hdmi Signal Format
-PA_UI_HSHSFHDMI1 = 'hshsfhdmi1'
-PA_UI_HSHSFHDMI2 = 'hshsfhdmi2'
-PA_UI_HSHSFHDMI3 = 'hshsfhdmi3'
-
-# Parental Control
-PA_UI_HSPARENTALONOFF = 'hsparentalonoff'
-PA_UI_HSEXTERNALINPUTLOCK = 'hsexternalinputlock'
-PA_UI_HSCHANNELSBLOCKED = 'hschannelsblocked'
-PA_UI_HSPROGRAMMERESTRICTIONS = 'hsprogrammerestrictions'
-PA_UI_HSCHANGEPIN = 'hschangepin'
-# External Input lock
-PA_UI_HSBLOCKALL = 'hsblockall'
-PA_UI_HSANALOGUELOCK = 'hsanaloguelock'
-PA_UI_HSDIGITALLOCK = 'hsdigitallock'
-PA_UI_HSHDMI1LOCK = 'hshdmi1lock'
-PA_UI_HSHDMI2LOCK = 'hshdmi2lock'
-PA_UI_HSHDMI3LOCK = 'hshdmi3lock'
-PA_UI_HSAVLOCK = 'hsavlock'
-# Programme Restriction
-PA_UI_HSNONE = 'hsuinone'
-PA_UI_HSPR3 = 'hspr3'
-PA_UI_HSPR4 = 'hspr4'
-PA_UI_HSPR5 = 'hspr5'
-PA_UI_HSPR6 = 'hspr6'
-PA_UI_HSPR7 = 'hspr7'
-PA_UI_HSPR8 = 'hspr8'
-PA_UI_HSPR9 = 'hspr9'
-PA_UI_HSPR10 = 'hspr10'
-PA_UI_HSPR11 = 'hspr11'
-PA_UI_HSPR12 = 'hspr12'
-PA_UI_HSPR13 = 'hspr13'
-PA_UI_HSPR14 = 'hspr14'
-PA_UI_HSPR15 = 'hspr15'
-PA_UI_HSPR16 = 'hspr16'
-PA_UI_HSPR17 = 'hspr17'
-PA_UI_HSPR18 = 'hspr18'
-
-# Thailand Programme Restriction
-PA_UI_HSPR19 = 'hspr19'
-# Singapore Programme Restriction
-PA_UI_HSG = 'hsg'
-PA_UI_HSPG = 'hspg'
-PA_UI_HSPG13 = 'hspg13'
-PA_UI_HSNC16 = 'hsnc16'
-PA_UI_HSM18 = 'hsm18'
-PA_UI_HSR21 = 'hsr21'
-
-# Eco
-PA_UI_HSPOWERSAVING = 'hspowersaving'
-PA_UI_HSIDLETVSTANDBY = 'hsidletvstandby'
-PA_UI_HSAUTOSHUTOFF = 'hsautoshutoff'
-
-# IP Control
-PA_UI_HSCONTROLREMOTELY = 'hscontrolremotely'
-PA_UI_HSAUTHENTICATION = 'hsauthentication'
-PA_UI_HSPRESHAREDKEY = 'hspresharedkey'
-
-# Customer Support
-PA_UI_HSCONTACTANDSUPPORT = 'hscontactandsupport'
-PA_UI_HSSIGNALDIAGNOSTICS = 'hssignaldiagnostics'
-PA_UI_HSHELPGUIDE = 'hshelpguide'
-PA_UI_HSNOTICESANDLICENCES = 'hsnoticesandlicences'
-# Contact and Support
-PA_UI_HSCONTACTANDSUPPORTVIEW = 'hscontactandsupportview'
-# Signal Diagnostics
-PA_UI_HSSIGNALCHANNEL = 'hssignalchannel'
-PA_UI_HSSIGNALNETWORK = 'hssignalnetwork'
-PA_UI_HSSIGNALSTRENGTH = 'hssignalstrength'
-PA_UI_HSSIGNALQUALITY = 'hssignalquality'
-PA_UI_HSPHYSICALCHANNEL = 'hsphysicalchannel'
-PA_UI_HSSIGNALFREQUENCY = 'hssignalfrequency'
-PA_UI_HSMODULATION = 'hsmodulation'
-PA_UI_HSPREBCH = 'hsprebch'
-PA_UI_HSUEC = 'hsuec'
-PA_UI_HSSNR = 'hssnr'
-# Inside Settings from HOME        Inside Settings from HOME        Inside Settings from HOME        Inside Settings from HOME        Inside Settings from HOME        
-
-# Inside Settings from DTV        Inside Settings from DTV        Inside Settings from DTV        Inside Settings from DTV        Inside Settings from DTV
-PA_UI_FINISHSETTINGTV = 'finishsettingtv'
-PA_UI_TAKEBUGREPORT = 'takebugreport'
-PA_UI_NETWORKANDINTERNET = 'networkandinternet'
-PA_UI_ACCOUNTSANDSIGNIN = 'accountsandsignin'
-PA_UI_SAPPS = 'sapps'
-PA_UI_DEVICEPREFERENCES = 'devicepreferences'
-PA_UI_REMOTESANDACCESSORIES = 'remoteandaccessories'
-PA_UI_BRAVIASETTINGS = 'braviasettings'
-
-# Network and Internet
-PA_UI_WIFI = 'wifi'
-PA_UI_NETWORK1 = 'network1'
-PA_UI_NETWORK2 = 'network2'
-PA_UI_NETWORK3 = 'network3'
-PA_UI_SEEALL = 'seeall'
-PA_UI_ADDNEWNETWORK = 'addnewnetwork'
-PA_UI_SCANNINGALWAYSAVAILABLE = 'scanningalwaysavailable'
-PA_UI_NOTCONNECTED = 'notconnected'
-PA_UI_PROXYSETTINGS = 'proxysettings'
-PA_UI_IPSETTINGS = 'ipsettings'
-
-# Inside Apps
-PA_UI_APPS1 = 'apps1'
-PA_UI_APPS2 = 'apps2'
-PA_UI_APPS3 = 'apps3'
-PA_UI_APPS4 = 'apps4'
-PA_UI_APPS5 = 'apps5'
-PA_UI_SEEALLAPPS = 'seeallmaps'
-PA_UI_APPSPERMISSION = 'appspermission'
-PA_UI_SPECIALAPPACCESS = 'specialappaccess'
-PA_UI_SECURITYANDRESTRICTIONS = 'securityandrestrictions'
-
-# App Permissions
-PA_UI_BODYSENSORS = 'bodysensors'
-PA_UI_CALENDAR = 'calendar'
-PA_UI_CALLLOGS = 'calllogs'
-PA_UI_CAMERA = 'camera'
-PA_UI_CONTACTS = 'contacts'
-PA_UI_LOCATION = 'locations'
-PA_UI_MICROPHONE = 'microphone'
-PA_UI_SMS = 'sms'
-PA_UI_STORAGE = 'storage'
-PA_UI_TELEPHONE = 'telephone'
-PA_UI_ADDITIONALPERMISSION = 'additionalpermission'
-
-# Calendar Permissions
-PA_UI_CALENDARSHOWSYSTEMAPPS = 'calendarshowsystemapps'
-PA_UI_CALENDARGOOGLECALENDARSYNC = 'calendargooglecalendarsync'
-PA_UI_CALENDARGOOGLEPLAYSERVICES = 'calendargoogleplayservices'
-PA_UI_CALENDARGOOGLESEARCH = 'calendargooglesearch'
-# Call Log Permissions
-PA_UI_CALLLOGSSHOWSYSTEMAPPS = 'calllogsshowsystmeapps'
-PA_UI_CALLLOGSGOOGLEPLAYSERVICES = 'calllogsgoogleplayservices'
-# Camera Permissions
-PA_UI_CAMERAL2 = 'cameral2'
-PA_UI_CAMERAGALLERY = 'cameragallery'
-PA_UI_CAMERASHOWSYSTEMAPPS = 'camerashowsystemapps'
-PA_UI_CAMERAL3 = 'cameral3'
-PA_UI_CAMERAGOOGLEPLAYSERVICES = 'cameragoogleplayservices'
-PA_UI_CAMERAGOOGLESEARCH = 'cameragooglesearch'
-# Contacts Permissions
-PA_UI_CONTACTSGALLERY = 'contactsgallery'
-PA_UI_CONTACTSGOOGLEPLAYGAMES = 'contactsgoogleplaygames'
-PA_UI_CONTACTSGOOGLEPLAYSTORE = 'contactsgoogleplaystore'
-PA_UI_CONTACTSNETFLIX = 'contactsnetflix'
-PA_UI_CONTACTSSHOWSYSTEMAPPS = 'contactsshowsytemapps'
-PA_UI_CONTACTSBUGREPORTSENDER = 'contactsbugreportsender'
-PA_UI_CONTACTSCALENDARSTORAGE = 'contactscalendarstorage'
-PA_UI_CONTACTSGBOARD = 'contactsgboard'
-PA_UI_CONTACTSGOOGLEBACKUPTRANSPORT = 'contactsgooglebackuptransport'
-PA_UI_CONTACTSGOOGLECONTACTSSYNC = 'contactsgooglecontactssync'
-PA_UI_CONTACTSGOOGLEINDICKEYBOARD = 'contactsgoogleinidckeyboard'
-PA_UI_CONTACTSGOOGLEPLAYSERVICE = 'contactsgoogleplayservice'
-PA_UI_CONTACTSGOOGLESEARCH = 'contactsgooglesearch'
-PA_UI_CONTACTSGOOGLESERVICEFRAMEWORK = 'contactsgoogleserviceframework'
-PA_UI_CONTACTSPLAYMUSIC = 'contactsplaymusic'
-# Location Permissions
-PA_UI_LOCATIONANDROIDTVREMOTE = 'locationandroidremote'
-PA_UI_LOCATIONSERVICE = 'locationservice'
-PA_UI_LOCATIONEULA1 = 'locationeula1'
-PA_UI_LOCATIONEULA2 = 'locationeula2'
-PA_UI_LOCATIONEULA3 = 'locationeula3'
-PA_UI_LOCATIONGALLERY = 'locationgallery'
-PA_UI_LOCATIONGOOGLEPLAYSTORE = 'locationgoogleplaystore'
-PA_UI_LOCATIONHELP1 = 'locationhelp1'
-PA_UI_LOCATIONHELP2 = 'locationhelp2'
-PA_UI_LOCATIONSHOWSYSTEMAPPS = 'locationshowsystemapps'
-PA_UI_LOCATIONANDDROIDACCESSIBILITY = 'locationandroidaccessibility'
-PA_UI_LOCATIONCAMERA = 'locationcamera'
-PA_UI_LOCATIONGOOGLEPLAYMOVIESANDTV = 'locationgoogleplaymoviesandtv'
-PA_UI_LOCATIONGOOGLEPLAYSERVICES = 'locationgoogleplayservices'
-PA_UI_LOCATIONGOOGLESEARCH = 'locationgooglesearch'
-PA_UI_LOCATIONPLAYMUSIC = 'locationplaymusic'
-PA_UI_LOCATIONSETUPWIZARD = 'locationsetupwizard'
-# Microphone Permissions
-PA_UI_MICROPHONECAMERA = 'microphonecamera'
-PA_UI_MICROPHONEEULA1 = 'microphoneeula1'
-PA_UI_MICROPHONEEULA2 = 'microphoneeula2'
-PA_UI_MICROPHONEEULA3 = 'microphoneeula3'
-PA_UI_MICROPHONEGALLERY = 'microphonegallery'
-PA_UI_MICROPHONEGOOGLEPLAYSTORE = 'microphonegoogleplaystore'
-PA_UI_MICROPHONEHELP1 = 'microphonehelp1'
-PA_UI_MICROPHONEHELP2 = 'microphonehelp2'
-PA_UI_MICROPHONEYOUTUBE = 'microphoneyoutube'
-PA_UI_MICROPHONESHOWSYSTEMAPPS = 'microphoneshowsystemapps'
-PA_UI_MICROPHONEANDROIDACCESSIBILITY = 'microphoneandroidaccessibility'
-PA_UI_MICROPHONECAMERAL2 = 'microphonecameral2'
-PA_UI_MICROPHONEGBOARD = 'microphonegboard'
-PA_UI_MICROPHONEGOOGLEPLAYSERVICE = 'microphonegoogleplayservice'
-PA_UI_MICROPHONEGOOGLESEARCH = 'microphonegooglesearch'
-PA_UI_MICROPHONEPLAYMUSIC = 'microphoneplaymusic'
-# SMS Permissions
-PA_UI_SMSGOOGLEPLAYSTORE = 'smsgoogleplaystore'
-PA_UI_SMSSHOWSYSTEMAPPS = 'smsshowsystemapps'
-PA_UI_SMSGOOGLEPLAYSERVICES = 'smsgoogleplayservices'
-# Storage Permissions
-PA_UI_STORAGEANDROIDTVREMOTE = 'storageandroidtvremote'
-PA_UI_STORAGECAMERAL2 = 'storagecameral2'
-PA_UI_STORAGEEULA1 = 'storageeula1'
-PA_UI_STORAGEEULA2 = 'storageeula2'
-PA_UI_STORAGEEULA3 = 'storageeula3'
-PA_UI_STORAGEGALLERY = 'storagegallery'
-PA_UI_STORAGEHELP1 = 'storagehelp1'
-PA_UI_STORAGEHELP2 = 'storagehelp2'
-PA_UI_STORAGENETFLIX = 'storagenetflix'
-PA_UI_STORAGEQRMT = 'storageqrmt'
-PA_UI_STORAGESHOWSYSTEMAPPS = 'storageshowsystemapps'
-PA_UI_STORAGEBUGREPORTSENDER = 'storagebugreportsender'
-PA_UI_STORAGECALENDARSTORAGE = 'storagecalendarstorage'
-PA_UI_STORAGECAMERAL3 = 'storagecameral3'
-PA_UI_STORAGEDEMOAPP = 'storagestoragedemoapp'
-PA_UI_STORAGEGBOARD = 'storagegboard'
-PA_UI_STORAGEGOOGLEINDICKEYBOARD = 'storagegoogleindickeyboard'
-PA_UI_STORAGEGOOGLEPLAYSERVICES = 'storagegoogleplayservices'
-PA_UI_STORAGEGOOGLESEARCH = 'storagegooglesearch'
-PA_UI_STORAGEHTMLVIEWER = 'storagehtmlviewer'
-PA_UI_STORAGEMEDIAPLAYER = 'storagemediaplayer'
-PA_UI_STORAGEPLAYMUSIC = 'storageplaymusic'
-PA_UI_STORAGEPRIMEVIDEO = 'storageprimevideo'
-PA_UI_STORAGESETUPWIZARD = 'storagesetupwizard'
-PA_UI_STORAGETVSTORAGE = 'storagetvstorage'
-# Telephone Permissions
-PA_UI_TELEPHONEEULA1 = 'telephoneeula1'
-PA_UI_TELEPHONEEULA2 = 'telephoneeula2'
-PA_UI_TELEPHONEEULA3 = 'telephoneeula3'
-PA_UI_TELEPHONEGOOGLEPLAYSTORE = 'telephonegoogleplaystore'
-PA_UI_TELEPHONEHELP1 = 'telephonehelp1'
-PA_UI_TELEPHONEHELP2 = 'telephonehelp2'
-PA_UI_TELEPHONEQRMT = 'telephoneqrmt'
-PA_UI_TELEPHONESHOWSYSTEMAPPS = 'telephoneshowsystemapps'
-PA_UI_TELEPHONEANDROIDACCESSIBILITY = 'telephoneandroidaccessibility'
-PA_UI_TELEPHONEGOOGLEPLAYSERVICES = 'telephonegoogleplayservices'
-PA_UI_TELEPHONEGOOGLESEARCH = 'telephonegooglesearch'
-PA_UI_TELEPHONEGOOGLESERVICESFRAMEWORK = 'telephonegoogleservicesframework'
-PA_UI_TELEPHONESETTINGSSUGGESTIONS = 'telephonesettingssuggestions'
-# Additional Permissions
-PA_UI_READALLTVLISTINGS = 'readalltvlistings'
-PA_UI_READINSTANTMESSAGES = 'readinstantmessages'
-PA_UI_WRITEINSTANTMESSAGES = 'writeinstantmessages'
-# Read Instant messages permission
-PA_UI_READSHOWSYSTEMAPPS = 'readshowsystemapps'
-PA_UI_READGOOGLESERVICESFRAMEWORK = 'readgoogleservicesframework'
-# Write Instant messages permission
-PA_UI_WRITESHOWSYSTEMAPPS = 'writeshowsystemapps'
-PA_UI_WRITEGOOGLESERVICESFRAMEWORK = 'writegoogleservicesframework'
-
-# Special App Access
-PA_UI_ENERGYOPTIMISATION = 'energyoptimisation'
-PA_UI_USAGEACCESS = 'usageaccess'
-PA_UI_NOTIFICATIONACCESS = 'notificationaccess'
-PA_UI_DISPLAYOVEROTHERAPPS = 'displayoverotherapps'
-PA_UI_MODIFYSYSTEMSETTINGS = 'modifysystemsettings'
-PA_UI_DIRECTORYACCESS = 'directoryaccess'
-
-# Energy Optimisation
-
-# Usage Access
-PA_UI_USAGEACCESS2 = 'usageaccess2'
-PA_UI_USAGEBLUETOOTH = 'usagebluetooth'
-PA_UI_USAGEGOOGLEPLAYSERVICES = 'usagegoogleplayservices'
-PA_UI_USAGEGOOGLEPLAYSTORE = 'usagegoogleplaystore'
-PA_UI_USAGEGOOGLESEARCH = 'usagegooglesearch'
-PA_UI_USAGESHELL = 'usageshell'
-# Notification Access
-PA_UI_NOTIFICATIONACCESS2 = 'notificationaccess2'
-PA_UI_NOTIFICATIONANDROIDTVCORESERVICES = 'notificationandroidtvservices'
-# Allow Display Over Other Apps
-PA_UI_DISPLAYOVEROTHERAPPS2 = 'displayoverotherapps2'
-PA_UI_DISPLAYADVANCEDSETTINGS = 'displayadvancedsettings'
-PA_UI_DISPLAYANDROIDACCESSIBILITYSUITE = 'displayandroidaccessibilitysuite'
-PA_UI_DISPLAYANDROIDTVCORESERVICES = 'displayandroidtvcoreservices'
-PA_UI_DISPLAYANDROIDTVHOME = 'displayandroidhome'
-PA_UI_DISPLAYANDROIDTVREMOTESERVICE = 'displayandroidtvremoteservice'
-PA_UI_DISPLAYBRAVIASETTINGS = 'displaybraviasettings'
-PA_UI_DISPLAYCODECNOTIFICATION = 'displaycodenotification'
-PA_UI_DISPLAYCOMREALTEKSERVICEMENU = 'displaycomrealtekservicemenu'
-PA_UI_DISPLAYGOOGLEPLAYSERVICE = 'displaygoogleplayservice'
-PA_UI_DISPLAYGOOGLESEARCH = 'displaygooglesearch'
-PA_UI_DISPLAYMULTILINGUALKEYBOARD = 'displaymultilingualkeyboard'
-PA_UI_DISPLAYPLAYMUSIC = 'displayplaymusic'
-PA_UI_DISPLAYTEXTMAGNIFICATION = 'displaytextmagnification'
-PA_UI_DISPLAYTV = 'displaytv'
-# Modify System Settings
-PA_UI_MODIFYSYSTEMSETTINGS2 = 'modifysystemsettings2'
-PA_UI_MODIFYACTIONMENU = 'modifyactionmenu'
-PA_UI_MODIFYADVANCEDSETTINGS = 'modifyadvancedsettings'
-PA_UI_MODIFYBLUETOOTH = 'modifybluetooth'
-PA_UI_MODIFYBRAVIASETTINGS = 'modifybraviasettings'
-PA_UI_MODIFYCAMERA = 'modifycamera'
-PA_UI_MODIFYGALLERY = 'modifygallery'
-PA_UI_MODIFYGOOGLEBACKUPTRANSPORT = 'modifygooglebackuptransport'
-PA_UI_MODIFYGOOGLEPLAYSERVICE = 'modifygoogleplayservice'
-PA_UI_MODIFYGOOGLEPLAYSTORE = 'modifygoogleplaystore'
-PA_UI_MODIFYGOOGLESEARCH = 'modifygooglesearch'
-PA_UI_MODIFYGOOGLESERVICESFRAMEWORK = 'modifygoogleservicesframework'
-PA_UI_MODIFYMEDIASTORAGE = 'modifymediastorage'
-PA_UI_MODIFYPLAYMUSIC = 'modifyplaymusic'
-PA_UI_MODIFYQRMT = 'modifyqrmt'
-PA_UI_MODIFYSETUPWIZARD = 'modifysetupwizard'
-PA_UI_MODIFYSHELL = 'modifyshell'
-PA_UI_MODIFYTV = 'modifytv'
-# Directory Access
-PA_UI_DIRECTORYACCESS2 = 'directoryaccess2'
-
-# Security and Restrictions
-PA_UI_UNKNOWNSOURCES = 'unknownsources'
-PA_UI_VERIFYAPPS = 'verifyapps'
-# Install Unknown Apps
-PA_UI_DEMOAPP = 'demoapp'
-
-# Device Preferences
-PA_UI_ABOUT = 'about'
-PA_UI_DATEANDTIME = 'dateandtime'
-PA_UI_LANGUAGE = 'language'
-PA_UI_KEYBOARD = 'keyboard'
-PA_UI_DEVICESOUND = 'devicesound'
-PA_UI_DEVICESTORAGE = 'devicestorage'
-PA_UI_HOMESCREEN = 'homescreen'
-PA_UI_GOOGLEASSISTANT = 'googleassistant'
-PA_UI_CHROMECASTBUILTIN = 'chromecastbuiltin'
-PA_UI_SCREENSAVER = 'screensaver'
-PA_UI_DEVICELOCATION = 'devicelocation'
-PA_UI_USAGEANDDIAGNOSTICS = 'usageanddiagnostics'
-PA_UI_ACCESSIBILITY = 'accessibility'
-PA_UI_RESET = 'uireset'
-# About
-PA_UI_SYSTEMUPDATE = 'systemupdate'
-PA_UI_DEVICENAME = 'devicename'
-PA_UI_RESTART = 'restart'
-PA_UI_STATUS = 'status'
-PA_UI_LEGALINFORMATION = 'legalinformation'
-PA_UI_MODEL = 'model'
-PA_UI_NETFLIXESN = 'netflixesn'
-PA_UI_VERSION = 'version'
-PA_UI_ANDROID = 'android'
-PA_UI_KERNELVERSION = 'kernelversion'
-PA_UI_BUILD = 'build'
-# Status
-PA_UI_IPADDRESS = 'ipaddress'
-PA_UI_MACADDRESS = 'macaddress'
-PA_UI_BLUETOOTHADDRESS = 'bluetoothaddress'
-PA_UI_SERIALNUMBER = 'serialnumber'
-PA_UI_UPTIME = 'uptime'
-
-# Legal Information
-PA_UI_OPENSOURCE = 'opensource'
-PA_UI_GOOGLELEGAL = 'googlelegal'
-PA_UI_SYSTEMWEBVIEWLICENCES = 'systemwebviewlicences'
-PA_UI_ADS = 'ads'
-# Date And Time
-PA_UI_AUTOMATICDATEANDTIME = 'automaticdateandtime'
-PA_UI_SETDATE = 'setdate'
-PA_UI_SETTIME = 'settime'
-PA_UI_SETTIMEZONE = 'settimezone'
-PA_UI_USE24HOURFORMAT = 'use24hourformat'
-# Keyboard
-PA_UI_CURRENTKEYBOARD = 'currentkeyboard'
-PA_UI_GBOARDSETTINGS = 'gboardsettings'
-PA_UI_MANAGEKEYBOARD = 'managekeyboard'
-# Keyboard Settings
-PA_UI_GBOARDLANGUAGE = 'gboardlanguage'
-PA_UI_TERMSOFSERVICE = 'termsofservice'
-PA_UI_PRIVACYPOLICY = 'privacypolicy'
-PA_UI_KEYBOARDOPENSOURCELICENCES = 'keyboardopensourcelicences'
-PA_UI_SHAREUSAGESTATISTICS = 'shareusagestatistics'
-# Gboard Settings
-PA_UI_USESYSTEMLANGUAGES = 'usesytemlanguages'
-PA_UI_KENGLISH_US = 'kenglish_us'
-PA_UI_KENGLISH_UK = 'kenglish_uk'
-PA_UI_KSIMPLIFIEDCHINESE = 'ksimplifiedchinese'
-PA_UI_KTRADISIONALCHINESE = 'ktraditionalchinese'
-PA_UI_KFRENCH = 'kfrench'
-PA_UI_KGERMAN = 'kgerman'
-PA_UI_KGERMAN_SWITZERLAND = 'kgerman_switzerland'
-PA_UI_KHEBREW = 'khebrew'
-PA_UI_KHINDI1 = 'khindi1'
-PA_UI_KHINDI2 = 'khindi2'
-PA_UI_KITALIAN = 'kitalian'
-PA_UI_KITALIAN_SWITZERLAND = 'kitalian_switzerland'
-PA_UI_KJAPANESE = 'kjapanese'
-PA_UI_KKOREAN = 'kkorean'
-PA_UI_KNORWEGIAN_BOKMAL = 'knorwegian_bokmal'
-PA_UI_KRUSSIAN = 'krussian'
-PA_UI_KSPANISH = 'kspanish'
-PA_UI_KVIETNAMESE = 'kvietnamese'
-
-# Available Virtual Keyboard
-PA_UI_KEYBOARDGBOARD = 'keyboardgboard'
-PA_UI_GOOGLEINDICKEYBOARD = 'googleindickeyboard'
-PA_UI_GOOGLEVOICETYPING = 'googlevoicetyping'
-PA_UI_MULTILINGUALKEYBOARD = 'multilingualkeyboard'
-PA_UI_VIRTUALREMOTEKEYBOARD = 'virtualremotekeyboard'
-# Device Sound
-PA_UI_SYSTEMSOUND = 'systemsound'
-# Device Storage
-PA_UI_INTERNALSHAREDSTORAGE = 'internalsharedstorge'
-# Internal Shared Storage
-PA_UI_INTERNALAPPS = 'intnernalaps'
-PA_UI_INTERNALPHOTOSANDVIDEOS = 'internalphotosandvideos'
-PA_UI_INTERNALAUDIO = 'internalaudio'
-PA_UI_INTERNALDOWNLOAD = 'internaldownload'
-PA_UI_INTERNALCACHED = 'internalcached'
-PA_UI_INTERNALMISC = 'internalmisc'
-PA_UI_INTERNALAVAILABLE = 'internalavailable'
-
-# Home Screen
-# Channels
-PA_UI_CUSTOMISECHANNELS = 'customisechannels'
-PA_UI_ENABLEVIDEOPREVIEWS = 'enablevideopreviews'
-PA_UI_ENABLEAUDIOPREVIEWS = 'enableaudiopreviews'
-# Apps
-PA_UI_REORDERAPPS = 'reorderapps'
-PA_UI_REORDERGAMES = 'reordergames'
-# Open-Source Licences
-PA_UI_ANDROIDTVHOME = 'androidtvhome'
-PA_UI_ANDROIDTVCORESERVICES = 'androidtvcoreservices'
-# Customise Channels
-PA_UI_PLAYNEXT = 'playnext'
-PA_UI_CUSTOMISECHANNELSTV = 'customisechannelstv'
-PA_UI_PLAYNEXTL2 = 'playnextl2'
-PA_UI_PLAYNEXTTV = 'playnexttv'
-# Google Assistant
-PA_UI_ACCOUNTS = 'accounts'
-PA_UI_SEARCHABLEAPPS = 'searchableapps'
-PA_UI_SAFESEARCHFILTER = 'safesearchfilter'
-PA_UI_BLOCKOFFENSIVEWORDS = 'blockoffensivewords'
-PA_UI_TEMPERATUREUNIT = 'temperatureunit'
-PA_UI_GOOGLEOPENSOURCELICENCES = 'gooleopensourcelicences'
-# Google Assistant
-PA_UI_SEARCHABLEAPPSGOOGLEPLAYGAMES = 'searchableappsgoogleplaygames'
-PA_UI_SEARCHABLEAPPSTV = 'searchableappstv'
-# Chromecast Built-in
-PA_UI_CHROMEOPENSOURCELICENSE = 'chromeopensourcelicense'
-PA_UI_VERSIONNUMBERS = 'versionnumbers'
-# Screen Saver
-PA_UI_SCREENSAVERL2 = 'screensaverl2'
-PA_UI_WHENTOSTART = 'whentostart'
-PA_UI_PUTDEVICETOSLEEP = 'putdevicetosleep'
-PA_UI_STARTNOW = 'startnow'
-# Start Screen Saver
-PA_UI_STARTSCREENSAVER = 'startscreensaver'
-# Location
-PA_UI_LOCATIONSTATUS = 'locationstatus'
-# Usage and Diafnostics
-PA_UI_USAGEANDDIAGNOSTICSL2 = 'usageanddiagnosticsl2'
-PA_UI_ACCESSIBILITYCAPTIONS = 'accessibilitycaptions'
-PA_UI_ACCESSIBILITYAUDIODESCRIPTION = 'accessibilityaudiodescription'
-PA_UI_ACCESSIBILITYHIGHCONTRASTTEXT = 'accessibilityhighcontrasttext'
-PA_UI_ACCESSIBILITYTEXTTOSPEECH = 'accessibilitytexttospeech'
-PA_UI_ACCESSIBILITYSHORTCUT = 'accessibilityshortcut'
-PA_UI_ACCESSIBILITYTALKBACK = 'accessibilitytalkback'
-PA_UI_ACCESSIBILITYSWITCHACCESS = 'accessibilityswitchaccess'
-PA_UI_ACCESSIBILITYTEXTMAGNIFICATION = 'accessibilitytextmagnification'
-PA_UI_ACCESSIBILITYSCREENREADER = 'accessibilityscreenreader'
-# Captions
-PA_UI_CAPTIONSDISPLAY = 'captionsdisplay'
-# Display Options
-PA_UI_CAPTIONSLANGUAGE = 'captionslanguage'
-PA_UI_CAPTIONSTEXTSIZE = 'captionstextsize'
-# Caption Style
-PA_UI_CAPTIONSWHITEONBLACK = 'captionswhiteonblack'
-PA_UI_CAPTIONSBLACKONWHITE = 'captionsblackonwhite'
-PA_UI_CAPTIONSYELLOWONBLACK = 'captionsyellowonblack'
-PA_UI_CAPTIONSYELLOWONBLUE = 'captionsyellowonblue'
-PA_UI_CAPTIONSCUSTOMIZED = 'captionscustomized'
-# Caption Customised
-PA_UI_FONTFAMILY = 'fontfamily'
-PA_UI_TEXTFLASHING = 'textflashing'
-PA_UI_TEXTCOLOUR = 'textcolour'
-PA_UI_TEXTOPACITY = 'textopacity'
-PA_UI_EDGETYPE = 'edgetype'
-PA_UI_EDGECOLOUR = 'edgecolour'
-PA_UI_SHOWBACKGROUND = 'showbackground'
-PA_UI_BACKGROUNDFLASHING = 'backgroundflashing'
-PA_UI_BACKGROUNDCOLOUR = 'backgroundcolour'
-PA_UI_BACKGROUNDOPACITY = 'backgroundopacity'
-PA_UI_SHOWWINDOW = 'showwindow'
-PA_UI_WINDOWCOLOUR = 'windowcolour'
-PA_UI_WINDOWOPACITY = 'windowopacity'
-# Audio Setup
-PA_UI_AUDIODESCRIPTION = 'audiodescription'
-PA_UI_MIXINGLEVEL = 'mixinglevel'
-PA_UI_AUDIOTYPE = 'audiotype'
-PA_UI_APRIMARYPREFEREDLANGUAGE = 'aprimarypreferedlanguage'
-PA_UI_ASECONDARYPREFEREDLANGUAGE = 'asecondarypreferedlanguage'
-# Text to Speech Output
-PA_UI_GOOGLETEXTTOSPEECHENGINE = 'googletexttospeechengine'
-PA_UI_ENGINECONFIGURATION = 'engineconfiguration'
-PA_UI_SPEECHRATE = 'speechrate'
-PA_UI_LISTENTOANEXAMPLE = 'listentoanexample'
-PA_UI_DEFAULTLANGUAGESTATUS = 'defaultlanguagestatus'
-# Engine Configuration
-PA_UI_GOOGLETEXTTOSPEECHLANGUAGE = 'googletexttospeechlanguage'
-PA_UI_SETTINGSFORGOOGLETEXTTOSPEECHENGINE = 'settingsforgoogletexttospeechengine'
-PA_UI_INSTALLVOICEDATA = 'installvoicedata'
-# Accessibility Shortcut
-PA_UI_ENABLEACCESSIBILITYSHORTCUT = 'enableaccessibilityshortcut'
-PA_UI_SHORTCUTSERVICE = 'shortcutservice'
-# Talkback
-PA_UI_TALKBACKENABLE = 'talkbackenable'
-PA_UI_TALKBACKCONFIGURATION = 'talkbackconfiguration'
-# Switch Access
-PA_UI_SWITCHACCESSENABLE = 'switchaccessenable'
-PA_UI_SWITCHACCESSCONFIGURATION = 'switchaccessconfiguration'
-# Text Magnification
-PA_UI_TEXTMAGNIFICATIONENABLE = 'textmagnificationenable'
-PA_UI_TEXTMAGNIFICATIONCONFIGURATION = 'textmagnificationconfiguration'
-PA_UI_TEXTMAGNIFICATIONCOLOUR = 'textmagnificationcolour'
-PA_UI_TEXTMAGNIFICATIONDURATION = 'textmagnificationduration'
-# Screen Reader
-PA_UI_SCREENREADERENABLE = 'screenreaderenable'
-PA_UI_SCREENREADERCONFIGURATION = 'screenreaderconfiguration'
-# Bravia Settings
-PA_UI_CHANNELSETUP = 'channelsetup'
-PA_UI_PICTURE = 'picture'
-PA_UI_SOUND = 'sound'
-PA_UI_SCREEN = 'screen'
-PA_UI_REMOTESTART = 'remotestart'
-PA_UI_BLUETOOTH = 'bluetooth'
-PA_UI_VOICEREMOTECONTROL = 'voiceremotecontrol'
-PA_UI_SPEAKERS = 'speakers'
-PA_UI_TVPOSITION = 'tvposition'
-PA_UI_DIGITALAUDIOOUT = 'digitalaudioout'
-PA_UI_EXTERNALINPUTS = 'externalinputs'
-PA_UI_PARENTALCONTROLS = 'parentalcontrols'
-PA_UI_ECO = 'eco'
-PA_UI_IPCONTROL = 'ipcontrol'
-PA_UI_CUSTOMERSUPPORT = 'customersupport'
-# Channel Setup
-PA_UI_ANALOGSETUP = 'analogsetup'
-PA_UI_DIGITALSETUP = 'digitalsetup'
-# Analog Setup
-PA_UI_ANALOGAUTOTUNING = 'analogautotuning'
-PA_UI_MANUALPROGRAMPRESET = 'manualprogrampreset'
-PA_UI_CHANNELLISTEDIT = 'channellistedit'
-PA_UI_PROGRAMMELABELS = 'programmelabels'
-# Digital Setup
-PA_UI_DIGITALTUNING = 'digitaltuning'
-PA_UI_SUBTITLESETUP = 'subtitlesetup'
-PA_UI_AUDIOSETUP = 'audiosetup'
-PA_UI_TECHNICALSETUP = 'technicalsetup'
-# Digital Tuning
-PA_UI_DIGITALAUTOTUNING = 'digitalautotuning'
-PA_UI_PROGRAMLISTEDIT = 'programlistedit'
-PA_UI_MANUALTUNING = 'manualtuning'
-PA_UI_LCN = 'lcn'
-PA_UI_VPOSTALCODE = 'vpostalcode'
-PA_UI_VPOSTALCODE2 = 'vpostalcode2'
-PA_UI_SCANTYPE = 'scantype'
-PA_UI_CHANNELNUMBER = 'channelnumber'
-PA_UI_FREQUENCY = 'uifrequency'
-PA_UI_SCAN = 'scan'
-PA_UI_SUBTITLE = 'subtitle'
-PA_UI_SPRIMARYPREFEREDLANGUAGE = 'sprimarypreferedlanguage'
-PA_UI_SSECONDARYPREFEREDLANGUAGE = 'ssecondarypreferedlanguage'
-# Audio Setup
-PA_UI_DAUDIODESCRIPTION = 'daudiodescription'
-PA_UI_DMIXINGLEVEL = 'dmixinglevel'
-PA_UI_DAUDIOTYPE = 'daudiotype'
-PA_UI_DAPRIMARYPREFEREDLANGUAGE = 'daprimarypreferedlanguage'
-PA_UI_DASECONDARYPREFEREDLANGUAGE = 'dasecondarypreferedlanguage'
-# Technical Setup
-PA_UI_AUTOMATICSOFTWAREDOWNLOAD = 'automaticsoftwaredownload'
-PA_UI_EPGLANGUAGE = 'epglanguage'
-PA_UI_ACTIVESTANBYUPDATE = 'activestanbyupdate'
-
-# Picture
-PA_UI_PICTUREMODE = 'picturemode'
-PA_UI_BRIGHTNESS = 'brightness'
-PA_UI_COLOUR = 'colour'
-PA_UI_PICTUREADVANCED = 'pictureadvanced'
-# Advanced Picture
-# Brightness
-PA_UI_BRIGHTNESSL2 = 'brightnessl2'
-PA_UI_BRIGHTNESSL3 = 'brightnessl3'
-PA_UI_CONTRAST = 'contrast'
-PA_UI_GAMMA = 'gamma'
-PA_UI_BLACKLEVEL = 'blacklevel'
-PA_UI_BLACKADJUST = 'blackadjust'
-PA_UI_ADVCONTRASTENHANCER = 'advcontrastenhancer'
-# Colour
-PA_UI_COLOURL2 = 'colourl2'
-PA_UI_COLOURL3 = 'colourl3'
-PA_UI_HUE = 'hue'
-PA_UI_COLOURTEMPERATURE = 'colourtemperature'
-PA_UI_ADVCOLOURTEMPERATURE = 'advcolourtemperature'
-PA_UI_LIVECOLOUR = 'livecolour'
-# Adv colour temperature
-PA_UI_CRESET = 'creset'
-PA_UI_BASIC = 'uibasic'
-PA_UI_RGAIN = 'rgain'
-PA_UI_GGAIN = 'ggain'
-PA_UI_BGAIN = 'bgain'
-PA_UI_RBIAS = 'rbias'
-PA_UI_GBIAS = 'gbias'
-PA_UI_BBIAS = 'bbias'
-PA_UI_MULTIPOINT = 'multipoint'
-PA_UI_COLOURGAMMAADJUSTMENTPOINT = 'colourgammaadjustmentpoint'
-PA_UI_ROFFSET = 'roofset'
-PA_UI_GOFFSET = 'goofset'
-PA_UI_BOFFSET = 'boofset'
-# Clarity
-PA_UI_CLARITY = 'clarity'
-PA_UI_SHARPNESS = 'sharpness'
-PA_UI_REALITYCREATION = 'realitycreation'
-PA_UI_RESOLUTION = 'resolution'
-PA_UI_RANDOMNOISEREDUCTION = 'randomnoisereduction'
-PA_UI_DIGITALNOISEREDUCTION = 'digitalnoisereduction'
-PA_UI_MOTION = 'motion'
-PA_UI_MOTIONFLOW = 'motionflow'
-PA_UI_SMOOTHNESS = 'smoothness'
-PA_UI_CLEARNESS = 'clearness'
-PA_UI_FILMMODE = 'filmmode'
-PA_UI_VIDEOOPTION = 'videooption'
-PA_UI_HDMIVIDEORANGE = 'hdmivideorange'
-PA_UI_PRESET = 'preset'
-PA_UI_PRESETL2 = 'presetl2'
-
-# Sound
-PA_UI_DIALOGUEENHANCER = 'dialogueenhancer'
-PA_UI_SURROUND = 'surround'
-PA_UI_SOUNDADVANCED = 'soundadvanced'
-PA_UI_COMMON = 'common'
-PA_UI_AUTOVOLUME = 'autovolume'
-PA_UI_BALANCE = 'balance'
-PA_UI_DIGITALAUDIOOUTVOLUME = 'digitalaudiovolume'
-PA_UI_INPUTRELATED = 'inputrelated'
-PA_UI_VOLUMEOFFSET = 'volumeoffset'
-PA_UI_DYNAMICRANGE = 'dynamicrange'
-PA_UI_SRESET = 'sreset'
-PA_UI_SRESETL2 = 'sresetl2'
-
-# Screen
-PA_UI_WIDEMODE = 'widemode'
-PA_UI_43DEFAULT = '43default'
-
-# External Input
-PA_UI_MANAGEINPUTS = 'manageinputs'
-PA_UI_HDMICECSETTINGS = 'hdmicecsettings'
-PA_UI_CUSTOMISETVKEY = 'customisetvkey'
-PA_UI_HDMISIGNALFORMAT = 'hdmisignalformat'
-# Manage Inputs
-# analogue
-PA_UI_ANALOGUE = 'uianalogue'
-PA_UI_ANALOGUEDISPLAY = 'analoguedisplay'
-# digital
-PA_UI_DIGITAL = 'uidigital'
-PA_UI_DIGITALDISPLAY = 'digitaldisplay'
-# hdmi1
-PA_UI_HDMI1 = 'uihdmi1'
-PA_UI_HDMI1DISPLAY = 'hdmi1display'
-PA_UI_HDMI1LABEL = 'hdmi1label'
-# hdmi2
-PA_UI_HDMI2 = 'uihdmi2'
-PA_UI_HDMI2DISPLAY = 'hdmi2display'
-PA_UI_HDMI2LABEL = 'hdmi2label'
-# hdmi3
-PA_UI_HDMI3 = 'uihdmi3'
-PA_UI_HDMI3DISPLAY = 'hdmi3display'
-PA_UI_HDMI3LABEL = 'hdmi3label'
-# av
-PA_UI_AV = 'uiav'
-PA_UI_AVDISPLAY = 'avdisplay'
-PA_UI_AVLABEL = 'avlabel'
-# Hdmi CEC Settings
-PA_UI_CEC = 'cec'
-PA_UI_AUTODEVICESOFF = 'autodeviceoff'
-PA_UI_AUTOTVON = 'autotvon'
-# Hdmi Signal Format
-PA_UI_HSFHDMI1 = 'hsfhdmi1'
-PA_UI_HSFHDMI2 = 'hsfhdmi2'
-PA_UI_HSFHDMI3 = 'hsfhdmi3'
-
-# Parental Control
-PA_UI_PARENTALONOFF = 'parentalonoff'
-PA_UI_EXTERNALINPUTLOCK = 'externalinputlock'
-PA_UI_CHANNELSBLOCKED = 'channelsblocked'
-PA_UI_PROGRAMMERESTRICTIONS = 'programmerestrictions'
-PA_UI_CHANGEPIN = 'changepin'
-PA_UI_CHANGEPIN2 = 'changepin2'
-# External Input lock
-PA_UI_BLOCKALL = 'blockall'
-PA_UI_ANALOGUELOCK = 'analoguelock'
-PA_UI_DIGITALLOCK = 'digitallock'
-PA_UI_HDMI1LOCK = 'hdmi1lock'
-PA_UI_HDMI2LOCK = 'hdmi2lock'
-PA_UI_HDMI3LOCK = 'hdmi3lock'
-PA_UI_AVLOCK = 'avlock'
-# Programme Restriction
-PA_UI_NONE = 'uinone'
-PA_UI_PR3 = 'pr3'
-PA_UI_PR4 = 'pr4'
-PA_UI_PR5 = 'pr5'
-PA_UI_PR6 = 'pr6'
-PA_UI_PR7 = 'pr7'
-PA_UI_PR8 = 'pr8'
-PA_UI_PR9 = 'pr9'
-PA_UI_PR10 = 'pr10'
-PA_UI_PR11 = 'pr11'
-PA_UI_PR12 = 'pr12'
-PA_UI_PR13 = 'pr13'
-PA_UI_PR14 = 'pr14'
-PA_UI_PR15 = 'pr15'
-PA_UI_PR16 = 'pr16'
-PA_UI_PR17 = 'pr17'
-PA_UI_PR18 = 'pr18'
-
-# Thailand Programme Restriction
-PA_UI_PR19 = 'pr19'
-# Singapore Programme Restriction
-PA_UI_G = 'g'
-PA_UI_PG = 'pg'
-PA_UI_PG13 = 'pg13'
-PA_UI_NC16 = 'nc16'
-PA_UI_M18 = 'm18'
-PA_UI_R21 = 'r21'
-
-# Eco
-PA_UI_POWERSAVING = 'powersaving'
-PA_UI_IDLETVSTANDBY = 'idletvstandby'
-PA_UI_AUTOSHUTOFF = 'autoshutoff'
-
-# IP Control
-PA_UI_CONTROLREMOTELY = 'controlremotely'
-PA_UI_AUTHENTICATION = 'authentication'
-PA_UI_PRESHAREDKEY = 'presharedkey'
-
-# Customer Support
-PA_UI_CONTACTANDSUPPORT = 'contactandsupport'
-PA_UI_SIGNALDIAGNOSTICS = 'signaldiagnostics'
-PA_UI_HELPGUIDE = 'helpguide'
-PA_UI_NOTICESANDLICENCES = 'noticesandlicences'
-# Contact and Support
-PA_UI_CONTACTANDSUPPORTVIEW = 'contactandsupportview'
-# Signal Diagnostics
-PA_UI_SIGNALCHANNEL = 'signalchannel'
-PA_UI_SIGNALNETWORK = 'signalnetwork'
-PA_UI_SIGNALSTRENGTH = 'signalstrength'
-PA_UI_SIGNALQUALITY = 'signalquality'
-PA_UI_PHYSICALCHANNEL = 'physicalchannel'
-PA_UI_SIGNALFREQUENCY = 'signalfrequency'
-PA_UI_MODULATION = 'modulation'
-PA_UI_PREBCH = 'prebch'
-PA_UI_UEC = 'uec'
-PA_UI_SNR = 'snr'
-# Inside Settings from DTV        Inside Settings from DTV        Inside Settings from DTV        Inside Settings from DTV        Inside Settings from DTV
-
-# FACTORY RESET
-PA_UI_FENGLISH_US = 'uienglish_us'
-PA_UI_FAFRIKAANS = 'uiafrikaans'
-PA_UI_FENGLISH_UK = 'uienglish_uk'
-PA_UI_FESPANOL = 'uiespanol'
-PA_UI_FFRANCAIS_CANADA = 'uifrancais_canada'
-PA_UI_FFRANCAIS_FRANCE = 'uifrancais_france'
-PA_UI_FINDONESIAN = 'uiindonesian'
-PA_UI_FISIZULU = 'uiisizulu'
-PA_UI_FKISWAHILI = 'uikiswahili'
-PA_UI_FPORTUGUES = 'uiportugues'
-PA_UI_FTIENGVIET = 'uitiengviet'
-PA_UI_FRUSSIAN = 'uirussian'
-PA_UI_FARABIC = 'uiarabic'
-PA_UI_FFARSI = 'uifarsi'
-PA_UI_FMARATHI = 'uimarathi'
-PA_UI_FHINDI = 'uihindi'
-PA_UI_FBENGALI = 'uibengali'
-PA_UI_FPUNJABI = 'uipunjabi'
-PA_UI_FGUJARATHI = 'uigujarathi'
-PA_UI_FTAMIL = 'uitamil'
-PA_UI_FTELUGU = 'uitelugu'
-PA_UI_FKANNADA = 'uikannada'
-PA_UI_FMALAYALAM = 'uimalayalam'
-PA_UI_FTHAI = 'uithai'
-PA_UI_FSIMPLIFIEDCHINESE = 'uisimplifiedchinese'
-PA_UI_FTRADISIONALCHINESE = 'uitradisionalchinese'
-
-PA_UI_FCONTINUE = 'fcontinue'
-PA_UI_FLSKIP = 'flskip'
-PA_UI_FWIFI1 = 'fwifi1'
-
-PA_UI_FOTHERNETWORK = 'fothernetwork'
-PA_UI_FUSEETHERNET = 'fuseethernet'
-PA_UI_FSKIP = 'fskip'
-
-PA_UI_FAFRICA = 'uiafrica'
-PA_UI_FASIA = 'uiasia'
-PA_UI_FEUROPE = 'uieurope'
-PA_UI_FMIDDLEEAST = 'uimiddleeast'
-PA_UI_FOCEANIA = 'uioceania'
-PA_UI_FAREAEXCLUDINGABOVE = 'uiareaexcludingabove'
-PA_UI_FOK = 'fok'
-PA_UI_FDONE = 'fdone'
-PA_UI_FEASTAFRICA = 'uifeastafrica'
-PA_UI_FGHANA = 'uifghana'
-PA_UI_FKENYA = 'uifkenya'
-PA_UI_FMOROCO = 'uifmoroco'
-PA_UI_FNIGERIA = 'uifnigeria'
-PA_UI_FNORTHAFRICA = 'uifnorthafrika'
-PA_UI_FSOUTHAFRICA = 'uifsouthafrika'
-PA_UI_FTANZANIA = 'uiftanzania'
-PA_UI_FTUNISIA = 'uiftunisia'
-PA_UI_FUGANDA = 'uifuganda'
-PA_UI_FWESTAFRICA = 'uifwestafrica'
-PA_UI_FINDIA = 'uifindia'
-PA_UI_FINDONESIA = 'uifindonesia'
-PA_UI_FMALAYSIA = 'uifmalaysia'
-PA_UI_FMYANMAR = 'uifmyanmar'
-PA_UI_FPHILIPPINES = 'uifphilippines'
-PA_UI_FSINGAPORE = 'uifsingapore'
-PA_UI_FTHAILAND = 'uifthailand'
-PA_UI_FVIETNAM = 'uifvietnam'
-PA_UI_FAEA_ASIA = 'faea_asia'
-PA_UI_FAZERBAIJAN = 'uifazerbaijan'
-PA_UI_FCIS = 'uifcis'
-PA_UI_FTURKEY = 'uifturkey'
-PA_UI_FAEA_EUROPE = 'faea_europe'
-PA_UI_FGCC = 'uifgcc'
-PA_UI_FIRAN = 'uifiran'
-PA_UI_FLEVANT = 'uiflevant'
-PA_UI_FSAUDIARABIA = 'uifsaudiarabia'
-PA_UI_FAEA_MIDDLEEAST = 'faea_middleeast'
-PA_UI_FAUSTRALIA = 'faustralia'
-PA_UI_FNEWZEALAND = 'uifnewzealand'
-PA_UI_FAEA_OCEANIA = 'faea_oceania'
-#---------------
-# VULCAN UISTRUCLIB_UC
-#---------------
-# HOME LAYER
-UC_UI_CLICKTOSPEAK = 'clicktospeak'
-UC_UI_CLICKTOTYPE = 'clicktotype'
-UC_UI_NOTIFICATION = 'notification'
-UC_UI_HOMESETTINGS = 'homesettings'
-UC_UI_DETAILS = 'details'
-UC_UI_DISMISS = 'dismiss'
-UC_UI_APPS = 'apps'
-UC_UI_TV = 'tv'
-UC_UI_DTV = 'dtv'
-
-# Apps
-UC_UI_NETFLIX = 'netflix'
-UC_UI_PRIMEVIDEO = 'primevideo'
-UC_UI_MEDIAPLAYER = 'mediaplayer'
-UC_UI_YOUTUBE = 'youtube'
-UC_UI_GOOLEPLAY = 'googleplay'
-UC_UI_ADDAPPTOFAVOURITES = 'addapptofavourites'
-UC_UI_HOMECUSTOMISECHANNELS = 'homecustomisechannels'
-UC_UI_APPTV = 'apptv'
-UC_UI_CHANNEL1 = 'channel1'
-UC_UI_CHANNEL2 = 'channel2'
-UC_UI_CHANNEL3 = 'channel3'
-
-# Home Customise Channels
-UC_UI_HOMEPLAYNEXT = 'homeplaynext'
-UC_UI_HOMECUSTOMISECHANNELSTV = 'homecustomisechannelstv'
-UC_UI_HOMEPLAYNEXTL2 = 'homeplaynextl2'
-UC_UI_HOMEPLAYNEXTTV = 'homeplaynexttv'
-
-# Option
-UC_UI_OPICTUREOFF = 'opictureoff'
-UC_UI_OPICTURE = 'opicture'
-UC_UI_OSOUND = 'osound'
-UC_UI_OSPEAKERS = 'ospeakers'
-UC_UI_OWATCHTV = 'owatchtv'
-UC_UI_OALTERNATEAUDIO = 'oalternateaudio'
-UC_UI_OCCDISPLAY = 'occdisplay'
-UC_UI_OAUDIODESCRIPTION = 'oaudiodescription'
-UC_UI_OSETTINGS = 'osettings'
-UC_UI_BLACKSCREEN = 'blackscreen'
-# Inside Apps
-UC_UI_GETMOREAPPS = 'getmoreapps'
-UC_UI_GETMOREGAMES = 'getmoregames'
-UC_UI_APPSNETFLIX = 'appsnetflix'
-UC_UI_APPSPRIMEVIDEO = 'appsprimevideo'
-UC_UI_APPSTV = 'appstv'
-UC_UI_APPSMEDIAPLAYER = 'appsmediaplayer'
-UC_UI_APPSYOUTUBE = 'appsyoutube'
-UC_UI_APPSGOOGLEPLAYMOVIES = 'appsgoogleplaymovies'
-UC_UI_APPSGOOGLEPLAYMUSIC = 'appsgoogleplaymusic'
-UC_UI_APPSGOOGLEPLAYSTORE = 'appsgoogleplaystore'
-UC_UI_APPSGOOGLEPLAYGAMES = 'appsgoogleplaygames'
-UC_UI_APPSCUSTOMERSUPPORT = 'appscustomersupport'
-UC_UI_APPSSYSTEMTRACING = 'appssystemtracing'
-
-UC_UI_OKIVEGOTIT = 'okivegotit'
-UC_UI_OKSETUPNOW = 'oksetupnow'
-
-# Inside Settings from HOME        Inside Settings from HOME        Inside Settings from HOME        Inside Settings from HOME        Inside Settings from HOME        
-UC_UI_HSDTV = 'hsdtv'
-UC_UI_HSFINISHSETTINGTV = 'hsfinishsettingtv'
-UC_UI_HSTAKEBUGREPORT = 'hstakebugreport'
-UC_UI_HSNETWORKANDINTERNET = 'hsnetworkandinternet'
-UC_UI_HSACCOUNTSANDSIGNIN = 'hsaccountsandsignin'
-UC_UI_HSSAPPS = 'hssapps'
-UC_UI_HSDEVICEPREFERENCES = 'hsdevicepreferences'
-UC_UI_HSREMOTESANDACCESSORIES = 'hsremoteandaccessories'
-UC_UI_HSBRAVIASETTINGS = 'hsbraviasettings'
-
-# Network and Internet
-UC_UI_HSWIFI = 'hswifi'
-UC_UI_HSNETWORK1 = 'hsnetwork1'
-UC_UI_HSNETWORK2 = 'hsnetwork2'
-UC_UI_HSNETWORK3 = 'hsnetwork3'
-UC_UI_HSSEEALL = 'hsseeall'
-UC_UI_HSADDNEWNETWORK = 'hsaddnewnetwork'
-UC_UI_HSSCANNINGALWAYSAVAILABLE = 'hsscanningalwaysavailable'
-UC_UI_HSNOTCONNECTED = 'hsnotconnected'
-UC_UI_HSPROXYSETTINGS = 'hsproxysettings'
-UC_UI_HSIPSETTINGS = 'hsipsettings'
-
-# Inside Apps
-UC_UI_HSAPPS1 = 'hsapps1'
-UC_UI_HSAPPS2 = 'hsapps2'
-UC_UI_HSAPPS3 = 'hsapps3'
-UC_UI_HSAPPS4 = 'hsapps4'
-UC_UI_HSAPPS5 = 'hsapps5'
-UC_UI_HSSEEALLAPPS = 'hsseeallmaps'
-UC_UI_HSAPPSPERMISSION = 'hsappspermission'
-UC_UI_HSSPECIALAPPACCESS = 'hsspecialappaccess'
-UC_UI_HSSECURITYANDRESTRICTIONS = 'hssecurityandrestrictions'
-
-# App Permissions
-UC_UI_HSBODYSENSORS = 'hsbodysensors'
-UC_UI_HSCALENDAR = 'hscalendar'
-UC_UI_HSCALLLOGS = 'hscalllogs'
-UC_UI_HSCAMERA = 'hscamera'
-UC_UI_HSCONTACTS = 'hscontacts'
-UC_UI_HSLOCATION = 'hslocations'
-UC_UI_HSMICROPHONE = 'hsmicrophone'
-UC_UI_HSSMS = 'hssms'
-UC_UI_HSSTORAGE = 'hsstorage'
-UC_UI_HSTELEPHONE = 'hstelephone'
-UC_UI_HSADDITIONALPERMISSION = 'hsadditionalpermission'
-
-# Calendar Permissions
-UC_UI_HSCALENDARSHOWSYSTEMAPPS = 'hscalendarshowsystemapps'
-UC_UI_HSCALENDARGOOGLECALENDARSYNC = 'hscalendargooglecalendarsync'
-UC_UI_HSCALENDARGOOGLEPLAYSERVICES = 'hscalendargoogleplayservices'
-UC_UI_HSCALENDARGOOGLESEARCH = 'hscalendargooglesearch'
-# Call Log Permissions
-UC_UI_HSCALLLOGSSHOWSYSTEMAPPS = 'hscalllogsshowsystmeapps'
-UC_UI_HSCALLLOGSGOOGLEPLAYSERVICES = 'hscalllogsgoogleplayservices'
-# Camera Permissions
-UC_UI_HSCAMERAL2 = 'hscameral2'
-UC_UI_HSCAMERAGALLERY = 'hscameragallery'
-UC_UI_HSCAMERASHOWSYSTEMAPPS = 'hscamerashowsystemapps'
-UC_UI_HSCAMERAL3 = 'hscameral3'
-UC_UI_HSCAMERAGOOGLEPLAYSERVICES = 'hscameragoogleplayservices'
-UC_UI_HSCAMERAGOOGLESEARCH = 'hscameragooglesearch'
-# Contacts Permissions
-UC_UI_HSCONTACTSGALLERY = 'hscontactsgallery'
-UC_UI_HSCONTACTSGOOGLEPLAYGAMES = 'hscontactsgoogleplaygames'
-UC_UI_HSCONTACTSGOOGLEPLAYSTORE = 'hscontactsgoogleplaystore'
-UC_UI_HSCONTACTSNETFLIX = 'hscontactsnetflix'
-UC_UI_HSCONTACTSSHOWSYSTEMAPPS = 'hscontactsshowsytemapps'
-UC_UI_HSCONTACTSBUGREPORTSENDER = 'hscontactsbugreportsender'
-UC_UI_HSCONTACTSCALENDARSTORAGE = 'hscontactscalendarstorage'
-UC_UI_HSCONTACTSGBOARD = 'hscontactsgboard'
-UC_UI_HSCONTACTSGOOGLEBACKUPTRANSPORT = 'hscontactsgooglebackuptransport'
-UC_UI_HSCONTACTSGOOGLECONTACTSSYNC = 'hscontactsgooglecontactssync'
-UC_UI_HSCONTACTSGOOGLEINDICKEYBOARD = 'hscontactsgoogleinidckeyboard'
-UC_UI_HSCONTACTSGOOGLEPLAYSERVICE = 'hscontactsgoogleplayservice'
-UC_UI_HSCONTACTSGOOGLESEARCH = 'hscontactsgooglesearch'
-UC_UI_HSCONTACTSGOOGLESERVICEFRAMEWORK = 'hscontactsgoogleserviceframework'
-UC_UI_HSCONTACTSPLAYMUSIC = 'hscontactsplaymusic'
-# Location Permissions
-UC_UI_HSLOCATIONANDROIDTVREMOTE = 'hslocationandroidremote'
-UC_UI_HSLOCATIONSERVICE = 'hslocationservice'
-UC_UI_HSLOCATIONEULA1 = 'hslocationeula1'
-UC_UI_HSLOCATIONEULA2 = 'hslocationeula2'
-UC_UI_HSLOCATIONEULA3 = 'hslocationeula3'
-UC_UI_HSLOCATIONGALLERY = 'hslocationgallery'
-UC_UI_HSLOCATIONGOOGLEPLAYSTORE = 'hslocationgoogleplaystore'
-UC_UI_HSLOCATIONHELP1 = 'hslocationhelp1'
-UC_UI_HSLOCATIONHELP2 = 'hslocationhelp2'
-UC_UI_HSLOCATIONSHOWSYSTEMAPPS = 'hslocationshowsystemapps'
-UC_UI_HSLOCATIONANDDROIDACCESSIBILITY = 'hslocationandroidaccessibility'
-UC_UI_HSLOCATIONCAMERA = 'hslocationcamera'
-UC_UI_HSLOCATIONGOOGLEPLAYMOVIESANDTV = 'hslocationgoogleplaymoviesandtv'
-UC_UI_HSLOCATIONGOOGLEPLAYSERVICES = 'hslocationgoogleplayservices'
-UC_UI_HSLOCATIONGOOGLESEARCH = 'hslocationgooglesearch'
-UC_UI_HSLOCATIONPLAYMUSIC = 'hslocationplaymusic'
-UC_UI_HSLOCATIONSETUPWIZARD = 'hslocationsetupwizard'
-# Microphone Permissions
-UC_UI_HSMICROPHONECAMERA = 'hsmicrophonecamera'
-UC_UI_HSMICROPHONEEULA1 = 'hsmicrophoneeula1'
-UC_UI_HSMICROPHONEEULA2 = 'hsmicrophoneeula2'
-UC_UI_HSMICROPHONEEULA3 = 'hsmicrophoneeula3'
-UC_UI_HSMICROPHONEGALLERY = 'hsmicrophonegallery'
-UC_UI_HSMICROPHONEGOOGLEPLAYSTORE = 'hsmicrophonegoogleplaystore'
-UC_UI_HSMICROPHONEHELP1 = 'hsmicrophonehelp1'
-UC_UI_HSMICROPHONEHELP2 = 'hsmicrophonehelp2'
-UC_UI_HSMICROPHONEYOUTUBE = 'hsmicrophoneyoutube'
-UC_UI_HSMICROPHONESHOWSYSTEMAPPS = 'hsmicrophoneshowsystemapps'
-UC_UI_HSMICROPHONEANDROIDACCESSIBILITY = 'hsmicrophoneandroidaccessibility'
-UC_UI_HSMICROPHONECAMERAL2 = 'hsmicrophonecameral2'
-UC_UI_HSMICROPHONEGBOARD = 'hsmicrophonegboard'
-UC_UI_HSMICROPHONEGOOGLEPLAYSERVICE = 'hsmicrophonegoogleplayservice'
-UC_UI_HSMICROPHONEGOOGLESEARCH = 'hsmicrophonegooglesearch'
-UC_UI_HSMICROPHONEPLAYMUSIC = 'hsmicrophoneplaymusic'
-# SMS Permissions
-UC_UI_HSSMSGOOGLEPLAYSTORE = 'hssmsgoogleplaystore'
-UC_UI_HSSMSSHOWSYSTEMAPPS = 'hssmsshowsystemapps'
-UC_UI_HSSMSGOOGLEPLAYSERVICES = 'hssmsgoogleplayservices'
-# Storage Permissions
-UC_UI_HSSTORAGEANDROIDTVREMOTE = 'hsstorageandroidtvremote'
-UC_UI_HSSTORAGECAMERAL2 = 'hsstoragecameral2'
-UC_UI_HSSTORAGEEULA1 = 'hsstorageeula1'
-UC_UI_HSSTORAGEEULA2 = 'hsstorageeula2'
-UC_UI_HSSTORAGEEULA3 = 'hsstorageeula3'
-UC_UI_HSSTORAGEGALLERY = 'hsstoragegallery'
-UC_UI_HSSTORAGEHELP1 = 'hsstoragehelp1'
-UC_UI_HSSTORAGEHELP2 = 'hsstoragehelp2'
-UC_UI_HSSTORAGENETFLIX = 'hsstoragenetflix'
-UC_UI_HSSTORAGEQRMT = 'hsstorageqrmt'
-UC_UI_HSSTORAGESHOWSYSTEMAPPS = 'hsstorageshowsystemapps'
-UC_UI_HSSTORAGEBUGREPORTSENDER = 'hsstoragebugreportsender'
-UC_UI_HSSTORAGECALENDARSTORAGE = 'hsstoragecalendarstorage'
-UC_UI_HSSTORAGECAMERAL3 = 'hsstoragecameral3'
-UC_UI_HSSTORAGEDEMOAPP = 'hsstoragestoragedemoapp'
-UC_UI_HSSTORAGEGBOARD = 'hsstoragegboard'
-UC_UI_HSSTORAGEGOOGLEINDICKEYBOARD = 'hsstoragegoogleindickeyboard'
-UC_UI_HSSTORAGEGOOGLEPLAYSERVICES = 'hsstoragegoogleplayservices'
-UC_UI_HSSTORAGEGOOGLESEARCH = 'hsstoragegooglesearch'
-UC_UI_HSSTORAGEHTMLVIEWER = 'hsstoragehtmlviewer'
-UC_UI_HSSTORAGEMEDIAPLAYER = 'hsstoragemediaplayer'
-UC_UI_HSSTORAGEPLAYMUSIC = 'hsstorageplaymusic'
-UC_UI_HSSTORAGEPRIMEVIDEO = 'hsstorageprimevideo'
-UC_UI_HSSTORAGESETUPWIZARD = 'hsstoragesetupwizard'
-UC_UI_HSSTORAGETVSTORAGE = 'hsstoragetvstorage'
-# Telephone Permissions
-UC_UI_HSTELEPHONEEULA1 = 'hstelephoneeula1'
-UC_UI_HSTELEPHONEEULA2 = 'hstelephoneeula2'
-UC_UI_HSTELEPHONEEULA3 = 'hstelephoneeula3'
-UC_UI_HSTELEPHONEGOOGLEPLAYSTORE = 'hstelephonegoogleplaystore'
-UC_UI_HSTELEPHONEHELP1 = 'hstelephonehelp1'
-UC_UI_HSTELEPHONEHELP2 = 'hstelephonehelp2'
-UC_UI_HSTELEPHONEQRMT = 'hstelephoneqrmt'
-UC_UI_HSTELEPHONESHOWSYSTEMAPPS = 'hstelephoneshowsystemapps'
-UC_UI_HSTELEPHONEANDROIDACCESSIBILITY = 'hstelephoneandroidaccessibility'
-UC_UI_HSTELEPHONEGOOGLEPLAYSERVICES = 'hstelephonegoogleplayservices'
-UC_UI_HSTELEPHONEGOOGLESEARCH = 'hstelephonegooglesearch'
-UC_UI_HSTELEPHONEGOOGLESERVICESFRAMEWORK = 'hstelephonegoogleservicesframework'
-UC_UI_HSTELEPHONESETTINGSSUGGESTIONS = 'hstelephonesettingssuggestions'
-# Additional Permissions
-UC_UI_HSREADALLTVLISTINGS = 'hsreadalltvlistings'
-UC_UI_HSREADINSTANTMESSAGES = 'hsreadinstantmessages'
-UC_UI_HSWRITEINSTANTMESSAGES = 'hswriteinstantmessages'
-# Read Instant messages permission
-UC_UI_HSREADSHOWSYSTEMAPPS = 'hsreadshowsystemapps'
-UC_UI_HSREADGOOGLESERVICESFRAMEWORK = 'hsreadgoogleservicesframework'
-# Write Instant messages permission
-UC_UI_HSWRITESHOWSYSTEMAPPS = 'hswriteshowsystemapps'
-UC_UI_HSWRITEGOOGLESERVICESFRAMEWORK = 'hswritegoogleservicesframework'
-
-# Special App Access
-UC_UI_HSENERGYOPTIMISATION = 'hsenergyoptimisation'
-UC_UI_HSUSAGEACCESS = 'hsusageaccess'
-UC_UI_HSNOTIFICATIONACCESS = 'hsnotificationaccess'
-UC_UI_HSDISPLAYOVEROTHERAPPS = 'hsdisplayoverotherapps'
-UC_UI_HSMODIFYSYSTEMSETTINGS = 'hsmodifysystemsettings'
-UC_UI_HSDIRECTORYACCESS = 'hsdirectoryaccess'
-
-# Energy Optimisation
-UC_UI_ENERGYOPTIMISATION2 = 'energyoptimisation2'
-UC_UI_ENERGYACTIONMENU = 'energyactionmenu'
-UC_UI_ENERGYACTIVITYSTUB = 'energyactivitystub'
-UC_UI_ENERGYADVANCEDSETTINGS = 'energyadvancedsettings'
-UC_UI_ENERGYANDROIDACCESSIBILITYSUITE = 'energyandroidaccessibilitysuite'
-UC_UI_ENERGYANDROIDSERVICESLIBRARY = 'energyandroidserviceslibrary'
-UC_UI_ENERGYANDROIDSHAREDLIBRARY = 'energyandroidsharedlibrary'
-UC_UI_ENERGYANDROIDSYSTEMWEBVIEW = 'energyandroidsystemwebview'
-UC_UI_ENERGYANDROIDTVCORESERVICES = 'energyandroidtvcoreservices'
-UC_UI_ENERGYANDROIDTVHOME = 'energyandroidtvhome'
-UC_UI_ENERGYANDROIDTVREMOTESERVICE = 'energyandroidtvremoteservice'
-UC_UI_ENERGYBACKDROP = 'energybackdrop'
-UC_UI_ENERGYBASICDAYDREAMS = 'energybasicdaydreams'
-UC_UI_ENERGYBLUETOOTH = 'energybluetooth'
-UC_UI_ENERGYBRAVIASETTINGS = 'energybraviasettings'
-UC_UI_ENERGYBUGREPORTSENDER = 'energybugreportsender'
-UC_UI_ENERGYCALENDARSTORAGE = 'energycalendarstorage'
-UC_UI_ENERGYCAMERA1 = 'energycamera1'
-UC_UI_ENERGYCAMERA2 = 'energycamera2'
-UC_UI_ENERGYCAPTIVEPORTALLOGIN = 'energycaptiveportallogin'
-UC_UI_ENERGYCERIFICATEINSTALLER = 'energycerificateinstaller'
-UC_UI_ENERGYCHROMECASTBUILTIN = 'energychromecastbuiltin'
-UC_UI_ENERGYCODECNOTIFICATION = 'energycodecnotification'
-UC_UI_ENERGYCOMANDROIDBACKUPCOMFIRM = 'energycomandroidbackupcomfirm'
-UC_UI_ENERGYCOMANDROIDCTCCTSSHIM = 'energycomandroidctcctsshim'
-UC_UI_ENERGYCOMANDROIDSHAREDSTORAGEBACKUP = 'energycomandroidsharedstoragebackup'
-UC_UI_ENERGYCOMGOOGLEANDORIDLEANBACKLAUNCHER = 'energycomgoogleandoridleanbacklauncher'
-UC_UI_ENERGYCOMGOOGLEANDORIDLEANBACKLAUNCHERRECOMENDATIONS = 'energycomgoogleandoridleanbacklauncherrecomendations'
-UC_UI_ENERGYCOMREALTEKSERVICEMENU = 'energycomrealtekservicemenu'
-UC_UI_ENERGYCOMPANIONDEVICEMANAGER = 'energycompaniondevicemanager'
-UC_UI_ENERGYCONTACTSSTORAGE = 'energycontactsstorage'
-UC_UI_ENERGYDEMOAPP = 'energydemoapp'
-UC_UI_ENERGYDEVICECONFIGURATION = 'energydeviceconfiguration'
-UC_UI_ENERGYDOWNLOADMANAGER = 'energydownloadmanager'
-UC_UI_ENERGYDTVTVINOUT = 'energydtvtvinout'
-UC_UI_ENERGYENGLISHMENU = 'energyenglishmenu'
-UC_UI_ENERGYEULA1 = 'energyeula1'
-UC_UI_ENERGYEULA2 = 'energyeula2'
-UC_UI_ENERGYEULA3 = 'energyeula3'
-UC_UI_ENERGYEXTERNALSTORAGE = 'energyexternalstorage'
-UC_UI_ENERGYFILES = 'energyfiles'
-UC_UI_ENERGYFUSEDLOCATION = 'energyfusedlocation'
-UC_UI_ENERGYGALLERY = 'energygallery'
-UC_UI_ENERGYGBOARD = 'energygboard'
-UC_UI_ENERGYGOOGLEBACKUPTRANSPORT = 'energygooglebackuptransport'
-UC_UI_ENERGYGOOGLECALENDARSYNC = 'energygooglecalendarsync'
-UC_UI_ENERGYGOOGLECONTACTSSYNC = 'energygooglecontactssync'
-UC_UI_ENERGYGOOGLEONETIMEINIT = 'energygoogleonetimeinit'
-UC_UI_ENERGYGOOGLEPARTNERSETUP = 'energygooglepartnersetup'
-UC_UI_ENERGYGOOGLEPLAYGAMES = 'energygoogleplaygames'
-UC_UI_ENERGYGOOGLEPLAYMOVIESANDTV = 'energygoogleplaymoviesandtv'
-UC_UI_ENERGYGOOGLEPLAYSERVICES = 'energygoogleplayservices'
-UC_UI_ENERGYGOOGLEPLAYSTORE = 'energygoogleplaystore'
-UC_UI_ENERGYGOOGLESEARCH = 'energygooglesearch'
-UC_UI_ENERGYGOOGLESERVICEFRAMEWORK = 'energygoogleserviceframework'
-UC_UI_ENERGYGOOGLETEXTTOSPEECHENGINE = 'energygoogletexttospeechengine'
-UC_UI_ENERGYHELP1 = 'energyhelp1'
-UC_UI_ENERGYHELP2 = 'energyhelp2'
-UC_UI_ENERGYHTMLVIEWER = 'energyhtmlviewer'
-UC_UI_ENERGYINPUTDEVICES = 'energyinputdevices'
-UC_UI_ENERGYINTENTFILTERVERIFICATIONSERVICE = 'energyintentfilterverificationservice'
-UC_UI_ENERGYIPCONTROL = 'energyipcontrol'
-UC_UI_ENERGYIPCONTROLAUX = 'energyipcontrolaux'
-UC_UI_ENERGYKEYCHAIN = 'energykeychain'
-UC_UI_ENERGYLIVEWALLPAPERPICKER = 'energylivewallpaperpicker'
-UC_UI_ENERGYMARKETFEEDBACKAGENT = 'energymarketfeedbackagent'
-UC_UI_ENERGYMEDIAPLAYER = 'energymediaplayer'
-UC_UI_ENERGYMEDIASTORAGE = 'energymediastorage'
-UC_UI_ENERGYMULTILINGUALKEYBOARD = 'energymultilingualkeyboard'
-UC_UI_ENERGYNETFLIX = 'energynetflix'
-UC_UI_ENERGYNETFLIXSETTINGS = 'energynetflixsettings'
-UC_UI_ENERGYPACKAGEACCESSHELPER = 'energypackageaccesshelper'
-UC_UI_ENERGYPACKAGEINSTALLER = 'energypackageinstaller'
-UC_UI_ENERGYPACPROCESSOR = 'energypacprocessor'
-UC_UI_ENERGYPASSTHROUGHINPUT = 'energypassthroughinput'
-UC_UI_ENERGYPLAYMUSIC = 'energyplaymusic'
-UC_UI_ENERGYPRIMEVIDEO = 'energyprimevideo'
-UC_UI_ENERGYPRINTSPOOLER = 'energyprintspooler'
-UC_UI_ENERGYPROXYHANDLER = 'energyproxyhandler'
-UC_UI_ENERGYPUMPKINSERVICE = 'energypumpkinservice'
-UC_UI_ENERGYQRMT = 'energyqrmt'
-UC_UI_ENERGYSECONDSCREENSETUPAUTHBRIDGE = 'energysecondscreensetupauthbridge'
-UC_UI_ENERGYSECUREELEMENTAPPLICATION = 'energysecureelementapplication'
-UC_UI_ENERGYSETTINGSSTORAGE = 'energysettingsstorage'
-UC_UI_ENERGYSETTINGSSUGGESTION = 'energysettingssuggestion'
-UC_UI_ENERGYSETUPWIZARD = 'energysetupwizard'
-UC_UI_ENERGYSETUPCUSTOMIZER = 'energysetupcustomizer'
-UC_UI_ENERGYSHELL = 'energyshell'
-UC_UI_ENERGYSYSTEMTRACING = 'energysystemtracing'
-UC_UI_ENERGYTEXTMAGNIFICATION = 'energytextmagnification'
-UC_UI_ENERGYTV1 = 'energytv1'
-UC_UI_ENERGYTV2 = 'energytv2'
-UC_UI_ENERGYTVSTORAGE1 = 'energytvstorage1'
-UC_UI_ENERGYTVSTORAGE2 = 'energytvstorage2'
-UC_UI_ENERGYUSBUPDATE = 'energyusbupdate'
-UC_UI_ENERGYUSERDICTIONARY = 'energyuserdictionary'
-UC_UI_ENERGYVPNDIALOGS = 'energyvpndialogs'
-UC_UI_ENERGYYOUTUBE = 'energyyoutube'
-
-# Usage Access
-UC_UI_HSUSAGEACCESS2 = 'hsusageaccess2'
-UC_UI_HSUSAGEBLUETOOTH = 'hsusagebluetooth'
-UC_UI_HSUSAGEGOOGLEPLAYSERVICES = 'hsusagegoogleplayservices'
-UC_UI_HSUSAGEGOOGLEPLAYSTORE = 'hsusagegoogleplaystore'
-UC_UI_HSUSAGEGOOGLESEARCH = 'hsusagegooglesearch'
-UC_UI_HSUSAGESHELL = 'hsusageshell'
-# Notification Access
-UC_UI_HSNOTIFICATIONACCESS2 = 'hsnotificationaccess2'
-UC_UI_HSNOTIFICATIONANDROIDTVCORESERVICES = 'hsnotificationandroidtvservices'
-# Allow Display Over Other Apps
-UC_UI_HSDISPLAYOVEROTHERAPPS2 = 'hsdisplayoverotherapps2'
-UC_UI_HSDISPLAYADVANCEDSETTINGS = 'hsdisplayadvancedsettings'
-UC_UI_HSDISPLAYANDROIDACCESSIBILITYSUITE = 'hsdisplayandroidaccessibilitysuite'
-UC_UI_HSDISPLAYANDROIDTVCORESERVICES = 'hsdisplayandroidtvcoreservices'
-UC_UI_HSDISPLAYANDROIDTVHOME = 'hsdisplayandroidhome'
-UC_UI_HSDISPLAYANDROIDTVREMOTESERVICE = 'hsdisplayandroidtvremoteservice'
-UC_UI_HSDISPLAYBRAVIASETTINGS = 'hsdisplaybraviasettings'
-UC_UI_HSDISPLAYCODECNOTIFICATION = 'hsdisplaycodenotification'
-UC_UI_HSDISPLAYCOMREALTEKSERVICEMENU = 'hsdisplaycomrealtekservicemenu'
-UC_UI_HSDISPLAYGOOGLEPLAYSERVICE = 'hsdisplaygoogleplayservice'
-UC_UI_HSDISPLAYGOOGLESEARCH = 'hsdisplaygooglesearch'
-UC_UI_HSDISPLAYMULTILINGUALKEYBOARD = 'hsdisplaymultilingualkeyboard'
-UC_UI_HSDISPLAYPLAYMUSIC = 'hsdisplayplaymusic'
-UC_UI_HSDISPLAYTEXTMAGNIFICATION = 'hsdisplaytextmagnification'
-UC_UI_HSDISPLAYTV = 'hsdisplaytv'
-# Modify System Settings
-UC_UI_HSMODIFYSYSTEMSETTINGS2 = 'hsmodifysystemsettings2'
-UC_UI_HSMODIFYACTIONMENU = 'hsmodifyactionmenu'
-UC_UI_HSMODIFYADVANCEDSETTINGS = 'hsmodifyadvancedsettings'
-UC_UI_HSMODIFYBLUETOOTH = 'hsmodifybluetooth'
-UC_UI_HSMODIFYBRAVIASETTINGS = 'hsmodifybraviasettings'
-UC_UI_HSMODIFYCAMERA = 'hsmodifycamera'
-UC_UI_HSMODIFYGALLERY = 'hsmodifygallery'
-UC_UI_HSMODIFYGOOGLEBACKUPTRANSPORT = 'hsmodifygooglebackuptransport'
-UC_UI_HSMODIFYGOOGLEPLAYSERVICE = 'hsmodifygoogleplayservice'
-UC_UI_HSMODIFYGOOGLEPLAYSTORE = 'hsmodifygoogleplaystore'
-UC_UI_HSMODIFYGOOGLESEARCH = 'hsmodifygooglesearch'
-UC_UI_HSMODIFYGOOGLESERVICESFRAMEWORK = 'hsmodifygoogleservicesframework'
-UC_UI_HSMODIFYMEDIASTORAGE = 'hsmodifymediastorage'
-UC_UI_HSMODIFYPLAYMUSIC = 'hsmodifyplaymusic'
-UC_UI_HSMODIFYQRMT = 'hsmodifyqrmt'
-UC_UI_HSMODIFYSETUPWIZARD = 'hsmodifysetupwizard'
-UC_UI_HSMODIFYSHELL = 'hsmodifyshell'
-UC_UI_HSMODIFYTV = 'hsmodifytv'
-# Directory Access
-UC_UI_HSDIRECTORYACCESS2 = 'hsdirectoryaccess2'
-
-# Security and Restrictions
-UC_UI_HSUNKNOWNSOURCES = 'hsunknownsources'
-UC_UI_HSVERIFYAPPS = 'hsverifyapps'
-# Install Unknown Apps
-UC_UI_HSDEMOAPP = 'hsdemoapp'
-
-
-# Device Preferences
-UC_UI_HSABOUT = 'hsabout'
-UC_UI_HSDATEANDTIME = 'hsdateandtime'
-UC_UI_HSLANGUAGE = 'hslanguage'
-UC_UI_HSKEYBOARD = 'hskeyboard'
-UC_UI_HSDEVICESOUND = 'hsdevicesound'
-UC_UI_HSDEVICESTORAGE = 'hsdevicestorage'
-UC_UI_HSHOMESCREEN = 'hshomescreen'
-UC_UI_HSGOOGLEASSISTANT = 'hsgoogleassistant'
-UC_UI_HSCHROMECASTBUILTIN = 'hschromecastbuiltin'
-UC_UI_HSSCREENSAVER = 'hsscreensaver'
-UC_UI_HSDEVICELOCATION = 'hsdevicelocation'
-UC_UI_HSUSAGEANDDIAGNOSTICS = 'hsusageanddiagnostics'
-UC_UI_HSACCESSIBILITY = 'hsaccessibility'
-UC_UI_HSRESET = 'hsuireset'
-# About
-UC_UI_HSSYSTEMUPDATE = 'hssystemupdate'
-UC_UI_HSDEVICENAME = 'hsdevicename'
-UC_UI_HSRESTART = 'hsrestart'
-UC_UI_HSSTATUS = 'hsstatus'
-UC_UI_HSLEGALINFORMATION = 'hslegalinformation'
-UC_UI_HSMODEL = 'hsmodel'
-UC_UI_HSNETFLIXESN = 'hsnetflixesn'
-UC_UI_HSVERSION = 'hsversion'
-UC_UI_HSANDROID = 'hsandroid'
-UC_UI_HSKERNELVERSION = 'hskernelversion'
-UC_UI_HSBUILD = 'hsbuild'
-# Status
-UC_UI_HSIPADDRESS = 'hsipaddress'
-UC_UI_HSMACADDRESS = 'hsmacaddress'
-UC_UI_HSBLUETOOTHADDRESS = 'hsbluetoothaddress'
-UC_UI_HSSERIALNUMBER = 'hsserialnumber'
-UC_UI_HSUPTIME = 'hsuptime'
-
-# Legal Information
-UC_UI_HSOPENSOURCE = 'hsopensource'
-UC_UI_HSGOOGLELEGAL = 'hsgooglelegal'
-UC_UI_HSSYSTEMWEBVIEWLICENCES = 'hssystemwebviewlicences'
-UC_UI_HSADS = 'hsads'
-# Date And Time
-UC_UI_HSAUTOMATICDATEANDTIME = 'hsautomaticdateandtime'
-UC_UI_HSSETDATE = 'hssetdate'
-UC_UI_HSSETTIME = 'hssettime'
-UC_UI_HSSETTIMEZONE = 'hssettimezone'
-UC_UI_HSUSE24HOURFORMAT = 'hsuse24hourformat'
-# Keyboard
-UC_UI_HSCURRENTKEYBOARD = 'hscurrentkeyboard'
-UC_UI_HSGBOARDSETTINGS = 'hsgboardsettings'
-UC_UI_HSMANAGEKEYBOARD = 'hsmanagekeyboard'
-# Keyboard Settings
-UC_UI_HSGBOARDLANGUAGE = 'hsgboardlanguage'
-UC_UI_HSTERMSOFSERVICE = 'hstermsofservice'
-UC_UI_HSPRIVACYPOLICY = 'hsprivacypolicy'
-UC_UI_HSKEYBOARDOPENSOURCELICENCES = 'hskeyboardopensourcelicences'
-UC_UI_HSSHAREUSAGESTATISTICS = 'hsshareusagestatistics'
-# Gboard Settings
-UC_UI_HSUSESYSTEMLANGUAGES = 'hsusesytemlanguages'
-UC_UI_HSKENGLISH_US = 'hskenglish_us'
-UC_UI_HSKENGLISH_UK = 'hskenglish_uk'
-UC_UI_HSKSIMPLIFIEDCHINESE = 'hsksimplifiedchinese'
-UC_UI_HSKTRADISIONALCHINESE = 'hsktraditionalchinese'
-UC_UI_HSKFRENCH = 'hskfrench'
-UC_UI_HSKGERMAN = 'hskgerman'
-UC_UI_HSKGERMAN_SWITZERLAND = 'hskgerman_switzerland'
-UC_UI_HSKHEBREW = 'hskhebrew'
-UC_UI_HSKHINDI1 = 'hskhindi1'
-UC_UI_HSKHINDI2 = 'hskhindi2'
-UC_UI_HSKITALIAN = 'hskitalian'
-UC_UI_HSKITALIAN_SWITZERLAND = 'hskitalian_switzerland'
-UC_UI_HSKJAPANESE = 'hskjapanese'
-UC_UI_HSKKOREAN = 'hskkorean'
-UC_UI_HSKNORWEGIAN_BOKMAL = 'hsknorwegian_bokmal'
-UC_UI_HSKRUSSIAN = 'hskrussian'
-UC_UI_HSKSPANISH = 'hskspanish'
-UC_UI_HSKVIETNAMESE = 'hskvietnamese'
-
-# Available Virtual Keyboard
-UC_UI_HSKEYBOARDGBOARD = 'hskeyboardgboard'
-UC_UI_HSGOOGLEINDICKEYBOARD = 'hsgoogleindickeyboard'
-UC_UI_HSGOOGLEVOICETYPING = 'hsgooglevoicetyping'
-UC_UI_HSMULTILINGUALKEYBOARD = 'hsmultilingualkeyboard'
-UC_UI_HSVIRTUALREMOTEKEYBOARD = 'hsvirtualremotekeyboard'
-# Device Sound
-UC_UI_HSSYSTEMSOUND = 'hssystemsound'
-# Device Storage
-UC_UI_HSINTERNALSHAREDSTORAGE = 'hsinternalsharedstorge'
-# Internal Shared Storage
-UC_UI_HSINTERNALAPPS = 'hsintnernalaps'
-UC_UI_HSINTERNALPHOTOSANDVIDEOS = 'hsinternalphotosandvideos'
-UC_UI_HSINTERNALAUDIO = 'hsinternalaudio'
-UC_UI_HSINTERNALDOWNLOAD = 'hsinternaldownload'
-UC_UI_HSINTERNALCACHED = 'hsinternalcached'
-UC_UI_HSINTERNALMISC = 'hsinternalmisc'
-UC_UI_HSINTERNALAVAILABLE = 'hsinternalavailable'
-
-# Home Screen
-# Channels
-UC_UI_HSCUSTOMISECHANNELS = 'hscustomisechannels'
-UC_UI_HSENABLEVIDEOPREVIEWS = 'hsenablevideopreviews'
-UC_UI_HSENABLEAUDIOPREVIEWS = 'hsenableaudiopreviews'
-# Apps
-UC_UI_HSREORDERAPPS = 'hsreorderapps'
-UC_UI_HSREORDERGAMES = 'hsreordergames'
-# Open-Source Licences
-UC_UI_HSANDROIDTVHOME = 'hsandroidtvhome'
-UC_UI_HSANDROIDTVCORESERVICES = 'hsandroidtvcoreservices'
-# Customise Channels
-UC_UI_HSPLAYNEXT = 'hsplaynext'
-UC_UI_HSCUSTOMISECHANNELSTV = 'hscustomisechannelstv'
-UC_UI_HSPLAYNEXTL2 = 'hsplaynextl2'
-UC_UI_HSPLAYNEXTTV = 'hsplaynexttv'
-# Google Assistant
-UC_UI_HSACCOUNTS = 'hsaccounts'
-UC_UI_HSSEARCHABLEAPPS = 'hssearchableapps'
-UC_UI_HSSAFESEARCHFILTER = 'hssafesearchfilter'
-UC_UI_HSBLOCKOFFENSIVEWORDS = 'hsblockoffensivewords'
-UC_UI_HSTEMPERATUREUNIT = 'hstemperatureunit'
-UC_UI_HSGOOGLEOPENSOURCELICENCES = 'hsgooleopensourcelicences'
-# Google Assistant
-UC_UI_HSSEARCHABLEAPPSGOOGLEPLAYGAMES = 'hssearchableappsgoogleplaygames'
-UC_UI_HSSEARCHABLEAPPSTV = 'hssearchableappstv'
-# Chromecast Built-in
-UC_UI_HSCHROMEOPENSOURCELICENSE = 'hschromeopensourcelicense'
-UC_UI_HSVERSIONNUMBERS = 'hsversionnumbers'
-# Screen Saver
-UC_UI_HSSCREENSAVERL2 = 'hsscreensaverl2'
-UC_UI_HSWHENTOSTART = 'hswhentostart'
-UC_UI_HSPUTDEVICETOSLEEP = 'hsputdevicetosleep'
-UC_UI_HSSTARTNOW = 'hsstartnow'
-# Start Screen Saver
-UC_UI_HSSTARTSCREENSAVER = 'hsstartscreensaver'
-# Location
-UC_UI_HSLOCATIONSTATUS = 'hslocationstatus'
-# Usage and Diafnostics
-UC_UI_HSUSAGEANDDIAGNOSTICSL2 = 'hsusageanddiagnosticsl2'
-UC_UI_HSACCESSIBILITYCAPTIONS = 'hsaccessibilitycaptions'
-UC_UI_HSACCESSIBILITYAUDIODESCRIPTION = 'hsaccessibilityaudiodescription'
-UC_UI_HSACCESSIBILITYHIGHCONTRASTTEXT = 'hsaccessibilityhighcontrasttext'
-UC_UI_HSACCESSIBILITYTEXTTOSPEECH = 'hsaccessibilitytexttospeech'
-UC_UI_HSACCESSIBILITYSHORTCUT = 'hsaccessibilityshortcut'
-UC_UI_HSACCESSIBILITYTALKBACK = 'hsaccessibilitytalkback'
-UC_UI_HSACCESSIBILITYSWITCHACCESS = 'hsaccessibilityswitchaccess'
-UC_UI_HSACCESSIBILITYTEXTMAGNIFICATION = 'hsaccessibilitytextmagnification'
-UC_UI_HSACCESSIBILITYSCREENREADER = 'hsaccessibilityscreenreader'
-# Captions
-UC_UI_HSCAPTIONSDISPLAY = 'hscaptionsdisplay'
-# Display Options
-UC_UI_HSCAPTIONSLANGUAGE = 'hscaptionslanguage'
-UC_UI_HSCAPTIONSTEXTSIZE = 'hscaptionstextsize'
-# Caption Style
-UC_UI_HSCAPTIONSWHITEONBLACK = 'hscaptionswhiteonblack'
-UC_UI_HSCAPTIONSBLACKONWHITE = 'hscaptionsblackonwhite'
-UC_UI_HSCAPTIONSYELLOWONBLACK = 'hscaptionsyellowonblack'
-UC_UI_HSCAPTIONSYELLOWONBLUE = 'hscaptionsyellowonblue'
-UC_UI_HSCAPTIONSCUSTOMIZED = 'hscaptionscustomized'
-# Caption Customised
-UC_UI_HSFONTFAMILY = 'hsfontfamily'
-UC_UI_HSTEXTFLASHING = 'hstextflashing'
-UC_UI_HSTEXTCOLOUR = 'hstextcolour'
-UC_UI_HSTEXTOPACITY = 'hstextopacity'
-UC_UI_HSEDGETYPE = 'hsedgetype'
-UC_UI_HSEDGECOLOUR = 'hsedgecolour'
-UC_UI_HSSHOWBACKGROUND = 'hsshowbackground'
-UC_UI_HSBACKGROUNDFLASHING = 'hsbackgroundflashing'
-UC_UI_HSBACKGROUNDCOLOUR = 'hsbackgroundcolour'
-UC_UI_HSBACKGROUNDOPACITY = 'hsbackgroundopacity'
-UC_UI_HSSHOWWINDOW = 'hsshowwindow'
-UC_UI_HSWINDOWCOLOUR = 'hswindowcolour'
-UC_UI_HSWINDOWOPACITY = 'hswindowopacity'
-# Audio Setup
-UC_UI_HSAUDIODESCRIPTION = 'hsaudiodescription'
-UC_UI_HSMIXINGLEVEL = 'hsmixinglevel'
-UC_UI_HSAUDIOTYPE = 'hsaudiotype'
-UC_UI_HSAPRIMARYPREFEREDLANGUAGE = 'hsaprimarypreferedlanguage'
-UC_UI_HSASECONDARYPREFEREDLANGUAGE = 'hsasecondarypreferedlanguage'
-# Text to Speech Output
-UC_UI_HSGOOGLETEXTTOSPEECHENGINE = 'hsgoogletexttospeechengine'
-UC_UI_HSENGINECONFIGURATION = 'hsengineconfiguration'
-UC_UI_HSSPEECHRATE = 'hsspeechrate'
-UC_UI_HSLISTENTOANEXAMPLE = 'hslistentoanexample'
-UC_UI_HSDEFAULTLANGUAGESTATUS = 'hsdefaultlanguagestatus'
-# Engine Configuration
-UC_UI_HSGOOGLETEXTTOSPEECHLANGUAGE = 'hsgoogletexttospeechlanguage'
-UC_UI_HSSETTINGSFORGOOGLETEXTTOSPEECHENGINE = 'hssettingsforgoogletexttospeechengine'
-UC_UI_HSINSTALLVOICEDATA = 'hsinstallvoicedata'
-# Accessibility Shortcut
-UC_UI_HSENABLEACCESSIBILITYSHORTCUT = 'hsenableaccessibilityshortcut'
-UC_UI_HSSHORTCUTSERVICE = 'hsshortcutservice'
-# Talkback
-UC_UI_HSTALKBACKENABLE = 'hstalkbackenable'
-UC_UI_HSTALKBACKCONFIGURATION = 'hstalkbackconfiguration'
-# Switch Access
-UC_UI_HSSWITCHACCESSENABLE = 'hsswitchaccessenable'
-UC_UI_HSSWITCHACCESSCONFIGURATION = 'hsswitchaccessconfiguration'
-# Text Magnification
-UC_UI_HSTEXTMAGNIFICATIONENABLE = 'hstextmagnificationenable'
-UC_UI_HSTEXTMAGNIFICATIONCONFIGURATION = 'hstextmagnificationconfiguration'
-UC_UI_HSTEXTMAGNIFICATIONCOLOUR = 'hstextmagnificationcolour'
-UC_UI_HSTEXTMAGNIFICATIONDURATION = 'hstextmagnificationduration'
-# Screen Reader        
-UC_UI_HSSCREENREADERENABLE = 'hsscreenreaderenable'
-UC_UI_HSSCREENREADERCONFIGURATION = 'hsscreenreaderconfiguration'
-
-# Bravia Settings
-UC_UI_HSCHANNELSETUP = 'hschannelsetup'
-UC_UI_HSPICTURE = 'hspicture'
-UC_UI_HSSOUND = 'hssound'
-UC_UI_HSSCREEN = 'hsscreen'
-UC_UI_HSREMOTESTART = 'hsremotestart'
-UC_UI_HSBLUETOOTH = 'hsbluetooth'
-UC_UI_HSVOICEREMOTECONTROL = 'hsvoiceremotecontrol'
-UC_UI_HSSPEAKERS = 'hsspeakers'
-UC_UI_HSTVPOSITION = 'hstvposition'
-UC_UI_HSDIGITALAUDIOOUT = 'hsdigitalaudioout'
-UC_UI_HSEXTERNALINPUTS = 'hsexternalinputs'
-UC_UI_HSPARENTALCONTROLS = 'hsparentalcontrols'
-UC_UI_HSECO = 'hseco'
-UC_UI_HSIPCONTROL = 'hsipcontrol'
-UC_UI_HSCUSTOMERSUPPORT = 'hscustomersupport'
-
-# Channel Setup
-UC_UI_HSSIGNALTYPE = 'hssignaltype'
-UC_UI_HSANALOGUESETUP = 'hsanaloguesetup'
-UC_UI_HSDIGITALSETUP = 'hsdigitalsetup'
-UC_UI_HSSHOWNCHANNELS = 'hsshownchannels'
-UC_UI_HSCAPTIONS = 'hscaptions'
-UC_UI_HSPREFERREDLANGUAGE = 'hspreferredlanguage'
-# Analaogue Setup
-UC_UI_HSANALOGUEAUTOTUNING = 'hsanalogueautotuning'
-UC_UI_HSPROGRAMMELABELS = 'hsprogrammelabels'
-# Digital Setup
-UC_UI_HSDSIGNALTYPE = 'hsdsignaltype'
-UC_UI_HSDIGITALAUTOTUNING = 'hsdigitalautotuning'
-UC_UI_HSMANUALTUNING = 'hsmanualtuning'
-# Manual Tuning
-UC_UI_HSSCANTYPE = 'hsscantype'
-UC_UI_HSCHANNELNUMBER = 'hschannelnumber'
-UC_UI_HSFREQUENCY = 'hsfrequency'
-UC_UI_HSSCAN = 'hsscan'
-# Captions
-UC_UI_HSCCDISPLAY = 'hsccdisplay'
-UC_UI_HSANALOGUECC = 'hsanalogcc'
-UC_UI_HSDIGITALCC = 'hsdigitalcc'
-UC_UI_HSDIGITALCCOPTIONS = 'hsdigitalccoptions'
-# Preffered Language
-UC_UI_HSPREFERREDAUDIO1 = 'hspreferredaudio1'
-UC_UI_HSPREFERREDAUDIO2 = 'hspreferredaudio2'
-UC_UI_HSPREFERREDCC1 = 'hspreferredcc1'
-UC_UI_HSPREFERREDCC2 = 'hspreferredcc2'
-
-# Picture
-UC_UI_HSPICTUREMODE = 'hspicturemode'
-UC_UI_HSBRIGHTNESS = 'hsbrightness'
-UC_UI_HSCOLOUR = 'hscolour'
-UC_UI_HSPICTUREADVANCED = 'hspictureadvanced'
-# Advanced Picture
-# Brightness
-UC_UI_HSBRIGHTNESSL2 = 'hsbrightnessl2'
-UC_UI_HSBRIGHTNESSL3 = 'hsbrightnessl3'
-UC_UI_HSCONTRAST = 'hscontrast'
-UC_UI_HSGAMMA = 'hsgamma'
-UC_UI_HSBLACKLEVEL = 'hsblacklevel'
-UC_UI_HSBLACKADJUST = 'hsblackadjust'
-UC_UI_HSADVCONTRASTENHANCER = 'hsadvcontrastenhancer'
-# Colour
-UC_UI_HSCOLOURL2 = 'hscolourl2'
-UC_UI_HSCOLOURL3 = 'hscolourl3'
-UC_UI_HSHUE = 'hshue'
-UC_UI_HSCOLOURTEMPERATURE = 'hscolourtemperature'
-UC_UI_HSADVCOLOURTEMPERATURE = 'hsadvcolourtemperature'
-UC_UI_HSLIVECOLOUR = 'hslivecolour'
-# Adv colour temperature
-UC_UI_HSCRESET = 'hscreset'
-UC_UI_HSBASIC = 'hsbasic'
-UC_UI_HSRGAIN = 'hsrgain'
-UC_UI_HSGGAIN = 'hsggain'
-UC_UI_HSBGAIN = 'hsbgain'
-UC_UI_HSRBIAS = 'hsrbias'
-UC_UI_HSGBIAS = 'hsgbias'
-UC_UI_HSBBIAS = 'hsbbias'
-UC_UI_HSMULTIPOINT = 'hsmultipoint'
-UC_UI_HSCOLOURGAMMAADJUSTMENTPOINT = 'hscolourgammaadjustmentpoint'
-UC_UI_HSROFFSET = 'hsroofset'
-UC_UI_HSGOFFSET = 'hsgoofset'
-UC_UI_HSBOFFSET = 'hsboofset'
-# Clarity
-UC_UI_HSCLARITY = 'hsclarity'
-UC_UI_HSSHARPNESS = 'hssharpness'
-UC_UI_HSREALITYCREATION = 'hsrealitycreation'
-UC_UI_HSRESOLUTION = 'hsresolution'
-UC_UI_HSRANDOMNOISEREDUCTION = 'hsrandomnoisereduction'
-UC_UI_HSDIGITALNOISEREDUCTION = 'hsdigitalnoisereduction'
-UC_UI_HSMOTION = 'hsmotion'
-UC_UI_HSMOTIONFLOW = 'hsmotionflow'
-UC_UI_HSSMOOTHNESS = 'hssmoothness'
-UC_UI_HSCLEARNESS = 'hsclearness'
-UC_UI_HSFILMMODE = 'hsfilmmode'
-UC_UI_HSVIDEOOPTION = 'hsvideooption'
-UC_UI_HSHDMIVIDEORANGE = 'hshdmivideorange'
-UC_UI_HSPRESET = 'hspreset'
-UC_UI_HSPRESETL2 = 'hspresetl2'
-
-# Sound
-UC_UI_HSDIALOGUEENHANCER = 'hsdialogueenhancer'
-UC_UI_HSSURROUND = 'hssurround'
-UC_UI_HSSOUNDADVANCED = 'hssoundadvanced'
-UC_UI_HSCOMMON = 'hscommon'
-UC_UI_HSAUTOVOLUME = 'hsautovolume'
-UC_UI_HSBALANCE = 'hsbalance'
-UC_UI_HSDIGITALAUDIOOUTVOLUME = 'hsdigitalaudiovolume'
-UC_UI_HSINPUTRELATED = 'hsinputrelated'
-UC_UI_HSVOLUMEOFFSET = 'hsvolumeoffset'
-UC_UI_HSDYNAMICRANGE = 'hsdynamicrange'
-UC_UI_HSSRESET = 'hssreset'
-UC_UI_HSSRESETL2 = 'hssresetl2'
-
-# Screen
-UC_UI_HSWIDEMODE = 'hswidemode'
-UC_UI_HS43DEFAULT = 'hs43default'
-
-# External Input
-UC_UI_HSMANAGEINPUTS = 'hsmanageinputs'
-UC_UI_HSHDMICECSETTINGS = 'hshdmicecsettings'
-UC_UI_HSCUSTOMISETVKEY = 'hscustomisetvkey'
-UC_UI_HSHDMISIGNALFORMAT = 'hshdmisignalformat'
-# Manage Inputs
-# analogue
-UC_UI_HSANALOGUE = 'hsuianalogue'
-UC_UI_HSANALOGUEDISPLAY = 'hsanaloguedisplay'
-# digital
-UC_UI_HSDIGITAL = 'hsuidigital'
-UC_UI_HSDIGITALDISPLAY = 'hsdigitaldisplay'
-# hdmi1
-UC_UI_HSHDMI1 = 'hsuihdmi1'
-UC_UI_HSHDMI1DISPLAY = 'hshdmi1display'
-UC_UI_HSHDMI1LABEL = 'hshdmi1label'
-# hdmi2
-UC_UI_HSHDMI2 = 'hsuihdmi2'
-UC_UI_HSHDMI2DISPLAY = 'hshdmi2display'
-UC_UI_HSHDMI2LABEL = 'hshdmi2label'
-# hdmi3
-UC_UI_HSHDMI3 = 'hsuihdmi3'
-UC_UI_HSHDMI3DISPLAY = 'hshdmi3display'
-UC_UI_HSHDMI3LABEL = 'hshdmi3label'
-# av
-UC_UI_HSAV = 'hsuiav'
-UC_UI_HSAVDISPLAY = 'hsavdisplay'
-UC_UI_HSAVLABEL = 'hsavlabel'
-# Hdmi CEC Settings
-UC_UI_HSCEC = 'hscec'
-UC_UI_HSAUTODEVICESOFF = 'hsautodeviceoff'
-UC_UI_HSAUTOTVON = 'hsautotvon'
-# Hdmi Signal Format
-UC_UI_HSHSFHDMI1 = 'hshsfhdmi1'
-UC_UI_HSHSFHDMI2 = 'hshsfhdmi2'
-UC_UI_HSHSFHDMI3 = 'hshsfhdmi3'
-
-# Parental Control
-UC_UI_HSPARENTALONOFF = 'hsparentalonoff'
-UC_UI_HSEXTERNALINPUTLOCK = 'hsexternalinputlock'
-UC_UI_HSCHANNELSBLOCKED = 'hschannelsblocked'
-UC_UI_HSPROGRAMMERESTRICTIONS = 'hsprogrammerestrictions'
-UC_UI_HSCHANGEPIN = 'hschangepin'
-# External Input lock
-UC_UI_HSBLOCKALL = 'hsblockall'
-UC_UI_HSANALOGUELOCK = 'hsanaloguelock'
-UC_UI_HSDIGITALLOCK = 'hsdigitallock'
-UC_UI_HSHDMI1LOCK = 'hshdmi1lock'
-UC_UI_HSHDMI2LOCK = 'hshdmi2lock'
-UC_UI_HSHDMI3LOCK = 'hshdmi3lock'
-UC_UI_HSAVLOCK = 'hsavlock'
-
-# Ratings USA
-# Programme Restriction
-UC_UI_HSCOUNTRY = 'hscountry'
-UC_UI_HSRATINGS = 'hsratings'
-UC_UI_HSDOWNLOADABLEUSRATING = 'hsdownloadableusrating'
-UC_UI_HSUSA = 'hsuiusa'
-UC_UI_HSCANADA = 'hsuicanada'
-UC_UI_HSNONE = 'hsuinone'
-UC_UI_HSHIGHRESTRICTIONS = 'hshighrestrictions'
-UC_UI_HSMEDIUMRESTRICTIONS = 'hsmediumrestrictions'
-UC_UI_HSLOWRESTRICTIONS = 'hslowrestrictions'
-UC_UI_HSCUSTOMISED = 'hscustomised'
-
-UC_UI_HSTVY = 'hstvy'
-UC_UI_HSTVY7 = 'hstvy7'
-UC_UI_HSTVG = 'hstvg'
-UC_UI_HSTVPG = 'hstvpg'
-UC_UI_HSTV14 = 'hstv14'
-UC_UI_HSTVMA = 'hstvma'
-UC_UI_HSG = 'hsg'
-UC_UI_HSPG = 'hspg'
-UC_UI_HSPG13 = 'hspg13'
-UC_UI_HSR = 'hsr'
-UC_UI_HSNC17 = 'hsnc17'
-UC_UI_HSX = 'hsx'
-UC_UI_HSRNONE = 'hsrnone'
-
-UC_UI_HSTVY7L2 = 'hstvy7l2'
-UC_UI_HSTVY7FV = 'hstvy7fv'
-UC_UI_HSTVPGL2 = 'hstvpgl2'
-UC_UI_HSTVPGD = 'hstvpgd'
-UC_UI_HSTVPGL = 'hstvpgl'
-UC_UI_HSTVPGS = 'hstvpgs'
-UC_UI_HSTVPGV = 'hstvpgv'
-UC_UI_HSTV14L2 = 'hstv14l2'
-UC_UI_HSTV14D = 'hstv14d'
-UC_UI_HSTV14L = 'hstv14l'
-UC_UI_HSTV14S = 'hstv14s'
-UC_UI_HSTV14V = 'hstv14v'
-UC_UI_HSTVMAL2 = 'hstvmal2'
-UC_UI_HSTVMAL = 'hstvmal'
-UC_UI_HSTVMAS = 'hstvmas'
-UC_UI_HSTVMAV = 'hstvmav'
-
-# Ratings CANADA
-# Programme Restriction
-UC_UI_HSCRCOUNTRY = 'hscrcountry'
-UC_UI_HSCRRATINGS = 'hscrratings'
-UC_UI_HSCRUSA = 'hscruiusa'
-UC_UI_HSCRCANADA = 'hscruicanada'
-UC_UI_HSCRNONE = 'hsuicrnone'
-UC_UI_HSCRHIGHRESTRICTIONS = 'hscrhighrestrictions'
-UC_UI_HSCRMEDIUMRESTRICTIONS = 'hscrmediumrestrictions'
-UC_UI_HSCRLOWRESTRICTIONS = 'hscrlowrestrictions'
-UC_UI_HSCRCUSTOMISED = 'hscrcustomised'
-
-UC_UI_HSCRE = 'hscre'
-UC_UI_HSCRC = 'hscrc'
-UC_UI_HSCRC8 = 'hscrc8'
-UC_UI_HSCRG = 'hscrg'
-UC_UI_HSCRPG = 'hscrpg'
-UC_UI_HSCR14 = 'hscr14'
-UC_UI_HSCR18 = 'hscr18'
-UC_UI_HSCRFE = 'hscrfe'
-UC_UI_HSCRFG = 'hscrfg'
-UC_UI_HSCRF8ANS = 'hscrf8ans'
-UC_UI_HSCRF13ANS = 'hscrf13ans'
-UC_UI_HSCRF16ANS = 'hscrf16ans'
-UC_UI_HSCRF18ANS = 'hscrf18ans'
-UC_UI_HSCRTVY = 'hscrtvy'
-UC_UI_HSCRTVY7 = 'hscrtvy7'
-UC_UI_HSCRTVG = 'hscrtvg'
-UC_UI_HSCRTVPG = 'hscrtvpg'
-UC_UI_HSCRTV14 = 'hscrtv14'
-UC_UI_HSCRTVMA = 'hscrtvma'
-
-UC_UI_HSCRTVY7L2 = 'hscrtvy7l2'
-UC_UI_HSCRTVY7FV = 'hscrtvy7fv'
-UC_UI_HSCRTVPGL2 = 'hscrtvpgl2'
-UC_UI_HSCRTVPGD = 'hscrtvpgd'
-UC_UI_HSCRTVPGL = 'hscrtvpgl'
-UC_UI_HSCRTVPGS = 'hscrtvpgs'
-UC_UI_HSCRTVPGV = 'hscrtvpgv'
-UC_UI_HSCRTV14L2 = 'hscrtv14l2'
-UC_UI_HSCRTV14D = 'hscrtv14d'
-UC_UI_HSCRTV14L = 'hscrtv14l'
-UC_UI_HSCRTV14S = 'hscrtv14s'
-UC_UI_HSCRTV14V = 'hscrtv14v'
-UC_UI_HSCRTVMAL2 = 'hscrtvmal2'
-UC_UI_HSCRTVMAL = 'hscrtvmal'
-UC_UI_HSCRTVMAS = 'hscrtvmas'
-UC_UI_HSCRTVMAV = 'hscrtvmav'
-
-# Downloadable US Rating
-UC_UI_HSDUSROFF = 'hsdusroff'
-UC_UI_HSDUSRCUSTOMISED = 'hsdusrcustomised'
-UC_UI_HSDUSRCLEARALL = 'hsdusrclearall'
-UC_UI_HSENTIREAUDIANCE1 = 'hsentireaudiance1'
-UC_UI_HSENTIREAUDIANCE1NONE = 'hsentireaudiance1none'
-UC_UI_HSENTIREAUDIANCE1TVG = 'hsentireaudiance1tvg'
-UC_UI_HSDIALOGUE1 = 'hsdialogue1'
-UC_UI_HSDIALOGUE1D = 'hsdialogue1d'
-UC_UI_HSLANGUAGE1 = 'hslanguage1'
-UC_UI_HSLANGUAGE1L = 'hslanguage1l'
-UC_UI_HSSEX1 = 'hssex1'
-UC_UI_HSSEX1S = 'hssex1s'
-UC_UI_HSVIOLENCE1 = 'hsviolence1'
-UC_UI_HSVIOLENCE1V = 'hsviolence1v'
-UC_UI_HSCHILDREN1 = 'hschildren1'
-UC_UI_HSCHILDREN1TVY = 'hschildren1tvy'
-
-# Eco
-UC_UI_HSPOWERSAVING = 'hspowersaving'
-UC_UI_HSIDLETVSTANDBY = 'hsidletvstandby'
-UC_UI_HSAUTOSHUTOFF = 'hsautoshutoff'
-
-# IP Control
-UC_UI_HSCONTROLREMOTELY = 'hscontrolremotely'
-UC_UI_HSAUTHENTICATION = 'hsauthentication'
-UC_UI_HSPRESHAREDKEY = 'hspresharedkey'
-
-# Customer Support
-UC_UI_HSCONTACTANDSUPPORT = 'hscontactandsupport'
-UC_UI_HSSIGNALDIAGNOSTICS = 'hssignaldiagnostics'
-UC_UI_HSHELPGUIDE = 'hshelpguide'
-UC_UI_HSNOTICESANDLICENCES = 'hsnoticesandlicences'
-# Contact and Support
-UC_UI_HSCONTACTANDSUPPORTVIEW = 'hscontactandsupportview'
-# Signal Diagnostics
-UC_UI_HSSIGNALCHANNEL = 'hssignalchannel'
-UC_UI_HSSIGNALQUALITY = 'hssignalquality'
-UC_UI_HSSIGNALSTRENGTH = 'hssignalstrength'
-UC_UI_HSPHYSICALCHANNEL = 'hsphysicalchannel'
-UC_UI_HSSIGNALFREQUENCY = 'hssignalfrequency'
-UC_UI_HSMODULATION = 'hsmodulation'
-UC_UI_HSPOSTVITERBI = 'hspostviterbi'
-UC_UI_HSUEC = 'hsuec'
-UC_UI_HSSNR = 'hssnr'
-# Inside Settings from HOME        Inside Settings from HOME        Inside Settings from HOME        Inside Settings from HOME        Inside Settings from HOME        
-
-# Inside Settings from DTV        Inside Settings from DTV        Inside Settings from DTV        Inside Settings from DTV        Inside Settings from DTV
-UC_UI_FINISHSETTINGTV = 'finishsettingtv'
-UC_UI_TAKEBUGREPORT = 'takebugreport'
-UC_UI_NETWORKANDINTERNET = 'networkandinternet'
-UC_UI_ACCOUNTSANDSIGNIN = 'accountsandsignin'
-UC_UI_SAPPS = 'sapps'
-UC_UI_DEVICEPREFERENCES = 'devicepreferences'
-UC_UI_REMOTESANDACCESSORIES = 'remoteandaccessories'
-UC_UI_BRAVIASETTINGS = 'braviasettings'
-
-# Network and Internet
-UC_UI_WIFI = 'wifi'
-UC_UI_NETWORK1 = 'network1'
-UC_UI_NETWORK2 = 'network2'
-UC_UI_NETWORK3 = 'network3'
-UC_UI_SEEALL = 'seeall'
-UC_UI_ADDNEWNETWORK = 'addnewnetwork'
-UC_UI_SCANNINGALWAYSAVAILABLE = 'scanningalwaysavailable'
-UC_UI_NOTCONNECTED = 'notconnected'
-UC_UI_PROXYSETTINGS = 'proxysettings'
-UC_UI_IPSETTINGS = 'ipsettings'
-
-# Inside Apps
-UC_UI_APPS1 = 'apps1'
-UC_UI_APPS2 = 'apps2'
-UC_UI_APPS3 = 'apps3'
-UC_UI_APPS4 = 'apps4'
-UC_UI_APPS5 = 'apps5'
-UC_UI_SEEALLAPPS = 'seeallmaps'
-UC_UI_APPSPERMISSION = 'appspermission'
-UC_UI_SPECIALAPPACCESS = 'specialappaccess'
-UC_UI_SECURITYANDRESTRICTIONS = 'securityandrestrictions'
-
-# App Permissions
-UC_UI_BODYSENSORS = 'bodysensors'
-UC_UI_CALENDAR = 'calendar'
-UC_UI_CALLLOGS = 'calllogs'
-UC_UI_CAMERA = 'camera'
-UC_UI_CONTACTS = 'contacts'
-UC_UI_LOCATION = 'locations'
-UC_UI_MICROPHONE = 'microphone'
-UC_UI_SMS = 'sms'
-UC_UI_STORAGE = 'storage'
-UC_UI_TELEPHONE = 'telephone'
-UC_UI_ADDITIONALPERMISSION = 'additionalpermission'
-
-# Calendar Permissions
-UC_UI_CALENDARSHOWSYSTEMAPPS = 'calendarshowsystemapps'
-UC_UI_CALENDARGOOGLECALENDARSYNC = 'calendargooglecalendarsync'
-UC_UI_CALENDARGOOGLEPLAYSERVICES = 'calendargoogleplayservices'
-UC_UI_CALENDARGOOGLESEARCH = 'calendargooglesearch'
-# Call Log Permissions
-UC_UI_CALLLOGSSHOWSYSTEMAPPS = 'calllogsshowsystmeapps'
-UC_UI_CALLLOGSGOOGLEPLAYSERVICES = 'calllogsgoogleplayservices'
-# Camera Permissions
-UC_UI_CAMERAL2 = 'cameral2'
-UC_UI_CAMERAGALLERY = 'cameragallery'
-UC_UI_CAMERASHOWSYSTEMAPPS = 'camerashowsystemapps'
-UC_UI_CAMERAL3 = 'cameral3'
-UC_UI_CAMERAGOOGLEPLAYSERVICES = 'cameragoogleplayservices'
-UC_UI_CAMERAGOOGLESEARCH = 'cameragooglesearch'
-# Contacts Permissions
-UC_UI_CONTACTSGALLERY = 'contactsgallery'
-UC_UI_CONTACTSGOOGLEPLAYGAMES = 'contactsgoogleplaygames'
-UC_UI_CONTACTSGOOGLEPLAYSTORE = 'contactsgoogleplaystore'
-UC_UI_CONTACTSNETFLIX = 'contactsnetflix'
-UC_UI_CONTACTSSHOWSYSTEMAPPS = 'contactsshowsytemapps'
-UC_UI_CONTACTSBUGREPORTSENDER = 'contactsbugreportsender'
-UC_UI_CONTACTSCALENDARSTORAGE = 'contactscalendarstorage'
-UC_UI_CONTACTSGBOARD = 'contactsgboard'
-UC_UI_CONTACTSGOOGLEBACKUPTRANSPORT = 'contactsgooglebackuptransport'
-UC_UI_CONTACTSGOOGLECONTACTSSYNC = 'contactsgooglecontactssync'
-UC_UI_CONTACTSGOOGLEINDICKEYBOARD = 'contactsgoogleinidckeyboard'
-UC_UI_CONTACTSGOOGLEPLAYSERVICE = 'contactsgoogleplayservice'
-UC_UI_CONTACTSGOOGLESEARCH = 'contactsgooglesearch'
-UC_UI_CONTACTSGOOGLESERVICEFRAMEWORK = 'contactsgoogleserviceframework'
-UC_UI_CONTACTSPLAYMUSIC = 'contactsplaymusic'
-# Location Permissions
-UC_UI_LOCATIONANDROIDTVREMOTE = 'locationandroidremote'
-UC_UI_LOCATIONSERVICE = 'locationservice'
-UC_UI_LOCATIONEULA1 = 'locationeula1'
-UC_UI_LOCATIONEULA2 = 'locationeula2'
-UC_UI_LOCATIONEULA3 = 'locationeula3'
-UC_UI_LOCATIONGALLERY = 'locationgallery'
-UC_UI_LOCATIONGOOGLEPLAYSTORE = 'locationgoogleplaystore'
-UC_UI_LOCATIONHELP1 = 'locationhelp1'
-UC_UI_LOCATIONHELP2 = 'locationhelp2'
-UC_UI_LOCATIONSHOWSYSTEMAPPS = 'locationshowsystemapps'
-UC_UI_LOCATIONANDDROIDACCESSIBILITY = 'locationandroidaccessibility'
-UC_UI_LOCATIONCAMERA = 'locationcamera'
-UC_UI_LOCATIONGOOGLEPLAYMOVIESANDTV = 'locationgoogleplaymoviesandtv'
-UC_UI_LOCATIONGOOGLEPLAYSERVICES = 'locationgoogleplayservices'
-UC_UI_LOCATIONGOOGLESEARCH = 'locationgooglesearch'
-UC_UI_LOCATIONPLAYMUSIC = 'locationplaymusic'
-UC_UI_LOCATIONSETUPWIZARD = 'locationsetupwizard'
-# Microphone Permissions
-UC_UI_MICROPHONECAMERA = 'microphonecamera'
-UC_UI_MICROPHONEEULA1 = 'microphoneeula1'
-UC_UI_MICROPHONEEULA2 = 'microphoneeula2'
-UC_UI_MICROPHONEEULA3 = 'microphoneeula3'
-UC_UI_MICROPHONEGALLERY = 'microphonegallery'
-UC_UI_MICROPHONEGOOGLEPLAYSTORE = 'microphonegoogleplaystore'
-UC_UI_MICROPHONEHELP1 = 'microphonehelp1'
-UC_UI_MICROPHONEHELP2 = 'microphonehelp2'
-UC_UI_MICROPHONEYOUTUBE = 'microphoneyoutube'
-UC_UI_MICROPHONESHOWSYSTEMAPPS = 'microphoneshowsystemapps'
-UC_UI_MICROPHONEANDROIDACCESSIBILITY = 'microphoneandroidaccessibility'
-UC_UI_MICROPHONECAMERAL2 = 'microphonecameral2'
-UC_UI_MICROPHONEGBOARD = 'microphonegboard'
-UC_UI_MICROPHONEGOOGLEPLAYSERVICE = 'microphonegoogleplayservice'
-UC_UI_MICROPHONEGOOGLESEARCH = 'microphonegooglesearch'
-UC_UI_MICROPHONEPLAYMUSIC = 'microphoneplaymusic'
-# SMS Permissions
-UC_UI_SMSGOOGLEPLAYSTORE = 'smsgoogleplaystore'
-UC_UI_SMSSHOWSYSTEMAPPS = 'smsshowsystemapps'
-UC_UI_SMSGOOGLEPLAYSERVICES = 'smsgoogleplayservices'
-# Storage Permissions
-UC_UI_STORAGEANDROIDTVREMOTE = 'storageandroidtvremote'
-UC_UI_STORAGECAMERAL2 = 'storagecameral2'
-UC_UI_STORAGEEULA1 = 'storageeula1'
-UC_UI_STORAGEEULA2 = 'storageeula2'
-UC_UI_STORAGEEULA3 = 'storageeula3'
-UC_UI_STORAGEGALLERY = 'storagegallery'
-UC_UI_STORAGEHELP1 = 'storagehelp1'
-UC_UI_STORAGEHELP2 = 'storagehelp2'
-UC_UI_STORAGENETFLIX = 'storagenetflix'
-UC_UI_STORAGEQRMT = 'storageqrmt'
-UC_UI_STORAGESHOWSYSTEMAPPS = 'storageshowsystemapps'
-UC_UI_STORAGEBUGREPORTSENDER = 'storagebugreportsender'
-UC_UI_STORAGECALENDARSTORAGE = 'storagecalendarstorage'
-UC_UI_STORAGECAMERAL3 = 'storagecameral3'
-UC_UI_STORAGEDEMOAPP = 'storagestoragedemoapp'
-UC_UI_STORAGEGBOARD = 'storagegboard'
-UC_UI_STORAGEGOOGLEINDICKEYBOARD = 'storagegoogleindickeyboard'
-UC_UI_STORAGEGOOGLEPLAYSERVICES = 'storagegoogleplayservices'
-UC_UI_STORAGEGOOGLESEARCH = 'storagegooglesearch'
-UC_UI_STORAGEHTMLVIEWER = 'storagehtmlviewer'
-UC_UI_STORAGEMEDIAPLAYER = 'storagemediaplayer'
-UC_UI_STORAGEPLAYMUSIC = 'storageplaymusic'
-UC_UI_STORAGEPRIMEVIDEO = 'storageprimevideo'
-UC_UI_STORAGESETUPWIZARD = 'storagesetupwizard'
-UC_UI_STORAGETVSTORAGE = 'storagetvstorage'
-# Telephone Permissions
-UC_UI_TELEPHONEEULA1 = 'telephoneeula1'
-UC_UI_TELEPHONEEULA2 = 'telephoneeula2'
-UC_UI_TELEPHONEEULA3 = 'telephoneeula3'
-UC_UI_TELEPHONEGOOGLEPLAYSTORE = 'telephonegoogleplaystore'
-UC_UI_TELEPHONEHELP1 = 'telephonehelp1'
-UC_UI_TELEPHONEHELP2 = 'telephonehelp2'
-UC_UI_TELEPHONEQRMT = 'telephoneqrmt'
-UC_UI_TELEPHONESHOWSYSTEMAPPS = 'telephoneshowsystemapps'
-UC_UI_TELEPHONEANDROIDACCESSIBILITY = 'telephoneandroidaccessibility'
-UC_UI_TELEPHONEGOOGLEPLAYSERVICES = 'telephonegoogleplayservices'
-UC_UI_TELEPHONEGOOGLESEARCH = 'telephonegooglesearch'
-UC_UI_TELEPHONEGOOGLESERVICESFRAMEWORK = 'telephonegoogleservicesframework'
-UC_UI_TELEPHONESETTINGSSUGGESTIONS = 'telephonesettingssuggestions'
-# Additional Permissions
-UC_UI_READALLTVLISTINGS = 'readalltvlistings'
-UC_UI_READINSTANTMESSAGES = 'readinstantmessages'
-UC_UI_WRITEINSTANTMESSAGES = 'writeinstantmessages'
-# Read Instant messages permission
-UC_UI_READSHOWSYSTEMAPPS = 'readshowsystemapps'
-UC_UI_READGOOGLESERVICESFRAMEWORK = 'readgoogleservicesframework'
-# Write Instant messages permission
-UC_UI_WRITESHOWSYSTEMAPPS = 'writeshowsystemapps'
-UC_UI_WRITEGOOGLESERVICESFRAMEWORK = 'writegoogleservicesframework'
-
-# Special App Access
-UC_UI_ENERGYOPTIMISATION = 'energyoptimisation'
-UC_UI_USAGEACCESS = 'usageaccess'
-UC_UI_NOTIFICATIONACCESS = 'notificationaccess'
-UC_UI_DISPLAYOVEROTHERAPPS = 'displayoverotherapps'
-UC_UI_MODIFYSYSTEMSETTINGS = 'modifysystemsettings'
-UC_UI_DIRECTORYACCESS = 'directoryaccess'
-
-# Energy Optimisation
-
-# Usage Access
-UC_UI_USAGEACCESS2 = 'usageaccess2'
-UC_UI_USAGEBLUETOOTH = 'usagebluetooth'
-UC_UI_USAGEGOOGLEPLAYSERVICES = 'usagegoogleplayservices'
-UC_UI_USAGEGOOGLEPLAYSTORE = 'usagegoogleplaystore'
-UC_UI_USAGEGOOGLESEARCH = 'usagegooglesearch'
-UC_UI_USAGESHELL = 'usageshell'
-# Notification Access
-UC_UI_NOTIFICATIONACCESS2 = 'notificationaccess2'
-UC_UI_NOTIFICATIONANDROIDTVCORESERVICES = 'notificationandroidtvservices'
-# Allow Display Over Other Apps
-UC_UI_DISPLAYOVEROTHERAPPS2 = 'displayoverotherapps2'
-UC_UI_DISPLAYADVANCEDSETTINGS = 'displayadvancedsettings'
-UC_UI_DISPLAYANDROIDACCESSIBILITYSUITE = 'displayandroidaccessibilitysuite'
-UC_UI_DISPLAYANDROIDTVCORESERVICES = 'displayandroidtvcoreservices'
-UC_UI_DISPLAYANDROIDTVHOME = 'displayandroidhome'
-UC_UI_DISPLAYANDROIDTVREMOTESERVICE = 'displayandroidtvremoteservice'
-UC_UI_DISPLAYBRAVIASETTINGS = 'displaybraviasettings'
-UC_UI_DISPLAYCODECNOTIFICATION = 'displaycodenotification'
-UC_UI_DISPLAYCOMREALTEKSERVICEMENU = 'displaycomrealtekservicemenu'
-UC_UI_DISPLAYGOOGLEPLAYSERVICE = 'displaygoogleplayservice'
-UC_UI_DISPLAYGOOGLESEARCH = 'displaygooglesearch'
-UC_UI_DISPLAYMULTILINGUALKEYBOARD = 'displaymultilingualkeyboard'
-UC_UI_DISPLAYPLAYMUSIC = 'displayplaymusic'
-UC_UI_DISPLAYTEXTMAGNIFICATION = 'displaytextmagnification'
-UC_UI_DISPLAYTV = 'displaytv'
-# Modify System Settings
-UC_UI_MODIFYSYSTEMSETTINGS2 = 'modifysystemsettings2'
-UC_UI_MODIFYACTIONMENU = 'modifyactionmenu'
-UC_UI_MODIFYADVANCEDSETTINGS = 'modifyadvancedsettings'
-UC_UI_MODIFYBLUETOOTH = 'modifybluetooth'
-UC_UI_MODIFYBRAVIASETTINGS = 'modifybraviasettings'
-UC_UI_MODIFYCAMERA = 'modifycamera'
-UC_UI_MODIFYGALLERY = 'modifygallery'
-UC_UI_MODIFYGOOGLEBACKUPTRANSPORT = 'modifygooglebackuptransport'
-UC_UI_MODIFYGOOGLEPLAYSERVICE = 'modifygoogleplayservice'
-UC_UI_MODIFYGOOGLEPLAYSTORE = 'modifygoogleplaystore'
-UC_UI_MODIFYGOOGLESEARCH = 'modifygooglesearch'
-UC_UI_MODIFYGOOGLESERVICESFRAMEWORK = 'modifygoogleservicesframework'
-UC_UI_MODIFYMEDIASTORAGE = 'modifymediastorage'
-UC_UI_MODIFYPLAYMUSIC = 'modifyplaymusic'
-UC_UI_MODIFYQRMT = 'modifyqrmt'
-UC_UI_MODIFYSETUPWIZARD = 'modifysetupwizard'
-UC_UI_MODIFYSHELL = 'modifyshell'
-UC_UI_MODIFYTV = 'modifytv'
-# Directory Access
-UC_UI_DIRECTORYACCESS2 = 'directoryaccess2'
-
-# Security and Restrictions
-UC_UI_UNKNOWNSOURCES = 'unknownsources'
-UC_UI_VERIFYAPPS = 'verifyapps'
-# Install Unknown Apps
-UC_UI_DEMOAPP = 'demoapp'
-
-# Device Preferences
-UC_UI_ABOUT = 'about'
-UC_UI_DATEANDTIME = 'dateandtime'
-UC_UI_LANGUAGE = 'language'
-UC_UI_KEYBOARD = 'keyboard'
-UC_UI_DEVICESOUND = 'devicesound'
-UC_UI_DEVICESTORAGE = 'devicestorage'
-UC_UI_HOMESCREEN = 'homescreen'
-UC_UI_GOOGLEASSISTANT = 'googleassistant'
-UC_UI_CHROMECASTBUILTIN = 'chromecastbuiltin'
-UC_UI_SCREENSAVER = 'screensaver'
-UC_UI_DEVICELOCATION = 'devicelocation'
-UC_UI_USAGEANDDIAGNOSTICS = 'usageanddiagnostics'
-UC_UI_ACCESSIBILITY = 'accessibility'
-UC_UI_RESET = 'uireset'
-# About
-UC_UI_SYSTEMUPDATE = 'systemupdate'
-UC_UI_DEVICENAME = 'devicename'
-UC_UI_RESTART = 'restart'
-UC_UI_STATUS = 'status'
-UC_UI_LEGALINFORMATION = 'legalinformation'
-UC_UI_MODEL = 'model'
-UC_UI_NETFLIXESN = 'netflixesn'
-UC_UI_VERSION = 'version'
-UC_UI_ANDROID = 'android'
-UC_UI_KERNELVERSION = 'kernelversion'
-UC_UI_BUILD = 'build'
-# Status
-UC_UI_IPADDRESS = 'ipaddress'
-UC_UI_MACADDRESS = 'macaddress'
-UC_UI_BLUETOOTHADDRESS = 'bluetoothaddress'
-UC_UI_SERIALNUMBER = 'serialnumber'
-UC_UI_UPTIME = 'uptime'
-
-# Legal Information
-UC_UI_OPENSOURCE = 'opensource'
-UC_UI_GOOGLELEGAL = 'googlelegal'
-UC_UI_SYSTEMWEBVIEWLICENCES = 'systemwebviewlicences'
-UC_UI_ADS = 'ads'
-# Date And Time
-UC_UI_AUTOMATICDATEANDTIME = 'automaticdateandtime'
-UC_UI_SETDATE = 'setdate'
-UC_UI_SETTIME = 'settime'
-UC_UI_SETTIMEZONE = 'settimezone'
-UC_UI_USE24HOURFORMAT = 'use24hourformat'
-# Keyboard
-UC_UI_CURRENTKEYBOARD = 'currentkeyboard'
-UC_UI_GBOARDSETTINGS = 'gboardsettings'
-UC_UI_MANAGEKEYBOARD = 'managekeyboard'
-# Keyboard Settings
-UC_UI_GBOARDLANGUAGE = 'gboardlanguage'
-UC_UI_TERMSOFSERVICE = 'termsofservice'
-UC_UI_PRIVACYPOLICY = 'privacypolicy'
-UC_UI_KEYBOARDOPENSOURCELICENCES = 'keyboardopensourcelicences'
-UC_UI_SHAREUSAGESTATISTICS = 'shareusagestatistics'
-# Gboard Settings
-UC_UI_USESYSTEMLANGUAGES = 'usesytemlanguages'
-UC_UI_KENGLISH_US = 'kenglish_us'
-UC_UI_KENGLISH_UK = 'kenglish_uk'
-UC_UI_KSIMPLIFIEDCHINESE = 'ksimplifiedchinese'
-UC_UI_KTRADISIONALCHINESE = 'ktraditionalchinese'
-UC_UI_KFRENCH = 'kfrench'
-UC_UI_KGERMAN = 'kgerman'
-UC_UI_KGERMAN_SWITZERLAND = 'kgerman_switzerland'
-UC_UI_KHEBREW = 'khebrew'
-UC_UI_KHINDI1 = 'khindi1'
-UC_UI_KHINDI2 = 'khindi2'
-UC_UI_KITALIAN = 'kitalian'
-UC_UI_KITALIAN_SWITZERLAND = 'kitalian_switzerland'
-UC_UI_KJAPANESE = 'kjapanese'
-UC_UI_KKOREAN = 'kkorean'
-UC_UI_KNORWEGIAN_BOKMAL = 'knorwegian_bokmal'
-UC_UI_KRUSSIAN = 'krussian'
-UC_UI_KSPANISH = 'kspanish'
-UC_UI_KVIETNAMESE = 'kvietnamese'
-
-# Available Virtual Keyboard
-UC_UI_KEYBOARDGBOARD = 'keyboardgboard'
-UC_UI_GOOGLEINDICKEYBOARD = 'googleindickeyboard'
-UC_UI_GOOGLEVOICETYPING = 'googlevoicetyping'
-UC_UI_MULTILINGUALKEYBOARD = 'multilingualkeyboard'
-UC_UI_VIRTUALREMOTEKEYBOARD = 'virtualremotekeyboard'
-# Device Sound
-UC_UI_SYSTEMSOUND = 'systemsound'
-# Device Storage
-UC_UI_INTERNALSHAREDSTORAGE = 'internalsharedstorge'
-# Internal Shared Storage
-UC_UI_INTERNALAPPS = 'intnernalaps'
-UC_UI_INTERNALPHOTOSANDVIDEOS = 'internalphotosandvideos'
-UC_UI_INTERNALAUDIO = 'internalaudio'
-UC_UI_INTERNALDOWNLOAD = 'internaldownload'
-UC_UI_INTERNALCACHED = 'internalcached'
-UC_UI_INTERNALMISC = 'internalmisc'
-UC_UI_INTERNALAVAILABLE = 'internalavailable'
-
-# Home Screen
-# Channels
-UC_UI_CUSTOMISECHANNELS = 'customisechannels'
-UC_UI_ENABLEVIDEOPREVIEWS = 'enablevideopreviews'
-UC_UI_ENABLEAUDIOPREVIEWS = 'enableaudiopreviews'
-# Apps
-UC_UI_REORDERAPPS = 'reorderapps'
-UC_UI_REORDERGAMES = 'reordergames'
-# Open-Source Licences
-UC_UI_ANDROIDTVHOME = 'androidtvhome'
-UC_UI_ANDROIDTVCORESERVICES = 'androidtvcoreservices'
-# Customise Channels
-UC_UI_PLAYNEXT = 'playnext'
-UC_UI_CUSTOMISECHANNELSTV = 'customisechannelstv'
-UC_UI_PLAYNEXTL2 = 'playnextl2'
-UC_UI_PLAYNEXTTV = 'playnexttv'
-# Google Assistant
-UC_UI_ACCOUNTS = 'accounts'
-UC_UI_SEARCHABLEAPPS = 'searchableapps'
-UC_UI_SAFESEARCHFILTER = 'safesearchfilter'
-UC_UI_BLOCKOFFENSIVEWORDS = 'blockoffensivewords'
-UC_UI_TEMPERATUREUNIT = 'temperatureunit'
-UC_UI_GOOGLEOPENSOURCELICENCES = 'gooleopensourcelicences'
-# Google Assistant
-UC_UI_SEARCHABLEAPPSGOOGLEPLAYGAMES = 'searchableappsgoogleplaygames'
-UC_UI_SEARCHABLEAPPSTV = 'searchableappstv'
-# Chromecast Built-in
-UC_UI_CHROMEOPENSOURCELICENSE = 'chromeopensourcelicense'
-UC_UI_VERSIONNUMBERS = 'versionnumbers'
-# Screen Saver
-UC_UI_SCREENSAVERL2 = 'screensaverl2'
-UC_UI_WHENTOSTART = 'whentostart'
-UC_UI_PUTDEVICETOSLEEP = 'putdevicetosleep'
-UC_UI_STARTNOW = 'startnow'
-# Start Screen Saver
-UC_UI_STARTSCREENSAVER = 'startscreensaver'
-# Location
-UC_UI_LOCATIONSTATUS = 'locationstatus'
-# Usage and Diafnostics
-UC_UI_USAGEANDDIAGNOSTICSL2 = 'usageanddiagnosticsl2'
-UC_UI_ACCESSIBILITYCAPTIONS = 'accessibilitycaptions'
-UC_UI_ACCESSIBILITYAUDIODESCRIPTION = 'accessibilityaudiodescription'
-UC_UI_ACCESSIBILITYHIGHCONTRASTTEXT = 'accessibilityhighcontrasttext'
-UC_UI_ACCESSIBILITYTEXTTOSPEECH = 'accessibilitytexttospeech'
-UC_UI_ACCESSIBILITYSHORTCUT = 'accessibilityshortcut'
-UC_UI_ACCESSIBILITYTALKBACK = 'accessibilitytalkback'
-UC_UI_ACCESSIBILITYSWITCHACCESS = 'accessibilityswitchaccess'
-UC_UI_ACCESSIBILITYTEXTMAGNIFICATION = 'accessibilitytextmagnification'
-UC_UI_ACCESSIBILITYSCREENREADER = 'accessibilityscreenreader'
-# Captions
-UC_UI_CAPTIONSDISPLAY = 'captionsdisplay'
-# Display Options
-UC_UI_CAPTIONSLANGUAGE = 'captionslanguage'
-UC_UI_CAPTIONSTEXTSIZE = 'captionstextsize'
-# Caption Style
-UC_UI_CAPTIONSWHITEONBLACK = 'captionswhiteonblack'
-UC_UI_CAPTIONSBLACKONWHITE = 'captionsblackonwhite'
-UC_UI_CAPTIONSYELLOWONBLACK = 'captionsyellowonblack'
-UC_UI_CAPTIONSYELLOWONBLUE = 'captionsyellowonblue'
-UC_UI_CAPTIONSCUSTOMIZED = 'captionscustomized'
-# Caption Customised
-UC_UI_FONTFAMILY = 'fontfamily'
-UC_UI_TEXTFLASHING = 'textflashing'
-UC_UI_TEXTCOLOUR = 'textcolour'
-UC_UI_TEXTOPACITY = 'textopacity'
-UC_UI_EDGETYPE = 'edgetype'
-UC_UI_EDGECOLOUR = 'edgecolour'
-UC_UI_SHOWBACKGROUND = 'showbackground'
-UC_UI_BACKGROUNDFLASHING = 'backgroundflashing'
-UC_UI_BACKGROUNDCOLOUR = 'backgroundcolour'
-UC_UI_BACKGROUNDOPACITY = 'backgroundopacity'
-UC_UI_SHOWWINDOW = 'showwindow'
-UC_UI_WINDOWCOLOUR = 'windowcolour'
-UC_UI_WINDOWOPACITY = 'windowopacity'
-
-# Audio Setup
-UC_UI_AUDIODESCRIPTION = 'audiodescription'
-UC_UI_MIXINGLEVEL = 'mixinglevel'
-UC_UI_AUDIOTYPE = 'audiotype'
-UC_UI_APRIMARYPREFEREDLANGUAGE = 'aprimarypreferedlanguage'
-UC_UI_ASECONDARYPREFEREDLANGUAGE = 'asecondarypreferedlanguage'
-# Text to Speech Output
-UC_UI_GOOGLETEXTTOSPEECHENGINE = 'googletexttospeechengine'
-UC_UI_ENGINECONFIGURATION = 'engineconfiguration'
-UC_UI_SPEECHRATE = 'speechrate'
-UC_UI_LISTENTOANEXAMPLE = 'listentoanexample'
-UC_UI_DEFAULTLANGUAGESTATUS = 'defaultlanguagestatus'
-# Engine Configuration
-UC_UI_GOOGLETEXTTOSPEECHLANGUAGE = 'googletexttospeechlanguage'
-UC_UI_SETTINGSFORGOOGLETEXTTOSPEECHENGINE = 'settingsforgoogletexttospeechengine'
-UC_UI_INSTALLVOICEDATA = 'installvoicedata'
-# Accessibility Shortcut
-UC_UI_ENABLEACCESSIBILITYSHORTCUT = 'enableaccessibilityshortcut'
-UC_UI_SHORTCUTSERVICE = 'shortcutservice'
-# Talkback
-UC_UI_TALKBACKENABLE = 'talkbackenable'
-UC_UI_TALKBACKCONFIGURATION = 'talkbackconfiguration'
-# Switch Access
-UC_UI_SWITCHACCESSENABLE = 'switchaccessenable'
-UC_UI_SWITCHACCESSCONFIGURATION = 'switchaccessconfiguration'
-# Text Magnification
-UC_UI_TEXTMAGNIFICATIONENABLE = 'textmagnificationenable'
-UC_UI_TEXTMAGNIFICATIONCONFIGURATION = 'textmagnificationconfiguration'
-UC_UI_TEXTMAGNIFICATIONCOLOUR = 'textmagnificationcolour'
-UC_UI_TEXTMAGNIFICATIONDURATION = 'textmagnificationduration'
-# Screen Reader
-UC_UI_SCREENREADERENABLE = 'screenreaderenable'
-UC_UI_SCREENREADERCONFIGURATION = 'screenreaderconfiguration'
-# Bravia Settings
-UC_UI_CHANNELSETUP = 'channelsetup'
-UC_UI_PICTURE = 'picture'
-UC_UI_SOUND = 'sound'
-UC_UI_SCREEN = 'screen'
-UC_UI_REMOTESTART = 'remotestart'
-UC_UI_BLUETOOTH = 'bluetooth'
-UC_UI_VOICEREMOTECONTROL = 'voiceremotecontrol'
-UC_UI_SPEAKERS = 'speakers'
-UC_UI_TVPOSITION = 'tvposition'
-UC_UI_DIGITALAUDIOOUT = 'digitalaudioout'
-UC_UI_EXTERNALINPUTS = 'externalinputs'
-UC_UI_PARENTALCONTROLS = 'parentalcontrols'
-UC_UI_ECO = 'eco'
-UC_UI_IPCONTROL = 'ipcontrol'
-UC_UI_CUSTOMERSUPPORT = 'customersupport'
-
-# Channel Setup
-UC_UI_SIGNALTYPE = 'signaltype'
-UC_UI_ANALOGUESETUP = 'analoguesetup'
-UC_UI_DIGITALSETUP = 'digitalsetup'
-UC_UI_SHOWNCHANNELS = 'shownchannels'
-UC_UI_CAPTIONS = 'captions'
-UC_UI_PREFERREDLANGUAGE = 'preferredlanguage'
-# Analaogue Setup
-UC_UI_ANALOGUEAUTOTUNING = 'analogueautotuning'
-UC_UI_PROGRAMMELABELS = 'programmelabels'
-# Digital Setup
-UC_UI_DSIGNALTYPE = 'dsignaltype'
-UC_UI_DIGITALAUTOTUNING = 'digitalautotuning'
-UC_UI_MANUALTUNING = 'manualtuning'
-# Manual Tuning
-UC_UI_SCANTYPE = 'scantype'
-UC_UI_CHANNELNUMBER = 'channelnumber'
-UC_UI_FREQUENCY = 'frequency'
-UC_UI_SCAN = 'scan'
-# Captions
-UC_UI_CCDISPLAY = 'ccdisplay'
-UC_UI_ANALOGUECC = 'analogcc'
-UC_UI_DIGITALCC = 'digitalcc'
-UC_UI_DIGITALCCOPTIONS = 'digitalccoptions'
-# Preffered Language
-UC_UI_PREFERREDAUDIO1 = 'preferredaudio1'
-UC_UI_PREFERREDAUDIO2 = 'preferredaudio2'
-UC_UI_PREFERREDCC1 = 'preferredcc1'
-UC_UI_PREFERREDCC2 = 'preferredcc2'
-
-# Picture
-UC_UI_PICTUREMODE = 'picturemode'
-UC_UI_BRIGHTNESS = 'brightness'
-UC_UI_COLOUR = 'colour'
-UC_UI_PICTUREADVANCED = 'pictureadvanced'
-# Advanced Picture
-# Brightness
-UC_UI_BRIGHTNESSL2 = 'brightnessl2'
-UC_UI_BRIGHTNESSL3 = 'brightnessl3'
-UC_UI_CONTRAST = 'contrast'
-UC_UI_GAMMA = 'gamma'
-UC_UI_BLACKLEVEL = 'blacklevel'
-UC_UI_BLACKADJUST = 'blackadjust'
-UC_UI_ADVCONTRASTENHANCER = 'advcontrastenhancer'
-# Colour
-UC_UI_COLOURL2 = 'colourl2'
-UC_UI_COLOURL3 = 'colourl3'
-UC_UI_HUE = 'hue'
-UC_UI_COLOURTEMPERATURE = 'colourtemperature'
-UC_UI_ADVCOLOURTEMPERATURE = 'advcolourtemperature'
-UC_UI_LIVECOLOUR = 'livecolour'
-# Adv colour temperature
-UC_UI_CRESET = 'creset'
-UC_UI_BASIC = 'uibasic'
-UC_UI_RGAIN = 'rgain'
-UC_UI_GGAIN = 'ggain'
-UC_UI_BGAIN = 'bgain'
-UC_UI_RBIAS = 'rbias'
-UC_UI_GBIAS = 'gbias'
-UC_UI_BBIAS = 'bbias'
-UC_UI_MULTIPOINT = 'multipoint'
-UC_UI_COLOURGAMMAADJUSTMENTPOINT = 'colourgammaadjustmentpoint'
-UC_UI_ROFFSET = 'roofset'
-UC_UI_GOFFSET = 'goofset'
-UC_UI_BOFFSET = 'boofset'
-# Clarity
-UC_UI_CLARITY = 'clarity'
-UC_UI_SHARPNESS = 'sharpness'
-UC_UI_REALITYCREATION = 'realitycreation'
-UC_UI_RESOLUTION = 'resolution'
-UC_UI_RANDOMNOISEREDUCTION = 'randomnoisereduction'
-UC_UI_DIGITALNOISEREDUCTION = 'digitalnoisereduction'
-UC_UI_MOTION = 'motion'
-UC_UI_MOTIONFLOW = 'motionflow'
-UC_UI_SMOOTHNESS = 'smoothness'
-UC_UI_CLEARNESS = 'clearness'
-UC_UI_FILMMODE = 'filmmode'
-UC_UI_VIDEOOPTION = 'videooption'
-UC_UI_HDMIVIDEORANGE = 'hdmivideorange'
-UC_UI_PRESET = 'preset'
-UC_UI_PRESETL2 = 'presetl2'
-
-# Sound
-UC_UI_DIALOGUEENHANCER = 'dialogueenhancer'
-UC_UI_SURROUND = 'surround'
-UC_UI_SOUNDADVANCED = 'soundadvanced'
-UC_UI_COMMON = 'common'
-UC_UI_AUTOVOLUME = 'autovolume'
-UC_UI_BALANCE = 'balance'
-UC_UI_DIGITALAUDIOOUTVOLUME = 'digitalaudiovolume'
-UC_UI_INPUTRELATED = 'inputrelated'
-UC_UI_VOLUMEOFFSET = 'volumeoffset'
-UC_UI_DYNAMICRANGE = 'dynamicrange'
-UC_UI_SRESET = 'sreset'
-UC_UI_SRESETL2 = 'sresetl2'
-
-# Screen
-UC_UI_WIDEMODE = 'widemode'
-UC_UI_43DEFAULT = '43default'
-
-# External Input
-UC_UI_MANAGEINPUTS = 'manageinputs'
-UC_UI_HDMICECSETTINGS = 'hdmicecsettings'
-UC_UI_CUSTOMISETVKEY = 'customisetvkey'
-UC_UI_HDMISIGNALFORMAT = 'hdmisignalformat'
-# Manage Inputs
-# analogue
-UC_UI_ANALOGUE = 'uianalogue'
-UC_UI_ANALOGUEDISPLAY = 'analoguedisplay'
-# digital
-UC_UI_DIGITAL = 'uidigital'
-UC_UI_DIGITALDISPLAY = 'digitaldisplay'
-# hdmi1
-UC_UI_HDMI1 = 'uihdmi1'
-UC_UI_HDMI1DISPLAY = 'hdmi1display'
-UC_UI_HDMI1LABEL = 'hdmi1label'
-# hdmi2
-UC_UI_HDMI2 = 'uihdmi2'
-UC_UI_HDMI2DISPLAY = 'hdmi2display'
-UC_UI_HDMI2LABEL = 'hdmi2label'
-# hdmi3
-UC_UI_HDMI3 = 'uihdmi3'
-UC_UI_HDMI3DISPLAY = 'hdmi3display'
-UC_UI_HDMI3LABEL = 'hdmi3label'
-# av
-UC_UI_AV = 'uiav'
-UC_UI_AVDISPLAY = 'avdisplay'
-UC_UI_AVLABEL = 'avlabel'
-# Hdmi CEC Settings
-UC_UI_CEC = 'cec'
-UC_UI_AUTODEVICESOFF = 'autodeviceoff'
-UC_UI_AUTOTVON = 'autotvon'
-# Hdmi Signal Format
-UC_UI_HSFHDMI1 = 'hsfhdmi1'
-UC_UI_HSFHDMI2 = 'hsfhdmi2'
-UC_UI_HSFHDMI3 = 'hsfhdmi3'
-
-# Parental Control
-UC_UI_PARENTALONOFF = 'parentalonoff'
-UC_UI_EXTERNALINPUTLOCK = 'externalinputlock'
-UC_UI_CHANNELSBLOCKED = 'channelsblocked'
-UC_UI_PROGRAMMERESTRICTIONS = 'programmerestrictions'
-UC_UI_CHANGEPIN = 'changepin'
-UC_UI_CHANGEPIN2 = 'changepin2'
-# External Input lock
-UC_UI_BLOCKALL = 'blockall'
-UC_UI_ANALOGUELOCK = 'analoguelock'
-UC_UI_DIGITALLOCK = 'digitallock'
-UC_UI_HDMI1LOCK = 'hdmi1lock'
-UC_UI_HDMI2LOCK = 'hdmi2lock'
-UC_UI_HDMI3LOCK = 'hdmi3lock'
-UC_UI_AVLOCK = 'avlock'
-
-# Ratings USA
-# Programme Restriction
-UC_UI_COUNTRY = 'country'
-UC_UI_RATINGS = 'ratings'
-UC_UI_DOWNLOADABLEUSRATING = 'downloadableusrating'
-UC_UI_USA = 'uiusa'
-UC_UI_CANADA = 'uicanada'
-UC_UI_NONE = 'uinone'
-UC_UI_HIGHRESTRICTIONS = 'highrestrictions'
-UC_UI_MEDIUMRESTRICTIONS = 'mediumrestrictions'
-UC_UI_LOWRESTRICTIONS = 'lowrestrictions'
-UC_UI_CUSTOMISED = 'customised'
-
-UC_UI_TVY = 'tvy'
-UC_UI_TVY7 = 'tvy7'
-UC_UI_TVG = 'tvg'
-UC_UI_TVPG = 'tvpg'
-UC_UI_TV14 = 'tv14'
-UC_UI_TVMA = 'tvma'
-UC_UI_G = 'g'
-UC_UI_PG = 'pg'
-UC_UI_PG13 = 'pg13'
-UC_UI_R = 'r'
-UC_UI_NC17 = 'nc17'
-UC_UI_X = 'x'
-UC_UI_RNONE = 'uirnone'
-
-UC_UI_TVY7L2 = 'tvy7l2'
-UC_UI_TVY7FV = 'tvy7fv'
-UC_UI_TVPGL2 = 'tvpgl2'
-UC_UI_TVPGD = 'tvpgd'
-UC_UI_TVPGL = 'tvpgl'
-UC_UI_TVPGS = 'tvpgs'
-UC_UI_TVPGV = 'tvpgv'
-UC_UI_TV14L2 = 'tv14l2'
-UC_UI_TV14D = 'tv14d'
-UC_UI_TV14L = 'tv14l'
-UC_UI_TV14S = 'tv14s'
-UC_UI_TV14V = 'tv14v'
-UC_UI_TVMAL2 = 'tvmal2'
-UC_UI_TVMAL = 'tvmal'
-UC_UI_TVMAS = 'tvmas'
-UC_UI_TVMAV = 'tvmav'
-
-# Ratings CANADA
-# Programme Restriction
-UC_UI_CRCOUNTRY = 'crcountry'
-UC_UI_CRRATINGS = 'crratings'
-UC_UI_CRUSA = 'cruiusa'
-UC_UI_CRCANADA = 'cruicanada'
-UC_UI_CRNONE = 'uicrnone'
-UC_UI_CRHIGHRESTRICTIONS = 'crhighrestrictions'
-UC_UI_CRMEDIUMRESTRICTIONS = 'crmediumrestrictions'
-UC_UI_CRLOWRESTRICTIONS = 'crlowrestrictions'
-UC_UI_CRCUSTOMISED = 'crcustomised'
-
-UC_UI_CRE = 'cre'
-UC_UI_CRC = 'crc'
-UC_UI_CRC8 = 'crc8'
-UC_UI_CRG = 'crg'
-UC_UI_CRPG = 'crpg'
-UC_UI_CR14 = 'cr14'
-UC_UI_CR18 = 'cr18'
-UC_UI_CRFE = 'crfe'
-UC_UI_CRFG = 'crfg'
-UC_UI_CRF8ANS = 'crf8ans'
-UC_UI_CRF13ANS = 'crf13ans'
-UC_UI_CRF16ANS = 'crf16ans'
-UC_UI_CRF18ANS = 'crf18ans'
-UC_UI_CRTVY = 'crtvy'
-UC_UI_CRTVY7 = 'crtvy7'
-UC_UI_CRTVG = 'crtvg'
-UC_UI_CRTVPG = 'crtvpg'
-UC_UI_CRTV14 = 'crtv14'
-UC_UI_CRTVMA = 'crtvma'
-
-UC_UI_CRTVY7L2 = 'crtvy7l2'
-UC_UI_CRTVY7FV = 'crtvy7fv'
-UC_UI_CRTVPGL2 = 'crtvpgl2'
-UC_UI_CRTVPGD = 'crtvpgd'
-UC_UI_CRTVPGL = 'crtvpgl'
-UC_UI_CRTVPGS = 'crtvpgs'
-UC_UI_CRTVPGV = 'crtvpgv'
-UC_UI_CRTV14L2 = 'crtv14l2'
-UC_UI_CRTV14D = 'crtv14d'
-UC_UI_CRTV14L = 'crtv14l'
-UC_UI_CRTV14S = 'crtv14s'
-UC_UI_CRTV14V = 'crtv14v'
-UC_UI_CRTVMAL2 = 'crtvmal2'
-UC_UI_CRTVMAL = 'crtvmal'
-UC_UI_CRTVMAS = 'crtvmas'
-UC_UI_CRTVMAV = 'crtvmav'
-
-# Downloadable US Rating
-UC_UI_DUSROFF = 'dusroff'
-UC_UI_DUSRCUSTOMISED = 'dusrcustomised'
-UC_UI_DUSRCLEARALL = 'dusrclearall'
-UC_UI_ENTIREAUDIANCE1 = 'entireaudiance1'
-UC_UI_ENTIREAUDIANCE1NONE = 'entireaudiance1none'
-UC_UI_ENTIREAUDIANCE1TVG = 'entireaudiance1tvg'
-UC_UI_DIALOGUE1 = 'dialogue1'
-UC_UI_DIALOGUE1D = 'dialogue1d'
-UC_UI_LANGUAGE1 = 'language1'
-UC_UI_LANGUAGE1L = 'language1l'
-UC_UI_SEX1 = 'sex1'
-UC_UI_SEX1S = 'sex1s'
-UC_UI_VIOLENCE1 = 'violence1'
-UC_UI_VIOLENCE1V = 'violence1v'
-UC_UI_CHILDREN1 = 'children1'
-UC_UI_CHILDREN1TVY = 'children1tvy'
-
-# Eco
-UC_UI_POWERSAVING = 'powersaving'
-UC_UI_IDLETVSTANDBY = 'idletvstandby'
-UC_UI_AUTOSHUTOFF = 'autoshutoff'
-
-# IP Control
-UC_UI_CONTROLREMOTELY = 'controlremotely'
-UC_UI_AUTHENTICATION = 'authentication'
-UC_UI_PRESHAREDKEY = 'presharedkey'
-
-# Customer Support
-UC_UI_CONTACTANDSUPPORT = 'contactandsupport'
-UC_UI_SIGNALDIAGNOSTICS = 'signaldiagnostics'
-UC_UI_HELPGUIDE = 'helpguide'
-UC_UI_NOTICESANDLICENCES = 'noticesandlicences'
-# Contact and Support
-UC_UI_CONTACTANDSUPPORTVIEW = 'contactandsupportview'
-# Signal Diagnostics
-UC_UI_SIGNALCHANNEL = 'signalchannel'
-UC_UI_SIGNALQUALITY = 'signalquality'
-UC_UI_SIGNALSTRENGTH = 'signalstrength'
-UC_UI_PHYSICALCHANNEL = 'physicalchannel'
-UC_UI_SIGNALFREQUENCY = 'signalfrequency'
-UC_UI_MODULATION = 'modulation'
-UC_UI_POSTVITERBI = 'postviterbi'
-UC_UI_UEC = 'uec'
-UC_UI_SNR = 'snr'
-# Inside Settings from DTV        Inside Settings from DTV        Inside Settings from DTV        Inside Settings from DTV        Inside Settings from DTV
-
-# FACTORY RESET
-UC_UI_FENGLISH_US = 'uienglish_us'
-UC_UI_FAFRIKAANS = 'uiafrikaans'
-UC_UI_FENGLISH_UK = 'uienglish_uk'
-UC_UI_FESPANOL = 'uiespanol'
-UC_UI_FFRANCAIS_CANADA = 'uifrancais_canada'
-UC_UI_FFRANCAIS_FRANCE = 'uifrancais_france'
-UC_UI_FINDONESIA = 'uiindonesia'
-UC_UI_FISIZULU = 'uiisizulu'
-UC_UI_FKISWAHILI = 'uikiswahili'
-UC_UI_FPORTUGUES = 'uiportugues'
-UC_UI_FTIENGVIET = 'uitiengviet'
-UC_UI_FRUSSIAN = 'uirussian'
-UC_UI_FARABIC = 'uiarabic'
-UC_UI_FFARSI = 'uifarsi'
-UC_UI_FMARATHI = 'uimarathi'
-UC_UI_FHINDI = 'uihindi'
-UC_UI_FBENGALI = 'uibengali'
-UC_UI_FPUNJABI = 'uipunjabi'
-UC_UI_FGUJARATHI = 'uigujarathi'
-UC_UI_FTAMIL = 'uitamil'
-UC_UI_FTELUGU = 'uitelugu'
-UC_UI_FKANNADA = 'uikannada'
-UC_UI_FMALAYALAM = 'uimalayalam'
-UC_UI_FTHAI = 'uithai'
-UC_UI_FSIMPLIFIEDCHINESE = 'uisimplifiedchinese'
-UC_UI_FTRADISIONALCHINESE = 'uitradisionalchinese'
-
-UC_UI_FCONTINUE = 'fcontinue'
-UC_UI_FLSKIP = 'flskip'
-UC_UI_FWIFI1 = 'fwifi1'
-
-UC_UI_FOTHERNETWORK = 'fothernetwork'
-UC_UI_FUSEETHERNET = 'fuseethernet'
-UC_UI_FSKIP = 'fskip'
-
-UC_UI_FUSA = 'fusa'
-UC_UI_FCANADA = 'fcanada'
-UC_UI_FBELIZE = 'fbelize'
-UC_UI_FDOMINICANREPUBLIC = 'fdominicanrepublic'
-UC_UI_FPUERTORICO = 'fpuertorico'
-UC_UI_FOTHER = 'uifother'
-UC_UI_FAREAEXCLUDINGABOVE = 'uiareaexcludingabove'
-UC_UI_FOK = 'fok'
-UC_UI_FDONE = 'fdone'
-
-
-#---------------------------
-# IPTV UI
-#---------------------------
-
-
-#---------------------------
-# YouTube's UI Structure Function
-#---------------------------
-YT_UI_ACCOUNTS = 'accounts'
-YT_UI_SIGNOUT = 'sign out'
-YT_UI_SEARCH = 'searchyt'
-YT_UI_HOME = 'homeyt'
-YT_UI_MUSIC = 'music'
-YT_UI_GAMING = 'gaming'
-YT_UI_NEWS = 'news'
-YT_UI_MOVIES = 'movies'
-YT_UI_SUBSCRIPTIONS = 'subscriptions'
-YT_UI_LIBRARY = 'library'
-YT_UI_SETTINGS = 'settings'
-YT_UI_HOMEVIDEO1 = 'homevideo1'
-YT_UI_HOMEVIDEO2 = 'homevideo2'
-YT_UI_HOMEVIDEO3 = 'homevideo3'
-YT_UI_HOMEVIDEO4 = 'homevideo4'
-YT_UI_MUSICVIDEO1 = 'musicvideo1'
-YT_UI_MUSICVIDEO2 = 'musicvideo2'
-YT_UI_MUSICVIDEO3 = 'musicvideo3'
-YT_UI_GAMINGVIDEO1 = 'gamingvideo1'
-YT_UI_GAMINGVIDEO2 = 'gamingvideo2'
-YT_UI_GAMINGVIDEO3 = 'gamingvideo3'
-YT_UI_NEWSVIDEO1 = 'newsvideo1'
-YT_UI_NEWSVIDEO2 = 'newsvideo2'
-YT_UI_NEWSVIDEO3 = 'newsvideo3'
-YT_UI_MOVIES1 = 'movies1'
-# Subcriptions layer
-YT_UI_ALL = 'all'
-YT_UI_PLAYALL = 'playall'
-YT_UI_SUBSCRIPTIONSACC1 = 'subscriptionsacc1'
-YT_UI_SUBSCRIPTIONSACC1VIDEO1 = 'subscriptionsacc1video1'
-YT_UI_HISTORY = 'history'
-YT_UI_HISTORYVIDEO1 = 'historyvideo1'
-YT_UI_MYVIDEOS = 'myvideos'
-YT_UI_MYVIDEOS1 = 'myvideos1'
-YT_UI_WATCHLATER = 'watchlater'
-NVIDIA720P = 'nvidia720p'
-NVIDIA1080P = 'nvidia1080p'
-BIGBUCKBUNNY = 'bigbuckbunny'
-SEANPRINTSAMOTOR = 'seanprintsamotor'
-HDRTESTFOOTAGE = 'hdrtestfootage'
-INKDROPSVIDEO = 'inkdropsvideo'
-VIDEOTEST1440P = 'videotest1440p'
-MEGACOASTER360 = 'megacoaster360'
-VRELEMENTAL360 = 'vrelemental360'
-ADELEHELLO = 'adelehello'
-VIDEO4KCONTENT1 = 'video4kcontent1'
-VIDEO4KCONTENT2 = 'VIDEO4KCONTENT2'
-VIDEO4KCONTENT3 = 'VIDEO4KCONTENT3'
-VIDEO4KCONTENT4 = 'VIDEO4KCONTENT4'
-VIDEO4KCONTENT5 = 'VIDEO4KCONTENT5'
-VIDEO2KCONTENT1 = 'VIDEO2KCONTENT1'
-VIDEO2KCONTENT2 = 'VIDEO2KCONTENT2'
-VIDEO2KCONTENT3 = 'VIDEO2KCONTENT3'
-VIDEO2KCONTENT4 = 'VIDEO2KCONTENT4'
-VIDEO2KCONTENT5 = 'VIDEO2KCONTENT5'
-SUBTITLEVIDEO1 = 'subtitlevideo1'
-SUBTITLEVIDEO2 = 'subtitlevideo2'
-SUBTITLEVIDEO3 = 'subtitlevideo3'
-SUBTITLEVIDEO4 = 'subtitlevideo4'
-SUBTITLEVIDEO5 = 'subtitlevideo5'
-VIDEO24FPS = 'video24fps'
-VIDEO25FPS = 'video25fps'
-VIDEO30FPS = 'video30fps'
-VIDEONO26 = 'videono26'
-VIDEONO27 = 'videono27'
-VIDEONO28 = 'videono28'
-YT_UI_PURCHASES = 'purchases'
-YT_UI_PURCHASESVIDEO1 = 'purchasesvideo1'
-YT_UI_POPULARRIGHTNOW = 'popularrightnow'
-YT_UI_POPULARRIGHTNOWVIDEO1 = 'popularrightnowvideo1'
-YT_UI_LIKEDVIDEOS = 'likedvideos'
-YT_UI_LIKEDVIDEOS1 = 'likedvideos1'
-YT_UI_AUTOTEST = 'autotest'
-YT_UI_AUTOTESTVIDEO1 = 'autotestvideo1'
-YT_UI_TESTPACK = 'testpack'
-RATIO219 = 'ratio219'
-RATIO169 = 'ratio169'
-RATIO43 = 'ratio43'
-AVSYNC1080P = 'avsync1080p'
-AVSYNC4K = 'avsync4k'
-AVSYNCENDURANCE = 'avsyncendurance'
-VERYLOWBITRATE = 'verylowbitrate'
-LOWBITRATE = 'lowbitrate'
-MEDBITRATE = 'medbitrate'
-HIGHBITRATE = 'highbitrate'
-ULTRAHIGHBITRATE = 'ultrahighbitrate'
-HIGHBITRATE2 = 'highbitrate2'
-LIVE1080 = 'live1080p'
-LIVE4K = 'live4k'
-
-YT_UI_ACCOUNTNO1 = 'accountno1'
-YT_UI_REMOVEACC = 'removeacc'
-YT_UI_GUEST = 'guest'
-YT_UI_ADDACCOUNT = 'addaccount'
-YT_UI_SOUNDS = 'sounds'
-YT_UI_SOUNDSON = 'soundson'
-YT_UI_SOUNDSOFF = 'soundsoff'
-YT_UI_AUTOPLAY = 'autoplay'
-YT_UI_AUTOPLAYON = 'autoplayon'
-YT_UI_AUTOPLAYOFF = 'autoplayoff'
-YT_UI_MUSICPREVIEWS = 'musicpreviews'
-YT_UI_RESTRICTEDMODE = 'restrictedmode'
-YT_UI_LINKWITHWIFI = 'linkwithwifi'
-YT_UI_LINKWITHTVCODE = 'linkwithtvcode'
-YT_UI_LINKEDDEVICES = 'linkeddevices'
-YT_UI_LANGUAGE = 'ytlanguage'
-YT_UI_LANGUAGESELECT = 'ytlanguage select'
-YT_UI_LOCATION = 'location'
-YT_UI_CLEARWATCHHISTORY = 'clearwatchhistory'
-YT_UI_CLEARSEARCHHISTORY = 'clearsearchhistory'
-YT_UI_RESETAPP = 'resetapp'
-YT_UI_IMPROVEYOUTUBE = 'improveyoutube'
-YT_UI_HELP = 'help'
-YT_UI_SENDFEEDBACK = 'sendfeedback'
-YT_UI_PRIVACYANDTERMS = 'privacyandterms'
-YT_UI_CREDITS = 'credits'
-YT_UI_APPVERSION = 'appversion'
-YT_UI_PLAYLISTGLITETESTS = 'play'
-YT_UI_PLAYLISTS02 = 'list2'
-
-# YT LANGUAGE
-
-YTRUSSIA = 'lang russia'
-YTTURKEY = 'lang turkey'
-YTVIETNAM = 'lang vietnam'
-YTSVENSKA = 'lang svenska'
-YTSUOMI = 'lang suomi'
-YTSRPSKI = 'lang turkish'
-YTSLOVENSCINA = 'lang slovenscina'
-YTSLOVENCINA = 'lang slovencina'
-YTSHQIP = 'lang shqip'
-YTROMANA = 'lang romana'
-YTPORTUGESEBRA = 'lang portugese brazil'
-YTPORTUGESE = 'lang portugese'
-YTPOLSKI = 'lang polski'
-YTOZBEK = 'lang ozbek'
-YTNORSK = 'lang norsk'
-YTNEDERLANDS = 'lang nederlands'
-YTMAGYAR = 'lang magyar'
-YTLIETUVIU = 'lang lietuviu'
-YTLATVIESU = 'lang latviesu'
-YTKISWAHILI = 'lang kiswahili'
-YTITALIANO = 'lang italiano'
-YTISLENSKA = 'lang islenska'
-YTISIZULU = 'lang isizulu'
-YTHRVATSKI = 'lang hrvatski'
-YTGALEGO = 'lang galego'
-YTFRENCHCANADA = 'lang french canada'
-YTFRENCH = 'lang french'
-YTFILIPINO = 'lang filipino'
-YTEUSKARA = 'lang euskara'
-YTESPANAUS = 'lang espana us'
-YTESPANALATIN = 'lang espana latin'
-YTESPANASPAIN = 'lang espana spain'
-YTENGUS = 'lang eng us'
-YTENGUK = 'lang eng uk'
-
-
-
-# YT More option
-UIYTSIGNOUT = 'yt sign out' 
-UIYTCANCEL =  'yt cancel'
-
-
-#---------------------------
-# Amazon's UI Structure Function
-#---------------------------
-AMZ_SEARCH = 'search'
-AMZ_HOME = 'home'
-AMZ_ORIGINALS = 'originals'
-AMZ_MOVIES = 'movies'
-AMZ_TV = 'amazon tv'
-AMZ_KIDS = 'kids'
-AMZ_PURCHASESANDRENTALS = 'purchase and rentals'
-AMZ_WATCHLIST = 'watchlist'
-AMZ_SETTINGS = 'settings'
-AMZ_MYSTUFF = 'mystuff'
-
-#===HOME LAYER===
-AMZ_TRAVELINGHOME = 'traveling home'
-AMZ_WATCHNEXTHOME = 'watch next home'
-AMZ_HOMEMOVIEROW1 = 'home movie row 1'
-AMZ_HOMEMOVIEROW2 = 'home movie row 2'
-AMZ_HOMEMOVIEROW3 = 'home movie row 3'
-AMZ_HOMEMOVIEROW4 = 'home movie row 4'
-AMZ_HOMEMOVIEROW5 = 'home movie row 5'
-
-#===ORIGINALS LAYER===
-AMZ_TRAVELINGORIGINALS = 'traveling originals'
-AMZ_WATCHWHILEABROAD   = 'watch while abroad'
-AMZ_ORIGINALMOVIEROW1  = 'original movie row 1'
-AMZ_ORIGINALMOVIEROW2  = 'original movie row 2'
-AMZ_ORIGINALMOVIEROW3  = 'original movie row 3'
-AMZ_ORIGINALMOVIEROW4  = 'original movie row 4'
-AMZ_ORIGINALMOVIEROW5  = 'original movie row 5'
-
-#===MOVIES LAYER===
-AMZ_TRAVELINGMOVIES = 'traveling movies'
-AMZ_PRIMEVIDEOCINEMA = 'prime video cinema'
-AMZ_MOVIEROW1 = 'movie row 1'
-AMZ_MOVIEROW2 = 'movie row 2'
-AMZ_MOVIEROW3 = 'movie row 3'
-AMZ_MOVIEROW4 = 'movie row 4'
-AMZ_MOVIEROW5 = 'movie row 5'
-
-#===TV LAYER===
-AMZ_TRAVELINGTV = 'traveling tv'
-AMZ_TVROW1 = 'tv row 1'
-AMZ_TVROW2 = 'tv row 2'
-AMZ_TVROW3 = 'tv row 3'
-AMZ_TVROW4 = 'tv row 4'
-AMZ_TVROW5 = 'tv row 5'
-AMZ_TVROW6 = 'tv row 6'
-
-#===KIDS LAYER===
-AMZ_TRAVELINGKIDS = 'traveling kids'
-AMZ_WATCHNEXTKIDS = 'watch next kids'
-AMZ_KIDSMOVIEROW1 = 'kids movie row 1'
-AMZ_KIDSMOVIEROW2 = 'kids movie row 2'
-AMZ_KIDSMOVIEROW3 = 'kids movie row 3'
-AMZ_KIDSMOVIEROW4 = 'kids movie row 4'
-AMZ_KIDSMOVIEROW5 = 'kids movie row 5'
-
-#====PURCHASES & RENTAL LAYER===
-AMZ_TVSHOWSLIBRARY = 'tv shows library'
-AMZ_MOVIESLIBRARY  = 'movies library'
-
-#===WATCHLIST LAYER===
-AMZ_TVSHOWSWATCHLIST = 'tv shows watchlist'
-AMZ_MOVIESWATCHLIST  = 'movies watchlist'
-
-# ===SETTINGS LAYER===
-AMZ_MEMBERSHIP = 'membership'
-AMZ_BUYING = 'buying'
-AMZ_DEREGISTERDEVICE = 'deregister device'
-AMZ_PARENTALCONTROLAMZ = 'parental control'
-AMZ_RENTING = 'renting'
-AMZ_FEEDBACK = 'feedback'
-AMZ_LEGALNOTICES = 'legal notices' 
-
-
-
-#---------------------------
-# Netflix's UI Structure Function
-#---------------------------
-NFX_PROFILE_TESTER = 'selecttesterprofile'
-NFX_PROFILE_KIDS = 'selectkidsprofile'
-NFX_ADD_PROFILE = 'addprofile'
-NFX_PROFILE_TESTER_EDIT = 'edittesterprofile'
-NFX_PROFILE_KIDS_EDIT = 'editkidsprofile'
-NFX_TESTER_NAME = 'testername'
-NFX_TESTER_ICON = 'testericon'
-NFX_TESTER_LANGUAGE = 'testerlanguage'
-NFX_TESTER_DONE = 'testerdone'
-NFX_KIDS_NAME = 'kidsname'
-NFX_KIDS_ICON = 'kidsicon'
-NFX_KIDS_LANGUAGE = 'kidslanguage'
-NFX_KIDS_DONE = 'kidsdone'
-NFX_KIDS_DELETE = 'kidsdelete'
-NFX_TESTER = 'nftester'
-NFX_KIDS = 'nfkids'
-NFX_SEARCH = 'nfsearch'
-NFX_HOME = 'nfhome'
-NFX_LATEST = 'nflatest'
-NFX_TVSHOWS = 'nftvshows'
-NFX_MOVIES = 'nfmovies'
-NFX_MYLIST = 'nfmylist'
-NFX_SETTINGS = 'nfsettings'
-NFX_EXIT1 = 'nfexit1'
-NFX_HOMEVIDEO = 'nfbrowsecontent'
-NFX_K_KIDS = 'k.nfkids'
-NFX_K_SEARCH = 'k.nfsearch'
-NFX_K_HOME = 'k.nfhome'
-NFX_K_LATEST = 'k.nflatest'
-NFX_K_TVSHOWS = 'k.nftvshows'
-NFX_K_MOVIES = 'k.nfmovies'
-NFX_K_MYLIST = 'k.nfmylist'
-NFX_K_GETHELP = 'k.nfgethelp'
-NFX_K_EXIT1 = 'k.nfexit1'
-NFX_K_HOMEVIDEO = 'k.nfbrowsecontent'
-NFX_GOBACK1 = 'back1'
-NFX_CHANGE_EMAIL = 'changeemail'
-NFX_CHANGE_PASSWORD = 'changepassword'
-NFX_GETHELP = 'gethelp'
-NFX_EXIT2 = 'nfexit2'
-NFX_SIGNOUT1 = 'signout1'
-NFX_GOBACK2 = 'back2'
-NFX_MEMBER = 'memberinfo'
-NFX_NETWORK = 'networkinfo'
-NFX_DEVICE = 'deviceinfo'
-NFX_CONTACTUS = 'contactus'
-NFX_CHECKNETWORK = 'checknetwork'
-NFX_RELOAD = 'nfreload'
-NFX_EXIT3 = 'nfexit3'
-NFX_SIGNOUT2 = 'signout2'
-NFX_HD1 = 'hdcontent1'
-NFX_HD2 = 'hdcontent2'
-NFX_HD3 = 'hdcontent3'
-NFX_HD4 = 'hdcontent4'
-NFX_HD5 = 'hdcontent5'
-NFX_HD6 = 'hdcontent6'
-NFX_HD7 = 'hdcontent7'
-NFX_HD8 = 'hdcontent8'
-NFX_4K1 = '4kcontent1'
-NFX_4K2 = '4kcontent2'
-NFX_4K3 = '4kcontent3'
-NFX_4K4 = '4kcontent4'
-NFX_4K5 = '4kcontent5'
-NFX_4K6 = '4kcontent6'
-NFX_4K7 = '4kcontent7'
-NFX_4K8 = '4kcontent8'
-NFX_HDR1 = 'hdrcontent1'
-NFX_HDR2 = 'hdrcontent2'
-NFX_HDR3 = 'hdrcontent3'
-NFX_HDR4 = 'hdrcontent4'
-NFX_HDR5 = 'hdrcontent5'
-NFX_HDR6 = 'hdrcontent6'
-NFX_HDR7 = 'hdrcontent7'
-NFX_HDR8 = 'hdrcontent8'
-NFXNO = 'netflix no'
-NFXYES = 'netflix yes'
-
-#---------------------------
-# Google UI
-#---------------------------
-
-#---------------------------
-# Google Play Store's UI Structure Function
-#---------------------------
-GPSTORE_UI_ROW1APP1 = 'gpstorehomerow1apps1'
-GPSTORE_UI_ROW1APP2 = 'gpstorehomerow1apps2'
-GPSTORE_UI_ROW1APP3 = 'gpstorehomerow1apps3'
-
-GPSTORE_UI_APPS = 'gpstoreapps'
-GPSTORE_UI_GAMES = 'gpstoregames'
-GPSTORE_UI_MYAPPS = 'gpstoremyapps'
-GPSTORE_UI_SEARCH = 'gpstoresearch'
-GPSTORE_UI_SETTINGS = 'gpstoresettings'
-
-GPSTORE_UI_PARENTALCONTROLS = 'gpstoreparentalcontrol'
-GPSTORE_UI_PURCHASEAUTHORIZATION = 'gpstorepurchseauthorization'
-GPSTORE_UI_AUTOUPDATE = 'gpstoreautoupdate'
-GPSTORE_UI_ABOUT = 'gpstoreabout'
-GPSTORE_UI_UPDATEALL = 'gpstoreupdateall'
-UIDONTAUTOUPDATE = 'dontautoupdate'
-UIAUTOUPDATE = 'autoupdate'
-
-#---------------------------
-# Google Play Movie's UI Structure Function
-#---------------------------
-GPM_UI_SEARCHICON = 'gpmsearchicon'
-GPM_UI_LIBRARY = 'gpmlibrary'
-GPM_UI_RECOMENEDED1 = 'gpmrecomeneded1'
-GPM_UI_NEWRELEASES = 'gpmnewreleases'
-GPM_UI_RECOMENEDED2 = 'gpmrecomeneded2'
-GPM_UI_TOPSELLINGMOVIES = 'gpmtopsellingmovies'
-GPM_UI_GENRE1 = 'gpmgenre1'
-GPM_UI_GENRE2 = 'gpmgenre2'
-GPM_UI_GENRE3 = 'gpmgenre3'
-GPM_UI_GENRE4 = 'gpmgenre4'
-GPM_UI_GENRE5 = 'gpmgenre5'
-GPM_UI_GENRE6 = 'gpmgenre6'
-GPM_UI_GENRE7 = 'gpmgenre7'
-GPM_UI_GENRE8 = 'gpmgenre8'
-GPM_UI_GENRE9 = 'gpmgenre9'
-GPM_UI_GENRE10 = 'gpmgenre10'
-GPM_UI_MOVIEGENRES = 'gpmmoviegenres'
-GPM_UI_HELPANDSETTINGS = 'gpmhelpandsettings'
-GPM_UI_LMOVIES = 'gpmlmovies'
-GPM_UI_LWATCHLIST = 'gpmlmovies'
-GPM_UI_MGACTIONANDADVANTURE = 'gpmmgactionandadvanture'
-GPM_UI_MGANIMATION = 'gpmmganimation'
-GPM_UI_MGCOMEDY = 'gpmmgcomedy'
-GPM_UI_MGDOCUMENTARY = 'gpmmgdocumentary'
-GPM_UI_MGDRAMA = 'gpmmgdrama'
-GPM_UI_MGFAMILY = 'gpmmgfamily'
-GPM_UI_MGHORROR = 'gpmmghorror'
-GPM_UI_MGMUSIC = 'gpmmgmusic'
-GPM_UI_SETTINGS = 'gpmsettings'
-GPM_UI_SUPPORT = 'gpmsupport'
-GPM_UI_OPENSOURCELICENCES = 'gpmopensourcelicences'
-
-#---------------------------
-# Google Play Games's UI Structure Function
-#---------------------------
-GPGAMES_UI_SEARCHICON = 'gpgamessearchicon'
-GPGAMES_UI_MYGAMES = 'gpgamesmygames'
-GPGAMES_UI_FINDTVGAMES = 'gpgamesfindtvgames'
-GPGAMES_UI_PLAYERS = 'gpgamesplayers'
-GPGAMES_UI_INBOX = 'gpgamesinbox'
-GPGAMES_UI_SETTINGS = 'gpgamessettings'
-GPGAMES_UI_MYPROFILE = 'gpgamesmyprofile'
-GPGAMES_UI_GAME1 = 'gpgamesgame1'
-GPGAMES_UI_GAME2 = 'gpgamesgame2'
-GPGAMES_UI_GAME3 = 'gpgamesgame3'
-GPGAMES_UI_ACCOUNT = 'gpgamesaccount'
-GPGAMES_UI_GAMERPROFILE = 'gpgamesgamerprofile'
-GPGAMES_UI_ABOUT = 'gpgamesabout'
-
-#-------------------
-# UI_Google Common Library Structure Function
-#---------------------
-UI_HSSIGNIN = 'hssignin'
-UI_HSSIGNINSKIP = 'hssigninskip'
-UIUSEYOURREMOTE = 'fuseyourremote'
-UIUSEYOURPHONEORCOMPUTER = 'fuseyourphoneorcomputer'
-UI_HSSIGNEDINACC01 = 'hssignedinacc01'
-UI_HSADDACCOUNT = 'hsaddaccount'
-UI_HSACCSYNCNOW = 'hsaccsyncnow'
-UI_HSACCREMOVEACCOUNT = 'hsaccremoveaccount'
-UI_FSIGNIN = 'fsignin'
-UI_FSIGNINSKIP = 'fsigninskip'
-UI_FCONTINUE = 'fcontinue'
-UI_FLSKIP = 'flskip'
-UI_FWIFI1 = 'fwifi1'
-UI_FCONTINUE_ETHERNET= 'fcontinueethernet'
-UI_FLSKIP_ETHERNET = 'flskipethernet'
-UI_FNONE = 'fnone'
-UI_FWEP =  'fwep'
-UI_FWPA =  'fwpa'
-UI_FWIFIPASSWORD = 'fwifipassword'
-
-#-----------------------------------------------------------------------------------   
-#Constant for ui name
-# --------------------- LINUX ----------------------
-UIB = 'b'
-UIA = 'a'
-UISTERIO = 'sterio'
-UIUKRAINIAN = 'ukrainian'
-UIENABLESMARTTV = 'enablesmarttv'
-UISTART = 'start'
-UISETUPFORRETAIL = 'setupforretail'
-UIFHOME = 'fhome'
-UISHOPDEMO = 'shopedemo'
-UIRETAILDEMO = 'retaildemo'
-UISTARTDEMO = 'startdemo'
-UIALWAYS = 'always'
-UIEVERYDAY = 'everyday'
-UIEVERYSATURDAY = 'everysaturday'
-UIEVERYFRIDAY = 'everyfriday'
-UIEVERYTHURSDAY = 'everythursday'
-UIEVERYWEDNESDAY = 'everywednesday'
-UIEVERYTUESDAY = 'everytuesday'
-UIEVERYMONDAY = 'everymonday'
-UIEVERYSUNDAY = 'everysunday'
-UISATURDAY = 'saturday'
-UIFRIDAY = 'friday'
-UITHURSDAY = 'thursday'
-UIWEDNESDAY = 'wednesday'
-UITUESDAY = 'tuesday'
-UISUNDAY = 'sunday'
-UIMONDAY = 'monday'
-UIEVERYMONFRI = 'everymonfri'
-UIPHOTOFRAME = 'photoframe'
-UI1H = '1h'
-UI2H = '2h'
-UI3H = '3h'
-UI4H = '4h'
-UI5H = '5h'
-UI6H = '6h'
-UI7H = '7h'
-UI8H = '8h'
-UI9H = '9h'
-UI10H = '10h'
-UI11H = '11h'
-UI12H = '12h'
-UI13H = '13h'
-UI14H = '14h'
-UI15H = '15h'
-UI16H = '16h'
-UI17H = '17h'
-UI18H = '18h'
-UI19H = '19h'
-UI20H = '20h'
-UI21H = '21h'
-UI22H = '22h'
-UI23H = '23h'
-UI24H = '24h'
-UINEDERLAND = 'nederland'
-UIKAZAKHLANGUAGE = 'kazakhlanguage'
-UIEXPERT = 'expert'
-UIEASY = 'easy'
-UISAT = 'sat'
-UIVCR = 'vcr'
-UIDVD_BD = 'dvd_bd'
-UIHOMETHEATER = 'hometheater'
-UIGAME = 'game'
-UICAM = 'cam'
-UIDIGITALCAMERA = 'digitalcamera'
-UIPC = 'pc'
-UIEDIT = 'edit'
-UIPALM = 'palm'
-UIPALN = 'paln'
-UINTSC = 'ntsc'
-UIMAJORMINORCHANNELS = 'majorminorchannels'
-UIMAJORCHANNELS = 'majorchannels'
-UIENABLE = 'enable'
-UIDISABLE = 'disable'
-UIALLOW = 'allow'
-UIBLOCK = 'block'
-UIANALOGUECLOCK = 'analogueclock'
-UIFMRADIO = 'fmradio'
-UISUBTITLE1 = 'subtitle1'
-UISUBTITLE2 = 'subtitle2'
-UISUBTITLE3 = 'subtitle3'
-UISUBTITLE4 = 'subtitle4'
-UISUBTITLE5 = 'subtitle5'
-UISUBTITLE6 = 'subtitle6'
-UISUBTITLE7 = 'subtitle7'
-UISUBTITLE8 = 'subtitle8'
-UIHIDDEN = 'hidden'
-UIEVERTMONFRI = 'evertmonfri'
-UITV = 'mtv'
-UIVIDEO = 'mvideo'
-UISTYLE7 = 'style1'
-UISTYLE6 = 'style2'
-UISTYLE5 = 'style3'
-UISTYLE4 = 'style4'
-UISTYLE3 = 'style5'
-UISTYLE2 = 'style6'
-UISTYLE1 = 'style7'
-UISOLID = 'solid'
-UITRANSLUCENT = 'translucent'
-UIFLASHING = 'flashing'
-UIUNIFORM = 'uniform'
-UILEFTSHADOW = 'leftshadow'
-UIRIGHTSHADOW = 'rightshadow'
-UIHDR = 'hdr'
-UIGENERAL = 'general'
-UIUSA = 'usa'
-UICANADA = 'canada'
-UIYOUNGADULT = 'youngadult'
-UIYOUTH = 'youth'
-UICHILD = 'child'
-UIUNLOCK = 'unlock'
-UILOCK = 'lock'
-UIM = 'm'
-UII = 'uii'
-UIBG = 'bg'
-UIL = 'l'
-UIDK = 'dk'
-UIC = 'uic'
-UIS = 's'
-UIPAL60 = 'pal60'
-UISECAM = 'secam'
-UIPAL = 'pal'
-UINTSC358 = 'ntsc358 '
-UINTSC443 = 'ntsc443'
-UISATELLITE = 'satellite'
-UICAMCORDER = 'camcorder'
-UIFTURKEY = 'fturkey'
-UIFAUSTRALIA = 'faustralia'
-UITAIWAN = 'taiwan'
-UIUNRATED = 'unrated'
-UICABLEBOX = 'cablebox'
-UIRETAIL = 'retail'
-UITRADISIONALCHINEESE = 'tradisionalchineese'
-UIINTELLIGENT = 'intelligent'
-UISTEREO = 'stereo'
-UIMONO = 'mono'
-UIAUTOSAP = 'autosap'
-UIMANDARIN = 'mandarin'
-UINOBLOCK = 'noblock'
-UIBLOCKALL = 'blockall'
-UIGANDABOVE = 'gandabove'
-UIPGRANDABOVE = 'pgandabove'
-UIAOANDABOVE = 'aoandabove'
-UIG = 'g'
-UIPG = 'pg'
-UIPG13 = 'pg13'
-UINC16 = 'nc16'
-UIM18 = 'm18'
-UIR21 = 'r21'
-UIFARGENTINA = 'fargentina'
-UIFBOLIVIA = 'fbolivia'
-UIFCHILE = 'fchile'
-UIFECUADOR = 'fecuador'
-UIFCOSTARICA = 'fcostarica'
-UIFNICARAGUA = 'fnicaragua'
-UIFPARAGUAY = 'fparaguay'
-UIFPERU = 'fperu'
-UIFURUGUAY = 'furuguay'
-UIFVENEZUELA = 'fvenezuela'
-UIFOTHER = 'fother'
-UIPENINSULAANDBALEARICISLANDS = 'peninsulaandbalearicislands'
-UICANARYISLANDS = 'canaryislands'
-
-# Factory Reset
-UIFAFRICA = 'fafrica'
-UIFBOSNIA = 'fbosnia'
-UIFCESKAREP = 'fceskarep'
-UIFDANMARK = 'fdanmark'
-UIFDEUTSCHLAND = 'fdeutschland'
-UIFSCHWEIZ = 'fchweiz'
-UIFOSTERREICH = 'fosterreich'
-UIFEESTI = 'feesti'
-UIFGREECE = 'fgreece'
-UIFUNITEDKINGDOM = 'funitedkingdom'
-UIFIRELAND = 'fireland'
-UIFESPANA = 'fespana'
-UIFFRANCE = 'ffrance'
-UIFREPUBLIKAHRVATSKA = 'frepublikahrvatska'
-UIFITALIA = 'fitalia'
-UIFLATVIJA = 'flatvija'
-UIFLIETUVA = 'flietuva'
-UIFMAGYARORSZAG = 'fmagyarorszag'
-UIFMACEDONIA = 'fmacedonia'
-UIFNEDERLAND = 'fnederland'
-UIFBELGIE = 'fbelgie'
-UIFLUXEMBOURG = 'fluxembourg'
-UIFNORGE = 'fnorge'
-UIFPOLSKA = 'fpolska'
-UIFPORTUGAL = 'fportugal'
-UIFROMANIA = 'fromania'
-UIFRUSSIA = 'frussia'
-UIFSLOVENSKAREP = 'fslovenskarep'
-UIFSLOVENIJA = 'fslovenija'
-UIFSERBIA = 'fserbia'
-UIFSUOMI = 'fsuomi'
-UIFSVERIGE = 'fsverige'
-UIFTURKIYE = 'fturkiye'
-UIFUKRAIN = 'fukrain'
-UIFKAZAKHSTAN = 'fkazakhstan'
-UIFISRAEL = 'fisrael'
-# --------------------- LINUX ----------------------
-UIGETSTARTED = 'getstarted'
-UIGOBACK = 'goback'
-UICHECKFORUPDATE = 'checkforupdate'
-UICHANGE = 'change'
-UIDONTCHANGE = 'dontchange'
-UIBRAVIAVU1 = 'braviavu1'
-UIANDROIDTV = 'androidtv'
-UILIVINGROOMTV = 'livingroomtv'
-UIFAMILYROOMTV = 'familyroomtv'
-UIBEDROOMTV = 'bedroomtv'
-UIENTERCUSTOMNAME = 'entercustomname'
-UIRESTART = 'restart'
-UINONE = 'none'
-UISTATIC = 'static'
-UIDHCP = 'dhcp'
-UIOFF = 'off'
-UION = 'on'
-UINOTSET = 'notset'
-UIYES = 'yes'
-UINO = 'no'
-UIDENYANYWAY = 'denyanyway'
-UILOCATIONSETTINGS = 'locationsettings'
-UIRESET = 'reset'
-UIERASEEVERYTHING = 'eraseeverything'
-UIUSENETWORKPROVIDEDTIME = 'networkprovidedtime'
-UIGBOARD = 'gboard'
-UICELSIUS = 'celsius'
-UIFAHRENHEIT = 'fahrenheit'
-UITURNSCREENOFF = 'turnscreenoff'
-UIBACKDROP = 'backdrop'
-UICOLOURS = 'colours'
-UI5MIN = '5min'
-UI15MIN = '15min'
-UI30MIN = '30min'
-UI45MIN = '45min'
-UI60MIN = '60min'
-UI90MIN = '90min'
-UI120MIN = '120min'
-UINEVER = 'never'
-UIUSEWIFI = 'usewifi'
-UIVERYSMALL = 'verysmall'
-UISMALL = 'small'
-UINORMAL = 'normal'
-UILARGE = 'large'
-UIVERYLARGE = 'verylarge'
-UISANSSERIF = 'sansserif'
-UISANSSERIFCONDENSED = 'sansserifcondensed'
-UISANSSERIFMONOSPACE = 'sansserifmonospace'
-UISERIF = 'serif'
-UISERIFMONOSPACE = 'serifmonospace'
-UICASUAL = 'casual'
-UICURSIVE = 'cursive'
-UISMALLCAPITALS = 'smallcapitals'
-UIWHITE = 'white'
-UIBLACK = 'black'
-UIRED = 'red'
-UIYELLOW = 'yellow'
-UIGREEN = 'green'
-UICYAN = 'cyan'
-UIBLUE = 'blue'
-UIMAGENTA = 'magenta'
-UI000055 = '000055'
-UI0000AA = '0000aa'
-UI005500 = '005500'
-UI005555 = '005555'
-UI0055AA = '0055aa'
-UI0055FF = '0055ff'
-UI00AA00 = '00aa00'
-UI00AA55 = '00aa55'
-UI00AAAA = '00aaaa'
-UI00AAFF = '00aaff'
-UI00FF55 = '00ff55'
-UI00FFAA = '00ffaa'
-UI550000 = '550000'
-UI550055 = '550055'
-UI5500AA = '5500aa'
-UI5500FF = '5500ff'
-UI555500 = '555500'
-UI555555 = '555555'
-UI5555AA = '5555aa'
-UI5555FF = '5555ff'
-UI55AA00 = '55aa00'
-UI55AA55 = '55aa55'
-UI55AAAA = '55aaaa'
-UI55AAFF = '55aaff'
-UI55FF00 = '55ff00'
-UI55FF55 = '55ff55'
-UI55FFAA = '55ffaa'
-UI55FFFF = '55ffff'
-UIAA0000 = 'aa0000'
-UIAA0055 = 'aa0055'
-UIAA00AA = 'aa00aa'
-UIAA00FF = 'aa00ff'
-UIAA5500 = 'aa5500'
-UIAA5555 = 'aa5555'
-UIAA55AA = 'aa55aa'
-UIAA55FF = 'aa55ff'
-UIAAAA00 = 'aaaa00'
-UIAAAA55 = 'aaaa55'
-UIAAAAAA = 'aaaaaa'
-UIAAAAFF = 'aaaaff'
-UIAAFF00 = 'aaff00'
-UIAAFF55 = 'aaff55'
-UIAAFFAA = 'aaffaa'
-UIAAFFFF = 'aaffff'
-UIFF0055 = 'ff0055'
-UIFF00AA = 'ff00aa'
-UIFF5500 = 'ff5500'
-UIFF5555 = 'ff5555'
-UIFF55AA = 'ff55aa'
-UIFF55FF = 'ff55ff'
-UIFFAA00 = 'ffaa00'
-UIFFAA55 = 'ffaa55'
-UIFFAAAA = 'ffaaaa'
-UIFFAAFF = 'ffaaff'
-UIFFFF55 = 'ffff55'
-UIFFFFAA = 'ffffaa'
-UI25P = '25p'
-UI50P = '50p'
-UI75P = '75p'
-UI100P = '100p'
-UIOUTLINE = 'outline'
-UIDROPSHADOW = 'dropshadow'
-UIRAISED = 'raised'
-UIDEPRESSED = 'depressed'
-UIVERYSLOW = 'veryslow'
-UISLOW = 'slow'
-UIFAST = 'fast'
-UIFASTER = 'faster'
-UIVERYFAST = 'veryfast'
-UIRAPID = 'rapid'
-UIVERYRAPID = 'veryrapid'
-UIFASTEST = 'fastest'
-UIWHITEONBLACK = 'whiteonblack'
-UIBLACKONWHITE = 'blackonwhite'
-UIYELLOWONBLACK = 'yellowonblack'
-UIVERYSHORT = 'veryshort'
-UISHORT = 'mshort'
-UILONG = 'mlong'
-UIVERYLONG = 'verylong'
-UISWITCHACCESS = 'switchaccess'
-UITALKBACK = 'talkback'
-UITEXTMAGNIFICATION = 'textmagnification'
-UISCREENREADER = 'screenreader'
-UICHANNEL = 'channel'
-UIFREQUENCY = 'frequency'
-UIBASIC = 'basic'
-UIFORHARDOFHEARING = 'forhardofhearing'
-UISPOKENSUBTITLE = 'spokensubtitle'
-UISTANDARD = 'standard'
-UISMOOTH = 'smooth'
-UICINEMA = 'cinema'
-UISPORT = 'sport'
-UIGAME = 'game'
-UIMUSIC = 'music'
-UIGRAPHIC = 'graphic'
-UIPHOTO = 'photo'
-UICUSTOM = 'custom'
-UIVIVID = 'vivid'
-UIMEDUIM = 'medium'
-UIHIGH = 'high'
-UIMEDIUM = 'medium'
-UILOW = 'low'
-UIMID = 'mid'
-UICOOL = 'cool'
-UINEUTRAL = 'neutral'
-UIWARM = 'warm'
-UIEXPERT1 = 'expert1'
-UIEXPERT2 = 'expert2'
-UIAUTO = 'auto'
-UIMANUAL = 'manual'
-UICOMPRESSED = 'compressed'
-UIWIDEZOOM = 'widezoom'
-UIFULL = 'full'
-UIFULLPIXEL = 'fullpixel'
-UIZOOM = 'zoom'
-UI14_9 = '14_9'
-UIDCHANNEL = 'dchannel'
-UIDFREQUENCY = 'dfrequency'
-UITVSPEAKERS = 'tvspeakers'
-UIAUDIOSYSTEM = 'audiosystem'
-UIHEADPHONE = 'headphone'
-UIAUDIOOUTFIXED = 'audiooutfixed'
-UIAUDIOOUTVARIABLE = 'audiooutvariable'
-UISUBWOOFER = 'subwoofer'
-UITABLETOPSTAND = 'tabletopstand'
-UIWALLMOUNT = 'wallmount'
-UISHOW = 'show'
-UIHIDE = 'hide'
-UIHDMI1 = 'hdmi1'
-UIHDMI2 = 'hdmi2'
-UIHDMI3 = 'hdmi3'
-UIAV = 'av'
-UIBLURAY = 'bluray'
-UIDVD = 'dvd'
-UIAUX = 'aux'
-UIENHANCED = 'enhanced'
-UIMENUKEYS = 'menukeys'
-UITUNINGKEYS = 'tuningkeys'
-UITUNINGANDMENUKEYS = 'tuningandmenukeys'
-UIPRESHAREDKEY = 'presharedkey'
-UIBLOCKED = 'blocked'
-UIUNBLOCKED = 'unblocked'
-UIONWHENMUTING = 'onwhenmuting'
-UICC1 = 'cc1'
-UICC2 = 'cc2'
-UICC3 = 'cc3'
-UICC4 = 'cc4'
-UITEXT1 = 'text1'
-UITEXT2 = 'text2'
-UITEXT3 = 'text3'
-UITEXT4 = 'text4'
-UINA = 'na'
-UINODESCRIPTION1 = 'nodescription1'
-UINODESCRIPTION2 = 'nodescription2'
-UINODESCRIPTION3 = 'nodescription3'
-UINODESCRIPTION4 = 'nodescription4'
-UINODESCRIPTION5 = 'nodescription5'
-UINODESCRIPTION6 = 'nodescription6'
-UINODESCRIPTION7 = 'nodescription7'
-UINODESCRIPTION8 = 'nodescription8'
-UINODESCRIPTION9 = 'nodescription9'
-UINODESCRIPTION10 = 'nodescription10'
-UINODESCRIPTION11 = 'nodescription11'
-UINODESCRIPTION12 = 'nodescription12'
-UINODESCRIPTION13 = 'nodescription13'
-UINODESCRIPTION14 = 'nodescription14'
-UINODESCRIPTION15 = 'nodescription15'
-UINODESCRIPTION16 = 'nodescription16'
-UINODESCRIPTION17 = 'nodescription17'
-UINODESCRIPTION18 = 'nodescription18'
-UINODESCRIPTION19 = 'nodescription19'
-UINODESCRIPTION20 = 'nodescription20'
-UINODESCRIPTION21 = 'nodescription21'
-UINODESCRIPTION22 = 'nodescription22'
-UINODESCRIPTION23 = 'nodescription23'
-UINODESCRIPTION24 = 'nodescription24'
-UINODESCRIPTION25 = 'nodescription25'
-UINODESCRIPTION26 = 'nodescription26'
-UINODESCRIPTION27 = 'nodescription27'
-UINODESCRIPTION28 = 'nodescription28'
-UINODESCRIPTION29 = 'nodescription29'
-UINODESCRIPTION30 = 'nodescription30'
-UINODESCRIPTION31 = 'nodescription31'
-UINODESCRIPTION32 = 'nodescription32'
-UINODESCRIPTION33 = 'nodescription33'
-UINODESCRIPTION34 = 'nodescription34'
-UINODESCRIPTION35 = 'nodescription35'
-UINODESCRIPTION36 = 'nodescription36'
-UINODESCRIPTION37 = 'nodescription37'
-UINODESCRIPTION38 = 'nodescription38'
-UINODESCRIPTION39 = 'nodescription39'
-UINODESCRIPTION40 = 'nodescription40'
-UINODESCRIPTION41 = 'nodescription41'
-UINODESCRIPTION42 = 'nodescription42'
-UINODESCRIPTION43 = 'nodescription43'
-UINODESCRIPTION44 = 'nodescription44'
-UINODESCRIPTION45 = 'nodescription45'
-UINODESCRIPTION46 = 'nodescription46'
-UINODESCRIPTION47 = 'nodescription47'
-UINODESCRIPTION48 = 'nodescription48'
-UINODESCRIPTION49 = 'nodescription49'
-UINODESCRIPTION50 = 'nodescription50'
-UINODESCRIPTION51 = 'nodescription51'
-UINODESCRIPTION52 = 'nodescription52'
-UINODESCRIPTION53 = 'nodescription53'
-UINODESCRIPTION54 = 'nodescription54'
-UINODESCRIPTION55 = 'nodescription55'
-UINODESCRIPTION56 = 'nodescription56'
-UINODESCRIPTION57 = 'nodescription57'
-UINODESCRIPTION58 = 'nodescription58'
-UINODESCRIPTION59 = 'nodescription59'
-UINODESCRIPTION60 = 'nodescription60'
-UINODESCRIPTION61 = 'nodescription61'
-UINODESCRIPTION62 = 'nodescription62'
-UINODESCRIPTION63 = 'nodescription63'
-UIASBROADCAST = 'asbroadcast'
-UIIMAGEANDLCLOCK = 'imageandclock'
-UIFULLSCREENCLOCK = 'fullscreenclock'
-UIFULLSCREENIMAGE = 'fullscreenimage'
-UICALENDAR = 'calendar'
-UIDIGITALCLOCK = 'digitalclock'
-UIANALOGCLOCK = 'analogclock'
-UISLIDESHOW = 'slideshow'
-UISINGLEVIEW = 'singleview'
-UIALLTRACKS  = 'alltracks'
-UISINGLETRACK = 'singletrack'
-
-UISUNDAY = 'sunday'
-UIMONDAY = 'monday'
-UITUESDAY = 'tuesday'
-UIWEDNESDAY = 'wednesday'
-UITHURSDAY = 'thursday'
-UIFRIDAY = 'friday'
-UISATURDAY = 'saturday'
-UIPICTUREOFF = 'pictureoff'
-
-# Language
-UILANGUAGE1 = 'language1'
-UILANGUAGE7 = 'language7'
-UILANGUAGE13 = 'language13'
-UILANGUAGE17 = 'language17'
-UILANGUAGE20 = 'language20'
-UILANGUAGE26 = 'language26'
-UILANGUAGE32 = 'language32'
-
-UIDEFAULT = 'default'
-UIAFRIKAANS = 'afrikaans'
-UIENGLISH_UK = 'english_uk'
-UIENGLISH_US = 'english_us'
-UIESPANOL = 'espanol'
-UIFRANCAIS_CANADA = 'francais_canada'
-UIFRANCAIS_FRANCE = 'francais_france'
-UIINDONESIA = 'indonesia'
-UIISIZULU = 'isizulu'
-UIKISWAHILI = 'kiswahili'
-UIPORTUGUES = 'portugues'
-UITIENGVIET = 'tiengviet'
-UISOMI = 'somi'
-UIRUSSIAN = 'russian'
-UIARABIC = 'arabic'
-UIFARSI = 'farsi'
-UIMARATHI = 'marathi'
-UIHINDI = 'hindi'
-UIBENGALI = 'bengali'
-UIPUNJABI = 'punjabi'
-UIGUJARATHI = 'gujarathi'
-UITAMIL = 'tamil'
-UITELUGU = 'telugu'
-UIKANNADA = 'kannada'
-UIMALAYALAM = 'malayalam'
-UITHAI = 'thai'
-UISIMPLIFIEDCHINESE = 'simplifiedchinese'
-UITRADISIONALCHINESE = 'tradisionalchinese'
-UITURKCE = 'turke'
-UISVENSKA = 'svenska'
-UISRPSKI = 'srpski'
-UISLOVENSCINA = 'slovenscina'
-UISLOVENCINA = 'slovencina'
-UIROMANA = 'romana'
-UIPOLSKI = 'polski'
-UINORSK = 'norsk'
-UINEDERLANDS = 'nederlands'
-UILATVIESU = 'latviesu'
-UILIETUVISKAI = 'lietuviskai'
-UIITALIANO = 'italiano'
-UIMAGYAR = 'magyar'
-UIHRVATSKI = 'hrvatski'
-UIFRANCAIS = 'fracais'
-UISUOMI = 'suomi'
-UIEESTI = 'eesti'
-UIESPANOL = 'espanol'
-UIDEUTSH = 'deutsh' 
-UIDANSK = 'dansk' 
-UICESKY = 'cesky'
-UICATALA = 'catala'
-UIBOSANSKI = 'bosanski'
-
-# Time Offset
-UIMIDWAY = 'midway'
-UIHONOLULU = 'honolulu'
-UIANCHORAGE = 'anchorage'
-UILOSANGELES = 'losangeles'
-UIPHOENIX = 'phoenix'
-UITIJUANA = 'tijuana'
-UICHIHUAHUA = 'chihuahua'
-UICOSTARICA = 'costarica'
-UIDENVER = 'denver'
-UIREGINA = 'regina'
-UIBOGOTA = 'bogota'
-UICHICAGO = 'chicago'
-UIMEXICOCITY = 'mexicocity'
-UIBARBADOS = 'barbados'
-UICARACAS = 'caracas'
-UIMANAUS = 'manaus'
-UINEWYORK = 'newyork'
-UIBUENOSAIRES = 'buenosaires'
-UIHALIFAX = 'halifax'
-UIMONTEVIDEO = 'montevideo'
-UIRECIFE = 'recife'
-UISANTIAGO = 'santiago'
-UISAOPAULO = 'saopaulo'
-UISTJOHNS = 'stjohns'
-UINUUK = 'nuuk'
-UISOUTHGEORGIA = 'southgeorgia'
-UICAPEVERDE = 'capeverde'
-UIAZORES = 'azores'
-UICOORDINATEDUNIVERSALTIME = 'coordinateduniversaltime'
-UIBRAZZAVILLE = 'brazzaville'
-UIBRITISHSUMMERTIME = 'britishsummertime'
-UICASABLANCA = 'casablanca'
-UIGREENWICHMEANTIME = 'greenwichmeantime'
-UIAMSTERDAM = 'amsterdam'
-UIBELGRADE = 'belgrade'
-UIBRUSSELS = 'brussels'
-UICAIRO = 'cairo'
-UIHARARE = 'harare'
-UIMADRID = 'madrid'
-UISARAJEVO = 'sarajevo'
-UIWINDHOEK = 'windhoek'
-UIAMMAN = 'amman'
-UIATHENS = 'athens'
-UIBAGHDAD = 'baghdad'
-UIBEIRUT = 'beirut'
-UIHELSINKI = 'helsinki'
-UIISTANBUL = 'istanbul'
-UIJERUSALEM = 'jerusalem'
-UIKUWAIT = 'kuwait'
-UIMINSK = 'minsk'
-UIMOSCOW = 'moscow'
-UINAIROBI = 'nairobi'
-UIBAKU = 'baku'
-UIDUBAI = 'dubai'
-UITBILISI = 'tbilisi'
-UIYEREVAN = 'yerevan'
-UIKABUL = 'kabul'
-UITEHRAN = 'tehran'
-UIKARACHI = 'karachi'
-UIORAL = 'oral'
-UIYEKATERINBURG = 'yekaterinburg'
-UICOLOMBO = 'colombo'
-UIKOLKATA = 'kolkata'
-UIKATHMANDU = 'kathmandu'
-UIALMATY = 'almaty'
-UIRANGOON = 'rangoon'
-UIBANGKOK = 'bangkok'
-UIJAKARTA = 'jakarta'
-UIKRASNOYARSK = 'krasnoyarsk'
-UIHONGKONG = 'hongkong'
-UIIRKUTSK = 'irkutsk'
-UIKUALALUMPUR = 'kualalumpur'
-UIPERTH = 'perth'
-UISHANGHAI = 'shanghai'
-UITAIPEI = 'taipei'
-UISEOUL = 'seoul'
-UITOKYO = 'tokyo'
-UIYAKUTSK = 'yakutsk'
-UIADELAIDE = 'adelaide'
-UIDARWIN = 'darwin'
-UIBRISBANE = 'brisbane'
-UIGUAM = 'guam'
-UIHOBART = 'hobart'
-UISYDNEY = 'sydney'
-UIVLADIVOSTOK = 'vladivostok'
-UIMAGADAN = 'magadan'
-UINOUMEA = 'noumea'
-UIAUKLAND = 'aukland'
-UIFIJI = 'fiji'
-UIMAJURO = 'majuro'
-UITONGATAPU = 'tongatapu'
-
-# Subtitle and Audio Language
-UIENGLISH = 'english'
-UIFRENCH = 'french'
-UIITALIAN = 'italian'
-UIGERMAN = 'german'
-UISPANISH = 'spanish'
-UIORIGINALAUDIO = 'originalaudio'
-UIAZERBAIJANI = 'azerbaijani'
-UICHINESE = 'chinese'
-UIPERSIAN = 'persian'
-UIINDONESIAN = 'indonesian'
-UIJAPANESE = 'japanese'
-UIKOREAN = 'korean'
-UIMAORI = 'maori'
-UIBAHASAMELAYU = 'bahasamelayu'
-UIMULTIPLELANGUAGES = 'multiplelanguages'
-UIMYANMAR = 'myanmar'
-UISOUTHERNNDEBELE = 'southernndebele'
-UINORTHERNSOTO = 'northernsoto'
-UISECONDAUDIO = 'secondaudio'
-UITHIRDAUDIO = 'thirdaudio'
-UISOUTHERNSOTHO = 'southernsotho'
-UISWATI = 'swati'
-UISWAHILI = 'swahili'
-UITSWANA = 'tswana'
-UITSONGA = 'tsonga'
-UIVENDA = 'venda'
-UIVIETNAMESE = 'vietnamese'
-UIXHOSA = 'xhosa'
-UIZULU = 'zulu'
-UIALBANIAN = 'albanian'
-UIARMENIAN = 'armenian'
-UIBOSNIAN = 'bosnian'
-UIBRETON = 'breton'
-UIBULGARIAN = 'bulgarian'
-UICATALAN = 'catalan'
-UICZECH = 'czech'
-UIWELSH = 'welsh'
-UIDANISH = 'danish'
-UIGREEK = 'greek'
-UIESTONIAN = 'estonian'
-UIBASQUE = 'basque'
-UIFINNISH = 'finnish'
-UIIRISH = 'irish'
-UISCOTTISH_GAELIC = 'scottishgaelic'
-UIGALICIAN = 'galician'
-UIHEBREW = 'hebrew'
-UICROATIAN = 'croatian'
-UIHUNGARIAN = 'hungarian'
-UIICELANDIC = 'icelandic'
-UIKAZAKH = 'kazakh'
-UILUXEMBOURGISH = 'luxembourgish'
-UILITHUANIAN = 'lithuanian'
-UILATVIAN = 'latvian'
-UIMACEDONIAN = 'macedonian'
-UIMALTESE = 'maltese'
-UINARRATIVE = 'narrative'
-UIDUTCH = 'dutch'
-UINORWEGIAN = 'norwegian'
-UINORWEGIAN_BOKMAL = 'norwegianbokmal'
-UINORWEGIAN_NYNORSK = 'norwegiannynorsk'
-UIPOLISH = 'polish'
-UIPORTUGUESE = 'portuguese'
-UIHUNGARIN = 'hungarin'
-UIROMANIAN = 'romanian'
-UISAMI = 'sami'
-UISLOVAK = 'slovak'
-UISLOVENIAN = 'slovenian'
-UISERBIAN = 'serbian'
-UISWEDISH = 'swedish'
-UITURKISH = 'turkish'
-UIUKRANIAN = 'ukranian'
-UIVALENCIAN = 'valencian'
-UIASSAMESE = 'assamese'
-UIAUDIODESCRIPTION = 'audiodescription'
-UIORIYA = 'oriya'
-UIUNKNOWN = 'unknown'
-
-# Device Preferences Languages
-UIUSESYSTEMLANGUAGE = 'usesystemlanguage'
-UIBANGLA_BANGLADESH = 'bangla_bangladesh'
-UIBANGLA_INDIA = 'bangla_india'
-UICANTONESE = 'cantonese'
-UICHINESE_CHINA = 'chinese_china'
-UICHINESE_TAIWAN = 'chinese_taiwan'
-UIENGLISH_AUSTRALIA = 'english_australia'
-UIENGLISH_INDIA = 'english_india'
-UIFILIPINO = 'filipino'
-UIJAVANESE = 'javanese'
-UIKHMER = 'khmer'
-UINEPALI = 'nepali'
-UISINHALA = 'sinhala'
-UISPANISH_SPAIN = 'spanish_spain'
-UISPANISH_US = 'spanish_us'
-UISUNDANESE = 'sundanese'
-
-# FACTORY RESET
-UICONTINUE = 'continue'
-UISKIP = 'skip'
-UINEXT = 'next'
-UIPLAYTERMSOFSERVICE = 'fplaytermsofservice'
-UIPRIVACYPOLICY = 'fprivacypolicy'
-UITERMSOFSERVICE = 'ftermsofservice'
-UIACCEPT = 'accept'
-UIUSB = 'usb'
-UINETWORK = 'network'
-
-UIFEASTAFRICA = 'feastafrica'
-UIFGHANA = 'fghana'
-UIFKENYA = 'fkenya'
-UIFMOROCO = 'fmoroco'
-UIFNIGERIA = 'fnigeria'
-UIFNORTHAFRICA = 'fnorthafrika'
-UIFSOUTHAFRICA = 'fsouthafrika'
-UIFTANZANIA = 'ftanzania'
-UIFTUNISIA = 'ftunisia'
-UIFUGANDA = 'fuganda'
-UIFWESTAFRICA = 'fwestafrica'
-UIFINDIA = 'findia'
-UIFINDONESIA = 'findonesia'
-UIFMALAYSIA = 'fmalaysia'
-UIFMYANMAR = 'fmyanmar'
-UIFPHILIPPINES = 'fphilippines'
-UIFSINGAPORE = 'fsingapore'
-UIFTHAILAND = 'fthailand'
-UIFVIETNAM = 'fvietnam'
-UIFAREAEXCLUDINGABOVE = 'fareaexcludingabove'
-UIFAZERBAIJAN = 'fazerbaijan'
-UIFCIS = 'fcis'
-UIFGCC = 'fgcc'
-UIFIRAN = 'firan'
-UIFLEVANT = 'flevant'
-UIFSAUDIARABIA = 'fsaudiarabia'
-UIFAUSTRALIAN_NSW = 'faustralia_nsw'
-UIFAUSTRALIA_VIC = 'faustralia_vic'
-UIFAUSTRALIA_QLD = 'faustralia_qld'
-UIFAUSTRALIA_SA = 'faustralia_sa'
-UIFAUSTRALIA_WA = 'faustralia_wa'
-UIFAUSTRALIA_TAS = 'faustralia_tas'
-UIFAUSTRALIA_NT = 'faustralia_nt'
-UIFNEWZEALAND = 'fnewzealand'
-
-UIDIGITALANDANALOGUE = 'digitalandanalogue'
-UIDIGITAL = 'digital'
-UIANALOGUE = 'analogue'
-UIDONE = 'done'
-UIDISAGREE = 'disagree'
-UIAGREE = 'agree'
-
-UIUNLOCKED = 'unlocked'
-UILOCKED = 'locked'
- 
-# Internet
-UIIPV4 = 'ipv4'
-UIIPV6 = 'ipv6'
-UINETWORKSETUP = 'uinetworksetup'
-UIRETRY = 'retry'
-
-#---------------
-# Arif Added_09012020
-#---------------
-PA_UI_FDIGITALANDANALOGUE = 'fdigitalandanalogue'
-PA_UI_FDIGITAL = 'fdigital'
-PA_UI_FANALOGUE = 'fanalogue'
-PA_UI_FSKIPTUNING = 'fskiptuning'
-
-#---------------
-# Arif Added_07022020
-#---------------
-SA_UI_FZONE = 'fzone'
-SA_UI_FREGION = 'fregion'
-SA_UI_FCITY = 'fcity'
-SA_UI_FASOK = 'fasok'
-
-# ZONE
-UILUZON = 'luzon'
-UIMINDANAO = 'mindanao'
-UIVISAYAS = 'visayas'
-
-# LUZON
-UINCR = 'ncr'
-UIBICOLREGION = 'bicolregion'
-UIMIMAROPA = 'mimaropa'
-UICALABARZON = 'calabarzon'
-UICENTRALLUZON = 'centralluzon'
-UICAGAYANVELLY = 'cagayanvelly'
-UIILOCOSREGION = 'ilocosregion'
-UICORDILERAADMINISTRATIVEREGION = 'cordileraadministrativeregion'
-# NCR
-UICALOOCAN = 'caloocan'
-UIVANLENZUELA = 'vanlenzuela'
-UITAGUIG = 'taguig'
-UISANJUAN = 'sanjuan'
-UIQUEZONCITY = 'quezoncity'
-UIPATEROS = 'pateros'
-UIPASIG = 'pasig'
-UIPASAY = 'pasay'
-UIPARANAQUE = 'paranaque'
-UINAVOTAS = 'navotas'
-UIMUNTINLUPA = 'muntinlupa'
-UIMARIKINA = 'marikina'
-UIMANILA = 'manila'
-UIMANDALUYONG = 'mandaluyong'
-UIMALABON = 'malabon'
-UIMAKATI = 'makati'
-UILASPINAS = 'laspinas'
-# BICOLREGION
-UIALBAY = 'albay'
-UISORSOGON = 'sorsogon'
-UINAGA = 'naga'
-UIMASBATA = 'masbata'
-UICATADUANES = 'cataduanes'
-UICAMARINESNORTE = 'camarinesnorte'
-UICAMARINESSUR = 'camarinessur'
-# MIMAROPA
-UIMARINDUQUE = 'marinduque'
-UIROMBION = 'rombion'
-UIPUERTOPRINCESA = 'puertoprincesa'
-UIPALAWAN = 'palawan'
-UIORIENTALMINDORO = 'orientalmindoro'
-UIOCCIDENTALMINDORO = 'occidentalmindoro'
-# CALABARZON
-UIBATANGAS = 'batangas'
-UIRIZAL = 'rizal'
-UIQUEZON = 'quezon'
-UILUCENA = 'lucena'
-UILAGUNA = 'laguna'
-UICAVITE = 'cavite'
-# CENTRALLUZON
-UIANGELES = 'angeles'
-UIZAMBALES = 'zambales'
-UITARLAC = 'tarlac'
-UIPAMPANGA = 'pampanga'
-UIOLONGAPO = 'olongapo'
-UINUEVAECIJIA = 'nuevaecijia'
-UIBULACAN = 'bulacan'
-UIBATAAAN = 'bataaan'
-UIAURORA = 'aurora'
-# CAGAYANVELLY
-UIBATANES = 'batanes'
-UISANTIGO = 'santigo'
-UIQUIRINO = 'quirino'
-UINUEVAVIZCAYA = 'nuevavizcaya'
-UIISABELA = 'isabela'
-UICAGAYAN = 'cagayan'
-# ILOCOSREGION
-UIILOCOSNORTE = 'ilocosnorte'
-UIPANGASINAN = 'pangasinan'
-UILAUNION = 'launion'
-UIILOCOSSUR = 'ilocossur'
-# CORDILERAADMINISTRATIVEREGION
-UIABRA = 'abra'
-UIMTPROVINCE = 'mtprovince'
-UIKALINGA = 'kalinga'
-UIIFUGAO = 'ifugao'
-UIBENGUET = 'benguet'
-UIBAGUIO = 'baguio'
-UIAPAYAO = 'apayao'
-
-# -------------------------
-# MINDANAO
-UIZAMBOANGAPENINSULA = 'zamboangapeninsula'
-UIAUTONOMOUSREGIONINMUSLIM = 'autonomousregioninmuslim'
-UICARAGA = 'caraga'
-UISOCCSKSARGEN = 'soccsksargen'
-UIDAVAOREGION = 'davaoregion'
-UINORTHERNMINDANAO = 'northernmindanao'
-# ZAMBOANGAPENINSULA
-UIISABELACITY = 'isabelacity'
-UIZAMBOANGASIBUGAY = 'zamboangasibugay'
-UIZAMBOANGADELSUR = 'zamboangadelsur'
-UIZAMBOANGADELNORTE = 'zamboangadelnorte'
-UIZAMBOANGACITY = 'zamboangacity'
-# AUTONOMOUSREGIONINMUSLIM
-UIBASILAN = 'basilan'
-UITAWITAWI = 'tawitawi'
-UISULU = 'sulu'
-UIMAGUINDANAO = 'maguindanao'
-UILANAODELSUR = 'lanaodelsur'
-# CARAGA
-UIAUGUSANDELNORTE = 'augusandelnorte'
-UISURIGAODELSUR = 'surigaodelsur'
-UISURIGAODELNORTE = 'surigaodelnorte'
-UIDINAGATISLANDS = 'dinagatislands'
-UIBUTUAN = 'butuan'
-UIAUGUSANDELSUR = 'augusandelsur'
-# SOCCSKSARGEN
-UICOTABATO = 'cotabato'
-UISULTANKUDARATA = 'sultankudarata'
-UISOUTHCOTABATO = 'southcotabato'
-UISARANGGANI = 'saranggani'
-UIGENERALSANTOS = 'generalsantos'
-UICOTABATOCITY = 'cotabatocity'
-# DAVAOREGION
-UICOMPOSTELAVALLEY = 'compostelavalley'
-UIDAVAOORIENTAL = 'davaooriental'
-UIDAVAODELSUR = 'davaodelsur'
-UIDAVAODELNORTE = 'davaodelnorte'
-UIDAVAOCITY = 'davaocity'
-# NORTHERNMINDANAO
-UIBUKIDNON = 'bukidnon'
-UIMISAMISORIENTAL = 'misamisoriental'
-UIMISAMISOCCIDENTAL = 'misamisoccidental'
-UILANAODELNORTE = 'lanaodelnorte'
-UIILIGAN = 'iligan'
-UICAMIGUIN = 'camiguin'
-UICAGAYANDEORO = 'cagayandeoro'
-
-# -------------------------
-# VISAYAS
-UIWESTERNVISAYAS = 'westernvisayas'
-UIEASTERNVISAYAS = 'easternvisayas'
-UICENTRALVISAYAS = 'centralvisayas'
-# WESTERNVISAYAS
-UIAKLAN = 'aklan'
-UINEGROSOCCIDENTAL = 'negrosoccidental'
-UIILOILOCITY = 'iloilocity'
-UIILOILO = 'iloilo'
-UIGUIMARAS = 'guimaras'
-UICAPIZ = 'capiz'
-UIBACOLOD = 'bacolod'
-UIANTIQUE = 'antique'
-# EASTERNVISAYAS
-UIBILIRAN = 'biliran'
-UITACLOBAN = 'tacloban'
-UISOUTHERNLEYTE = 'southernleyte'
-UISAMAR = 'samar'
-UIORMOC = 'ormoc'
-UINORTHERNSAMAR = 'northernsamar'
-UILEYTE = 'leyte'
-UIEASTERNSAMAR = 'easternsamar'
-# CENTRALVISAYAS
-UIBOHOL = 'bohol'
-UISIQUIJOR = 'siquijor'
-UINEGROSORIENTAL = 'negrosoriental'
-UILAPULAPU = 'lapulapu'
-UICEBUCITY = 'cebucity'
-UICEBU = 'cebu'
-
-#---------------
-# Arif Added_21022020
-#---------------
-UNICORN = 'unicorn'
-VULCAN = 'vulcan'
-VULCAN2 = 'vulcan2'
-
-#---------------
-# Arif Added_13032020
-#---------------
-PA_UI_HSREBOOT = 'uihsreboot'
-PA_UI_REBOOT = 'uireboot'
-UI_HSREBOOT = 'uihsreboot'
-UI_REBOOT = 'uireboot'
-UIREBOOT = 'reboot'
-
-#---------------
-# Arif Added_16032020
-#---------------
-# HOME LAYER
-UI_CLICKTOSPEAK = 'clicktospeak'
-UI_CLICKTOTYPE = 'clicktotype'
-UI_NOTIFICATION = 'notification'
-UI_HOMESETTINGS = 'homesettings'
-UI_DETAILS = 'details'
-UI_DISMISS = 'dismiss'
-UI_APPS = 'apps'
-UI_TV = 'tv'
-UI_DTV = 'dtv'
-
-# Apps
-UI_NETFLIX = 'netflix'
-UI_PRIMEVIDEO = 'primevideo'
-UI_MEDIAPLAYER = 'mediaplayer'
-UI_YOUTUBE = 'youtube'
-UI_GOOLEPLAY = 'googleplay'
-UI_ADDAPPTOFAVOURITES = 'addapptofavourites'
-UI_HOMECUSTOMISECHANNELS = 'homecustomisechannels'
-UI_APPTV = 'apptv'
-UI_CHANNEL1 = 'channel1'
-UI_CHANNEL2 = 'channel2'
-UI_CHANNEL3 = 'channel3'
-UI_NETFLIX_ROW = 'netflixrow'
-UI_NETFLIXR1 = 'netflixr1'
-UI_NETFLIXR2 = 'netflixr2'
-UI_NETFLIXR3 = 'netflixr3'
-UI_YOUTUBE_ROW = 'youtuberow'
-UI_YOUTUBER1 = 'youtuber1'
-UI_YOUTUBER2 = 'youtuber2'
-UI_YOUTUBER3 = 'youtuber3'
-UI_GOOGLEPM_ROW = 'googlepmrow'
-UI_GOOGLEPMR1 = 'googlepmr1'
-UI_GOOGLEPMR2 = 'googlepmr2'
-UI_GOOGLEPMR3 = 'googlepmr3'
-
-# Home Customise Channels
-UI_HOMEPLAYNEXT = 'homeplaynext'
-UI_HOMECUSTOMISECHANNELSTV = 'homecustomisechannelstv'
-UI_HOMEPLAYNEXTL2 = 'homeplaynextl2'
-UI_HOMEPLAYNEXTTV = 'homeplaynexttv'
-UI_HOMEPLAYNEXTGPM = 'homeplaynextgpm'
-UI_HOMEPLAYNEXTNETFLIX = 'homeplaynextnetflix'
-UI_HOMEPLAYNEXTYOUTUBE = 'homeplaynextyoutube'
-UI_HOMECUSTOMISECHANNELSGPM = 'homecustomisechannelsgpm'
-UI_HOMECUSTOMISECHANNELSNETFLIX = 'homecustomisechaneelsnetflix'
-UI_HOMECUSTOMISECHANNELSYOUTUBE ='homecustomisechannelsyoutube'
-
-# Option
-UI_OPICTUREOFF = 'opictureoff'
-UI_OPICTURE = 'opicture'
-UI_OSOUND = 'osound'
-UI_OSPEAKERS = 'ospeakers'
-UI_OWATCHTV = 'owatchtv'
-UI_OAUDIOLANGUAGE = 'oaudiolanguage'
-UI_OALTERNATEAUDIO = 'oalternateaudio'
-UI_OCCDISPLAY = 'occdisplay'
-UI_OAUDIODESCRIPTION = 'oaudiodescription'
-UI_OSETTINGS = 'osettings'
-UI_BLACKSCREEN = 'blackscreen'
-# Inside Apps
-UI_GETMOREAPPS = 'getmoreapps'
-UI_GETMOREGAMES = 'getmoregames'
-UI_APPSNETFLIX = 'appsnetflix'
-UI_APPSPRIMEVIDEO = 'appsprimevideo'
-UI_APPSTV = 'appstv'
-UI_APPSMEDIAPLAYER = 'appsmediaplayer'
-UI_APPSYOUTUBE = 'appsyoutube'
-UI_APPSGOOGLEPLAYMOVIES = 'appsgoogleplaymovies'
-UI_APPSGOOGLEPLAYMUSIC = 'appsgoogleplaymusic'
-UI_APPSGOOGLEPLAYSTORE = 'appsgoogleplaystore'
-UI_APPSGOOGLEPLAYGAMES = 'appsgoogleplaygames'
-UI_APPSCUSTOMERSUPPORT = 'appscustomersupport'
-UI_APPSSYSTEMTRACING = 'appssystemtracing'
-
-UI_OKIVEGOTIT = 'okivegotit'
-UI_OKSETUPNOW = 'oksetupnow'
-
-# Inside Settings from HOME        Inside Settings from HOME        Inside Settings from HOME        Inside Settings from HOME        Inside Settings from HOME        
-UI_HSDTV = 'hsdtv'
-UI_HSFINISHSETTINGTV = 'hsfinishsettingtv'
-UI_HSTAKEBUGREPORT = 'hstakebugreport'
-UI_HSNETWORKANDINTERNET = 'hsnetworkandinternet'
-UI_HSACCOUNTSANDSIGNIN = 'hsaccountsandsignin'
-UI_HSSAPPS = 'hssapps'
-UI_HSDEVICEPREFERENCES = 'hsdevicepreferences'
-UI_HSREMOTESANDACCESSORIES = 'hsremoteandaccessories'
-UI_HSBRAVIASETTINGS = 'hsbraviasettings'
-
-# Network and Internet
-UI_HSWIFI = 'hswifi'
-UI_HSNETWORK1 = 'hsnetwork1'
-UI_HSNETWORK2 = 'hsnetwork2'
-UI_HSNETWORK3 = 'hsnetwork3'
-UI_HSSEEALL = 'hsseeall'
-UI_HSADDNEWNETWORK = 'hsaddnewnetwork'
-UI_HSSCANNINGALWAYSAVAILABLE = 'hsscanningalwaysavailable'
-UI_HSNOTCONNECTED = 'hsnotconnected'
-UI_HSPROXYSETTINGS = 'hsproxysettings'
-UI_HSIPSETTINGS = 'hsipsettings'
-
-# Inside Apps
-UI_HSAPPS1 = 'hsapps1'
-UI_HSAPPS2 = 'hsapps2'
-UI_HSAPPS3 = 'hsapps3'
-UI_HSAPPS4 = 'hsapps4'
-UI_HSAPPS5 = 'hsapps5'
-UI_HSSEEALLAPPS = 'hsseeallmaps'
-UI_HSAPPSPERMISSION = 'hsappspermission'
-UI_HSSPECIALAPPACCESS = 'hsspecialappaccess'
-UI_HSSECURITYANDRESTRICTIONS = 'hssecurityandrestrictions'
-
-# App Permissions
-UI_HSBODYSENSORS = 'hsbodysensors'
-UI_HSCALENDAR = 'hscalendar'
-UI_HSCALLLOGS = 'hscalllogs'
-UI_HSCAMERA = 'hscamera'
-UI_HSCONTACTS = 'hscontacts'
-UI_HSLOCATION = 'hslocations'
-UI_HSMICROPHONE = 'hsmicrophone'
-UI_HSSMS = 'hssms'
-UI_HSSTORAGE = 'hsstorage'
-UI_HSTELEPHONE = 'hstelephone'
-UI_HSADDITIONALPERMISSION = 'hsadditionalpermission'
-
-# Calendar Permissions
-UI_HSCALENDARSHOWSYSTEMAPPS = 'hscalendarshowsystemapps'
-UI_HSCALENDARGOOGLECALENDARSYNC = 'hscalendargooglecalendarsync'
-UI_HSCALENDARGOOGLEPLAYSERVICES = 'hscalendargoogleplayservices'
-UI_HSCALENDARGOOGLESEARCH = 'hscalendargooglesearch'
-# Call Log Permissions
-UI_HSCALLLOGSSHOWSYSTEMAPPS = 'hscalllogsshowsystmeapps'
-UI_HSCALLLOGSGOOGLEPLAYSERVICES = 'hscalllogsgoogleplayservices'
-# Camera Permissions
-UI_HSCAMERAL2 = 'hscameral2'
-UI_HSCAMERAGALLERY = 'hscameragallery'
-UI_HSCAMERASHOWSYSTEMAPPS = 'hscamerashowsystemapps'
-UI_HSCAMERAL3 = 'hscameral3'
-UI_HSCAMERAGOOGLEPLAYSERVICES = 'hscameragoogleplayservices'
-UI_HSCAMERAGOOGLESEARCH = 'hscameragooglesearch'
-# Contacts Permissions
-UI_HSCONTACTSGALLERY = 'hscontactsgallery'
-UI_HSCONTACTSGOOGLEPLAYGAMES = 'hscontactsgoogleplaygames'
-UI_HSCONTACTSGOOGLEPLAYSTORE = 'hscontactsgoogleplaystore'
-UI_HSCONTACTSNETFLIX = 'hscontactsnetflix'
-UI_HSCONTACTSSHOWSYSTEMAPPS = 'hscontactsshowsytemapps'
-UI_HSCONTACTSBUGREPORTSENDER = 'hscontactsbugreportsender'
-UI_HSCONTACTSCALENDARSTORAGE = 'hscontactscalendarstorage'
-UI_HSCONTACTSGBOARD = 'hscontactsgboard'
-UI_HSCONTACTSGOOGLEBACKUPTRANSPORT = 'hscontactsgooglebackuptransport'
-UI_HSCONTACTSGOOGLECONTACTSSYNC = 'hscontactsgooglecontactssync'
-UI_HSCONTACTSGOOGLEINDICKEYBOARD = 'hscontactsgoogleinidckeyboard'
-UI_HSCONTACTSGOOGLEPLAYSERVICE = 'hscontactsgoogleplayservice'
-UI_HSCONTACTSGOOGLESEARCH = 'hscontactsgooglesearch'
-UI_HSCONTACTSGOOGLESERVICEFRAMEWORK = 'hscontactsgoogleserviceframework'
-UI_HSCONTACTSPLAYMUSIC = 'hscontactsplaymusic'
-# Location Permissions
-UI_HSLOCATIONANDROIDTVREMOTE = 'hslocationandroidremote'
-UI_HSLOCATIONSERVICE = 'hslocationservice'
-UI_HSLOCATIONEULA1 = 'hslocationeula1'
-UI_HSLOCATIONEULA2 = 'hslocationeula2'
-UI_HSLOCATIONEULA3 = 'hslocationeula3'
-UI_HSLOCATIONGALLERY = 'hslocationgallery'
-UI_HSLOCATIONGOOGLEPLAYSTORE = 'hslocationgoogleplaystore'
-UI_HSLOCATIONHELP1 = 'hslocationhelp1'
-UI_HSLOCATIONHELP2 = 'hslocationhelp2'
-UI_HSLOCATIONSHOWSYSTEMAPPS = 'hslocationshowsystemapps'
-UI_HSLOCATIONANDDROIDACCESSIBILITY = 'hslocationandroidaccessibility'
-UI_HSLOCATIONCAMERA = 'hslocationcamera'
-UI_HSLOCATIONGOOGLEPLAYMOVIESANDTV = 'hslocationgoogleplaymoviesandtv'
-UI_HSLOCATIONGOOGLEPLAYSERVICES = 'hslocationgoogleplayservices'
-UI_HSLOCATIONGOOGLESEARCH = 'hslocationgooglesearch'
-UI_HSLOCATIONPLAYMUSIC = 'hslocationplaymusic'
-UI_HSLOCATIONSETUPWIZARD = 'hslocationsetupwizard'
-# Microphone Permissions
-UI_HSMICROPHONECAMERA = 'hsmicrophonecamera'
-UI_HSMICROPHONEEULA1 = 'hsmicrophoneeula1'
-UI_HSMICROPHONEEULA2 = 'hsmicrophoneeula2'
-UI_HSMICROPHONEEULA3 = 'hsmicrophoneeula3'
-UI_HSMICROPHONEGALLERY = 'hsmicrophonegallery'
-UI_HSMICROPHONEGOOGLEPLAYSTORE = 'hsmicrophonegoogleplaystore'
-UI_HSMICROPHONEHELP1 = 'hsmicrophonehelp1'
-UI_HSMICROPHONEHELP2 = 'hsmicrophonehelp2'
-UI_HSMICROPHONEYOUTUBE = 'hsmicrophoneyoutube'
-UI_HSMICROPHONESHOWSYSTEMAPPS = 'hsmicrophoneshowsystemapps'
-UI_HSMICROPHONEANDROIDACCESSIBILITY = 'hsmicrophoneandroidaccessibility'
-UI_HSMICROPHONECAMERAL2 = 'hsmicrophonecameral2'
-UI_HSMICROPHONEGBOARD = 'hsmicrophonegboard'
-UI_HSMICROPHONEGOOGLEPLAYSERVICE = 'hsmicrophonegoogleplayservice'
-UI_HSMICROPHONEGOOGLESEARCH = 'hsmicrophonegooglesearch'
-UI_HSMICROPHONEPLAYMUSIC = 'hsmicrophoneplaymusic'
-# SMS Permissions
-UI_HSSMSGOOGLEPLAYSTORE = 'hssmsgoogleplaystore'
-UI_HSSMSSHOWSYSTEMAPPS = 'hssmsshowsystemapps'
-UI_HSSMSGOOGLEPLAYSERVICES = 'hssmsgoogleplayservices'
-# Storage Permissions
-UI_HSSTORAGEANDROIDTVREMOTE = 'hsstorageandroidtvremote'
-UI_HSSTORAGECAMERAL2 = 'hsstoragecameral2'
-UI_HSSTORAGEEULA1 = 'hsstorageeula1'
-UI_HSSTORAGEEULA2 = 'hsstorageeula2'
-UI_HSSTORAGEEULA3 = 'hsstorageeula3'
-UI_HSSTORAGEGALLERY = 'hsstoragegallery'
-UI_HSSTORAGEHELP1 = 'hsstoragehelp1'
-UI_HSSTORAGEHELP2 = 'hsstoragehelp2'
-UI_HSSTORAGENETFLIX = 'hsstoragenetflix'
-UI_HSSTORAGEQRMT = 'hsstorageqrmt'
-UI_HSSTORAGESHOWSYSTEMAPPS = 'hsstorageshowsystemapps'
-UI_HSSTORAGEBUGREPORTSENDER = 'hsstoragebugreportsender'
-UI_HSSTORAGECALENDARSTORAGE = 'hsstoragecalendarstorage'
-UI_HSSTORAGECAMERAL3 = 'hsstoragecameral3'
-UI_HSSTORAGEDEMOAPP = 'hsstoragestoragedemoapp'
-UI_HSSTORAGEGBOARD = 'hsstoragegboard'
-UI_HSSTORAGEGOOGLEINDICKEYBOARD = 'hsstoragegoogleindickeyboard'
-UI_HSSTORAGEGOOGLEPLAYSERVICES = 'hsstoragegoogleplayservices'
-UI_HSSTORAGEGOOGLESEARCH = 'hsstoragegooglesearch'
-UI_HSSTORAGEHTMLVIEWER = 'hsstoragehtmlviewer'
-UI_HSSTORAGEMEDIAPLAYER = 'hsstoragemediaplayer'
-UI_HSSTORAGEPLAYMUSIC = 'hsstorageplaymusic'
-UI_HSSTORAGEPRIMEVIDEO = 'hsstorageprimevideo'
-UI_HSSTORAGESETUPWIZARD = 'hsstoragesetupwizard'
-UI_HSSTORAGETVSTORAGE = 'hsstoragetvstorage'
-# Telephone Permissions
-UI_HSTELEPHONEEULA1 = 'hstelephoneeula1'
-UI_HSTELEPHONEEULA2 = 'hstelephoneeula2'
-UI_HSTELEPHONEEULA3 = 'hstelephoneeula3'
-UI_HSTELEPHONEGOOGLEPLAYSTORE = 'hstelephonegoogleplaystore'
-UI_HSTELEPHONEHELP1 = 'hstelephonehelp1'
-UI_HSTELEPHONEHELP2 = 'hstelephonehelp2'
-UI_HSTELEPHONEQRMT = 'hstelephoneqrmt'
-UI_HSTELEPHONESHOWSYSTEMAPPS = 'hstelephoneshowsystemapps'
-UI_HSTELEPHONEANDROIDACCESSIBILITY = 'hstelephoneandroidaccessibility'
-UI_HSTELEPHONEGOOGLEPLAYSERVICES = 'hstelephonegoogleplayservices'
-UI_HSTELEPHONEGOOGLESEARCH = 'hstelephonegooglesearch'
-UI_HSTELEPHONEGOOGLESERVICESFRAMEWORK = 'hstelephonegoogleservicesframework'
-UI_HSTELEPHONESETTINGSSUGGESTIONS = 'hstelephonesettingssuggestions'
-# Additional Permissions
-UI_HSREADALLTVLISTINGS = 'hsreadalltvlistings'
-UI_HSREADINSTANTMESSAGES = 'hsreadinstantmessages'
-UI_HSWRITEINSTANTMESSAGES = 'hswriteinstantmessages'
-# Read Instant messages permission
-UI_HSREADSHOWSYSTEMAPPS = 'hsreadshowsystemapps'
-UI_HSREADGOOGLESERVICESFRAMEWORK = 'hsreadgoogleservicesframework'
-# Write Instant messages permission
-UI_HSWRITESHOWSYSTEMAPPS = 'hswriteshowsystemapps'
-UI_HSWRITEGOOGLESERVICESFRAMEWORK = 'hswritegoogleservicesframework'
-
-# Special App Access
-UI_HSENERGYOPTIMISATION = 'hsenergyoptimisation'
-UI_HSUSAGEACCESS = 'hsusageaccess'
-UI_HSNOTIFICATIONACCESS = 'hsnotificationaccess'
-UI_HSDISPLAYOVEROTHERAPPS = 'hsdisplayoverotherapps'
-UI_HSMODIFYSYSTEMSETTINGS = 'hsmodifysystemsettings'
-UI_HSDIRECTORYACCESS = 'hsdirectoryaccess'
-
-# Energy Optimisation
-UI_ENERGYOPTIMISATION2 = 'energyoptimisation2'
-UI_ENERGYACTIONMENU = 'energyactionmenu'
-UI_ENERGYACTIVITYSTUB = 'energyactivitystub'
-UI_ENERGYADVANCEDSETTINGS = 'energyadvancedsettings'
-UI_ENERGYANDROIDACCESSIBILITYSUITE = 'energyandroidaccessibilitysuite'
-UI_ENERGYANDROIDSERVICESLIBRARY = 'energyandroidserviceslibrary'
-UI_ENERGYANDROIDSHAREDLIBRARY = 'energyandroidsharedlibrary'
-UI_ENERGYANDROIDSYSTEMWEBVIEW = 'energyandroidsystemwebview'
-UI_ENERGYANDROIDTVCORESERVICES = 'energyandroidtvcoreservices'
-UI_ENERGYANDROIDTVHOME = 'energyandroidtvhome'
-UI_ENERGYANDROIDTVREMOTESERVICE = 'energyandroidtvremoteservice'
-UI_ENERGYBACKDROP = 'energybackdrop'
-UI_ENERGYBASICDAYDREAMS = 'energybasicdaydreams'
-UI_ENERGYBLUETOOTH = 'energybluetooth'
-UI_ENERGYBRAVIASETTINGS = 'energybraviasettings'
-UI_ENERGYBUGREPORTSENDER = 'energybugreportsender'
-UI_ENERGYCALENDARSTORAGE = 'energycalendarstorage'
-UI_ENERGYCAMERA1 = 'energycamera1'
-UI_ENERGYCAMERA2 = 'energycamera2'
-UI_ENERGYCAPTIVEPORTALLOGIN = 'energycaptiveportallogin'
-UI_ENERGYCERIFICATEINSTALLER = 'energycerificateinstaller'
-UI_ENERGYCHROMECASTBUILTIN = 'energychromecastbuiltin'
-UI_ENERGYCODECNOTIFICATION = 'energycodecnotification'
-UI_ENERGYCOMANDROIDBACKUPCOMFIRM = 'energycomandroidbackupcomfirm'
-UI_ENERGYCOMANDROIDCTCCTSSHIM = 'energycomandroidctcctsshim'
-UI_ENERGYCOMANDROIDSHAREDSTORAGEBACKUP = 'energycomandroidsharedstoragebackup'
-UI_ENERGYCOMGOOGLEANDORIDLEANBACKLAUNCHER = 'energycomgoogleandoridleanbacklauncher'
-UI_ENERGYCOMGOOGLEANDORIDLEANBACKLAUNCHERRECOMENDATIONS = 'energycomgoogleandoridleanbacklauncherrecomendations'
-UI_ENERGYCOMREALTEKSERVICEMENU = 'energycomrealtekservicemenu'
-UI_ENERGYCOMPANIONDEVICEMANAGER = 'energycompaniondevicemanager'
-UI_ENERGYCONTACTSSTORAGE = 'energycontactsstorage'
-UI_ENERGYDEMOAPP = 'energydemoapp'
-UI_ENERGYDEVICECONFIGURATION = 'energydeviceconfiguration'
-UI_ENERGYDOWNLOADMANAGER = 'energydownloadmanager'
-UI_ENERGYDTVTVINOUT = 'energydtvtvinout'
-UI_ENERGYENGLISHMENU = 'energyenglishmenu'
-UI_ENERGYEULA1 = 'energyeula1'
-UI_ENERGYEULA2 = 'energyeula2'
-UI_ENERGYEULA3 = 'energyeula3'
-UI_ENERGYEXTERNALSTORAGE = 'energyexternalstorage'
-UI_ENERGYFILES = 'energyfiles'
-UI_ENERGYFUSEDLOCATION = 'energyfusedlocation'
-UI_ENERGYGALLERY = 'energygallery'
-UI_ENERGYGBOARD = 'energygboard'
-UI_ENERGYGOOGLEBACKUPTRANSPORT = 'energygooglebackuptransport'
-UI_ENERGYGOOGLECALENDARSYNC = 'energygooglecalendarsync'
-UI_ENERGYGOOGLECONTACTSSYNC = 'energygooglecontactssync'
-UI_ENERGYGOOGLEONETIMEINIT = 'energygoogleonetimeinit'
-UI_ENERGYGOOGLEPARTNERSETUP = 'energygooglepartnersetup'
-UI_ENERGYGOOGLEPLAYGAMES = 'energygoogleplaygames'
-UI_ENERGYGOOGLEPLAYMOVIESANDTV = 'energygoogleplaymoviesandtv'
-UI_ENERGYGOOGLEPLAYSERVICES = 'energygoogleplayservices'
-UI_ENERGYGOOGLEPLAYSTORE = 'energygoogleplaystore'
-UI_ENERGYGOOGLESEARCH = 'energygooglesearch'
-UI_ENERGYGOOGLESERVICEFRAMEWORK = 'energygoogleserviceframework'
-UI_ENERGYGOOGLETEXTTOSPEECHENGINE = 'energygoogletexttospeechengine'
-UI_ENERGYHELP1 = 'energyhelp1'
-UI_ENERGYHELP2 = 'energyhelp2'
-UI_ENERGYHTMLVIEWER = 'energyhtmlviewer'
-UI_ENERGYINPUTDEVICES = 'energyinputdevices'
-UI_ENERGYINTENTFILTERVERIFICATIONSERVICE = 'energyintentfilterverificationservice'
-UI_ENERGYIPCONTROL = 'energyipcontrol'
-UI_ENERGYIPCONTROLAUX = 'energyipcontrolaux'
-UI_ENERGYKEYCHAIN = 'energykeychain'
-UI_ENERGYLIVEWALLPAPERPICKER = 'energylivewallpaperpicker'
-UI_ENERGYMARKETFEEDBACKAGENT = 'energymarketfeedbackagent'
-UI_ENERGYMEDIAPLAYER = 'energymediaplayer'
-UI_ENERGYMEDIASTORAGE = 'energymediastorage'
-UI_ENERGYMULTILINGUALKEYBOARD = 'energymultilingualkeyboard'
-UI_ENERGYNETFLIX = 'energynetflix'
-UI_ENERGYNETFLIXSETTINGS = 'energynetflixsettings'
-UI_ENERGYPACKAGEACCESSHELPER = 'energypackageaccesshelper'
-UI_ENERGYPACKAGEINSTALLER = 'energypackageinstaller'
-UI_ENERGYPACPROCESSOR = 'energypacprocessor'
-UI_ENERGYPASSTHROUGHINPUT = 'energypassthroughinput'
-UI_ENERGYPLAYMUSIC = 'energyplaymusic'
-UI_ENERGYPRIMEVIDEO = 'energyprimevideo'
-UI_ENERGYPRINTSPOOLER = 'energyprintspooler'
-UI_ENERGYPROXYHANDLER = 'energyproxyhandler'
-UI_ENERGYPUMPKINSERVICE = 'energypumpkinservice'
-UI_ENERGYQRMT = 'energyqrmt'
-UI_ENERGYSECONDSCREENSETUPAUTHBRIDGE = 'energysecondscreensetupauthbridge'
-UI_ENERGYSECUREELEMENTAPPLICATION = 'energysecureelementapplication'
-UI_ENERGYSETTINGSSTORAGE = 'energysettingsstorage'
-UI_ENERGYSETTINGSSUGGESTION = 'energysettingssuggestion'
-UI_ENERGYSETUPWIZARD = 'energysetupwizard'
-UI_ENERGYSETUPCUSTOMIZER = 'energysetupcustomizer'
-UI_ENERGYSHELL = 'energyshell'
-UI_ENERGYSYSTEMTRACING = 'energysystemtracing'
-UI_ENERGYTEXTMAGNIFICATION = 'energytextmagnification'
-UI_ENERGYTV1 = 'energytv1'
-UI_ENERGYTV2 = 'energytv2'
-UI_ENERGYTVSTORAGE1 = 'energytvstorage1'
-UI_ENERGYTVSTORAGE2 = 'energytvstorage2'
-UI_ENERGYUSBUPDATE = 'energyusbupdate'
-UI_ENERGYUSERDICTIONARY = 'energyuserdictionary'
-UI_ENERGYVPNDIALOGS = 'energyvpndialogs'
-UI_ENERGYYOUTUBE = 'energyyoutube'
-
-# Usage Access
-UI_HSUSAGEACCESS2 = 'hsusageaccess2'
-UI_HSUSAGEBLUETOOTH = 'hsusagebluetooth'
-UI_HSUSAGEGOOGLEPLAYSERVICES = 'hsusagegoogleplayservices'
-UI_HSUSAGEGOOGLEPLAYSTORE = 'hsusagegoogleplaystore'
-UI_HSUSAGEGOOGLESEARCH = 'hsusagegooglesearch'
-UI_HSUSAGESHELL = 'hsusageshell'
-# Notification Access
-UI_HSNOTIFICATIONACCESS2 = 'hsnotificationaccess2'
-UI_HSNOTIFICATIONANDROIDTVCORESERVICES = 'hsnotificationandroidtvservices'
-# Allow Display Over Other Apps
-UI_HSDISPLAYOVEROTHERAPPS2 = 'hsdisplayoverotherapps2'
-UI_HSDISPLAYADVANCEDSETTINGS = 'hsdisplayadvancedsettings'
-UI_HSDISPLAYANDROIDACCESSIBILITYSUITE = 'hsdisplayandroidaccessibilitysuite'
-UI_HSDISPLAYANDROIDTVCORESERVICES = 'hsdisplayandroidtvcoreservices'
-UI_HSDISPLAYANDROIDTVHOME = 'hsdisplayandroidhome'
-UI_HSDISPLAYANDROIDTVREMOTESERVICE = 'hsdisplayandroidtvremoteservice'
-UI_HSDISPLAYBRAVIASETTINGS = 'hsdisplaybraviasettings'
-UI_HSDISPLAYCODECNOTIFICATION = 'hsdisplaycodenotification'
-UI_HSDISPLAYCOMREALTEKSERVICEMENU = 'hsdisplaycomrealtekservicemenu'
-UI_HSDISPLAYGOOGLEPLAYSERVICE = 'hsdisplaygoogleplayservice'
-UI_HSDISPLAYGOOGLESEARCH = 'hsdisplaygooglesearch'
-UI_HSDISPLAYMULTILINGUALKEYBOARD = 'hsdisplaymultilingualkeyboard'
-UI_HSDISPLAYPLAYMUSIC = 'hsdisplayplaymusic'
-UI_HSDISPLAYTEXTMAGNIFICATION = 'hsdisplaytextmagnification'
-UI_HSDISPLAYTV = 'hsdisplaytv'
-# Modify System Settings
-UI_HSMODIFYSYSTEMSETTINGS2 = 'hsmodifysystemsettings2'
-UI_HSMODIFYACTIONMENU = 'hsmodifyactionmenu'
-UI_HSMODIFYADVANCEDSETTINGS = 'hsmodifyadvancedsettings'
-UI_HSMODIFYBLUETOOTH = 'hsmodifybluetooth'
-UI_HSMODIFYBRAVIASETTINGS = 'hsmodifybraviasettings'
-UI_HSMODIFYCAMERA = 'hsmodifycamera'
-UI_HSMODIFYGALLERY = 'hsmodifygallery'
-UI_HSMODIFYGOOGLEBACKUPTRANSPORT = 'hsmodifygooglebackuptransport'
-UI_HSMODIFYGOOGLEPLAYSERVICE = 'hsmodifygoogleplayservice'
-UI_HSMODIFYGOOGLEPLAYSTORE = 'hsmodifygoogleplaystore'
-UI_HSMODIFYGOOGLESEARCH = 'hsmodifygooglesearch'
-UI_HSMODIFYGOOGLESERVICESFRAMEWORK = 'hsmodifygoogleservicesframework'
-UI_HSMODIFYMEDIASTORAGE = 'hsmodifymediastorage'
-UI_HSMODIFYPLAYMUSIC = 'hsmodifyplaymusic'
-UI_HSMODIFYQRMT = 'hsmodifyqrmt'
-UI_HSMODIFYSETUPWIZARD = 'hsmodifysetupwizard'
-UI_HSMODIFYSHELL = 'hsmodifyshell'
-UI_HSMODIFYTV = 'hsmodifytv'
-# Directory Access
-UI_HSDIRECTORYACCESS2 = 'hsdirectoryaccess2'
-
-# Security and Restrictions
-UI_HSUNKNOWNSOURCES = 'hsunknownsources'
-UI_HSVERIFYAPPS = 'hsverifyapps'
-# Install Unknown Apps
-UI_HSDEMOAPP = 'hsdemoapp'
-
-
-# Device Preferences
-UI_HSABOUT = 'hsabout'
-UI_HSDATEANDTIME = 'hsdateandtime'
-UI_HSLANGUAGE = 'hslanguage'
-UI_HSKEYBOARD = 'hskeyboard'
-UI_HSDEVICESOUND = 'hsdevicesound'
-UI_HSDEVICESTORAGE = 'hsdevicestorage'
-UI_HSHOMESCREEN = 'hshomescreen'
-UI_HSGOOGLEASSISTANT = 'hsgoogleassistant'
-UI_HSCHROMECASTBUILTIN = 'hschromecastbuiltin'
-UI_HSSCREENSAVER = 'hsscreensaver'
-UI_HSDEVICELOCATION = 'hsdevicelocation'
-UI_HSUSAGEANDDIAGNOSTICS = 'hsusageanddiagnostics'
-UI_HSACCESSIBILITY = 'hsaccessibility'
-UI_HSRESET = 'hsuireset'
-# About
-UI_HSSYSTEMUPDATE = 'hssystemupdate'
-UI_HSDEVICENAME = 'hsdevicename'
-UI_HSRESTART = 'hsrestart'
-UI_HSSTATUS = 'hsstatus'
-UI_HSLEGALINFORMATION = 'hslegalinformation'
-UI_HSMODEL = 'hsmodel'
-UI_HSNETFLIXESN = 'hsnetflixesn'
-UI_HSVERSION = 'hsversion'
-UI_HSANDROID = 'hsandroid'
-UI_HSKERNELVERSION = 'hskernelversion'
-UI_HSBUILD = 'hsbuild'
-# Status
-UI_HSIPADDRESS = 'hsipaddress'
-UI_HSMACADDRESS = 'hsmacaddress'
-UI_HSBLUETOOTHADDRESS = 'hsbluetoothaddress'
-UI_HSSERIALNUMBER = 'hsserialnumber'
-UI_HSUPTIME = 'hsuptime'
-
-# Legal Information
-UI_HSOPENSOURCE = 'hsopensource'
-UI_HSGOOGLELEGAL = 'hsgooglelegal'
-UI_HSSYSTEMWEBVIEWLICENCES = 'hssystemwebviewlicences'
-UI_HSADS = 'hsads'
-# Date And Time
-UI_HSAUTOMATICDATEANDTIME = 'hsautomaticdateandtime'
-UI_HSSETDATE = 'hssetdate'
-UI_HSSETTIME = 'hssettime'
-UI_HSSETTIMEZONE = 'hssettimezone'
-UI_HSUSE24HOURFORMAT = 'hsuse24hourformat'
-# Keyboard
-UI_HSCURRENTKEYBOARD = 'hscurrentkeyboard'
-UI_HSGBOARDSETTINGS = 'hsgboardsettings'
-UI_HSMANAGEKEYBOARD = 'hsmanagekeyboard'
-# Keyboard Settings
-UI_HSGBOARDLANGUAGE = 'hsgboardlanguage'
-UI_HSTERMSOFSERVICE = 'hstermsofservice'
-UI_HSPRIVACYPOLICY = 'hsprivacypolicy'
-UI_HSKEYBOARDOPENSOURCELICENCES = 'hskeyboardopensourcelicences'
-UI_HSSHAREUSAGESTATISTICS = 'hsshareusagestatistics'
-# Gboard Settings
-UI_HSUSESYSTEMLANGUAGES = 'hsusesytemlanguages'
-UI_HSKENGLISH_US = 'hskenglish_us'
-UI_HSKENGLISH_UK = 'hskenglish_uk'
-UI_HSKSIMPLIFIEDCHINESE = 'hsksimplifiedchinese'
-UI_HSKTRADISIONALCHINESE = 'hsktraditionalchinese'
-UI_HSKFRENCH = 'hskfrench'
-UI_HSKGERMAN = 'hskgerman'
-UI_HSKGERMAN_SWITZERLAND = 'hskgerman_switzerland'
-UI_HSKHEBREW = 'hskhebrew'
-UI_HSKHINDI1 = 'hskhindi1'
-UI_HSKHINDI2 = 'hskhindi2'
-UI_HSKITALIAN = 'hskitalian'
-UI_HSKITALIAN_SWITZERLAND = 'hskitalian_switzerland'
-UI_HSKJAPANESE = 'hskjapanese'
-UI_HSKKOREAN = 'hskkorean'
-UI_HSKNORWEGIAN_BOKMAL = 'hsknorwegian_bokmal'
-UI_HSKRUSSIAN = 'hskrussian'
-UI_HSKSPANISH = 'hskspanish'
-UI_HSKVIETNAMESE = 'hskvietnamese'
-
-# Available Virtual Keyboard
-UI_HSKEYBOARDGBOARD = 'hskeyboardgboard'
-UI_HSGOOGLEINDICKEYBOARD = 'hsgoogleindickeyboard'
-UI_HSGOOGLEVOICETYPING = 'hsgooglevoicetyping'
-UI_HSMULTILINGUALKEYBOARD = 'hsmultilingualkeyboard'
-UI_HSVIRTUALREMOTEKEYBOARD = 'hsvirtualremotekeyboard'
-# Device Sound
-UI_HSSYSTEMSOUND = 'hssystemsound'
-# Device Storage
-UI_HSINTERNALSHAREDSTORAGE = 'hsinternalsharedstorge'
-# Internal Shared Storage
-UI_HSINTERNALAPPS = 'hsintnernalaps'
-UI_HSINTERNALPHOTOSANDVIDEOS = 'hsinternalphotosandvideos'
-UI_HSINTERNALAUDIO = 'hsinternalaudio'
-UI_HSINTERNALDOWNLOAD = 'hsinternaldownload'
-UI_HSINTERNALCACHED = 'hsinternalcached'
-UI_HSINTERNALMISC = 'hsinternalmisc'
-UI_HSINTERNALAVAILABLE = 'hsinternalavailable'
-
-# Home Screen
-# Channels
-UI_HSCUSTOMISECHANNELS = 'hscustomisechannels'
-UI_HSENABLEVIDEOPREVIEWS = 'hsenablevideopreviews'
-UI_HSENABLEAUDIOPREVIEWS = 'hsenableaudiopreviews'
-# Apps
-UI_HSREORDERAPPS = 'hsreorderapps'
-UI_HSREORDERGAMES = 'hsreordergames'
-# Open-Source Licences
-UI_HSANDROIDTVHOME = 'hsandroidtvhome'
-UI_HSANDROIDTVCORESERVICES = 'hsandroidtvcoreservices'
-# Customise Channels
-UI_HSPLAYNEXT = 'hsplaynext'
-UI_HSCUSTOMISECHANNELSTV = 'hscustomisechannelstv'
-UI_HSPLAYNEXTL2 = 'hsplaynextl2'
-UI_HSPLAYNEXTTV = 'hsplaynexttv'
-# Google Assistant
-UI_HSACCOUNTS = 'hsaccounts'
-UI_HSSEARCHABLEAPPS = 'hssearchableapps'
-UI_HSSAFESEARCHFILTER = 'hssafesearchfilter'
-UI_HSBLOCKOFFENSIVEWORDS = 'hsblockoffensivewords'
-UI_HSTEMPERATUREUNIT = 'hstemperatureunit'
-UI_HSGOOGLEOPENSOURCELICENCES = 'hsgooleopensourcelicences'
-# Google Assistant
-UI_HSSEARCHABLEAPPSGOOGLEPLAYGAMES = 'hssearchableappsgoogleplaygames'
-UI_HSSEARCHABLEAPPSTV = 'hssearchableappstv'
-# Chromecast Built-in
-UI_HSCHROMEOPENSOURCELICENSE = 'hschromeopensourcelicense'
-UI_HSVERSIONNUMBERS = 'hsversionnumbers'
-# Screen Saver
-UI_HSSCREENSAVERL2 = 'hsscreensaverl2'
-UI_HSWHENTOSTART = 'hswhentostart'
-UI_HSPUTDEVICETOSLEEP = 'hsputdevicetosleep'
-UI_HSSTARTNOW = 'hsstartnow'
-# Start Screen Saver
-UI_HSSTARTSCREENSAVER = 'hsstartscreensaver'
-# Location
-UI_HSLOCATIONSTATUS = 'hslocationstatus'
-# Usage and Diafnostics
-UI_HSUSAGEANDDIAGNOSTICSL2 = 'hsusageanddiagnosticsl2'
-UI_HSACCESSIBILITYCAPTIONS = 'hsaccessibilitycaptions'
-UI_HSACCESSIBILITYAUDIODESCRIPTION = 'hsaccessibilityaudiodescription'
-UI_HSACCESSIBILITYHIGHCONTRASTTEXT = 'hsaccessibilityhighcontrasttext'
-UI_HSACCESSIBILITYTEXTTOSPEECH = 'hsaccessibilitytexttospeech'
-UI_HSACCESSIBILITYSHORTCUT = 'hsaccessibilityshortcut'
-UI_HSACCESSIBILITYTALKBACK = 'hsaccessibilitytalkback'
-UI_HSACCESSIBILITYSWITCHACCESS = 'hsaccessibilityswitchaccess'
-UI_HSACCESSIBILITYTEXTMAGNIFICATION = 'hsaccessibilitytextmagnification'
-UI_HSACCESSIBILITYSCREENREADER = 'hsaccessibilityscreenreader'
-# Captions
-UI_HSCAPTIONSDISPLAY = 'hscaptionsdisplay'
-# Display Options
-UI_HSCAPTIONSLANGUAGE = 'hscaptionslanguage'
-UI_HSCAPTIONSTEXTSIZE = 'hscaptionstextsize'
-# Caption Style
-UI_HSCAPTIONSWHITEONBLACK = 'hscaptionswhiteonblack'
-UI_HSCAPTIONSBLACKONWHITE = 'hscaptionsblackonwhite'
-UI_HSCAPTIONSYELLOWONBLACK = 'hscaptionsyellowonblack'
-UI_HSCAPTIONSYELLOWONBLUE = 'hscaptionsyellowonblue'
-UI_HSCAPTIONSCUSTOMIZED = 'hscaptionscustomized'
-# Caption Customised
-UI_HSFONTFAMILY = 'hsfontfamily'
-UI_HSTEXTFLASHING = 'hstextflashing'
-UI_HSTEXTCOLOUR = 'hstextcolour'
-UI_HSTEXTOPACITY = 'hstextopacity'
-UI_HSEDGETYPE = 'hsedgetype'
-UI_HSEDGECOLOUR = 'hsedgecolour'
-UI_HSSHOWBACKGROUND = 'hsshowbackground'
-UI_HSBACKGROUNDFLASHING = 'hsbackgroundflashing'
-UI_HSBACKGROUNDCOLOUR = 'hsbackgroundcolour'
-UI_HSBACKGROUNDOPACITY = 'hsbackgroundopacity'
-UI_HSSHOWWINDOW = 'hsshowwindow'
-UI_HSWINDOWCOLOUR = 'hswindowcolour'
-UI_HSWINDOWOPACITY = 'hswindowopacity'
-# Audio Setup
-UI_HSAUDIODESCRIPTION = 'hsaudiodescription'
-UI_HSMIXINGLEVEL = 'hsmixinglevel'
-UI_HSAUDIOTYPE = 'hsaudiotype'
-UI_HSAPRIMARYPREFEREDLANGUAGE = 'hsaprimarypreferedlanguage'
-UI_HSASECONDARYPREFEREDLANGUAGE = 'hsasecondarypreferedlanguage'
-# Text to Speech Output
-UI_HSGOOGLETEXTTOSPEECHENGINE = 'hsgoogletexttospeechengine'
-UI_HSENGINECONFIGURATION = 'hsengineconfiguration'
-UI_HSSPEECHRATE = 'hsspeechrate'
-UI_HSLISTENTOANEXAMPLE = 'hslistentoanexample'
-UI_HSDEFAULTLANGUAGESTATUS = 'hsdefaultlanguagestatus'
-# Engine Configuration
-UI_HSGOOGLETEXTTOSPEECHLANGUAGE = 'hsgoogletexttospeechlanguage'
-UI_HSSETTINGSFORGOOGLETEXTTOSPEECHENGINE = 'hssettingsforgoogletexttospeechengine'
-UI_HSINSTALLVOICEDATA = 'hsinstallvoicedata'
-# Accessibility Shortcut
-UI_HSENABLEACCESSIBILITYSHORTCUT = 'hsenableaccessibilityshortcut'
-UI_HSSHORTCUTSERVICE = 'hsshortcutservice'
-# Talkback
-UI_HSTALKBACKENABLE = 'hstalkbackenable'
-UI_HSTALKBACKCONFIGURATION = 'hstalkbackconfiguration'
-# Switch Access
-UI_HSSWITCHACCESSENABLE = 'hsswitchaccessenable'
-UI_HSSWITCHACCESSCONFIGURATION = 'hsswitchaccessconfiguration'
-# Text Magnification
-UI_HSTEXTMAGNIFICATIONENABLE = 'hstextmagnificationenable'
-UI_HSTEXTMAGNIFICATIONCONFIGURATION = 'hstextmagnificationconfiguration'
-UI_HSTEXTMAGNIFICATIONCOLOUR = 'hstextmagnificationcolour'
-UI_HSTEXTMAGNIFICATIONDURATION = 'hstextmagnificationduration'
-# Screen Reader        
-UI_HSSCREENREADERENABLE = 'hsscreenreaderenable'
-UI_HSSCREENREADERCONFIGURATION = 'hsscreenreaderconfiguration'
-
-# Remote & Accessories
-UI_HSBLUETOOTHSETTINGS = 'hsbluetoothsettings'
-UI_HSREMOTECONTROL = 'hsremotecontrol'
-# Bluetooth Settings
-UI_HSADDDEVICE = 'hsadddevice'
-# Remote Control
-UI_HSBTSOFTWAREUPDATE = 'hsbtsoftwareupdate'
-UI_HSCONNECTVIABLUETOOTH = 'hsconnectviabluetooth'
-# Bravia Settings
-UI_HSCHANNELSETUP = 'hschannelsetup'
-UI_HSPICTURE = 'hspicture'
-UI_HSSOUND = 'hssound'
-UI_HSSCREEN = 'hsscreen'
-UI_HSREMOTESTART = 'hsremotestart'
-UI_HSBLUETOOTH = 'hsbluetooth'
-UI_HSVOICEREMOTECONTROL = 'hsvoiceremotecontrol'
-UI_HSSPEAKERS = 'hsspeakers'
-UI_HSTVPOSITION = 'hstvposition'
-UI_HSDIGITALAUDIOOUT = 'hsdigitalaudioout'
-UI_HSEXTERNALINPUTS = 'hsexternalinputs'
-UI_HSPARENTALCONTROLS = 'hsparentalcontrols'
-UI_HSECO = 'hseco'
-UI_HSIPCONTROL = 'hsipcontrol'
-UI_HSCUSTOMERSUPPORT = 'hscustomersupport'
-
-# Channel Setup
-UI_HSSIGNALTYPE = 'hssignaltype'
-UI_HSANALOGSETUP = 'hsanalogsetup'
-UI_HSANALOGUESETUP = 'hsanaloguesetup'
-UI_HSDIGITALSETUP = 'hsdigitalsetup'
-UI_HSSHOWNCHANNELS = 'hsshownchannels'
-UI_HSCAPTIONS = 'hscaptions'
-UI_HSPREFERREDLANGUAGE = 'hspreferredlanguage'
-# Analogue Setup
-UI_HSANALOGAUTOTUNING = 'hsanalogautotuning'
-UI_HSMANUALPROGRAMPRESET = 'hsmanualprogrampreset'
-UI_HSCHANNELLISTEDIT = 'hschannellistedit'
-UI_HSANALOGUEAUTOTUNING = 'hsanalogueautotuning'
-UI_HSPROGRAMMELABELS = 'hsprogrammelabels'
-# Digital Setup
-UI_HSDIGITALTUNING = 'hsdigitaltuning'
-UI_HSSUBTITLESETUP = 'hssubtitlesetup'
-UI_HSAUDIOSETUP = 'hsaudiosetup'
-UI_HSTECHNICALSETUP = 'hstechnicalsetup'
-UI_HSDSIGNALTYPE = 'hsdsignaltype'
-# Digital Tuning
-UI_HSDIGITALAUTOTUNING = 'hsdigitalautotuning'
-UI_HSPROGRAMLISTEDIT = 'hsprogramlistedit'
-UI_HSMANUALTUNING = 'hsmanualtuning'
-UI_HSLCN = 'hslcn'
-UI_HSPOSTALCODE = 'hspostalcode'
-UI_HSPOSTALCODE2 = 'hspostalcode2'
-UI_HSSCANTYPE = 'hsscantype'
-UI_HSCHANNELNUMBER = 'hschannelnumber'
-UI_HSFREQUENCY = 'hsuifrequency'
-UI_HSSCAN = 'hsscan'
-UI_HSSUBTITLE = 'hssubtitle'
-UI_HSSPRIMARYPREFEREDLANGUAGE = 'hssprimarypreferedlanguage'
-UI_HSSSECONDARYPREFEREDLANGUAGE = 'hsssecondarypreferedlanguage'
-# Audio Setup
-UI_HSDAUDIODESCRIPTION = 'hsdaudiodescription'
-UI_HSDMIXINGLEVEL = 'hsdmixinglevel'
-UI_HSDAUDIOTYPE = 'hsdaudiotype'
-UI_HSDAPRIMARYPREFEREDLANGUAGE = 'hsdaprimarypreferedlanguage'
-UI_HSDASECONDARYPREFEREDLANGUAGE = 'hsdasecondarypreferedlanguage'
-# Technical Setup
-UI_HSAUTOMATICSOFTWAREDOWNLOAD = 'hsautomaticsoftwaredownload'
-UI_HSEPGLANGUAGE = 'hsepglanguage'
-UI_HSACTIVESTANBYUPDATE = 'hsactivestanbyupdate'
-# Captions
-UI_HSCCDISPLAY = 'hsccdisplay'
-UI_HSANALOGUECC = 'hsanalogcc'
-UI_HSDIGITALCC = 'hsdigitalcc'
-UI_HSDIGITALCCOPTIONS = 'hsdigitalccoptions'
-# Preffered Language
-UI_HSPREFERREDAUDIO1 = 'hspreferredaudio1'
-UI_HSPREFERREDAUDIO2 = 'hspreferredaudio2'
-UI_HSPREFERREDCC1 = 'hspreferredcc1'
-UI_HSPREFERREDCC2 = 'hspreferredcc2'
-
-# Picture
-UI_HSPICTUREMODE = 'hspicturemode'
-UI_HSBRIGHTNESS = 'hsbrightness'
-UI_HSCOLOUR = 'hscolour'
-UI_HSPICTUREADVANCED = 'hspictureadvanced'
-# Advanced Picture
-# Brightness
-UI_HSBRIGHTNESSL2 = 'hsbrightnessl2'
-UI_HSBRIGHTNESSL3 = 'hsbrightnessl3'
-UI_HSCONTRAST = 'hscontrast'
-UI_HSGAMMA = 'hsgamma'
-UI_HSBLACKLEVEL = 'hsblacklevel'
-UI_HSBLACKADJUST = 'hsblackadjust'
-UI_HSADVCONTRASTENHANCER = 'hsadvcontrastenhancer'
-# Colour
-UI_HSCOLOURL2 = 'hscolourl2'
-UI_HSCOLOURL3 = 'hscolourl3'
-UI_HSHUE = 'hshue'
-UI_HSCOLOURTEMPERATURE = 'hscolourtemperature'
-UI_HSADVCOLOURTEMPERATURE = 'hsadvcolourtemperature'
-UI_HSLIVECOLOUR = 'hslivecolour'
-# Adv colour temperature
-UI_HSCRESET = 'hscreset'
-UI_HSBASIC = 'hsbasic'
-UI_HSRGAIN = 'hsrgain'
-UI_HSGGAIN = 'hsggain'
-UI_HSBGAIN = 'hsbgain'
-UI_HSRBIAS = 'hsrbias'
-UI_HSGBIAS = 'hsgbias'
-UI_HSBBIAS = 'hsbbias'
-UI_HSMULTIPOINT = 'hsmultipoint'
-UI_HSCOLOURGAMMAADJUSTMENTPOINT = 'hscolourgammaadjustmentpoint'
-UI_HSROFFSET = 'hsroofset'
-UI_HSGOFFSET = 'hsgoofset'
-UI_HSBOFFSET = 'hsboofset'
-# Clarity
-UI_HSCLARITY = 'hsclarity'
-UI_HSSHARPNESS = 'hssharpness'
-UI_HSREALITYCREATION = 'hsrealitycreation'
-UI_HSRESOLUTION = 'hsresolution'
-UI_HSRANDOMNOISEREDUCTION = 'hsrandomnoisereduction'
-UI_HSDIGITALNOISEREDUCTION = 'hsdigitalnoisereduction'
-UI_HSMOTION = 'hsmotion'
-UI_HSMOTIONFLOW = 'hsmotionflow'
-UI_HSSMOOTHNESS = 'hssmoothness'
-UI_HSCLEARNESS = 'hsclearness'
-UI_HSFILMMODE = 'hsfilmmode'
-UI_HSVIDEOOPTION = 'hsvideooption'
-UI_HSHDMIVIDEORANGE = 'hshdmivideorange'
-UI_HSPRESET = 'hspreset'
-UI_HSPRESETL2 = 'hspresetl2'
-
-# Sound
-UI_HSDIALOGUEENHANCER = 'hsdialogueenhancer'
-UI_HSSURROUND = 'hssurround'
-UI_HSSOUNDADVANCED = 'hssoundadvanced'
-UI_HSCOMMON = 'hscommon'
-UI_HSAUTOVOLUME = 'hsautovolume'
-UI_HSBALANCE = 'hsbalance'
-UI_HSDIGITALAUDIOOUTVOLUME = 'hsdigitalaudiovolume'
-UI_HSINPUTRELATED = 'hsinputrelated'
-UI_HSVOLUMEOFFSET = 'hsvolumeoffset'
-UI_HSDYNAMICRANGE = 'hsdynamicrange'
-UI_HSSRESET = 'hssreset'
-UI_HSSRESETL2 = 'hssresetl2'
-
-# Screen
-UI_HSWIDEMODE = 'hswidemode'
-UI_HS43DEFAULT = 'hs43default'
-
-# External Input
-UI_HSMANAGEINPUTS = 'hsmanageinputs'
-UI_HSHDMICECSETTINGS = 'hshdmicecsettings'
-UI_HSCUSTOMISETVKEY = 'hscustomisetvkey'
-UI_HSHDMISIGNALFORMAT = 'hshdmisignalformat'
-# Manage Inputs
-# analogue
-UI_HSANALOGUE = 'hsuianalogue'
-UI_HSANALOGUEDISPLAY = 'hsanaloguedisplay'
-# digital
-UI_HSDIGITAL = 'hsuidigital'
-UI_HSDIGITALDISPLAY = 'hsdigitaldisplay'
-# hdmi1
-UI_HSHDMI1 = 'hsuihdmi1'
-UI_HSHDMI1DISPLAY = 'hshdmi1display'
-UI_HSHDMI1LABEL = 'hshdmi1label'
-# hdmi2
-UI_HSHDMI2 = 'hsuihdmi2'
-UI_HSHDMI2DISPLAY = 'hshdmi2display'
-UI_HSHDMI2LABEL = 'hshdmi2label'
-# hdmi3
-UI_HSHDMI3 = 'hsuihdmi3'
-UI_HSHDMI3DISPLAY = 'hshdmi3display'
-UI_HSHDMI3LABEL = 'hshdmi3label'
-# av
-UI_HSAV = 'hsuiav'
-UI_HSAVDISPLAY = 'hsavdisplay'
-UI_HSAVLABEL = 'hsavlabel'
-# Hdmi CEC Settings
-UI_HSCEC = 'hscec'
-UI_HSAUTODEVICESOFF = 'hsautodeviceoff'
-UI_HSAUTOTVON = 'hsautotvon'
-# Hdmi Signal Format
-UI_HSHSFHDMI1 = 'hshsfhdmi1'
-UI_HSHSFHDMI2 = 'hshsfhdmi2'
-UI_HSHSFHDMI3 = 'hshsfhdmi3'
-
-# Parental Control
-UI_HSPARENTALONOFF = 'hsparentalonoff'
-UI_HSEXTERNALINPUTLOCK = 'hsexternalinputlock'
-UI_HSCHANNELSBLOCKED = 'hschannelsblocked'
-UI_HSPROGRAMMERESTRICTIONS = 'hsprogrammerestrictions'
-UI_HSCHANGEPIN = 'hschangepin'
-# External Input lock
-UI_HSBLOCKALL = 'hsblockall'
-UI_HSANALOGUELOCK = 'hsanaloguelock'
-UI_HSDIGITALLOCK = 'hsdigitallock'
-UI_HSHDMI1LOCK = 'hshdmi1lock'
-UI_HSHDMI2LOCK = 'hshdmi2lock'
-UI_HSHDMI3LOCK = 'hshdmi3lock'
-UI_HSAVLOCK = 'hsavlock'
-
-# Ratings USA
-# Programme Restriction
-UI_HSCOUNTRY = 'hscountry'
-UI_HSRATINGS = 'hsratings'
-UI_HSDOWNLOADABLEUSRATING = 'hsdownloadableusrating'
-UI_HSUSA = 'hsuiusa'
-UI_HSCANADA = 'hsuicanada'
-UI_HSNONE = 'hsuinone'
-UI_HSHIGHRESTRICTIONS = 'hshighrestrictions'
-UI_HSMEDIUMRESTRICTIONS = 'hsmediumrestrictions'
-UI_HSLOWRESTRICTIONS = 'hslowrestrictions'
-UI_HSCUSTOMISED = 'hscustomised'
-
-UI_HSPR3 = 'hspr3'
-UI_HSPR4 = 'hspr4'
-UI_HSPR5 = 'hspr5'
-UI_HSPR6 = 'hspr6'
-UI_HSPR7 = 'hspr7'
-UI_HSPR8 = 'hspr8'
-UI_HSPR9 = 'hspr9'
-UI_HSPR10 = 'hspr10'
-UI_HSPR11 = 'hspr11'
-UI_HSPR12 = 'hspr12'
-UI_HSPR13 = 'hspr13'
-UI_HSPR14 = 'hspr14'
-UI_HSPR15 = 'hspr15'
-UI_HSPR16 = 'hspr16'
-UI_HSPR17 = 'hspr17'
-UI_HSPR18 = 'hspr18'
-
-# ZA Programme Restriction
-UI_HSPG10 = 'hspg10'
-UI_HSR18 = 'hsr18'
-# Thailand Programme Restriction
-UI_HSPR19 = 'hspr19'
-# Singapore Programme Restriction
-UI_HSTVY = 'hstvy'
-UI_HSTVY7 = 'hstvy7'
-UI_HSTVG = 'hstvg'
-UI_HSTVPG = 'hstvpg'
-UI_HSTV14 = 'hstv14'
-UI_HSTVMA = 'hstvma'
-UI_HSG = 'hsg'
-UI_HSPG = 'hspg'
-UI_HSPG13 = 'hspg13'
-UI_HSNC16 = 'hsnc16'
-UI_HSM18 = 'hsm18'
-UI_HSR21 = 'hsr21'
-UI_HSR = 'hsr'
-UI_HSNC17 = 'hsnc17'
-UI_HSX = 'hsx'
-UI_HSRNONE = 'hsrnone'
-
-UI_HSTVY7L2 = 'hstvy7l2'
-UI_HSTVY7FV = 'hstvy7fv'
-UI_HSTVPGL2 = 'hstvpgl2'
-UI_HSTVPGD = 'hstvpgd'
-UI_HSTVPGL = 'hstvpgl'
-UI_HSTVPGS = 'hstvpgs'
-UI_HSTVPGV = 'hstvpgv'
-UI_HSTV14L2 = 'hstv14l2'
-UI_HSTV14D = 'hstv14d'
-UI_HSTV14L = 'hstv14l'
-UI_HSTV14S = 'hstv14s'
-UI_HSTV14V = 'hstv14v'
-UI_HSTVMAL2 = 'hstvmal2'
-UI_HSTVMAL = 'hstvmal'
-UI_HSTVMAS = 'hstvmas'
-UI_HSTVMAV = 'hstvmav'
-
-# Ratings CANADA
-# Programme Restriction
-UI_HSCRCOUNTRY = 'hscrcountry'
-UI_HSCRRATINGS = 'hscrratings'
-UI_HSCRUSA = 'hscruiusa'
-UI_HSCRCANADA = 'hscruicanada'
-UI_HSCRNONE = 'hsuicrnone'
-UI_HSCRHIGHRESTRICTIONS = 'hscrhighrestrictions'
-UI_HSCRMEDIUMRESTRICTIONS = 'hscrmediumrestrictions'
-UI_HSCRLOWRESTRICTIONS = 'hscrlowrestrictions'
-UI_HSCRCUSTOMISED = 'hscrcustomised'
-
-UI_HSCRE = 'hscre'
-UI_HSCRC = 'hscrc'
-UI_HSCRC8 = 'hscrc8'
-UI_HSCRG = 'hscrg'
-UI_HSCRPG = 'hscrpg'
-UI_HSCR14 = 'hscr14'
-UI_HSCR18 = 'hscr18'
-UI_HSCRFE = 'hscrfe'
-UI_HSCRFG = 'hscrfg'
-UI_HSCRF8ANS = 'hscrf8ans'
-UI_HSCRF13ANS = 'hscrf13ans'
-UI_HSCRF16ANS = 'hscrf16ans'
-UI_HSCRF18ANS = 'hscrf18ans'
-UI_HSCRTVY = 'hscrtvy'
-UI_HSCRTVY7 = 'hscrtvy7'
-UI_HSCRTVG = 'hscrtvg'
-UI_HSCRTVPG = 'hscrtvpg'
-UI_HSCRTV14 = 'hscrtv14'
-UI_HSCRTVMA = 'hscrtvma'
-
-UI_HSCRTVY7L2 = 'hscrtvy7l2'
-UI_HSCRTVY7FV = 'hscrtvy7fv'
-UI_HSCRTVPGL2 = 'hscrtvpgl2'
-UI_HSCRTVPGD = 'hscrtvpgd'
-UI_HSCRTVPGL = 'hscrtvpgl'
-UI_HSCRTVPGS = 'hscrtvpgs'
-UI_HSCRTVPGV = 'hscrtvpgv'
-UI_HSCRTV14L2 = 'hscrtv14l2'
-UI_HSCRTV14D = 'hscrtv14d'
-UI_HSCRTV14L = 'hscrtv14l'
-UI_HSCRTV14S = 'hscrtv14s'
-UI_HSCRTV14V = 'hscrtv14v'
-UI_HSCRTVMAL2 = 'hscrtvmal2'
-UI_HSCRTVMAL = 'hscrtvmal'
-UI_HSCRTVMAS = 'hscrtvmas'
-UI_HSCRTVMAV = 'hscrtvmav'
-
-# Downloadable US Rating
-UI_HSDUSROFF = 'hsdusroff'
-UI_HSDUSRCUSTOMISED = 'hsdusrcustomised'
-UI_HSDUSRCLEARALL = 'hsdusrclearall'
-UI_HSENTIREAUDIANCE1 = 'hsentireaudiance1'
-UI_HSENTIREAUDIANCE1NONE = 'hsentireaudiance1none'
-UI_HSENTIREAUDIANCE1TVG = 'hsentireaudiance1tvg'
-UI_HSDIALOGUE1 = 'hsdialogue1'
-UI_HSDIALOGUE1D = 'hsdialogue1d'
-UI_HSLANGUAGE1 = 'hslanguage1'
-UI_HSLANGUAGE1L = 'hslanguage1l'
-UI_HSSEX1 = 'hssex1'
-UI_HSSEX1S = 'hssex1s'
-UI_HSVIOLENCE1 = 'hsviolence1'
-UI_HSVIOLENCE1V = 'hsviolence1v'
-UI_HSCHILDREN1 = 'hschildren1'
-UI_HSCHILDREN1TVY = 'hschildren1tvy'
-
-# Eco
-UI_HSPOWERSAVING = 'hspowersaving'
-UI_HSIDLETVSTANDBY = 'hsidletvstandby'
-UI_HSAUTOSHUTOFF = 'hsautoshutoff'
-
-# IP Control
-UI_HSCONTROLREMOTELY = 'hscontrolremotely'
-UI_HSAUTHENTICATION = 'hsauthentication'
-UI_HSPRESHAREDKEY = 'hspresharedkey'
-
-# Customer Support
-UI_HSCONTACTANDSUPPORT = 'hscontactandsupport'
-UI_HSSIGNALDIAGNOSTICS = 'hssignaldiagnostics'
-UI_HSHELPGUIDE = 'hshelpguide'
-UI_HSNOTICESANDLICENCES = 'hsnoticesandlicences'
-# Contact and Support
-UI_HSCONTACTANDSUPPORTVIEW = 'hscontactandsupportview'
-# Signal Diagnostics
-UI_HSSIGNALCHANNEL = 'hssignalchannel'
-UI_HSSIGNALNETWORK = 'hssignalnetwork'
-UI_HSSIGNALQUALITY = 'hssignalquality'
-UI_HSSIGNALSTRENGTH = 'hssignalstrength'
-UI_HSSIGNALQUALITY = 'hssignalquality'
-UI_HSPHYSICALCHANNEL = 'hsphysicalchannel'
-UI_HSSIGNALFREQUENCY = 'hssignalfrequency'
-UI_HSMODULATION = 'hsmodulation'
-UI_HSPREBCH = 'hsprebch'
-UI_HSPOSTVITERBI = 'hspostviterbi'
-UI_HSUEC = 'hsuec'
-UI_HSSNR = 'hssnr'
-# Inside Settings from HOME        Inside Settings from HOME        Inside Settings from HOME        Inside Settings from HOME        Inside Settings from HOME        
-
-# Inside Settings from DTV        Inside Settings from DTV        Inside Settings from DTV        Inside Settings from DTV        Inside Settings from DTV
-UI_FINISHSETTINGTV = 'finishsettingtv'
-UI_TAKEBUGREPORT = 'takebugreport'
-UI_NETWORKANDINTERNET = 'networkandinternet'
-UI_ACCOUNTSANDSIGNIN = 'accountsandsignin'
-UI_SAPPS = 'sapps'
-UI_DEVICEPREFERENCES = 'devicepreferences'
-UI_REMOTESANDACCESSORIES = 'remoteandaccessories'
-UI_BRAVIASETTINGS = 'braviasettings'
-
-# Network and Internet
-UI_WIFI = 'wifi'
-UI_NETWORK1 = 'network1'
-UI_NETWORK2 = 'network2'
-UI_NETWORK3 = 'network3'
-UI_SEEALL = 'seeall'
-UI_ADDNEWNETWORK = 'addnewnetwork'
-UI_SCANNINGALWAYSAVAILABLE = 'scanningalwaysavailable'
-UI_NOTCONNECTED = 'notconnected'
-UI_PROXYSETTINGS = 'proxysettings'
-UI_IPSETTINGS = 'ipsettings'
-
-# Inside Apps
-UI_APPS1 = 'apps1'
-UI_APPS2 = 'apps2'
-UI_APPS3 = 'apps3'
-UI_APPS4 = 'apps4'
-UI_APPS5 = 'apps5'
-UI_SEEALLAPPS = 'seeallmaps'
-UI_APPSPERMISSION = 'appspermission'
-UI_SPECIALAPPACCESS = 'specialappaccess'
-UI_SECURITYANDRESTRICTIONS = 'securityandrestrictions'
-
-# App Permissions
-UI_BODYSENSORS = 'bodysensors'
-UI_CALENDAR = 'calendar'
-UI_CALLLOGS = 'calllogs'
-UI_CAMERA = 'camera'
-UI_CONTACTS = 'contacts'
-UI_LOCATION = 'locations'
-UI_MICROPHONE = 'microphone'
-UI_SMS = 'sms'
-UI_STORAGE = 'storage'
-UI_TELEPHONE = 'telephone'
-UI_ADDITIONALPERMISSION = 'additionalpermission'
-
-# Calendar Permissions
-UI_CALENDARSHOWSYSTEMAPPS = 'calendarshowsystemapps'
-UI_CALENDARGOOGLECALENDARSYNC = 'calendargooglecalendarsync'
-UI_CALENDARGOOGLEPLAYSERVICES = 'calendargoogleplayservices'
-UI_CALENDARGOOGLESEARCH = 'calendargooglesearch'
-# Call Log Permissions
-UI_CALLLOGSSHOWSYSTEMAPPS = 'calllogsshowsystmeapps'
-UI_CALLLOGSGOOGLEPLAYSERVICES = 'calllogsgoogleplayservices'
-# Camera Permissions
-UI_CAMERAL2 = 'cameral2'
-UI_CAMERAGALLERY = 'cameragallery'
-UI_CAMERASHOWSYSTEMAPPS = 'camerashowsystemapps'
-UI_CAMERAL3 = 'cameral3'
-UI_CAMERAGOOGLEPLAYSERVICES = 'cameragoogleplayservices'
-UI_CAMERAGOOGLESEARCH = 'cameragooglesearch'
-# Contacts Permissions
-UI_CONTACTSGALLERY = 'contactsgallery'
-UI_CONTACTSGOOGLEPLAYGAMES = 'contactsgoogleplaygames'
-UI_CONTACTSGOOGLEPLAYSTORE = 'contactsgoogleplaystore'
-UI_CONTACTSNETFLIX = 'contactsnetflix'
-UI_CONTACTSSHOWSYSTEMAPPS = 'contactsshowsytemapps'
-UI_CONTACTSBUGREPORTSENDER = 'contactsbugreportsender'
-UI_CONTACTSCALENDARSTORAGE = 'contactscalendarstorage'
-UI_CONTACTSGBOARD = 'contactsgboard'
-UI_CONTACTSGOOGLEBACKUPTRANSPORT = 'contactsgooglebackuptransport'
-UI_CONTACTSGOOGLECONTACTSSYNC = 'contactsgooglecontactssync'
-UI_CONTACTSGOOGLEINDICKEYBOARD = 'contactsgoogleinidckeyboard'
-UI_CONTACTSGOOGLEPLAYSERVICE = 'contactsgoogleplayservice'
-UI_CONTACTSGOOGLESEARCH = 'contactsgooglesearch'
-UI_CONTACTSGOOGLESERVICEFRAMEWORK = 'contactsgoogleserviceframework'
-UI_CONTACTSPLAYMUSIC = 'contactsplaymusic'
-# Location Permissions
-UI_LOCATIONANDROIDTVREMOTE = 'locationandroidremote'
-UI_LOCATIONSERVICE = 'locationservice'
-UI_LOCATIONEULA1 = 'locationeula1'
-UI_LOCATIONEULA2 = 'locationeula2'
-UI_LOCATIONEULA3 = 'locationeula3'
-UI_LOCATIONGALLERY = 'locationgallery'
-UI_LOCATIONGOOGLEPLAYSTORE = 'locationgoogleplaystore'
-UI_LOCATIONHELP1 = 'locationhelp1'
-UI_LOCATIONHELP2 = 'locationhelp2'
-UI_LOCATIONSHOWSYSTEMAPPS = 'locationshowsystemapps'
-UI_LOCATIONANDDROIDACCESSIBILITY = 'locationandroidaccessibility'
-UI_LOCATIONCAMERA = 'locationcamera'
-UI_LOCATIONGOOGLEPLAYMOVIESANDTV = 'locationgoogleplaymoviesandtv'
-UI_LOCATIONGOOGLEPLAYSERVICES = 'locationgoogleplayservices'
-UI_LOCATIONGOOGLESEARCH = 'locationgooglesearch'
-UI_LOCATIONPLAYMUSIC = 'locationplaymusic'
-UI_LOCATIONSETUPWIZARD = 'locationsetupwizard'
-# Microphone Permissions
-UI_MICROPHONECAMERA = 'microphonecamera'
-UI_MICROPHONEEULA1 = 'microphoneeula1'
-UI_MICROPHONEEULA2 = 'microphoneeula2'
-UI_MICROPHONEEULA3 = 'microphoneeula3'
-UI_MICROPHONEGALLERY = 'microphonegallery'
-UI_MICROPHONEGOOGLEPLAYSTORE = 'microphonegoogleplaystore'
-UI_MICROPHONEHELP1 = 'microphonehelp1'
-UI_MICROPHONEHELP2 = 'microphonehelp2'
-UI_MICROPHONEYOUTUBE = 'microphoneyoutube'
-UI_MICROPHONESHOWSYSTEMAPPS = 'microphoneshowsystemapps'
-UI_MICROPHONEANDROIDACCESSIBILITY = 'microphoneandroidaccessibility'
-UI_MICROPHONECAMERAL2 = 'microphonecameral2'
-UI_MICROPHONEGBOARD = 'microphonegboard'
-UI_MICROPHONEGOOGLEPLAYSERVICE = 'microphonegoogleplayservice'
-UI_MICROPHONEGOOGLESEARCH = 'microphonegooglesearch'
-UI_MICROPHONEPLAYMUSIC = 'microphoneplaymusic'
-# SMS Permissions
-UI_SMSGOOGLEPLAYSTORE = 'smsgoogleplaystore'
-UI_SMSSHOWSYSTEMAPPS = 'smsshowsystemapps'
-UI_SMSGOOGLEPLAYSERVICES = 'smsgoogleplayservices'
-# Storage Permissions
-UI_STORAGEANDROIDTVREMOTE = 'storageandroidtvremote'
-UI_STORAGECAMERAL2 = 'storagecameral2'
-UI_STORAGEEULA1 = 'storageeula1'
-UI_STORAGEEULA2 = 'storageeula2'
-UI_STORAGEEULA3 = 'storageeula3'
-UI_STORAGEGALLERY = 'storagegallery'
-UI_STORAGEHELP1 = 'storagehelp1'
-UI_STORAGEHELP2 = 'storagehelp2'
-UI_STORAGENETFLIX = 'storagenetflix'
-UI_STORAGEQRMT = 'storageqrmt'
-UI_STORAGESHOWSYSTEMAPPS = 'storageshowsystemapps'
-UI_STORAGEBUGREPORTSENDER = 'storagebugreportsender'
-UI_STORAGECALENDARSTORAGE = 'storagecalendarstorage'
-UI_STORAGECAMERAL3 = 'storagecameral3'
-UI_STORAGEDEMOAPP = 'storagestoragedemoapp'
-UI_STORAGEGBOARD = 'storagegboard'
-UI_STORAGEGOOGLEINDICKEYBOARD = 'storagegoogleindickeyboard'
-UI_STORAGEGOOGLEPLAYSERVICES = 'storagegoogleplayservices'
-UI_STORAGEGOOGLESEARCH = 'storagegooglesearch'
-UI_STORAGEHTMLVIEWER = 'storagehtmlviewer'
-UI_STORAGEMEDIAPLAYER = 'storagemediaplayer'
-UI_STORAGEPLAYMUSIC = 'storageplaymusic'
-UI_STORAGEPRIMEVIDEO = 'storageprimevideo'
-UI_STORAGESETUPWIZARD = 'storagesetupwizard'
-UI_STORAGETVSTORAGE = 'storagetvstorage'
-# Telephone Permissions
-UI_TELEPHONEEULA1 = 'telephoneeula1'
-UI_TELEPHONEEULA2 = 'telephoneeula2'
-UI_TELEPHONEEULA3 = 'telephoneeula3'
-UI_TELEPHONEGOOGLEPLAYSTORE = 'telephonegoogleplaystore'
-UI_TELEPHONEHELP1 = 'telephonehelp1'
-UI_TELEPHONEHELP2 = 'telephonehelp2'
-UI_TELEPHONEQRMT = 'telephoneqrmt'
-UI_TELEPHONESHOWSYSTEMAPPS = 'telephoneshowsystemapps'
-UI_TELEPHONEANDROIDACCESSIBILITY = 'telephoneandroidaccessibility'
-UI_TELEPHONEGOOGLEPLAYSERVICES = 'telephonegoogleplayservices'
-UI_TELEPHONEGOOGLESEARCH = 'telephonegooglesearch'
-UI_TELEPHONEGOOGLESERVICESFRAMEWORK = 'telephonegoogleservicesframework'
-UI_TELEPHONESETTINGSSUGGESTIONS = 'telephonesettingssuggestions'
-# Additional Permissions
-UI_READALLTVLISTINGS = 'readalltvlistings'
-UI_READINSTANTMESSAGES = 'readinstantmessages'
-UI_WRITEINSTANTMESSAGES = 'writeinstantmessages'
-# Read Instant messages permission
-UI_READSHOWSYSTEMAPPS = 'readshowsystemapps'
-UI_READGOOGLESERVICESFRAMEWORK = 'readgoogleservicesframework'
-# Write Instant messages permission
-UI_WRITESHOWSYSTEMAPPS = 'writeshowsystemapps'
-UI_WRITEGOOGLESERVICESFRAMEWORK = 'writegoogleservicesframework'
-
-# Special App Access
-UI_ENERGYOPTIMISATION = 'energyoptimisation'
-UI_USAGEACCESS = 'usageaccess'
-UI_NOTIFICATIONACCESS = 'notificationaccess'
-UI_DISPLAYOVEROTHERAPPS = 'displayoverotherapps'
-UI_MODIFYSYSTEMSETTINGS = 'modifysystemsettings'
-UI_DIRECTORYACCESS = 'directoryaccess'
-
-# Energy Optimisation
-
-# Usage Access
-UI_USAGEACCESS2 = 'usageaccess2'
-UI_USAGEBLUETOOTH = 'usagebluetooth'
-UI_USAGEGOOGLEPLAYSERVICES = 'usagegoogleplayservices'
-UI_USAGEGOOGLEPLAYSTORE = 'usagegoogleplaystore'
-UI_USAGEGOOGLESEARCH = 'usagegooglesearch'
-UI_USAGESHELL = 'usageshell'
-# Notification Access
-UI_NOTIFICATIONACCESS2 = 'notificationaccess2'
-UI_NOTIFICATIONANDROIDTVCORESERVICES = 'notificationandroidtvservices'
-# Allow Display Over Other Apps
-UI_DISPLAYOVEROTHERAPPS2 = 'displayoverotherapps2'
-UI_DISPLAYADVANCEDSETTINGS = 'displayadvancedsettings'
-UI_DISPLAYANDROIDACCESSIBILITYSUITE = 'displayandroidaccessibilitysuite'
-UI_DISPLAYANDROIDTVCORESERVICES = 'displayandroidtvcoreservices'
-UI_DISPLAYANDROIDTVHOME = 'displayandroidhome'
-UI_DISPLAYANDROIDTVREMOTESERVICE = 'displayandroidtvremoteservice'
-UI_DISPLAYBRAVIASETTINGS = 'displaybraviasettings'
-UI_DISPLAYCODECNOTIFICATION = 'displaycodenotification'
-UI_DISPLAYCOMREALTEKSERVICEMENU = 'displaycomrealtekservicemenu'
-UI_DISPLAYGOOGLEPLAYSERVICE = 'displaygoogleplayservice'
-UI_DISPLAYGOOGLESEARCH = 'displaygooglesearch'
-UI_DISPLAYMULTILINGUALKEYBOARD = 'displaymultilingualkeyboard'
-UI_DISPLAYPLAYMUSIC = 'displayplaymusic'
-UI_DISPLAYTEXTMAGNIFICATION = 'displaytextmagnification'
-UI_DISPLAYTV = 'displaytv'
-# Modify System Settings
-UI_MODIFYSYSTEMSETTINGS2 = 'modifysystemsettings2'
-UI_MODIFYACTIONMENU = 'modifyactionmenu'
-UI_MODIFYADVANCEDSETTINGS = 'modifyadvancedsettings'
-UI_MODIFYBLUETOOTH = 'modifybluetooth'
-UI_MODIFYBRAVIASETTINGS = 'modifybraviasettings'
-UI_MODIFYCAMERA = 'modifycamera'
-UI_MODIFYGALLERY = 'modifygallery'
-UI_MODIFYGOOGLEBACKUPTRANSPORT = 'modifygooglebackuptransport'
-UI_MODIFYGOOGLEPLAYSERVICE = 'modifygoogleplayservice'
-UI_MODIFYGOOGLEPLAYSTORE = 'modifygoogleplaystore'
-UI_MODIFYGOOGLESEARCH = 'modifygooglesearch'
-UI_MODIFYGOOGLESERVICESFRAMEWORK = 'modifygoogleservicesframework'
-UI_MODIFYMEDIASTORAGE = 'modifymediastorage'
-UI_MODIFYPLAYMUSIC = 'modifyplaymusic'
-UI_MODIFYQRMT = 'modifyqrmt'
-UI_MODIFYSETUPWIZARD = 'modifysetupwizard'
-UI_MODIFYSHELL = 'modifyshell'
-UI_MODIFYTV = 'modifytv'
-# Directory Access
-UI_DIRECTORYACCESS2 = 'directoryaccess2'
-
-# Security and Restrictions
-UI_UNKNOWNSOURCES = 'unknownsources'
-UI_VERIFYAPPS = 'verifyapps'
-# Install Unknown Apps
-UI_DEMOAPP = 'demoapp'
-
-# Device Preferences
-UI_ABOUT = 'about'
-UI_DATEANDTIME = 'dateandtime'
-UI_LANGUAGE = 'language'
-UI_KEYBOARD = 'keyboard'
-UI_DEVICESOUND = 'devicesound'
-UI_DEVICESTORAGE = 'devicestorage'
-UI_HOMESCREEN = 'homescreen'
-UI_GOOGLEASSISTANT = 'googleassistant'
-UI_CHROMECASTBUILTIN = 'chromecastbuiltin'
-UI_SCREENSAVER = 'screensaver'
-UI_DEVICELOCATION = 'devicelocation'
-UI_USAGEANDDIAGNOSTICS = 'usageanddiagnostics'
-UI_ACCESSIBILITY = 'accessibility'
-UI_RESET = 'uireset'
-# About
-UI_SYSTEMUPDATE = 'systemupdate'
-UI_DEVICENAME = 'devicename'
-UI_RESTART = 'restart'
-UI_STATUS = 'status'
-UI_LEGALINFORMATION = 'legalinformation'
-UI_MODEL = 'model'
-UI_NETFLIXESN = 'netflixesn'
-UI_VERSION = 'version'
-UI_ANDROID = 'android'
-UI_KERNELVERSION = 'kernelversion'
-UI_BUILD = 'build'
-# Status
-UI_IPADDRESS = 'ipaddress'
-UI_MACADDRESS = 'macaddress'
-UI_BLUETOOTHADDRESS = 'bluetoothaddress'
-UI_SERIALNUMBER = 'serialnumber'
-UI_UPTIME = 'uptime'
-
-# Legal Information
-UI_OPENSOURCE = 'opensource'
-UI_GOOGLELEGAL = 'googlelegal'
-UI_SYSTEMWEBVIEWLICENCES = 'systemwebviewlicences'
-UI_ADS = 'ads'
-# Date And Time
-UI_AUTOMATICDATEANDTIME = 'automaticdateandtime'
-UI_SETDATE = 'setdate'
-UI_SETTIME = 'settime'
-UI_SETTIMEZONE = 'settimezone'
-UI_USE24HOURFORMAT = 'use24hourformat'
-# Keyboard
-UI_CURRENTKEYBOARD = 'currentkeyboard'
-UI_GBOARDSETTINGS = 'gboardsettings'
-UI_MANAGEKEYBOARD = 'managekeyboard'
-# Keyboard Settings
-UI_GBOARDLANGUAGE = 'gboardlanguage'
-UI_TERMSOFSERVICE = 'termsofservice'
-UI_PRIVACYPOLICY = 'privacypolicy'
-UI_KEYBOARDOPENSOURCELICENCES = 'keyboardopensourcelicences'
-UI_SHAREUSAGESTATISTICS = 'shareusagestatistics'
-# Gboard Settings
-UI_USESYSTEMLANGUAGES = 'usesytemlanguages'
-UI_KENGLISH_US = 'kenglish_us'
-UI_KENGLISH_UK = 'kenglish_uk'
-UI_KSIMPLIFIEDCHINESE = 'ksimplifiedchinese'
-UI_KTRADISIONALCHINESE = 'ktraditionalchinese'
-UI_KFRENCH = 'kfrench'
-UI_KGERMAN = 'kgerman'
-UI_KGERMAN_SWITZERLAND = 'kgerman_switzerland'
-UI_KHEBREW = 'khebrew'
-UI_KHINDI1 = 'khindi1'
-UI_KHINDI2 = 'khindi2'
-UI_KITALIAN = 'kitalian'
-UI_KITALIAN_SWITZERLAND = 'kitalian_switzerland'
-UI_KJAPANESE = 'kjapanese'
-UI_KKOREAN = 'kkorean'
-UI_KNORWEGIAN_BOKMAL = 'knorwegian_bokmal'
-UI_KRUSSIAN = 'krussian'
-UI_KSPANISH = 'kspanish'
-UI_KVIETNAMESE = 'kvietnamese'
-
-# Available Virtual Keyboard
-UI_KEYBOARDGBOARD = 'keyboardgboard'
-UI_GOOGLEINDICKEYBOARD = 'googleindickeyboard'
-UI_GOOGLEVOICETYPING = 'googlevoicetyping'
-UI_MULTILINGUALKEYBOARD = 'multilingualkeyboard'
-UI_VIRTUALREMOTEKEYBOARD = 'virtualremotekeyboard'
-# Device Sound
-UI_SYSTEMSOUND = 'systemsound'
-# Device Storage
-UI_INTERNALSHAREDSTORAGE = 'internalsharedstorge'
-# Internal Shared Storage
-UI_INTERNALAPPS = 'intnernalaps'
-UI_INTERNALPHOTOSANDVIDEOS = 'internalphotosandvideos'
-UI_INTERNALAUDIO = 'internalaudio'
-UI_INTERNALDOWNLOAD = 'internaldownload'
-UI_INTERNALCACHED = 'internalcached'
-UI_INTERNALMISC = 'internalmisc'
-UI_INTERNALAVAILABLE = 'internalavailable'
-
-# Home Screen
-# Channels
-UI_CUSTOMISECHANNELS = 'customisechannels'
-UI_ENABLEVIDEOPREVIEWS = 'enablevideopreviews'
-UI_ENABLEAUDIOPREVIEWS = 'enableaudiopreviews'
-# Apps
-UI_REORDERAPPS = 'reorderapps'
-UI_REORDERGAMES = 'reordergames'
-# Open-Source Licences
-UI_ANDROIDTVHOME = 'androidtvhome'
-UI_ANDROIDTVCORESERVICES = 'androidtvcoreservices'
-# Customise Channels
-UI_PLAYNEXT = 'playnext'
-UI_CUSTOMISECHANNELSTV = 'customisechannelstv'
-UI_PLAYNEXTL2 = 'playnextl2'
-UI_PLAYNEXTTV = 'playnexttv'
-# Google Assistant
-UI_ACCOUNTS = 'accounts'
-UI_SEARCHABLEAPPS = 'searchableapps'
-UI_SAFESEARCHFILTER = 'safesearchfilter'
-UI_BLOCKOFFENSIVEWORDS = 'blockoffensivewords'
-UI_TEMPERATUREUNIT = 'temperatureunit'
-UI_GOOGLEOPENSOURCELICENCES = 'gooleopensourcelicences'
-# Google Assistant
-UI_SEARCHABLEAPPSGOOGLEPLAYGAMES = 'searchableappsgoogleplaygames'
-UI_SEARCHABLEAPPSTV = 'searchableappstv'
-# Chromecast Built-in
-UI_CHROMEOPENSOURCELICENSE = 'chromeopensourcelicense'
-UI_VERSIONNUMBERS = 'versionnumbers'
-# Screen Saver
-UI_SCREENSAVERL2 = 'screensaverl2'
-UI_WHENTOSTART = 'whentostart'
-UI_PUTDEVICETOSLEEP = 'putdevicetosleep'
-UI_STARTNOW = 'startnow'
-# Start Screen Saver
-UI_STARTSCREENSAVER = 'startscreensaver'
-# Location
-UI_LOCATIONSTATUS = 'locationstatus'
-# Usage and Diafnostics
-UI_USAGEANDDIAGNOSTICSL2 = 'usageanddiagnosticsl2'
-UI_ACCESSIBILITYCAPTIONS = 'accessibilitycaptions'
-UI_ACCESSIBILITYAUDIODESCRIPTION = 'accessibilityaudiodescription'
-UI_ACCESSIBILITYHIGHCONTRASTTEXT = 'accessibilityhighcontrasttext'
-UI_ACCESSIBILITYTEXTTOSPEECH = 'accessibilitytexttospeech'
-UI_ACCESSIBILITYSHORTCUT = 'accessibilityshortcut'
-UI_ACCESSIBILITYTALKBACK = 'accessibilitytalkback'
-UI_ACCESSIBILITYSWITCHACCESS = 'accessibilityswitchaccess'
-UI_ACCESSIBILITYTEXTMAGNIFICATION = 'accessibilitytextmagnification'
-UI_ACCESSIBILITYSCREENREADER = 'accessibilityscreenreader'
-# Captions
-UI_CAPTIONSDISPLAY = 'captionsdisplay'
-# Display Options
-UI_CAPTIONSLANGUAGE = 'captionslanguage'
-UI_CAPTIONSTEXTSIZE = 'captionstextsize'
-# Caption Style
-UI_CAPTIONSWHITEONBLACK = 'captionswhiteonblack'
-UI_CAPTIONSBLACKONWHITE = 'captionsblackonwhite'
-UI_CAPTIONSYELLOWONBLACK = 'captionsyellowonblack'
-UI_CAPTIONSYELLOWONBLUE = 'captionsyellowonblue'
-UI_CAPTIONSCUSTOMIZED = 'captionscustomized'
-# Caption Customised
-UI_FONTFAMILY = 'fontfamily'
-UI_TEXTFLASHING = 'textflashing'
-UI_TEXTCOLOUR = 'textcolour'
-UI_TEXTOPACITY = 'textopacity'
-UI_EDGETYPE = 'edgetype'
-UI_EDGECOLOUR = 'edgecolour'
-UI_SHOWBACKGROUND = 'showbackground'
-UI_BACKGROUNDFLASHING = 'backgroundflashing'
-UI_BACKGROUNDCOLOUR = 'backgroundcolour'
-UI_BACKGROUNDOPACITY = 'backgroundopacity'
-UI_SHOWWINDOW = 'showwindow'
-UI_WINDOWCOLOUR = 'windowcolour'
-UI_WINDOWOPACITY = 'windowopacity'
-
-# Audio Setup
-UI_AUDIODESCRIPTION = 'audiodescription'
-UI_MIXINGLEVEL = 'mixinglevel'
-UI_AUDIOTYPE = 'audiotype'
-UI_APRIMARYPREFEREDLANGUAGE = 'aprimarypreferedlanguage'
-UI_ASECONDARYPREFEREDLANGUAGE = 'asecondarypreferedlanguage'
-# Text to Speech Output
-UI_GOOGLETEXTTOSPEECHENGINE = 'googletexttospeechengine'
-UI_ENGINECONFIGURATION = 'engineconfiguration'
-UI_SPEECHRATE = 'speechrate'
-UI_LISTENTOANEXAMPLE = 'listentoanexample'
-UI_DEFAULTLANGUAGESTATUS = 'defaultlanguagestatus'
-# Engine Configuration
-UI_GOOGLETEXTTOSPEECHLANGUAGE = 'googletexttospeechlanguage'
-UI_SETTINGSFORGOOGLETEXTTOSPEECHENGINE = 'settingsforgoogletexttospeechengine'
-UI_INSTALLVOICEDATA = 'installvoicedata'
-# Accessibility Shortcut
-UI_ENABLEACCESSIBILITYSHORTCUT = 'enableaccessibilityshortcut'
-UI_SHORTCUTSERVICE = 'shortcutservice'
-# Talkback
-UI_TALKBACKENABLE = 'talkbackenable'
-UI_TALKBACKCONFIGURATION = 'talkbackconfiguration'
-# Switch Access
-UI_SWITCHACCESSENABLE = 'switchaccessenable'
-UI_SWITCHACCESSCONFIGURATION = 'switchaccessconfiguration'
-# Text Magnification
-UI_TEXTMAGNIFICATIONENABLE = 'textmagnificationenable'
-UI_TEXTMAGNIFICATIONCONFIGURATION = 'textmagnificationconfiguration'
-UI_TEXTMAGNIFICATIONCOLOUR = 'textmagnificationcolour'
-UI_TEXTMAGNIFICATIONDURATION = 'textmagnificationduration'
-# Screen Reader
-UI_SCREENREADERENABLE = 'screenreaderenable'
-UI_SCREENREADERCONFIGURATION = 'screenreaderconfiguration'
-# Remote & Accessories
-UI_BLUETOOTHSETTINGS = 'bluetoothsettings'
-UI_REMOTECONTROL = 'remotecontrol'
-# Bluetooth Settings
-UI_ADDDEVICE = 'adddevice'
-# Remote Control
-UI_BTSOFTWAREUPDATE = 'btsoftwareupdate'
-UI_CONNECTVIABLUETOOTH = 'connectviabluetooth'                      
-
-# Bravia Settings
-UI_CHANNELSETUP = 'channelsetup'
-UI_PICTURE = 'picture'
-UI_SOUND = 'sound'
-UI_SCREEN = 'screen'
-UI_REMOTESTART = 'remotestart'
-UI_BLUETOOTH = 'bluetooth'
-UI_VOICEREMOTECONTROL = 'voiceremotecontrol'
-UI_SPEAKERS = 'speakers'
-UI_TVPOSITION = 'tvposition'
-UI_DIGITALAUDIOOUT = 'digitalaudioout'
-UI_EXTERNALINPUTS = 'externalinputs'
-UI_PARENTALCONTROLS = 'parentalcontrols'
-UI_ECO = 'eco'
-UI_IPCONTROL = 'ipcontrol'
-UI_CUSTOMERSUPPORT = 'customersupport'
-
-# Channel Setup
-UI_SIGNALTYPE = 'signaltype'
-UI_ANALOGSETUP = 'analogsetup'
-UI_ANALOGUESETUP = 'analoguesetup'
-UI_DIGITALSETUP = 'digitalsetup'
-UI_SHOWNCHANNELS = 'shownchannels'
-UI_CAPTIONS = 'captions'
-UI_PREFERREDLANGUAGE = 'preferredlanguage'
-# Analaogue Setup
-UI_ANALOGAUTOTUNING = 'analogautotuning'
-UI_MANUALPROGRAMPRESET = 'manualprogrampreset'
-UI_CHANNELLISTEDIT = 'channellistedit'
-UI_ANALOGUEAUTOTUNING = 'analogueautotuning'
-UI_PROGRAMMELABELS = 'programmelabels'
-# Digital Setup
-UI_DIGITALTUNING = 'digitaltuning'
-UI_SUBTITLESETUP = 'subtitlesetup'
-UI_AUDIOSETUP = 'audiosetup'
-UI_TECHNICALSETUP = 'technicalsetup'
-# Digital Tuning
-UI_DSIGNALTYPE = 'dsignaltype'
-UI_DIGITALAUTOTUNING = 'digitalautotuning'
-UI_PROGRAMLISTEDIT = 'programlistedit'
-UI_MANUALTUNING = 'manualtuning'
-UI_LCN = 'lcn'
-UI_VPOSTALCODE = 'vpostalcode'
-UI_VPOSTALCODE2 = 'vpostalcode2'
-# Manual Tuning
-UI_SCANTYPE = 'scantype'
-UI_CHANNELNUMBER = 'channelnumber'
-UI_FREQUENCY = 'uifrequency'
-UI_SCAN = 'scan'
-UI_SUBTITLE = 'subtitle'
-UI_SPRIMARYPREFEREDLANGUAGE = 'sprimarypreferedlanguage'
-UI_SSECONDARYPREFEREDLANGUAGE = 'ssecondarypreferedlanguage'
-# Audio Setup
-UI_DAUDIODESCRIPTION = 'daudiodescription'
-UI_DMIXINGLEVEL = 'dmixinglevel'
-UI_DAUDIOTYPE = 'daudiotype'
-UI_DAPRIMARYPREFEREDLANGUAGE = 'daprimarypreferedlanguage'
-UI_DASECONDARYPREFEREDLANGUAGE = 'dasecondarypreferedlanguage'
-# Technical Setup
-UI_AUTOMATICSOFTWAREDOWNLOAD = 'automaticsoftwaredownload'
-UI_EPGLANGUAGE = 'epglanguage'
-UI_ACTIVESTANBYUPDATE = 'activestanbyupdate'
-# Captions
-UI_CCDISPLAY = 'ccdisplay'
-UI_ANALOGUECC = 'analogcc'
-UI_DIGITALCC = 'digitalcc'
-UI_DIGITALCCOPTIONS = 'digitalccoptions'
-# Preffered Language
-UI_PREFERREDAUDIO1 = 'preferredaudio1'
-UI_PREFERREDAUDIO2 = 'preferredaudio2'
-UI_PREFERREDCC1 = 'preferredcc1'
-UI_PREFERREDCC2 = 'preferredcc2'
-
-# Picture
-UI_PICTUREMODE = 'picturemode'
-UI_BRIGHTNESS = 'brightness'
-UI_COLOUR = 'colour'
-UI_PICTUREADVANCED = 'pictureadvanced'
-# Advanced Picture
-# Brightness
-UI_BRIGHTNESSL2 = 'brightnessl2'
-UI_BRIGHTNESSL3 = 'brightnessl3'
-UI_CONTRAST = 'contrast'
-UI_GAMMA = 'gamma'
-UI_BLACKLEVEL = 'blacklevel'
-UI_BLACKADJUST = 'blackadjust'
-UI_ADVCONTRASTENHANCER = 'advcontrastenhancer'
-# Colour
-UI_COLOURL2 = 'colourl2'
-UI_COLOURL3 = 'colourl3'
-UI_HUE = 'hue'
-UI_COLOURTEMPERATURE = 'colourtemperature'
-UI_ADVCOLOURTEMPERATURE = 'advcolourtemperature'
-UI_LIVECOLOUR = 'livecolour'
-# Adv colour temperature
-UI_CRESET = 'creset'
-UI_BASIC = 'uibasic'
-UI_RGAIN = 'rgain'
-UI_GGAIN = 'ggain'
-UI_BGAIN = 'bgain'
-UI_RBIAS = 'rbias'
-UI_GBIAS = 'gbias'
-UI_BBIAS = 'bbias'
-UI_MULTIPOINT = 'multipoint'
-UI_COLOURGAMMAADJUSTMENTPOINT = 'colourgammaadjustmentpoint'
-UI_ROFFSET = 'roofset'
-UI_GOFFSET = 'goofset'
-UI_BOFFSET = 'boofset'
-# Clarity
-UI_CLARITY = 'clarity'
-UI_SHARPNESS = 'sharpness'
-UI_REALITYCREATION = 'realitycreation'
-UI_RESOLUTION = 'resolution'
-UI_RANDOMNOISEREDUCTION = 'randomnoisereduction'
-UI_DIGITALNOISEREDUCTION = 'digitalnoisereduction'
-UI_MOTION = 'motion'
-UI_MOTIONFLOW = 'motionflow'
-UI_SMOOTHNESS = 'smoothness'
-UI_CLEARNESS = 'clearness'
-UI_FILMMODE = 'filmmode'
-UI_VIDEOOPTION = 'videooption'
-UI_HDMIVIDEORANGE = 'hdmivideorange'
-UI_PRESET = 'preset'
-UI_PRESETL2 = 'presetl2'
-
-# Sound
-UI_DIALOGUEENHANCER = 'dialogueenhancer'
-UI_SURROUND = 'surround'
-UI_SOUNDADVANCED = 'soundadvanced'
-UI_COMMON = 'common'
-UI_AUTOVOLUME = 'autovolume'
-UI_BALANCE = 'balance'
-UI_DIGITALAUDIOOUTVOLUME = 'digitalaudiovolume'
-UI_INPUTRELATED = 'inputrelated'
-UI_VOLUMEOFFSET = 'volumeoffset'
-UI_DYNAMICRANGE = 'dynamicrange'
-UI_SRESET = 'sreset'
-UI_SRESETL2 = 'sresetl2'
-
-# Screen
-UI_WIDEMODE = 'widemode'
-UI_43DEFAULT = '43default'
-
-# External Input
-UI_MANAGEINPUTS = 'manageinputs'
-UI_HDMICECSETTINGS = 'hdmicecsettings'
-UI_CUSTOMISETVKEY = 'customisetvkey'
-UI_HDMISIGNALFORMAT = 'hdmisignalformat'
-# Manage Inputs
-# analogue
-UI_ANALOGUE = 'uianalogue'
-UI_ANALOGUEDISPLAY = 'analoguedisplay'
-# digital
-UI_DIGITAL = 'uidigital'
-UI_DIGITALDISPLAY = 'digitaldisplay'
-# hdmi1
-UI_HDMI1 = 'uihdmi1'
-UI_HDMI1DISPLAY = 'hdmi1display'
-UI_HDMI1LABEL = 'hdmi1label'
-# hdmi2
-UI_HDMI2 = 'uihdmi2'
-UI_HDMI2DISPLAY = 'hdmi2display'
-UI_HDMI2LABEL = 'hdmi2label'
-# hdmi3
-UI_HDMI3 = 'uihdmi3'
-UI_HDMI3DISPLAY = 'hdmi3display'
-UI_HDMI3LABEL = 'hdmi3label'
-# av
-UI_AV = 'uiav'
-UI_AVDISPLAY = 'avdisplay'
-UI_AVLABEL = 'avlabel'
-# Hdmi CEC Settings
-UI_CEC = 'cec'
-UI_AUTODEVICESOFF = 'autodeviceoff'
-UI_AUTOTVON = 'autotvon'
-# Hdmi Signal Format
-UI_HSFHDMI1 = 'hsfhdmi1'
-UI_HSFHDMI2 = 'hsfhdmi2'
-UI_HSFHDMI3 = 'hsfhdmi3'
-
-# Parental Control
-UI_PARENTALONOFF = 'parentalonoff'
-UI_EXTERNALINPUTLOCK = 'externalinputlock'
-UI_CHANNELSBLOCKED = 'channelsblocked'
-UI_PROGRAMMERESTRICTIONS = 'programmerestrictions'
-UI_CHANGEPIN = 'changepin'
-UI_CHANGEPIN2 = 'changepin2'
-# External Input lock
-UI_BLOCKALL = 'blockall'
-UI_ANALOGUELOCK = 'analoguelock'
-UI_DIGITALLOCK = 'digitallock'
-UI_HDMI1LOCK = 'hdmi1lock'
-UI_HDMI2LOCK = 'hdmi2lock'
-UI_HDMI3LOCK = 'hdmi3lock'
-UI_AVLOCK = 'avlock'
-
-# Ratings USA
-# Programme Restriction
-UI_COUNTRY = 'country'
-UI_RATINGS = 'ratings'
-UI_DOWNLOADABLEUSRATING = 'downloadableusrating'
-UI_USA = 'uiusa'
-UI_CANADA = 'uicanada'
-UI_NONE = 'uinone'
-UI_HIGHRESTRICTIONS = 'highrestrictions'
-UI_MEDIUMRESTRICTIONS = 'mediumrestrictions'
-UI_LOWRESTRICTIONS = 'lowrestrictions'
-UI_CUSTOMISED = 'customised'
-
-UI_TVY = 'tvy'
-UI_TVY7 = 'tvy7'
-UI_TVG = 'tvg'
-UI_TVPG = 'tvpg'
-UI_TV14 = 'tv14'
-UI_TVMA = 'tvma'
-UI_PR3 = 'pr3'
-UI_PR4 = 'pr4'
-UI_PR5 = 'pr5'
-UI_PR6 = 'pr6'
-UI_PR7 = 'pr7'
-UI_PR8 = 'pr8'
-UI_PR9 = 'pr9'
-UI_PR10 = 'pr10'
-UI_PR11 = 'pr11'
-UI_PR12 = 'pr12'
-UI_PR13 = 'pr13'
-UI_PR14 = 'pr14'
-UI_PR15 = 'pr15'
-UI_PR16 = 'pr16'
-UI_PR17 = 'pr17'
-UI_PR18 = 'pr18'
-
-# ZA Programme Restriction
-UI_PG10 = 'pg10'
-UI_R18 = 'r18'
-
-# NZ Programme Restriction
-UI_PGR = 'pgr'
-UI_AO = 'ao'
-# Thailand Programme Restriction
-UI_PR19 = 'pr19'
-# Singapore Programme Restriction
-UI_G = 'g'
-UI_PG = 'pg'
-UI_PG13 = 'pg13'
-UI_NC16 = 'nc16'
-UI_M18 = 'm18'
-UI_R21 = 'r21'
-UI_R = 'r'
-UI_NC17 = 'nc17'
-UI_X = 'x'
-UI_RNONE = 'uirnone'
-
-UI_TVY7L2 = 'tvy7l2'
-UI_TVY7FV = 'tvy7fv'
-UI_TVPGL2 = 'tvpgl2'
-UI_TVPGD = 'tvpgd'
-UI_TVPGL = 'tvpgl'
-UI_TVPGS = 'tvpgs'
-UI_TVPGV = 'tvpgv'
-UI_TV14L2 = 'tv14l2'
-UI_TV14D = 'tv14d'
-UI_TV14L = 'tv14l'
-UI_TV14S = 'tv14s'
-UI_TV14V = 'tv14v'
-UI_TVMAL2 = 'tvmal2'
-UI_TVMAL = 'tvmal'
-UI_TVMAS = 'tvmas'
-UI_TVMAV = 'tvmav'
-
-# Ratings CANADA
-# Programme Restriction
-UI_CRCOUNTRY = 'crcountry'
-UI_CRRATINGS = 'crratings'
-UI_CRUSA = 'cruiusa'
-UI_CRCANADA = 'cruicanada'
-UI_CRNONE = 'uicrnone'
-UI_CRHIGHRESTRICTIONS = 'crhighrestrictions'
-UI_CRMEDIUMRESTRICTIONS = 'crmediumrestrictions'
-UI_CRLOWRESTRICTIONS = 'crlowrestrictions'
-UI_CRCUSTOMISED = 'crcustomised'
-
-UI_CRE = 'cre'
-UI_CRC = 'crc'
-UI_CRC8 = 'crc8'
-UI_CRG = 'crg'
-UI_CRPG = 'crpg'
-UI_CR14 = 'cr14'
-UI_CR18 = 'cr18'
-UI_CRFE = 'crfe'
-UI_CRFG = 'crfg'
-UI_CRF8ANS = 'crf8ans'
-UI_CRF13ANS = 'crf13ans'
-UI_CRF16ANS = 'crf16ans'
-UI_CRF18ANS = 'crf18ans'
-UI_CRTVY = 'crtvy'
-UI_CRTVY7 = 'crtvy7'
-UI_CRTVG = 'crtvg'
-UI_CRTVPG = 'crtvpg'
-UI_CRTV14 = 'crtv14'
-UI_CRTVMA = 'crtvma'
-
-UI_CRTVY7L2 = 'crtvy7l2'
-UI_CRTVY7FV = 'crtvy7fv'
-UI_CRTVPGL2 = 'crtvpgl2'
-UI_CRTVPGD = 'crtvpgd'
-UI_CRTVPGL = 'crtvpgl'
-UI_CRTVPGS = 'crtvpgs'
-UI_CRTVPGV = 'crtvpgv'
-UI_CRTV14L2 = 'crtv14l2'
-UI_CRTV14D = 'crtv14d'
-UI_CRTV14L = 'crtv14l'
-UI_CRTV14S = 'crtv14s'
-UI_CRTV14V = 'crtv14v'
-UI_CRTVMAL2 = 'crtvmal2'
-UI_CRTVMAL = 'crtvmal'
-UI_CRTVMAS = 'crtvmas'
-UI_CRTVMAV = 'crtvmav'
-
-# Downloadable US Rating
-UI_DUSROFF = 'dusroff'
-UI_DUSRCUSTOMISED = 'dusrcustomised'
-UI_DUSRCLEARALL = 'dusrclearall'
-UI_ENTIREAUDIANCE1 = 'entireaudiance1'
-UI_ENTIREAUDIANCE1NONE = 'entireaudiance1none'
-UI_ENTIREAUDIANCE1TVG = 'entireaudiance1tvg'
-UI_DIALOGUE1 = 'dialogue1'
-UI_DIALOGUE1D = 'dialogue1d'
-UI_LANGUAGE1 = 'language1'
-UI_LANGUAGE1L = 'language1l'
-UI_SEX1 = 'sex1'
-UI_SEX1S = 'sex1s'
-UI_VIOLENCE1 = 'violence1'
-UI_VIOLENCE1V = 'violence1v'
-UI_CHILDREN1 = 'children1'
-UI_CHILDREN1TVY = 'children1tvy'
-
-# Eco
-UI_POWERSAVING = 'powersaving'
-UI_IDLETVSTANDBY = 'idletvstandby'
-UI_AUTOSHUTOFF = 'autoshutoff'
-
-# IP Control
-UI_CONTROLREMOTELY = 'controlremotely'
-UI_AUTHENTICATION = 'authentication'
-UI_PRESHAREDKEY = 'presharedkey'
-
-# Customer Support
-UI_CONTACTANDSUPPORT = 'contactandsupport'
-UI_SIGNALDIAGNOSTICS = 'signaldiagnostics'
-UI_HELPGUIDE = 'helpguide'
-UI_NOTICESANDLICENCES = 'noticesandlicences'
-# Contact and Support
-UI_CONTACTANDSUPPORTVIEW = 'contactandsupportview'
-# Signal Diagnostics
-UI_SIGNALCHANNEL = 'signalchannel'
-UI_SIGNALNETWORK = 'signalnetwork'
-UI_SIGNALQUALITY = 'signalquality'
-UI_SIGNALSTRENGTH = 'signalstrength'
-UI_SIGNALQUALITY = 'signalquality'
-UI_PHYSICALCHANNEL = 'physicalchannel'
-UI_SIGNALFREQUENCY = 'signalfrequency'
-UI_MODULATION = 'modulation'
-UI_PREBCH = 'prebch'
-UI_POSTVITERBI = 'postviterbi'
-UI_UEC = 'uec'
-UI_SNR = 'snr'
-# Inside Settings from DTV        Inside Settings from DTV        Inside Settings from DTV        Inside Settings from DTV        Inside Settings from DTV
-
-# FACTORY RESET
-UI_FENGLISH_US = 'uienglish_us'
-UI_FAFRIKAANS = 'uiafrikaans'
-UI_FENGLISH_UK = 'uienglish_uk'
-UI_FESPANOL = 'uiespanol'
-UI_FFRANCAIS_CANADA = 'uifrancais_canada'
-UI_FFRANCAIS_FRANCE = 'uifrancais_france'
-UI_FINDONESIAN = 'uiindonesian'
-UI_FINDONESIA = 'uiindonesia'
-UI_FISIZULU = 'uiisizulu'
-UI_FKISWAHILI = 'uikiswahili'
-UI_FPORTUGUES = 'uiportugues'
-UI_FTIENGVIET = 'uitiengviet'
-UI_FRUSSIAN = 'uirussian'
-UI_FARABIC = 'uiarabic'
-UI_FFARSI = 'uifarsi'
-UI_FMARATHI = 'uimarathi'
-UI_FHINDI = 'uihindi'
-UI_FBENGALI = 'uibengali'
-UI_FPUNJABI = 'uipunjabi'
-UI_FGUJARATHI = 'uigujarathi'
-UI_FTAMIL = 'uitamil'
-UI_FTELUGU = 'uitelugu'
-UI_FKANNADA = 'uikannada'
-UI_FMALAYALAM = 'uimalayalam'
-UI_FTHAI = 'uithai'
-UI_FSIMPLIFIEDCHINESE = 'uisimplifiedchinese'
-UI_FTRADISIONALCHINESE = 'uitradisionalchinese'
-
-UI_FCONTINUE = 'fcontinue'
-UI_FLSKIP = 'flskip'
-#---------------
-# ZARUL ADDED 13082020
-#---------------
-UI_FQUICKSETUPCONTINUE = 'fquicksetupcontinue'
-UI_FQUICKSETUPSKIP = 'fquicksetupskip'
-UI_FQUICKSETUP = 'fquicksetup'
-#---------------
-# ZARUL ADDED 13082020
-#---------------                
-
-UI_FWIFI1 = 'fwifi1'
-
-UI_FOTHERNETWORK = 'fothernetwork'
-UI_FUSEETHERNET = 'fuseethernet'
-UI_FSKIP = 'fskip'
-
-#---------------
-# ZARUL ADDED 13082020
-#---------------
-UI_FTOS_ACCEPT = 'uiftosaccept'
-UI_FTOS_DETAIL = 'uiftosdetail'
-UI_FTOS_PRIVACYPOLICY = 'uiftosprivacypolicy'
-UI_FTOS_PLAYTOS = 'uiftosplaytoss'
-UI_FTOS_DETAIL_SCREEN = 'uiftosdetailscreen'
-UI_FTOS_PLAYTOS_SCREEN = 'uiftosplaytosscreen'
-UI_FTOS_PRIVACYPOLICY_SCREEN = 'uiftosprivacypolicyscreen'
-UI_FLOCATION_YES = 'uiflocationyes'
-UI_FLOCATION_NO = 'uiflocationno'
-UI_FHELPIMPROVE_YES = 'uihelpimproveyes'
-UI_FHELPIMPROVE_NO = 'uihelpimprove'
-UI_FGOOGLE_WALKTHROUGH1 = 'uifgooglewalkthrough1'
-UI_FGOOGLE_WALKTHROUGH2 = 'uifgooglewalkthrough2'
-UI_FGOOGLE_WALKTHROUGH3 = 'uifgooglewalkthrough3'
-UI_FGOOGLE_WALKTHROUGH4 = 'uifgooglewalkthrough4'
-#---------------
-# ZARUL ADDED 13082020
-#---------------                
-UI_FAFRICA = 'uiafrica'
-UI_FASIA = 'uiasia'
-UI_FEUROPE = 'uieurope'
-UI_FMIDDLEEAST = 'uimiddleeast'
-UI_FOCEANIA = 'uioceania'
-UI_FUSA = 'fusa'
-UI_FCANADA = 'fcanada'
-UI_FBELIZE = 'fbelize'
-UI_FDOMINICANREPUBLIC = 'fdominicanrepublic'
-UI_FPUERTORICO = 'fpuertorico'
-UI_FOTHER = 'uifother'
-UI_FAREAEXCLUDINGABOVE = 'uiareaexcludingabove'
-UI_FOK = 'fok'
-UI_FDONE = 'fdone'
-UI_FEASTAFRICA = 'uifeastafrica'
-UI_FGHANA = 'uifghana'
-UI_FKENYA = 'uifkenya'
-UI_FMOROCO = 'uifmoroco'
-UI_FNIGERIA = 'uifnigeria'
-UI_FNORTHAFRICA = 'uifnorthafrika'
-UI_FSOUTHAFRICA = 'uifsouthafrika'
-UI_FTANZANIA = 'uiftanzania'
-UI_FTUNISIA = 'uiftunisia'
-UI_FUGANDA = 'uifuganda'
-UI_FWESTAFRICA = 'uifwestafrica'
-UI_FINDIA = 'uifindia'
-UI_FINDONESIA = 'uifindonesia'
-UI_FMALAYSIA = 'uifmalaysia'
-UI_FMYANMAR = 'uifmyanmar'
-UI_FPHILIPPINES = 'uifphilippines'
-UI_FSINGAPORE = 'uifsingapore'
-UI_FTHAILAND = 'uifthailand'
-UI_FVIETNAM = 'uifvietnam'
-UI_FAEA_ASIA = 'faea_asia'
-UI_FAZERBAIJAN = 'uifazerbaijan'
-UI_FCIS = 'uifcis'
-UI_FTURKEY = 'uifturkey'
-UI_FAEA_EUROPE = 'faea_europe'
-UI_FGCC = 'uifgcc'
-UI_FIRAN = 'uifiran'
-UI_FLEVANT = 'uiflevant'
-UI_FSAUDIARABIA = 'uifsaudiarabia'
-UI_FAEA_MIDDLEEAST = 'faea_middleeast'
-UI_FAUSTRALIA = 'faustralia'
-UI_FNEWZEALAND = 'uifnewzealand'
-UI_FAEA_OCEANIA = 'faea_oceania'
-
-#---------------
-# ZARUL ADDED 13082020
-#---------------
-UI_FAUSTRALIA_NSW = 'uifaustraliansw'
-UI_FAUSTRALIA_VIC = 'uifaustraliavic'
-UI_FAUSTRALIA_QLD = 'uifaustraliaqld'
-UI_FAUSTRALIA_SA = 'uifaustraliasa'
-UI_FAUSTRALIA_WA = 'uifaustraliawa'
-UI_FAUSTRALIA_TAS = 'uifaustraliatas'
-UI_FAUSTRALIA_NT = 'uifaustraliant'
-
-UI_FVOICERECOGNITION_NEXT = 'uifvoicerecognitionnext'
-UI_FVOICERECOGNITION_SKIP1 = 'uifvoicerecognitionskip1'
-UI_FVOICERECOGNITION_SKIP2 = 'uifvoicerecognitionskip2'
-
-UI_FDIGITALANALOGUE = 'uifdigitalanalogue'
-UI_FDIGITAL = 'uifdigital'
-UI_FANALOGUE = 'uifanalogue'
-UI_FTUNE_SKIP = 'uiftuneskip'
-UI_FCANCELTUNE_YES = 'uifcanceltuneyes'
-UI_FCANCELTUNE_NO = 'uifcanceltuneno'
-#---------------
-# ZARUL ADDED 13082020
-#---------------           
-# Arif Added_06042020
-#---------------
-UI_TIMERS = 'uitimers'
-UI_HSSLEEPTIMER = 'hssleeptimer'
-
-#---------------
-# Arif Added_13042020
-#---------------
-# RedratLib path
-POWER = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\POWER.bat'
-HOME = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\HOME.bat'
-BACK = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\BACK.bat'
-OPTION = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\OPTION.bat'
-DOWN = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\DOWN.bat'
-UP = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\UP.bat'
-LEFT = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\LEFT.bat'
-RIGHT = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\RIGHT.bat'
-SELECT = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\SELECT.bat'
-ChUp = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\ChUp.bat'
-ChDown = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\ChDown.bat'
-EPG = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\EPG.bat'
-AUDIOMENU = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\AUDIOMENU.bat'
-ch0 = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\ch0.bat'
-ch1 = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\ch1.bat'
-ch2 = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\ch2.bat'
-ch3 = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\ch3.bat'
-ch4 = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\ch4.bat'
-ch5 = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\ch5.bat'
-ch6 = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\ch6.bat'
-ch7 = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\ch7.bat'
-ch8 = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\ch8.bat'
-ch9 = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\ch9.bat'
-DOT = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\DOT.bat'
-RED = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\RED.bat'
-GREEN = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\GREEN.bat'
-YELLOW = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\YELLOW.bat'
-BLUE = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\BLUE.bat'
-NETFLIX = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\NETFLIX.bat'
-YOUTUBE = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\YOUTUBE.bat'
-MUTE = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\MUTE.bat'
-BANNER = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\BANNER.bat'
-INPUT = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\INPUT.bat'
-SUBTITLE = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\SUBTITLE.bat'
-JUMP = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\JUMP.bat'
-TELETEXT = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\TELETEXT.bat'
-VolumeUp = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\VolumeUp.bat'
-VolumeDown = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\VolumeDown.bat'
-ServiceMode = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\ServiceMode.bat'
-PLAY = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\PLAY.bat'
-STOP = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\STOP.bat'
-PAUSE = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\PAUSE.bat'
-PREVIOUS = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\PREVIOUS.bat'
-NEXT = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\NEXT.bat'
-REWIND = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\REWIND.bat'
-FORWARD = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\FORWARD.bat'
-EXIT = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\EXIT.bat'
-GOOGLEPLAY = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\GOOGLEPLAY.bat'
-HELP = r'C:\Users\Public\AKIRA\Api\at\library\RedRatLib\TOOLS\HELP.bat'
-
-#-------------------
-# AudioPlayer Module
-#---------------------
-AUDIOLIBPATH = r'Api\at\default\library\audio'
-
-# --------------------- Android ----------------------
-UISwitch = 'uiswitch'
-
-#---------------
-# Universal UI Name (Used for UI Difference iteration (API v4))
-#---------------
-
-UI_DTV = 'dtv'
-UI_APP1 = 'app1'
-UI_DIGITALEPG = 'digitalepg'
-UI_PROGRAMMELIST = 'programmelist'
-UI_TITLELIST = 'titlelist'
-UI_TIMERLIST = 'timerlist'
-UI_PHOTO = 'photo'
-UI_MUSIC = 'music'
-UI_VIDEO = 'video'
-UI_SYSTEMSETTINGS = 'systemsettings'
-
-#---------------
-# UI Structure Function
-#---------------
-AKIRAPATH = r'C:\Users\Public'
-TESTTOOLNAME1 = r'\TVTool'
-TESTTOOLNAME2 = r'\AKIRA'
-AKIRAPATHERRORMESSAGE = r"Can't find TestTool Path."
-UISTRUCTURELIBRARYFOLDERPATH = r'Api\uistructure\uistructurelibrary'
-
-UIUP = STR_UP
-UIDOWN = STR_DOWN
-UILEFT = STR_LEFT
-UIRIGHT = STR_RIGHT
-UISELECT = STR_SELECT
-UIBACK = STR_BACK
-UIHOME = STR_HOME
-UIOPTION = STR_OPTION
-
-UIHOMENAME = STR_HOME
-UIGRAPHHOMEINDEX = INT_SIX
-UIGREYOUTFLAGINDEX = INT_SIX
-UIGREYOUT = True
-UINOTGREYOUT = False
-UINEXT = INT_ONE
-UILASTINDEX = INT_NEG_ONE
-UILASTUINAMEINDEX = INT_ZERO
-UIGRAPHNODEINDEX = INT_ZERO
-UIMOREOPTIONINDEX = INT_ONE
-UICHANGEDEFAULTVALUEFLAGINDEX = INT_FIVE
-UIDEFAULTVALUEINDEX = INT_TWO
-UIVALUESELECTIONINDEX = INT_ZERO
-UIMINVALUEINDEX = INT_THREE
-UIMAXVALUEINDEX = INT_FOUR
-UILDICKEYLST1STINDEX = INT_ZERO
-UIOK = 'ok'
-UICANCEL = 'cancel'
-UIAERIAL = 'aerial'
-UIANTENNA = 'antenna'
-UICABLE = 'cable'
-UIHORIZONTAL = 'horizontal'
-UIVERTICAL = 'vertical'
-UISWITCH = 'switch'
-UICONVERTUIFILENAME = r'ConvertUIRegion'
-UIREGIONUIFILENAME = r'RegionUIUpdate'
-UICOUNTRYUIFILENAME = r'CountryUIUpdate'
-
-#---------------
-# Remote Control
-#---------------
-RCUP = STR_UP
-RCDOWN = STR_DOWN
-RCLEFT = STR_LEFT
-RCRIGHT = STR_RIGHT
-RCSELECT = STR_SELECT
-RCBACK = STR_BACK
-RCHOME = STR_HOME
-RCOPTION = STR_OPTION
-
-RCAPIFOLDERPATHTVTOOL = r'C:\Users\Public\TVTool\Api\config'
-RCAPIFOLDERPATHAKIRA = r'C:\Users\Public\AKIRA\Api\config'
-RCIRCODEEXCELPATH = r'Api\config'
-RCINDEXUINAME = INT_ZERO
-RCINDEXDIRECTION = INT_ONE
-RCINDEXDEFAULTVALUE = INT_TWO
-RCINDEXMINVALUE = UIMINVALUEINDEX
-RCINDEXMAXVALUE = UIMAXVALUEINDEX
-RCLASTINDEX = UILASTINDEX
-RCDELAY1SEC = INT_ONE
-RCDELAY2SEC = INT_TWO
-RCDELAY5SEC = INT_FIVE
-RCHORIZONTAL = UIHORIZONTAL
-RCVERTICAL = UIVERTICAL
-RCHOME = UIHOMENAME
-RCINDEXSELECTION = INT_ZERO
-RCMSEC = 1000
-RCDEFAULTDELAY = 1
-RCDEFAULTREPEAT = 2
-
-RCEU = STR_EU
-RCPA = STR_PA
-RCLA = STR_LA
-RCBZ = STR_BZ
-RCUC = STR_UC
-RCCOL = STR_COL
-RCTW = STR_TW
-RCCHD = STR_CHD
-RCHK = STR_HK
-
-RCUK = STR_UK 
-RCBRA = STR_BRA
-RCGCC = STR_GCC
-RCGHA = STR_GHA
-RCIDN = STR_IDN
-RCKEN = STR_KEN
-RCMY = STR_MY 
-RCNZ = STR_NZ 
-RCSG = STR_SG 
-RCTHA = STR_THA
-RCECU = STR_ECU
-RCPH = STR_PH 
-RCPAR = STR_PAR # Paraguay
-RCURU = STR_URU # Uruguay
-RCUSA = STR_USA
-RCTWN = STR_TWN
-
-RCDEFAULTUSBUIRTNAME = 'USB-UIRT'
-
-#---------------
-#      AC
-#---------------
-ACHTTP = STR_HTTP
-ACSETCMDUSER = r'/set.cmd?user='
-ACCMDSETPOWERON = r'+cmd=setpower+p61=1'
-ACCMDSETPOWEROFF = r'+cmd=setpower+p61=0'
-ACPASS = r'+pass='
-ACON_LOWER = r'on'
-ACOFF_LOWER = r'off'
-
-#---------------
-# Audio Video Recording
-#---------------
-AVRAUDIOCHUNK = 1024
-AVRAUDIORATE = 44100
-AVRAUDIOCHANNEL = 2
-AVRDEFAULTDEVICE = 0
-AVR30FPS = 30.0
-AVR1SECOND = INT_ONE
-AVRDEFAULTVIDEOWIDTH = 1920
-AVRDEFAULTVIDEOHEIGHT = 1080
-
-AVRAUDIONAME = r'_audio'
-
-#---------------
-#  Serial API
-#---------------
-SAPI3DECIMAL = INT_THREE
-SAPISTR_I = 'i'
-SAPISTR_C = 'c'
-SAPISTR_TAB = 'tab'
-
-SAPIUP = STR_UP
-SAPIDOWN = STR_DOWN
-SAPILEFT = STR_LEFT
-SAPIRIGHT = STR_RIGHT
-SAPISELECT = STR_SELECT
-SAPIBACK = STR_BACK
-SAPIHOME = STR_HOME
-SAPIOPTION = STR_OPTION
-
-SAPIINDEXUINAME = INT_ZERO
-SAPIINDEXDIRECTION = INT_ONE
-SAPIINDEXDEFAULTVALUE = INT_TWO
-SAPIINDEXMINVALUE = UIMINVALUEINDEX
-SAPIINDEXMAXVALUE = UIMAXVALUEINDEX
-SAPILASTINDEX = UILASTINDEX
-SAPIDELAY1SEC = INT_ONE
-SAPIDELAY2SEC = INT_TWO
-SAPIDELAY5SEC = INT_FIVE
-SAPIHORIZONTAL = UIHORIZONTAL
-SAPIVERTICAL = UIVERTICAL
-SAPIHOME = UIHOMENAME
-SAPIINDEXSELECTION = INT_ZERO
-SAPIINDEXNEXT = INT_ONE
-SAPIASCIICARRIAGERETURN_STR = '\x0D'
-SAPIASCIIHORIZONALTAB_STR = '\x09'
-SAPIASCIIINTERRUPT_STR = '\x09'
-SAPIASCIIFORMAT_STR = 'ascii'
-
-MTKMODE = 'mtkmode'
-RTKMODE = 'rtkmode'
-SERIALDELAY = 5
-
-DEFAULT_WRITE_WAIT_TIME = 3
-
-#---------------
-# Capture Photo
-#---------------
-CPDEFAULTDEVICE = INT_ZERO
-
-#---------------
-#  System API
-#---------------
-SAPISUMMARYTEXTDEFAULT = INT_ONE
-SAPISUBSUMMARYTEXTDEFAULT = INT_TWO
-SAPIRESULTTEXTDEFAULT = INT_ONE
-SAPIRESULTPICDEFAULT = INT_FOUR
-SAPIWORKSHEETDEFAULTNAME1 = 'Summary'
-SAPIWORKSHEETDEFAULTNAME2 = 'Results'
-SAPIDEFAULTCOOR  = [INT_ZERO,INT_ZERO,INT_ZERO,INT_ZERO]
-SAPIDATAIMAGERESULTPASS = 'Passed'
-SAPIDATAIMAGERESULTFAIL = 'Failed'
-SAPIDATAIMAGERESULTPENDING = 'Pending'
-SAPIDEFAULTERRORTEXT = 'Error Detected'
-
-SAPIINCREMENT1 = INT_ONE
-SAPIINCREMENT2 = INT_TWO
-SAPIINCREMENT3 = INT_THREE
-SAPIINCREMENT28 = 28
-SAPIINCREMENT30 = 30
-SAPITESTFOLDERSELECTIONPICTURE = 'picture'
-SAPITESTFOLDERSELECTIONSUBTITLE = 'subtitle'
-SAPITESTFOLDERSELECTIONVIDEO = 'video'
-SAPITESTFOLDERPICTURE= r'testfolder'
-SAPITESTFOLDERSUBVIDEO = r'subtitlevideo'
-SAPITESTFOLDERTESTVIDEO = r'testvideo'
-SAPIAVALSHAREFOLDERNAME = 'avalshare'
-SAPIIMAGEFLAG = False
-SAPISUBTITLEFLAG = True
-SAPIAVALDEFAULTIP = '43.74.4.35'
-SAPIJAASDEFAULTIP = '43.74.10.87'
-SAPIAVALGATEWAYDEFAULTIP = '43.74.10.87'
-SAPIHTTPPOSTDATAVALUE = ':3030/postdata'
-SAPIAVALTESTFOLDERPATH = r'avalshare/testfolder'
-SAPIAVALSTATUS = r'http://43.74.4.35:3031/aval/status'
-
-SAPICOORLENGTH = INT_FIVE
-SAPICOOR1 = INT_ZERO
-SAPICOOR2 = INT_ONE
-SAPICOOR3 = INT_TWO
-SAPICOOR4 = INT_THREE
-SAPIREFWORD = INT_FOUR
-SAPIREFTEXTTESTMODE = INT_ONE
-SAPIREFLOGOTESTMODE = INT_THREE
-SAPIIMAGETESTRESULT = INT_ZERO
-SAPIFULLHDWIDTH = 1920 
-SAPIFULLHDHEIGHT = 1080 
-SAPIVIDEOFULLHDCOOR = [0,0,1920,320,0,780,1920,1080]
-SAPIHDWIDTH = 1280
-SAPIHDHEIGHT = 720
-SAPIVIDEOHDCOOR = [0,0,1280,213,0,520,1280,720]
-SAPIAVALSHAREJSONRESULTPATH = r'avalshare\result'
-SAPIJSONRESULTNAME = '_subtitle'
-
-SAPISUMMARYTAB = INT_ZERO
-SAPIRESULTTAB = INT_ONE
-SAPISUMMARYCOLUMN = INT_FIVE
-SAPISUMMARYRESULTCOLUMN = INT_ONE
-SAPIRESULTRESULTCOLUMN = INT_ONE
-SAPISUMMARYDEFAULTFONTSIZE = '30'
-SAPIPICTUREPATHINDEX = INT_ZERO
-SAPIPICTURECOORINDEX = INT_ONE
-SAPIPICTURERESULTNAMEINDEX = INT_TWO
-SAPIPICTURERESULTINDEX = INT_THREE
-SAPITEXTINDEX = INT_FOUR
-SAPITEXTREFERENCEINDEX = INT_ZERO
-SAPITEXTDETECTEDINDEX = INT_ONE
-SAPIERRORINDEX = INT_FIVE
-SAPITESTDESCINDEX = INT_SIX
-SAPIERRORSTATUSCODEINDEX = INT_ZERO
-SAPIERRORTEXTINDEX = INT_ONE
-SAPIATTACHIMAGEWIDTH = 960
-SAPIATTACHIMAGEHEIGHT = 540
-SAPIATTACHIMAGECOLUMN = INT_ONE
-SAPIAVALSUBTITLERESULTFILEPATHINDEX = INT_ONE
-SAPIAVALSUBTITLEVIDEOPATHINDEX = INT_ZERO
-SAPIAVALSUBTITLERESULTPATHINDEX = INT_TWO
-SAPIAVALSUBTITLEVIDEONAMEINDEX = INT_ONE
-SAPIREDCOLOUR = (0,0,255) # (B,G,R) (0 -> 255 value)
-SAPIGREENCOLOUR = (0,255,0) # (B,G,R) (0 -> 255 value)
-
-SAPILINETHICKNESS = INT_THREE
-SAPILINETYPE = INT_EIGHT
-SAPILINESHIFT = INT_ZERO
-SAPISUBTITLEFRAMENAME = 'SubtitleFrame'
-SAPIBEGSUBTITLEFRAMEINDEX = INT_ZERO
-SAPIENDSUBTITLEFRAMEINDEX = INT_ONE
-SAPIMINFRAME = INT_ZERO
-SAPISUBTITLETEXTINDEX = INT_TWO
-SAPIJSONSTARTFRAME = 'Start Frame'
-SAPIJSONENDFRAME = 'End Frame'
-SAPIJSONTEXT = 'text'
-SAPIRESULTKEY = 'result'
-SAPIRESULTMESSAGEKEY = 'resultmessage'
-SAPIDBFILENAME = 'systemapiresult.db'
-SAPIPICTUREJUDGEMENT = 'picture'
-SAPIREFVIDEOJUDGEMENT = 'reference_video'
-SAPIAUTOVIDEOJUDGEMENT = 'auto_video'
-
-SAPIARTIFACTSTHRESHOLD = 'artifactsthreshold'
-SAPITOLERANCESECOND = 'tolerancesecond'
-SAPIFREQUENCY = 'frequency'
-SAPINOISEREMOVETHRESHOLD = 'noiseremovethreshold'
-
-SAPIMINIODEFAULTIPPORT = 9000
-SAPIMINIOIPADDRESS = '43.74.4.35:9000'
-
-SAPIRUNTIMEPARAFILE = 'runtime.json'
-SAPIRUNTIMEPARADIR = r'Api\settings\runtime'
-
-SAPI_LOGO_DETECTION_OPTION = [2,3]
-SAPI_TEXT_DETECTION_OPTION = [1,5]
-
-SAPI_RESULT_PASS = 1
-SAPI_RESULT_FAIL = 0
-SAPI_RESULT_PENDING = 2
-SAPI_RESULT_SERVER_ISSUE = 3
-
-SAPI_DEFAULT_PENDING_MESSAGE = "Please check WebUI for results."
-SAPI_DEFAULT_400_MESSAGE = "Server issue"
-SAPI_DEFAULT_500_MESSAGE = "Client issue"
-SAPI_DEFAULT_503_MESSAGE = "Not enough resources"
-SAPI_DEFAULT_EXCEPTION_MESSAGE = "General Exception Detected"
-SAPI_DEFAULT_TIMEOUT_MESSAGE = "Requests Time Out Detected"
-
-SAPI_STANDARD_TIMEOUT = 20
-
-#-------------------
-#  Reference Video Name
-#-------------------
-SAPI_SCENE_REF = 'scene_ref'
-SAPI_BRIDGE_REF = 'bridge_ref'
-SAPI_FLOWER_REF = 'flower_ref'
-SAPI_PARK_REF = 'park_ref'
-SAPI_VILLAGE_REF = 'village_ref'
-SAPI_OFFICE_REF = 'office_ref'
-
-#-------------------
-#  Auto Video Detection Speed Name
-#-------------------
-SAPI_DETECTION_FAST = 'FAST'
-SAPI_DETECTION_DEFAULT = 'DEFAULT'
-
-#---------------
-# Capture Photo
-#---------------
-CPDEFAULTPHOTOWIDTH = 1920
-CPDEFAULTPHOTOHEIGHT = 1080
-
-#---------------
-# Router API
-#---------------
-
-LISTCOUNTRYVPN = r'/root/RouterAPI/ListCountriesVPN.txt'
-LISTOPENVPN = r'/root/RouterAPI/OpenVPN.txt'
-DIROPENVPN = r'/root/RouterAPI/OpenVPN'
-ROUTER_REBOOT = '1'
-ROUTER_ADDBANDWIDTH = '2'
-ROUTER_REMOVEBANDWIDTH = '3'
-ROUTER_SSID = '4'
-ROUTER_DEFAULTCHANNEL = '5'
-ROUTER_DEFAULTCHANNEL5GHZ = '6'
-ROUTER_CHANNELSETTING = '7'
-ROUTER_DEFAULTAUTH = '8'
-ROUTER_DEFAULTAUTH5GHZ = '9'
-ROUTER_AUTHMETHOD = '10'
-ROUTER_DEFAULTWIFIPASSWORD = '11'
-ROUTER_DEFAULTWIFIPASSWORD5GHZ = '12'
-ROUTER_WIFIPASSWORD = '13'
-ROUTER_WPATYPE = '14'
-ROUTER_DHCP = '15'
-ROUTER_DEFAULTDHCP = '16'
-ROUTER_VPN = '17'
-ROUTER_TOGGLESSIDVISIBILITY = '18'
-ROUTER_TOGGLEWANCONNECTION = '19'
-ROUTER_RESET = '20'
-
-ROUTER_DELAY6MIN = 360
-ROUTER_DELAY5MIN = 300
-ROUTER_DELAY30SEC = 30
-ROUTER_DELAY20SEC = 20
-ROUTER_DELAY10SEC = 10
-ROUTER_DELAY2SEC = 2
-
-ROUTER_5GHZ = '5GHz'
-ROUTER_2GHZ = '2.4GHz'
-
-ROUTER_WPA2PERSONAL = 'WPA2-Personal'
-ROUTER_WPAAUTOPERSONAL = 'WPA-Auto-Personal'
-
-ROUTER_PPTP = 'PPTP'
-ROUTER_L2TP = 'L2TP'
-ROUTER_OPENVPN = 'OpenVPN'
-
-ROUTER_WIRED = 'wired'
-ROUTER_WIRELESS = 'wireless'
-
-ROUTERURL = "http://192.168.1.1/Main_Login.asp"
-CHROME = "chrome"
-FIREFOX = "firefox"
-
-# =====Sign In Keywords=====
-LOGIN_USER = "login_username"
-LOGIN_PASS = "login_passwd"
-LOGIN_ERROR = "error_status_field"
-SIGN_IN_BUTTON = "button"
-REBOOT_BUTTON = '//span[contains(text(),\'Reboot\')]'
-
-# =====QoS Keywords=====
-ADAPTIVE_QOS = "_AdaptiveQoS_Bandwidth_Monitor"
-BANDWIDTH_MENU = '//*[@id="AdaptiveQoS_Bandwidth_Monitor_menu"]/table/tbody/tr/td[2]'
-QOS = '//*[@id="QoS_EZQoS_tab"]/span'
-DOWNLOAD_RATE = "download_rate"
-UPLOAD_RATE = "upload_rate"
-ADD_DELETE_DEVICE = "add_delete"
-PULL_DOWN_MENU = "pull_arrow"
-APPLY = '//span[contains(text(),\'Apply\')]'
-TABLE_INFO = '//*[@id="mainTable_table"]/tbody/tr[3]/td'
-REMOVE_BANDWIDTH = '//*[@id="mainTable_table"]/tbody/tr[3]/td[5]/div'
-
-# =====Wireless Keywords =====
-WIRELESS_MENU = "Advanced_Wireless_Content_menu"
-LAN_MENU = "Advanced_LAN_Content_menu"
-BAND = 'select[name=wl_unit]'
-CHANNEL_BOX = 'select[name=wl_channel]'
-AUTH_BOX = 'select[name=wl_auth_mode_x]'
-ENCRYPTION_BOX = 'select[name=wl_crypto]'
-WPA_PRESHARED_KEY = "wl_wpa_psk"
-DHCP_SERVER = 'Advanced_DHCP_Content_tab'
-ENABLE_DHCP_SERVER = '//*[@id="FormTitle"]/tbody/tr/td/table[1]/tbody/tr[1]/td/input[1]'
-UNABLE_DHCP_SERVER = '//*[@id="FormTitle"]/tbody/tr/td/table[1]/tbody/tr[1]/td/input[2]'
-DHCP_STARTING = '//*[@id="FormTitle"]/tbody/tr/td/table[1]/tbody/tr[3]/td/input'
-DHCP_ENDING = '//*[@id="FormTitle"]/tbody/tr/td/table[1]/tbody/tr[4]/td/input'
-DHCP_APPLY = "//*[@id='FormTitle']/tbody/tr/td/div[9]/input"
-DEFAULT_BAND_TYPE_2 = "2.4GHz"
-DEFAULT_BAND_TYPE_5 = "5GHz"
-CONTROL_CHANNEL = "wl_channel"
-DEFAULT_CHANNEL = "Auto"
-DEFAULT_AUTHMETHOD = "WPA2-Personal"
-DEFAULT_STARTING_ADDRESS = "192.168.1.2"
-DEFAULT_ENDING_ADDRESS = "192.168.1.254"
-DEFAULT_PASSWORD = "admin123"
-BAND24GHZ = "span0"
-BAND5GHZ = "span1"
-SSIDNAME = "wl_ssid"
-APPLYBUTTON = "applySecurity"
-APPLY_BUTTON = "applyButton"
-
-# =====VPN SETTINGS Keywords =====
-VPN_TAB = "Advanced_VPN_PPTP_menu"
-VPN_CLIENT = '//span[contains(text(),\'VPN Client\')]'
-ADD_PROFILE = '//*[@id="FormTitle"]/tbody/tr/td/table/tbody/tr[2]/td/div[2]/input'
-PPTP = 'pptpcTitle_pptp'
-L2TP = 'l2tpcTitle_pptp'
-OPENVPN = 'opencTitle_pptp'
-DESC_BOX = '//*[@id="openvpnc_setting"]/table/tbody/tr[2]/td/div/table/tbody/tr[1]/td/input'
-SERVER_BOX = '//*[@id="openvpnc_setting"]/table/tbody/tr[2]/td/div/table/tbody/tr[2]/td/input'
-USERNAME_BOX = '//*[@id="openvpnc_setting"]/table/tbody/tr[2]/td/div/table/tbody/tr[3]/td/input'
-PASSWORD_BOX = '//*[@id="openvpnc_setting"]/table/tbody/tr[2]/td/div/table/tbody/tr[4]/td/input'
-OPENVPN_DESC_BOX = '//*[@id="openvpnc_setting_openvpn"]/table/tbody/tr[3]/td/div/table[1]/tbody/tr[1]/td/input'
-OPENVPN_USERNAME_BOX = '//*[@id="openvpnc_setting_openvpn"]/table/tbody/tr[3]/td/div/table[1]/tbody/tr[2]/td/input'
-OPENVPN_PASSWORD_BOX = '//*[@id="openvpnc_setting_openvpn"]/table/tbody/tr[3]/td/div/table[1]/tbody/tr[3]/td/input'
-CHOOSE_FILE = '//*[@id="openvpnc_setting_openvpn"]/table/tbody/tr[3]/td/div/table[1]/tbody/tr[4]/td/input[1]'
-UPLOAD_FILE = '//*[@id="openvpnc_setting_openvpn"]/table/tbody/tr[3]/td/div/table[1]/tbody/tr[4]/td/input[2]'
-ACTIVATE_VPN = ".button_gen[value='Activate']"
-CANCEL = ".button_gen[value='Cancel']"
-# DELETE_VPN = '//*[@id="vpnc_clientlist_table"]/table/tbody/tr/td[5]'
-DELETE_VPN = '//*[@id="vpnc_clientlist_Block"]/table/tbody/tr/td[5]/div'
-# DELETE_VPN = '//*[@id="row0"]/td[5]/input'
-VPN_OK_BUTTON = '.button_gen[value="OK"]'
-
-# =====SSID Visibility=====
-SSID_HIDE = '//*[@id="WLgeneral"]/tbody/tr[5]/td/input[1]'
-SSID_VISIBLE = '//*[@id="WLgeneral"]/tbody/tr[5]/td/input[2]'
-
-# =====WAN Connection=====
-WAN_MENU = '//*[@id="Advanced_WAN_Content_menu"]'
-WAN_ON = '//*[@id="t2BC"]/tbody/tr[2]/td/input[1]'
-WAN_OFF = '//*[@id="t2BC"]/tbody/tr[2]/td/input[2]'
-WAN_APPLY = '//*[@id="FormTitle"]/tbody/tr/td/div[7]/input'
-
-#---------------
-# TV Models
-#---------------
-
-# MTK Linux Models
-UNICORN = 'unicorn'
-UNICORN2 = 'unicorn2'
-UNICORN3 = 'unicorn3'
-UNICORN4 = 'unicorn4'
-
-MTK_LINUX_TV = [UNICORN, UNICORN2, UNICORN3, UNICORN4]
-
-# MTK Android Models
-UROBOROS = 'uroboros'
-UROBOROS2 = 'uroboros2'
-UROBOROS3 = 'uroboros3'
-VALHALLA = 'valhalla'
-VALHALLA2 = 'valhalla2'
-
-MTK_ANDROID_TV = [UROBOROS, UROBOROS2, UROBOROS3, VALHALLA, VALHALLA2]
-
-# MTK TV Models
-MTK_TV = MTK_LINUX_TV + MTK_ANDROID_TV
-
-# RTK Models
-VULCAN = 'vulcan'
-VULCAN2 = 'vulcan2'
-
-RTK_ANDROID_TV = [VULCAN, VULCAN2]
-
-# Android Models
-ANDROID_TV = MTK_ANDROID_TV + RTK_ANDROID_TV
+'''
+This is the ConstantName.py file for Pyhton 3
+'''
+
+'''
+This file is to hold a collection of Constant Variable that is used by the APIs.
+'''
+
+'''
+For searching purposes
+----------------------
+INDEX:-
+1) General                   -> ConstantGeneral.py
+2) UI Structure Library      -> ConstantUI.py
+  a) UISTRUCLIB_EU
+  b) IPTV UI
+  c) Google UI
+3) UI Structure Function     -> ConstantApi.py
+4) Remote Control            -> ConstantApi.py
+5) AC                        -> ConstantApi.py
+6) Audio Video Recording     -> ConstantApi.py
+7) Serial API                -> ConstantApi.py
+8) System API                -> ConstantApi.py
+9) Capture Photo             -> ConstantApi.py
+10) Router API               -> RouterConstant.py
+11) TV Models                -> ConstantTVModel.py
+'''
+
+'''
+General and Router API constants are loaded with this module. The other modules
+are only imported the first time one of their constants is read, eg. CN.UI_PHOTO,
+so "import ConstantName as CN" stays cheap for the Router API.
+'''
+import importlib
+
+from ConstantGeneral import *
+from RouterConstant import *
+
+# Lazily loaded modules, smallest first since they are searched in this order.
+LAZY_MODULES = ('ConstantTVModel', 'ConstantApi', 'ConstantUI')
+# Names of this module itself, left out of "from ConstantName import *".
+MODULE_NAMES = ('importlib', 'LAZY_MODULES', 'MODULE_NAMES')
+
+
+def __getattr__(name):
+    if name == '__all__':
+        return [constant for constant in __dir__() if not constant.startswith('_') and constant not in MODULE_NAMES]
+    if name.startswith('__'):
+        raise AttributeError(name)
+    for module_name in LAZY_MODULES:
+        module = importlib.import_module(module_name)
+        if name in vars(module):
+            value = globals()[name] = getattr(module, name)
+            return value
+    raise AttributeError("module 'ConstantName' has no attribute '%s'" % name)
+
+
+def __dir__():
+    names = set(globals())
+    for module_name in LAZY_MODULES:
+        names.update(vars(importlib.import_module(module_name)))
+    return sorted(names)
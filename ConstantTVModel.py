@@ -0,0 +1,42 @@
+'''
+This is the ConstantTVModel.py file for Pyhton 3
+'''
+
+'''
+TV model names.
+Loaded through ConstantName, eg. CN.UNICORN
+'''
+from ConstantGeneral import *
+
+#---------------
+# TV Models
+#---------------
+
+# MTK Linux Models
+UNICORN = 'unicorn'
+UNICORN2 = 'unicorn2'
+UNICORN3 = 'unicorn3'
+UNICORN4 = 'unicorn4'
+
+MTK_LINUX_TV = [UNICORN, UNICORN2, UNICORN3, UNICORN4]
+
+# MTK Android Models
+UROBOROS = 'uroboros'
+UROBOROS2 = 'uroboros2'
+UROBOROS3 = 'uroboros3'
+VALHALLA = 'valhalla'
+VALHALLA2 = 'valhalla2'
+
+MTK_ANDROID_TV = [UROBOROS, UROBOROS2, UROBOROS3, VALHALLA, VALHALLA2]
+
+# MTK TV Models
+MTK_TV = MTK_LINUX_TV + MTK_ANDROID_TV
+
+# RTK Models
+VULCAN = 'vulcan'
+VULCAN2 = 'vulcan2'
+
+RTK_ANDROID_TV = [VULCAN, VULCAN2]
+
+# Android Models
+ANDROID_TV = MTK_ANDROID_TV + RTK_ANDROID_TV
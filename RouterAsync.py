@@ -0,0 +1,501 @@
+#!/usr/bin/python3
+import asyncio
+import base64
+import collections
+import contextlib
+import json
+import os
+import time
+import urllib.parse
+import uuid
+
+import ConstantName as CN
+from RouterForm import RouterFormSetting
+from RouterEvents import EVENTS, outcome
+from RouterMetrics import METRICS
+from RouterSession import SessionStore
+from RouterTransport import Change, LoginResult, OperationFailed, RouterTransport, router_ip
+
+
+# Response of the router: HTTP status, headers (lower case names) and body bytes.
+HttpResponse = collections.namedtuple('HttpResponse', 'status headers body')
+
+
+class AsyncHttpError(IOError):
+    pass
+
+
+class ReadNeeded(Exception):
+    def __init__(self, names):
+        Exception.__init__(self, names)
+        self.names = names
+
+
+def multipart(fields, files):
+    boundary = uuid.uuid4().hex
+    parts = []
+    for name, value in fields.items():
+        parts.append(('--%s\r\nContent-Disposition: form-data; name="%s"\r\n\r\n%s\r\n' % (
+            boundary, name, value)).encode('utf-8'))
+    for name, (filename, content) in files.items():
+        parts.append(('--%s\r\nContent-Disposition: form-data; name="%s"; filename="%s"\r\n'
+                      'Content-Type: application/octet-stream\r\n\r\n' % (boundary, name, filename)).encode('utf-8')
+                     + content + b'\r\n')
+    parts.append(('--%s--\r\n' % boundary).encode('ascii'))
+    return b''.join(parts), 'multipart/form-data; boundary=' + boundary
+
+
+class AsyncHttpTransport(RouterTransport):
+    name = CN.ROUTER_BACKEND_HTTP
+
+    def __init__(self, ip, timeout=CN.ROUTER_HTTP_TIMEOUT):
+        '''
+        Summary:
+            Non-blocking HTTP channel to the router, on asyncio streams.
+
+        Description:
+            1) Same endpoints and methods as RouterHttp.HttpTransport, as coroutines.
+            2) Every request opens its own connection, so requests of many routers never share a thread or a pool.
+            3) Every request is bounded by timeout; cancelling it closes its connection.
+
+        Args:
+            self: self
+            ip: (Type: String) Router IP address, optionally with port
+            timeout: (Type: Float) Seconds allowed per request
+
+        Returns:
+            An object of AsyncHttpTransport.
+        '''
+        RouterTransport.__init__(self, ip)
+        self.timeout = timeout
+        self.jar = {}
+
+    async def request(self, method, page, data=None, files=None, headers=None, timeout=None):
+        '''
+        Summary:
+            Send one request to the router.
+
+        Args:
+            self: self
+            method: (Type: String) GET or POST
+            page: (Type: String) Router page or cgi, eg. 'apply.cgi'
+            data: (Type: Dict) Form fields
+            files: (Type: Dict) Field name to (file name, content bytes), sent as multipart/form-data
+            headers: (Type: Dict) Extra headers
+            timeout: (Type: Float) Seconds allowed. Default the transport timeout
+
+        Raises:
+            asyncio.TimeoutError: No complete response in time
+            OSError: Connection refused or dropped
+
+        Returns:
+            (Type: HttpResponse)
+        '''
+        return await asyncio.wait_for(self.exchange(method, page, data, files, headers),
+                                      self.timeout if timeout is None else timeout)
+
+    async def exchange(self, method, page, data, files, headers):
+        url = urllib.parse.urlsplit(self.url(page))
+        body = b''
+        head = collections.OrderedDict([
+            ('Host', url.netloc),
+            ('User-Agent', CN.ROUTER_USER_AGENT),
+            ('Referer', self.url(CN.ROUTER_INDEX_PAGE)),
+            ('Connection', 'close'),
+        ])
+        if files:
+            body, head['Content-Type'] = multipart(data or {}, files)
+        elif data is not None:
+            body, head['Content-Type'] = urllib.parse.urlencode(data).encode('utf-8'), 'application/x-www-form-urlencoded'
+        if method == 'POST':
+            head['Content-Length'] = str(len(body))
+        if self.jar:
+            head['Cookie'] = '; '.join('%s=%s' % cookie for cookie in self.jar.items())
+        head.update(headers or {})
+        reader, writer = await asyncio.open_connection(url.hostname, url.port or 80)
+        try:
+            writer.write(('%s %s HTTP/1.1\r\n' % (method, url.path or CN.STR_FORWARDSLASH)).encode('latin-1')
+                         + ''.join('%s: %s\r\n' % header for header in head.items()).encode('latin-1')
+                         + b'\r\n' + body)
+            await writer.drain()
+            status_line = await reader.readline()
+            if not status_line:
+                raise ConnectionError("Router closed the connection")
+            status = int(status_line.split()[1])
+            response_headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(CN.STR_COLON)
+                name, value = name.strip().lower(), value.strip()
+                if name == 'set-cookie':
+                    cookie, _, cookie_value = value.split(CN.STR_SEMICOLON, 1)[0].partition('=')
+                    self.jar[cookie.strip()] = cookie_value.strip()
+                response_headers[name] = value
+            if 'content-length' in response_headers:
+                content = await reader.readexactly(int(response_headers['content-length']))
+            else:
+                content = await reader.read()
+        finally:
+            writer.close()
+        return HttpResponse(status, response_headers, content)
+
+    @staticmethod
+    def check(response):
+        if not 200 <= response.status < 300:
+            raise AsyncHttpError("Router answered HTTP %d" % response.status)
+        return response
+
+    async def sign_in(self, username, password):
+        auth = base64.b64encode((username + CN.STR_COLON + password).encode('utf-8')).decode('ascii')
+        self.jar.clear()
+        await self.request('POST', CN.ROUTER_LOGIN_CGI, {'login_authorization': auth},
+                           headers={'Referer': self.url(CN.ROUTER_LOGIN_PAGE)})
+        return CN.ROUTER_TOKEN_COOKIE in self.jar
+
+    async def submit(self, change):
+        data = {
+            'action_mode': change.action,
+            'action_script': '',
+            'action_wait': '',
+            'rc_service': change.service,
+            'current_page': change.page,
+            'next_page': change.page,
+        }
+        data.update(change.fields)
+        return self.check(await self.request('POST', CN.ROUTER_APPLY_CGI, data))
+
+    async def read(self, names):
+        hook = CN.STR_SEMICOLON.join('nvram_get(%s)' % name for name in names)
+        response = self.check(await self.request('POST', CN.ROUTER_APPGET_CGI, {'hook': hook}))
+        return json.loads(response.body.decode('utf-8'))
+
+    async def upload(self, filename, fields):
+        with open(filename, 'rb') as upload_file:
+            content = upload_file.read()
+        return self.check(await self.request('POST', CN.ROUTER_VPNUPLOAD_CGI, fields,
+                                             files={'file': (os.path.basename(filename), content)}))
+
+    def cookies(self):
+        return dict(self.jar)
+
+    async def resume(self, cookies):
+        self.jar = dict(cookies)
+        try:
+            await self.read([CN.ROUTER_SESSION_CHECK])
+            return True
+        except (OSError, asyncio.TimeoutError, ValueError):
+            # The firmware answers an expired token with the login page instead of JSON.
+            self.jar.clear()
+            return False
+
+    async def close(self):
+        # Every request closes its own connection; only the login is dropped.
+        self.jar.clear()
+
+
+class PlanTransport(RouterTransport):
+    '''
+    Transport of the AsyncRouterSetting planner: nvram values come from a cache the
+    async side fills in, and changes are only ever staged, never sent.
+    '''
+    name = 'plan'
+
+    def __init__(self, ip):
+        RouterTransport.__init__(self, ip)
+        self.values = {}
+
+    def sign_in(self, username, password):
+        # AsyncRouterSetting signs in on its own transport.
+        return True
+
+    def submit(self, change):
+        raise RuntimeError("The planner only stages changes")
+
+    def upload(self, filename, fields):
+        raise RuntimeError("The planner only stages uploads")
+
+    def read(self, names):
+        missing = [name for name in names if name not in self.values]
+        if missing:
+            raise ReadNeeded(missing)
+        return dict((name, self.values[name]) for name in names)
+
+
+def planned(name):
+    method = getattr(RouterFormSetting, name)
+
+    async def operation(self, *args, **kwargs):
+        started, start = time.time(), time.perf_counter()
+        result, error = None, None
+        try:
+            result = await self.apply(name, *args, **kwargs)
+            return result
+        except (Exception, asyncio.CancelledError) as err:
+            error = err
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            # A failure the operation caught counts as the exception it caught.
+            failure = error.exception or error if isinstance(error, OperationFailed) else error
+            METRICS.observe(name, self.transport.ip, elapsed, result, failure)
+            EVENTS.operation(method, self.transport.ip, args, kwargs, started, elapsed, result, error)
+    operation.__name__ = name
+    operation.__doc__ = method.__doc__
+    return operation
+
+
+class AsyncRouterSetting(object):
+    def __init__(self, ip=None, session=True, timeout=CN.ROUTER_HTTP_TIMEOUT):
+        '''
+        Summary:
+            Awaitable router settings over a non-blocking HTTP transport.
+
+        Description:
+            1) Same operations as RouterHttp.RouterHttpSetting, as coroutines; no thread is used.
+            2) Every operation runs the RouterFormSetting setter to get its nvram fields,
+               then sends them with AsyncHttpTransport.
+            3) Every request is bounded by timeout. Wrap an operation in asyncio.wait_for to bound all of it;
+               cancelling it closes its connection and drops a pending transaction.
+
+        Args:
+            self: self
+            ip: (Type: String) Router IP address. Default taken from RouterConfig ['HARDWAREINFO']['IP']
+            session: (Type: Boolean) Resume and store the login in RouterSession.SessionStore
+            timeout: (Type: Float) Seconds allowed per request
+
+        Example:
+            Below code block shows how to use::
+
+                async def rollout(ips):
+                    async def configure(ip):
+                        router = AsyncRouterSetting(ip)
+                        await router.sign_in('admin', 'admin123')
+                        async with router.transaction():
+                            await router.set_band_and_ssid('2.4GHz', 'iptv_lab')
+                            await router.set_channel_no('2.4GHz', 6)
+                        return await router.reboot()
+                    return await asyncio.gather(*[asyncio.wait_for(configure(ip), 600) for ip in ips],
+                                                return_exceptions=True)
+
+        Returns:
+            An object of AsyncRouterSetting.
+
+        Caveat:
+            reset_router and reconcile are only available on the blocking RouterSetting.
+        '''
+        self.transport = AsyncHttpTransport(router_ip(ip), timeout)
+        self.planner = RouterFormSetting(PlanTransport(self.transport.ip))
+        self.sessions = SessionStore() if session else None
+        self.credentials = (None, None)
+
+    def _event(self, operation, message, level='info', **fields):
+        '''
+        Summary:
+            Log a step of an operation in RouterEvents.EVENTS.
+        '''
+        EVENTS.emit('step', router=self.transport.ip, operation=operation, level=level, message=message, **fields)
+
+    async def close(self):
+        await self.transport.close()
+
+    async def sign_in(self, username, password):
+        '''
+        Summary:
+            Sign in on the router, resuming the stored session when the router still accepts it.
+
+        Returns:
+            (Type: LoginResult) success, error message, elapsed seconds and whether the session was resumed
+        '''
+        start = time.perf_counter()
+        self.credentials = (username, password)
+        if self.sessions is not None:
+            cookies = self.sessions.load(self.transport.ip, username)
+            if cookies is not None:
+                if await self.transport.resume(cookies):
+                    self._event('sign_in', "Login Successfull (session resumed)")
+                    return LoginResult(True, '', time.perf_counter() - start, True)
+                self.sessions.discard(self.transport.ip, username)
+        if await self.transport.sign_in(username, password):
+            if self.sessions is not None:
+                self.sessions.save(self.transport.ip, username, self.transport.cookies())
+            self._event('sign_in', "Login Successfull")
+            return LoginResult(True, '', time.perf_counter() - start)
+        self._event('sign_in', "Login unsuccessfull: Invalid username or password", 'error')
+        return LoginResult(False, 'Invalid username or password', time.perf_counter() - start)
+
+    async def apply(self, name, *args, **kwargs):
+        '''
+        Summary:
+            Run a RouterFormSetting operation and send the changes it makes.
+
+        Description:
+            1) The setter runs on the planner; nvram values it reads are fetched asynchronously and the setter run again.
+            2) Outside a transaction the changes are sent right away, one request per page.
+            3) Step events are logged under the operation name; when the method reports errors
+               instead of raising them, OperationFailed is raised once its changes are sent.
+
+        Args:
+            self: self
+            name: (Type: String) RouterFormSetting method, eg. 'set_band_and_ssid'
+            args: (Type: Any) Arguments of the method
+
+        Raises:
+            OperationFailed: The method reported errors
+
+        Returns:
+            Value returned by the method
+        '''
+        planner = self.planner
+        outer = planner.staged is not None
+        operation, planner.operation = planner.operation, name
+        planner.transport.values = {}
+        try:
+            while True:
+                # Steps of a run cut short by a read are reported again by the next run.
+                errors = planner.errors
+                if not outer:
+                    planner.staged = collections.OrderedDict()
+                    planner.uploads = []
+                try:
+                    result = getattr(planner, name)(*args, **kwargs)
+                    changes, uploads = ([], []) if outer else (list(planner.staged.values()), planner.uploads)
+                    break
+                except ReadNeeded as err:
+                    planner.transport.values.update(await self.transport.read(err.names))
+                finally:
+                    if not outer:
+                        planner.staged = None
+                        planner.uploads = []
+            for change in changes:
+                await self.commit(change, uploads)
+        finally:
+            planner.operation = operation
+        reported = planner.errors - errors
+        if reported and outcome(result)[0] == 'ok':
+            message, exception = planner.failure
+            raise OperationFailed('%s (%d error(s) reported)' % (message, reported), exception)
+        return result
+
+    async def commit(self, change, uploads=()):
+        for page, filename, fields in uploads:
+            if page == change.page:
+                await self.transport.upload(filename, fields)
+        await self.transport.submit(change)
+
+    async def read(self, names):
+        return await self.transport.read(names)
+
+    @contextlib.asynccontextmanager
+    async def transaction(self):
+        '''
+        Summary:
+            Stage changes and apply them once per page, like RouterFormSetting.transaction.
+
+        Example:
+            Below code block shows how to use::
+
+                async with router.transaction():
+                    await router.set_band_and_ssid('2.4GHz', 'SONY!!')
+                    await router.set_wifi_password('2.4GHz', 'WPA2-Personal', 'abcd1234')
+
+        Caveat:
+            If the block raises or is cancelled, nothing is applied. Cancelling while the
+            pages are being submitted leaves the pages already submitted applied.
+        '''
+        planner = self.planner
+        if planner.staged is not None:
+            yield self
+            return
+        planner.staged = collections.OrderedDict()
+        planner.uploads = []
+        try:
+            yield self
+            changes, uploads = list(planner.staged.values()), planner.uploads
+            planner.staged = None
+            for change in changes:
+                await self.commit(change, uploads)
+        finally:
+            planner.staged = None
+            planner.uploads = []
+
+    async def probe(self, stage, username=None, password=None):
+        try:
+            if stage == 'tcp':
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection(self.planner.prober.host, self.planner.prober.port),
+                    CN.ROUTER_PROBE_SOCKET_TIMEOUT)
+                writer.close()
+                return True
+            if stage == 'http':
+                response = await self.transport.request('GET', CN.ROUTER_LOGIN_PAGE, timeout=CN.ROUTER_PROBE_SOCKET_TIMEOUT)
+                return response.status == 200
+            return await self.transport.sign_in(username, password)
+        except (OSError, asyncio.TimeoutError, ValueError):
+            return False
+
+    async def wait_for_reboot(self, username=None, password=None, timeout=CN.ROUTER_DELAY6MIN):
+        '''
+        Summary:
+            Wait for a reboot to complete without holding a thread.
+
+        Description:
+            1) Wait for the router to stop serving its web UI.
+            2) Poll TCP, HTTP and login in order on the RouterProbe.ProbeSchedule of ReadinessProber.
+
+        Returns:
+            (Type: ProbeResult)
+        '''
+        prober = self.planner.prober
+        start = time.perf_counter()
+        down = None
+        deadline = start + prober.down_timeout
+        while time.perf_counter() < deadline:
+            if not await self.probe('http'):
+                down = time.perf_counter()
+                break
+            await asyncio.sleep(prober.interval)
+        schedule = prober.schedule(['tcp', 'http'] + (['login'] if username is not None else []), down, timeout)
+        while schedule.stage is not None:
+            await asyncio.sleep(schedule.record(await self.probe(schedule.stage, username, password)))
+        result = schedule.result(down is not None)._replace(elapsed=time.perf_counter() - start)
+        METRICS.reboot(self.transport.ip, result)
+        return result
+
+    async def reboot(self):
+        '''
+        Summary:
+            Reboot the router and wait until it accepts the login again (the session is signed in again).
+
+        Returns:
+            (Type: ProbeResult) Readiness and measured downtime of the router
+        '''
+        await self.transport.submit(Change(CN.ROUTER_INDEX_PAGE, '', {}, CN.ROUTER_ACTION_REBOOT))
+        self._event('reboot', "rebooting router...")
+        result = await self.wait_for_reboot(*self.credentials)
+        if result.ready:
+            self._event('reboot', "rebooting completed", elapsed=result.elapsed, downtime=result.downtime)
+        else:
+            self._event('reboot', "Router not ready", 'error', elapsed=result.elapsed, stage=result.stage)
+        return result
+
+    set_bandwidth_limit = planned('set_bandwidth_limit')
+    set_bandwidth_rules = planned('set_bandwidth_rules')
+    remove_bandwidth_limit = planned('remove_bandwidth_limit')
+    set_band_and_ssid = planned('set_band_and_ssid')
+    set_default_channel_no = planned('set_default_channel_no')
+    set_default_channel_no_5ghz = planned('set_default_channel_no_5ghz')
+    set_channel_no = planned('set_channel_no')
+    set_default_authentication_method = planned('set_default_authentication_method')
+    set_default_authentication_method_5ghz = planned('set_default_authentication_method_5ghz')
+    set_authentication_method = planned('set_authentication_method')
+    set_default_wifi_password = planned('set_default_wifi_password')
+    set_default_wifi_password_5ghz = planned('set_default_wifi_password_5ghz')
+    set_wifi_password = planned('set_wifi_password')
+    set_wpa_encryption = planned('set_wpa_encryption')
+    dhcp_control = planned('dhcp_control')
+    set_default_dhcp_address = planned('set_default_dhcp_address')
+    set_vpn_connection = planned('set_vpn_connection')
+    toggle_ssid_visibility = planned('toggle_ssid_visibility')
+    toggle_wan_connection = planned('toggle_wan_connection')
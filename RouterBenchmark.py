@@ -0,0 +1,445 @@
+#!/usr/bin/python3
+'''
+Benchmark every RouterSetting operation end to end and per phase.
+
+Each operation runs N times on one session. Wall time is split into the phases
+launch, navigation, lookup, form_fill, apply and confirmation by wrapping the
+browser (selenium backend) or the transport (http and ssh backends), and
+p50/p95/p99 are written as JSON so releases and transports can be compared.
+
+With --cold-start every run is a fresh Python process instead, split into the
+phases interpreter, import, launch, sign_in and operation, to track start-up cost.
+
+    python RouterBenchmark.py --mock --backend http selenium --iterations 20 --output bench.json
+    python RouterBenchmark.py --mock --backend http --cold-start --operations reboot set_band_and_ssid
+'''
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import ConstantName as CN
+import RouterConfig as routerconfig
+from RouterMemory import PeakMemory
+
+
+PHASES = ('launch', 'navigation', 'lookup', 'form_fill', 'apply', 'confirmation', 'other')
+COLD_START_PHASES = ('interpreter', 'import', 'launch', 'sign_in', 'operation')
+# Modules reported as loaded (or not) by a cold start.
+HEAVY_MODULES = ('selenium.webdriver', 'pandas', 'requests', 'paramiko', 'VpnCatalog')
+
+# Runs in a fresh interpreter: import Router, launch, sign in and run one operation.
+COLD_START_SCRIPT = '''
+import json, sys, time
+start = time.perf_counter()
+params = json.loads(sys.argv[1])
+import RouterConfig as routerconfig
+routerconfig.hardware['HARDWAREINFO']['IP'] = params['ip']
+from Router import RouterSetting
+imported = time.perf_counter()
+router = RouterSetting(params['device'], backend=params['backend'], session=False)
+launched = time.perf_counter()
+router.sign_in(params['username'], params['password'])
+signed_in = time.perf_counter()
+error = None
+try:
+    getattr(router, params['operation'])(*params['args'])
+except Exception as err:
+    error = type(err).__name__
+done = time.perf_counter()
+router.close()
+sys.stdout.write('\\n' + json.dumps({
+    'phases': {'import': imported - start, 'launch': launched - imported, 'sign_in': signed_in - launched,
+               'operation': done - signed_in},
+    'total': done - start,
+    'modules': [name for name in params['modules'] if name in sys.modules],
+    'error': error,
+}) + '\\n')
+'''
+
+BENCH_SSID = 'bench_ssid'
+BENCH_PASSWORD = 'abcd1234'
+BENCH_MAC = 'AA:BB:CC:DD:EE:01'
+
+OPERATIONS = [
+    ('set_band_and_ssid', (CN.ROUTER_2GHZ, BENCH_SSID)),
+    ('set_channel_no', (CN.ROUTER_5GHZ, '153')),
+    ('set_default_channel_no', ()),
+    ('set_default_channel_no_5ghz', ()),
+    ('set_authentication_method', (CN.ROUTER_2GHZ, CN.ROUTER_WPA2PERSONAL)),
+    ('set_default_authentication_method', ()),
+    ('set_default_authentication_method_5ghz', ()),
+    ('set_wifi_password', (CN.ROUTER_2GHZ, CN.ROUTER_WPA2PERSONAL, BENCH_PASSWORD)),
+    ('set_default_wifi_password', (BENCH_PASSWORD,)),
+    ('set_default_wifi_password_5ghz', (BENCH_PASSWORD,)),
+    ('set_wpa_encryption', (CN.ROUTER_2GHZ, CN.ROUTER_WPAAUTOPERSONAL, CN.ROUTER_AES)),
+    ('dhcp_control', (True, '192.168.1.20', '192.168.1.100')),
+    ('set_default_dhcp_address', ()),
+    ('toggle_ssid_visibility', (CN.ROUTER_2GHZ, 'visible')),
+    ('toggle_wan_connection', ('on',)),
+    ('set_bandwidth_limit', (BENCH_MAC, 50, 25)),
+    ('remove_bandwidth_limit', ()),
+    ('set_vpn_connection', (CN.ROUTER_PPTP, 'FRANCE', 'vpnuser', 'vpnpass')),
+    ('reboot', ()),
+    ('reset_router', (BENCH_SSID, BENCH_SSID + '_5G', BENCH_PASSWORD, BENCH_PASSWORD,
+                      CN.ROUTER_DEFAULT_USERNAME, CN.ROUTER_DEFAULT_PASSWORD)),
+]
+
+# Take the router down; only run when asked for by name.
+DISRUPTIVE = ('reboot', 'reset_router')
+
+# Locators whose click submits a change or opens a page.
+APPLY_LOCATORS = (CN.APPLY_BUTTON, CN.APPLY, CN.DHCP_APPLY, CN.WAN_APPLY, CN.ACTIVATE_VPN, CN.VPN_OK_BUTTON,
+                  CN.REBOOT_BUTTON, CN.UPLOAD_FILE, CN.SIGN_IN_BUTTON)
+NAVIGATION_LOCATORS = (CN.WIRELESS_MENU, CN.LAN_MENU, CN.DHCP_SERVER, CN.BANDWIDTH_MENU, CN.QOS, CN.VPN_TAB,
+                       CN.VPN_CLIENT, CN.ADD_PROFILE, CN.WAN_MENU, CN.PPTP, CN.L2TP, CN.OPENVPN)
+
+
+def percentile(values, pct):
+    '''
+    Summary:
+        Linear-interpolated percentile of a list of numbers.
+    '''
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(values):
+    return {
+        'count': len(values),
+        'mean': sum(values) / len(values) if values else None,
+        'p50': percentile(values, 50),
+        'p95': percentile(values, 95),
+        'p99': percentile(values, 99),
+        'max': max(values) if values else None,
+    }
+
+
+class PhaseTimer(object):
+    '''
+    Attributes wall time to phases. Entering a phase closes the running segment,
+    so waits between driver calls (eg. WebDriverWait polling) count towards the
+    phase of the call that started them.
+    '''
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.phases = dict((phase, 0.0) for phase in PHASES)
+        self.current = 'other'
+        self.mark = time.perf_counter()
+
+    def enter(self, phase):
+        now = time.perf_counter()
+        self.phases[self.current] += now - self.mark
+        self.current = phase
+        self.mark = now
+
+    def stop(self):
+        self.enter('other')
+        return dict(self.phases)
+
+
+class PhaseElement(object):
+    def __init__(self, element, locator, timer):
+        self._element = element
+        self._locator = locator
+        self._timer = timer
+
+    def click(self):
+        if self._locator in APPLY_LOCATORS:
+            self._timer.enter('apply')
+        elif self._locator in NAVIGATION_LOCATORS:
+            self._timer.enter('navigation')
+        else:
+            self._timer.enter('form_fill')
+        return self._element.click()
+
+    def send_keys(self, *value):
+        self._timer.enter('form_fill')
+        return self._element.send_keys(*value)
+
+    def clear(self):
+        self._timer.enter('form_fill')
+        return self._element.clear()
+
+    def find_element(self, *args, **kwargs):
+        self._timer.enter('lookup')
+        return PhaseElement(self._element.find_element(*args, **kwargs), None, self._timer)
+
+    def find_elements(self, *args, **kwargs):
+        self._timer.enter('lookup')
+        return [PhaseElement(element, None, self._timer) for element in self._element.find_elements(*args, **kwargs)]
+
+    def __getattr__(self, name):
+        return getattr(self._element, name)
+
+
+class PhaseBrowser(object):
+    '''
+    Wraps a WebDriver and tags every command with a benchmark phase.
+    Scripts run by RouterWait.fill_form and verify_form count as form_fill and confirmation.
+    '''
+    def __init__(self, browser, timer):
+        from RouterWait import FILL_SCRIPT, STATE_SCRIPT
+
+        self._browser = browser
+        self._timer = timer
+        self._scripts = {FILL_SCRIPT: 'form_fill', STATE_SCRIPT: 'confirmation'}
+
+    def __getattr__(self, name):
+        attribute = getattr(self._browser, name)
+        if name.startswith('find_element'):
+            def find(*args, **kwargs):
+                self._timer.enter('lookup')
+                found = attribute(*args, **kwargs)
+                locator = args[-1] if args else None
+                if isinstance(found, list):
+                    return [PhaseElement(element, locator, self._timer) for element in found]
+                return PhaseElement(found, locator, self._timer)
+            return find
+        if name == 'execute_script':
+            def execute(script, *args):
+                self._timer.enter(self._scripts.get(script, 'navigation'))
+                return attribute(script, *args)
+            return execute
+        if name in ('get', 'refresh', 'back'):
+            self._timer.enter('navigation')
+        elif name == 'switch_to':
+            self._timer.enter('confirmation')
+        return attribute
+
+
+class PhaseTransport(object):
+    '''
+    Wraps a direct transport and tags every call with a benchmark phase.
+    '''
+    PHASE = {'sign_in': 'navigation', 'read': 'lookup', 'upload': 'form_fill', 'submit': 'apply'}
+
+    def __init__(self, transport, timer):
+        self._transport = transport
+        self._timer = timer
+
+    def __getattr__(self, name):
+        attribute = getattr(self._transport, name)
+        if name in self.PHASE:
+            self._timer.enter(self.PHASE[name])
+        return attribute
+
+
+def run_backend(backend, operations, iterations, username, password, device=None, memory=True):
+    '''
+    Summary:
+        Benchmark a list of operations on one backend.
+
+    Description:
+        1) Time the RouterSetting launch and sign in.
+        2) Run every operation iterations times and record total and per-phase wall time.
+        3) Record the peak resident memory (bytes) of every run, unless memory is False.
+
+    Args:
+        backend: (Type: String) selenium, http or ssh
+        operations: (Type: List) (method name, args) pairs
+        iterations: (Type: Integer) Runs per operation
+        username: (Type: String) Router username
+        password: (Type: String) Router password
+        device: (Type: String) orangepi or pc (selenium only)
+        memory: (Type: Boolean) Sample the peak resident memory of every run
+
+    Returns:
+        (Type: Dict) Results per operation
+    '''
+    from Router import RouterSetting
+
+    timer = PhaseTimer()
+    peak = PeakMemory() if memory else None
+    results = {}
+
+    start = time.perf_counter()
+    timer.enter('launch')
+    with peak or contextlib.nullcontext():
+        router = RouterSetting(device, backend=backend, session=False)
+    launch = time.perf_counter() - start
+    timer.stop()
+    results['launch'] = {'total': summarize([launch]), 'phases': {'launch': summarize([launch])}, 'errors': {},
+                         'memory': summarize([peak.peak] if peak and peak.peak else [])}
+
+    if router.transport.direct:
+        router.transport = router.form.transport = PhaseTransport(router.transport, timer)
+    else:
+        router.browser = router.wait.browser = PhaseBrowser(router.browser, timer)
+
+    try:
+        for name, args in [('sign_in', (username, password))] + list(operations):
+            totals, phases, errors, peaks = [], dict((phase, []) for phase in PHASES), {}, []
+            for iteration in range(1 if name == 'sign_in' else iterations):
+                timer.reset()
+                start = time.perf_counter()
+                with peak or contextlib.nullcontext():
+                    try:
+                        getattr(router, name)(*args)
+                    except Exception as err:
+                        errors[type(err).__name__] = errors.get(type(err).__name__, 0) + 1
+                totals.append(time.perf_counter() - start)
+                for phase, value in timer.stop().items():
+                    phases[phase].append(value)
+                if peak and peak.peak:
+                    peaks.append(peak.peak)
+            results[name] = {
+                'total': summarize(totals),
+                'phases': dict((phase, summarize(values)) for phase, values in phases.items() if any(values)),
+                'errors': errors,
+                'memory': summarize(peaks),
+            }
+    finally:
+        router.close()
+    return results
+
+
+def cold_start(backend, operation, args, iterations, username, password, device=None):
+    '''
+    Summary:
+        Benchmark the cold start of one operation.
+
+    Description:
+        1) Run the operation iterations times, each in a new Python process.
+        2) Split every run into interpreter start-up, import of Router, launch, sign in and the operation.
+
+    Args:
+        backend: (Type: String) selenium, http or ssh
+        operation: (Type: String) RouterSetting method name
+        args: (Type: Tuple) Arguments of the operation
+        iterations: (Type: Integer) Runs of the operation
+        username: (Type: String) Router username
+        password: (Type: String) Router password
+        device: (Type: String) orangepi or pc (selenium only)
+
+    Returns:
+        (Type: Dict) Total and per-phase summary, heavy modules loaded and errors
+    '''
+    params = json.dumps({'ip': routerconfig.hardware['HARDWAREINFO']['IP'], 'backend': backend, 'device': device,
+                         'username': username, 'password': password, 'operation': operation, 'args': list(args),
+                         'modules': HEAVY_MODULES})
+    totals, phases, modules, errors = [], dict((phase, []) for phase in COLD_START_PHASES), set(), {}
+    for iteration in range(iterations):
+        start = time.perf_counter()
+        child = subprocess.run([sys.executable, '-c', COLD_START_SCRIPT, params], stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE, universal_newlines=True,
+                               cwd=os.path.dirname(os.path.abspath(__file__)))
+        total = time.perf_counter() - start
+        try:
+            result = json.loads(child.stdout.strip().splitlines()[-1])
+        except (IndexError, ValueError):
+            error = child.stderr.strip().splitlines()[-1] if child.stderr.strip() else 'exit %d' % child.returncode
+            errors[error] = errors.get(error, 0) + 1
+            continue
+        totals.append(total)
+        phases['interpreter'].append(total - result['total'])
+        for phase, value in result['phases'].items():
+            phases[phase].append(value)
+        modules.update(result['modules'])
+        if result['error']:
+            errors[result['error']] = errors.get(result['error'], 0) + 1
+    return {
+        'total': summarize(totals),
+        'phases': dict((phase, summarize(values)) for phase, values in phases.items() if values),
+        'modules': sorted(modules),
+        'errors': errors,
+    }
+
+
+def report(backend, results):
+    print("\n== {} ==".format(backend))
+    print("{:<40}{:>10}{:>10}{:>10}{:>10}  {}".format('operation', 'p50 (s)', 'p95 (s)', 'p99 (s)', 'peak (MB)',
+                                                      'slowest phase'))
+    for name, result in results.items():
+        total = result['total']
+        if not total['count']:
+            print("{:<40}{:>10}{:>10}{:>10}{:>10}  -  errors: {}".format(name, '-', '-', '-', '-', result['errors']))
+            continue
+        slowest = max(result['phases'].items(), key=lambda item: item[1]['p50'] or 0)[0] if result['phases'] else '-'
+        memory = result.get('memory') or {}
+        print("{:<40}{:>10.3f}{:>10.3f}{:>10.3f}{:>10}  {}{}{}".format(
+            name, total['p50'], total['p95'], total['p99'],
+            '%.0f' % (memory['max'] / (1024 * 1024)) if memory.get('max') else '-', slowest,
+            '  loaded: %s' % ', '.join(result['modules']) if result.get('modules') else '',
+            '  errors: %s' % result['errors'] if result['errors'] else ''))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark RouterSetting operations')
+    parser.add_argument('--backend', nargs='+', default=[CN.ROUTER_BACKEND_SELENIUM],
+                        help='one or more of selenium, http, ssh')
+    parser.add_argument('--device', default=None, help='orangepi or pc (selenium backend)')
+    parser.add_argument('--iterations', type=int, default=10)
+    parser.add_argument('--operations', nargs='+', default=None,
+                        help='operation names to run. Default: all except %s' % ', '.join(DISRUPTIVE))
+    parser.add_argument('--username', default=routerconfig.hardware['HARDWAREINFO']['USERNAME'] or CN.ROUTER_DEFAULT_USERNAME)
+    parser.add_argument('--password', default=routerconfig.hardware['HARDWAREINFO']['PASSWORD'] or CN.ROUTER_DEFAULT_PASSWORD)
+    parser.add_argument('--mock', action='store_true', help='run against a local RouterMock instead of the configured router')
+    parser.add_argument('--mock-page-latency', type=float, default=0)
+    parser.add_argument('--mock-apply-latency', type=float, default=0)
+    parser.add_argument('--cold-start', action='store_true',
+                        help='run every iteration in a fresh Python process and report start-up phases')
+    parser.add_argument('--no-memory', action='store_true', help='do not sample the peak resident memory of every run')
+    parser.add_argument('--output', default=None, help='write the results as JSON to this file')
+    args = parser.parse_args(argv)
+
+    known = dict(OPERATIONS)
+    if args.operations:
+        unknown = [name for name in args.operations if name not in known]
+        if unknown:
+            parser.error('unknown operations: %s' % ', '.join(unknown))
+        operations = [(name, known[name]) for name in args.operations]
+    else:
+        operations = [(name, params) for name, params in OPERATIONS if name not in DISRUPTIVE]
+
+    mock = None
+    if args.mock:
+        from RouterMock import MockRouter
+        mock = MockRouter(port=0, username=args.username, password=args.password,
+                          page_latency=args.mock_page_latency, apply_latency=args.mock_apply_latency).start()
+        routerconfig.hardware['HARDWAREINFO']['IP'] = mock.address
+
+    output = {
+        'router': routerconfig.hardware['HARDWAREINFO']['IP'],
+        'mock': args.mock,
+        'cold_start': args.cold_start,
+        'iterations': args.iterations,
+        'started': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'backends': {},
+    }
+    try:
+        for backend in args.backend:
+            if args.cold_start:
+                output['backends'][backend] = dict(
+                    (name, cold_start(backend, name, params, args.iterations, args.username, args.password, args.device))
+                    for name, params in operations)
+            else:
+                output['backends'][backend] = run_backend(backend, operations, args.iterations,
+                                                          args.username, args.password, args.device,
+                                                          not args.no_memory)
+            report(backend, output['backends'][backend])
+    finally:
+        if mock is not None:
+            mock.stop()
+
+    if args.output:
+        with open(args.output, 'w') as result_file:
+            json.dump(output, result_file, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,224 @@
+#!/usr/bin/python3
+'''
+Command line interface of RouterSetting.
+
+Every operation is a subcommand; the router is given with --router (default
+RouterConfig) or a whole lab with --inventory (see RouterFleet.load_inventory).
+
+    python RouterCli.py ssid --band 5GHz --name iptv_hariz
+    python RouterCli.py --backend http --json vpn --type OpenVPN --country FRANCE --username u --password p
+    python RouterCli.py --inventory lab.json --workers 16 channel --band 2.4GHz --channel 6
+    python RouterCli.py --inventory lab.json playbook --file nightly.yaml
+
+Exit codes: 0 every router succeeded, 1 an operation or login failed, 2 usage error.
+With --json the results are printed as JSON; progress is logged in the event log (stderr by default).
+'''
+import argparse
+import json
+import sys
+
+import ConstantName as CN
+import RouterConfig as routerconfig
+
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+
+BANDS = (CN.ROUTER_2GHZ, CN.ROUTER_5GHZ)
+AUTH_TYPES = tuple(CN.ROUTER_AUTH_MODE)
+VPN_TYPES = tuple(CN.ROUTER_VPN_PROTO)
+
+# Subcommand: (help, arguments as (flags, add_argument options), steps built from the parsed arguments)
+COMMANDS = [
+    ('login', 'sign in only, to check the router is reachable and the credentials', [],
+     lambda args: []),
+    ('reboot', 'reboot the router and wait until it is back', [],
+     lambda args: [('reboot', ())]),
+    ('ssid', 'set the SSID of a band', [
+        ('--band', dict(required=True, choices=BANDS)),
+        ('--name', dict(required=True))],
+     lambda args: [('set_band_and_ssid', (args.band, args.name))]),
+    ('channel', 'set the control channel of a band', [
+        ('--band', dict(required=True, choices=BANDS)),
+        ('--channel', dict(default=CN.DEFAULT_CHANNEL, help="channel number or Auto (default)"))],
+     lambda args: [('set_channel_no', (args.band, args.channel))]),
+    ('auth', 'set the authentication method of a band', [
+        ('--band', dict(required=True, choices=BANDS)),
+        ('--type', dict(default=CN.DEFAULT_AUTHMETHOD, choices=AUTH_TYPES))],
+     lambda args: [('set_authentication_method', (args.band, args.type))]),
+    ('wifi-password', 'set the WiFi password of a band', [
+        ('--band', dict(required=True, choices=BANDS)),
+        ('--auth', dict(default=CN.DEFAULT_AUTHMETHOD, choices=(CN.ROUTER_WPA2PERSONAL, CN.ROUTER_WPAAUTOPERSONAL))),
+        ('--password', dict(required=True, dest='wifi_password'))],
+     lambda args: [('set_wifi_password', (args.band, args.auth, args.wifi_password))]),
+    ('encryption', 'set the WPA encryption of a band', [
+        ('--band', dict(required=True, choices=BANDS)),
+        ('--auth', dict(default=CN.DEFAULT_AUTHMETHOD, choices=(CN.ROUTER_WPA2PERSONAL, CN.ROUTER_WPAAUTOPERSONAL))),
+        ('--type', dict(required=True, choices=tuple(CN.ROUTER_CRYPTO)))],
+     lambda args: [('set_wpa_encryption', (args.band, args.auth, args.type))]),
+    ('visibility', 'show or hide the SSID of a band', [
+        ('--band', dict(required=True, choices=BANDS)),
+        ('--state', dict(required=True, choices=('visible', 'hide')))],
+     lambda args: [('toggle_ssid_visibility', (args.band, args.state))]),
+    ('dhcp', 'configure the DHCP server', [
+        ('--disable', dict(action='store_true')),
+        ('--start', dict(default=CN.DEFAULT_STARTING_ADDRESS)),
+        ('--end', dict(default=CN.DEFAULT_ENDING_ADDRESS))],
+     lambda args: [('dhcp_control', (not args.disable, args.start, args.end))]),
+    ('wan', 'connect or disconnect the WAN', [
+        ('--state', dict(required=True, choices=('on', 'off')))],
+     lambda args: [('toggle_wan_connection', (args.state,))]),
+    ('bandwidth', 'limit the bandwidth of a device', [
+        ('--mac', dict(required=True)),
+        ('--download', dict(required=True, type=int, help='Mbps')),
+        ('--upload', dict(required=True, type=int, help='Mbps'))],
+     lambda args: [('set_bandwidth_limit', (args.mac, args.download, args.upload))]),
+    ('bandwidth-remove', 'remove every bandwidth limit', [],
+     lambda args: [('remove_bandwidth_limit', ())]),
+    ('vpn', 'connect a VPN client', [
+        ('--type', dict(required=True, choices=VPN_TYPES)),
+        ('--country', dict(required=True)),
+        ('--username', dict(required=True, dest='vpn_username')),
+        ('--password', dict(required=True, dest='vpn_password'))],
+     lambda args: [('set_vpn_connection', (args.type, args.country, args.vpn_username, args.vpn_password))]),
+    ('reset', 'restore factory defaults, then set SSIDs, WiFi passwords and the router account', [
+        ('--ssid', dict(required=True)),
+        ('--ssid-5', dict(required=True)),
+        ('--wifi-password', dict(required=True)),
+        ('--wifi-password-5', dict(required=True)),
+        ('--new-username', dict(required=True)),
+        ('--new-password', dict(required=True))],
+     lambda args: [('reset_router', (args.ssid, args.ssid_5, args.wifi_password, args.wifi_password_5,
+                                     args.new_username, args.new_password))]),
+    ('playbook', 'run a YAML or JSON playbook of operations on one session (see RouterPlaybook)', [
+        ('--file', dict(required=True, dest='playbook')),
+        ('--on-error', dict(default=CN.ROUTER_PLAYBOOK_STOP, choices=(CN.ROUTER_PLAYBOOK_STOP, CN.ROUTER_PLAYBOOK_CONTINUE),
+                            help='policy of the steps when the playbook sets none'))],
+     lambda args: [playbook(args.playbook, args.on_error).run]),
+    ('reconcile', 'bring the router to the desired state of a JSON file, applying only what differs', [
+        ('--state', dict(required=True, help='JSON file, see RouterSetting.reconcile'))],
+     lambda args: [('reconcile', (load_json(args.state),))]),
+]
+
+
+def playbook(filename, on_error):
+    from RouterPlaybook import RouterPlaybook
+
+    return RouterPlaybook(filename, on_error)
+
+
+def load_json(filename):
+    with open(filename) as json_file:
+        return json.load(json_file)
+
+
+def parser():
+    info = routerconfig.hardware['HARDWAREINFO']
+    cli = argparse.ArgumentParser(prog='router', description='Configure ASUS routers without prompts')
+    target = cli.add_mutually_exclusive_group()
+    target.add_argument('--router', default=None, help='router IP address. Default RouterConfig IP')
+    target.add_argument('--inventory', default=None, help='JSON inventory of routers, run on all of them')
+    cli.add_argument('--backend', default=None, choices=(CN.ROUTER_BACKEND_SELENIUM, CN.ROUTER_BACKEND_HTTP,
+                                                         CN.ROUTER_BACKEND_SSH),
+                     help='transport to the router. Default RouterConfig BACKEND')
+    cli.add_argument('--device', default=None, help='orangepi or pc (selenium backend)')
+    cli.add_argument('--username', default=info['USERNAME'] or CN.ROUTER_DEFAULT_USERNAME)
+    cli.add_argument('--password', default=info['PASSWORD'] or CN.ROUTER_DEFAULT_PASSWORD)
+    cli.add_argument('--no-session', action='store_true', help='always sign in instead of resuming the stored session')
+    cli.add_argument('--workers', type=int, default=CN.ROUTER_FLEET_WORKERS, help='routers configured at a time')
+    cli.add_argument('--timeout', type=float, default=CN.ROUTER_FLEET_TIMEOUT, help='seconds allowed per router')
+    cli.add_argument('--json', action='store_true', help='print the results as JSON')
+    cli.add_argument('--trace', default=None, metavar='FILE',
+                     help='write a trace of every operation and WebDriver command (Perfetto, chrome://tracing)')
+    cli.add_argument('--metrics', default=None, metavar='FILE',
+                     help='write Prometheus metrics of the run (node_exporter textfile collector)')
+    cli.add_argument('--events', default=None, metavar='FILE',
+                     help="append the JSON event log to FILE ('-' for stderr, the default)")
+    commands = cli.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+    for name, description, arguments, steps in COMMANDS:
+        command = commands.add_parser(name, help=description, description=description)
+        for flag, options in arguments:
+            command.add_argument(flag, **options)
+        command.set_defaults(steps=steps)
+    return cli
+
+
+def inventory(args):
+    from RouterFleet import load_inventory, router_hardware
+
+    if args.inventory:
+        return load_inventory(args.inventory)
+    ip = args.router or routerconfig.hardware['HARDWAREINFO']['IP']
+    if ip is None:
+        raise ValueError("No router given: use --router, --inventory or RouterConfig ['HARDWAREINFO']['IP']")
+    return {ip: router_hardware(ip, username=args.username, password=args.password,
+                                device=args.device or routerconfig.hardware['HARDWAREINFO']['DEVICE'])}
+
+
+def serialize(value):
+    if hasattr(value, '_asdict'):
+        return dict((name, serialize(item)) for name, item in value._asdict().items())
+    if isinstance(value, dict):
+        return dict((str(name), serialize(item)) for name, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return [serialize(item) for item in value]
+    return value
+
+
+def main(argv=None):
+    '''
+    Summary:
+        Run one subcommand on the router (or every router of the inventory).
+
+    Returns:
+        (Type: Integer) Exit code: 0 success, 1 operation or login failed, 2 usage error
+    '''
+    cli = parser()
+    args = cli.parse_args(argv)
+    try:
+        routers = inventory(args)
+        steps = args.steps(args)
+    except (OSError, ValueError, KeyError, ImportError) as err:
+        cli.print_usage(sys.stderr)
+        print("router: error: %s" % err, file=sys.stderr)
+        return EXIT_USAGE
+
+    from RouterFleet import RouterFleet
+
+    if args.events:
+        from RouterEvents import EVENTS
+
+        EVENTS.target = args.events
+    tracer = None
+    if args.trace:
+        from RouterTrace import RouterTracer
+
+        tracer = RouterTracer(args.trace)
+    fleet = RouterFleet(routers, workers=args.workers, timeout=args.timeout, backend=args.backend,
+                        session=not args.no_session, tracer=tracer)
+    results = fleet.batch(steps, transaction=len(steps) > 1)
+    if tracer is not None:
+        print("Trace written to %s" % tracer.save(), file=sys.stderr)
+    if args.metrics:
+        from RouterMetrics import METRICS
+
+        METRICS.write_textfile(args.metrics)
+    if args.json:
+        document = [dict(serialize(result), command=args.command) for result in results]
+        json.dump(document if args.inventory else document[0], sys.stdout, indent=2, default=str)
+        sys.stdout.write('\n')
+    else:
+        if args.command == 'playbook':
+            from RouterPlaybook import RouterPlaybook
+
+            for result in results:
+                if result.result is not None:
+                    print("== %s ==\n%s\n" % (result.router, RouterPlaybook.table(result.result)))
+        print(fleet.table(results))
+    return EXIT_OK if all(result.success for result in results) else EXIT_FAILED
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,47 +1,49 @@
-hardware = {
-    'CATEGORY': 'Router',
-    'DEVICE': 'asus',
-
-#==============================
-# Regarding the  SSID and WIFIPASSWORD, please follow this format:-
-# SSID:- (all in lowercase)
-# [DeptName] + Underscore + Owner/Tester
-# eg: iptv_hariz
-# WIFIPASSWORD:- please combine alphabet and number
-# eg: abcd1234
-#==============================
-    'HARDWAREINFO': {
-        'IP': None,
-        'USERNAME': None,
-        'PASSWORD': None,
-        'DEVICE': 'orangepi',
-	    'COMPORT': None,
-	    'BAUDRATE': None,
-	    'TVMAC':{
-                'WIRED': None,
-                'WIRELESS': None,
-
-        },
-        'SSID':{
-                '2.4': None,
-                '5': None,
-        },
-        'WIFIPASSWORD':{
-                '2.4': None,
-                '5': None,
-        },
-	    'STARTADDRESS': '192.168.1.2',
-	    'ENDADDRESS': '192.168.1.254',
-	    
-    },
-
-    'IPPOWER':{ 
-                'SWITCH':{
-                            'USERNAME': None,
-                            'PASSWORD': None,
-                            'IP': None
-                        }
-    }
-
-}
-
+hardware = {
+    'CATEGORY': 'Router',
+    'DEVICE': 'asus',
+
+#==============================
+# Regarding the  SSID and WIFIPASSWORD, please follow this format:-
+# SSID:- (all in lowercase)
+# [DeptName] + Underscore + Owner/Tester
+# eg: iptv_hariz
+# WIFIPASSWORD:- please combine alphabet and number
+# eg: abcd1234
+# BACKEND:- selenium, http or ssh
+#==============================
+    'HARDWAREINFO': {
+        'IP': None,
+        'USERNAME': None,
+        'PASSWORD': None,
+        'DEVICE': 'orangepi',
+        'BACKEND': 'selenium',
+	    'COMPORT': None,
+	    'BAUDRATE': None,
+	    'TVMAC':{
+                'WIRED': None,
+                'WIRELESS': None,
+
+        },
+        'SSID':{
+                '2.4': None,
+                '5': None,
+        },
+        'WIFIPASSWORD':{
+                '2.4': None,
+                '5': None,
+        },
+	    'STARTADDRESS': '192.168.1.2',
+	    'ENDADDRESS': '192.168.1.254',
+	    
+    },
+
+    'IPPOWER':{ 
+                'SWITCH':{
+                            'USERNAME': None,
+                            'PASSWORD': None,
+                            'IP': None
+                        }
+    }
+
+}
+
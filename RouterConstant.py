@@ -0,0 +1,291 @@
+'''
+This is the RouterConstant.py file for Pyhton 3
+'''
+
+'''
+Router API constants (web UI selectors, pages and settings of the router).
+Loaded through ConstantName, eg. CN.LISTCOUNTRYVPN
+'''
+from ConstantGeneral import *
+
+#---------------
+# Router API
+#---------------
+
+LISTCOUNTRYVPN = r'/root/RouterAPI/ListCountriesVPN.txt'
+LISTOPENVPN = r'/root/RouterAPI/OpenVPN.txt'
+DIROPENVPN = r'/root/RouterAPI/OpenVPN'
+# VPN list columns a name is looked up in, in this order.
+VPN_INDEX_COLUMNS = ('Country', 'City', 'VpnServer')
+VPN_FUZZY_CUTOFF = 0.8
+# The VPN lists are saved by Excel on Windows (eg. 'Niš' in ListCountriesVPN.txt).
+VPN_LIST_ENCODING = 'cp1252'
+ROUTER_REBOOT = '1'
+ROUTER_ADDBANDWIDTH = '2'
+ROUTER_REMOVEBANDWIDTH = '3'
+ROUTER_SSID = '4'
+ROUTER_DEFAULTCHANNEL = '5'
+ROUTER_DEFAULTCHANNEL5GHZ = '6'
+ROUTER_CHANNELSETTING = '7'
+ROUTER_DEFAULTAUTH = '8'
+ROUTER_DEFAULTAUTH5GHZ = '9'
+ROUTER_AUTHMETHOD = '10'
+ROUTER_DEFAULTWIFIPASSWORD = '11'
+ROUTER_DEFAULTWIFIPASSWORD5GHZ = '12'
+ROUTER_WIFIPASSWORD = '13'
+ROUTER_WPATYPE = '14'
+ROUTER_DHCP = '15'
+ROUTER_DEFAULTDHCP = '16'
+ROUTER_VPN = '17'
+ROUTER_TOGGLESSIDVISIBILITY = '18'
+ROUTER_TOGGLEWANCONNECTION = '19'
+ROUTER_RESET = '20'
+
+ROUTER_DELAY6MIN = 360
+ROUTER_DELAY5MIN = 300
+ROUTER_DELAY30SEC = 30
+ROUTER_DELAY20SEC = 20
+ROUTER_DELAY10SEC = 10
+ROUTER_DELAY2SEC = 2
+
+ROUTER_5GHZ = '5GHz'
+ROUTER_2GHZ = '2.4GHz'
+
+ROUTER_WPA2PERSONAL = 'WPA2-Personal'
+ROUTER_WPAAUTOPERSONAL = 'WPA-Auto-Personal'
+
+ROUTER_PPTP = 'PPTP'
+ROUTER_L2TP = 'L2TP'
+ROUTER_OPENVPN = 'OpenVPN'
+
+ROUTER_WIRED = 'wired'
+ROUTER_WIRELESS = 'wireless'
+
+ROUTERURL = "http://192.168.1.1/Main_Login.asp"
+CHROME = "chrome"
+FIREFOX = "firefox"
+
+# =====Sign In Keywords=====
+LOGIN_USER = "login_username"
+LOGIN_PASS = "login_passwd"
+LOGIN_ERROR = "error_status_field"
+MAIN_MENU = "mainMenu"
+SIGN_IN_BUTTON = "button"
+REBOOT_BUTTON = '//span[contains(text(),\'Reboot\')]'
+
+# =====QoS Keywords=====
+ADAPTIVE_QOS = "_AdaptiveQoS_Bandwidth_Monitor"
+BANDWIDTH_MENU = '//*[@id="AdaptiveQoS_Bandwidth_Monitor_menu"]/table/tbody/tr/td[2]'
+QOS = '//*[@id="QoS_EZQoS_tab"]/span'
+DOWNLOAD_RATE = "download_rate"
+UPLOAD_RATE = "upload_rate"
+ADD_DELETE_DEVICE = "add_delete"
+PULL_DOWN_MENU = "pull_arrow"
+APPLY = '//span[contains(text(),\'Apply\')]'
+TABLE_INFO = '//*[@id="mainTable_table"]/tbody/tr[3]/td'
+REMOVE_BANDWIDTH = '//*[@id="mainTable_table"]/tbody/tr[3]/td[5]/div'
+
+# =====Wireless Keywords =====
+WIRELESS_MENU = "Advanced_Wireless_Content_menu"
+LAN_MENU = "Advanced_LAN_Content_menu"
+BAND = 'select[name=wl_unit]'
+CHANNEL_BOX = 'select[name=wl_channel]'
+AUTH_BOX = 'select[name=wl_auth_mode_x]'
+ENCRYPTION_BOX = 'select[name=wl_crypto]'
+WPA_PRESHARED_KEY = "wl_wpa_psk"
+DHCP_SERVER = 'Advanced_DHCP_Content_tab'
+ENABLE_DHCP_SERVER = '//*[@id="FormTitle"]/tbody/tr/td/table[1]/tbody/tr[1]/td/input[1]'
+UNABLE_DHCP_SERVER = '//*[@id="FormTitle"]/tbody/tr/td/table[1]/tbody/tr[1]/td/input[2]'
+DHCP_STARTING = '//*[@id="FormTitle"]/tbody/tr/td/table[1]/tbody/tr[3]/td/input'
+DHCP_ENDING = '//*[@id="FormTitle"]/tbody/tr/td/table[1]/tbody/tr[4]/td/input'
+DHCP_APPLY = "//*[@id='FormTitle']/tbody/tr/td/div[9]/input"
+DEFAULT_BAND_TYPE_2 = "2.4GHz"
+DEFAULT_BAND_TYPE_5 = "5GHz"
+CONTROL_CHANNEL = "wl_channel"
+DEFAULT_CHANNEL = "Auto"
+DEFAULT_AUTHMETHOD = "WPA2-Personal"
+DEFAULT_STARTING_ADDRESS = "192.168.1.2"
+DEFAULT_ENDING_ADDRESS = "192.168.1.254"
+DEFAULT_PASSWORD = "admin123"
+BAND24GHZ = "span0"
+BAND5GHZ = "span1"
+SSIDNAME = "wl_ssid"
+APPLYBUTTON = "applySecurity"
+APPLY_BUTTON = "applyButton"
+
+# =====VPN SETTINGS Keywords =====
+VPN_TAB = "Advanced_VPN_PPTP_menu"
+VPN_CLIENT = '//span[contains(text(),\'VPN Client\')]'
+ADD_PROFILE = '//*[@id="FormTitle"]/tbody/tr/td/table/tbody/tr[2]/td/div[2]/input'
+PPTP = 'pptpcTitle_pptp'
+L2TP = 'l2tpcTitle_pptp'
+OPENVPN = 'opencTitle_pptp'
+DESC_BOX = '//*[@id="openvpnc_setting"]/table/tbody/tr[2]/td/div/table/tbody/tr[1]/td/input'
+SERVER_BOX = '//*[@id="openvpnc_setting"]/table/tbody/tr[2]/td/div/table/tbody/tr[2]/td/input'
+USERNAME_BOX = '//*[@id="openvpnc_setting"]/table/tbody/tr[2]/td/div/table/tbody/tr[3]/td/input'
+PASSWORD_BOX = '//*[@id="openvpnc_setting"]/table/tbody/tr[2]/td/div/table/tbody/tr[4]/td/input'
+OPENVPN_DESC_BOX = '//*[@id="openvpnc_setting_openvpn"]/table/tbody/tr[3]/td/div/table[1]/tbody/tr[1]/td/input'
+OPENVPN_USERNAME_BOX = '//*[@id="openvpnc_setting_openvpn"]/table/tbody/tr[3]/td/div/table[1]/tbody/tr[2]/td/input'
+OPENVPN_PASSWORD_BOX = '//*[@id="openvpnc_setting_openvpn"]/table/tbody/tr[3]/td/div/table[1]/tbody/tr[3]/td/input'
+CHOOSE_FILE = '//*[@id="openvpnc_setting_openvpn"]/table/tbody/tr[3]/td/div/table[1]/tbody/tr[4]/td/input[1]'
+UPLOAD_FILE = '//*[@id="openvpnc_setting_openvpn"]/table/tbody/tr[3]/td/div/table[1]/tbody/tr[4]/td/input[2]'
+ACTIVATE_VPN = ".button_gen[value='Activate']"
+CANCEL = ".button_gen[value='Cancel']"
+# DELETE_VPN = '//*[@id="vpnc_clientlist_table"]/table/tbody/tr/td[5]'
+DELETE_VPN = '//*[@id="vpnc_clientlist_Block"]/table/tbody/tr/td[5]/div'
+# DELETE_VPN = '//*[@id="row0"]/td[5]/input'
+VPN_OK_BUTTON = '.button_gen[value="OK"]'
+
+# =====SSID Visibility=====
+SSID_HIDE = '//*[@id="WLgeneral"]/tbody/tr[5]/td/input[1]'
+SSID_VISIBLE = '//*[@id="WLgeneral"]/tbody/tr[5]/td/input[2]'
+
+# =====WAN Connection=====
+WAN_MENU = '//*[@id="Advanced_WAN_Content_menu"]'
+WAN_ON = '//*[@id="t2BC"]/tbody/tr[2]/td/input[1]'
+WAN_OFF = '//*[@id="t2BC"]/tbody/tr[2]/td/input[2]'
+WAN_APPLY = '//*[@id="FormTitle"]/tbody/tr/td/div[7]/input'
+
+# =====Backends=====
+ROUTER_BACKEND_SELENIUM = 'selenium'
+ROUTER_BACKEND_HTTP = 'http'
+ROUTER_BACKEND_SSH = 'ssh'
+ROUTER_SSH_PORT = 22
+
+# =====HTTP Backend=====
+ROUTER_AES = 'AES'
+ROUTER_TKIPAES = 'TKIP+AES'
+ROUTER_OPENSYSTEM = 'Open System'
+
+ROUTER_LOGIN_PAGE = 'Main_Login.asp'
+ROUTER_INDEX_PAGE = 'index.asp'
+ROUTER_WIRELESS_PAGE = 'Advanced_Wireless_Content.asp'
+ROUTER_DHCP_PAGE = 'Advanced_DHCP_Content.asp'
+ROUTER_QOS_PAGE = 'QoS_EZQoS.asp'
+ROUTER_VPN_PAGE = 'Advanced_VPNClient_Content.asp'
+ROUTER_WAN_PAGE = 'Advanced_WAN_Content.asp'
+ROUTER_BACKUP_PAGE = 'Advanced_SettingBackup_Content.asp'
+ROUTER_LOGIN_CGI = 'login.cgi'
+ROUTER_APPLY_CGI = 'apply.cgi'
+ROUTER_APPGET_CGI = 'appGet.cgi'
+ROUTER_VPNUPLOAD_CGI = 'vpnupload.cgi'
+ROUTER_TOKEN_COOKIE = 'asus_token'
+ROUTER_USER_AGENT = 'asusrouter-Android-DUTUtil-1.0.0.245'
+ROUTER_HTTP_POOLSIZE = 4
+ROUTER_HTTP_TIMEOUT = 10
+ROUTER_DEFAULT_USERNAME = 'admin'
+ROUTER_DEFAULT_PASSWORD = 'admin'
+
+ROUTER_SERVICE_WIRELESS = 'restart_wireless'
+ROUTER_SERVICE_DHCP = 'restart_net_and_phy'
+ROUTER_SERVICE_QOS = 'restart_qos;restart_firewall'
+ROUTER_SERVICE_VPN = 'restart_vpncall'
+ROUTER_SERVICE_OPENVPN = 'restart_vpnclient1'
+ROUTER_SERVICE_WAN = 'restart_wan_if 0'
+ROUTER_ACTION_APPLY = 'apply'
+ROUTER_ACTION_REBOOT = 'reboot'
+ROUTER_ACTION_RESTORE = 'Restore'
+
+ROUTER_WL_UNIT = {ROUTER_2GHZ: '0', ROUTER_5GHZ: '1'}
+ROUTER_AUTH_MODE = {ROUTER_OPENSYSTEM: 'open', ROUTER_WPA2PERSONAL: 'psk2', ROUTER_WPAAUTOPERSONAL: 'pskpsk2'}
+ROUTER_CRYPTO = {ROUTER_AES: 'aes', ROUTER_TKIPAES: 'tkip+aes'}
+ROUTER_VPN_PROTO = {ROUTER_PPTP: 'pptp', ROUTER_L2TP: 'l2tp', ROUTER_OPENVPN: 'openvpn'}
+ROUTER_AUTO_CHANNEL = '0'
+# Fields that pick which band / VPN client a form edits, not settings of their own.
+ROUTER_SELECTOR_FIELDS = ('wl_unit', 'vpn_client_unit')
+# Fields never shown in reports.
+ROUTER_SECRET_MARKERS = ('psk', 'passw', 'clientlist')
+ROUTER_OPENVPN_UNIT = '1'
+# Router page every setter writes; adjacent playbook steps on the same page are applied together.
+ROUTER_OPERATION_PAGES = {
+    'set_band_and_ssid': ROUTER_WIRELESS_PAGE,
+    'set_default_channel_no': ROUTER_WIRELESS_PAGE,
+    'set_default_channel_no_5ghz': ROUTER_WIRELESS_PAGE,
+    'set_channel_no': ROUTER_WIRELESS_PAGE,
+    'set_default_authentication_method': ROUTER_WIRELESS_PAGE,
+    'set_default_authentication_method_5ghz': ROUTER_WIRELESS_PAGE,
+    'set_authentication_method': ROUTER_WIRELESS_PAGE,
+    'set_default_wifi_password': ROUTER_WIRELESS_PAGE,
+    'set_default_wifi_password_5ghz': ROUTER_WIRELESS_PAGE,
+    'set_wifi_password': ROUTER_WIRELESS_PAGE,
+    'set_wpa_encryption': ROUTER_WIRELESS_PAGE,
+    'toggle_ssid_visibility': ROUTER_WIRELESS_PAGE,
+    'dhcp_control': ROUTER_DHCP_PAGE,
+    'set_default_dhcp_address': ROUTER_DHCP_PAGE,
+    'set_bandwidth_limit': ROUTER_QOS_PAGE,
+    'set_bandwidth_rules': ROUTER_QOS_PAGE,
+    'remove_bandwidth_limit': ROUTER_QOS_PAGE,
+    'set_vpn_connection': ROUTER_VPN_PAGE,
+    'toggle_wan_connection': ROUTER_WAN_PAGE,
+}
+ROUTER_PLAYBOOK_STOP = 'stop'
+ROUTER_PLAYBOOK_CONTINUE = 'continue'
+# RouterSetting methods not exposed to playbooks and the daemon; they own the session and transactions.
+ROUTER_PRIVATE_OPERATIONS = ('close', 'transaction', 'sign_in')
+
+# =====Readiness Probe=====
+ROUTER_PROBE_INTERVAL = 0.5
+ROUTER_PROBE_MAX_INTERVAL = 5
+ROUTER_PROBE_DOWN_TIMEOUT = 60
+ROUTER_PROBE_SOCKET_TIMEOUT = 2
+
+# =====Explicit Waits=====
+ROUTER_TIMEOUT_ELEMENT = 10
+ROUTER_TIMEOUT_ALERT = 3
+ROUTER_TIMEOUT_PAGE = 30
+ROUTER_TIMEOUT_APPLY = 90
+ROUTER_WAIT_POLL = 0.1
+ROUTER_LOADING = 'Loading'
+OPENVPN_OK_BUTTON = "//*[@id='openvpnc_setting_openvpn']/div/input[2]"
+
+# =====Session Store=====
+ROUTER_SESSION_FILE = '.router_sessions.json'
+ROUTER_SESSION_SEPARATOR = '|'
+ROUTER_SESSION_CHECK = 'http_username'
+
+# =====Fleet=====
+ROUTER_FLEET_WORKERS = 8
+ROUTER_FLEET_TIMEOUT = 300
+ROUTER_FLEET_POLL = 0.5
+
+# =====Browser Pool=====
+ROUTER_POOL_SIZE = 2
+ROUTER_POOL_MAX_USES = 50
+ROUTER_POOL_MAX_MEMORY = 600 * 1024 * 1024
+ROUTER_POOL_LEASE_TIMEOUT = 60
+ROUTER_POOL_POLL = 1
+ROUTER_POOL_RETRY = 10
+
+# =====Low Memory Chrome=====
+ROUTER_CHROME_LOW_MEMORY = True
+ROUTER_CHROME_RENDERERS = 1
+ROUTER_CHROME_JS_HEAP = 128
+ROUTER_CHROME_TMPFS = '/dev/shm'
+ROUTER_CHROME_BLOCKED = ('*.css', '*.woff', '*.woff2', '*.ttf', '*.otf', '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.ico')
+ROUTER_MEMORY_SAMPLE = 0.1
+
+# =====Daemon=====
+ROUTER_DAEMON_HOST = '127.0.0.1'
+ROUTER_DAEMON_PORT = 8765
+ROUTER_DAEMON_JOBS = 1000
+ROUTER_DAEMON_WAIT = 300
+
+# =====Tracing=====
+ROUTER_TRACE_FILE = 'router.trace.json'
+
+# =====Metrics=====
+ROUTER_METRICS_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300)
+ROUTER_METRICS_DOWNTIME_BUCKETS = (10, 20, 30, 45, 60, 90, 120, 180, 240, 360)
+ROUTER_METRICS_FILE = 'router.prom'
+ROUTER_METRICS_PORT = 9108
+
+# =====Event Log=====
+# '-' for stderr, a file name to append to, or None to disable.
+ROUTER_EVENT_LOG = '-'
+ROUTER_EVENT_QUEUE = 10000
+ROUTER_EVENT_BATCH = 256
+ROUTER_EVENT_CLOSE_TIMEOUT = 5
+
+# =====Mock Router=====
+ROUTER_MOCK_HOST = '127.0.0.1'
+ROUTER_MOCK_PORT = 8080
@@ -0,0 +1,379 @@
+#!/usr/bin/python3
+'''
+Long-running router control daemon with a local HTTP/JSON API.
+
+Keeps one signed-in RouterSetting per router, so a request only pays for the
+operation itself. Jobs of a router run one at a time in submission order; jobs of
+different routers run concurrently.
+
+    python RouterDaemon.py --inventory lab.json --backend http
+
+    curl -X POST localhost:8765/routers/lab1/set_channel_no -d '{"args": ["2.4GHz", 6]}'
+    curl -X POST 'localhost:8765/routers/lab1/reboot?wait=0'      -> 202 {"id": "7", "status": "queued", ...}
+    curl localhost:8765/jobs/7
+    curl -X POST localhost:8765/routers/lab1/playbook -d '{"steps": [{"set_band_and_ssid": ["5GHz", "X"]}]}'
+
+Endpoints:
+    GET  /health                       daemon status
+    GET  /routers                      routers with their session and queue length
+    GET  /operations                   operations that can be posted
+    POST /routers/<name>/<operation>   body {"args": [...], "kwargs": {...}}; ?wait=0 returns at once, ?timeout=s
+    POST /routers/<name>/playbook      body: a RouterPlaybook (list of steps or {"on_error", "steps"})
+    GET  /jobs/<id>                    job status and result
+    GET  /metrics                      Prometheus metrics (see RouterMetrics)
+'''
+import argparse
+import collections
+import itertools
+import json
+import queue
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import ConstantName as CN
+import RouterConfig as routerconfig
+from RouterCli import serialize
+from RouterEvents import EVENTS
+
+
+PLAYBOOK = 'playbook'
+
+
+def operations():
+    from Router import RouterSetting
+
+    return sorted(name for name in dir(RouterSetting)
+                  if not name.startswith('_') and name not in CN.ROUTER_PRIVATE_OPERATIONS
+                  and callable(getattr(RouterSetting, name)))
+
+
+class Job(object):
+    _ids = itertools.count(1)
+
+    def __init__(self, router, operation, args=(), kwargs=None):
+        '''
+        Summary:
+            One operation queued for a router.
+        '''
+        self.id = str(next(self._ids))
+        self.router = router
+        self.operation = operation
+        self.args = list(args)
+        self.kwargs = dict(kwargs or {})
+        self.status = 'queued'
+        self.result = None
+        self.error = None
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self.done = threading.Event()
+
+    def finish(self, result=None, error=None):
+        self.result, self.error = result, error
+        self.status = 'failed' if error else 'done'
+        self.finished = time.time()
+        self.done.set()
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'router': self.router,
+            'operation': self.operation,
+            'status': self.status,
+            'result': serialize(self.result),
+            'error': self.error,
+            'queued': (self.started or time.time()) - self.submitted,
+            'elapsed': (self.finished or time.time()) - self.started if self.started else None,
+        }
+
+
+class RouterWorker(object):
+    def __init__(self, name, hardware, backend=None):
+        '''
+        Summary:
+            Thread owning the session to one router and running its jobs in order.
+
+        Description:
+            1) Sign in on the first job and keep the session for the next ones.
+            2) Drop the session after a job fails on anything but its arguments or an error its operation
+               reported (Router.OperationFailed), so the next job starts clean.
+        '''
+        self.name = name
+        self.hardware = hardware
+        self.backend = backend
+        self.router = None
+        self.current = None
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self.run, name='RouterWorker-%s' % name, daemon=True)
+        self.thread.start()
+
+    def connect(self):
+        from Router import RouterSetting
+
+        info = self.hardware['HARDWAREINFO']
+        router = RouterSetting(backend=self.backend, hardware=self.hardware)
+        login = router.sign_in(info.get('USERNAME') or CN.ROUTER_DEFAULT_USERNAME,
+                               info.get('PASSWORD') or CN.ROUTER_DEFAULT_PASSWORD)
+        if not login.success:
+            router.close()
+            raise RuntimeError('Login failed: %s' % login.message)
+        self.router = router
+
+    def disconnect(self):
+        router, self.router = self.router, None
+        if router is not None:
+            try:
+                router.close()
+            except Exception as err:
+                EVENTS.emit('step', router=self.name, level='error', message="Closing failed",
+                            error='%s: %s' % (type(err).__name__, err))
+
+    def execute(self, job):
+        if self.router is None:
+            self.connect()
+        if job.operation == PLAYBOOK:
+            from RouterPlaybook import RouterPlaybook
+
+            return RouterPlaybook(job.kwargs.get('playbook')).run(self.router)
+        return getattr(self.router, job.operation)(*job.args, **job.kwargs)
+
+    def run(self):
+        from Router import OperationFailed
+
+        while True:
+            job = self.queue.get()
+            if job is None:
+                break
+            self.current = job
+            job.status, job.started = 'running', time.time()
+            try:
+                result = self.execute(job)
+                if getattr(result, 'ready', True) is False:
+                    job.finish(result, 'Router not ready after %.1fs' % result.elapsed)
+                elif getattr(result, 'success', True) is False:
+                    job.finish(result, getattr(result, 'error', None) or 'Operation failed')
+                else:
+                    job.finish(result)
+            except Exception as err:
+                job.finish(error='%s: %s' % (type(err).__name__, err))
+                if not isinstance(err, (ValueError, TypeError, OperationFailed)):
+                    self.disconnect()
+            finally:
+                self.current = None
+        self.disconnect()
+
+    def status(self):
+        return {'router': self.name, 'ip': self.hardware['HARDWAREINFO']['IP'], 'signed_in': self.router is not None,
+                'queued': self.queue.qsize(), 'running': self.current.id if self.current else None}
+
+    def stop(self):
+        self.queue.put(None)
+
+
+class RouterDaemon(object):
+    def __init__(self, inventory, host=CN.ROUTER_DAEMON_HOST, port=CN.ROUTER_DAEMON_PORT, backend=None):
+        '''
+        Summary:
+            Local HTTP/JSON API running RouterSetting operations on kept-alive sessions.
+
+        Args:
+            self: self
+            inventory: (Type: Dict) Router name to configuration in the RouterConfig.hardware format
+            host: (Type: String) Address to listen on. Default localhost only
+            port: (Type: Integer) Port to listen on, 0 for any free port
+            backend: (Type: String) selenium, http or ssh. Default HARDWAREINFO BACKEND of every router
+
+        Example:
+            Below code block shows how to use::
+
+                daemon = RouterDaemon(load_inventory('lab.json'), backend='http').start()
+                # POST http://127.0.0.1:8765/routers/lab1/set_channel_no {"args": ["2.4GHz", 6]}
+                daemon.stop()
+
+        Returns:
+            An object of RouterDaemon.
+
+        Caveat:
+            No authentication: keep it bound to localhost.
+        '''
+        self.workers = collections.OrderedDict((name, RouterWorker(name, hardware, backend))
+                                               for name, hardware in inventory.items())
+        self.jobs = collections.OrderedDict()
+        self.jobs_lock = threading.Lock()
+        self.operations = operations()
+        self.started = time.time()
+        self.server = ThreadingHTTPServer((host, port), RouterDaemonHandler)
+        self.server.daemon_threads = True
+        self.server.daemon = self
+        self.host, self.port = self.server.server_address[:2]
+        self.thread = None
+
+    @property
+    def address(self):
+        return '%s:%d' % (self.host, self.port)
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, name='RouterDaemon', daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        for worker in self.workers.values():
+            worker.stop()
+        for worker in self.workers.values():
+            worker.thread.join()
+
+    def submit(self, router, operation, args=(), kwargs=None):
+        '''
+        Summary:
+            Queue an operation for a router.
+
+        Raises:
+            KeyError: Unknown router
+            ValueError: Unknown operation
+
+        Returns:
+            (Type: Job)
+        '''
+        worker = self.workers[router]
+        if operation != PLAYBOOK and operation not in self.operations:
+            raise ValueError("Unknown operation %s" % operation)
+        job = Job(router, operation, args, kwargs)
+        with self.jobs_lock:
+            self.jobs[job.id] = job
+            while len(self.jobs) > CN.ROUTER_DAEMON_JOBS:
+                self.jobs.popitem(last=False)
+        worker.queue.put(job)
+        return job
+
+    def job(self, job_id):
+        with self.jobs_lock:
+            return self.jobs.get(job_id)
+
+
+class RouterDaemonHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def daemon(self):
+        return self.server.daemon
+
+    def send_json(self, status, document):
+        body = json.dumps(document, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = urlsplit(self.path).path.strip(CN.STR_FORWARDSLASH).split(CN.STR_FORWARDSLASH)
+        if path == ['health']:
+            self.send_json(200, {'status': 'ok', 'uptime': time.time() - self.daemon.started,
+                                 'routers': len(self.daemon.workers)})
+        elif path == ['routers']:
+            self.send_json(200, [worker.status() for worker in self.daemon.workers.values()])
+        elif path == ['operations']:
+            self.send_json(200, self.daemon.operations + [PLAYBOOK])
+        elif path == ['metrics']:
+            from RouterMetrics import CONTENT_TYPE, METRICS
+
+            body = METRICS.render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif len(path) == 2 and path[0] == 'jobs':
+            job = self.daemon.job(path[1])
+            if job is None:
+                self.send_json(404, {'error': 'Unknown job %s' % path[1]})
+            else:
+                self.send_json(200, job.to_dict())
+        else:
+            self.send_json(404, {'error': 'Not found'})
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        path = url.path.strip(CN.STR_FORWARDSLASH).split(CN.STR_FORWARDSLASH)
+        length = int(self.headers.get('Content-Length', 0))
+        try:
+            body = json.loads(self.rfile.read(length).decode('utf-8') or '{}') if length else {}
+        except ValueError:
+            self.send_json(400, {'error': 'Body is not JSON'})
+            return
+        if len(path) != 3 or path[0] != 'routers':
+            self.send_json(404, {'error': 'Not found'})
+            return
+        router, operation = path[1], path[2]
+        if operation == PLAYBOOK:
+            args, kwargs = (), {'playbook': body}
+        elif isinstance(body, dict):
+            args, kwargs = body.get('args') or (), body.get('kwargs') or {}
+        else:
+            args, kwargs = body, {}
+        query = parse_qs(url.query)
+        try:
+            timeout = float(query.get('timeout', [CN.ROUTER_DAEMON_WAIT])[0])
+        except ValueError:
+            self.send_json(400, {'error': 'timeout must be a number of seconds'})
+            return
+        try:
+            if operation == PLAYBOOK:
+                # Reject a malformed playbook now rather than in the job.
+                from RouterPlaybook import RouterPlaybook
+
+                RouterPlaybook(body)
+            job = self.daemon.submit(router, operation, args, kwargs)
+        except KeyError:
+            self.send_json(404, {'error': 'Unknown router %s' % router})
+            return
+        except ValueError as err:
+            self.send_json(400, {'error': str(err)})
+            return
+        if query.get('wait', ['1'])[0] in ('0', 'false'):
+            self.send_json(202, job.to_dict())
+            return
+        job.done.wait(timeout)
+        if not job.done.is_set():
+            self.send_json(202, job.to_dict())
+        else:
+            self.send_json(200 if job.status == 'done' else 500, job.to_dict())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Router control daemon with a local HTTP/JSON API')
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--router', default=None, help='router IP address. Default RouterConfig IP')
+    target.add_argument('--inventory', default=None, help='JSON inventory of routers (see RouterFleet.load_inventory)')
+    parser.add_argument('--backend', default=None, help='selenium, http or ssh. Default RouterConfig BACKEND')
+    parser.add_argument('--host', default=CN.ROUTER_DAEMON_HOST)
+    parser.add_argument('--port', type=int, default=CN.ROUTER_DAEMON_PORT)
+    args = parser.parse_args()
+
+    from RouterFleet import load_inventory, router_hardware
+
+    if args.inventory:
+        inventory = load_inventory(args.inventory)
+    else:
+        ip = args.router or routerconfig.hardware['HARDWAREINFO']['IP']
+        if ip is None:
+            parser.error("No router given: use --router, --inventory or RouterConfig ['HARDWAREINFO']['IP']")
+        inventory = {ip: router_hardware(ip)}
+    daemon = RouterDaemon(inventory, args.host, args.port, args.backend).start()
+    print("Router daemon listening on http://%s/ for %s" % (daemon.address, ', '.join(daemon.workers)))
+    try:
+        daemon.thread.join()
+    except KeyboardInterrupt:
+        daemon.stop()
+
+
+if __name__ == '__main__':
+    main()
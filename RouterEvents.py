@@ -0,0 +1,165 @@
+#!/usr/bin/python3
+'''
+Structured event log of the router automation, one JSON object per line.
+
+    {"time": "2026-10-18T09:12:03.512Z", "event": "step", "router": "192.168.1.1",
+     "operation": "set_wpa_encryption", "level": "info", "message": "Setting wpa encryption..."}
+    {"time": "2026-10-18T09:12:01.204Z", "event": "operation", "router": "192.168.1.1",
+     "operation": "set_wpa_encryption", "params": {"band_type": "2.4GHz", ...}, "duration": 2.308,
+     "outcome": "ok"}
+
+Events go to CN.ROUTER_EVENT_LOG: '-' for stderr (default), a file name to append to, or None to disable.
+'''
+import atexit
+import datetime
+import json
+import queue
+import sys
+import threading
+import time
+
+import ConstantName as CN
+from RouterTrace import call_arguments
+
+
+def timestamp(seconds):
+    return datetime.datetime.fromtimestamp(seconds, datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+
+
+def outcome(result=None, error=None, errors=0):
+    '''
+    Summary:
+        Outcome of an operation from what it raised, returned and reported.
+
+    Returns:
+        (Type: Tuple) ('ok' or 'failed', error message or None)
+    '''
+    if error is not None:
+        return 'failed', '%s: %s' % (type(error).__name__, error)
+    if getattr(result, 'ready', True) is False:
+        return 'failed', 'Router not ready after %.1fs' % result.elapsed
+    if getattr(result, 'success', True) is False:
+        return 'failed', getattr(result, 'message', None) or getattr(result, 'error', None) or 'Operation failed'
+    if errors:
+        return 'failed', '%d error(s) reported' % errors
+    return 'ok', None
+
+
+class EventLog(object):
+    def __init__(self, target=CN.ROUTER_EVENT_LOG, size=CN.ROUTER_EVENT_QUEUE):
+        '''
+        Summary:
+            Non-blocking JSON lines writer.
+
+        Description:
+            1) emit() only queues the event; a writer thread serializes and writes queued events in batches,
+               so a slow disk or terminal never stalls the automation thread.
+            2) When the queue is full the event is dropped and counted in dropped.
+               A target that cannot be opened falls back to stderr.
+            3) Events still queued are written at interpreter exit.
+
+        Args:
+            self: self
+            target: (Type: String) '-' for stderr, a file name to append to, or None to disable
+            size: (Type: Integer) Events queued at most
+
+        Example:
+            Below code block shows how to use::
+
+                events = EventLog('router.events.jsonl')
+                events.emit('step', router='192.168.1.1', message='Rebooting')
+                events.close()
+
+        Returns:
+            An object of EventLog.
+        '''
+        self.target = target
+        self.queue = queue.Queue(size)
+        self.dropped = 0
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def emit(self, event, **fields):
+        if self.target is None:
+            return
+        if self.thread is None:
+            self.start()
+        try:
+            self.queue.put_nowait((event, time.time(), fields))
+        except queue.Full:
+            self.dropped += 1
+
+    def operation(self, method, router, args, kwargs, started, duration, result=None, error=None, errors=0):
+        '''
+        Summary:
+            Emit the event of a finished RouterSetting operation, its parameters redacted.
+        '''
+        if self.target is None:
+            return
+        status, message = outcome(result, error, errors)
+        fields = {'router': router, 'operation': method.__name__, 'params': call_arguments(method, args, kwargs),
+                  'started': started, 'duration': duration, 'outcome': status}
+        if message:
+            fields['error'] = message
+        self.emit('operation', **fields)
+
+    def start(self):
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name='EventLog', daemon=True)
+                self.thread.start()
+
+    def run(self):
+        try:
+            stream = sys.stderr if self.target == '-' else open(self.target, 'a')
+        except OSError as err:
+            # Events must still be consumed, or emit() fills the queue and flush() never returns.
+            sys.stderr.write("Event log %s not writable (%s), writing events to stderr\n" % (self.target, err))
+            stream = sys.stderr
+        running = True
+        while running:
+            batch = [self.queue.get()]
+            while len(batch) < CN.ROUTER_EVENT_BATCH:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            lines = []
+            for item in batch:
+                if item is None:
+                    running = False
+                    continue
+                event, seconds, fields = item
+                record = {'time': timestamp(seconds), 'event': event}
+                record.update(fields)
+                if 'started' in record:
+                    record['started'] = timestamp(record['started'])
+                lines.append(json.dumps(record, default=str) + '\n')
+            try:
+                stream.write(''.join(lines))
+                stream.flush()
+            except (OSError, ValueError):
+                pass
+            for _ in batch:
+                self.queue.task_done()
+        if stream is not sys.stderr:
+            stream.close()
+
+    def flush(self):
+        '''
+        Summary:
+            Wait until every event emitted so far is written.
+        '''
+        if self.thread is not None:
+            self.queue.join()
+
+    def close(self):
+        with self.lock:
+            thread, self.thread = self.thread, None
+        if thread is not None:
+            self.queue.put(None)
+            thread.join(CN.ROUTER_EVENT_CLOSE_TIMEOUT)
+
+
+EVENTS = EventLog()
+atexit.register(EVENTS.close)
@@ -0,0 +1,271 @@
+#!/usr/bin/python3
+import collections
+import concurrent.futures
+import copy
+import json
+import threading
+import time
+
+import ConstantName as CN
+import RouterConfig as routerconfig
+
+
+# Outcome of a fleet run on one router: its inventory name, whether sign in and every
+# step passed, the value returned by the last step, the error (if any) and the seconds it took.
+FleetResult = collections.namedtuple('FleetResult', 'router success result error elapsed')
+
+
+class FleetTimeout(Exception):
+    pass
+
+
+def router_hardware(ip, **info):
+    '''
+    Summary:
+        Inventory entry of a router, based on RouterConfig.hardware.
+
+    Args:
+        ip: (Type: String) Router IP address
+        info: (Type: Any) Other HARDWAREINFO fields, eg. username='admin', backend='http'
+
+    Example:
+        Below code block shows how to use::
+
+            inventory = {'lab1': router_hardware('192.168.1.1', username='admin', password='admin123')}
+
+    Returns:
+        (Type: Dict) Copy of RouterConfig.hardware with the given HARDWAREINFO fields
+    '''
+    hardware = copy.deepcopy(routerconfig.hardware)
+    hardware['HARDWAREINFO']['IP'] = ip
+    for name, value in info.items():
+        hardware['HARDWAREINFO'][name.upper()] = value
+    return hardware
+
+
+def load_inventory(filename):
+    '''
+    Summary:
+        Load an inventory file.
+
+    Description:
+        1) The file is a JSON object of router name to configuration in the RouterConfig.hardware format.
+        2) HARDWAREINFO fields left out are taken from RouterConfig.hardware.
+
+    Raises:
+        ValueError: File is not a JSON object
+
+    Returns:
+        (Type: Dict) Router name to hardware configuration
+    '''
+    with open(filename) as inventory_file:
+        routers = json.load(inventory_file)
+    if not isinstance(routers, dict):
+        raise ValueError("Inventory must be a JSON object of router name to hardware configuration")
+    inventory = collections.OrderedDict()
+    for name, hardware in routers.items():
+        inventory[name] = router_hardware(**dict((key.lower(), value) for key, value in hardware['HARDWAREINFO'].items()))
+    return inventory
+
+
+class FleetJob(object):
+    '''
+    State of one router in a fleet run, shared by its worker and the thread enforcing the timeout.
+    '''
+    def __init__(self, name, hardware):
+        self.name = name
+        self.hardware = hardware
+        self.started = None
+        self.router = None
+        self.timed_out = False
+        self.lock = threading.Lock()
+
+    def attach(self, router):
+        with self.lock:
+            if not self.timed_out:
+                self.router = router
+                return True
+        router.close()
+        return False
+
+    def close(self):
+        with self.lock:
+            router, self.router = self.router, None
+        if router is not None:
+            router.close()
+
+    def abort(self):
+        '''
+        Summary:
+            Give up on the router; closing its transport makes the worker fail fast.
+        '''
+        with self.lock:
+            self.timed_out = True
+        threading.Thread(target=self.close, daemon=True).start()
+
+
+class RouterFleet(object):
+    def __init__(self, inventory, workers=CN.ROUTER_FLEET_WORKERS, timeout=CN.ROUTER_FLEET_TIMEOUT,
+                 backend=None, session=True, tracer=None):
+        '''
+        Summary:
+            Run RouterSetting operations on many routers in parallel.
+
+        Description:
+            1) Every router gets its own RouterSetting, signs in with its USERNAME and PASSWORD and runs the steps.
+            2) At most workers routers are configured at a time; a rollout takes about as long as the slowest router.
+            3) A router still running timeout seconds after it started is reported as failed and its transport closed.
+
+        Args:
+            self: self
+            inventory: (Type: Dict or List) Router name to configuration in the RouterConfig.hardware format,
+                       or a list of configurations named by their IP
+            workers: (Type: Integer) Routers configured at a time
+            timeout: (Type: Float) Seconds allowed per router, sign in included
+            backend: (Type: String) selenium, http or ssh. Default HARDWAREINFO BACKEND of every router
+            session: (Type: Boolean) Resume stored router sessions instead of signing in again
+            tracer: (Type: RouterTrace.RouterTracer) Tracer shared by the routers, one track per worker thread
+
+        Example:
+            Below code block shows how to use::
+
+                fleet = RouterFleet(load_inventory('lab.json'), workers=16, backend='http')
+                results = fleet.batch([('set_band_and_ssid', (CN.ROUTER_2GHZ, 'iptv_lab')),
+                                       ('set_channel_no', (CN.ROUTER_2GHZ, '6'))])
+                print(fleet.table(results))
+
+        Returns:
+            An object of RouterFleet.
+
+        Caveat:
+            A timed-out worker thread keeps its pool slot until the closed transport makes it return.
+        '''
+        if not isinstance(inventory, dict):
+            inventory = collections.OrderedDict((hardware['HARDWAREINFO']['IP'], hardware) for hardware in inventory)
+        self.inventory = inventory
+        self.workers = workers
+        self.timeout = timeout
+        self.backend = backend
+        self.session = session
+        self.tracer = tracer
+
+    def run(self, operation, *args, **kwargs):
+        '''
+        Summary:
+            Run one RouterSetting operation on every router.
+
+        Example:
+            Below code block shows how to use::
+
+                results = fleet.run('set_channel_no', CN.ROUTER_5GHZ, '36')
+
+        Returns:
+            (Type: List) FleetResult per router, in inventory order
+        '''
+        return self.batch([(operation, args, kwargs)], transaction=False)
+
+    def batch(self, steps, transaction=True):
+        '''
+        Summary:
+            Run a list of steps on every router.
+
+        Description:
+            1) A step is (method name, args), (method name, args, kwargs) or a callable taking the RouterSetting.
+            2) With transaction, the steps of a router are applied once per page (see RouterSetting.transaction).
+            3) A router stops at its first failing step (it raised, returned an unsuccessful result or reported
+               errors, see Router.OperationFailed); the other routers carry on.
+
+        Args:
+            self: self
+            steps: (Type: List) Steps to run on every router
+            transaction: (Type: Boolean) Run the steps of a router in one transaction
+
+        Returns:
+            (Type: List) FleetResult per router, in inventory order
+        '''
+        jobs = [FleetJob(name, hardware) for name, hardware in self.inventory.items()]
+        results = {}
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            pending = dict((pool.submit(self.configure, job, steps, transaction), job) for job in jobs)
+            while pending:
+                done, _ = concurrent.futures.wait(pending, timeout=CN.ROUTER_FLEET_POLL,
+                                                  return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    job = pending.pop(future)
+                    results[job.name] = future.result()
+                now = time.perf_counter()
+                for future, job in list(pending.items()):
+                    if job.started is not None and now - job.started > self.timeout:
+                        del pending[future]
+                        job.abort()
+                        results[job.name] = FleetResult(job.name, False, None,
+                                                        'Timed out after %ss' % self.timeout, now - job.started)
+        finally:
+            pool.shutdown(wait=False)
+        return [results[job.name] for job in jobs]
+
+    def configure(self, job, steps, transaction):
+        from Router import RouterSetting
+
+        job.started = start = time.perf_counter()
+        try:
+            router = RouterSetting(backend=self.backend, session=self.session, hardware=job.hardware,
+                                   tracer=self.tracer)
+            if not job.attach(router):
+                raise FleetTimeout(job.name)
+            info = job.hardware['HARDWAREINFO']
+            login = router.sign_in(info.get('USERNAME') or CN.ROUTER_DEFAULT_USERNAME,
+                                   info.get('PASSWORD') or CN.ROUTER_DEFAULT_PASSWORD)
+            if not login.success:
+                return FleetResult(job.name, False, None, 'Login failed: %s' % login.message,
+                                   time.perf_counter() - start)
+            if transaction:
+                with router.transaction():
+                    result = self.steps(router, steps)
+            else:
+                result = self.steps(router, steps)
+            if getattr(result, 'ready', True) is False:
+                # eg. a reboot whose router did not come back
+                return FleetResult(job.name, False, result, 'Router not ready after %.1fs' % result.elapsed,
+                                   time.perf_counter() - start)
+            if getattr(result, 'success', True) is False:
+                # eg. a playbook with a failed step
+                return FleetResult(job.name, False, result, getattr(result, 'error', None) or 'Operation failed',
+                                   time.perf_counter() - start)
+            return FleetResult(job.name, True, result, None, time.perf_counter() - start)
+        except Exception as err:
+            return FleetResult(job.name, False, None, '%s: %s' % (type(err).__name__, err),
+                               time.perf_counter() - start)
+        finally:
+            job.close()
+
+    @staticmethod
+    def steps(router, steps):
+        result = None
+        for step in steps:
+            if callable(step):
+                result = step(router)
+                continue
+            name, args = step[0], step[1] if len(step) > 1 else ()
+            kwargs = step[2] if len(step) > 2 else {}
+            result = getattr(router, name)(*args, **kwargs)
+        return result
+
+    @staticmethod
+    def table(results):
+        '''
+        Summary:
+            Format fleet results as a table, one line per router.
+
+        Returns:
+            (Type: String) Table of router, status, seconds and result or error
+        '''
+        lines = ["{:<24}{:<8}{:>10}  {}".format('router', 'status', 'time (s)', 'result')]
+        for result in results:
+            lines.append("{:<24}{:<8}{:>10.3f}  {}".format(
+                result.router, 'ok' if result.success else 'FAILED', result.elapsed,
+                result.error if result.error else ('' if result.result is None else result.result)))
+        passed = sum(1 for result in results if result.success)
+        lines.append("%d/%d routers configured" % (passed, len(results)))
+        return '\n'.join(lines)
@@ -0,0 +1,1058 @@
+#!/usr/bin/python3
+import collections
+import contextlib
+import os
+import time
+
+import ConstantName as CN
+from RouterEvents import EVENTS
+from RouterProbe import ReadinessProber
+from RouterTransport import Change, LoginResult
+
+
+# changed: nvram name to (current, applied) value, secrets masked
+# unchanged: nvram names already at the desired value
+# pages: router pages submitted, in order
+# elapsed: seconds spent reading, diffing and applying
+ReconcileResult = collections.namedtuple('ReconcileResult', 'changed unchanged pages elapsed')
+
+
+class RouterFormSetting(object):
+    def __init__(self, transport, sessions=None):
+        '''
+        Summary:
+            Initialize router settings on top of a direct transport.
+
+        Description:
+            1) Every operation is described as the nvram fields of a router form (a Change).
+            2) The Change is handed to the transport, which decides how it reaches the router.
+
+        Args:
+            self: self
+            transport: (Type: RouterTransport) HTTP, SSH or Selenium transport
+            sessions: (Type: SessionStore) Store of authenticated sessions to resume. None to always sign in
+
+        Example:
+            Below code block shows how to use::
+
+                from RouterTransport import create_transport
+                from RouterForm import RouterFormSetting
+
+                router = RouterFormSetting(create_transport('ssh'))
+                router.sign_in('admin', 'admin123')
+
+        Returns:
+            An object of RouterFormSetting.
+
+        Caveat:
+            Same methods as RouterSetting, so operation lists can be replayed on any transport.
+        '''
+        self.transport = transport
+        self.prober = ReadinessProber(transport.ip)
+        self.sessions = sessions
+        self.credentials = (None, None)
+        self.staged = None
+        self.uploads = []
+        self.operation = None
+        self.errors = 0
+        # (message, exception type) of the last error reported
+        self.failure = None
+
+    def _event(self, message, level='info', **fields):
+        '''
+        Summary:
+            Log a step of the running operation in RouterEvents.EVENTS; an 'error' step fails the operation.
+        '''
+        if level == 'error':
+            self.errors += 1
+            self.failure = (message, fields.get('exception'))
+        EVENTS.emit('step', router=self.transport.ip, operation=self.operation, level=level, message=message,
+                    **fields)
+
+    def submit(self, page, service, fields, action=CN.ROUTER_ACTION_APPLY):
+        '''
+        Summary:
+            Submit the fields of a router form.
+
+        Description:
+            1) Outside a transaction the change is submitted right away.
+            2) Inside a transaction an apply is staged and merged with the other changes of its page;
+               a reboot or restore first submits the staged changes, then runs right away.
+
+        Args:
+            self: self
+            page: (Type: String) Router page the change belongs to, eg. 'Advanced_Wireless_Content.asp'
+            service: (Type: String) Service restarted by the firmware after the change
+            fields: (Type: Dict) nvram name to value
+            action: (Type: String) apply.cgi action. Default 'apply'
+
+        Returns:
+            Transport specific response, None when the change was staged
+        '''
+        change = Change(page, service, fields, action)
+        if self.staged is None:
+            return self.transport.submit(change)
+        if action != CN.ROUTER_ACTION_APPLY:
+            self.flush()
+            return self.transport.submit(change)
+        self.stage(change)
+
+    def stage(self, change):
+        staged = self.staged.get(change.page)
+        if staged is None:
+            self.staged[change.page] = change._replace(fields=dict(change.fields))
+            return
+        staged.fields.update(change.fields)
+        services = [service for service in staged.service.split(CN.STR_SEMICOLON) if service]
+        for service in change.service.split(CN.STR_SEMICOLON):
+            if service and service not in services:
+                services.append(service)
+        self.staged[change.page] = staged._replace(service=CN.STR_SEMICOLON.join(services))
+
+    def upload(self, page, filename, fields):
+        '''
+        Summary:
+            Upload a file for a router page, staged like submit inside a transaction.
+
+        Args:
+            self: self
+            page: (Type: String) Router page the file belongs to
+            filename: (Type: String) Full path of the local file
+            fields: (Type: Dict) Extra form fields sent with the file
+        '''
+        if self.staged is None:
+            return self.transport.upload(filename, fields)
+        self.uploads.append((page, filename, fields))
+
+    def flush(self):
+        '''
+        Summary:
+            Submit the staged changes, one per page, each after the files uploaded for its page.
+
+        Returns:
+            (Type: List) Changes submitted
+        '''
+        changes, uploads = list(self.staged.values()), self.uploads
+        self.staged.clear()
+        self.uploads = []
+        for change in changes:
+            self.commit(change, uploads)
+        return changes
+
+    def commit(self, change, uploads=()):
+        for page, filename, fields in uploads:
+            if page == change.page:
+                self.transport.upload(filename, fields)
+        self.transport.submit(change)
+
+    def read(self, names):
+        '''
+        Summary:
+            Read nvram values, with the values staged in the current transaction on top.
+        '''
+        values = self.transport.read(names)
+        for change in (self.staged or {}).values():
+            values.update((name, value) for name, value in change.fields.items() if name in values)
+        return values
+
+    @contextlib.contextmanager
+    def transaction(self):
+        '''
+        Summary:
+            Stage changes and apply them once per page.
+
+        Description:
+            1) Every change made inside the block is staged instead of submitted.
+            2) Changes to the same page (eg. SSID, channel and password of both bands) are merged.
+            3) On leaving the block each page is submitted once, so its service restarts once.
+            4) If the block raises, the staged changes are dropped and nothing is applied.
+
+        Example:
+            Below code block shows how to use::
+
+                with router.transaction():
+                    router.set_band_and_ssid('2.4GHz', 'SONY!!')
+                    router.set_channel_no('5GHz', '153')
+                    router.set_wifi_password('5GHz', 'WPA2-Personal', 'abcd1234')
+
+        Caveat:
+            A nested transaction joins the outer one.
+        '''
+        if self.staged is not None:
+            yield self
+            return
+        self.staged = collections.OrderedDict()
+        self.uploads = []
+        try:
+            yield self
+            self.flush()
+        finally:
+            self.staged = None
+            self.uploads = []
+
+    def stage_state(self, state):
+        '''
+        Summary:
+            Make the changes described by a desired state, through the regular setters.
+
+        Args:
+            self: self
+            state: (Type: Dict) Desired state, see reconcile
+        '''
+        for band_type, wireless in state.get('wireless', {}).items():
+            authentication_type = wireless.get('auth')
+            if 'ssid' in wireless:
+                self.set_band_and_ssid(band_type, wireless['ssid'])
+            if 'channel' in wireless:
+                self.set_channel_no(band_type, wireless['channel'])
+            if authentication_type is not None:
+                self.set_authentication_method(band_type, authentication_type)
+            if 'password' in wireless:
+                self.set_wifi_password(band_type, authentication_type or CN.DEFAULT_AUTHMETHOD, wireless['password'])
+            if 'encryption' in wireless:
+                self.set_wpa_encryption(band_type, authentication_type or CN.DEFAULT_AUTHMETHOD, wireless['encryption'])
+            if 'visible' in wireless:
+                self.toggle_ssid_visibility(band_type, 'visible' if wireless['visible'] else 'hide')
+        if 'dhcp' in state:
+            dhcp = state['dhcp']
+            self.dhcp_control(dhcp.get('enabled', True), dhcp['start'], dhcp['end'])
+        if 'qos' in state:
+            self.set_bandwidth_rules(state['qos'])
+        if 'wan' in state:
+            wan = state['wan']
+            self.toggle_wan_connection(wan if wan in ('on', 'off') else ('on' if wan else 'off'))
+        if 'vpn' in state:
+            vpn = state['vpn']
+            self.set_vpn_connection(vpn['type'], vpn['country'], vpn['username'], vpn['password'])
+
+    def plan(self, state):
+        '''
+        Summary:
+            Changes (one per page) and uploads a desired state would make, without applying them.
+        '''
+        if self.staged is not None:
+            raise RuntimeError("Cannot plan a desired state inside a transaction")
+        with self.transaction():
+            self.stage_state(state)
+            changes, uploads = list(self.staged.values()), self.uploads
+            self.staged.clear()
+            self.uploads = []
+        return changes, uploads
+
+    def reconcile(self, state):
+        '''
+        Summary:
+            Bring the router to a desired state, applying only what differs.
+
+        Description:
+            1) Turn the desired state into nvram fields per page, using the regular setters.
+            2) Read the current values of those fields in one request.
+            3) Submit only the pages with differing fields, and only those fields.
+
+        Args:
+            self: self
+            state: (Type: Dict) Desired state. Every key is optional:
+                wireless: {band: {ssid, channel, auth, password, encryption, visible}}
+                dhcp: {enabled, start, end}
+                qos: [{mac, download, upload}] (full list of bandwidth limits, Mbps)
+                wan: 'on' / 'off' or Boolean
+                vpn: {type, country, username, password}
+
+        Example:
+            Below code block shows how to use::
+
+                result = router.reconcile({
+                    'wireless': {'2.4GHz': {'ssid': 'SONY!!', 'channel': 'Auto', 'auth': 'WPA2-Personal'}},
+                    'dhcp': {'start': '192.168.1.2', 'end': '192.168.1.254'},
+                    'wan': 'on',
+                })
+                print(result.changed, result.elapsed)
+
+        Returns:
+            (Type: ReconcileResult)
+        '''
+        start = time.perf_counter()
+        changes, uploads = self.plan(state)
+        names = sorted(set(name for change in changes for name in change.fields))
+        current = self.transport.read(names) if names else {}
+        changed, unchanged, pages = {}, [], []
+        for change in changes:
+            diff = dict((name, value) for name, value in change.fields.items()
+                        if name not in CN.ROUTER_SELECTOR_FIELDS and str(current.get(name, '')) != str(value))
+            unchanged.extend(name for name in change.fields if name not in CN.ROUTER_SELECTOR_FIELDS and name not in diff)
+            if not diff:
+                continue
+            for name, value in diff.items():
+                secret = any(marker in name for marker in CN.ROUTER_SECRET_MARKERS)
+                changed[name] = ('***', '***') if secret else (current.get(name, ''), value)
+            diff.update((name, change.fields[name]) for name in CN.ROUTER_SELECTOR_FIELDS if name in change.fields)
+            self.commit(change._replace(fields=diff), uploads)
+            pages.append(change.page)
+        result = ReconcileResult(changed, unchanged, pages, time.perf_counter() - start)
+        self._event("Reconciled", changed=len(changed), pages=len(pages), unchanged=len(unchanged),
+                    elapsed=result.elapsed)
+        return result
+
+    def sign_in(self, username, password):
+        '''
+        Summary:
+            Sign in on the router
+
+        Description:
+            1) Resume the stored session of username when the router still accepts it.
+            2) Else sign in on the router through the transport and store the new session.
+
+        Args:
+            self: self
+            username: (Type: string) Username to the router webpage
+            password: (Type: string) Password to the router webpage
+
+        Raises:
+            None
+
+        Example:
+            Below code block shows how to use::
+
+                router.sign_in('hello', 'hello123')
+
+        Returns:
+            (Type: LoginResult) success, error message, elapsed seconds and whether the session was resumed
+
+        Caveat:
+            None
+        '''
+        start = time.perf_counter()
+        self.credentials = (username, password)
+        if self.sessions is not None and self.sessions.resume(self.transport, username):
+            self._event("Login Successfull (session resumed)")
+            return LoginResult(True, '', time.perf_counter() - start, True)
+        if self.transport.sign_in(username, password):
+            if self.sessions is not None:
+                self.sessions.store(self.transport, username)
+            self._event("Login Successfull")
+            return LoginResult(True, '', time.perf_counter() - start)
+        result = LoginResult(False, 'Invalid username or password', time.perf_counter() - start)
+        self._event("Login unsuccessfull: " + result.message, 'error')
+        return result
+
+    def reboot(self):
+        '''
+        Summary:
+            To reboot router
+
+        Description:
+            1) To reboot router
+            2) Wait until the router went down and accepts a login again, then sign in again.
+
+        Args:
+            self: self
+
+        Raises:
+            None
+
+        Example:
+            Below code block shows how to use::
+
+                router.reboot()
+
+        Returns:
+            (Type: ProbeResult) Readiness and measured downtime of the router
+
+        Caveat:
+            Waits at most 6 minutes for the router to come back.
+        '''
+        self.submit(CN.ROUTER_INDEX_PAGE, '', {}, CN.ROUTER_ACTION_REBOOT)
+        self._event("rebooting router...")
+        result = self.prober.wait_for_reboot(*self.credentials)
+        if result.ready:
+            self._event("rebooting completed", elapsed=result.elapsed, downtime=result.downtime)
+            if self.credentials[0] is not None:
+                self.transport.sign_in(*self.credentials)
+        else:
+            self._event("Router not ready", 'error', elapsed=result.elapsed, stage=result.stage)
+        return result
+
+    def set_bandwidth_limit(self, target_device, download_rate, upload_rate):
+        '''
+        Summary:
+            To set the bandwidth rate of device
+
+        Description:
+            1) To set the bandwidth rate of device
+
+        Args:
+            self: self
+            target_device: (Type: String) MAC address of the device
+            download_rate: (Type: Integer) Download rate limit in Mbps
+            upload_rate: (Type: Integer) Uplaod rate limit in Mbps
+
+        Raises:
+            None
+
+        Example:
+            Below code block shows how to use::
+
+                router.set_bandwidth_limit('AA:BB:CC:DD:EE:FF', 50, 25)
+
+        Returns:
+            None
+
+        Caveat:
+            None
+        '''
+        rules = self.read(['qos_bw_rulelist'])['qos_bw_rulelist']
+        rules += self._bandwidth_rule(target_device, download_rate, upload_rate)
+        self.submit(CN.ROUTER_QOS_PAGE, CN.ROUTER_SERVICE_QOS,
+                   {'qos_enable': '1', 'qos_type': '2', 'qos_bw_rulelist': rules})
+        self._event("Bandwidth limit set", device=target_device, download=download_rate, upload=upload_rate)
+
+    def _bandwidth_rule(self, target_device, download_rate, upload_rate):
+        return '<1>{}>{}>{}>0'.format(target_device, int(download_rate) * 1024, int(upload_rate) * 1024)
+
+    def set_bandwidth_rules(self, rules):
+        '''
+        Summary:
+            To replace every bandwidth limit at once.
+
+        Args:
+            self: self
+            rules: (Type: List) {'mac', 'download', 'upload'} per device, rates in Mbps. Empty to remove every limit
+
+        Example:
+            Below code block shows how to use::
+
+                router.set_bandwidth_rules([{'mac': 'AA:BB:CC:DD:EE:FF', 'download': 50, 'upload': 25}])
+        '''
+        if not rules:
+            self.submit(CN.ROUTER_QOS_PAGE, CN.ROUTER_SERVICE_QOS, {'qos_bw_rulelist': ''})
+            return
+        self.submit(CN.ROUTER_QOS_PAGE, CN.ROUTER_SERVICE_QOS, {
+            'qos_enable': '1', 'qos_type': '2',
+            'qos_bw_rulelist': ''.join(self._bandwidth_rule(rule['mac'], rule['download'], rule['upload']) for rule in rules),
+        })
+
+    def remove_bandwidth_limit(self):
+        '''
+        Summary:
+            To remove upload and download limit.
+
+        Description:
+            1) To remove upload and download limit.
+
+        Args:
+            self: self
+
+        Raises:
+            None
+
+        Example:
+            Below code block shows how to use::
+
+                router.remove_bandwidth_limit()
+
+        Returns:
+            None
+
+        Caveat:
+            None
+        '''
+        if self.read(['qos_bw_rulelist'])['qos_bw_rulelist'] == '':
+            self._event("Set to default bandwidth setting")
+        else:
+            self._event("Restoring to default bandwidth setting...")
+            self.submit(CN.ROUTER_QOS_PAGE, CN.ROUTER_SERVICE_QOS, {'qos_bw_rulelist': ''})
+
+    def _wireless(self, band_type, fields):
+        if band_type not in CN.ROUTER_WL_UNIT:
+            raise ValueError("Invalid band type")
+        unit = CN.ROUTER_WL_UNIT[band_type]
+        data = {'wl_unit': unit}
+        for name, value in fields.items():
+            data['wl' + unit + name[2:]] = value
+        self.submit(CN.ROUTER_WIRELESS_PAGE, CN.ROUTER_SERVICE_WIRELESS, data)
+
+    def set_band_and_ssid(self, band_type, ssid_name):
+        '''
+        Summary:
+            To select band type and set ssid name
+
+        Description:
+            1) To select band type and set ssid name
+
+        Args:
+            self: self
+            band_type: (Type: String) To select either 2.4 GHz or 5 GHz.
+            ssid_name: (Type: String) Network SSID name
+
+        Raises:
+            ValueError: Invalid band type
+
+        Example:
+            Below code block shows how to use::
+
+                router.set_band_and_ssid('2.4GHz', 'SONY!!')
+
+        Returns:
+            None
+
+        Caveat:
+            None
+        '''
+        self._wireless(band_type, {'wl_ssid': ssid_name})
+        self._event("Setting up new ssid...")
+
+    def set_default_channel_no(self):
+        '''
+        Summary:
+            To set default available channel
+
+        Description:
+            1) To set default available channel
+
+        Args:
+            self: self
+
+        Raises:
+            None
+
+        Example:
+            Below code block shows how to use::
+
+                router.set_default_channel_no()
+
+        Returns:
+            None
+
+        Caveat:
+            None
+        '''
+        self.set_channel_no(CN.DEFAULT_BAND_TYPE_2, CN.DEFAULT_CHANNEL)
+
+    def set_default_channel_no_5ghz(self):
+        '''
+        Summary:
+            To set default available channel for 5GHz
+
+        Description:
+            1) To set default available channel for 5GHz
+
+        Args:
+            self: self
+
+        Raises:
+            None
+
+        Example:
+            Below code block shows how to use::
+
+                router.set_default_channel_no_5ghz()
+
+        Returns:
+            None
+
+        Caveat:
+            None
+        '''
+        self.set_channel_no(CN.DEFAULT_BAND_TYPE_5, CN.DEFAULT_CHANNEL)
+
+    def set_channel_no(self, band_type, channel_no):
+        '''
+        Summary:
+            To set available channel for both 2.4 GHz and 5 GHz
+
+        Description:
+            1) To set available channel for both 2.4 GHz and 5 GHz
+
+        Args:
+            self: self
+            band_type: (Type: String) Network band (2.4GHz or 5 GHz)
+            channel_no: (Type: Integer) Channel Number. (Supported: 2.4GHz -> Auto, 1 to 11, 5GHz -> Auto, 36, 40, 44, 48, 149, 153, 157, 161 and 165)
+
+        Raises:
+            ValueError: Invalid band type
+
+        Example:
+            Below code block shows how to use::
+
+                router.set_channel_no('5GHz', 153)
+
+        Returns:
+            None
+
+        Caveat:
+            None
+        '''
+        channel = CN.ROUTER_AUTO_CHANNEL if str(channel_no) == CN.DEFAULT_CHANNEL else str(channel_no)
+        self._wireless(band_type, {CN.CONTROL_CHANNEL: channel})
+        self._event("Setting channel number...")
+
+    def set_default_authentication_method(self):
+        '''
+        Summary:
+            To set default authentication method for 2.4 GHz.
+
+        Description:
+            1) To set default authentication method for 2.4 GHz.
+
+        Args:
+            self: self
+
+        Raises:
+            None
+
+        Example:
+            Below code block shows how to use::
+
+                router.set_default_authentication_method()
+
+        Returns:
+            None
+
+        Caveat:
+            None
+        '''
+        self.set_authentication_method(CN.DEFAULT_BAND_TYPE_2, CN.DEFAULT_AUTHMETHOD)
+
+    def set_default_authentication_method_5ghz(self):
+        '''
+        Summary:
+            To set default authentication method for 5 GHz.
+
+        Description:
+            1) To set default authentication method for 5 GHz.
+
+        Args:
+            self: self
+
+        Raises:
+            None
+
+        Example:
+            Below code block shows how to use::
+
+                router.set_default_authentication_method_5ghz()
+
+        Returns:
+            None
+
+        Caveat:
+            None
+        '''
+        self.set_authentication_method(CN.DEFAULT_BAND_TYPE_5, CN.DEFAULT_AUTHMETHOD)
+
+    def set_authentication_method(self, band_type, authentication_type):
+        '''
+        Summary:
+            To set authentication method for 2.4GHz or 5 GHz.
+
+        Description:
+            1) To set authentication method for 2.4GHz or 5 GHz.
+
+        Args:
+            self: self
+            band_type: (Type: String) Network band of 2.4GHz or 5GHz
+            authentication_type: (Type: String) Authentication type. (Supported: Open System, WPA2-Personal, WPA-Auto-Personal)
+
+        Raises:
+            None
+
+        Example:
+            Below code block shows how to use::
+
+                router.set_authentication_method('5GHz', 'WPA-Auto-Personal')
+
+        Returns:
+            None
+
+        Caveat:
+            None
+        '''
+        if band_type not in CN.ROUTER_WL_UNIT:
+            self._event("Invalid band type", 'error', band=band_type)
+        elif authentication_type not in CN.ROUTER_AUTH_MODE:
+            self._event("Invalid authentication type. Please check", 'error', authentication=authentication_type)
+        else:
+            self._wireless(band_type, {'wl_auth_mode_x': CN.ROUTER_AUTH_MODE[authentication_type]})
+            self._event("Setting authentication method...")
+
+    def set_default_wifi_password(self, new_password):
+        '''
+        Summary:
+            To set default WiFi password.
+
+        Description:
+            1) To set default WiFi password.
+
+        Args:
+            self: self
+            new_password: (Type: String) Set a new password.
+
+        Raises:
+            None
+
+        Example:
+            Below code block shows how to use::
+
+                router.set_default_wifi_password('abcd1234')
+
+        Returns:
+            None
+
+        Caveat:
+            None
+        '''
+        self.set_wifi_password(CN.DEFAULT_BAND_TYPE_2, CN.DEFAULT_AUTHMETHOD, new_password)
+
+    def set_default_wifi_password_5ghz(self, new_password):
+        '''
+        Summary:
+            To set default WiFi password for 5GHz.
+
+        Description:
+            1) To set default WiFi password for 5GHz.
+
+        Args:
+            self: self
+            new_password: (Type: String) Set a new password.
+
+        Raises:
+            None
+
+        Example:
+            Below code block shows how to use::
+
+                router.set_default_wifi_password_5ghz('abcd1234')
+
+        Returns:
+            None
+
+        Caveat:
+            None
+        '''
+        self.set_wifi_password(CN.DEFAULT_BAND_TYPE_5, CN.DEFAULT_AUTHMETHOD, new_password)
+
+    def set_wifi_password(self, band_type, authentication_type, new_password):
+        '''
+        Summary:
+            To set WiFi password for both 2.4GHz and 5 GHz band.
+
+        Description:
+            1) To set WiFi password for both 2.4GHz and 5 GHz band.
+
+        Args:
+            self: self
+            band_type: (Type: String) Network band of either 2.4 GHz or 5 GHz
+            authentication_type: (Type: String): Authentication type. (Supported: WPA2-Personal, WPA-Auto-Personal)
+            new_password: (Type: String) Set a new password.
+
+        Raises:
+            ValueError: Invalid band type
+
+        Example:
+            Below code block shows how to use::
+
+                router.set_wifi_password('5GHz', 'WPA2-Personal', 'PASSWORD!?!?!?!?')
+
+        Returns:
+            None
+
+        Caveat:
+            None
+        '''
+        if authentication_type == CN.ROUTER_WPA2PERSONAL or authentication_type == CN.ROUTER_WPAAUTOPERSONAL:
+            self._wireless(band_type, {'wl_auth_mode_x': CN.ROUTER_AUTH_MODE[authentication_type],
+                                       CN.WPA_PRESHARED_KEY: new_password})
+            self._event("Setting up new password...")
+        else:
+            self._event("Invalid authentication type. Please check", 'error', authentication=authentication_type)
+
+    def set_wpa_encryption(self, band_type, authentication_type, encryption_type):
+        '''
+        Summary:
+            To set WPA encryption type.
+
+        Description:
+            1) To set WPA encryption type
+
+        Args:
+            self: self
+            band_type: (Type: String) Network band of either 2.4 GHz or 5 GHz
+            authentication_type: (Type: String): Authentication type. (Supported: WPA2-Personal, WPA-Auto-Personal)
+            encryption_type: (Type: String) Encryption selection. (Supported: AES and TKIP+AES)
+
+        Raises:
+            ValueError: Invalid band type
+
+        Example:
+            Below code block shows how to use::
+
+                router.set_wpa_encryption('2.4GHz', 'WPA-Auto-Personal', 'AES')
+
+        Returns:
+            None
+
+        Caveat:
+            WPA2-Personal only supports AES.
+        '''
+        if authentication_type == CN.ROUTER_WPAAUTOPERSONAL and encryption_type in CN.ROUTER_CRYPTO:
+            self._wireless(band_type, {'wl_crypto': CN.ROUTER_CRYPTO[encryption_type]})
+            self._event("Setting wpa encryption...")
+        elif authentication_type == CN.ROUTER_WPA2PERSONAL and encryption_type == CN.ROUTER_AES:
+            self._wireless(band_type, {'wl_crypto': CN.ROUTER_CRYPTO[encryption_type]})
+            self._event("Setting wpa encryption...")
+        elif authentication_type == CN.ROUTER_WPA2PERSONAL:
+            self._event("Encryption type not supported", 'error', encryption=encryption_type)
+        else:
+            self._event("Only WPA-Auto-Personal & WPA2-Personal have the option to use different WPA encryption method",
+                        'error', authentication=authentication_type)
+
+    def dhcp_control(self, dhcp_server_status, starting_address, ending_address):
+        '''
+        Summary:
+            To configure DHCP features.
+
+        Description:
+            1) To configure DHCP features.
+
+        Args:
+            self: self
+            dhcp_server_status: (Type: Boolean) : Only two options supported which are True (enable) and False (disable)
+            starting_address: (Type: String) Only change value of X from '192.168.1.X'. X cannot be lower than 1.
+            ending_address:  (Type: String) Only change value of X from '192.168.1.X'. X cannot be higher than 254.
+
+        Raises:
+            None
+
+        Example:
+            Below code block shows how to use::
+
+                router.dhcp_control(True, '192.168.1.25', '192.168.1.150')
+
+        Returns:
+            None
+
+        Caveat:
+            None
+        '''
+        self.submit(CN.ROUTER_DHCP_PAGE, CN.ROUTER_SERVICE_DHCP, {
+            'dhcp_enable_x': '1' if dhcp_server_status == True else '0',
+            'dhcp_start': starting_address,
+            'dhcp_end': ending_address,
+        })
+        self._event("IP Pool", starting_address=starting_address, ending_address=ending_address)
+        self._event("Configuring DHCP control...")
+
+    def set_default_dhcp_address(self):
+        '''
+        Summary:
+            To configure default DHCP features.
+
+        Description:
+            1) To configure default DHCP features.
+
+        Args:
+            self: self
+
+        Raises:
+            None
+
+        Example:
+            Below code block shows how to use::
+
+                router.set_default_dhcp_address()
+
+        Returns:
+            None
+
+        Caveat:
+            None
+        '''
+        self._event("Reset DHCP address")
+        self.dhcp_control(True, CN.DEFAULT_STARTING_ADDRESS, CN.DEFAULT_ENDING_ADDRESS)
+
+    def set_vpn_connection(self, vpn_type, country_name, username, password):
+        '''
+        Summary:
+            To establish a VPN connection.
+
+        Description:
+            1) To establish a VPN connection.
+
+        Args:
+            self: self
+            vpn_type: (Type: String) VPN method. (Supported: PPTP, L2TP and OpenVPN)
+            country_name: (Type: String) Country VPN. (Must refer to ListCountriesVPN.csv and OpenVPN.csv for available country name)
+            username: (Type: String) VPN account name
+            password: (Type: String) VPN account password
+
+        Raises:
+            None
+
+        Example:
+            Below code block shows how to use::
+
+                router.set_vpn_connection('OpenVPN', 'FRANCE', 'admin', 'admin123')
+
+        Returns:
+            None
+
+        Caveat:
+            None
+        '''
+        if vpn_type not in CN.ROUTER_VPN_PROTO:
+            self._event("VPN type is not valid. Please choose 1 of these options: 1. PPTP 2. L2TP 3. OpenVPN", 'error',
+                        vpn_type=vpn_type)
+            return
+        if vpn_type == CN.ROUTER_OPENVPN and not self.transport.can_upload:
+            self._event("OpenVPN profiles cannot be uploaded over the %s backend" % self.transport.name, 'error',
+                        vpn_type=vpn_type)
+            return
+        from VpnCatalog import VpnCatalog
+
+        vpn_list = CN.LISTOPENVPN if vpn_type == CN.ROUTER_OPENVPN else CN.LISTCOUNTRYVPN
+        vpn_server = VpnCatalog.catalog(vpn_list).server(country_name)
+        if vpn_server is None:
+            self._event("Country not found", 'error', country=country_name)
+            return
+        clientlist = self.read(['vpnc_clientlist'])['vpnc_clientlist']
+        if vpn_type == CN.ROUTER_OPENVPN:
+            self.upload(CN.ROUTER_VPN_PAGE, os.path.join(CN.DIROPENVPN, vpn_server),
+                        {'vpn_upload_type': 'ovpn', 'vpn_upload_unit': CN.ROUTER_OPENVPN_UNIT})
+            entry = '<{}>{}>{}>{}>{}'.format(country_name, vpn_type, CN.ROUTER_OPENVPN_UNIT, username, password)
+            if entry not in clientlist:
+                clientlist += entry
+            self.submit(CN.ROUTER_VPN_PAGE, CN.ROUTER_SERVICE_OPENVPN, {
+                'vpnc_clientlist': clientlist,
+                'vpn_client_unit': CN.ROUTER_OPENVPN_UNIT,
+                'vpn_client%s_username' % CN.ROUTER_OPENVPN_UNIT: username,
+                'vpn_client%s_password' % CN.ROUTER_OPENVPN_UNIT: password,
+            })
+        else:
+            entry = '<{}>{}>{}>{}>{}'.format(country_name, vpn_type, vpn_server, username, password)
+            if entry not in clientlist:
+                clientlist += entry
+            self.submit(CN.ROUTER_VPN_PAGE, CN.ROUTER_SERVICE_VPN, {
+                'vpnc_clientlist': clientlist,
+                'vpnc_proto': CN.ROUTER_VPN_PROTO[vpn_type],
+                'vpnc_heartbeat_x': vpn_server,
+                'vpnc_pppoe_username': username,
+                'vpnc_pppoe_passwd': password,
+            })
+        self._event("VPN connected", country=country_name.upper(), vpn_type=vpn_type)
+
+    def toggle_ssid_visibility(self, band_type, visibility):
+        '''
+        Summary:
+            To toggle SSID visibility
+
+        Description:
+            1) To toggle SSID visibility
+
+        Args:
+            self: self
+            band_type: (Type: String) Network band of either 2.4 GHz or 5 GHz
+            visibility: (Type: String) Only support visible or hide
+
+        Raises:
+            None
+
+        Example:
+            Below code block shows how to use::
+
+                router.toggle_ssid_visibility('2.4GHz', 'hide')
+
+        Returns:
+            None
+
+        Caveat:
+            None
+        '''
+        if band_type not in CN.ROUTER_WL_UNIT:
+            self._event("Invalid band type", 'error', band=band_type)
+        elif visibility not in ('hide', 'visible'):
+            self._event("Invalid SSID visibility. Please choose visible or hide", 'error', visibility=visibility)
+        else:
+            self._wireless(band_type, {'wl_closed': '1' if visibility == 'hide' else '0'})
+            self._event("SSID visibility = %s" % visibility)
+
+    def toggle_wan_connection(self, status):
+        '''
+        Summary:
+            To toggle WAN connection.
+
+        Description:
+            1) To toggle WAN connection.
+
+        Args:
+            self: self
+            status: (Type: String) Only support on (connect) and off (disconnect).
+
+        Example:
+            Below code block shows how to use::
+
+                router.toggle_wan_connection(status = 'off')
+
+        Returns:
+            None
+
+        Caveat:
+            None
+        '''
+        if status == 'on':
+            self.submit(CN.ROUTER_WAN_PAGE, CN.ROUTER_SERVICE_WAN, {'wan_enable': '1', 'wan0_enable': '1'})
+        elif status == 'off':
+            self.submit(CN.ROUTER_WAN_PAGE, CN.ROUTER_SERVICE_WAN, {'wan_enable': '0', 'wan0_enable': '0'})
+        else:
+            self._event("Invalid WAN status. Please choose on or off", 'error', status=status)
+            return
+        self._event("WAN connection = %s" % status)
+
+    def reset_router(self, ssid, ssid_5, wifi_password, wifi_password_5, username, password):
+        '''
+        Summary:
+            To reset the router
+
+        Description:
+            1) Restore the factory defaults.
+            2) Sign in with the default account and configure SSID, WiFi password and router account.
+            3) Enable the QoS bandwidth limiter.
+
+        Args:
+            self: self
+            ssid: (Type: String) 2.4GHz SSID
+            ssid_5: (Type: String) 5GHz SSID
+            wifi_password: (Type: String) 2.4GHz WiFi password
+            wifi_password_5: (Type: String) 5GHz WiFi password
+            username: (Type: String) New router username
+            password: (Type: String) New router password
+
+        Example:
+            Below code block shows how to use::
+
+                router.reset_router('iptv_hariz', 'iptv_hariz_5G', 'abcd1234', 'abcd1234', 'admin', 'admin123')
+
+        Returns:
+            (Type: ProbeResult) Readiness and measured downtime of the factory reset
+
+        Caveat:
+            Waits for the router to come back from the factory reset.
+        '''
+        self.submit(CN.ROUTER_BACKUP_PAGE, '', {}, CN.ROUTER_ACTION_RESTORE)
+        result = self.prober.wait_for_reboot(CN.ROUTER_DEFAULT_USERNAME, CN.ROUTER_DEFAULT_PASSWORD)
+        self._event("Router restored", elapsed=result.elapsed, downtime=result.downtime)
+        self.sign_in(CN.ROUTER_DEFAULT_USERNAME, CN.ROUTER_DEFAULT_PASSWORD)
+        self.submit(CN.ROUTER_WIRELESS_PAGE, CN.ROUTER_SERVICE_WIRELESS, {
+            'wl0_ssid': ssid,
+            'wl0_wpa_psk': wifi_password,
+            'wl0_auth_mode_x': CN.ROUTER_AUTH_MODE[CN.DEFAULT_AUTHMETHOD],
+            'wl1_ssid': ssid_5,
+            'wl1_wpa_psk': wifi_password_5,
+            'wl1_auth_mode_x': CN.ROUTER_AUTH_MODE[CN.DEFAULT_AUTHMETHOD],
+            'http_username': username,
+            'http_passwd': password,
+            'x_Setting': '1',
+        })
+        self.prober.wait_up(username, password)
+        self.sign_in(username, password)
+        self.submit(CN.ROUTER_QOS_PAGE, CN.ROUTER_SERVICE_QOS, {'qos_enable': '1', 'qos_type': '2'})
+        return result
@@ -0,0 +1,129 @@
+#!/usr/bin/python3
+import base64
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import ConstantName as CN
+from RouterForm import RouterFormSetting
+from RouterSession import SessionStore
+from RouterTransport import RouterTransport, router_ip
+
+
+class HttpTransport(RouterTransport):
+    name = CN.ROUTER_BACKEND_HTTP
+
+    def __init__(self, ip):
+        '''
+        Summary:
+            Initialize a direct HTTP session to the router.
+
+        Description:
+            1) Initialize a pooled HTTP session to the router login and apply.cgi endpoints.
+            2) No browser is launched; every change is posted straight to apply.cgi.
+
+        Args:
+            self: self
+            ip: (Type: String) Router IP address
+
+        Returns:
+            An object of HttpTransport.
+
+        Caveat:
+            Only the ASUS firmware endpoints login.cgi, apply.cgi, appGet.cgi and vpnupload.cgi are used.
+        '''
+        RouterTransport.__init__(self, ip)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=CN.ROUTER_HTTP_POOLSIZE, pool_maxsize=CN.ROUTER_HTTP_POOLSIZE)
+        self.session.mount(CN.STR_HTTP, adapter)
+        self.session.headers.update({
+            'User-Agent': CN.ROUTER_USER_AGENT,
+            'Referer': self.url(CN.ROUTER_INDEX_PAGE),
+        })
+
+    def sign_in(self, username, password):
+        auth = base64.b64encode((username + CN.STR_COLON + password).encode('utf-8')).decode('ascii')
+        self.session.cookies.clear()
+        self.session.post(self.url(CN.ROUTER_LOGIN_CGI),
+                          data={'login_authorization': auth},
+                          headers={'Referer': self.url(CN.ROUTER_LOGIN_PAGE)},
+                          timeout=CN.ROUTER_HTTP_TIMEOUT)
+        return CN.ROUTER_TOKEN_COOKIE in self.session.cookies
+
+    def submit(self, change):
+        data = {
+            'action_mode': change.action,
+            'action_script': '',
+            'action_wait': '',
+            'rc_service': change.service,
+            'current_page': change.page,
+            'next_page': change.page,
+        }
+        data.update(change.fields)
+        response = self.session.post(self.url(CN.ROUTER_APPLY_CGI), data=data, timeout=CN.ROUTER_HTTP_TIMEOUT)
+        response.raise_for_status()
+        return response
+
+    def read(self, names):
+        hook = ';'.join('nvram_get(%s)' % name for name in names)
+        response = self.session.post(self.url(CN.ROUTER_APPGET_CGI), data={'hook': hook}, timeout=CN.ROUTER_HTTP_TIMEOUT)
+        response.raise_for_status()
+        return response.json()
+
+    def upload(self, filename, fields):
+        with open(filename, 'rb') as upload_file:
+            response = self.session.post(self.url(CN.ROUTER_VPNUPLOAD_CGI), data=fields,
+                                         files={'file': (os.path.basename(filename), upload_file)},
+                                         timeout=CN.ROUTER_HTTP_TIMEOUT)
+        response.raise_for_status()
+        return response
+
+    def cookies(self):
+        return self.session.cookies.get_dict()
+
+    def resume(self, cookies):
+        self.session.cookies.clear()
+        for name, value in cookies.items():
+            self.session.cookies.set(name, value)
+        try:
+            self.read([CN.ROUTER_SESSION_CHECK])
+            return True
+        except (requests.RequestException, ValueError):
+            # The firmware answers an expired token with the login page instead of JSON.
+            self.session.cookies.clear()
+            return False
+
+    def close(self):
+        self.session.close()
+
+
+class RouterHttpSetting(RouterFormSetting):
+    def __init__(self, ip=None, session=True):
+        '''
+        Summary:
+            Initialize router settings over the direct HTTP backend.
+
+        Description:
+            1) Initialize a pooled HTTP session to the router; no browser is launched.
+
+        Args:
+            self: self
+            ip: (Type: String) Router IP address. Default taken from RouterConfig ['HARDWAREINFO']['IP']
+            session: (Type: Boolean) Resume and store the login in RouterSession.SessionStore
+
+        Raises:
+            ValueError: Router IP is not configured
+
+        Example:
+            Below code block shows how to use::
+
+                from RouterHttp import RouterHttpSetting
+
+                router = RouterHttpSetting()
+                router.sign_in('admin', 'admin123')
+
+        Returns:
+            An object of RouterHttpSetting.
+        '''
+        RouterFormSetting.__init__(self, HttpTransport(router_ip(ip)), SessionStore() if session else None)
@@ -0,0 +1,46 @@
+#!/usr/bin/python3
+import importlib
+
+
+class LazyImport(object):
+    def __init__(self, module, name=None):
+        '''
+        Summary:
+            Stand-in for "import module" or "from module import name" that imports on first use.
+
+        Description:
+            1) Nothing is imported until an attribute is read or the object is called.
+            2) Use it for heavy dependencies (eg. the Selenium webdriver stack) needed by a few code paths only.
+
+        Args:
+            self: self
+            module: (Type: String) Module to import, eg. 'selenium.webdriver.common.by'
+            name: (Type: String) Attribute of the module to stand in for, eg. 'By'
+
+        Example:
+            Below code block shows how to use::
+
+                By = LazyImport('selenium.webdriver.common.by', 'By')
+                locator = (By.ID, CN.WIRELESS_MENU)   # selenium is imported here
+
+        Returns:
+            An object of LazyImport.
+
+        Caveat:
+            Not usable in an except clause; import exception classes directly.
+        '''
+        self._module = module
+        self._name = name
+        self._target = None
+
+    def resolve(self):
+        if self._target is None:
+            target = importlib.import_module(self._module)
+            self._target = getattr(target, self._name) if self._name else target
+        return self._target
+
+    def __getattr__(self, attribute):
+        return getattr(self.resolve(), attribute)
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
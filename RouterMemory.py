@@ -0,0 +1,100 @@
+#!/usr/bin/python3
+import os
+import threading
+
+import ConstantName as CN
+
+
+def process_tree_rss(pid):
+    '''
+    Summary:
+        Resident memory of a process and all its descendants (eg. chromedriver, Chrome and its renderers).
+
+    Args:
+        pid: (Type: Integer) Root process id
+
+    Returns:
+        (Type: Integer) Bytes, or None where /proc is not available
+    '''
+    page_size = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+    try:
+        pids = [int(entry) for entry in os.listdir('/proc') if entry.isdigit()]
+    except OSError:
+        return None
+    children, rss = {}, {}
+    for process in pids:
+        try:
+            with open('/proc/%d/stat' % process) as stat:
+                # The process name may hold spaces; fields after it are space separated.
+                parent = int(stat.read().rsplit(')', 1)[1].split()[1])
+            with open('/proc/%d/statm' % process) as statm:
+                rss[process] = int(statm.read().split()[1]) * page_size
+        except (OSError, ValueError, IndexError):
+            continue
+        children.setdefault(parent, []).append(process)
+    if pid not in rss:
+        return None
+    total, pending = 0, [pid]
+    while pending:
+        process = pending.pop()
+        total += rss.get(process, 0)
+        pending.extend(children.get(process, []))
+    return total
+
+
+class PeakMemory(object):
+    def __init__(self, pid=None, interval=CN.ROUTER_MEMORY_SAMPLE):
+        '''
+        Summary:
+            Peak resident memory of a process tree while a block runs.
+
+        Description:
+            1) A background thread samples process_tree_rss every interval seconds.
+            2) The default process is this one, so the test harness, chromedriver, Chrome and its renderers all count.
+
+        Args:
+            self: self
+            pid: (Type: Integer) Root process id. Default this process
+            interval: (Type: Float) Seconds between samples
+
+        Example:
+            Below code block shows how to use::
+
+                with PeakMemory() as memory:
+                    router.set_band_and_ssid('2.4GHz', 'SONY!!')
+                print(memory.peak // (1024 * 1024), 'MB')
+
+        Returns:
+            An object of PeakMemory.
+
+        Caveat:
+            peak stays None where /proc is not available.
+        '''
+        self.pid = os.getpid() if pid is None else pid
+        self.interval = interval
+        self.peak = None
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def sample(self):
+        rss = process_tree_rss(self.pid)
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.sample()
+
+    def __enter__(self):
+        self.peak = None
+        self.stopped.clear()
+        self.sample()
+        self.thread = threading.Thread(target=self.run, name='PeakMemory', daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stopped.set()
+        self.thread.join()
+        self.sample()
+        return False
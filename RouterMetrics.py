@@ -0,0 +1,239 @@
+#!/usr/bin/python3
+'''
+Prometheus metrics of the router automation.
+
+Every RouterSetting (and AsyncRouterSetting) operation, reboot and browser launch
+of this process is recorded in METRICS. Expose them with one of:
+
+    METRICS.write_textfile('/var/lib/node_exporter/textfile/router.prom')   # node_exporter textfile collector
+    serve(port=9108)                                                        # GET http://localhost:9108/metrics
+    GET /metrics of RouterDaemon
+    python RouterCli.py --metrics router.prom ...
+'''
+import bisect
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import ConstantName as CN
+
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def labels_text(names, values, extra=None):
+    pairs = list(zip(names, values)) + ([extra] if extra else [])
+    if not pairs:
+        return ''
+    return '{%s}' % ','.join('%s="%s"' % (name, escape(value)) for name, value in pairs)
+
+
+def number(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter(object):
+    kind = 'counter'
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(str(labels[name]) for name in self.labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def get(self, **labels):
+        return self.values.get(tuple(str(labels[name]) for name in self.labels), 0)
+
+    def samples(self):
+        with self.lock:
+            values = sorted(self.values.items())
+        for key, value in values:
+            yield self.name, labels_text(self.labels, key), value
+
+
+class Histogram(object):
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labels=(), buckets=CN.ROUTER_METRICS_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+        # labels -> [count per bucket (not cumulative), sum]
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(str(labels[name]) for name in self.labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            entry = self.values.get(key)
+            if entry is None:
+                entry = self.values[key] = [[0] * len(self.buckets), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def count(self, **labels):
+        entry = self.values.get(tuple(str(labels[name]) for name in self.labels))
+        return sum(entry[0]) if entry else 0
+
+    def samples(self):
+        with self.lock:
+            values = sorted((key, (list(counts), total)) for key, (counts, total) in self.values.items())
+        for key, (counts, total) in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                yield self.name + '_bucket', labels_text(self.labels, key, ('le', number(bound))), cumulative
+            yield self.name + '_sum', labels_text(self.labels, key), total
+            yield self.name + '_count', labels_text(self.labels, key), cumulative
+
+
+class RouterMetrics(object):
+    def __init__(self):
+        '''
+        Summary:
+            Registry of the router automation metrics, in the Prometheus text format.
+
+        Description:
+            1) router_operation_seconds: duration of every operation, by method and router.
+            2) router_operation_failures_total: failed operations by method, router and exception
+               (eg. TimeoutException, NoSuchElementException, UnexpectedAlertPresentException,
+               LoginFailed, RouterNotReady), including exceptions the operation caught and reported
+               (see Router.OperationFailed).
+            3) router_reboot_downtime_seconds and router_reboots_total: downtime measured by the readiness probe.
+            4) router_browser_launches_total and router_browser_launch_seconds: Chrome launches by device and outcome.
+
+        Example:
+            Below code block shows how to use::
+
+                from RouterMetrics import METRICS
+
+                router.set_channel_no('2.4GHz', 6)
+                print(METRICS.render())
+
+        Returns:
+            An object of RouterMetrics.
+        '''
+        self.operations = Histogram('router_operation_seconds', 'Duration of router operations.',
+                                    ('method', 'router'))
+        self.failures = Counter('router_operation_failures_total', 'Failed router operations by exception type.',
+                                ('method', 'router', 'exception'))
+        self.downtime = Histogram('router_reboot_downtime_seconds', 'Seconds a router was unusable after a reboot.',
+                                  ('router',), CN.ROUTER_METRICS_DOWNTIME_BUCKETS)
+        self.reboots = Counter('router_reboots_total', 'Reboots waited for, by whether the router came back.',
+                               ('router', 'ready'))
+        self.launches = Counter('router_browser_launches_total', 'Chrome launches by device and outcome.',
+                                ('device', 'outcome'))
+        self.launch_time = Histogram('router_browser_launch_seconds', 'Seconds to launch Chrome.', ('device',))
+        self.metrics = [self.operations, self.failures, self.downtime, self.reboots, self.launches, self.launch_time]
+
+    def observe(self, method, router, seconds, result=None, error=None):
+        '''
+        Summary:
+            Record an operation; a raised exception or an unsuccessful result counts as a failure.
+        '''
+        self.operations.observe(seconds, method=method, router=router)
+        if error is not None:
+            self.failure(method, router, error)
+        elif getattr(result, 'ready', True) is False:
+            self.failure(method, router, 'RouterNotReady')
+        elif getattr(result, 'success', True) is False:
+            self.failure(method, router, type(result).__name__.replace('Result', 'Failed'))
+
+    def failure(self, method, router, exception):
+        '''
+        Args:
+            exception: (Type: Exception or String) Exception or the name of the failure
+        '''
+        name = exception if isinstance(exception, str) else type(exception).__name__
+        self.failures.inc(method=method, router=router, exception=name)
+
+    def reboot(self, router, result):
+        self.reboots.inc(router=router, ready=str(result.ready).lower())
+        if result.ready:
+            self.downtime.observe(result.downtime, router=router)
+
+    def launch(self, device, seconds, success):
+        self.launches.inc(device=device, outcome='ok' if success else 'failed')
+        if success:
+            self.launch_time.observe(seconds, device=device)
+
+    def render(self):
+        '''
+        Summary:
+            All metrics in the Prometheus text exposition format.
+        '''
+        lines = []
+        for metric in self.metrics:
+            lines.append('# HELP %s %s' % (metric.name, metric.documentation))
+            lines.append('# TYPE %s %s' % (metric.name, metric.kind))
+            lines.extend('%s%s %s' % (name, labels, number(value)) for name, labels, value in metric.samples())
+        return '\n'.join(lines) + '\n'
+
+    def write_textfile(self, filename=CN.ROUTER_METRICS_FILE):
+        '''
+        Summary:
+            Write the metrics for the node_exporter textfile collector; the file is replaced whole.
+
+        Returns:
+            (Type: String) File written
+        '''
+        partial = '%s.%d.tmp' % (filename, threading.get_ident())
+        with open(partial, 'w') as metrics_file:
+            metrics_file.write(self.render())
+        os.replace(partial, filename)
+        return filename
+
+
+METRICS = RouterMetrics()
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split('?')[0] != '/metrics':
+            self.send_error(404)
+            return
+        body = self.server.metrics.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def serve(host=CN.ROUTER_DAEMON_HOST, port=CN.ROUTER_METRICS_PORT, metrics=METRICS):
+    '''
+    Summary:
+        Serve GET /metrics on a background thread.
+
+    Example:
+        Below code block shows how to use::
+
+            server = serve(port=9108)
+            ...
+            server.shutdown()
+
+    Returns:
+        (Type: ThreadingHTTPServer) Running server
+    '''
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    server.metrics = metrics
+    threading.Thread(target=server.serve_forever, name='RouterMetrics', daemon=True).start()
+    return server
@@ -0,0 +1,665 @@
+#!/usr/bin/python3
+'''
+Local stand-in for the ASUS router web UI.
+
+Serves the login, wireless, LAN/DHCP, QoS, VPN client and WAN pages with the element
+IDs and XPaths of the Router API section in ConstantName.py, accepts the same
+login.cgi, apply.cgi, appGet.cgi and vpnupload.cgi posts and keeps the nvram in memory.
+Artificial latency separates our own overhead from the firmware's apply time.
+
+Run standalone:
+
+    python RouterMock.py --port 8080 --apply-latency 2
+
+and point RouterConfig ['HARDWAREINFO']['IP'] at '127.0.0.1:8080'.
+'''
+import argparse
+import base64
+import email.parser
+import html
+import json
+import re
+import secrets
+import string
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import ConstantName as CN
+
+
+CHANNELS = {
+    '0': ['1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '11'],
+    '1': ['36', '40', '44', '48', '149', '153', '157', '161', '165'],
+}
+
+CLIENTS = ['AA:BB:CC:DD:EE:01', 'AA:BB:CC:DD:EE:02', 'AA:BB:CC:DD:EE:03']
+
+# Fields posted with every form that are not nvram values.
+FORM_FIELDS = ('action_mode', 'action_script', 'action_wait', 'rc_service', 'current_page', 'next_page',
+               'login_authorization', 'login_username', 'login_passwd', 'PC_devicename')
+
+# Pages whose Apply button pops an alert before posting, as the firmware does.
+ALERT_PAGES = (CN.ROUTER_WIRELESS_PAGE, CN.ROUTER_DHCP_PAGE, CN.ROUTER_WAN_PAGE)
+
+
+def default_nvram(username=CN.ROUTER_DEFAULT_USERNAME, password=CN.ROUTER_DEFAULT_PASSWORD):
+    nvram = {
+        'http_username': username,
+        'http_passwd': password,
+        'x_Setting': '1',
+        'dhcp_enable_x': '1',
+        'dhcp_start': CN.DEFAULT_STARTING_ADDRESS,
+        'dhcp_end': CN.DEFAULT_ENDING_ADDRESS,
+        'lan_domain': '',
+        'qos_enable': '0',
+        'qos_type': '0',
+        'qos_bw_rulelist': '',
+        'vpnc_clientlist': '',
+        'vpnc_proto': 'disable',
+        'vpnc_heartbeat_x': '',
+        'vpnc_pppoe_username': '',
+        'vpnc_pppoe_passwd': '',
+        'vpn_client_unit': CN.ROUTER_OPENVPN_UNIT,
+        'vpn_upload_file': '',
+        'wan_enable': '1',
+        'wan0_enable': '1',
+        # Band the wireless page shows, kept across applies like the firmware does
+        'wl_unit': '0',
+    }
+    for unit, suffix in (('0', ''), ('1', '_5G')):
+        nvram.update({
+            'wl%s_ssid' % unit: 'ASUS' + suffix,
+            'wl%s_channel' % unit: CN.ROUTER_AUTO_CHANNEL,
+            'wl%s_auth_mode_x' % unit: CN.ROUTER_AUTH_MODE[CN.DEFAULT_AUTHMETHOD],
+            'wl%s_crypto' % unit: CN.ROUTER_CRYPTO[CN.ROUTER_AES],
+            'wl%s_wpa_psk' % unit: CN.DEFAULT_PASSWORD,
+            'wl%s_closed' % unit: '0',
+        })
+    return nvram
+
+
+LAYOUT = string.Template('''<html>
+<head><title>ASUS Wireless Router - $title</title></head>
+<body>
+<div id="TopBanner">
+<span class="titlebtn" onclick="reboot()">Reboot</span>
+<span class="titlebtn" onclick="go('Main_Login.asp')">Logout</span>
+</div>
+<div id="mainMenu">
+<div id="index_menu" onclick="go('index.asp')">Network Map</div>
+<div id="AdaptiveQoS_Bandwidth_Monitor_menu" onclick="go('QoS_EZQoS.asp')"><table><tbody><tr><td><div class="menu_Icon"></div></td><td>Adaptive QoS</td></tr></tbody></table></div>
+<div id="Advanced_Wireless_Content_menu" onclick="go('Advanced_Wireless_Content.asp')">Wireless</div>
+<div id="Advanced_LAN_Content_menu" onclick="go('Advanced_LAN_Content.asp')">LAN</div>
+<div id="Advanced_WAN_Content_menu" onclick="go('Advanced_WAN_Content.asp')">WAN</div>
+<div id="Advanced_VPN_PPTP_menu" onclick="go('Advanced_VPN_PPTP.asp')">VPN</div>
+</div>
+<div id="tabMenu">$tabs</div>
+<iframe name="hidden_frame" id="hidden_frame" style="display:none"></iframe>
+<div id="Loading" style="display:none">Applying settings...</div>
+<form method="post" name="form" action="/apply.cgi">
+<input type="hidden" name="current_page" value="$page">
+<input type="hidden" name="next_page" value="$page">
+<input type="hidden" name="action_mode" value="apply">
+<input type="hidden" name="action_script" value="">
+<input type="hidden" name="action_wait" value="">
+<input type="hidden" name="rc_service" value="$service">
+$content
+</form>
+$extra
+<script>
+var nvram = $nvram;
+function go(page) { location.href = '/' + page; }
+function reboot() {
+    if (confirm('Are you sure you want to reboot?')) {
+        document.form.action_mode.value = 'reboot';
+        document.form.submit();
+    }
+}
+function applyRule() {
+    if ($alert) { alert('Settings have been applied.'); }
+    document.getElementById('Loading').style.display = '';
+    document.form.submit();
+}
+$script
+</script>
+</body>
+</html>''')
+
+LOGIN = string.Template('''<html>
+<head><title>ASUS Login</title></head>
+<body>
+<form method="post" name="form" action="/login.cgi">
+<input type="hidden" name="login_authorization" value="">
+<input type="hidden" name="next_page" value="index.asp">
+<div>Sign in with your router account</div>
+<input type="text" id="login_username" name="login_username" value="">
+<input type="password" name="login_passwd" value="">
+$error
+<div class="button" onclick="login()">Sign In</div>
+</form>
+<script>
+function login() {
+    var f = document.form;
+    f.login_authorization.value = btoa(f.login_username.value + ':' + f.login_passwd.value);
+    f.login_username.disabled = true;
+    f.login_passwd.disabled = true;
+    f.submit();
+}
+</script>
+</body>
+</html>''')
+
+LAN_TABS = ('<div id="Advanced_LAN_Content_tab" onclick="go(\'Advanced_LAN_Content.asp\')"><span>LAN IP</span></div>'
+            '<div id="Advanced_DHCP_Content_tab" onclick="go(\'Advanced_DHCP_Content.asp\')"><span>DHCP Server</span></div>')
+QOS_TABS = '<div id="QoS_EZQoS_tab" onclick="go(\'QoS_EZQoS.asp\')"><span>QoS</span></div>'
+VPN_TABS = ('<div id="Advanced_VPN_PPTP_tab" onclick="go(\'Advanced_VPN_PPTP.asp\')"><span>VPN Server</span></div>'
+            '<div id="Advanced_VPNClient_tab" onclick="go(\'Advanced_VPNClient_Content.asp\')"><span>VPN Client</span></div>')
+
+
+def divs(count):
+    return ''.join('<div class="formfontdesc"></div>' for i in range(count))
+
+
+def radio(name, value):
+    return ('<input type="radio" name="{0}" value="1"{1}>Yes'
+            '<input type="radio" name="{0}" value="0"{2}>No').format(
+                name, ' checked' if value == '1' else '', ' checked' if value != '1' else '')
+
+
+def wireless_page(nvram):
+    content = '''<table id="WLgeneral"><tbody>
+<tr><th>Band</th><td><select name="wl_unit" onchange="changeUnit(this.value)"><option value="0">2.4GHz</option><option value="1">5GHz</option></select></td></tr>
+<tr><th>Network Name (SSID)</th><td><input type="text" name="wl_ssid" maxlength="32" value=""></td></tr>
+<tr><th>Control Channel</th><td><select name="wl_channel" id="wl_channel"></select></td></tr>
+<tr><th>Authentication Method</th><td><select name="wl_auth_mode_x"><option value="open">Open System</option><option value="psk2">WPA2-Personal</option><option value="pskpsk2">WPA-Auto-Personal</option></select></td></tr>
+<tr><th>Hide SSID</th><td><input type="radio" name="wl_closed" value="1">Yes<input type="radio" name="wl_closed" value="0">No</td></tr>
+<tr><th>WPA Encryption</th><td><select name="wl_crypto"><option value="aes">AES</option><option value="tkip+aes">TKIP+AES</option></select></td></tr>
+<tr><th>WPA Pre-Shared Key</th><td><input type="password" name="wl_wpa_psk" value=""></td></tr>
+</tbody></table>
+<div class="apply_gen"><input type="button" class="button_gen" id="applyButton" value="Apply" onclick="applyRule()"></div>'''
+    script = '''var channels = %s;
+function changeUnit(unit) {
+    var f = document.form, prefix = 'wl' + unit + '_';
+    f.wl_ssid.value = nvram[prefix + 'ssid'];
+    f.wl_channel.options.length = 0;
+    f.wl_channel.options.add(new Option('Auto', '0'));
+    for (var i = 0; i < channels[unit].length; i++) { f.wl_channel.options.add(new Option(channels[unit][i], channels[unit][i])); }
+    f.wl_channel.value = nvram[prefix + 'channel'];
+    f.wl_auth_mode_x.value = nvram[prefix + 'auth_mode_x'];
+    f.wl_crypto.value = nvram[prefix + 'crypto'];
+    f.wl_wpa_psk.value = nvram[prefix + 'wpa_psk'];
+    f.wl_closed[0].checked = (nvram[prefix + 'closed'] == '1');
+    f.wl_closed[1].checked = (nvram[prefix + 'closed'] != '1');
+}
+document.form.wl_unit.value = nvram.wl_unit;
+changeUnit(nvram.wl_unit);''' % json.dumps(CHANNELS)
+    return 'Wireless', '', CN.ROUTER_SERVICE_WIRELESS, content, '', script
+
+
+def dhcp_page(nvram):
+    content = '''<table id="FormTitle"><tbody><tr><td>
+<div class="formfonttitle">LAN - DHCP Server</div>%s
+<table><tbody>
+<tr><th>Enable the DHCP Server</th><td>%s</td></tr>
+<tr><th>Domain Name</th><td><input type="text" name="lan_domain" value="%s"></td></tr>
+<tr><th>IP Pool Starting Address</th><td><input type="text" name="dhcp_start" value="%s"></td></tr>
+<tr><th>IP Pool Ending Address</th><td><input type="text" name="dhcp_end" value="%s"></td></tr>
+</tbody></table>
+%s<div class="apply_gen"><input type="button" class="button_gen" value="Apply" onclick="applyRule()"></div>
+</td></tr></tbody></table>''' % (divs(4), radio('dhcp_enable_x', nvram['dhcp_enable_x']), html.escape(nvram['lan_domain']),
+                                 html.escape(nvram['dhcp_start']), html.escape(nvram['dhcp_end']), divs(3))
+    return 'DHCP Server', LAN_TABS, CN.ROUTER_SERVICE_DHCP, content, '', ''
+
+
+def lan_page(nvram):
+    content = '<table id="FormTitle"><tbody><tr><td><div class="formfonttitle">LAN - LAN IP</div></td></tr></tbody></table>'
+    return 'LAN IP', LAN_TABS, '', content, '', ''
+
+
+def wan_page(nvram):
+    content = '''<table id="FormTitle"><tbody><tr><td>
+<div class="formfonttitle">WAN - Internet Connection</div>%s
+<table id="t2BC"><tbody>
+<tr><th colspan="2">Basic Config</th></tr>
+<tr><th>Enable WAN</th><td>%s</td></tr>
+</tbody></table>
+%s<div class="apply_gen"><input type="button" class="button_gen" value="Apply" onclick="applyRule()"></div>
+</td></tr></tbody></table>''' % (divs(3), radio('wan_enable', nvram['wan_enable']), divs(2))
+    return 'WAN', '', CN.ROUTER_SERVICE_WAN, content, '', ''
+
+
+def qos_page(nvram, clients):
+    client_list = ''.join('<div id="{0}" onclick="setClient(\'{0}\')">{0}</div>'.format(mac) for mac in clients)
+    content = '''<input type="hidden" name="qos_enable" value="1">
+<input type="hidden" name="qos_type" value="2">
+<input type="hidden" name="qos_bw_rulelist" value="%s">
+<table id="FormTitle"><tbody><tr><td>
+<div class="formfonttitle">Adaptive QoS - QoS</div>
+<table><tbody><tr><td>
+<input type="text" id="PC_devicename" name="PC_devicename" value="">
+<input type="button" id="pull_arrow" value="v" onclick="pullList()">
+<div id="ClientList_Block_PC" style="display:none">%s</div>
+<input type="text" id="download_rate" value="">
+<input type="text" id="upload_rate" value="">
+<input type="button" id="add_delete" value="+" onclick="addRow()">
+</td></tr></tbody></table>
+<table id="mainTable_table"><tbody></tbody></table>
+<div class="apply_gen"><span class="button_gen" onclick="applyRule()">Apply</span></div>
+</td></tr></tbody></table>''' % (html.escape(nvram['qos_bw_rulelist']), client_list)
+    script = '''function rules() {
+    var list = document.form.qos_bw_rulelist.value.split('<'), result = [];
+    for (var i = 1; i < list.length; i++) { result.push(list[i].split('>')); }
+    return result;
+}
+function renderTable() {
+    var rows = rules(), html = '<tr><th colspan="5">Bandwidth Limiter</th></tr>' +
+        '<tr><th>Enabled</th><th>Client Name</th><th>Download</th><th>Upload</th><th>Delete</th></tr>';
+    if (rows.length == 0) { html += '<tr><td colspan="5">No data in table.</td></tr>'; }
+    for (var i = 0; i < rows.length; i++) {
+        html += '<tr><td>' + rows[i][0] + '</td><td>' + rows[i][1] + '</td><td>' + rows[i][2] / 1024 + ' Mb/s</td><td>' +
+            rows[i][3] / 1024 + ' Mb/s</td><td><div class="remove_btn" onclick="delRow(' + i + ')">-</div></td></tr>';
+    }
+    document.getElementById('mainTable_table').tBodies[0].innerHTML = html;
+}
+function pullList() { document.getElementById('ClientList_Block_PC').style.display = 'block'; }
+function setClient(mac) {
+    document.getElementById('PC_devicename').value = mac;
+    document.getElementById('ClientList_Block_PC').style.display = 'none';
+}
+function addRow() {
+    var f = document.form;
+    f.qos_bw_rulelist.value += '<1>' + document.getElementById('PC_devicename').value + '>' +
+        document.getElementById('download_rate').value * 1024 + '>' + document.getElementById('upload_rate').value * 1024 + '>0';
+    renderTable();
+}
+function delRow(index) {
+    var rows = rules(), list = '';
+    rows.splice(index, 1);
+    for (var i = 0; i < rows.length; i++) { list += '<' + rows[i].join('>'); }
+    document.form.qos_bw_rulelist.value = list;
+    renderTable();
+}
+renderTable();'''
+    return 'QoS', QOS_TABS, CN.ROUTER_SERVICE_QOS, content, '', script
+
+
+def vpn_server_page(nvram):
+    content = '<table id="FormTitle"><tbody><tr><td><div class="formfonttitle">VPN - VPN Server</div></td></tr></tbody></table>'
+    return 'VPN Server', VPN_TABS, '', content, '', ''
+
+
+def vpn_client_page(nvram):
+    rows = ''
+    for index, entry in enumerate(nvram['vpnc_clientlist'].split('<')[1:]):
+        values = entry.split('>')
+        rows += ('<tr><td>{1}</td><td>{2}</td><td>{3}</td>'
+                 '<td><input type="button" class="button_gen" value="Activate" onclick="activate({0})"></td>'
+                 '<td><div class="remove_btn" onclick="delProfile({0})">-</div></td></tr>').format(
+                     index, *[html.escape(value) for value in values[:3]])
+    if not rows:
+        rows = '<tr><td colspan="5">No data in table.</td></tr>'
+    content = '''<input type="hidden" name="vpnc_clientlist" value="%s">
+<input type="hidden" name="vpnc_proto" value="%s">
+<input type="hidden" name="vpnc_heartbeat_x" value="%s">
+<input type="hidden" name="vpnc_pppoe_username" value="%s">
+<input type="hidden" name="vpnc_pppoe_passwd" value="%s">
+<table id="FormTitle"><tbody><tr><td><table><tbody>
+<tr><td><div class="formfonttitle">VPN - VPN Client</div></td></tr>
+<tr><td><div class="formfontdesc">Add a VPN profile, then activate it.</div><div class="apply_gen"><input type="button" class="button_gen" value="Add profile" onclick="showAdd()"></div></td></tr>
+<tr><td><div id="vpnc_clientlist_Block"><table><tbody>%s</tbody></table></div></td></tr>
+</tbody></table></td></tr></tbody></table>
+<div id="vpnc_setting" style="display:none">
+<div><span id="pptpcTitle_pptp" onclick="showTab('PPTP')">PPTP</span> <span id="l2tpcTitle_pptp" onclick="showTab('L2TP')">L2TP</span> <span id="opencTitle_pptp" onclick="showTab('OpenVPN')">OpenVPN</span></div>
+<div id="openvpnc_setting"><table><tbody>
+<tr><td><div class="formfontdesc"></div></td></tr>
+<tr><td><div><table><tbody>
+<tr><th>Description</th><td><input type="text" id="vpnc_des_edit" value=""></td></tr>
+<tr><th>VPN Server</th><td><input type="text" id="vpnc_svr_edit" value=""></td></tr>
+<tr><th>Username</th><td><input type="text" id="vpnc_account_edit" value=""></td></tr>
+<tr><th>Password</th><td><input type="text" id="vpnc_pwd_edit" value=""></td></tr>
+</tbody></table></div></td></tr>
+</tbody></table>
+<div><input type="button" class="button_gen" value="Cancel" onclick="hideAdd()"><input type="button" class="button_gen" value="OK" onclick="addProfile()"></div>
+</div>
+<div id="openvpnc_setting_openvpn" style="display:none"><table><tbody>
+<tr><td><div class="formfontdesc"></div></td></tr>
+<tr><td><div class="formfontdesc"></div></td></tr>
+<tr><td><div><table><tbody>
+<tr><th>Description</th><td><input type="text" id="vpnc_openvpn_des" value=""></td></tr>
+<tr><th>Username</th><td><input type="text" id="vpnc_openvpn_username" value=""></td></tr>
+<tr><th>Password</th><td><input type="text" id="vpnc_openvpn_pwd" value=""></td></tr>
+<tr><th>Import .ovpn file</th><td><input type="file" name="file" form="openvpnManualForm"><input type="button" class="button_gen" value="Upload" onclick="document.openvpnManualForm.submit()"></td></tr>
+</tbody></table></div></td></tr>
+</tbody></table>
+<div><input type="button" class="button_gen" value="Cancel" onclick="hideAdd()"><input type="button" class="button_gen" value="OK" onclick="addProfile()"></div>
+</div>
+</div>''' % tuple([html.escape(nvram[name]) for name in ('vpnc_clientlist', 'vpnc_proto', 'vpnc_heartbeat_x',
+                                                     'vpnc_pppoe_username', 'vpnc_pppoe_passwd')] + [rows])
+    extra = '''<form method="post" name="openvpnManualForm" id="openvpnManualForm" action="/vpnupload.cgi" target="hidden_frame" enctype="multipart/form-data">
+<input type="hidden" name="vpn_upload_type" value="ovpn">
+<input type="hidden" name="vpn_upload_unit" value="%s">
+</form>''' % CN.ROUTER_OPENVPN_UNIT
+    script = '''var vpnType = 'PPTP';
+function showAdd() { document.getElementById('vpnc_setting').style.display = 'block'; showTab('PPTP'); }
+function hideAdd() { document.getElementById('vpnc_setting').style.display = 'none'; }
+function showTab(type) {
+    vpnType = type;
+    document.getElementById('openvpnc_setting').style.display = (type == 'OpenVPN') ? 'none' : 'block';
+    document.getElementById('openvpnc_setting_openvpn').style.display = (type == 'OpenVPN') ? 'block' : 'none';
+}
+function field(id) { return document.getElementById(id).value; }
+function addProfile() {
+    var f = document.form;
+    if (vpnType == 'OpenVPN') {
+        f.vpnc_clientlist.value += '<' + [field('vpnc_openvpn_des'), vpnType, '%s', field('vpnc_openvpn_username'), field('vpnc_openvpn_pwd')].join('>');
+    } else {
+        f.vpnc_clientlist.value += '<' + [field('vpnc_des_edit'), vpnType, field('vpnc_svr_edit'), field('vpnc_account_edit'), field('vpnc_pwd_edit')].join('>');
+    }
+    f.rc_service.value = '';
+    f.submit();
+}
+function activate(index) {
+    var f = document.form, entry = f.vpnc_clientlist.value.split('<')[index + 1].split('>');
+    if (entry[1] == 'OpenVPN') {
+        f.rc_service.value = '%s';
+    } else {
+        f.vpnc_proto.value = entry[1].toLowerCase();
+        f.vpnc_heartbeat_x.value = entry[2];
+        f.vpnc_pppoe_username.value = entry[3];
+        f.vpnc_pppoe_passwd.value = entry[4];
+        f.rc_service.value = '%s';
+    }
+    f.submit();
+}
+function delProfile(index) {
+    var f = document.form, list = f.vpnc_clientlist.value.split('<');
+    list.splice(index + 1, 1);
+    f.vpnc_clientlist.value = list.join('<');
+    f.rc_service.value = '';
+    f.submit();
+}''' % (CN.ROUTER_OPENVPN_UNIT, CN.ROUTER_SERVICE_OPENVPN, CN.ROUTER_SERVICE_VPN)
+    return 'VPN Client', VPN_TABS, CN.ROUTER_SERVICE_VPN, content, extra, script
+
+
+def index_page(nvram):
+    content = '<table id="FormTitle"><tbody><tr><td><div class="formfonttitle">Network Map</div></td></tr></tbody></table>'
+    return 'Network Map', '', '', content, '', ''
+
+
+class MockRouter(object):
+    def __init__(self, host=CN.ROUTER_MOCK_HOST, port=CN.ROUTER_MOCK_PORT, username=CN.ROUTER_DEFAULT_USERNAME,
+                 password=CN.ROUTER_DEFAULT_PASSWORD, page_latency=0, apply_latency=0, reboot_time=CN.ROUTER_DELAY2SEC,
+                 clients=None):
+        '''
+        Summary:
+            Initialize a mock ASUS router.
+
+        Description:
+            1) Keep nvram-like state in memory, starting from the factory defaults.
+            2) Delay page loads by page_latency and apply.cgi by apply_latency seconds.
+            3) Drop every request for reboot_time seconds after a reboot or restore.
+
+        Args:
+            self: self
+            host: (Type: String) Address to listen on
+            port: (Type: Integer) Port to listen on. 0 picks a free port
+            username: (Type: String) Router account username
+            password: (Type: String) Router account password
+            page_latency: (Type: Float) Seconds added to every page load
+            apply_latency: (Type: Float) Seconds added to every apply.cgi post
+            reboot_time: (Type: Float) Seconds the router stays down after a reboot
+            clients: (Type: List) MAC addresses listed in the QoS client list
+
+        Example:
+            Below code block shows how to use::
+
+                from RouterMock import MockRouter
+
+                mock = MockRouter(port=0, apply_latency=0.5).start()
+                routerconfig.hardware['HARDWAREINFO']['IP'] = mock.address
+                ...
+                mock.stop()
+
+        Returns:
+            An object of MockRouter.
+        '''
+        self.host = host
+        self.port = port
+        self.page_latency = page_latency
+        self.apply_latency = apply_latency
+        self.reboot_time = reboot_time
+        self.clients = clients or CLIENTS
+        self.nvram = default_nvram(username, password)
+        self.tokens = set()
+        self.history = []
+        self.down_until = 0
+        self.lock = threading.Lock()
+        self.server = None
+        self.thread = None
+
+    @property
+    def address(self):
+        return '%s:%d' % (self.host, self.port)
+
+    def start(self):
+        self.server = ThreadingHTTPServer((self.host, self.port), MockRouterHandler)
+        self.server.daemon_threads = True
+        self.server.router = self
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, name='MockRouter', daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def is_down(self):
+        return time.time() < self.down_until
+
+    def reboot(self):
+        with self.lock:
+            self.tokens.clear()
+            self.down_until = time.time() + self.reboot_time
+
+    def login(self, authorization):
+        try:
+            username, password = base64.b64decode(authorization).decode('utf-8').split(CN.STR_COLON, 1)
+        except ValueError:
+            return None
+        if username != self.nvram['http_username'] or password != self.nvram['http_passwd']:
+            return None
+        token = secrets.token_hex(16)
+        with self.lock:
+            self.tokens.add(token)
+        return token
+
+    def apply(self, fields):
+        action = fields.get('action_mode', CN.ROUTER_ACTION_APPLY)
+        page = fields.get('current_page', '')
+        self.history.append((page, fields.get('rc_service', ''), action))
+        if action == CN.ROUTER_ACTION_REBOOT:
+            self.reboot()
+            return
+        if action == CN.ROUTER_ACTION_RESTORE:
+            with self.lock:
+                self.nvram = default_nvram()
+            self.reboot()
+            return
+        time.sleep(self.apply_latency)
+        unit = fields.get('wl_unit')
+        with self.lock:
+            for name, value in fields.items():
+                if name in FORM_FIELDS:
+                    continue
+                if name.startswith('wl_') and unit is not None and name not in CN.ROUTER_SELECTOR_FIELDS:
+                    name = 'wl%s_%s' % (unit, name[3:])
+                self.nvram[name] = value
+            if 'wan_enable' in fields:
+                self.nvram['wan0_enable'] = fields['wan_enable']
+
+    def render(self, page):
+        pages = {
+            CN.ROUTER_INDEX_PAGE: index_page,
+            CN.ROUTER_WIRELESS_PAGE: wireless_page,
+            CN.ROUTER_DHCP_PAGE: dhcp_page,
+            'Advanced_LAN_Content.asp': lan_page,
+            CN.ROUTER_WAN_PAGE: wan_page,
+            CN.ROUTER_QOS_PAGE: lambda nvram: qos_page(nvram, self.clients),
+            'Advanced_VPN_PPTP.asp': vpn_server_page,
+            CN.ROUTER_VPN_PAGE: vpn_client_page,
+        }
+        if page not in pages:
+            return None
+        with self.lock:
+            nvram = dict(self.nvram)
+        title, tabs, service, content, extra, script = pages[page](nvram)
+        return LAYOUT.substitute(title=title, tabs=tabs, page=page, service=service, content=content, extra=extra,
+                                 script=script, nvram=json.dumps(nvram).replace('</', '<\\/'),
+                                 alert='true' if page in ALERT_PAGES else 'false')
+
+
+class MockRouterHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def router(self):
+        return self.server.router
+
+    def send(self, status, body, content_type='text/html', headers=None):
+        body = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def redirect(self, page, headers=None):
+        headers = dict(headers or {})
+        headers['Location'] = CN.STR_FORWARDSLASH + page
+        self.send(302, '', headers=headers)
+
+    def authorized(self):
+        cookies = self.headers.get('Cookie', '')
+        match = re.search(CN.ROUTER_TOKEN_COOKIE + r'=([0-9a-f]+)', cookies)
+        return match is not None and match.group(1) in self.router.tokens
+
+    def form(self):
+        length = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(length)
+        content_type = self.headers.get('Content-Type', '')
+        if content_type.startswith('multipart/form-data'):
+            message = email.parser.BytesParser().parsebytes(
+                b'Content-Type: ' + content_type.encode('latin-1') + b'\r\n\r\n' + body)
+            fields = {}
+            for part in message.get_payload():
+                name = part.get_param('name', header='content-disposition')
+                filename = part.get_filename()
+                fields[name] = filename if filename else part.get_payload(decode=True).decode('utf-8', 'replace')
+            return fields
+        return dict((name, values[-1]) for name, values in parse_qs(body.decode('utf-8'), keep_blank_values=True).items())
+
+    def dropped(self):
+        if self.router.is_down():
+            self.close_connection = True
+            return True
+        return False
+
+    def do_GET(self):
+        if self.dropped():
+            return
+        url = urlsplit(self.path)
+        page = url.path.lstrip(CN.STR_FORWARDSLASH) or CN.ROUTER_LOGIN_PAGE
+        time.sleep(self.router.page_latency)
+        if page == CN.ROUTER_LOGIN_PAGE:
+            error = ''
+            if 'error' in parse_qs(url.query):
+                error = '<div id="error_status_field">Invalid username or password</div>'
+            self.send(200, LOGIN.substitute(error=error))
+        elif page == CN.ROUTER_APPGET_CGI:
+            self.app_get(parse_qs(url.query).get('hook', [''])[0])
+        elif not self.authorized():
+            self.redirect(CN.ROUTER_LOGIN_PAGE)
+        else:
+            body = self.router.render(page)
+            if body is None:
+                self.send(404, 'Not Found', 'text/plain')
+            else:
+                self.send(200, body)
+
+    def do_POST(self):
+        if self.dropped():
+            return
+        page = urlsplit(self.path).path.lstrip(CN.STR_FORWARDSLASH)
+        fields = self.form()
+        if page == CN.ROUTER_LOGIN_CGI:
+            self.login(fields)
+        elif not self.authorized():
+            self.send(401, json.dumps({'error_status': '2'}), 'application/json')
+        elif page == CN.ROUTER_APPLY_CGI:
+            self.router.apply(fields)
+            next_page = fields.get('next_page') or CN.ROUTER_INDEX_PAGE
+            self.send(200, '<html><script>location.href = "/%s";</script></html>' % next_page)
+        elif page == CN.ROUTER_APPGET_CGI:
+            self.app_get(fields.get('hook', ''))
+        elif page == CN.ROUTER_VPNUPLOAD_CGI:
+            with self.router.lock:
+                self.router.nvram['vpn_upload_file'] = fields.get('file') or ''
+            self.send(200, '<html><script>parent.document.title = "uploaded";</script></html>')
+        else:
+            self.send(404, 'Not Found', 'text/plain')
+
+    def login(self, fields):
+        token = self.router.login(fields.get('login_authorization', ''))
+        browser = 'next_page' in fields
+        if token is None:
+            if browser:
+                self.redirect(CN.ROUTER_LOGIN_PAGE + '?error=1')
+            else:
+                self.send(200, json.dumps({'error_status': '3'}), 'application/json')
+            return
+        cookie = {'Set-Cookie': '%s=%s; path=/; HttpOnly' % (CN.ROUTER_TOKEN_COOKIE, token)}
+        if browser:
+            self.redirect(fields['next_page'], cookie)
+        else:
+            self.send(200, json.dumps({CN.ROUTER_TOKEN_COOKIE: token}), 'application/json', cookie)
+
+    def app_get(self, hook):
+        if not self.authorized():
+            self.send(401, json.dumps({'error_status': '2'}), 'application/json')
+            return
+        with self.router.lock:
+            values = dict((name, self.router.nvram.get(name, '')) for name in re.findall(r'nvram_get\((\w+)\)', hook))
+        self.send(200, json.dumps(values), 'application/json')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local mock ASUS router web server')
+    parser.add_argument('--host', default=CN.ROUTER_MOCK_HOST)
+    parser.add_argument('--port', type=int, default=CN.ROUTER_MOCK_PORT)
+    parser.add_argument('--username', default=CN.ROUTER_DEFAULT_USERNAME)
+    parser.add_argument('--password', default=CN.ROUTER_DEFAULT_PASSWORD)
+    parser.add_argument('--page-latency', type=float, default=0, help='seconds added to every page load')
+    parser.add_argument('--apply-latency', type=float, default=0, help='seconds added to every apply.cgi post')
+    parser.add_argument('--reboot-time', type=float, default=CN.ROUTER_DELAY2SEC, help='seconds the router stays down after a reboot')
+    args = parser.parse_args()
+    mock = MockRouter(args.host, args.port, args.username, args.password,
+                      args.page_latency, args.apply_latency, args.reboot_time).start()
+    print("Mock router listening on http://%s/%s" % (mock.address, CN.ROUTER_LOGIN_PAGE))
+    try:
+        mock.thread.join()
+    except KeyboardInterrupt:
+        mock.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,219 @@
+#!/usr/bin/python3
+import collections
+import json
+import time
+
+import ConstantName as CN
+from RouterEvents import EVENTS
+
+
+# One step of a playbook: its number (1 based), the RouterSetting operation and its arguments,
+# and whether the playbook stops or continues when it fails.
+Step = collections.namedtuple('Step', 'number operation args kwargs on_error')
+
+# One row of a playbook run: the step number (None for the apply of a batch), the operation,
+# the router page it writes, whether it passed, its return value, the error and the seconds it took.
+StepResult = collections.namedtuple('StepResult', 'step operation page success result error elapsed')
+
+# Outcome of a playbook run: the rows, whether every step passed, the first error and the total seconds.
+PlaybookResult = collections.namedtuple('PlaybookResult', 'steps success error elapsed')
+
+
+def load_playbook(filename):
+    '''
+    Summary:
+        Load a playbook file, YAML (.yaml, .yml) or JSON.
+    '''
+    with open(filename) as playbook_file:
+        if filename.endswith(('.yaml', '.yml')):
+            # PyYAML is only needed for YAML playbooks.
+            import yaml
+
+            return yaml.safe_load(playbook_file)
+        return json.load(playbook_file)
+
+
+class RouterPlaybook(object):
+    def __init__(self, playbook, on_error=CN.ROUTER_PLAYBOOK_STOP):
+        '''
+        Summary:
+            Ordered list of router operations run on one signed-in RouterSetting.
+
+        Description:
+            1) Adjacent steps writing the same router page (CN.ROUTER_OPERATION_PAGES) run in one transaction,
+               so the page is applied and its service restarted once.
+            2) Every step is timed; the apply of a batch is reported as its own row.
+            3) A failing step stops the playbook, or is skipped when its on_error is 'continue'.
+               Steps of a batch that passed before the failure are still applied.
+
+        Args:
+            self: self
+            playbook: (Type: String, List or Dict) Playbook file, list of steps, or {'on_error': ..., 'steps': [...]}.
+                A step is an operation name, {operation: [args]}, {operation: {kwargs}} or
+                {'operation': name, 'args': [...], 'kwargs': {...}, 'on_error': 'continue'}
+            on_error: (Type: String) Default policy of the steps, 'stop' or 'continue'
+
+        Raises:
+            ValueError: Malformed step or unknown operation
+
+        Example:
+            Below code block shows how to use::
+
+                # nightly.yaml
+                # on_error: stop
+                # steps:
+                #   - set_band_and_ssid: [2.4GHz, iptv_lab]
+                #   - set_wifi_password: [2.4GHz, WPA2-Personal, abcd1234]
+                #   - dhcp_control: {dhcp_server_status: true, starting_address: 192.168.1.20, ending_address: 192.168.1.100}
+                #   - {operation: set_bandwidth_limit, args: ['AA:BB:CC:DD:EE:FF', 50, 25], on_error: continue}
+
+                router.sign_in('admin', 'admin123')
+                result = RouterPlaybook('nightly.yaml').run(router)
+                print(RouterPlaybook.table(result))
+
+        Returns:
+            An object of RouterPlaybook.
+        '''
+        # File name of the playbook, logged with its outcome.
+        self.name = playbook if isinstance(playbook, str) else None
+        if isinstance(playbook, str):
+            playbook = load_playbook(playbook)
+        if isinstance(playbook, dict):
+            on_error = playbook.get('on_error', on_error)
+            playbook = playbook.get('steps') or []
+        self.on_error = on_error
+        self.steps = [self.parse(number, step) for number, step in enumerate(playbook, 1)]
+
+    def parse(self, number, step):
+        from Router import RouterSetting
+
+        on_error = self.on_error
+        if isinstance(step, str):
+            operation, params = step, None
+        elif isinstance(step, dict) and 'operation' in step:
+            operation, on_error = step['operation'], step.get('on_error', on_error)
+            params = step.get('kwargs') or {}
+            if step.get('args'):
+                params = (step['args'], params)
+        elif isinstance(step, dict) and len(step) == 1:
+            operation, params = next(iter(step.items()))
+        else:
+            raise ValueError("Step %d: expected an operation name or a single {operation: arguments} entry" % number)
+        if isinstance(params, tuple):
+            args, kwargs = params
+        elif isinstance(params, dict):
+            args, kwargs = (), params
+        elif params is None:
+            args, kwargs = (), {}
+        else:
+            args, kwargs = params if isinstance(params, list) else [params], {}
+        if (operation.startswith('_') or operation in CN.ROUTER_PRIVATE_OPERATIONS
+                or not callable(getattr(RouterSetting, operation, None))):
+            raise ValueError("Step %d: unknown operation %s" % (number, operation))
+        if on_error not in (CN.ROUTER_PLAYBOOK_STOP, CN.ROUTER_PLAYBOOK_CONTINUE):
+            raise ValueError("Step %d: on_error must be stop or continue" % number)
+        return Step(number, operation, tuple(args), dict(kwargs), on_error)
+
+    def batches(self):
+        '''
+        Summary:
+            Split the steps into runs of adjacent steps writing the same page; other steps run alone.
+        '''
+        batch, page = [], None
+        for step in self.steps:
+            step_page = CN.ROUTER_OPERATION_PAGES.get(step.operation)
+            if batch and (step_page is None or step_page != page):
+                yield page, batch
+                batch = []
+            batch.append(step)
+            page = step_page
+        if batch:
+            yield page, batch
+
+    def step(self, router, step, page):
+        start = time.perf_counter()
+        value, error = None, None
+        try:
+            value = getattr(router, step.operation)(*step.args, **step.kwargs)
+            if getattr(value, 'ready', True) is False:
+                error = "Router not ready after %.1fs" % value.elapsed
+            elif getattr(value, 'success', True) is False:
+                error = getattr(value, 'message', None) or "Operation failed"
+        except Exception as err:
+            error = '%s: %s' % (type(err).__name__, err)
+        return StepResult(step.number, step.operation, page, error is None, value, error, time.perf_counter() - start)
+
+    def run(self, router):
+        '''
+        Summary:
+            Run the playbook on a signed-in router.
+
+        Args:
+            self: self
+            router: (Type: RouterSetting) Signed-in router, any backend
+
+        Returns:
+            (Type: PlaybookResult)
+        '''
+        start = time.perf_counter()
+        rows, stopped = [], False
+        for page, batch in self.batches():
+            if page is None or len(batch) == 1:
+                row = self.step(router, batch[0], page)
+                rows.append(row)
+                stopped = not row.success and batch[0].on_error == CN.ROUTER_PLAYBOOK_STOP
+            else:
+                staged = []
+                apply_start = None
+                try:
+                    with router.transaction():
+                        for step in batch:
+                            row = self.step(router, step, page)
+                            staged.append(row)
+                            if not row.success and step.on_error == CN.ROUTER_PLAYBOOK_STOP:
+                                stopped = True
+                                break
+                        apply_start = time.perf_counter()
+                    applied = [row for row in staged if row.success]
+                    rows.extend(staged)
+                    if applied:
+                        rows.append(StepResult(None, 'apply', page, True, len(applied), None,
+                                               time.perf_counter() - apply_start))
+                except Exception as err:
+                    # The apply of the batch failed, so none of its steps reached the router.
+                    error = '%s: %s' % (type(err).__name__, err)
+                    rows.extend(row._replace(success=False, error=row.error or 'Apply failed') for row in staged)
+                    rows.append(StepResult(None, 'apply', page, False, None, error,
+                                           time.perf_counter() - (apply_start or start)))
+                    stopped = any(step.on_error == CN.ROUTER_PLAYBOOK_STOP for step in batch)
+            if stopped:
+                break
+        failed = [row for row in rows if not row.success]
+        error = None
+        if failed:
+            row = failed[0]
+            error = '%s %s: %s' % ('Step %d' % row.step if row.step else 'Apply of', row.operation if row.step else row.page,
+                                   row.error)
+        result = PlaybookResult(rows, not failed, error, time.perf_counter() - start)
+        EVENTS.emit('playbook', router=router.transport.ip, playbook=self.name,
+                    outcome='ok' if result.success else 'failed', duration=result.elapsed,
+                    steps=len([row for row in rows if row.step]), failed=len(failed),
+                    skipped=len(self.steps) - max(row.step or 0 for row in rows) if stopped else 0, error=error)
+        return result
+
+    @staticmethod
+    def table(result):
+        '''
+        Summary:
+            Format a playbook result as a table, one line per step and per batch apply.
+
+        Returns:
+            (Type: String) Table of step, operation, status, seconds and error
+        '''
+        lines = ["{:<6}{:<40}{:<8}{:>10}  {}".format('step', 'operation', 'status', 'time (s)', 'error')]
+        for row in result.steps:
+            lines.append("{:<6}{:<40}{:<8}{:>10.3f}  {}".format(
+                row.step or '', row.operation if row.step else '  apply %s' % row.page,
+                'ok' if row.success else 'FAILED', row.elapsed, row.error or ''))
+        lines.append("{:<54}{:>10.3f}".format('total', result.elapsed))
+        return '\n'.join(lines)
@@ -0,0 +1,256 @@
+#!/usr/bin/python3
+import contextlib
+import queue
+import threading
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+import ConstantName as CN
+import RouterConfig as routerconfig
+from RouterEvents import EVENTS
+from RouterTransport import router_ip
+
+
+class PooledBrowser(object):
+    '''
+    Warm SeleniumTransport of a BrowserPool, with how often it was leased.
+    '''
+    def __init__(self, transport):
+        self.transport = transport
+        self.uses = 0
+        self.broken = False
+
+
+class BrowserPool(object):
+    def __init__(self, ip=None, device=None, username=None, password=None, size=CN.ROUTER_POOL_SIZE,
+                 max_uses=CN.ROUTER_POOL_MAX_USES, max_memory=CN.ROUTER_POOL_MAX_MEMORY):
+        '''
+        Summary:
+            Pool of Chrome instances kept warm, signed in and parked on the router main page.
+
+        Description:
+            1) A maintainer thread launches size browsers, one at a time, and signs them in.
+            2) lease() hands out a RouterSetting on an idle browser, so an operation starts without launching Chrome.
+            3) A returned browser is parked on the main page again, signed in again if its session expired,
+               or recycled (quit and replaced) when broken, used max_uses times or above max_memory.
+
+        Args:
+            self: self
+            ip: (Type: String) Router IP address. Default RouterConfig ['HARDWAREINFO']['IP']
+            device: (Type: String) Host running the browsers, 'orangepi' or 'pc'. Default RouterConfig ['HARDWAREINFO']['DEVICE']
+            username: (Type: String) Router username. Default RouterConfig ['HARDWAREINFO']['USERNAME']
+            password: (Type: String) Router password. Default RouterConfig ['HARDWAREINFO']['PASSWORD']
+            size: (Type: Integer) Browsers kept warm
+            max_uses: (Type: Integer) Leases before a browser is recycled
+            max_memory: (Type: Integer) Bytes of resident memory (Chrome and its renderers) before a browser is recycled
+
+        Example:
+            Below code block shows how to use::
+
+                pool = BrowserPool(size=2, username='admin', password='admin123').start()
+                with pool.lease() as router:
+                    router.set_band_and_ssid('2.4GHz', 'SONY!!')
+                with pool.lease() as router:
+                    router.set_channel_no('2.4GHz', 6)
+                pool.close()
+
+        Returns:
+            An object of BrowserPool.
+
+        Caveat:
+            Every browser holds its own router session; the router must allow size concurrent logins.
+        '''
+        info = routerconfig.hardware['HARDWAREINFO']
+        self.ip = router_ip(ip)
+        self.device = device or info['DEVICE']
+        self.username = username or info['USERNAME'] or CN.ROUTER_DEFAULT_USERNAME
+        self.password = password or info['PASSWORD'] or CN.ROUTER_DEFAULT_PASSWORD
+        self.size = size
+        self.max_uses = max_uses
+        self.max_memory = max_memory
+        self.idle = queue.Queue()
+        self.returned = queue.Queue()
+        self.browsers = []
+        self.lock = threading.Lock()
+        self.closed = False
+        self.maintainer = None
+
+    def start(self):
+        '''
+        Summary:
+            Start warming the browsers in the background.
+
+        Returns:
+            (Type: BrowserPool) self
+        '''
+        self.maintainer = threading.Thread(target=self.maintain, name='BrowserPool', daemon=True)
+        self.maintainer.start()
+        return self
+
+    def launch(self):
+        from RouterSelenium import SeleniumTransport
+
+        return SeleniumTransport(self.ip, self.device)
+
+    def warm(self):
+        '''
+        Summary:
+            Launch a browser, sign it in and make it available.
+
+        Returns:
+            (Type: Boolean) True if the browser joined the pool
+        '''
+        start = time.perf_counter()
+        try:
+            transport = self.launch()
+        except WebDriverException as err:
+            EVENTS.emit('step', router=self.ip, level='error', message="Browser launch failed",
+                        error=str(err).strip().split('\n')[0])
+            return False
+        try:
+            signed_in = transport.sign_in(self.username, self.password)
+        except WebDriverException:
+            signed_in = False
+        if not signed_in:
+            EVENTS.emit('step', router=self.ip, level='error', message="Browser login failed")
+            transport.close()
+            return False
+        entry = PooledBrowser(transport)
+        with self.lock:
+            self.browsers.append(entry)
+        self.idle.put(entry)
+        EVENTS.emit('step', router=self.ip, level='info', message="Browser ready",
+                    elapsed=time.perf_counter() - start, browsers=len(self.browsers), size=self.size)
+        return True
+
+    def maintain(self):
+        retry_at = 0
+        while not self.closed:
+            launch = len(self.browsers) < self.size and time.perf_counter() >= retry_at
+            try:
+                entry = self.returned.get_nowait() if launch else self.returned.get(timeout=CN.ROUTER_POOL_POLL)
+            except queue.Empty:
+                entry = None
+            if entry is not None:
+                self.park(entry)
+            elif launch and not self.warm():
+                retry_at = time.perf_counter() + CN.ROUTER_POOL_RETRY
+
+    def park(self, entry):
+        '''
+        Summary:
+            Make a returned browser available again, or recycle it.
+        '''
+        reason = None
+        if self.closed:
+            reason = 'pool closed'
+        elif entry.broken:
+            reason = 'broken'
+        elif entry.uses >= self.max_uses:
+            reason = 'used %d times' % entry.uses
+        else:
+            memory = entry.transport.memory()
+            if memory is not None and memory > self.max_memory:
+                reason = 'using %d MB' % (memory // (1024 * 1024))
+        if reason is None:
+            transport = entry.transport
+            try:
+                transport.browser.get(transport.url(CN.ROUTER_INDEX_PAGE))
+                if not transport.alive() and not transport.sign_in(self.username, self.password):
+                    reason = 'login failed'
+            except WebDriverException:
+                reason = 'not responding'
+        if reason is None:
+            self.idle.put(entry)
+        else:
+            self.retire(entry, reason)
+
+    def retire(self, entry, reason):
+        with self.lock:
+            if entry in self.browsers:
+                self.browsers.remove(entry)
+        EVENTS.emit('step', router=self.ip, level='info', message="Recycling browser", reason=reason)
+        try:
+            entry.transport.close()
+        except WebDriverException:
+            pass
+
+    def acquire(self, timeout=CN.ROUTER_POOL_LEASE_TIMEOUT):
+        '''
+        Summary:
+            Take an idle browser that is still signed in.
+
+        Raises:
+            TimeoutError: No browser free within timeout
+            RuntimeError: Pool closed
+        '''
+        deadline = time.perf_counter() + timeout
+        while True:
+            if self.closed:
+                raise RuntimeError("Browser pool closed")
+            try:
+                entry = self.idle.get(timeout=max(deadline - time.perf_counter(), 0))
+            except queue.Empty:
+                raise TimeoutError("No browser free after %ss" % timeout)
+            if entry.transport.alive():
+                return entry
+            self.returned.put(entry)
+
+    def release(self, entry):
+        entry.uses += 1
+        self.returned.put(entry)
+
+    @contextlib.contextmanager
+    def lease(self, timeout=CN.ROUTER_POOL_LEASE_TIMEOUT):
+        '''
+        Summary:
+            Lease a warm browser as a signed-in RouterSetting.
+
+        Args:
+            self: self
+            timeout: (Type: Float) Seconds to wait for a free browser
+
+        Raises:
+            TimeoutError: No browser free within timeout
+
+        Example:
+            Below code block shows how to use::
+
+                with pool.lease() as router:
+                    router.dhcp_control(True, '192.168.1.25', '192.168.1.150')
+        '''
+        from Router import RouterSetting
+
+        entry = self.acquire(timeout)
+        try:
+            router = RouterSetting(session=False, transport=entry.transport)
+            router.credentials = (self.username, self.password)
+            yield router
+        except WebDriverException:
+            entry.broken = True
+            raise
+        finally:
+            self.release(entry)
+
+    def stats(self):
+        '''
+        Summary:
+            Uses and resident memory (bytes) of every browser of the pool.
+        '''
+        with self.lock:
+            browsers = list(self.browsers)
+        return [{'uses': entry.uses, 'memory': entry.transport.memory()} for entry in browsers]
+
+    def close(self):
+        '''
+        Summary:
+            Stop the maintainer and quit every browser. Call it once every lease is returned.
+        '''
+        self.closed = True
+        if self.maintainer is not None:
+            self.maintainer.join()
+        with self.lock:
+            browsers = list(self.browsers)
+        for entry in browsers:
+            self.retire(entry, 'pool closed')
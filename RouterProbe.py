@@ -0,0 +1,244 @@
+#!/usr/bin/python3
+import base64
+import collections
+import platform
+import socket
+import subprocess
+import time
+import urllib.parse
+
+import ConstantName as CN
+from RouterMetrics import METRICS
+
+
+# ready: the router accepted a login (or served Main_Login.asp when no credentials were given)
+# went_down: the router was seen going down before coming back
+# downtime: seconds from the first failed probe to ready
+# elapsed: seconds spent in the prober
+# stage: last probe that succeeded (icmp, tcp, http or login)
+ProbeResult = collections.namedtuple('ProbeResult', 'ready went_down downtime elapsed stage')
+
+
+class ProbeSchedule(object):
+    def __init__(self, stages, interval, max_interval, timeout, since=None):
+        '''
+        Summary:
+            Order, backoff and deadline of the readiness probes, without running them.
+
+        Description:
+            1) stage is the next probe to run, each one only once the previous one passed.
+            2) record the outcome of the probe; it returns the seconds to wait before the next one,
+               backing off exponentially between failed probes up to max_interval.
+            3) stage is None once every probe passed or timeout seconds are over.
+
+        Args:
+            self: self
+            stages: (Type: List) Probe names, in order, eg. ['icmp', 'tcp', 'http', 'login']
+            interval: (Type: Float) First polling interval in seconds
+            max_interval: (Type: Float) Polling interval cap in seconds
+            timeout: (Type: Float) Give up after this many seconds
+            since: (Type: Float) perf_counter time the router went down, for the downtime
+
+        Example:
+            Below code block shows how to use::
+
+                schedule = ProbeSchedule(['tcp', 'http'], 0.5, 8, 360)
+                while schedule.stage is not None:
+                    time.sleep(schedule.record(probes[schedule.stage]()))
+                result = schedule.result(went_down=False)
+
+        Returns:
+            An object of ProbeSchedule.
+
+        Caveat:
+            Shared by ReadinessProber and the awaitable RouterAsync.AsyncRouterSetting, which run the probes.
+        '''
+        self.start = time.perf_counter()
+        self.since = self.start if since is None else since
+        self.stages = list(stages)
+        self.interval = interval
+        self.max_interval = max_interval
+        self.deadline = self.start + timeout
+        self.backoff = interval
+        self.passed = None
+
+    @property
+    def stage(self):
+        if self.stages and time.perf_counter() < self.deadline:
+            return self.stages[0]
+        return None
+
+    def record(self, success):
+        if success:
+            self.passed = self.stages.pop(0)
+            self.backoff = self.interval
+            return 0
+        delay = min(self.backoff, max(self.deadline - time.perf_counter(), 0))
+        self.backoff = min(self.backoff * 2, self.max_interval)
+        return delay
+
+    def result(self, went_down):
+        now = time.perf_counter()
+        return ProbeResult(not self.stages, went_down, now - self.since, now - self.start, self.passed)
+
+
+class ReadinessProber(object):
+    def __init__(self, ip, interval=CN.ROUTER_PROBE_INTERVAL, max_interval=CN.ROUTER_PROBE_MAX_INTERVAL,
+                 timeout=CN.ROUTER_DELAY6MIN, down_timeout=CN.ROUTER_PROBE_DOWN_TIMEOUT):
+        '''
+        Summary:
+            Initialize a readiness prober for the router.
+
+        Description:
+            1) Detect the router going down after a reboot or reset.
+            2) Poll ICMP, then TCP, then HTTP Main_Login.asp, then login.cgi with exponential backoff.
+            3) Return as soon as the router is usable, with the measured downtime.
+
+        Args:
+            self: self
+            ip: (Type: String) Router IP address, optionally with port (eg. '127.0.0.1:8080')
+            interval: (Type: Float) First polling interval in seconds
+            max_interval: (Type: Float) Polling interval cap in seconds
+            timeout: (Type: Float) Give up waiting for the router after this many seconds
+            down_timeout: (Type: Float) Give up waiting for the router to go down after this many seconds
+
+        Example:
+            Below code block shows how to use::
+
+                prober = ReadinessProber('192.168.1.1')
+                result = prober.wait_for_reboot('admin', 'admin123')
+                print(result.downtime)
+
+        Returns:
+            An object of ReadinessProber.
+        '''
+        self.ip = ip
+        url = urllib.parse.urlsplit(CN.STR_HTTP + ip)
+        self.host = url.hostname
+        self.port = url.port or 80
+        self.base_url = CN.STR_HTTP + ip + CN.STR_FORWARDSLASH
+        self.interval = interval
+        self.max_interval = max_interval
+        self.timeout = timeout
+        self.down_timeout = down_timeout
+
+    def icmp(self):
+        count = '-n' if platform.system() == 'Windows' else '-c'
+        try:
+            return subprocess.call(['ping', count, '1', self.host], stdout=subprocess.DEVNULL,
+                                   stderr=subprocess.DEVNULL, timeout=CN.ROUTER_PROBE_SOCKET_TIMEOUT) == 0
+        except subprocess.TimeoutExpired:
+            return False
+        except OSError:
+            # No ping binary or no permission: let the TCP probe decide.
+            return True
+
+    def tcp(self):
+        try:
+            socket.create_connection((self.host, self.port), timeout=CN.ROUTER_PROBE_SOCKET_TIMEOUT).close()
+            return True
+        except OSError:
+            return False
+
+    def http(self):
+        import urllib.error
+        import urllib.request
+
+        try:
+            response = urllib.request.urlopen(self.base_url + CN.ROUTER_LOGIN_PAGE, timeout=CN.ROUTER_PROBE_SOCKET_TIMEOUT)
+            response.read()
+            return response.status == 200
+        except (OSError, urllib.error.URLError, ValueError):
+            return False
+
+    def login(self, username, password):
+        import urllib.error
+        import urllib.request
+
+        auth = base64.b64encode((username + CN.STR_COLON + password).encode('utf-8')).decode('ascii')
+        request = urllib.request.Request(self.base_url + CN.ROUTER_LOGIN_CGI,
+                                         data=urllib.parse.urlencode({'login_authorization': auth}).encode('ascii'),
+                                         headers={'User-Agent': CN.ROUTER_USER_AGENT,
+                                                  'Referer': self.base_url + CN.ROUTER_LOGIN_PAGE})
+        try:
+            response = urllib.request.urlopen(request, timeout=CN.ROUTER_PROBE_SOCKET_TIMEOUT)
+            response.read()
+            return CN.ROUTER_TOKEN_COOKIE in (response.headers.get('Set-Cookie') or '')
+        except (OSError, urllib.error.URLError, ValueError):
+            return False
+
+    def schedule(self, stages, since=None, timeout=None):
+        '''
+        Summary:
+            ProbeSchedule of the given probes with the intervals of the prober.
+        '''
+        return ProbeSchedule(stages, self.interval, self.max_interval, self.timeout if timeout is None else timeout, since)
+
+    def wait_down(self):
+        '''
+        Summary:
+            Wait for the router to stop serving its web UI.
+
+        Returns:
+            (Type: Float) perf_counter time the router was first seen down, or None if it never went down
+        '''
+        deadline = time.perf_counter() + self.down_timeout
+        while time.perf_counter() < deadline:
+            if not self.http():
+                return time.perf_counter()
+            time.sleep(self.interval)
+        return None
+
+    def wait_up(self, username=None, password=None, since=None):
+        '''
+        Summary:
+            Wait for the router to be usable again.
+
+        Description:
+            1) Poll ICMP, TCP, HTTP and login in order, each stage only once the previous one passed.
+            2) Back off exponentially between failed polls, up to max_interval.
+
+        Args:
+            self: self
+            username: (Type: String) Router username. Skip the login stage when None
+            password: (Type: String) Router password
+            since: (Type: Float) perf_counter time the router went down, for the downtime
+
+        Returns:
+            (Type: ProbeResult)
+        '''
+        probes = {'icmp': self.icmp, 'tcp': self.tcp, 'http': self.http, 'login': lambda: self.login(username, password)}
+        schedule = self.schedule(['icmp', 'tcp', 'http'] + (['login'] if username is not None else []), since)
+        while schedule.stage is not None:
+            time.sleep(schedule.record(probes[schedule.stage]()))
+        return schedule.result(since is not None)
+
+    def wait_for_reboot(self, username=None, password=None):
+        '''
+        Summary:
+            Wait for a reboot to complete.
+
+        Description:
+            1) Wait for the router to go down.
+            2) Wait for it to come back and accept a login.
+            3) Record the downtime in RouterMetrics.METRICS.
+
+        Args:
+            self: self
+            username: (Type: String) Router username. Skip the login stage when None
+            password: (Type: String) Router password
+
+        Example:
+            Below code block shows how to use::
+
+                result = prober.wait_for_reboot('admin', 'admin123')
+
+        Returns:
+            (Type: ProbeResult)
+        '''
+        start = time.perf_counter()
+        down = self.wait_down()
+        result = self.wait_up(username, password, down)
+        result = result._replace(went_down=down is not None, elapsed=time.perf_counter() - start)
+        METRICS.reboot(self.ip, result)
+        return result
@@ -0,0 +1,281 @@
+#!/usr/bin/python3
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import (TimeoutException, NoSuchElementException, UnexpectedAlertPresentException,
+                                        WebDriverException)
+
+import ConstantName as CN
+from RouterEvents import EVENTS
+from RouterMemory import process_tree_rss
+from RouterMetrics import METRICS
+from RouterTransport import RouterTransport
+from RouterWait import RouterWait
+
+
+# =======if running on orange pi=============
+chrome_options = Options()
+chrome_options.add_argument('--no-sandbox')
+chrome_options.add_argument('--headless')
+chrome_options.add_argument('--disable-dev-shm-usage')
+
+# =======low memory profile (orange pi, CN.ROUTER_CHROME_LOW_MEMORY)=======
+LOW_MEMORY_ARGUMENTS = (
+    '--no-sandbox',
+    '--headless',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-software-rasterizer',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-background-timer-throttling',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--no-first-run',
+    '--mute-audio',
+    # One process per site would start a renderer per frame origin.
+    '--disable-features=site-per-process,Translate,MediaRouter,OptimizationHints',
+    '--blink-settings=imagesEnabled=false',
+    '--disk-cache-size=1',
+    '--media-cache-size=1',
+)
+
+
+def low_memory_options(user_data_dir):
+    '''
+    Summary:
+        Chrome options for hosts with about 1 GB of memory shared with the test harness.
+
+    Description:
+        1) Headless, no GPU, extensions, background networking or images.
+        2) Renderer processes and the JavaScript heap are capped.
+        3) The profile lives in user_data_dir (a tmpfs), so nothing is written to the SD card.
+
+    Args:
+        user_data_dir: (Type: String) Chrome profile directory
+
+    Returns:
+        (Type: Options) Chrome options
+    '''
+    options = Options()
+    for argument in LOW_MEMORY_ARGUMENTS:
+        options.add_argument(argument)
+    options.add_argument('--renderer-process-limit=%d' % CN.ROUTER_CHROME_RENDERERS)
+    options.add_argument('--js-flags=--max-old-space-size=%d' % CN.ROUTER_CHROME_JS_HEAP)
+    options.add_argument('--user-data-dir=' + user_data_dir)
+    options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+    return options
+
+
+def block_resources(browser):
+    '''
+    Summary:
+        Stop the browser from downloading stylesheets, fonts and images (CN.ROUTER_CHROME_BLOCKED).
+
+    Caveat:
+        Needs a chromedriver supporting Chrome DevTools commands; otherwise only images stay blocked.
+    '''
+    try:
+        browser.execute_cdp_cmd('Network.enable', {})
+        browser.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(CN.ROUTER_CHROME_BLOCKED)})
+    except (AttributeError, WebDriverException):
+        EVENTS.emit('step', level='warning', message="Stylesheets and fonts not blocked: chromedriver has no DevTools commands")
+
+# Writes every field of a Change into document.form, adding hidden inputs for nvram
+# names the page does not render, then posts the form to apply.cgi.
+SUBMIT_SCRIPT = '''
+var form = document.form, fields = arguments[0];
+for (var name in fields) {
+    var el = form.elements[name];
+    if (!el) {
+        el = document.createElement('input');
+        el.type = 'hidden';
+        el.name = name;
+        form.appendChild(el);
+    }
+    if (el.length !== undefined && el.tagName === undefined) {
+        for (var i = 0; i < el.length; i++) { el[i].checked = (el[i].value == fields[name]); }
+    } else {
+        el.value = fields[name];
+    }
+}
+form.action = '/apply.cgi';
+form.submit();
+'''
+
+# Reads nvram values through the authenticated browser session.
+READ_SCRIPT = '''
+var xhr = new XMLHttpRequest();
+xhr.open('POST', '/appGet.cgi', false);
+xhr.setRequestHeader('Content-Type', 'application/x-www-form-urlencoded');
+xhr.send('hook=' + encodeURIComponent(arguments[0]));
+return xhr.responseText;
+'''
+
+# Attaches the extra fields to the form owning the file input and posts it to vpnupload.cgi.
+UPLOAD_SCRIPT = '''
+var form = arguments[0].form, fields = arguments[1];
+for (var name in fields) {
+    var el = document.createElement('input');
+    el.type = 'hidden';
+    el.name = name;
+    el.value = fields[name];
+    form.appendChild(el);
+}
+form.action = '/vpnupload.cgi';
+form.submit();
+'''
+
+
+class SeleniumTransport(RouterTransport):
+    name = CN.ROUTER_BACKEND_SELENIUM
+    direct = False
+
+    def __init__(self, ip, device):
+        '''
+        Summary:
+            Launch Chrome and open the router login page.
+
+        Description:
+            1) Launch a headless Chrome on the OrangePi or a visible one on a PC.
+               On the OrangePi the low memory profile is used unless CN.ROUTER_CHROME_LOW_MEMORY is False.
+               Launches are counted in RouterMetrics.METRICS.
+            2) Open Main_Login.asp of the router.
+
+        Args:
+            self: self
+            ip: (Type: String) Router IP address
+            device: (Type: String) Host running the browser, 'orangepi' or 'pc'
+
+        Raises:
+            ValueError: Device not supported
+
+        Returns:
+            An object of SeleniumTransport.
+
+        Caveat:
+            RouterSetting drives this browser page by page; submit and read give form-level access.
+        '''
+        RouterTransport.__init__(self, ip)
+        self.user_data_dir = None
+        device = device.lower()
+        if device not in ('orangepi', 'pc'):
+            raise ValueError("Device not supported. Please check the API documentation")
+        start = time.perf_counter()
+        try:
+            self.browser = self.launch(device)
+        except Exception:
+            METRICS.launch(device, time.perf_counter() - start, False)
+            raise
+        METRICS.launch(device, time.perf_counter() - start, True)
+        # Explicit waits only: a failed lookup must fail now, not after the implicit wait.
+        self.browser.implicitly_wait(0)
+        self.wait = RouterWait(self.browser)
+        self.browser.get(self.url(CN.ROUTER_LOGIN_PAGE))
+
+    def launch(self, device):
+        if device == 'orangepi' and CN.ROUTER_CHROME_LOW_MEMORY:
+            tmpfs = CN.ROUTER_CHROME_TMPFS if os.path.isdir(CN.ROUTER_CHROME_TMPFS) else None
+            self.user_data_dir = tempfile.mkdtemp(prefix='router-chrome-', dir=tmpfs)
+            try:
+                browser = webdriver.Chrome(chrome_options=low_memory_options(self.user_data_dir))
+            except Exception:
+                shutil.rmtree(self.user_data_dir, ignore_errors=True)
+                raise
+            block_resources(browser)
+            return browser
+        if device == 'orangepi':
+            return webdriver.Chrome(chrome_options=chrome_options)
+        return webdriver.Chrome()
+
+    def sign_in(self, username, password):
+        if CN.ROUTER_LOGIN_PAGE not in self.browser.current_url:
+            self.browser.get(self.url(CN.ROUTER_LOGIN_PAGE))
+        self.wait.fill_form({(By.ID, CN.LOGIN_USER): username, (By.NAME, CN.LOGIN_PASS): password})
+        page = self.browser.find_element_by_tag_name('html')
+        self.wait.click((By.CLASS_NAME, CN.SIGN_IN_BUTTON))
+        try:
+            return self.wait.login(page)[0]
+        except TimeoutException:
+            return False
+
+    def submit(self, change):
+        self.browser.get(self.url(change.page))
+        fields = dict(change.fields)
+        fields.update({'action_mode': change.action, 'rc_service': change.service,
+                       'current_page': change.page, 'next_page': change.page})
+        page = self.browser.find_element_by_tag_name('html')
+        self.browser.execute_script(SUBMIT_SCRIPT, fields)
+        try:
+            self.wait.navigation(page)
+        except UnexpectedAlertPresentException:
+            self.wait.alert()
+            self.wait.navigation(page)
+
+    def read(self, names):
+        hook = ';'.join('nvram_get(%s)' % name for name in names)
+        return json.loads(self.browser.execute_script(READ_SCRIPT, hook))
+
+    def upload(self, filename, fields):
+        self.browser.get(self.url(CN.ROUTER_VPN_PAGE))
+        try:
+            upload = self.browser.find_element_by_css_selector('input[type=file][name=file]')
+        except NoSuchElementException:
+            upload = self.browser.find_element_by_xpath(CN.CHOOSE_FILE)
+        upload.send_keys(filename)
+        page = self.browser.find_element_by_tag_name('html')
+        self.browser.execute_script(UPLOAD_SCRIPT, upload, fields)
+        self.wait.navigation(page)
+
+    def cookies(self):
+        return dict((cookie['name'], cookie['value']) for cookie in self.browser.get_cookies())
+
+    def resume(self, cookies):
+        for name, value in cookies.items():
+            self.browser.add_cookie({'name': name, 'value': value, 'path': CN.STR_FORWARDSLASH})
+        self.browser.get(self.url(CN.ROUTER_INDEX_PAGE))
+        self.wait.page_loaded()
+        if CN.ROUTER_INDEX_PAGE in self.browser.current_url and self.browser.find_elements_by_id(CN.MAIN_MENU):
+            return True
+        self.browser.delete_all_cookies()
+        if CN.ROUTER_LOGIN_PAGE not in self.browser.current_url:
+            self.browser.get(self.url(CN.ROUTER_LOGIN_PAGE))
+        return False
+
+    def alive(self):
+        '''
+        Summary:
+            Whether the browser still responds and its router session is still signed in.
+        '''
+        try:
+            self.read([CN.ROUTER_SESSION_CHECK])
+            return True
+        except (WebDriverException, ValueError):
+            return False
+
+    def memory(self):
+        '''
+        Summary:
+            Resident memory of chromedriver, Chrome and its renderers.
+
+        Returns:
+            (Type: Integer) Bytes, or None where it cannot be measured
+        '''
+        try:
+            return process_tree_rss(self.browser.service.process.pid)
+        except AttributeError:
+            return None
+
+    def close(self):
+        try:
+            self.browser.quit()
+        finally:
+            if self.user_data_dir is not None:
+                shutil.rmtree(self.user_data_dir, ignore_errors=True)
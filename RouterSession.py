@@ -0,0 +1,128 @@
+#!/usr/bin/python3
+import json
+import os
+import threading
+import time
+
+import ConstantName as CN
+
+
+class SessionStore(object):
+    # One lock per session file, shared by every store writing it (eg. RouterFleet workers).
+    _locks = {}
+    _locks_lock = threading.Lock()
+
+    def __init__(self, path=None):
+        '''
+        Summary:
+            Local store of authenticated router sessions.
+
+        Description:
+            1) Keep the auth cookies of every router session, keyed by router IP and user.
+            2) A new RouterSetting resumes a stored session and only signs in when the router rejects it.
+
+        Args:
+            self: self
+            path: (Type: String) JSON file holding the sessions. Default ~/.router_sessions.json
+
+        Example:
+            Below code block shows how to use::
+
+                sessions = SessionStore()
+                if not sessions.resume(transport, 'admin'):
+                    transport.sign_in('admin', 'admin123')
+                    sessions.store(transport, 'admin')
+
+        Returns:
+            An object of SessionStore.
+
+        Caveat:
+            The file holds live router credentials; it is written readable by its owner only.
+        '''
+        self.path = path or os.path.join(os.path.expanduser('~'), CN.ROUTER_SESSION_FILE)
+        with self._locks_lock:
+            self.lock = self._locks.setdefault(os.path.abspath(self.path), threading.Lock())
+
+    @staticmethod
+    def key(ip, username):
+        return ip + CN.ROUTER_SESSION_SEPARATOR + username
+
+    def sessions(self):
+        try:
+            with open(self.path) as session_file:
+                return json.load(session_file)
+        except (OSError, ValueError):
+            return {}
+
+    def write(self, sessions):
+        import tempfile
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix='.sessions')
+        try:
+            with os.fdopen(descriptor, 'w') as session_file:
+                json.dump(sessions, session_file, indent=2)
+            os.chmod(temp_path, 0o600)
+            os.replace(temp_path, self.path)
+        finally:
+            # Gone once replaced; left behind by any failure before.
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+    def load(self, ip, username):
+        '''
+        Summary:
+            Stored cookies of a router session.
+
+        Returns:
+            (Type: Dict) Cookie name to value, or None when no session is stored
+        '''
+        entry = self.sessions().get(self.key(ip, username))
+        return entry['cookies'] if entry else None
+
+    def save(self, ip, username, cookies):
+        if not cookies:
+            return
+        with self.lock:
+            sessions = self.sessions()
+            sessions[self.key(ip, username)] = {'cookies': cookies, 'saved': time.strftime('%Y-%m-%dT%H:%M:%S%z')}
+            self.write(sessions)
+
+    def discard(self, ip, username):
+        with self.lock:
+            sessions = self.sessions()
+            if sessions.pop(self.key(ip, username), None) is not None:
+                self.write(sessions)
+
+    def resume(self, transport, username):
+        '''
+        Summary:
+            Resume the stored session of username on a transport.
+
+        Description:
+            1) Hand the stored cookies to the transport, which checks them against the router.
+            2) Drop the stored session when the router rejects it.
+
+        Args:
+            self: self
+            transport: (Type: RouterTransport) Transport to the router
+            username: (Type: String) Router username
+
+        Returns:
+            (Type: Boolean) True if the router accepted the stored session
+        '''
+        cookies = self.load(transport.ip, username)
+        if cookies is None:
+            return False
+        if transport.resume(cookies):
+            return True
+        self.discard(transport.ip, username)
+        return False
+
+    def store(self, transport, username):
+        '''
+        Summary:
+            Save the session of a transport that just signed in.
+        '''
+        self.save(transport.ip, username, transport.cookies())
@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+import shlex
+
+import paramiko
+
+import ConstantName as CN
+from RouterTransport import RouterTransport
+
+
+class SshTransport(RouterTransport):
+    name = CN.ROUTER_BACKEND_SSH
+    # The firmware only takes OpenVPN profiles through vpnupload.cgi.
+    can_upload = False
+
+    def __init__(self, ip):
+        '''
+        Summary:
+            Initialize an SSH channel to the router.
+
+        Description:
+            1) Changes are written with nvram set / nvram commit and applied with the firmware's service command.
+            2) The connection is opened on sign_in, using the router account.
+
+        Args:
+            self: self
+            ip: (Type: String) Router IP address
+
+        Returns:
+            An object of SshTransport.
+
+        Caveat:
+            SSH must be enabled on the router (Administration > System > Enable SSH).
+            OpenVPN profiles cannot be uploaded; set_vpn_connection reports an error for OpenVPN.
+        '''
+        RouterTransport.__init__(self, ip)
+        self.client = paramiko.SSHClient()
+        self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+
+    def run(self, command):
+        stdin, stdout, stderr = self.client.exec_command(command, timeout=CN.ROUTER_HTTP_TIMEOUT)
+        output = stdout.read().decode('utf-8', 'replace')
+        if stdout.channel.recv_exit_status() != 0:
+            raise RuntimeError("Command failed on router: {}: {}".format(command, stderr.read().decode('utf-8', 'replace')))
+        return output
+
+    def sign_in(self, username, password):
+        try:
+            self.client.connect(self.ip, port=CN.ROUTER_SSH_PORT, username=username, password=password,
+                                timeout=CN.ROUTER_HTTP_TIMEOUT, look_for_keys=False, allow_agent=False)
+            return True
+        except paramiko.AuthenticationException:
+            return False
+
+    def submit(self, change):
+        if change.action == CN.ROUTER_ACTION_REBOOT:
+            commands = ['reboot']
+        elif change.action == CN.ROUTER_ACTION_RESTORE:
+            commands = ['nvram erase', 'reboot']
+        else:
+            commands = ['nvram set {}={}'.format(name, shlex.quote(str(value))) for name, value in change.fields.items()]
+            commands.append('nvram commit')
+            commands += ['service ' + shlex.quote(service) for service in change.service.split(';') if service]
+        return self.run(' && '.join(commands))
+
+    def read(self, names):
+        values = self.run('printf "%s\\0" ' + ' '.join('"$(nvram get {})"'.format(name) for name in names))
+        return dict(zip(names, values.split('\0')))
+
+    def upload(self, filename, fields):
+        raise NotImplementedError("OpenVPN profile upload needs the http or selenium backend")
+
+    def close(self):
+        self.client.close()
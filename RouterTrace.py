@@ -0,0 +1,191 @@
+#!/usr/bin/python3
+import contextlib
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+
+import ConstantName as CN
+
+
+# RouterWait calls recorded as spans, between the operation and its WebDriver commands.
+WAIT_SPANS = ('element', 'clickable', 'click', 'fill', 'fill_form', 'page_state', 'verify_form', 'select', 'alert',
+              'page_loaded', 'navigation', 'login', 'applied')
+
+
+def redact(name, value):
+    '''
+    Summary:
+        Value of a parameter as shown in traces and logs, '***' for passwords and keys.
+    '''
+    if any(marker in name.lower() for marker in CN.ROUTER_SECRET_MARKERS):
+        return '***'
+    return value if isinstance(value, (int, float, bool, type(None))) else str(value)
+
+
+def call_arguments(method, args, kwargs):
+    '''
+    Summary:
+        Arguments of a RouterSetting method call by parameter name, secrets redacted.
+    '''
+    try:
+        bound = inspect.signature(method).bind(None, *args, **kwargs)
+    except TypeError:
+        return {'args': [str(arg) for arg in args]}
+    return dict((name, redact(name, value)) for name, value in list(bound.arguments.items())[1:])
+
+
+class RouterTracer(object):
+    def __init__(self, filename=None):
+        '''
+        Summary:
+            Timeline of router operations, their waits and every WebDriver command they send.
+
+        Description:
+            1) An operation span covers a RouterSetting method; RouterWait calls and WebDriver
+               commands made meanwhile are recorded as spans nested under it.
+            2) A WebDriver span holds the command, its locator, its duration and its outcome.
+            3) save() writes the Chrome trace event format, opened by https://ui.perfetto.dev or chrome://tracing.
+               Every thread (eg. every router of a fleet) gets its own track.
+
+        Args:
+            self: self
+            filename: (Type: String) Trace file written by save(). Default CN.ROUTER_TRACE_FILE
+
+        Example:
+            Below code block shows how to use::
+
+                tracer = RouterTracer('router.trace.json')
+                router = RouterSetting('orangepi', tracer=tracer)
+                router.set_wpa_encryption('2.4GHz', 'WPA2-Personal', 'AES')
+                router.close()      # writes router.trace.json
+
+        Returns:
+            An object of RouterTracer.
+
+        Caveat:
+            A RouterSetting without tracer is not instrumented at all.
+        '''
+        self.filename = filename or CN.ROUTER_TRACE_FILE
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+        self.events = []
+        self.threads = set()
+        self.lock = threading.Lock()
+
+    def record(self, name, category, start, end, args):
+        thread = threading.current_thread()
+        event = {'name': name, 'cat': category, 'ph': 'X', 'pid': self.pid, 'tid': thread.ident,
+                 'ts': (start - self.origin) * 1e6, 'dur': (end - start) * 1e6, 'args': args}
+        with self.lock:
+            if thread.ident not in self.threads:
+                self.threads.add(thread.ident)
+                self.events.append({'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': thread.ident,
+                                    'args': {'name': thread.name}})
+            self.events.append(event)
+
+    @contextlib.contextmanager
+    def span(self, name, category, **args):
+        '''
+        Summary:
+            Record the block as a span; an exception leaving it is recorded as its outcome.
+        '''
+        start = time.perf_counter()
+        try:
+            yield args
+        except BaseException as err:
+            args['outcome'] = type(err).__name__
+            args['error'] = str(err).strip().split('\n')[0]
+            raise
+        else:
+            args.setdefault('outcome', 'ok')
+        finally:
+            self.record(name, category, start, time.perf_counter(), args)
+
+    def operation(self, method, router, args, kwargs):
+        return self.span(method.__name__, 'operation', router=router, **call_arguments(method, args, kwargs))
+
+    def command(self, execute):
+        '''
+        Summary:
+            Wrap WebDriver.execute, the one call every browser and element command goes through.
+        '''
+        @functools.wraps(execute)
+        def traced(driver_command, params=None):
+            args = {}
+            if params:
+                if 'using' in params:
+                    args['locator'] = '%s=%s' % (params['using'], params.get('value'))
+                if 'id' in params:
+                    args['element'] = str(params['id'])[:8]
+                if 'url' in params:
+                    args['url'] = params['url']
+                if 'script' in params:
+                    args['script'] = params['script'].strip().split('\n')[0][:80]
+                if 'text' in params or ('value' in params and 'using' not in params):
+                    # Keys typed may be passwords.
+                    args['keys'] = '***'
+            with self.span(driver_command, 'webdriver', **args):
+                return execute(driver_command, params)
+        return traced
+
+    def wait(self, name, call):
+        @functools.wraps(call)
+        def traced(*args, **kwargs):
+            span = {}
+            if args and isinstance(args[0], tuple):
+                span['locator'] = '%s=%s' % args[0][:2]
+            with self.span('wait.%s' % name, 'wait', **span):
+                return call(*args, **kwargs)
+        return traced
+
+    def instrument(self, transport):
+        '''
+        Summary:
+            Record the WebDriver commands and RouterWait calls of a selenium transport.
+            Direct transports (http, ssh) have no browser; only their operations are recorded.
+        '''
+        browser = getattr(transport, 'browser', None)
+        if browser is None or getattr(browser, 'router_tracer', None) is self:
+            return
+        browser.execute = self.command(browser.execute)
+        browser.router_tracer = self
+        wait = getattr(transport, 'wait', None)
+        if wait is not None:
+            for name in WAIT_SPANS:
+                setattr(wait, name, self.wait(name, getattr(wait, name)))
+
+    def trace(self):
+        with self.lock:
+            events = list(self.events)
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def save(self, filename=None):
+        '''
+        Summary:
+            Write the spans recorded so far as a Chrome trace event JSON file.
+
+        Returns:
+            (Type: String) File written
+        '''
+        filename = filename or self.filename
+        # Routers sharing the tracer may save at the same time; each replaces the file whole.
+        partial = '%s.%d.tmp' % (filename, threading.get_ident())
+        with open(partial, 'w') as trace_file:
+            json.dump(self.trace(), trace_file)
+        os.replace(partial, filename)
+        return filename
+
+    def summary(self, category='webdriver'):
+        '''
+        Summary:
+            Count and total seconds of the spans of a category by name, slowest first.
+        '''
+        totals = {}
+        for event in self.trace()['traceEvents']:
+            if event.get('cat') == category:
+                count, seconds = totals.get(event['name'], (0, 0.0))
+                totals[event['name']] = (count + 1, seconds + event['dur'] / 1e6)
+        return sorted(totals.items(), key=lambda item: -item[1][1])
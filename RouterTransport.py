@@ -0,0 +1,184 @@
+#!/usr/bin/python3
+import abc
+import collections
+
+import ConstantName as CN
+import RouterConfig as routerconfig
+
+
+# A single form submission: the router page it belongs to, the service the firmware
+# restarts afterwards, the nvram fields to write and the apply.cgi action.
+Change = collections.namedtuple('Change', 'page service fields action')
+Change.__new__.__defaults__ = (CN.ROUTER_ACTION_APPLY,)
+
+# Outcome of a sign in: whether the router accepted it, the error it showed (if any),
+# the seconds it took to find out and whether a stored session was resumed instead.
+LoginResult = collections.namedtuple('LoginResult', 'success message elapsed resumed')
+LoginResult.__new__.__defaults__ = (False,)
+
+
+class OperationFailed(Exception):
+    '''
+    An operation reported errors (eg. a TimeoutException it caught, an invalid argument
+    or a setting the router did not keep) instead of raising them.
+    '''
+    def __init__(self, message, exception=None):
+        Exception.__init__(self, message)
+        # Type of the exception the operation caught, None when it only reported an error
+        self.exception = exception
+
+
+def router_ip(ip=None):
+    '''
+    Summary:
+        Resolve the router IP address.
+
+    Description:
+        1) Return the given IP, else the one configured in RouterConfig.
+
+    Args:
+        ip: (Type: String) Router IP address
+
+    Raises:
+        ValueError: Router IP is not configured
+
+    Returns:
+        (Type: String) Router IP address
+    '''
+    if ip is None:
+        ip = routerconfig.hardware['HARDWAREINFO']['IP']
+    if ip is None:
+        raise ValueError("Please configure RouterConfig ['HARDWAREINFO']['IP'] at Api\\setting\\hardware")
+    return ip
+
+
+class RouterTransport(abc.ABC):
+    '''
+    Base class of the channels used to talk to the router.
+
+    A transport only knows how to sign in, submit a Change and read nvram values back.
+    Transports with direct = True are driven through RouterForm.RouterFormSetting,
+    the Selenium transport keeps the page-by-page browser flows of RouterSetting.
+    Transports with can_upload = False cannot send files, so OpenVPN profiles are refused up front.
+    '''
+    name = None
+    direct = True
+    can_upload = True
+
+    def __init__(self, ip):
+        self.ip = ip
+        self.base_url = CN.STR_HTTP + ip + CN.STR_FORWARDSLASH
+
+    def url(self, page):
+        return self.base_url + page
+
+    @abc.abstractmethod
+    def sign_in(self, username, password):
+        '''
+        Summary:
+            Authenticate against the router.
+
+        Returns:
+            (Type: Boolean) True if the router accepted the credentials
+        '''
+
+    @abc.abstractmethod
+    def submit(self, change):
+        '''
+        Summary:
+            Write the fields of a Change and restart its service.
+
+        Args:
+            change: (Type: Change) Change to submit
+        '''
+
+    @abc.abstractmethod
+    def read(self, names):
+        '''
+        Summary:
+            Read nvram values back from the router.
+
+        Args:
+            names: (Type: List) nvram names
+
+        Returns:
+            (Type: Dict) nvram name to value
+        '''
+
+    @abc.abstractmethod
+    def upload(self, filename, fields):
+        '''
+        Summary:
+            Upload a file (eg. an OpenVPN profile) to the router.
+
+        Args:
+            filename: (Type: String) Full path of the local file
+            fields: (Type: Dict) Extra form fields sent with the file
+        '''
+
+    def cookies(self):
+        '''
+        Summary:
+            Export the authenticated session, for RouterSession.SessionStore.
+
+        Returns:
+            (Type: Dict) Cookie name to value. Empty when the transport has no session to share
+        '''
+        return {}
+
+    def resume(self, cookies):
+        '''
+        Summary:
+            Reuse a session exported by cookies().
+
+        Args:
+            cookies: (Type: Dict) Cookie name to value
+
+        Returns:
+            (Type: Boolean) True if the router accepted the session
+        '''
+        return False
+
+    def close(self):
+        pass
+
+
+def create_transport(backend=None, ip=None, device=None):
+    '''
+    Summary:
+        Create the transport for a backend.
+
+    Description:
+        1) Resolve the backend from the argument or RouterConfig ['HARDWAREINFO']['BACKEND'].
+        2) Import the backend module only when it is selected.
+
+    Args:
+        backend: (Type: String) One of 'selenium', 'http' or 'ssh'
+        ip: (Type: String) Router IP address
+        device: (Type: String) Host running the browser, 'orangepi' or 'pc' (Selenium only)
+
+    Raises:
+        ValueError: Backend not supported
+
+    Example:
+        Below code block shows how to use::
+
+            transport = create_transport('http', '192.168.1.1')
+
+    Returns:
+        An object of RouterTransport.
+    '''
+    if backend is None:
+        backend = routerconfig.hardware['HARDWAREINFO'].get('BACKEND') or CN.ROUTER_BACKEND_SELENIUM
+    ip = router_ip(ip)
+    backend = backend.lower()
+    if backend == CN.ROUTER_BACKEND_SELENIUM:
+        from RouterSelenium import SeleniumTransport
+        return SeleniumTransport(ip, device or routerconfig.hardware['HARDWAREINFO']['DEVICE'])
+    elif backend == CN.ROUTER_BACKEND_HTTP:
+        from RouterHttp import HttpTransport
+        return HttpTransport(ip)
+    elif backend == CN.ROUTER_BACKEND_SSH:
+        from RouterSsh import SshTransport
+        return SshTransport(ip)
+    raise ValueError("Backend not supported. Please choose 1 of these options: selenium, http, ssh")
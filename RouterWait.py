@@ -0,0 +1,362 @@
+#!/usr/bin/python3
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support.ui import Select
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import (NoSuchElementException, StaleElementReferenceException)
+
+import ConstantName as CN
+
+
+# Default timeouts in seconds, per kind of wait. Override per RouterWait instance.
+TIMEOUTS = {
+    'element': CN.ROUTER_TIMEOUT_ELEMENT,
+    'alert': CN.ROUTER_TIMEOUT_ALERT,
+    'page': CN.ROUTER_TIMEOUT_PAGE,
+    'apply': CN.ROUTER_TIMEOUT_APPLY,
+}
+
+IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+# Finds the element of a Selenium locator (By.ID, By.NAME, By.CSS_SELECTOR, By.XPATH, ...) in the page.
+FIND_SCRIPT = '''
+function find(using, value) {
+    switch (using) {
+    case 'id': return document.getElementById(value);
+    case 'name': return document.getElementsByName(value)[0] || null;
+    case 'css selector': return document.querySelector(value);
+    case 'class name': return document.getElementsByClassName(value)[0] || null;
+    case 'tag name': return document.getElementsByTagName(value)[0] || null;
+    case 'xpath': return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return null;
+}
+'''
+
+# Sets [using, value, field value] fields in order, firing the events typing or clicking would.
+# Returns null (nothing set) until the page is loaded and shows the first field,
+# else {missing: [indexes of fields not found, or selects without the option]}.
+FILL_SCRIPT = FIND_SCRIPT + '''
+function fire(el, type) { el.dispatchEvent(new Event(type, {bubbles: true})); }
+var fields = arguments[0], missing = [];
+if (document.readyState !== 'complete' || !find(fields[0][0], fields[0][1])) { return null; }
+for (var i = 0; i < fields.length; i++) {
+    var el = find(fields[i][0], fields[i][1]), value = fields[i][2];
+    if (!el) { missing.push(i); continue; }
+    if (el.tagName === 'SELECT') {
+        var index = -1;
+        for (var j = 0; j < el.options.length; j++) {
+            if (el.options[j].text.trim() === String(value) || el.options[j].value === String(value)) { index = j; break; }
+        }
+        if (index < 0) { missing.push(i); continue; }
+        if (el.selectedIndex !== index) { el.selectedIndex = index; fire(el, 'change'); }
+    } else if (el.type === 'radio') {
+        if (value && !el.checked) { el.click(); }
+    } else if (el.type === 'checkbox') {
+        if (el.checked !== Boolean(value)) { el.click(); }
+    } else {
+        el.focus();
+        el.value = String(value);
+        fire(el, 'input');
+        fire(el, 'change');
+        el.blur();
+    }
+}
+return {missing: missing};
+'''
+
+# Reads the page state: {fields: {name or id: value of every input, select, radio group and checkbox},
+# mismatched: [[index, value shown] of the [using, value, field value] fields the page does not show]}.
+# Fields compare as FILL_SCRIPT sets them. Returns null until the page is loaded (and shows the first field).
+STATE_SCRIPT = FIND_SCRIPT + '''
+function shown(el) {
+    if (el.tagName === 'SELECT') { return el.selectedIndex < 0 ? null : el.options[el.selectedIndex].text.trim(); }
+    if (el.type === 'radio' || el.type === 'checkbox') { return el.checked; }
+    return el.value;
+}
+function holds(el, value) {
+    if (el.tagName === 'SELECT') {
+        var option = el.options[el.selectedIndex];
+        return !!option && (option.text.trim() === String(value) || option.value === String(value));
+    }
+    if (el.type === 'radio') { return !value || el.checked; }
+    if (el.type === 'checkbox') { return el.checked === Boolean(value); }
+    return el.value === String(value);
+}
+var checks = arguments[0], fields = {}, mismatched = [];
+if (document.readyState !== 'complete' || (checks.length && !find(checks[0][0], checks[0][1]))) { return null; }
+var elements = document.querySelectorAll('input, select, textarea');
+for (var i = 0; i < elements.length; i++) {
+    var el = elements[i], key = el.name || el.id;
+    if (!key || /^(button|submit|reset|image|file)$/.test(el.type)) { continue; }
+    if (el.type === 'radio') {
+        if (el.checked) { fields[key] = el.value; } else if (!(key in fields)) { fields[key] = null; }
+    } else if (el.type === 'checkbox') {
+        fields[key] = el.checked;
+    } else if (el.tagName === 'SELECT') {
+        fields[key] = el.selectedIndex < 0 ? null : el.options[el.selectedIndex].value;
+    } else {
+        fields[key] = el.value;
+    }
+}
+for (var i = 0; i < checks.length; i++) {
+    var el = find(checks[i][0], checks[i][1]);
+    if (!el) { mismatched.push([i, null]); }
+    else if (!holds(el, checks[i][2])) { mismatched.push([i, shown(el)]); }
+}
+return {fields: fields, mismatched: mismatched};
+'''
+
+
+class RouterWait(object):
+    def __init__(self, browser, **timeouts):
+        '''
+        Summary:
+            Explicit waits for the router web UI.
+
+        Description:
+            1) Every wait polls its own condition and returns as soon as it holds.
+            2) The browser implicit wait is left at 0, so failed lookups never stall.
+
+        Args:
+            self: self
+            browser: (Type: WebDriver) Browser driving the router web UI
+            timeouts: (Type: Float) Overrides of TIMEOUTS, eg. apply=120
+
+        Example:
+            Below code block shows how to use::
+
+                wait = RouterWait(browser, alert=5)
+                wait.click((By.ID, CN.WIRELESS_MENU))
+                wait.select((By.CSS_SELECTOR, CN.BAND), CN.ROUTER_5GHZ)
+
+        Returns:
+            An object of RouterWait.
+        '''
+        self.browser = browser
+        self.timeouts = dict(TIMEOUTS)
+        self.timeouts.update(timeouts)
+
+    def until(self, condition, timeout='element', message=''):
+        '''
+        Summary:
+            Wait until condition returns a truthy value.
+
+        Args:
+            self: self
+            condition: (Type: Callable) Called with the browser
+            timeout: (Type: String or Float) Key of TIMEOUTS or seconds
+            message: (Type: String) Message of the TimeoutException
+
+        Raises:
+            TimeoutException: condition did not hold in time
+
+        Returns:
+            Value returned by condition
+        '''
+        seconds = self.timeouts[timeout] if isinstance(timeout, str) else timeout
+        return WebDriverWait(self.browser, seconds, poll_frequency=CN.ROUTER_WAIT_POLL,
+                             ignored_exceptions=IGNORED_EXCEPTIONS).until(condition, message)
+
+    def element(self, locator, timeout='element'):
+        return self.until(EC.presence_of_element_located(locator), timeout, 'Element not found: %s' % (locator,))
+
+    def clickable(self, locator, timeout='element'):
+        return self.until(EC.element_to_be_clickable(locator), timeout, 'Element not clickable: %s' % (locator,))
+
+    def click(self, locator, timeout='element'):
+        element = self.clickable(locator, timeout)
+        element.click()
+        return element
+
+    def fill(self, locator, value, timeout='element'):
+        element = self.clickable(locator, timeout)
+        element.clear()
+        element.send_keys(value)
+        return element
+
+    def fill_form(self, fields, timeout='element', required=True):
+        '''
+        Summary:
+            Set many fields of the current page in one execute_script call.
+
+        Description:
+            1) fields maps a locator to its value: text for inputs, option text or value for selects,
+               True to pick a radio button, True/False for checkboxes.
+            2) Fields are set in order and get the input and change events typing would fire,
+               so the page handlers (eg. showing the WPA key for the chosen authentication) run in between.
+            3) The script is retried until the page is loaded and shows the first field; a loaded page
+               costs one round trip to chromedriver instead of a find, clear and send_keys per field.
+
+        Args:
+            self: self
+            fields: (Type: Dict or List) Locator to value, in the order to set them (a list of pairs also works)
+            timeout: (Type: String or Float) Key of TIMEOUTS or seconds to wait for the first field
+            required: (Type: Boolean) Raise when a field is missing instead of returning it
+
+        Raises:
+            TimeoutException: First field not shown within the timeout
+            NoSuchElementException: Fields missing, when required
+
+        Example:
+            Below code block shows how to use::
+
+                wait.fill_form({(By.XPATH, CN.ENABLE_DHCP_SERVER): True,
+                                (By.XPATH, CN.DHCP_STARTING): '192.168.1.20',
+                                (By.XPATH, CN.DHCP_ENDING): '192.168.1.100'})
+
+        Returns:
+            (Type: List) Locators not found, or selects without the option
+        '''
+        fields = list(fields.items()) if isinstance(fields, dict) else list(fields)
+        arguments = [[locator[0], locator[1], value] for locator, value in fields]
+        result = self.until(lambda browser: browser.execute_script(FILL_SCRIPT, arguments), timeout,
+                            'Element not found: %s' % (fields[0][0],))
+        missing = [fields[index][0] for index in result['missing']]
+        if missing and required:
+            raise NoSuchElementException('Fields not found: %s' % ', '.join(str(locator) for locator in missing))
+        return missing
+
+    def page_state(self, timeout='page'):
+        '''
+        Summary:
+            Every input, select, radio group and checkbox value of the current page, in one execute_script call.
+
+        Description:
+            1) Keyed by field name (or id): input text, option value of selects, value of the checked
+               radio of a group (None when none is checked), True/False for checkboxes.
+
+        Example:
+            Below code block shows how to use::
+
+                wait.click((By.ID, CN.WIRELESS_MENU))
+                state = wait.page_state()
+                print(state['wl_ssid'], state['wl_channel'])
+
+        Returns:
+            (Type: Dict) Field name to value
+        '''
+        return self.until(lambda browser: browser.execute_script(STATE_SCRIPT, []), timeout, 'Page not loaded')['fields']
+
+    def verify_form(self, fields, timeout='page'):
+        '''
+        Summary:
+            Compare fields with what the current page shows, in one execute_script call.
+
+        Description:
+            1) fields is what was given to fill_form; after apply the firmware reloads the page from
+               its settings, so a field showing another value did not stick.
+            2) Fields compare as fill_form sets them: option text or value for selects, checked for
+               radios picked with True, checked state for checkboxes.
+
+        Args:
+            self: self
+            fields: (Type: Dict or List) Locator to value, as given to fill_form
+            timeout: (Type: String or Float) Key of TIMEOUTS or seconds to wait for the page and its first field
+
+        Raises:
+            TimeoutException: Page not loaded, or first field not shown, within the timeout
+
+        Example:
+            Below code block shows how to use::
+
+                fields = {(By.CSS_SELECTOR, CN.CHANNEL_BOX): 6}
+                wait.fill_form(fields)
+                ...apply...
+                for locator, expected, shown in wait.verify_form(fields):
+                    print(locator, expected, shown)
+
+        Returns:
+            (Type: List) (locator, expected value, value shown or None when missing) of every field not holding its value
+        '''
+        fields = list(fields.items()) if isinstance(fields, dict) else list(fields)
+        arguments = [[locator[0], locator[1], value] for locator, value in fields]
+        result = self.until(lambda browser: browser.execute_script(STATE_SCRIPT, arguments), timeout,
+                            'Element not found: %s' % (fields[0][0],))
+        return [(fields[index][0], fields[index][1], shown) for index, shown in result['mismatched']]
+
+    def select(self, locator, text, timeout='element'):
+        '''
+        Summary:
+            Select an option by its visible text and wait until the page shows it selected.
+
+        Description:
+            1) Pages such as the wireless band selector reload after a change; the
+               select is looked up again until the new page reports the option selected.
+        '''
+        text = str(text)
+        Select(self.clickable(locator, timeout)).select_by_visible_text(text)
+        self.until(lambda browser: Select(browser.find_element(*locator)).first_selected_option.text == text,
+                   'page', 'Option %s not selected in %s' % (text, locator))
+        return Select(self.clickable(locator, timeout))
+
+    def alert(self, timeout='alert'):
+        '''
+        Summary:
+            Wait for an alert and accept it.
+
+        Raises:
+            TimeoutException: No alert within the timeout
+
+        Returns:
+            (Type: String) Text of the alert
+        '''
+        alert = self.until(EC.alert_is_present(), timeout, 'No alert present')
+        text = alert.text
+        alert.accept()
+        return text
+
+    def page_loaded(self, timeout='page'):
+        return self.until(lambda browser: browser.execute_script('return document.readyState') == 'complete',
+                          timeout, 'Page not loaded')
+
+    def navigation(self, element, timeout='page'):
+        '''
+        Summary:
+            Wait until the page holding element is replaced by a fully loaded new page.
+        '''
+        self.until(EC.staleness_of(element), timeout, 'Page did not change')
+        return self.page_loaded(timeout)
+
+    def login(self, page=None, timeout='page'):
+        '''
+        Summary:
+            Wait for the outcome of a sign in.
+
+        Description:
+            1) Race the success conditions (redirect to index.asp or main menu present)
+               against the login error field and return as soon as either holds.
+            2) When page is given, the error field only counts once that page is gone,
+               so an error left from a previous attempt is not mistaken for the outcome.
+
+        Args:
+            self: self
+            page: (Type: WebElement) html element of the login page the credentials were sent from
+            timeout: (Type: String or Float) Key of TIMEOUTS or seconds
+
+        Raises:
+            TimeoutException: Neither outcome within the timeout
+
+        Returns:
+            (Type: Tuple) (True, '') on success, (False, error text) on failure
+        '''
+        def outcome(browser):
+            if CN.ROUTER_INDEX_PAGE in browser.current_url:
+                return True, ''
+            if page is not None and not EC.staleness_of(page)(browser):
+                return None
+            for error in browser.find_elements(By.ID, CN.LOGIN_ERROR):
+                if error.is_displayed() and error.text:
+                    return False, error.text
+            if browser.find_elements(By.ID, CN.MAIN_MENU):
+                return True, ''
+            return None
+        return self.until(outcome, timeout, 'No login outcome')
+
+    def applied(self, timeout='apply'):
+        '''
+        Summary:
+            Wait until the firmware's apply spinner is gone.
+        '''
+        return self.until(EC.invisibility_of_element_located((By.ID, CN.ROUTER_LOADING)), timeout,
+                          'Router still applying settings')
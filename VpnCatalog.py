@@ -0,0 +1,132 @@
+#!/usr/bin/python3
+import csv
+import difflib
+import os
+import threading
+
+import ConstantName as CN
+from RouterEvents import EVENTS
+
+
+def normalize(name):
+    return ' '.join(str(name).replace(CN.STR_UNDERSCORE, ' ').split()).upper()
+
+
+class VpnCatalog(object):
+    # One shared catalog per file, see catalog().
+    _catalogs = {}
+    _catalogs_lock = threading.Lock()
+
+    def __init__(self, filename):
+        '''
+        Summary:
+            Index of a VPN server list (ListCountriesVPN.txt or OpenVPN.txt).
+
+        Description:
+            1) Load the CSV once into one dict per column: country, city (when the list has one) and server.
+            2) Look names up case-insensitively, as a country first, then a city, then a server.
+               Falling back to the closest country name is opt-in.
+            3) Reload when the file modification time changes.
+
+        Args:
+            self: self
+            filename: (Type: String) Full path of the CSV, with at least the columns Country and VpnServer
+
+        Example:
+            Below code block shows how to use::
+
+                catalog = VpnCatalog.catalog(CN.LISTCOUNTRYVPN)
+                vpn_server = catalog.server('france')
+
+        Returns:
+            An object of VpnCatalog.
+        '''
+        self.filename = filename
+        self.mtime = None
+        self.rows = []
+        # Column to {normalized name: row}
+        self.indexes = dict((column, {}) for column in CN.VPN_INDEX_COLUMNS)
+        self.lock = threading.Lock()
+
+    @classmethod
+    def catalog(cls, filename):
+        '''
+        Summary:
+            Shared catalog of a file, so every caller uses the same loaded index.
+        '''
+        with cls._catalogs_lock:
+            if filename not in cls._catalogs:
+                cls._catalogs[filename] = cls(filename)
+            return cls._catalogs[filename]
+
+    def load(self):
+        '''
+        Summary:
+            Load the file when it was never loaded or changed on disk.
+
+        Raises:
+            FileNotFoundError: VPN list not found
+        '''
+        stat = os.stat(self.filename)
+        mtime = (stat.st_mtime_ns, stat.st_size)
+        if mtime == self.mtime:
+            return
+        with self.lock:
+            if mtime == self.mtime:
+                return
+            with open(self.filename, newline='', encoding=CN.VPN_LIST_ENCODING) as vpn_list:
+                rows = [row for row in csv.DictReader(vpn_list) if row.get('Country') and row.get('VpnServer')]
+            indexes = dict((column, {}) for column in CN.VPN_INDEX_COLUMNS)
+            for row in rows:
+                for column in CN.VPN_INDEX_COLUMNS:
+                    if row.get(column):
+                        # The first server listed for a country stays its default.
+                        indexes[column].setdefault(normalize(row[column]), row)
+            self.rows, self.indexes, self.mtime = rows, indexes, mtime
+
+    def lookup(self, name, fuzzy=False):
+        '''
+        Summary:
+            Find the row of a country, else a city, else a server of that name.
+
+        Args:
+            self: self
+            name: (Type: String) Country, city or server, in any case
+            fuzzy: (Type: Boolean) Fall back to the closest country name, eg. 'Frnace' for 'FRANCE'. Default False
+
+        Returns:
+            (Type: Dict) Row of the VPN list, or None when nothing matches
+
+        Caveat:
+            Only country names are matched fuzzily, so a misspelt country never resolves to a
+            city or server of another country. The country used instead is logged in RouterEvents.EVENTS.
+        '''
+        self.load()
+        key = normalize(name)
+        for column in CN.VPN_INDEX_COLUMNS:
+            row = self.indexes[column].get(key)
+            if row is not None:
+                return row
+        if fuzzy:
+            countries = self.indexes['Country']
+            matches = difflib.get_close_matches(key, countries.keys(), n=1, cutoff=CN.VPN_FUZZY_CUTOFF)
+            if matches:
+                row = countries[matches[0]]
+                EVENTS.emit('step', level='warning', message='VPN country not found, using the closest match',
+                            name=name, matched=row['Country'])
+        return row
+
+    def server(self, name, fuzzy=False):
+        '''
+        Summary:
+            VPN server (or OpenVPN profile file name) of a country, city or server.
+
+        Returns:
+            (Type: String) Value of the VpnServer column, or None when nothing matches
+        '''
+        row = self.lookup(name, fuzzy)
+        return row['VpnServer'] if row else None
+
+    def countries(self):
+        self.load()
+        return sorted(set(row['Country'] for row in self.rows))
@@ -0,0 +1,15 @@
+#!/usr/bin/python3
+import pytest
+
+from RouterMock import MockRouter
+
+
+@pytest.fixture
+def mock():
+    '''
+    Summary:
+        Mock ASUS router on a free local port, rebooting in a fraction of a second.
+    '''
+    router = MockRouter(port=0, password='admin123', reboot_time=0.3).start()
+    yield router
+    router.stop()
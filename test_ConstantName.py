@@ -0,0 +1,43 @@
+#!/usr/bin/python3
+import subprocess
+import sys
+
+import pytest
+
+
+def run(code):
+    # A fresh interpreter, so no test has imported the lazy modules yet.
+    subprocess.check_call([sys.executable, '-c', code])
+
+
+def test_router_constants_do_not_load_the_other_modules():
+    run('''import sys
+import ConstantName as CN
+assert CN.ROUTER_2GHZ and CN.VPN_LIST_ENCODING == 'cp1252'
+assert not {'ConstantUI', 'ConstantApi', 'ConstantTVModel'} & set(sys.modules)
+''')
+
+
+def test_lazy_constant_is_loaded_on_first_use():
+    run('''import sys
+import ConstantName as CN
+assert CN.UNICORN == 'unicorn'
+assert 'ConstantTVModel' in sys.modules and 'ConstantUI' not in sys.modules
+assert CN.SA_UI_DTV == 'dtv' and 'ConstantUI' in sys.modules
+assert 'SA_UI_DTV' in vars(CN)
+''')
+
+
+def test_star_import_and_dir_list_every_constant():
+    run('''from ConstantName import *
+assert UNICORN == 'unicorn' and AKIRAPATH and SA_UI_WIFISHORTCUT and ROUTER_5GHZ
+assert 'importlib' not in dir() and 'LAZY_MODULES' not in dir()
+''')
+    import ConstantName as CN
+    assert {'UNICORN', 'AKIRAPATH', 'SA_UI_DTV', 'ROUTER_2GHZ'} <= set(dir(CN))
+
+
+def test_unknown_constant():
+    import ConstantName as CN
+    with pytest.raises(AttributeError, match='NOT_A_CONSTANT'):
+        CN.NOT_A_CONSTANT
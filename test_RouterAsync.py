@@ -0,0 +1,99 @@
+#!/usr/bin/python3
+import asyncio
+
+import pytest
+
+from RouterAsync import AsyncRouterSetting
+from RouterEvents import EVENTS
+from RouterTransport import OperationFailed
+
+
+def signed_in(mock, **kwargs):
+    async def sign_in():
+        router = AsyncRouterSetting(mock.address, session=False, **kwargs)
+        assert (await router.sign_in('admin', 'admin123')).success
+        return router
+    return sign_in()
+
+
+def test_operations_and_reboot(mock):
+    async def configure():
+        router = AsyncRouterSetting(mock.address, session=False)
+        router.planner.prober.interval = 0.05
+        router.planner.prober.max_interval = 0.1
+        assert (await router.sign_in('admin', 'admin123')).success
+        async with router.transaction():
+            await router.set_band_and_ssid('2.4GHz', 'iptv_lab')
+            await router.set_channel_no('2.4GHz', '6')
+        return await router.reboot()
+
+    result = asyncio.run(configure())
+    assert result.ready and result.went_down and result.stage == 'login'
+    assert [action for page, service, action in mock.history] == ['apply', 'reboot']
+    assert mock.nvram['wl0_ssid'] == 'iptv_lab' and mock.nvram['wl0_channel'] == '6'
+
+
+def test_failed_login(mock):
+    async def sign_in():
+        return await AsyncRouterSetting(mock.address, session=False).sign_in('admin', 'wrong')
+
+    assert not asyncio.run(sign_in()).success
+
+
+def test_reported_error_raises(mock, monkeypatch):
+    emitted = []
+    monkeypatch.setattr(EVENTS, 'target', '-')
+    monkeypatch.setattr(EVENTS, 'emit', lambda event, **fields: emitted.append((event, fields)))
+
+    async def encrypt():
+        router = await signed_in(mock)
+        await router.set_wpa_encryption('2.4GHz', 'WPA2-Personal', 'TKIP+AES')
+
+    with pytest.raises(OperationFailed, match='Encryption type not supported'):
+        asyncio.run(encrypt())
+    steps = [fields for event, fields in emitted if event == 'step' and fields['level'] == 'error']
+    assert steps and all(step['operation'] == 'set_wpa_encryption' for step in steps)
+    operation, = [fields for event, fields in emitted if event == 'operation']
+    assert operation['operation'] == 'set_wpa_encryption' and operation['outcome'] == 'failed'
+    assert operation['duration'] > 0 and operation['error'].startswith('OperationFailed')
+
+
+def test_cancelled_transaction_applies_nothing(mock):
+    async def configure():
+        router = await signed_in(mock)
+        async with router.transaction():
+            await router.set_band_and_ssid('2.4GHz', 'iptv_lab')
+            await asyncio.sleep(10)
+
+    async def cancel():
+        task = asyncio.ensure_future(configure())
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel())
+    assert mock.history == []
+    assert mock.nvram['wl0_ssid'] != 'iptv_lab'
+
+
+def test_request_timeout(mock):
+    mock.apply_latency = 1
+
+    async def configure():
+        router = await signed_in(mock, timeout=0.2)
+        await router.set_band_and_ssid('2.4GHz', 'iptv_lab')
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(configure())
+
+
+def test_operation_timeout(mock):
+    mock.apply_latency = 1
+
+    async def configure():
+        router = await signed_in(mock)
+        await asyncio.wait_for(router.set_band_and_ssid('2.4GHz', 'iptv_lab'), 0.2)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(configure())
@@ -0,0 +1,70 @@
+#!/usr/bin/python3
+import os
+
+import pytest
+
+import RouterBenchmark
+import RouterConfig as routerconfig
+from RouterBenchmark import PhaseBrowser, PhaseTimer, percentile, summarize
+from RouterMemory import PeakMemory, process_tree_rss
+
+
+def test_percentile_and_summary():
+    assert percentile([], 50) is None
+    assert percentile([3, 1, 2, 4], 50) == 2.5
+    assert percentile([1, 2, 3, 4, 5], 95) == pytest.approx(4.8)
+    assert summarize([2.0, 4.0]) == {'count': 2, 'mean': 3.0, 'p50': 3.0, 'p95': pytest.approx(3.9),
+                                     'p99': pytest.approx(3.98), 'max': 4.0}
+    assert summarize([])['mean'] is None
+
+
+def test_phase_timer_attributes_wall_time():
+    timer = PhaseTimer()
+    timer.enter('navigation')
+    timer.enter('apply')
+    phases = timer.stop()
+    assert set(phases) == set(RouterBenchmark.PHASES)
+    assert phases['navigation'] >= 0 and phases['apply'] >= 0
+
+
+def test_phase_browser_tags_scripts_by_phase():
+    RouterWait = pytest.importorskip('RouterWait')
+
+    class Browser(object):
+        def execute_script(self, script, *args):
+            return timer.current
+
+        def get(self, url):
+            return timer.current
+
+    timer = PhaseTimer()
+    browser = PhaseBrowser(Browser(), timer)
+    assert browser.execute_script(RouterWait.FILL_SCRIPT, []) == 'form_fill'
+    assert browser.execute_script(RouterWait.STATE_SCRIPT, []) == 'confirmation'
+    assert browser.execute_script('return document.readyState') == 'navigation'
+    browser.get('http://192.168.1.1/')
+    assert timer.current == 'navigation'
+
+
+def test_memory_of_this_process():
+    if not os.path.isdir('/proc'):
+        pytest.skip('needs /proc')
+    assert process_tree_rss(os.getpid()) > 0
+    assert process_tree_rss(2 ** 22 + 1) is None
+    with PeakMemory(interval=0.01) as memory:
+        buffer = bytearray(16 * 1024 * 1024)
+    assert memory.peak >= len(buffer)
+
+
+def test_run_backend_over_http(mock, monkeypatch):
+    pytest.importorskip('requests')
+    monkeypatch.setitem(routerconfig.hardware['HARDWAREINFO'], 'IP', mock.address)
+    results = RouterBenchmark.run_backend('http', [('set_channel_no', ('2.4GHz', '6')),
+                                                   ('set_band_and_ssid', ('6GHz', 'iptv_lab'))],
+                                          3, 'admin', 'admin123', memory=False)
+    assert list(results) == ['launch', 'sign_in', 'set_channel_no', 'set_band_and_ssid']
+    assert results['sign_in']['total']['count'] == 1
+    assert results['set_channel_no']['total']['count'] == 3 and results['set_channel_no']['errors'] == {}
+    assert 'apply' in results['set_channel_no']['phases']
+    assert results['set_band_and_ssid']['errors'] == {'ValueError': 3}
+    assert len(mock.history) == 3
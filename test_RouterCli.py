@@ -0,0 +1,37 @@
+#!/usr/bin/python3
+import json
+
+import pytest
+
+pytest.importorskip('requests')
+
+import RouterCli
+
+
+def run(mock, capsys, *command):
+    code = RouterCli.main(['--router', mock.address, '--backend', 'http', '--no-session', '--password', 'admin123',
+                           '--json'] + list(command))
+    return code, json.loads(capsys.readouterr().out)
+
+
+def test_operation_succeeds(mock, capsys):
+    code, result = run(mock, capsys, 'channel', '--band', '2.4GHz', '--channel', '6')
+    assert code == RouterCli.EXIT_OK
+    assert result['success'] and result['command'] == 'channel'
+    assert len(mock.history) == 1
+
+
+def test_reported_error_fails_the_command(mock, capsys):
+    # WPA2-Personal only supports AES: the setter reports the error instead of raising it.
+    code, result = run(mock, capsys, 'encryption', '--band', '2.4GHz', '--auth', 'WPA2-Personal', '--type', 'TKIP+AES')
+    assert code == RouterCli.EXIT_FAILED
+    assert not result['success']
+    assert result['error'].startswith('OperationFailed: Encryption type not supported')
+    assert mock.history == []
+
+
+def test_failed_login(mock, capsys):
+    code = RouterCli.main(['--router', mock.address, '--backend', 'http', '--no-session', '--password', 'wrong',
+                           '--json', 'login'])
+    assert code == RouterCli.EXIT_FAILED
+    assert json.loads(capsys.readouterr().out)['error'].startswith('Login failed')
@@ -0,0 +1,46 @@
+#!/usr/bin/python3
+import pytest
+
+requests = pytest.importorskip('requests')
+
+from RouterDaemon import RouterDaemon
+from RouterFleet import router_hardware
+
+
+@pytest.fixture
+def daemon(mock, tmp_path, monkeypatch):
+    # Keep the stored sessions out of the home directory.
+    monkeypatch.setenv('HOME', str(tmp_path))
+    inventory = {'lab1': router_hardware(mock.address, username='admin', password='admin123')}
+    daemon = RouterDaemon(inventory, port=0, backend='http').start()
+    yield 'http://%s' % daemon.address
+    daemon.stop()
+
+
+def test_run_operation(daemon, mock):
+    response = requests.post(daemon + '/routers/lab1/set_channel_no', json={'args': ['2.4GHz', '6']})
+    assert response.status_code == 200
+    assert response.json()['status'] == 'done'
+    assert mock.nvram['wl0_channel'] == '6'
+    assert requests.get(daemon + '/routers').json()[0]['signed_in']
+
+
+def test_reported_error_keeps_the_session(daemon, mock):
+    response = requests.post(daemon + '/routers/lab1/set_wpa_encryption',
+                             json={'args': ['2.4GHz', 'WPA2-Personal', 'TKIP+AES']})
+    assert response.status_code == 500
+    assert response.json()['error'].startswith('OperationFailed: Encryption type not supported')
+    assert requests.get(daemon + '/routers').json()[0]['signed_in']
+    assert mock.history == []
+
+
+@pytest.mark.parametrize('path, status, error', [
+    ('/routers/lab1/set_channel_no?timeout=abc', 400, 'timeout must be a number of seconds'),
+    ('/routers/lab1/format_disk', 400, 'Unknown operation format_disk'),
+    ('/routers/lab2/set_channel_no', 404, 'Unknown router lab2'),
+])
+def test_bad_requests(daemon, mock, path, status, error):
+    response = requests.post(daemon + path, json={'args': ['2.4GHz', '6']})
+    assert response.status_code == status
+    assert response.json() == {'error': error}
+    assert mock.history == []
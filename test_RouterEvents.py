@@ -0,0 +1,88 @@
+#!/usr/bin/python3
+import collections
+import json
+
+import pytest
+
+from RouterEvents import EventLog, outcome, timestamp
+
+
+def read(log):
+    log.flush()
+    with open(log.target) as events_file:
+        return [json.loads(line) for line in events_file]
+
+
+@pytest.fixture
+def log(tmp_path):
+    events = EventLog(str(tmp_path / 'events.jsonl'))
+    yield events
+    events.close()
+
+
+def test_emit_writes_json_lines(log):
+    log.emit('step', router='192.168.1.1', level='info', message='Rebooting')
+    log.emit('step', router='192.168.1.1', level='error', message='Router not ready', elapsed=1.5)
+    events = read(log)
+    assert [event['message'] for event in events] == ['Rebooting', 'Router not ready']
+    assert events[1]['event'] == 'step' and events[1]['elapsed'] == 1.5
+    assert events[0]['time'].endswith('Z')
+
+
+def test_operation_redacts_secrets(log):
+    def set_wifi_password(self, band_type, authentication_type, new_password):
+        pass
+
+    log.operation(set_wifi_password, '192.168.1.1', ('5GHz', 'WPA2-Personal', 'abcd1234'), {}, 0.0, 0.25)
+    event = read(log)[0]
+    assert event['operation'] == 'set_wifi_password' and event['outcome'] == 'ok'
+    assert event['params'] == {'band_type': '5GHz', 'authentication_type': 'WPA2-Personal', 'new_password': '***'}
+    assert event['started'] == timestamp(0.0)
+
+
+def test_outcome():
+    Probe = collections.namedtuple('Probe', 'ready elapsed')
+    Login = collections.namedtuple('Login', 'success message')
+    assert outcome() == ('ok', None)
+    assert outcome(error=ValueError('Invalid band type')) == ('failed', 'ValueError: Invalid band type')
+    assert outcome(Probe(False, 3.0)) == ('failed', 'Router not ready after 3.0s')
+    assert outcome(Login(False, 'Invalid username or password')) == ('failed', 'Invalid username or password')
+    assert outcome(errors=2) == ('failed', '2 error(s) reported')
+
+
+def test_full_queue_drops_events(tmp_path):
+    log = EventLog(str(tmp_path / 'events.jsonl'), size=2)
+    # Writer not started yet: the queue only fills.
+    log.thread = 'not started'
+    for number in range(5):
+        log.emit('step', number=number)
+    assert log.dropped == 3
+    log.thread = None
+    log.start()
+    assert [event['number'] for event in read(log)] == [0, 1]
+    log.close()
+
+
+def test_disabled_log_writes_nothing(tmp_path):
+    log = EventLog(None)
+    log.emit('step', message='ignored')
+    assert log.thread is None and log.queue.empty()
+
+
+def test_close_writes_queued_events(tmp_path):
+    log = EventLog(str(tmp_path / 'events.jsonl'))
+    for number in range(1000):
+        log.emit('step', number=number)
+    log.close()
+    with open(log.target) as events_file:
+        assert len(events_file.readlines()) == 1000
+
+
+def test_unwritable_target_falls_back_to_stderr(tmp_path, capsys):
+    log = EventLog(str(tmp_path / 'missing' / 'events.jsonl'))
+    log.emit('step', router='192.168.1.1', level='info', message='Rebooting')
+    log.flush()
+    log.close()
+    lines = capsys.readouterr().err.splitlines()
+    assert 'not writable' in lines[0]
+    assert json.loads(lines[1])['message'] == 'Rebooting'
@@ -0,0 +1,45 @@
+#!/usr/bin/python3
+import pytest
+
+pytest.importorskip('requests')
+
+import ConstantName as CN
+from RouterFleet import RouterFleet, router_hardware
+
+
+@pytest.fixture
+def fleet(mock):
+    inventory = {'lab1': router_hardware(mock.address, username='admin', password='admin123', backend='http')}
+    return RouterFleet(inventory, workers=2, timeout=10, session=False)
+
+
+def test_run(fleet, mock):
+    result, = fleet.run('set_channel_no', '2.4GHz', '6')
+    assert result.router == 'lab1' and result.success and result.error is None
+    assert len(mock.history) == 1
+    assert '1/1 routers configured' in RouterFleet.table([result])
+
+
+def test_reported_error_fails_the_router(fleet, mock):
+    result, = fleet.batch([('set_channel_no', ('2.4GHz', '6')),
+                           ('set_wpa_encryption', ('2.4GHz', 'WPA2-Personal', 'TKIP+AES'))])
+    assert not result.success
+    assert result.error.startswith('OperationFailed: Encryption type not supported')
+    # The transaction was dropped, so the channel was not applied either.
+    assert mock.history == []
+
+
+def test_failed_login(mock):
+    inventory = [router_hardware(mock.address, username='admin', password='wrong', backend='http')]
+    result, = RouterFleet(inventory, session=False).run('set_channel_no', '2.4GHz', '6')
+    assert result.router == mock.address
+    assert not result.success and result.error.startswith('Login failed')
+
+
+def test_factory_account_after_reset(mock):
+    # A restored router only knows its factory account.
+    mock.apply({'action_mode': CN.ROUTER_ACTION_RESTORE})
+    mock.down_until = 0
+    fleet = RouterFleet([router_hardware(mock.address, backend='http')], session=False)
+    result, = fleet.run('set_channel_no', '2.4GHz', '6')
+    assert result.success
@@ -0,0 +1,120 @@
+#!/usr/bin/python3
+import pytest
+
+pytest.importorskip('requests')
+
+import ConstantName as CN
+import RouterForm
+from RouterHttp import RouterHttpSetting
+
+
+@pytest.fixture
+def router(mock):
+    router = RouterHttpSetting(mock.address, session=False)
+    assert router.sign_in('admin', 'admin123').success
+    yield router
+    router.transport.close()
+
+
+@pytest.fixture
+def steps(monkeypatch):
+    events = []
+    monkeypatch.setattr(RouterForm.EVENTS, 'emit', lambda event, **fields: events.append(fields))
+    return events
+
+
+def test_steps_are_events(router, steps):
+    router.set_channel_no('2.4GHz', 6)
+    assert [(step['level'], step['message']) for step in steps] == [('info', 'Setting channel number...')]
+    assert steps[0]['router'] == router.transport.ip
+    assert router.errors == 0
+
+
+def test_reported_errors_are_counted(router, steps, mock):
+    router.set_wifi_password('5GHz', 'Open System', 'abcd1234')
+    router.set_wpa_encryption('2.4GHz', 'WPA2-Personal', 'TKIP+AES')
+    assert [step['level'] for step in steps] == ['error', 'error']
+    assert router.errors == 2
+    assert mock.history == []
+
+
+def test_invalid_arguments_are_reported_errors(router, steps, mock):
+    router.set_authentication_method('2.4GHz', 'WEP')
+    router.set_authentication_method('6GHz', 'WPA2-Personal')
+    router.toggle_ssid_visibility('2.4GHz', 'hidden')
+    router.toggle_ssid_visibility('6GHz', 'hide')
+    router.toggle_wan_connection('restart')
+    assert [step['message'] for step in steps] == [
+        'Invalid authentication type. Please check', 'Invalid band type',
+        'Invalid SSID visibility. Please choose visible or hide', 'Invalid band type',
+        'Invalid WAN status. Please choose on or off']
+    assert router.errors == 5
+    assert mock.history == []
+
+
+def test_openvpn_needs_a_transport_that_uploads(router, steps, mock, monkeypatch):
+    monkeypatch.setattr(router.transport, 'can_upload', False)
+    router.set_vpn_connection('OpenVPN', 'FRANCE', 'vpn_user', 'vpn_pass')
+    assert [step['level'] for step in steps] == ['error']
+    assert 'cannot be uploaded' in steps[0]['message']
+    assert mock.history == []
+
+
+def test_transaction_applies_each_page_once(router, mock):
+    with router.transaction():
+        router.set_band_and_ssid('2.4GHz', 'iptv_lab')
+        router.set_channel_no('5GHz', '36')
+        router.set_wifi_password('5GHz', 'WPA2-Personal', 'abcd1234')
+        router.dhcp_control(True, '192.168.1.20', '192.168.1.100')
+        assert mock.history == []
+        # Reads inside the transaction see the staged values.
+        assert router.read(['wl0_ssid', 'wl1_channel']) == {'wl0_ssid': 'iptv_lab', 'wl1_channel': '36'}
+    assert [page for page, service, action in mock.history] == [CN.ROUTER_WIRELESS_PAGE, CN.ROUTER_DHCP_PAGE]
+    assert mock.nvram['wl0_ssid'] == 'iptv_lab'
+    assert (mock.nvram['wl1_channel'], mock.nvram['wl1_wpa_psk']) == ('36', 'abcd1234')
+    assert (mock.nvram['dhcp_start'], mock.nvram['dhcp_end']) == ('192.168.1.20', '192.168.1.100')
+
+
+def test_transaction_is_dropped_when_the_block_raises(router, mock):
+    with pytest.raises(ValueError):
+        with router.transaction():
+            router.set_band_and_ssid('2.4GHz', 'iptv_lab')
+            router.set_band_and_ssid('6GHz', 'iptv_lab')
+    assert mock.history == []
+    assert router.staged is None
+    router.set_channel_no('2.4GHz', '6')
+    assert len(mock.history) == 1
+
+
+def test_reboot_flushes_the_staged_changes_first(router, mock):
+    router.prober.interval = 0.05
+    with router.transaction():
+        router.set_band_and_ssid('2.4GHz', 'iptv_lab')
+        assert router.reboot().ready
+    assert [action for page, service, action in mock.history] == [CN.ROUTER_ACTION_APPLY, CN.ROUTER_ACTION_REBOOT]
+    assert mock.nvram['wl0_ssid'] == 'iptv_lab'
+
+
+def test_reconcile_applies_only_what_differs(router, mock):
+    state = {'wireless': {'2.4GHz': {'ssid': 'ASUS', 'channel': '6'},
+                          '5GHz': {'ssid': 'ASUS_5G', 'auth': 'WPA2-Personal', 'password': 'abcd1234'}},
+             'dhcp': {'start': CN.DEFAULT_STARTING_ADDRESS, 'end': CN.DEFAULT_ENDING_ADDRESS}}
+    result = router.reconcile(state)
+    assert result.changed == {'wl0_channel': (CN.ROUTER_AUTO_CHANNEL, '6'), 'wl1_wpa_psk': ('***', '***')}
+    assert {'wl0_ssid', 'wl1_ssid', 'wl1_auth_mode_x', 'dhcp_start', 'dhcp_end'} <= set(result.unchanged)
+    assert result.pages == [CN.ROUTER_WIRELESS_PAGE]
+    assert mock.history == [(CN.ROUTER_WIRELESS_PAGE, CN.ROUTER_SERVICE_WIRELESS, CN.ROUTER_ACTION_APPLY)]
+    assert (mock.nvram['wl0_channel'], mock.nvram['wl1_wpa_psk']) == ('6', 'abcd1234')
+
+    # The router is now in the desired state: nothing left to apply.
+    result = router.reconcile(state)
+    assert result.changed == {} and result.pages == []
+    assert len(mock.history) == 1
+
+
+def test_plan_does_not_touch_the_router(router, mock):
+    changes, uploads = router.plan({'wan': 'off', 'qos': []})
+    assert [(change.page, change.fields) for change in changes] == [
+        (CN.ROUTER_QOS_PAGE, {'qos_bw_rulelist': ''}), (CN.ROUTER_WAN_PAGE, {'wan_enable': '0', 'wan0_enable': '0'})]
+    assert uploads == [] and mock.history == []
+    assert mock.nvram['wan0_enable'] == '1'
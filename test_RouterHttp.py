@@ -0,0 +1,33 @@
+#!/usr/bin/python3
+import pytest
+
+pytest.importorskip('requests')
+
+import ConstantName as CN
+from RouterHttp import HttpTransport, RouterHttpSetting
+from RouterTransport import Change
+
+
+def test_sign_in_with_non_ascii_password(mock):
+    mock.nvram['http_passwd'] = 'pässwörd€'
+    transport = HttpTransport(mock.address)
+    assert transport.sign_in('admin', 'pässwörd€')
+    assert not transport.sign_in('admin', 'passwörd')
+    transport.close()
+
+
+def test_submit_and_read(mock):
+    transport = HttpTransport(mock.address)
+    assert transport.sign_in('admin', 'admin123')
+    transport.submit(Change(CN.ROUTER_WIRELESS_PAGE, CN.ROUTER_SERVICE_WIRELESS, {'wl_unit': '1', 'wl_channel': '153'},
+                            CN.ROUTER_ACTION_APPLY))
+    assert transport.read(['wl1_channel']) == {'wl1_channel': '153'}
+    transport.close()
+
+
+def test_setting_over_http(mock):
+    router = RouterHttpSetting(mock.address, session=False)
+    assert router.sign_in('admin', 'admin123').success
+    router.set_band_and_ssid('5GHz', 'SONY!!')
+    assert mock.nvram['wl1_ssid'] == 'SONY!!'
+    router.transport.close()
@@ -0,0 +1,46 @@
+#!/usr/bin/python3
+import subprocess
+import sys
+
+import pytest
+
+from RouterLazy import LazyImport
+
+
+def run(code):
+    # A fresh interpreter, so no test has imported the module yet.
+    subprocess.check_call([sys.executable, '-c', code])
+
+
+def test_import_on_first_use():
+    run('''import sys
+from RouterLazy import LazyImport
+Fraction = LazyImport('fractions', 'Fraction')
+decimal = LazyImport('decimal')
+assert 'fractions' not in sys.modules and 'decimal' not in sys.modules
+assert Fraction(1, 2) + Fraction(1, 2) == 1 and 'fractions' in sys.modules
+assert decimal.Decimal('1.5') * 2 == 3 and 'decimal' in sys.modules
+''')
+
+
+def test_resolve_is_cached():
+    import os.path
+
+    lazy = LazyImport('os.path', 'join')
+    assert lazy.resolve() is lazy.resolve() is os.path.join
+    assert lazy('a', 'b') == os.path.join('a', 'b')
+
+
+def test_missing_module_fails_on_use_only():
+    lazy = LazyImport('no_such_router_module')
+    with pytest.raises(ImportError):
+        lazy.anything
+
+
+def test_router_does_not_load_the_webdriver():
+    pytest.importorskip('selenium')
+    run('''import sys
+import Router
+assert 'selenium.common.exceptions' in sys.modules
+assert not {'selenium.webdriver', 'selenium.webdriver.common.by', 'VpnCatalog'} & set(sys.modules)
+''')
@@ -0,0 +1,83 @@
+#!/usr/bin/python3
+import collections
+import urllib.request
+
+import pytest
+
+import RouterMetrics
+from RouterMetrics import Counter, Histogram, RouterMetrics as Metrics
+
+
+Result = collections.namedtuple('Result', 'success')
+
+
+def test_counter_and_histogram_samples():
+    counter = Counter('router_reboots_total', 'Reboots.', ('router', 'ready'))
+    counter.inc(router='192.168.1.1', ready='true')
+    counter.inc(2, router='192.168.1.1', ready='true')
+    assert list(counter.samples()) == [('router_reboots_total', '{router="192.168.1.1",ready="true"}', 3)]
+
+    histogram = Histogram('router_operation_seconds', 'Durations.', ('method',), buckets=(1, 0.1))
+    for seconds in (0.05, 0.5, 0.5, 3):
+        histogram.observe(seconds, method='reboot')
+    assert list(histogram.samples()) == [
+        ('router_operation_seconds_bucket', '{method="reboot",le="0.1"}', 1),
+        ('router_operation_seconds_bucket', '{method="reboot",le="1"}', 3),
+        ('router_operation_seconds_bucket', '{method="reboot",le="+Inf"}', 4),
+        ('router_operation_seconds_sum', '{method="reboot"}', 4.05),
+        ('router_operation_seconds_count', '{method="reboot"}', 4),
+    ]
+
+
+def test_failures_by_kind():
+    metrics = Metrics()
+    metrics.observe('set_channel_no', 'lab1', 0.2)
+    metrics.observe('set_channel_no', 'lab1', 0.2, error=ValueError('Invalid band type'))
+    metrics.observe('sign_in', 'lab1', 0.2, Result(False))
+    metrics.observe('set_channel_no', 'lab1', 0.2, error='TimeoutException')
+    assert metrics.operations.count(method='set_channel_no', router='lab1') == 3
+    assert metrics.failures.get(method='set_channel_no', router='lab1', exception='ValueError') == 1
+    assert metrics.failures.get(method='set_channel_no', router='lab1', exception='TimeoutException') == 1
+    assert metrics.failures.get(method='sign_in', router='lab1', exception='Failed') == 1
+
+
+def test_render_text_format(tmp_path):
+    metrics = Metrics()
+    metrics.failure('set_vpn_connection', 'lab "1"\n', 'OSError')
+    text = metrics.render()
+    assert text.endswith('\n')
+    assert '# HELP router_operation_failures_total Failed router operations by exception type.\n' in text
+    assert '# TYPE router_operation_seconds histogram\n' in text
+    assert ('router_operation_failures_total{method="set_vpn_connection",router="lab \\"1\\"\\n",'
+            'exception="OSError"} 1\n') in text
+    filename = metrics.write_textfile(str(tmp_path / 'router.prom'))
+    with open(filename) as metrics_file:
+        assert metrics_file.read() == text
+
+
+def test_serve():
+    metrics = Metrics()
+    metrics.reboots.inc(router='lab1', ready='true')
+    server = RouterMetrics.serve(port=0, metrics=metrics)
+    try:
+        response = urllib.request.urlopen('http://127.0.0.1:%d/metrics' % server.server_address[1])
+        assert response.headers['Content-Type'] == RouterMetrics.CONTENT_TYPE
+        assert 'router_reboots_total{router="lab1",ready="true"} 1' in response.read().decode('utf-8')
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_reported_error_is_counted_once(mock):
+    pytest.importorskip('requests')
+    from Router import OperationFailed, RouterSetting
+    from RouterFleet import router_hardware
+
+    router = RouterSetting(backend='http', session=False, hardware=router_hardware(mock.address))
+    assert router.sign_in('admin', 'admin123').success
+    with pytest.raises(OperationFailed):
+        router.set_wpa_encryption('2.4GHz', 'WPA2-Personal', 'TKIP+AES')
+    router.close()
+    failures = dict((key, value) for key, value in RouterMetrics.METRICS.failures.values.items()
+                    if key[:2] == ('set_wpa_encryption', mock.address))
+    assert failures == {('set_wpa_encryption', mock.address, 'OperationFailed'): 1}
@@ -0,0 +1,87 @@
+#!/usr/bin/python3
+import base64
+import http.client
+import json
+import time
+import urllib.parse
+
+import pytest
+
+import ConstantName as CN
+
+
+def test_apply_maps_wireless_fields_to_the_selected_band(mock):
+    mock.apply({'current_page': CN.ROUTER_WIRELESS_PAGE, 'rc_service': CN.ROUTER_SERVICE_WIRELESS,
+                'wl_unit': '1', 'wl_ssid': 'iptv_lab_5G', 'wl_channel': '36'})
+    assert mock.nvram['wl1_ssid'] == 'iptv_lab_5G' and mock.nvram['wl1_channel'] == '36'
+    assert mock.nvram['wl0_ssid'] == 'ASUS'
+    assert 'wl1_unit' not in mock.nvram
+    assert mock.history == [(CN.ROUTER_WIRELESS_PAGE, CN.ROUTER_SERVICE_WIRELESS, CN.ROUTER_ACTION_APPLY)]
+
+
+def test_wireless_page_reloads_on_the_applied_band(mock):
+    assert mock.nvram['wl_unit'] == '0'
+    mock.apply({'current_page': CN.ROUTER_WIRELESS_PAGE, 'wl_unit': '1', 'wl_ssid': 'iptv_lab_5G'})
+    assert mock.nvram['wl_unit'] == '1'
+    page = mock.render(CN.ROUTER_WIRELESS_PAGE)
+    assert '"wl_unit": "1"' in page
+    assert 'changeUnit(nvram.wl_unit);' in page
+
+
+def test_restore_resets_the_band(mock):
+    mock.apply({'current_page': CN.ROUTER_WIRELESS_PAGE, 'wl_unit': '1'})
+    mock.apply({'action_mode': CN.ROUTER_ACTION_RESTORE})
+    assert mock.nvram['wl_unit'] == '0'
+    assert mock.is_down()
+
+
+def post(mock, page, fields, cookie=None):
+    connection = http.client.HTTPConnection('127.0.0.1', mock.port, timeout=5)
+    headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+    if cookie:
+        headers['Cookie'] = cookie
+    connection.request('POST', CN.STR_FORWARDSLASH + page, urllib.parse.urlencode(fields), headers)
+    response = connection.getresponse()
+    body = response.read().decode('utf-8')
+    connection.close()
+    return response, body
+
+
+def authorization(username, password):
+    return base64.b64encode(('%s:%s' % (username, password)).encode('utf-8')).decode('ascii')
+
+
+def test_login_hands_out_a_token(mock):
+    response, body = post(mock, CN.ROUTER_LOGIN_CGI, {'login_authorization': authorization('admin', 'admin123')})
+    token = json.loads(body)[CN.ROUTER_TOKEN_COOKIE]
+    assert token in mock.tokens
+    assert CN.ROUTER_TOKEN_COOKIE + '=' + token in response.getheader('Set-Cookie')
+
+
+def test_login_rejects_a_wrong_password(mock):
+    response, body = post(mock, CN.ROUTER_LOGIN_CGI, {'login_authorization': authorization('admin', 'wrong')})
+    assert json.loads(body) == {'error_status': '3'}
+    assert not mock.tokens
+
+
+def test_login_decodes_utf8_credentials(mock):
+    mock.nvram['http_passwd'] = 'pässwörd'
+    response, body = post(mock, CN.ROUTER_LOGIN_CGI, {'login_authorization': authorization('admin', 'pässwörd')})
+    assert CN.ROUTER_TOKEN_COOKIE in json.loads(body)
+
+
+def test_apply_needs_a_token(mock):
+    response, body = post(mock, CN.ROUTER_APPLY_CGI, {'current_page': CN.ROUTER_WIRELESS_PAGE, 'wl_ssid': 'x'},
+                          cookie=CN.ROUTER_TOKEN_COOKIE + '=00ff')
+    assert response.status == 401
+    assert mock.history == []
+
+
+def test_reboot_drops_tokens_and_connections(mock):
+    token = mock.login(authorization('admin', 'admin123'))
+    mock.apply({'action_mode': CN.ROUTER_ACTION_REBOOT})
+    assert token not in mock.tokens
+    with pytest.raises((http.client.HTTPException, ConnectionError)):
+        post(mock, CN.ROUTER_LOGIN_CGI, {'login_authorization': authorization('admin', 'admin123')})
+    time.sleep(mock.reboot_time)
+    assert not mock.is_down()
@@ -0,0 +1,130 @@
+#!/usr/bin/python3
+import json
+
+import pytest
+
+import ConstantName as CN
+from Router import RouterSetting
+from RouterPlaybook import RouterPlaybook
+
+
+def test_parse_step_forms():
+    playbook = RouterPlaybook({'on_error': 'continue', 'steps': [
+        'remove_bandwidth_limit',
+        {'set_channel_no': ['2.4GHz', '6']},
+        {'dhcp_control': {'dhcp_server_status': True, 'starting_address': '192.168.1.2',
+                          'ending_address': '192.168.1.254'}},
+        {'set_band_and_ssid': '2.4GHz'},
+        {'operation': 'set_wifi_password', 'args': ['5GHz', 'WPA2-Personal'], 'kwargs': {'wifi_password': 'abcd1234'},
+         'on_error': 'stop'},
+    ]})
+    assert [(step.number, step.operation, step.args, step.on_error) for step in playbook.steps] == [
+        (1, 'remove_bandwidth_limit', (), 'continue'),
+        (2, 'set_channel_no', ('2.4GHz', '6'), 'continue'),
+        (3, 'dhcp_control', (), 'continue'),
+        (4, 'set_band_and_ssid', ('2.4GHz',), 'continue'),
+        (5, 'set_wifi_password', ('5GHz', 'WPA2-Personal'), 'stop'),
+    ]
+    assert playbook.steps[2].kwargs['starting_address'] == '192.168.1.2'
+    assert playbook.steps[4].kwargs == {'wifi_password': 'abcd1234'}
+
+
+@pytest.mark.parametrize('step, error', [
+    ({'set_channel_no': ['2.4GHz'], 'dhcp_control': {}}, 'expected an operation name'),
+    ('format_disk', 'unknown operation format_disk'),
+    ('sign_in', 'unknown operation sign_in'),
+    ('_verify', 'unknown operation _verify'),
+    ({'operation': 'reboot', 'on_error': 'retry'}, 'on_error must be stop or continue'),
+])
+def test_parse_errors(step, error):
+    with pytest.raises(ValueError, match='Step 2: ' + error):
+        RouterPlaybook(['reboot', step])
+
+
+def test_operation_pages_are_operations():
+    for operation in CN.ROUTER_OPERATION_PAGES:
+        assert callable(getattr(RouterSetting, operation, None)), operation
+
+
+def test_batches_group_adjacent_steps_of_a_page():
+    playbook = RouterPlaybook(['set_band_and_ssid', 'set_channel_no', 'dhcp_control', 'reboot', 'set_bandwidth_rules',
+                               'remove_bandwidth_limit', 'set_wifi_password'])
+    assert [(page, [step.number for step in batch]) for page, batch in playbook.batches()] == [
+        (CN.ROUTER_WIRELESS_PAGE, [1, 2]),
+        (CN.ROUTER_DHCP_PAGE, [3]),
+        (None, [4]),
+        (CN.ROUTER_QOS_PAGE, [5, 6]),
+        (CN.ROUTER_WIRELESS_PAGE, [7]),
+    ]
+
+
+def test_load_json_file(tmp_path):
+    filename = str(tmp_path / 'nightly.json')
+    with open(filename, 'w') as playbook_file:
+        json.dump({'steps': [{'set_channel_no': ['2.4GHz', '6']}]}, playbook_file)
+    playbook = RouterPlaybook(filename)
+    assert playbook.name == filename
+    assert [step.operation for step in playbook.steps] == ['set_channel_no']
+
+
+@pytest.fixture
+def router(mock):
+    pytest.importorskip('requests')
+    from RouterFleet import router_hardware
+
+    router = RouterSetting(backend='http', session=False, hardware=router_hardware(mock.address))
+    assert router.sign_in('admin', 'admin123').success
+    yield router
+    router.close()
+
+
+def test_batch_is_applied_once(router, mock):
+    result = RouterPlaybook([{'set_band_and_ssid': ['2.4GHz', 'iptv_lab']},
+                             {'set_channel_no': ['2.4GHz', '6']},
+                             {'set_bandwidth_rules': [[{'mac': 'AA:BB:CC:DD:EE:FF', 'download': 50, 'upload': 25}]]}]
+                            ).run(router)
+    assert result.success and result.error is None
+    assert [(row.step, row.operation) for row in result.steps] == [
+        (1, 'set_band_and_ssid'), (2, 'set_channel_no'), (None, 'apply'), (3, 'set_bandwidth_rules')]
+    assert [page for page, service, action in mock.history] == [CN.ROUTER_WIRELESS_PAGE, CN.ROUTER_QOS_PAGE]
+    assert mock.nvram['wl0_ssid'] == 'iptv_lab' and mock.nvram['wl0_channel'] == '6'
+
+
+def test_reported_error_fails_the_step(router, mock):
+    result = RouterPlaybook([{'operation': 'set_wpa_encryption', 'args': ['2.4GHz', 'WPA2-Personal', 'TKIP+AES'],
+                              'on_error': 'continue'},
+                             {'dhcp_control': [True, '192.168.1.20', '192.168.1.100']},
+                             {'set_channel_no': ['5GHz', '36']}]).run(router)
+    assert not result.success
+    assert [(row.step, row.success) for row in result.steps] == [(1, False), (2, True), (3, True)]
+    assert result.error.startswith('Step 1 set_wpa_encryption: OperationFailed: Encryption type not supported')
+    assert len(mock.history) == 2
+
+
+class PageTransport(object):
+    '''
+    Browser transport double recording the changes posted through the page form.
+    '''
+    name = CN.ROUTER_BACKEND_SELENIUM
+    direct = False
+    browser = wait = None
+
+    def __init__(self):
+        self.ip = '192.168.1.1'
+        self.changes = []
+
+    def submit(self, change):
+        self.changes.append(change)
+
+
+def test_bandwidth_rules_through_the_page_form(monkeypatch):
+    import Router
+
+    events = []
+    monkeypatch.setattr(Router.EVENTS, 'emit', lambda event, **fields: events.append(event))
+    transport = PageTransport()
+    router = RouterSetting(session=False, transport=transport)
+    router.set_bandwidth_rules([{'mac': 'AA:BB:CC:DD:EE:FF', 'download': 50, 'upload': 25}])
+    change, = transport.changes
+    assert change.page == CN.ROUTER_QOS_PAGE and change.fields['qos_bw_rulelist'] == '<1>AA:BB:CC:DD:EE:FF>51200>25600>0'
+    assert events.count('operation') == 1
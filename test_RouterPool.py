@@ -0,0 +1,129 @@
+#!/usr/bin/python3
+import time
+
+import pytest
+
+pytest.importorskip('selenium')
+
+from selenium.common.exceptions import WebDriverException
+
+import ConstantName as CN
+from RouterPool import BrowserPool
+
+
+class PageBrowser(object):
+    def __init__(self):
+        self.pages = []
+
+    def get(self, url):
+        self.pages.append(url)
+
+
+class BrowserTransport(object):
+    '''
+    Stand-in for RouterSelenium.SeleniumTransport: a signed-in browser that never leaves the main page.
+    '''
+    name = CN.ROUTER_BACKEND_SELENIUM
+    direct = False
+
+    def __init__(self, ip, memory=None):
+        self.ip = ip
+        self.browser = PageBrowser()
+        self.wait = None
+        self.signed_in = False
+        self.closed = False
+        self.rss = memory
+
+    def url(self, page):
+        return CN.STR_HTTP + self.ip + CN.STR_FORWARDSLASH + page
+
+    def sign_in(self, username, password):
+        self.signed_in = password == 'admin123'
+        return self.signed_in
+
+    def alive(self):
+        return self.signed_in and not self.closed
+
+    def memory(self):
+        return self.rss
+
+    def close(self):
+        self.closed = True
+
+
+class Pool(BrowserPool):
+    def __init__(self, password='admin123', memory=None, **options):
+        BrowserPool.__init__(self, '192.168.1.1', 'pc', 'admin', password, **options)
+        self.launched = []
+        self.memory = memory
+
+    def launch(self):
+        transport = BrowserTransport(self.ip, self.memory)
+        self.launched.append(transport)
+        return transport
+
+
+@pytest.fixture(autouse=True)
+def poll(monkeypatch):
+    # The maintainer checks for returned browsers and close() every poll.
+    monkeypatch.setattr(CN, 'ROUTER_POOL_POLL', 0.02)
+
+
+def settle(pool, browsers):
+    deadline = time.perf_counter() + 2
+    while (len(pool.browsers) != browsers or pool.idle.qsize() != browsers) and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    assert len(pool.browsers) == browsers and pool.idle.qsize() == browsers
+
+
+def test_lease_reuses_warm_browsers():
+    pool = Pool(size=2, max_uses=10).start()
+    try:
+        settle(pool, 2)
+        with pool.lease(timeout=1) as router:
+            assert router.transport in pool.launched and router.credentials == ('admin', 'admin123')
+        settle(pool, 2)
+        assert len(pool.launched) == 2
+        assert sorted(stat['uses'] for stat in pool.stats()) == [0, 1]
+        assert router.transport.browser.pages == [router.transport.url(CN.ROUTER_INDEX_PAGE)]
+    finally:
+        pool.close()
+    assert all(transport.closed for transport in pool.launched)
+
+
+@pytest.mark.parametrize('options, memory', [({'max_uses': 1}, None), ({'max_memory': 100}, 200)])
+def test_worn_browser_is_recycled(options, memory):
+    pool = Pool(size=1, memory=memory, **options).start()
+    try:
+        settle(pool, 1)
+        with pool.lease(timeout=1) as router:
+            pass
+        settle(pool, 1)
+        assert router.transport.closed and len(pool.launched) == 2
+    finally:
+        pool.close()
+
+
+def test_broken_browser_is_recycled():
+    pool = Pool(size=1).start()
+    try:
+        settle(pool, 1)
+        with pytest.raises(WebDriverException):
+            with pool.lease(timeout=1) as router:
+                raise WebDriverException('chrome not reachable')
+        settle(pool, 1)
+        assert router.transport.closed and len(pool.launched) == 2
+    finally:
+        pool.close()
+
+
+def test_no_browser_when_login_fails():
+    pool = Pool(password='wrong', size=1).start()
+    try:
+        with pytest.raises(TimeoutError):
+            pool.acquire(timeout=0.2)
+        assert len(pool.launched) == 1 and pool.launched[0].closed
+    finally:
+        pool.close()
+    with pytest.raises(RuntimeError):
+        pool.acquire(timeout=0.2)
@@ -0,0 +1,71 @@
+#!/usr/bin/python3
+import subprocess
+import threading
+
+from RouterProbe import ProbeSchedule, ReadinessProber
+
+
+def test_login_with_non_ascii_password(mock):
+    mock.nvram['http_passwd'] = 'pässwörd€'
+    prober = ReadinessProber(mock.address)
+    assert prober.login('admin', 'pässwörd€')
+    assert not prober.login('admin', 'admin123')
+
+
+def test_wait_up_when_router_is_up(mock):
+    result = ReadinessProber(mock.address, interval=0.05).wait_up('admin', 'admin123')
+    assert result.ready and not result.went_down
+    assert result.stage == 'login'
+
+
+def test_wait_for_reboot_measures_downtime(mock):
+    prober = ReadinessProber(mock.address, interval=0.05, max_interval=0.1, timeout=5, down_timeout=2)
+    threading.Timer(0.2, mock.reboot).start()
+    result = prober.wait_for_reboot('admin', 'admin123')
+    assert result.ready and result.went_down
+    assert mock.reboot_time * 0.5 <= result.downtime < result.elapsed
+
+
+def test_router_not_ready_within_timeout(mock):
+    mock.reboot_time = 10
+    mock.reboot()
+    result = ReadinessProber(mock.address, interval=0.05, max_interval=0.1, timeout=0.5).wait_up('admin', 'admin123')
+    assert not result.ready
+    assert result.stage in (None, 'icmp', 'tcp')
+
+
+def test_router_that_never_goes_down(mock):
+    result = ReadinessProber(mock.address, interval=0.05, timeout=1, down_timeout=0.3).wait_for_reboot()
+    assert result.ready and not result.went_down
+
+
+def test_schedule_backs_off_until_a_probe_passes():
+    schedule = ProbeSchedule(['tcp', 'http'], 0.5, 2, 60)
+    assert schedule.stage == 'tcp'
+    assert [schedule.record(False) for _ in range(4)] == [0.5, 1, 2, 2]
+    assert schedule.record(True) == 0
+    assert schedule.stage == 'http'
+    assert schedule.record(False) == 0.5
+    schedule.record(True)
+    assert schedule.stage is None
+    result = schedule.result(went_down=False)
+    assert result.ready and result.stage == 'http'
+
+
+def test_schedule_gives_up_at_the_deadline():
+    schedule = ProbeSchedule(['tcp'], 5, 5, 0.05)
+    assert schedule.record(False) <= 0.05
+    threading.Event().wait(0.06)
+    assert schedule.stage is None
+    result = schedule.result(went_down=True)
+    assert not result.ready and result.went_down and result.stage is None
+
+
+def test_icmp_timeout_is_unreachable(monkeypatch):
+    def call(command, **kwargs):
+        raise subprocess.TimeoutExpired(command, kwargs['timeout'])
+
+    monkeypatch.setattr(subprocess, 'call', call)
+    assert not ReadinessProber('192.168.1.1').icmp()
+    monkeypatch.setattr(subprocess, 'call', lambda command, **kwargs: 0)
+    assert ReadinessProber('192.168.1.1').icmp()
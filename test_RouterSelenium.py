@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+import os
+
+import pytest
+
+pytest.importorskip('selenium')
+
+import ConstantName as CN
+import RouterSelenium
+from RouterMetrics import METRICS
+from RouterSelenium import LOW_MEMORY_ARGUMENTS, SeleniumTransport, block_resources, low_memory_options
+
+
+class DevToolsBrowser(object):
+    def __init__(self, error=None):
+        self.commands = []
+        self.error = error
+
+    def execute_cdp_cmd(self, command, params):
+        if self.error is not None:
+            raise self.error
+        self.commands.append((command, params))
+
+
+def test_low_memory_options():
+    options = low_memory_options('/dev/shm/router-chrome-1')
+    assert set(LOW_MEMORY_ARGUMENTS) <= set(options.arguments)
+    assert '--renderer-process-limit=%d' % CN.ROUTER_CHROME_RENDERERS in options.arguments
+    assert '--js-flags=--max-old-space-size=%d' % CN.ROUTER_CHROME_JS_HEAP in options.arguments
+    assert '--user-data-dir=/dev/shm/router-chrome-1' in options.arguments
+    assert options.experimental_options['prefs'] == {'profile.managed_default_content_settings.images': 2}
+
+
+def test_block_resources(monkeypatch):
+    browser = DevToolsBrowser()
+    block_resources(browser)
+    assert browser.commands == [('Network.enable', {}), ('Network.setBlockedURLs', {'urls': list(CN.ROUTER_CHROME_BLOCKED)})]
+
+    warnings = []
+    monkeypatch.setattr(RouterSelenium.EVENTS, 'emit', lambda event, **fields: warnings.append(fields['level']))
+    block_resources(DevToolsBrowser(RouterSelenium.WebDriverException('unknown command')))
+    assert warnings == ['warning']
+
+
+def test_failed_launch_removes_the_profile(tmp_path, monkeypatch):
+    def chrome(**kwargs):
+        assert os.path.isdir(kwargs['chrome_options'].arguments[-1].split('=', 1)[1])
+        raise RouterSelenium.WebDriverException('chrome not reachable')
+
+    monkeypatch.setattr(CN, 'ROUTER_CHROME_TMPFS', str(tmp_path))
+    monkeypatch.setattr(CN, 'ROUTER_CHROME_LOW_MEMORY', True)
+    monkeypatch.setattr(RouterSelenium.webdriver, 'Chrome', chrome)
+    failed = METRICS.launches.get(device='orangepi', outcome='failed')
+    with pytest.raises(RouterSelenium.WebDriverException):
+        SeleniumTransport('192.168.1.1', 'OrangePi')
+    assert os.listdir(str(tmp_path)) == []
+    assert METRICS.launches.get(device='orangepi', outcome='failed') == failed + 1
+
+
+def test_unsupported_device():
+    with pytest.raises(ValueError, match='Device not supported'):
+        SeleniumTransport('192.168.1.1', 'raspberrypi')
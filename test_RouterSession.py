@@ -0,0 +1,60 @@
+#!/usr/bin/python3
+import os
+import stat
+
+import pytest
+
+from RouterSession import SessionStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SessionStore(str(tmp_path / 'sessions.json'))
+
+
+def test_save_load_discard(store):
+    assert store.load('192.168.1.1', 'admin') is None
+    store.save('192.168.1.1', 'admin', {'asus_token': 'abc'})
+    store.save('192.168.1.1', 'guest', {})
+    assert store.load('192.168.1.1', 'admin') == {'asus_token': 'abc'}
+    assert store.load('192.168.1.1', 'guest') is None
+    assert stat.S_IMODE(os.stat(store.path).st_mode) == 0o600
+    store.discard('192.168.1.1', 'admin')
+    assert store.load('192.168.1.1', 'admin') is None
+
+
+def test_corrupt_file_holds_no_session(store):
+    with open(store.path, 'w') as session_file:
+        session_file.write('{not json')
+    assert store.load('192.168.1.1', 'admin') is None
+
+
+def test_failed_write_leaves_no_temp_file(store, tmp_path):
+    store.save('192.168.1.1', 'admin', {'asus_token': 'abc'})
+    with pytest.raises(TypeError):
+        store.save('192.168.1.1', 'root', {'asus_token': object()})
+    assert os.listdir(str(tmp_path)) == ['sessions.json']
+    assert store.load('192.168.1.1', 'admin') == {'asus_token': 'abc'}
+
+
+def test_resume_over_http(store, mock):
+    pytest.importorskip('requests')
+    from RouterHttp import HttpTransport
+
+    transport = HttpTransport(mock.address)
+    assert not store.resume(transport, 'admin')
+    assert transport.sign_in('admin', 'admin123')
+    store.store(transport, 'admin')
+    transport.close()
+
+    transport = HttpTransport(mock.address)
+    assert store.resume(transport, 'admin')
+    assert transport.read(['wl0_ssid']) == {'wl0_ssid': 'ASUS'}
+    transport.close()
+
+    # A reboot drops every token: the stored session is rejected and discarded.
+    mock.tokens.clear()
+    transport = HttpTransport(mock.address)
+    assert not store.resume(transport, 'admin')
+    assert store.load(mock.address, 'admin') is None
+    transport.close()
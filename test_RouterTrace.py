@@ -0,0 +1,75 @@
+#!/usr/bin/python3
+import json
+import threading
+
+import pytest
+
+from RouterTrace import RouterTracer, call_arguments, redact
+
+
+def set_wifi_password(self, band_type, authentication_type, wifi_password):
+    pass
+
+
+def spans(tracer, category):
+    return [event for event in tracer.trace()['traceEvents'] if event.get('cat') == category]
+
+
+def test_arguments_are_named_and_secrets_redacted():
+    assert redact('vpn_password', 'secret') == '***'
+    assert redact('channel', 6) == 6 and redact('band', ('2.4GHz',)) == "('2.4GHz',)"
+    assert call_arguments(set_wifi_password, ('5GHz', 'WPA2-Personal'), {'wifi_password': 'abcd1234'}) == {
+        'band_type': '5GHz', 'authentication_type': 'WPA2-Personal', 'wifi_password': '***'}
+    assert call_arguments(set_wifi_password, ('5GHz',), {'ssid': 'x'}) == {'args': ['5GHz']}
+
+
+def test_span_outcome():
+    tracer = RouterTracer()
+    with tracer.span('reboot', 'operation', router='lab1'):
+        pass
+    with pytest.raises(ValueError):
+        with tracer.span('set_channel_no', 'operation'):
+            raise ValueError("Invalid band type\nmore")
+    ok, failed = spans(tracer, 'operation')
+    assert ok['args'] == {'router': 'lab1', 'outcome': 'ok'}
+    assert failed['args'] == {'outcome': 'ValueError', 'error': 'Invalid band type'}
+    assert failed['ph'] == 'X' and failed['dur'] >= 0
+    names = [event for event in tracer.trace()['traceEvents'] if event['ph'] == 'M']
+    assert names == [{'name': 'thread_name', 'ph': 'M', 'pid': ok['pid'], 'tid': threading.get_ident(),
+                      'args': {'name': threading.current_thread().name}}]
+
+
+def test_webdriver_commands_and_waits():
+    tracer = RouterTracer()
+    execute = tracer.command(lambda command, params=None: {'value': None})
+    execute('findElement', {'using': 'css selector', 'value': '#applyButton'})
+    execute('sendKeysToElement', {'id': 'f.0123456789', 'text': 'abcd1234', 'value': ['abcd1234']})
+    click = tracer.wait('click', lambda locator: True)
+    assert click(('id', 'applyButton'))
+    find, keys = spans(tracer, 'webdriver')
+    assert find['name'] == 'findElement' and find['args']['locator'] == 'css selector=#applyButton'
+    assert keys['args'] == {'element': 'f.012345', 'keys': '***', 'outcome': 'ok'}
+    wait, = spans(tracer, 'wait')
+    assert wait['name'] == 'wait.click' and wait['args']['locator'] == 'id=applyButton'
+    assert sorted((name, count) for name, (count, seconds) in tracer.summary()) == [
+        ('findElement', 1), ('sendKeysToElement', 1)]
+
+
+def test_operations_over_http(mock, tmp_path):
+    pytest.importorskip('requests')
+    from Router import RouterSetting
+    from RouterFleet import router_hardware
+
+    tracer = RouterTracer(str(tmp_path / 'router.trace.json'))
+    router = RouterSetting(backend='http', session=False, hardware=router_hardware(mock.address), tracer=tracer)
+    router.sign_in('admin', 'admin123')
+    with router.transaction():
+        router.set_wifi_password('2.4GHz', 'WPA2-Personal', 'abcd1234')
+    router.close()
+    operations = dict((event['name'], event['args']) for event in spans(tracer, 'operation'))
+    assert operations['set_wifi_password'] == {'router': mock.address, 'band_type': '2.4GHz',
+                                               'authentication_type': 'WPA2-Personal', 'new_password': '***',
+                                               'outcome': 'ok'}
+    assert operations['transaction']['outcome'] == 'ok'
+    with open(tracer.save()) as trace_file:
+        assert json.load(trace_file)['displayTimeUnit'] == 'ms'
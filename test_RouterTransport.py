@@ -0,0 +1,70 @@
+#!/usr/bin/python3
+import subprocess
+import sys
+
+import pytest
+
+import ConstantName as CN
+import RouterConfig as routerconfig
+from RouterTransport import Change, RouterTransport, create_transport, router_ip
+
+
+def test_router_ip(monkeypatch):
+    assert router_ip('10.0.0.1') == '10.0.0.1'
+    monkeypatch.setitem(routerconfig.hardware['HARDWAREINFO'], 'IP', None)
+    with pytest.raises(ValueError, match='HARDWAREINFO'):
+        router_ip()
+    monkeypatch.setitem(routerconfig.hardware['HARDWAREINFO'], 'IP', '192.168.50.1')
+    assert router_ip() == '192.168.50.1'
+
+
+def test_change_defaults_to_apply():
+    change = Change(CN.ROUTER_WIRELESS_PAGE, CN.ROUTER_SERVICE_WIRELESS, {'wl_unit': '0'})
+    assert change.action == CN.ROUTER_ACTION_APPLY
+
+
+def test_base_transport():
+    class ReadOnly(RouterTransport):
+        def read(self, names):
+            return dict.fromkeys(names, '')
+
+    with pytest.raises(TypeError):
+        ReadOnly('127.0.0.1:8080')
+
+    class Transport(ReadOnly):
+        sign_in = submit = upload = None
+
+    transport = Transport('127.0.0.1:8080')
+    assert transport.direct and transport.can_upload
+    assert transport.url(CN.ROUTER_LOGIN_PAGE) == 'http://127.0.0.1:8080/' + CN.ROUTER_LOGIN_PAGE
+    assert transport.cookies() == {} and not transport.resume({'asus_token': 'abc'})
+
+
+def test_unsupported_backend():
+    with pytest.raises(ValueError, match='Backend not supported'):
+        create_transport('telnet', '192.168.1.1')
+
+
+def test_only_the_selected_backend_is_imported():
+    pytest.importorskip('requests')
+    subprocess.check_call([sys.executable, '-c', '''import sys
+from RouterTransport import create_transport
+transport = create_transport('HTTP', '192.168.1.1')
+assert type(transport).__name__ == 'HttpTransport' and transport.name == 'http'
+assert 'RouterHttp' in sys.modules
+assert not {'RouterSsh', 'RouterSelenium', 'paramiko', 'selenium'} & set(sys.modules)
+'''])
+
+
+def test_ssh_submit_and_read(monkeypatch):
+    pytest.importorskip('paramiko')
+    from RouterSsh import SshTransport
+
+    transport = SshTransport('192.168.1.1')
+    commands = []
+    monkeypatch.setattr(transport, 'run', lambda command: commands.append(command) or 'iptv lab\0' + '36\0')
+    transport.submit(Change(CN.ROUTER_WIRELESS_PAGE, 'restart_wireless;restart_qos', {'wl0_ssid': 'iptv lab'}))
+    transport.submit(Change(CN.ROUTER_INDEX_PAGE, '', {}, CN.ROUTER_ACTION_REBOOT))
+    assert commands == ["nvram set wl0_ssid='iptv lab' && nvram commit && service restart_wireless && service restart_qos",
+                        'reboot']
+    assert transport.read(['wl0_ssid', 'wl1_channel']) == {'wl0_ssid': 'iptv lab', 'wl1_channel': '36'}
@@ -0,0 +1,211 @@
+#!/usr/bin/python3
+import time
+
+import pytest
+
+pytest.importorskip('selenium')
+
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+
+import ConstantName as CN
+from RouterWait import FILL_SCRIPT, STATE_SCRIPT, RouterWait
+
+
+class Element(object):
+    def __init__(self, text='', displayed=True):
+        self.text = text
+        self.displayed = displayed
+        self.stale = False
+
+    def is_displayed(self):
+        return self.displayed
+
+    def is_enabled(self):
+        if self.stale:
+            raise StaleElementReferenceException('element is not attached to the page document')
+        return True
+
+
+class ScriptBrowser(object):
+    '''
+    Browser answering execute_script from a list of results, and find_elements from a dict of element id to elements.
+    '''
+    def __init__(self, results=(), elements=None, url='http://192.168.1.1/Main_Login.asp'):
+        self.results = list(results)
+        self.scripts = []
+        self.elements = elements or {}
+        self.current_url = url
+
+    def execute_script(self, script, *args):
+        self.scripts.append((script, args))
+        if script == 'return document.readyState':
+            return 'complete'
+        return self.results.pop(0) if len(self.results) > 1 else self.results[0]
+
+    def find_elements(self, by, value):
+        return self.elements.get(value, [])
+
+    def find_element(self, by, value):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(value)
+        return elements[0]
+
+
+def test_until_returns_as_soon_as_the_condition_holds():
+    wait = RouterWait(ScriptBrowser(), element=5)
+    calls = []
+    start = time.perf_counter()
+    assert wait.until(lambda browser: calls.append(1) or (len(calls) == 3 and 'ready')) == 'ready'
+    assert time.perf_counter() - start < 2
+
+
+def test_until_timeout_per_kind_and_seconds():
+    wait = RouterWait(ScriptBrowser(), apply=0.1)
+    assert wait.timeouts['apply'] == 0.1 and wait.timeouts['page'] == CN.ROUTER_TIMEOUT_PAGE
+    with pytest.raises(TimeoutException, match='Router still applying'):
+        wait.until(lambda browser: False, 'apply', 'Router still applying')
+    with pytest.raises(TimeoutException):
+        wait.until(lambda browser: False, 0.1)
+
+
+def test_missing_elements_are_retried_not_raised():
+    browser = ScriptBrowser()
+    wait = RouterWait(browser)
+    answers = [NoSuchElementException('wl_ssid'), StaleElementReferenceException('wl_ssid'), 'found']
+
+    def condition(browser):
+        answer = answers.pop(0)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+    assert wait.until(condition) == 'found'
+
+
+def test_navigation_waits_for_the_old_page_to_go():
+    page = Element()
+    wait = RouterWait(ScriptBrowser(), page=0.3)
+    with pytest.raises(TimeoutException, match='Page did not change'):
+        wait.navigation(page)
+    page.stale = True
+    assert wait.navigation(page)
+
+
+def test_login_success_on_redirect_or_main_menu():
+    wait = RouterWait(ScriptBrowser(url='http://192.168.1.1/' + CN.ROUTER_INDEX_PAGE))
+    assert wait.login() == (True, '')
+    wait = RouterWait(ScriptBrowser(elements={CN.MAIN_MENU: [Element()]}))
+    assert wait.login() == (True, '')
+
+
+def test_login_error_shown():
+    browser = ScriptBrowser(elements={CN.LOGIN_ERROR: [Element('Invalid username or password')]})
+    assert RouterWait(browser).login() == (False, 'Invalid username or password')
+    # A hidden or empty error field is not an outcome.
+    browser = ScriptBrowser(elements={CN.LOGIN_ERROR: [Element('Invalid username or password', displayed=False),
+                                                       Element('')]})
+    with pytest.raises(TimeoutException, match='No login outcome'):
+        RouterWait(browser, page=0.2).login()
+
+
+def test_login_error_of_the_previous_page_is_ignored():
+    page = Element()
+    browser = ScriptBrowser(elements={CN.LOGIN_ERROR: [Element('Invalid username or password')]})
+    with pytest.raises(TimeoutException):
+        RouterWait(browser, page=0.2).login(page)
+    page.stale = True
+    assert RouterWait(browser).login(page) == (False, 'Invalid username or password')
+
+
+def test_fill_form_sends_every_field_in_one_script():
+    browser = ScriptBrowser([None, {'missing': []}])
+    fields = {(By.NAME, 'wl_ssid'): 'iptv_lab', (By.CSS_SELECTOR, '#wl_channel'): 6, (By.ID, 'wl_closed_0'): True}
+    assert RouterWait(browser).fill_form(fields) == []
+    # Retried until the page is loaded, then sent once.
+    assert browser.scripts == [(FILL_SCRIPT, ([['name', 'wl_ssid', 'iptv_lab'], ['css selector', '#wl_channel', 6],
+                                               ['id', 'wl_closed_0', True]],))] * 2
+
+
+def test_fill_form_missing_fields():
+    fields = [((By.NAME, 'wl_ssid'), 'iptv_lab'), ((By.NAME, 'wl_crypto'), 'TKIP')]
+    wait = RouterWait(ScriptBrowser([{'missing': [1]}]))
+    with pytest.raises(NoSuchElementException, match='wl_crypto'):
+        wait.fill_form(fields)
+    assert wait.fill_form(fields, required=False) == [(By.NAME, 'wl_crypto')]
+    with pytest.raises(TimeoutException, match='wl_ssid'):
+        RouterWait(ScriptBrowser([None]), element=0.2).fill_form(fields)
+
+
+def test_page_state_and_verify_form():
+    state = {'fields': {'wl_ssid': 'iptv_lab', 'wl_closed': '0'}, 'mismatched': []}
+    assert RouterWait(ScriptBrowser([state])).page_state() == {'wl_ssid': 'iptv_lab', 'wl_closed': '0'}
+
+    browser = ScriptBrowser([None, {'fields': {}, 'mismatched': [[1, 'Auto'], [2, None]]}])
+    fields = {(By.NAME, 'wl_ssid'): 'iptv_lab', (By.NAME, 'wl_channel'): 6, (By.NAME, 'wl_wpa_psk'): 'abcd1234'}
+    assert RouterWait(browser).verify_form(fields) == [((By.NAME, 'wl_channel'), 6, 'Auto'),
+                                                      ((By.NAME, 'wl_wpa_psk'), 'abcd1234', None)]
+    assert browser.scripts[-1][0] == STATE_SCRIPT
+
+
+class BrowserTransport(object):
+    name = CN.ROUTER_BACKEND_SELENIUM
+    direct = False
+
+    def __init__(self, browser):
+        self.ip = '192.168.1.1'
+        self.browser = browser
+        self.wait = RouterWait(browser, page=0.3)
+
+
+def test_setter_verifies_the_reloaded_page(monkeypatch):
+    import Router
+
+    steps = []
+    monkeypatch.setattr(Router.EVENTS, 'emit', lambda event, **fields: steps.append(fields))
+    browser = ScriptBrowser([{'fields': {}, 'mismatched': [[0, 'ASUS'], [1, 'abcd']]}])
+    router = Router.RouterSetting(session=False, transport=BrowserTransport(browser))
+    fields = {(By.NAME, 'wl_ssid'): 'iptv_lab', (By.NAME, 'wl_wpa_psk'): 'abcd1234'}
+    page = Element()
+    # The page apply was clicked on is still shown: nothing is read from it.
+    with pytest.raises(TimeoutException, match='Page did not change'):
+        router._verify(page, fields)
+    assert not [script for script, args in browser.scripts if script == STATE_SCRIPT]
+
+    page.stale = True
+    assert not router._verify(page, fields)
+    assert [(step['message'], step['field'], step['expected'], step['shown']) for step in steps if 'field' in step] == [
+        ('Setting not applied', 'wl_ssid', 'iptv_lab', 'ASUS'), ('Setting not applied', 'wl_wpa_psk', '***', '***')]
+    assert router.errors == 2
+    assert router._verify(page, {})
+
+
+class Waits(object):
+    '''
+    RouterWait double: every wait returns at once.
+    '''
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+def test_setter_reports_success_only_when_verified(monkeypatch):
+    import Router
+
+    class Browser(ScriptBrowser):
+        def find_element_by_tag_name(self, name):
+            return Element()
+
+    steps = []
+    monkeypatch.setattr(Router.EVENTS, 'emit', lambda event, **fields: steps.append(fields))
+    router = Router.RouterSetting(session=False, transport=BrowserTransport(Browser([None])))
+    router.wait = Waits()
+    del steps[:]
+    monkeypatch.setattr(router, '_verify', lambda page, fields: True)
+    router.set_channel_no('2.4GHz', 6)
+    assert [step['message'] for step in steps if 'message' in step] == ['Setting channel number...']
+
+    del steps[:]
+    monkeypatch.setattr(router, '_verify', lambda page, fields: router._event("Setting not applied", 'error'))
+    with pytest.raises(Router.OperationFailed, match='Setting not applied'):
+        router.set_channel_no('2.4GHz', 6)
+    assert [step['message'] for step in steps if 'message' in step] == ['Setting not applied']
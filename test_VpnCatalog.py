@@ -0,0 +1,84 @@
+#!/usr/bin/python3
+import json
+import os
+
+import pytest
+
+import VpnCatalog as vpncatalog
+from RouterEvents import EventLog
+from VpnCatalog import VpnCatalog
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+@pytest.fixture
+def events(tmp_path, monkeypatch):
+    log = EventLog(str(tmp_path / 'events.jsonl'))
+    monkeypatch.setattr(vpncatalog, 'EVENTS', log)
+
+    def read():
+        log.flush()
+        with open(log.target) as events_file:
+            return [json.loads(line) for line in events_file]
+    yield read
+    log.close()
+
+
+@pytest.fixture
+def countries():
+    return VpnCatalog(os.path.join(HERE, 'ListCountriesVPN.txt'))
+
+
+def test_shipped_lists_load(countries):
+    # ListCountriesVPN.txt is cp1252, eg. 'Niš' of SERBIA
+    assert 'SERBIA' in countries.countries()
+    assert countries.server('Niš') == countries.server('SERBIA')
+    assert VpnCatalog(os.path.join(HERE, 'OpenVPN.txt')).server('france').endswith('.ovpn')
+
+
+def test_exact_lookup_by_country_city_or_server(countries):
+    assert countries.server('france') == countries.server('FRANCE')
+    assert countries.lookup('tirane')['Country'] == 'ALBANIA'
+    assert countries.lookup('al1.pointtoserver.com')['Country'] == 'ALBANIA'
+
+
+def test_first_server_of_a_country_is_its_default(countries):
+    countries.load()
+    rows = [row for row in countries.rows if row['Country'] == 'AUSTRALIA']
+    assert len(rows) > 1
+    assert countries.server('Australia') == rows[0]['VpnServer']
+
+
+def test_countries_before_cities_whatever_the_file_order(tmp_path):
+    vpn_list = tmp_path / 'vpn.txt'
+    vpn_list.write_text('Country,City,VpnServer\nUSA,Georgia,us-ga.example.com\nGEORGIA,Tbilisi,ge1.example.com\n')
+    catalog = VpnCatalog(str(vpn_list))
+    assert catalog.server('georgia') == 'ge1.example.com'
+    assert catalog.server('tbilisi') == 'ge1.example.com'
+
+
+def test_fuzzy_lookup_matches_countries_only(countries, events):
+    # 'IRAN' is close to the city 'TIRANE' of Albania, but is no country of the list.
+    assert countries.server('IRAN', fuzzy=True) is None
+    assert countries.lookup('Frnace', fuzzy=True)['Country'] == 'FRANCE'
+    assert [(event['name'], event['matched']) for event in events()] == [('Frnace', 'FRANCE')]
+
+
+def test_exact_lookup_by_default(countries):
+    assert countries.lookup('Frnace') is None
+
+
+def test_reload_when_file_changes(tmp_path):
+    vpn_list = tmp_path / 'vpn.txt'
+    vpn_list.write_text('Country,VpnServer\nFRANCE,fr1.example.com\n')
+    catalog = VpnCatalog(str(vpn_list))
+    assert catalog.server('france') == 'fr1.example.com'
+    vpn_list.write_text('Country,VpnServer\nFRANCE,fr2.example.com\nSPAIN,es1.example.com\n')
+    assert catalog.server('france') == 'fr2.example.com'
+    assert catalog.countries() == ['FRANCE', 'SPAIN']
+
+
+def test_catalog_is_shared_per_file(tmp_path):
+    vpn_list = str(tmp_path / 'vpn.txt')
+    assert VpnCatalog.catalog(vpn_list) is VpnCatalog.catalog(vpn_list)